@@ -0,0 +1,109 @@
+"""
+Arabic-aware text normalization and tokenization.
+All character tables and patterns are built once at import time so the
+per-string work is a couple of str.translate calls and one regex scan.
+"""
+import unicodedata
+
+import patterns
+
+# Presentation forms (ligatures and contextual shapes) that fold to base letters; the
+# U+FDD0-FDEF noncharacters and U+FEFF (BOM / zero-width no-break space) are left out
+PRESENTATION_RANGES = [(0xFB50, 0xFDCF), (0xFDF0, 0xFDFF), (0xFE70, 0xFEFC)]
+
+# Arabic, Arabic Supplement, Arabic Extended-A and the presentation forms
+ARABIC_RANGES = [(0x0600, 0x06FF), (0x0750, 0x077F), (0x08A0, 0x08FF)] + PRESENTATION_RANGES
+ARABIC_PATTERN = patterns.compile_pattern('[' + ''.join(f'{chr(start)}-{chr(end)}' for start, end in ARABIC_RANGES) + ']+')
+
+# Tashkeel, Qur'anic annotation marks, superscript alef and tatweel
+DIACRITIC_RANGES = [(0x0610, 0x061A), (0x064B, 0x065F), (0x0670, 0x0670), (0x06D6, 0x06ED), (0x08D3, 0x08FF)]
+TATWEEL = 'ـ'
+
+# Letter variants that are treated as equal for search and matching
+LETTER_VARIANTS = {
+    'آ': 'ا', 'أ': 'ا', 'إ': 'ا', 'ٱ': 'ا',
+    'ى': 'ي', 'ی': 'ي', 'ئ': 'ي',
+    'ة': 'ه', 'ۃ': 'ه', 'ہ': 'ه', 'ھ': 'ه',
+    'ک': 'ك', 'ؤ': 'و',
+}
+
+# Arabic comma, semicolon, question mark, full stop and number separators split tokens
+ARABIC_PUNCTUATION = '،؍؛؟٪٫٬٭۔'
+
+TOKEN_PATTERN = patterns.compile_pattern(r'[؀-ۿݐ-ݿࢠ-ࣿ]+|[a-z0-9]+')
+
+
+def _build_presentation_table():
+    """Map every presentation-form codepoint to its NFKC base letters."""
+    table = {}
+    for start, end in PRESENTATION_RANGES:
+        for cp in range(start, end + 1):
+            char = chr(cp)
+            folded = unicodedata.normalize('NFKC', char)
+            if folded != char:
+                table[cp] = folded
+    return table
+
+
+def _build_diacritic_table():
+    """Map every diacritic codepoint (and tatweel) to None for deletion."""
+    table = {ord(TATWEEL): None}
+    for start, end in DIACRITIC_RANGES:
+        for cp in range(start, end + 1):
+            table[cp] = None
+    return table
+
+
+PRESENTATION_TABLE = _build_presentation_table()
+DIACRITIC_TABLE = _build_diacritic_table()
+VARIANT_TABLE = str.maketrans(LETTER_VARIANTS)
+# Punctuation becomes a space; a stray BOM (U+FEFF) is dropped from keys
+PUNCTUATION_TABLE = str.maketrans(ARABIC_PUNCTUATION, ' ' * len(ARABIC_PUNCTUATION), '\ufeff')
+
+
+def is_arabic_text(text):
+    """Check if text contains Arabic characters."""
+    return bool(ARABIC_PATTERN.search(text))
+
+
+def fold_presentation_forms(text):
+    """Replace Arabic presentation forms with their base letters."""
+    return text.translate(PRESENTATION_TABLE)
+
+
+def strip_diacritics(text):
+    """Remove tashkeel, Qur'anic marks and tatweel."""
+    return text.translate(DIACRITIC_TABLE)
+
+
+def normalize_arabic(text):
+    """Fold presentation forms for storage; keeps diacritics so display is unchanged."""
+    return fold_presentation_forms(text)
+
+
+def search_key(text):
+    """Build the normalized key used for indexing, matching and deduplication."""
+    text = fold_presentation_forms(text)
+    text = strip_diacritics(text)
+    text = text.translate(VARIANT_TABLE).translate(PUNCTUATION_TABLE)
+    return ' '.join(text.lower().split())
+
+
+def tokenize(text):
+    """Split text into normalized Arabic and Latin tokens."""
+    return TOKEN_PATTERN.findall(search_key(text))
+
+
+def normalize_batch(texts):
+    """normalize_arabic over many strings."""
+    return [normalize_arabic(text) for text in texts]
+
+
+def search_keys(texts):
+    """search_key over many strings."""
+    return [search_key(text) for text in texts]
+
+
+def tokenize_batch(texts):
+    """tokenize over many strings."""
+    return [TOKEN_PATTERN.findall(key) for key in search_keys(texts)]
@@ -0,0 +1,242 @@
+"""
+Batch ingestion of several PDFs into one corpus.
+Takes a manifest (JSON) or a directory of PDFs, each with per-book config,
+and runs every document in its own worker process so a crash or bad PDF
+only fails that document: if a dying worker breaks the pool, the unfinished
+documents are re-run one per pool to find the one that crashed. Results are merged into corpus.json with ids
+renumbered so books, chapters and stories stay unique across documents.
+
+Manifest format (ingest_manifest.json):
+    {"documents": [
+        {"pdf": "easy-good-deeds.pdf", "kind": "deeds", "metadata": "data.js",
+         "overrides": "easy-good-deeds"},
+        {"pdf": "fazail-e-amal-virtues-of-deeds.pdf", "kind": "fazail",
+         "books": [{"id": 1, "title": "...", "arabic": "...", "start_page": 3, "end_page": 130}]}
+    ]}
+
+In directory mode every *.pdf is ingested; an optional <name>.json next to
+the PDF holds its config (kind defaults to "fazail"). Deed override tables
+are read from the document's section of deed_overrides.json. A section
+named with "overrides" must exist; without it the PDF name is looked up
+and a document with no section simply has no overrides.
+
+Usage:
+    python batch_ingest.py [ingest_manifest.json | pdf_dir] [--workers N]
+"""
+import contextlib
+import glob
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+MANIFEST_FILE = "ingest_manifest.json"
+BATCH_DIR = "batch_output"
+CORPUS_FILE = "corpus.json"
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+
+DOCUMENT_KINDS = ("deeds", "fazail")
+
+
+def load_manifest(source):
+    """List of document configs from a manifest file or a directory of PDFs."""
+    if os.path.isdir(source):
+        documents = []
+        for pdf_path in sorted(glob.glob(os.path.join(source, "*.pdf"))):
+            config = {"pdf": pdf_path, "kind": "fazail"}
+            sidecar = os.path.splitext(pdf_path)[0] + ".json"
+            if os.path.exists(sidecar):
+                with open(sidecar, "r", encoding="utf-8") as f:
+                    config.update(json.load(f))
+                config["pdf"] = pdf_path
+            documents.append(config)
+        return documents
+
+    with open(source, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    base = os.path.dirname(source)
+    documents = []
+    for config in manifest["documents"]:
+        config = dict(config)
+        config["pdf"] = os.path.join(base, config["pdf"])
+        if "metadata" in config:
+            config["metadata"] = os.path.join(base, config["metadata"])
+        documents.append(config)
+    return documents
+
+
+def document_name(config):
+    return os.path.splitext(os.path.basename(config["pdf"]))[0]
+
+
+def _ingest_deeds(config, work_dir):
+    from deed_overrides import load_overrides
+    from extract_deeds import extract_text_from_pdf, load_deeds_metadata, find_deed_content
+
+    clip_dir = config.get("clip_dir", os.path.join("arabic_clips", document_name(config)))
+    full_text = extract_text_from_pdf(config["pdf"], output_dir=clip_dir)
+    if not full_text:
+        raise RuntimeError("no text extracted")
+
+    # An explicitly named section must exist; a document without one just has no quirks
+    overrides = load_overrides(config.get("overrides", document_name(config)), required="overrides" in config)
+    deeds_meta = load_deeds_metadata(config.get("metadata", "data.js"))
+    deeds = find_deed_content(full_text, deeds_meta, overrides)
+    return {"deeds": deeds}
+
+
+def _ingest_fazail(config, work_dir):
+    from book_structure import load_structure, structure_from_books
+    from extract_complete import extract_with_arabic_detection, identify_chapters_and_stories
+
+    content = extract_with_arabic_detection(config["pdf"])
+    if config.get("books"):
+        structure = structure_from_books(config["books"], len(content))
+    else:
+        structure = load_structure(config["pdf"], os.path.join(work_dir, "book_structure.json"))
+
+    chapters, stories = identify_chapters_and_stories(content, structure)
+    books = [
+        dict(book, story_count=sum(1 for s in stories if s["book_id"] == book["id"]))
+        for book in structure["books"]
+    ]
+    return {"books": books, "chapters": chapters, "stories": stories}
+
+
+def ingest_document(config):
+    """Worker entry point: ingest one PDF; never raises, errors are returned."""
+    name = document_name(config)
+    work_dir = os.path.join(BATCH_DIR, name)
+    os.makedirs(work_dir, exist_ok=True)
+    start = time.perf_counter()
+
+    result = {"pdf": config["pdf"], "kind": config.get("kind"), "error": None}
+    with open(os.path.join(work_dir, "ingest.log"), "w", encoding="utf-8") as log, \
+            contextlib.redirect_stdout(log):
+        try:
+            if config.get("kind") not in DOCUMENT_KINDS:
+                raise ValueError(f"unknown kind {config.get('kind')!r}, expected one of {DOCUMENT_KINDS}")
+            if not os.path.exists(config["pdf"]):
+                raise FileNotFoundError(config["pdf"])
+            ingest = _ingest_deeds if config["kind"] == "deeds" else _ingest_fazail
+            result.update(ingest(config, work_dir))
+        except Exception as e:
+            traceback.print_exc(file=log)
+            result["error"] = f"{type(e).__name__}: {e}"
+
+    result["seconds"] = round(time.perf_counter() - start, 2)
+    with open(os.path.join(work_dir, "result.json"), "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2, ensure_ascii=False)
+    return result
+
+
+def merge_results(results):
+    """Merge per-document results into one corpus with globally unique ids."""
+    corpus = {"documents": [], "deeds": [], "books": [], "chapters": [], "stories": []}
+    seen_deeds = set()
+
+    for result in results:
+        source = os.path.basename(result["pdf"])
+        corpus["documents"].append({
+            "pdf": source,
+            "kind": result["kind"],
+            "error": result["error"],
+            "seconds": result["seconds"],
+            "deeds": len(result.get("deeds", [])),
+            "books": len(result.get("books", [])),
+            "chapters": len(result.get("chapters", [])),
+            "stories": len(result.get("stories", []))
+        })
+        if result["error"]:
+            continue
+
+        # Deed ids come from the metadata file, so they are kept as-is
+        for deed in result.get("deeds", []):
+            if deed["id"] in seen_deeds:
+                print(f"  Warning: deed {deed['id']} from {source} duplicates an earlier document")
+            seen_deeds.add(deed["id"])
+            corpus["deeds"].append(dict(deed, source=source))
+
+        book_ids = {b["id"]: len(corpus["books"]) + i + 1 for i, b in enumerate(result.get("books", []))}
+        chapter_ids = {c["id"]: len(corpus["chapters"]) + i + 1 for i, c in enumerate(result.get("chapters", []))}
+        story_offset = len(corpus["stories"])
+
+        for book in result.get("books", []):
+            corpus["books"].append(dict(book, id=book_ids[book["id"]], source=source))
+        for chapter in result.get("chapters", []):
+            corpus["chapters"].append(dict(chapter, id=chapter_ids[chapter["id"]],
+                                           book_id=book_ids.get(chapter["book_id"]), source=source))
+        for story in result.get("stories", []):
+            corpus["stories"].append(dict(story, id=story["id"] + story_offset,
+                                          book_id=book_ids.get(story["book_id"]),
+                                          chapter_id=chapter_ids.get(story["chapter_id"]), source=source))
+    return corpus
+
+
+def _failed(config, error):
+    return {"pdf": config["pdf"], "kind": config.get("kind"), "error": error, "seconds": None}
+
+
+def _run_pool(documents, indices, workers):
+    """Ingest documents[i] for each index in one pool.
+
+    Returns (results by index, indices left unfinished because the pool broke).
+    """
+    results = {}
+    unfinished = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(ingest_document, documents[i]): i for i in indices}
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                results[i] = future.result()
+            except BrokenProcessPool:
+                # A worker process died (e.g. a crash inside MuPDF) and took every pending document with it
+                unfinished.append(i)
+                continue
+            except Exception as e:
+                results[i] = _failed(documents[i], f"{type(e).__name__}: {e}")
+            result = results[i]
+            status = f"FAILED ({result['error']})" if result["error"] else f"ok in {result['seconds']}s"
+            print(f"  {document_name(documents[i])}: {status}")
+    return results, sorted(unfinished)
+
+
+def batch_ingest(source=MANIFEST_FILE, workers=DEFAULT_WORKERS):
+    documents = load_manifest(source)
+    print(f"Ingesting {len(documents)} documents with {workers} workers...")
+
+    results, unfinished = _run_pool(documents, range(len(documents)), workers)
+    if unfinished:
+        # The crashing document is among these; isolate each so it can only fail itself
+        print(f"  Worker pool broke; re-running {len(unfinished)} unfinished documents one at a time")
+        for i in unfinished:
+            retried, broken = _run_pool(documents, [i], 1)
+            results.update(retried)
+            if broken:
+                results[i] = _failed(documents[i], "worker died")
+                print(f"  {document_name(documents[i])}: FAILED (worker died)")
+
+    # Merge in manifest order so ids are stable between runs
+    corpus = merge_results(results[i] for i in range(len(documents)))
+    with open(CORPUS_FILE, "w", encoding="utf-8") as f:
+        json.dump(corpus, f, indent=2, ensure_ascii=False)
+
+    failed = sum(1 for d in corpus["documents"] if d["error"])
+    print(f"Saved {CORPUS_FILE}: {len(corpus['deeds'])} deeds, {len(corpus['books'])} books, "
+          f"{len(corpus['chapters'])} chapters, {len(corpus['stories'])} stories ({failed} documents failed)")
+    return corpus
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    workers = DEFAULT_WORKERS
+    if "--workers" in args:
+        i = args.index("--workers")
+        workers = int(args[i + 1])
+        del args[i:i + 2]
+    corpus = batch_ingest(args[0] if args else MANIFEST_FILE, workers)
+    sys.exit(1 if any(d["error"] for d in corpus["documents"]) else 0)
@@ -0,0 +1,250 @@
+"""
+Book and chapter boundary detection for Fazail-e-Amaal.
+Reads the PDF outline (doc.get_toc()) and page labels once, falls back to
+header font-size clustering on the cached page layout, and writes a single
+structure index that every stage reads. Page -> book/chapter is then a
+list lookup instead of a text scan.
+"""
+import json
+import os
+from collections import Counter
+
+from page_layout import file_hash, load_layout
+
+PDF_PATH = "fazail-e-amal-virtues-of-deeds.pdf"
+STRUCTURE_FILE = "book_structure.json"
+
+# Page ranges measured on PDF_PATH; used for that PDF when its outline has no
+# books, or when neither the PDF nor a cached index is available
+DEFAULT_BOOKS = [
+    {"id": 1, "title": "Stories of Sahaabah", "arabic": "حکایاتِ صحابہ", "start_page": 3, "end_page": 130},
+    {"id": 2, "title": "Virtues of Holy Qur'aan", "arabic": "فضائلِ قرآن", "start_page": 131, "end_page": 180},
+    {"id": 3, "title": "Virtues of Salaat", "arabic": "فضائلِ نماز", "start_page": 181, "end_page": 260},
+    {"id": 4, "title": "Virtues of Zikr", "arabic": "فضائلِ ذکر", "start_page": 261, "end_page": 320},
+    {"id": 5, "title": "Virtues of Tabligh", "arabic": "فضائلِ تبلیغ", "start_page": 321, "end_page": 370},
+    {"id": 6, "title": "Virtues of Ramadhaan", "arabic": "فضائلِ رمضان", "start_page": 371, "end_page": 420},
+    {"id": 7, "title": "Muslim Degeneration", "arabic": "مسلمانوں کی پستی", "start_page": 421, "end_page": 440},
+    {"id": 8, "title": "Six Fundamentals", "arabic": "چھ اصول", "start_page": 441, "end_page": 452},
+]
+
+# A line counts as a header when its font is this much larger than body text
+HEADER_SIZE_RATIO = 1.4
+
+
+def _close_ranges(entries, last_page):
+    """Fill end_page of each entry from the start of the next one."""
+    entries.sort(key=lambda e: e["start_page"])
+    for i, entry in enumerate(entries):
+        next_start = entries[i + 1]["start_page"] if i < len(entries) - 1 else last_page + 1
+        entry["end_page"] = max(entry["start_page"], next_start - 1)
+    return entries
+
+
+def is_default_pdf(pdf_path):
+    """True for the Fazail-e-Amaal PDF that DEFAULT_BOOKS describes."""
+    return os.path.basename(pdf_path) == os.path.basename(PDF_PATH)
+
+
+def books_from_toc(toc, page_count, defaults=()):
+    """Level-1 outline entries are books, level-2 entries are chapters.
+
+    defaults supplies the Arabic title of each book by position.
+    """
+    books = []
+    chapters = []
+    for level, title, page in toc:
+        if page < 1:
+            continue
+        if level == 1:
+            default = defaults[len(books)] if len(books) < len(defaults) else {}
+            books.append({
+                "id": len(books) + 1,
+                "title": title.strip(),
+                "arabic": default.get("arabic", ""),
+                "start_page": page
+            })
+        elif level == 2 and books:
+            chapters.append({
+                "id": len(chapters) + 1,
+                "book_id": books[-1]["id"],
+                "title": title.strip(),
+                "start_page": page
+            })
+
+    _close_ranges(books, page_count)
+    for book in books:
+        book_chapters = [c for c in chapters if c["book_id"] == book["id"]]
+        _close_ranges(book_chapters, book["end_page"])
+    return books, chapters
+
+
+def _page_header(page_layout, body_size):
+    """Text of the first header-sized line on the page, if any."""
+    for block in page_layout["blocks"]:
+        for line in block["lines"]:
+            spans = [s for s in line["spans"] if s["text"].strip()]
+            if not spans or min(s["size"] for s in spans) < body_size * HEADER_SIZE_RATIO:
+                continue
+            title = " ".join(s["text"].strip() for s in spans)
+            if len(title) >= 4 and not title.isdigit():
+                return title[:100]
+    return None
+
+
+def chapters_from_headers(layout, books):
+    """Detect chapter starts from lines set in a header-sized font."""
+    size_chars = Counter()
+    for page_layout in layout:
+        for block in page_layout["blocks"]:
+            for line in block["lines"]:
+                for span in line["spans"]:
+                    size_chars[round(span["size"])] += len(span["text"].strip())
+    if not size_chars:
+        return []
+    body_size = size_chars.most_common(1)[0][0]
+
+    page_books = page_index(books, len(layout))
+    chapters = []
+    for page_layout in layout:
+        book_id = page_books[page_layout["page"] - 1]
+        if book_id is None:
+            continue  # front matter and back matter belong to no book
+        title = _page_header(page_layout, body_size)
+        if title:
+            chapters.append({
+                "id": len(chapters) + 1,
+                "book_id": book_id,
+                "title": title,
+                "start_page": page_layout["page"]
+            })
+
+    for book in books:
+        book_chapters = [c for c in chapters if c["book_id"] == book["id"]]
+        _close_ranges(book_chapters, book["end_page"])
+    return chapters
+
+
+def page_index(entries, page_count, key="id"):
+    """List mapping page-1 -> entry id (None outside every range)."""
+    index = [None] * page_count
+    for entry in entries:
+        for page in range(entry["start_page"], min(entry["end_page"], page_count) + 1):
+            index[page - 1] = entry[key]
+    return index
+
+
+def build_structure(pdf_path):
+    """Detect books, chapters and page labels from the PDF."""
+    # Imported here so post-processing scripts can read the cached index without PyMuPDF
+    import fitz  # PyMuPDF
+
+    doc = fitz.open(pdf_path)
+    page_count = len(doc)
+    toc = doc.get_toc()
+    page_labels = [page.get_label() for page in doc]
+    title = (doc.metadata or {}).get("title") or os.path.splitext(os.path.basename(pdf_path))[0]
+    doc.close()
+
+    defaults = DEFAULT_BOOKS if is_default_pdf(pdf_path) else []
+    books, chapters = books_from_toc(toc, page_count, defaults)
+    source = chapter_source = "toc"
+    if not books and defaults:
+        books = [dict(b) for b in defaults]
+        source = "default"
+    elif not books:
+        # The Fazail page ranges mean nothing for another PDF: treat it as one book
+        books = [{"id": 1, "title": title.strip(), "arabic": "", "start_page": 1, "end_page": page_count}]
+        source = "single"
+    if not chapters:
+        chapters = chapters_from_headers(load_layout(pdf_path), books)
+        chapter_source = "headers"
+
+    return {
+        "pdf_hash": file_hash(pdf_path),
+        "source": source,
+        "chapter_source": chapter_source,
+        "page_count": page_count,
+        "books": books,
+        "chapters": chapters,
+        "page_labels": page_labels,
+        "page_books": page_index(books, page_count),
+        "page_chapters": page_index(chapters, page_count)
+    }
+
+
+def structure_from_books(books, page_count=None):
+    """Structure index for explicitly configured book page ranges (no chapters)."""
+    books = [dict(b) for b in books]
+    if page_count is None:
+        page_count = max(b["end_page"] for b in books)
+    return {
+        "pdf_hash": None,
+        "source": "config",
+        "chapter_source": None,
+        "page_count": page_count,
+        "books": books,
+        "chapters": [],
+        "page_labels": [],
+        "page_books": page_index(books, page_count),
+        "page_chapters": [None] * page_count
+    }
+
+
+def default_structure():
+    structure = structure_from_books(DEFAULT_BOOKS)
+    structure["source"] = "default"
+    return structure
+
+
+def load_structure(pdf_path=PDF_PATH, structure_file=STRUCTURE_FILE):
+    """Return the structure index, rebuilding it only when the PDF changed."""
+    cached = None
+    if os.path.exists(structure_file):
+        with open(structure_file, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+
+    if not os.path.exists(pdf_path):
+        if cached or is_default_pdf(pdf_path):
+            return cached or default_structure()
+        raise FileNotFoundError(pdf_path)
+
+    if cached and cached.get("pdf_hash") == file_hash(pdf_path):
+        return cached
+
+    structure = build_structure(pdf_path)
+    tmp_path = f"{structure_file}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(structure, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, structure_file)
+    return structure
+
+
+def book_for_page(structure, page):
+    """Book id for a 1-based page number."""
+    if 1 <= page <= len(structure["page_books"]):
+        return structure["page_books"][page - 1]
+    return None
+
+
+def chapter_for_page(structure, page):
+    """Chapter id for a 1-based page number."""
+    if 1 <= page <= len(structure["page_chapters"]):
+        return structure["page_chapters"][page - 1]
+    return None
+
+
+def book_ranges(structure):
+    """Map book id -> {"start_page", "end_page"}."""
+    return {b["id"]: {"start_page": b["start_page"], "end_page": b["end_page"]} for b in structure["books"]}
+
+
+if __name__ == "__main__":
+    if not os.path.exists(PDF_PATH):
+        print(f"PDF not found: {PDF_PATH}")
+    else:
+        structure = load_structure()
+        print(f"Detected {len(structure['books'])} books and {len(structure['chapters'])} chapters "
+              f"(books from {structure['source']}, chapters from {structure.get('chapter_source')})")
+        for book in structure["books"]:
+            print(f"  {book['id']}. {book['title']}: pages {book['start_page']}-{book['end_page']}")
+        print(f"Saved to {STRUCTURE_FILE}")
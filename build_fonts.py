@@ -0,0 +1,198 @@
+"""
+Self-host subsetted Arabic/Urdu fonts.
+Collects every Arabic-script codepoint used by the site's data files and
+markup, subsets the locally available source fonts to just those glyphs,
+writes WOFF2 files to fonts/ and inlines the @font-face rules into
+index.html. Families that could not be subset stay on Google Fonts, or on
+their CDN @font-face rule in styles.css.
+
+Requires fonttools and brotli: pip install fonttools brotli
+"""
+import glob
+import os
+import re
+
+import patterns
+from arabic_text import ARABIC_RANGES
+
+try:
+    from fontTools import subset
+except ImportError:
+    subset = None
+
+# Files (or globs) whose text is rendered with the Arabic font; story text lives in the shards
+TEXT_SOURCES = ["fazail_data.js", "data_shards/*.js", "data.js", "index.html"]
+
+# Source fonts to subset, one file per weight/style the page uses; place them under fonts/src/
+# (Indopak Nastaleeq: the Hanafi v4.2.2 build from static-cdn.tarteel.ai)
+SOURCE_FONTS = [
+    {"family": "Indopak Nastaleeq", "source": "fonts/src/indopak-nastaleeq.ttf", "weight": "400"},
+    {"family": "Noto Nastaliq Urdu", "source": "fonts/src/NotoNastaliqUrdu-Regular.ttf", "weight": "400"},
+    {"family": "Noto Nastaliq Urdu", "source": "fonts/src/NotoNastaliqUrdu-Medium.ttf", "weight": "500"},
+    {"family": "Noto Nastaliq Urdu", "source": "fonts/src/NotoNastaliqUrdu-SemiBold.ttf", "weight": "600"},
+    {"family": "Noto Nastaliq Urdu", "source": "fonts/src/NotoNastaliqUrdu-Bold.ttf", "weight": "700"},
+    {"family": "Amiri", "source": "fonts/src/Amiri-Regular.ttf", "weight": "400"},
+    {"family": "Amiri", "source": "fonts/src/Amiri-Bold.ttf", "weight": "700"},
+    {"family": "Amiri", "source": "fonts/src/Amiri-Italic.ttf", "weight": "400", "style": "italic"},
+]
+
+OUTPUT_DIR = "fonts"
+HTML_FILE = "index.html"
+CSS_FILE = "styles.css"
+
+# Remaining Google Fonts families and their axis specs
+GOOGLE_FAMILIES = {
+    "Noto Nastaliq Urdu": "wght@400;500;600;700",
+    "Amiri": "ital,wght@0,400;0,700;1,400",
+    "Inter": "wght@300;400;500;600;700",
+    "Outfit": "wght@300;400;500;600;700",
+}
+
+# Families not on Google Fonts, loaded from their CDN by styles.css until a subset is hosted
+CDN_FONT_FACES = {
+    "Indopak Nastaleeq": (
+        "/* ===== Indopak Nastaleeq Font from Tarteel ===== */\n"
+        "@font-face {\n"
+        "    font-family: 'Indopak Nastaleeq';\n"
+        "    src: url('https://static-cdn.tarteel.ai/qul/fonts/nastaleeq/Hanafi/normal-v4.2.2/with-waqf-lazmi/font.ttf') format('truetype');\n"
+        "    font-display: swap;\n"
+        "}\n"
+    ),
+}
+
+FONTS_BLOCK = patterns.compile_pattern(r'(    <!-- fonts:start -->\n).*?(    <!-- fonts:end -->)', re.DOTALL)
+CDN_FONTS_BLOCK = patterns.compile_pattern(r'(/\* cdn-fonts:start \*/\n).*?(/\* cdn-fonts:end \*/)', re.DOTALL)
+
+# Joiners/marks needed for shaping, on top of the Arabic blocks and presentation forms
+EXTRA_CODEPOINTS = {0x0020, 0x00A0, 0x200C, 0x200D, 0x200E, 0x200F, 0x25CC}
+
+
+def is_arabic_codepoint(cp):
+    return any(start <= cp <= end for start, end in ARABIC_RANGES)
+
+
+def collect_codepoints(paths=TEXT_SOURCES):
+    """Every Arabic-script codepoint present in the given files."""
+    codepoints = set()
+    for path in sorted(p for pattern in paths for p in glob.glob(pattern)):
+        with open(path, "r", encoding="utf-8") as f:
+            codepoints.update(ord(c) for c in set(f.read()) if is_arabic_codepoint(ord(c)))
+    return codepoints | EXTRA_CODEPOINTS
+
+
+def output_path(font):
+    name = os.path.splitext(os.path.basename(font["source"]))[0]
+    return os.path.join(OUTPUT_DIR, f"{name}.subset.woff2")
+
+
+def subset_font(font, codepoints):
+    """Write a WOFF2 subset of the font; returns the output path or None."""
+    if not os.path.exists(font["source"]):
+        print(f"  Skipping {font['family']}: {font['source']} not found")
+        return None
+
+    options = subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["*"]  # keep all shaping features (init/medi/fina, ligatures, marks)
+    options.name_IDs = ["*"]
+    options.notdef_outline = True
+
+    source_font = subset.load_font(font["source"], options)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=codepoints)
+    subsetter.subset(source_font)
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    path = output_path(font)
+    subset.save_font(source_font, path, options)
+
+    before = os.path.getsize(font["source"])
+    after = os.path.getsize(path)
+    print(f"  {font['family']}: {before // 1024} KB -> {after // 1024} KB ({path})")
+    return path
+
+
+def font_face_css(font, path):
+    return (
+        "        @font-face {\n"
+        f"            font-family: '{font['family']}';\n"
+        f"            src: url('{path.replace(os.sep, '/')}') format('woff2');\n"
+        f"            font-weight: {font['weight']};\n"
+        f"            font-style: {font.get('style', 'normal')};\n"
+        "            font-display: swap;\n"
+        "        }\n"
+    )
+
+
+def hosted_families(hosted):
+    """Families whose every weight/style was subset; only these leave their CDN."""
+    hosted_sources = {font["source"] for font, _ in hosted}
+    return {font["family"] for font in SOURCE_FONTS} - {
+        font["family"] for font in SOURCE_FONTS if font["source"] not in hosted_sources}
+
+
+def fonts_block(hosted):
+    """HTML for the fonts block: inline @font-face plus Google Fonts for the rest."""
+    families = hosted_families(hosted)
+    remaining = [f"family={name.replace(' ', '+')}:{spec}" for name, spec in GOOGLE_FAMILIES.items() if name not in families]
+
+    html = ""
+    if remaining:
+        html += (
+            '    <link rel="preconnect" href="https://fonts.googleapis.com">\n'
+            '    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>\n'
+            '    <link\n'
+            f'        href="https://fonts.googleapis.com/css2?{"&".join(remaining)}&display=swap"\n'
+            '        rel="stylesheet">\n'
+        )
+    if hosted:
+        html += '    <style id="subset-fonts">\n'
+        html += "".join(font_face_css(font, path) for font, path in hosted)
+        html += '    </style>\n'
+    return html
+
+
+def build_fonts():
+    if subset is None:
+        print("fonttools is not installed; run: pip install fonttools brotli")
+        return
+
+    codepoints = collect_codepoints()
+    print(f"Collected {len(codepoints)} codepoints from {', '.join(TEXT_SOURCES)}")
+
+    hosted = []
+    for font in SOURCE_FONTS:
+        path = subset_font(font, codepoints)
+        if path:
+            hosted.append((font, path))
+
+    with open(HTML_FILE, "r", encoding="utf-8") as f:
+        html = f.read()
+    if not FONTS_BLOCK.search(html):
+        print(f"Could not find fonts block markers in {HTML_FILE}")
+        return
+
+    html = FONTS_BLOCK.sub(lambda m: m.group(1) + fonts_block(hosted) + m.group(2), html)
+    with open(HTML_FILE, "w", encoding="utf-8") as f:
+        f.write(html)
+
+    print(f"Inlined {len(hosted)} @font-face rules into {HTML_FILE}")
+
+    # Drop a CDN @font-face only now that the subset rule replacing it is in index.html
+    families = hosted_families(hosted)
+    with open(CSS_FILE, "r", encoding="utf-8") as f:
+        css = f.read()
+    if not CDN_FONTS_BLOCK.search(css):
+        print(f"Could not find cdn-fonts block markers in {CSS_FILE}")
+        return
+    on_cdn = [family for family in CDN_FONT_FACES if family not in families]
+    cdn = "".join(CDN_FONT_FACES[family] for family in on_cdn)
+    css = CDN_FONTS_BLOCK.sub(lambda m: m.group(1) + cdn + m.group(2), css)
+    with open(CSS_FILE, "w", encoding="utf-8") as f:
+        f.write(css)
+
+    print(f"CDN @font-face rules left in {CSS_FILE}: {', '.join(on_cdn) or 'none'}")
+
+
+if __name__ == "__main__":
+    build_fonts()
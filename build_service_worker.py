@@ -0,0 +1,183 @@
+"""
+Generate the service worker and precache manifest for the static site.
+Every app-shell file, data file and image the site references is listed
+with a content hash; the hashes are baked into sw.js so any content change produces a new
+worker. Caches are stable per kind and entries are compared by hash, so an
+update only re-fetches changed URLs and drops URLs no longer listed.
+Pages are fetched network-first, so a rebuilt index.html is picked up even
+before the new worker activates.
+"""
+import glob
+import hashlib
+import json
+import os
+
+from check_budget import referenced_assets
+
+APP_SHELL = ["index.html", "styles.css", "script.js", "search_worker.js"]
+FONT_GLOBS = ["fonts/*.woff2"]
+DATA_FILES = ["fazail_data.js", "data.js", "search_index.json"]
+
+MANIFEST_FILE = "precache_manifest.json"
+SW_FILE = "sw.js"
+
+SW_TEMPLATE = """// Fazail-e-Amaal Service Worker
+// Auto-generated by build_service_worker.py - do not edit
+
+const CACHE_VERSION = '__VERSION__';
+const SHELL_CACHE = 'shell';
+const DATA_CACHE = 'data';
+const IMAGE_CACHE = 'images';
+const FONT_CACHE = 'fonts';
+
+const PRECACHE = __MANIFEST__;
+
+const DATA_URLS = new Set(PRECACHE.filter(e => e.kind === 'data').map(e => e.url));
+const PRECACHE_URLS = new Set(PRECACHE.map(e => new URL(e.url, self.location).href));
+const SCOPE_PATH = new URL(self.registration.scope).pathname;
+
+// Each precached file is stored only once, in the cache for its kind
+function cacheFor(entry) {
+    return entry.kind === 'image' ? IMAGE_CACHE : entry.kind === 'data' ? DATA_CACHE : SHELL_CACHE;
+}
+
+self.addEventListener('install', event => {
+    event.waitUntil((async () => {
+        await Promise.all(PRECACHE.map(async entry => {
+            const cache = await caches.open(cacheFor(entry));
+            const cached = await cache.match(entry.url);
+            if (cached && cached.headers.get('x-content-hash') === entry.hash) return;
+            const response = await fetch(entry.url, { cache: 'no-cache' });
+            if (response.ok) await cache.put(entry.url, await tagResponse(response, entry.hash));
+        }));
+        self.skipWaiting();
+    })());
+});
+
+self.addEventListener('activate', event => {
+    event.waitUntil((async () => {
+        const keep = new Set([SHELL_CACHE, DATA_CACHE, IMAGE_CACHE, FONT_CACHE]);
+        const names = await caches.keys();
+        await Promise.all(names.filter(name => !keep.has(name)).map(name => caches.delete(name)));
+
+        // Drop URLs the new manifest no longer lists (old content-hashed shards, removed clips)
+        await Promise.all([SHELL_CACHE, DATA_CACHE, IMAGE_CACHE].map(async name => {
+            const cache = await caches.open(name);
+            const requests = await cache.keys();
+            await Promise.all(requests.filter(request => {
+                const url = new URL(request.url);
+                url.search = '';
+                return !PRECACHE_URLS.has(url.href);
+            }).map(request => cache.delete(request)));
+        }));
+        await self.clients.claim();
+    })());
+});
+
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    if (request.method !== 'GET') return;
+    const url = new URL(request.url);
+
+    if (url.origin === 'https://fonts.googleapis.com' || url.origin === 'https://fonts.gstatic.com') {
+        event.respondWith(staleWhileRevalidate(request, FONT_CACHE));
+        return;
+    }
+    if (url.origin !== self.location.origin) return;
+
+    const path = url.pathname.startsWith(SCOPE_PATH) ? url.pathname.slice(SCOPE_PATH.length) : url.pathname;
+    if (DATA_URLS.has(path) || path.startsWith('data_shards/')) {
+        event.respondWith(staleWhileRevalidate(request, DATA_CACHE));
+    } else if (request.mode === 'navigate') {
+        // Pages name the current content-hashed shards, so prefer the network copy
+        event.respondWith(networkFirst(request, path === '' ? 'index.html' : undefined));
+    } else {
+        event.respondWith(cacheFirst(request));
+    }
+});
+
+async function tagResponse(response, hash) {
+    const headers = new Headers(response.headers);
+    headers.set('x-content-hash', hash);
+    return new Response(await response.blob(), { status: response.status, statusText: response.statusText, headers });
+}
+
+async function cacheFirst(request, cachedUrl) {
+    const cached = await caches.match(cachedUrl || request, { ignoreSearch: true });
+    if (cached) return cached;
+    return fetch(request);
+}
+
+async function networkFirst(request, cachedUrl) {
+    try {
+        return await fetch(request);
+    } catch (e) {
+        // Offline: serve the precached page
+        return cacheFirst(request, cachedUrl);
+    }
+}
+
+async function staleWhileRevalidate(request, cacheName) {
+    const cache = await caches.open(cacheName);
+    const cached = await cache.match(request, { ignoreSearch: true });
+    const network = fetch(request).then(response => {
+        if (response.ok) cache.put(request, response.clone());
+        return response;
+    }).catch(() => cached);
+    return cached || network;
+}
+"""
+
+
+def content_hash(path):
+    """Short SHA-256 of a file's bytes."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+def collect_entries():
+    entries = []
+    for path in APP_SHELL:
+        if os.path.exists(path):
+            entries.append({"url": path, "kind": "shell"})
+    for pattern in FONT_GLOBS:
+        for path in sorted(glob.glob(pattern)):
+            entries.append({"url": path.replace(os.sep, "/"), "kind": "shell"})
+    for path in DATA_FILES + sorted(glob.glob("data_shards/*.js")):
+        if os.path.exists(path):
+            entries.append({"url": path.replace(os.sep, "/"), "kind": "data"})
+    # Only images the shipped pages and data reference, not every clip on disk
+    for path, kind in referenced_assets().items():
+        if kind == "image":
+            entries.append({"url": path, "kind": "image"})
+
+    for entry in entries:
+        entry["hash"] = content_hash(entry["url"])
+    return entries
+
+
+def build_service_worker():
+    entries = collect_entries()
+    version = hashlib.sha256("".join(e["url"] + e["hash"] for e in entries).encode("utf-8")).hexdigest()[:12]
+
+    with open(MANIFEST_FILE, "w", encoding="utf-8") as f:
+        json.dump({"version": version, "entries": entries}, f, indent=2)
+
+    sw = SW_TEMPLATE.replace("__VERSION__", version).replace("__MANIFEST__", json.dumps(entries))
+    with open(SW_FILE, "w", encoding="utf-8") as f:
+        f.write(sw)
+
+    counts = {}
+    for entry in entries:
+        counts[entry["kind"]] = counts.get(entry["kind"], 0) + 1
+    print(f"Generated {SW_FILE} (version {version})")
+    for kind, count in counts.items():
+        print(f"  - {count} {kind} files")
+    print(f"Saved manifest to {MANIFEST_FILE}")
+
+
+if __name__ == "__main__":
+    build_service_worker()
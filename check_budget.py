@@ -0,0 +1,267 @@
+"""
+Performance budget check for the generated site.
+Measures every local asset index.html pulls in (directly, through CSS
+url() references, as images referenced from the data scripts, or as
+workers and the files they fetch) plus the generated precache manifest,
+at raw, gzip and brotli size, plus per-story image counts and payload size. The
+numbers are checked against perf_budget.json and against the last
+accepted baseline; any budget overrun or regression fails with exit 1.
+
+Usage:
+    python check_budget.py                    # measure and check
+    python check_budget.py --update-baseline  # accept the current numbers as the baseline
+"""
+import gzip
+import json
+import os
+import sys
+from html.parser import HTMLParser
+
+import patterns
+from fazail_store import load_fazail_data
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+HTML_FILE = "index.html"
+BUDGET_FILE = "perf_budget.json"
+BASELINE_FILE = "perf_baseline.json"
+
+# Generated files the site ships that no page fetches directly
+BUILD_ASSETS = {"precache_manifest.json": "manifest"}
+
+DATA_SCRIPTS = patterns.compile_pattern(r'^(?:fazail_data\.js|data\.js|data_shards/.*\.js)$')
+CSS_URL = patterns.compile_pattern(r'url\(\s*[\'"]?([^\'")]+)[\'"]?\s*\)')
+# src="..." / srcset="..." inside HTML strings embedded in JS or JSON (quotes may be escaped)
+IMAGE_REF = patterns.compile_pattern(r'(src|srcset)=\\?"([^"\\]+)\\?"')
+IMG_TAG = patterns.compile_pattern(r'<img\b')
+# Scripts started as (service) workers and files fetched by a script, by literal URL
+SCRIPT_REF = patterns.compile_pattern(r'(new Worker|serviceWorker\.register|importScripts|fetch)\(\s*[\'"]([^\'"]+)[\'"]')
+WORKER_CALLS = {"new Worker", "serviceWorker.register", "importScripts"}
+
+KINDS = {".js": "script", ".css": "style", ".html": "document", ".json": "data", ".woff2": "font", ".woff": "font",
+         ".png": "image", ".jpg": "image", ".jpeg": "image", ".webp": "image", ".avif": "image", ".svg": "image"}
+METRICS = ("raw", "gzip", "brotli")
+
+
+class _AssetParser(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.urls = []
+        self.styles = []
+        self._in_style = False
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "link" and attrs.get("href"):
+            self.urls.append(attrs["href"])
+        elif tag in ("script", "img", "source") and attrs.get("src"):
+            self.urls.append(attrs["src"])
+        if attrs.get("srcset"):
+            self.urls.extend(candidate.split()[0] for candidate in attrs["srcset"].split(",") if candidate.strip())
+        self._in_style = tag == "style"
+
+    def handle_endtag(self, tag):
+        self._in_style = False
+
+    def handle_data(self, data):
+        if self._in_style:
+            self.styles.append(data)
+
+
+def _is_local(url):
+    return not patterns.match(r'^(?:[a-z]+:)?//|^(?:data|mailto):', url)
+
+
+def _local_path(url, base=""):
+    path = os.path.normpath(os.path.join(base, url.split("#")[0].split("?")[0]))
+    return path.replace(os.sep, "/")
+
+
+def referenced_assets(html_file=HTML_FILE):
+    """Map of local file -> kind for everything index.html loads, directly or indirectly.
+
+    Follows CSS url()s, images named in the data scripts, and workers,
+    service workers and fetch() targets named in scripts.
+    """
+    with open(html_file, "r", encoding="utf-8") as f:
+        html = f.read()
+    parser = _AssetParser()
+    parser.feed(html)
+
+    assets = {html_file}
+    workers = set()
+    pending = [_local_path(u) for u in parser.urls if _is_local(u)]
+    pending += [_local_path(u) for css in parser.styles for u in CSS_URL.findall(css) if _is_local(u)]
+
+    while pending:
+        path = pending.pop()
+        if path in assets or not os.path.exists(path):
+            continue
+        assets.add(path)
+        if path.endswith(".css"):
+            with open(path, "r", encoding="utf-8") as f:
+                base = os.path.dirname(path)
+                pending += [_local_path(u, base) for u in CSS_URL.findall(f.read()) if _is_local(u)]
+        elif DATA_SCRIPTS.match(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for attr, value in IMAGE_REF.findall(f.read()):
+                    urls = [c.split()[0] for c in value.split(",") if c.strip()] if attr == "srcset" else [value]
+                    pending += [_local_path(u) for u in urls if _is_local(u)]
+        elif path.endswith(".js"):
+            with open(path, "r", encoding="utf-8") as f:
+                for call, url in SCRIPT_REF.findall(f.read()):
+                    if _is_local(url):
+                        pending.append(_local_path(url))
+                        if call in WORKER_CALLS:
+                            workers.add(_local_path(url))
+
+    assets.update(path for path in BUILD_ASSETS if os.path.exists(path))
+    return {path: asset_kind(path, workers) for path in sorted(assets)}
+
+
+def asset_kind(path, workers=()):
+    if path in BUILD_ASSETS:
+        return BUILD_ASSETS[path]
+    if path in workers:
+        return "worker"
+    if DATA_SCRIPTS.match(path):
+        return "data"
+    return KINDS.get(os.path.splitext(path)[1].lower(), "other")
+
+
+def asset_sizes(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    return {
+        "raw": len(data),
+        "gzip": len(gzip.compress(data, 9, mtime=0)),
+        "brotli": len(brotli.compress(data, quality=11)) if brotli else None
+    }
+
+
+def story_stats():
+    """Image count and serialized size of each story."""
+    data = load_fazail_data() or {"stories": []}
+    stories = []
+    for story in data["stories"]:
+        payload = json.dumps(story, ensure_ascii=False)
+        stories.append({"id": story["id"], "images": len(IMG_TAG.findall(payload)), "bytes": len(payload.encode("utf-8"))})
+    return stories
+
+
+def measure():
+    assets = {path: dict(asset_sizes(path), kind=kind) for path, kind in referenced_assets().items()}
+
+    totals = {}
+    for sizes in assets.values():
+        for group in (sizes["kind"], "all"):
+            total = totals.setdefault(group, {"count": 0, "raw": 0, "gzip": 0, "brotli": 0 if brotli else None})
+            total["count"] += 1
+            for metric in METRICS:
+                if sizes[metric] is not None:
+                    total[metric] += sizes[metric]
+
+    stories = story_stats()
+    most_images = max(stories, key=lambda s: s["images"], default={"id": None, "images": 0})
+    largest = max(stories, key=lambda s: s["bytes"], default={"id": None, "bytes": 0})
+    return {
+        "assets": assets,
+        "totals": totals,
+        "stories": {
+            "count": len(stories),
+            "max_images": most_images["images"],
+            "max_images_story": most_images["id"],
+            "largest_bytes": largest["bytes"],
+            "largest_story": largest["id"]
+        }
+    }
+
+
+def check(report, budgets, baseline=None):
+    """List of human-readable failures (empty when everything is within budget)."""
+    failures = []
+
+    for group, limits in budgets.get("totals", {}).items():
+        total = report["totals"].get(group, {})
+        for metric, limit in limits.items():
+            if total.get(metric) is not None and total[metric] > limit:
+                failures.append(f"{group} {metric} total {total[metric]:,} B exceeds budget {limit:,} B")
+
+    for kind, limits in budgets.get("per_asset", {}).items():
+        for path, sizes in report["assets"].items():
+            if sizes["kind"] != kind:
+                continue
+            for metric, limit in limits.items():
+                if sizes.get(metric) is not None and sizes[metric] > limit:
+                    failures.append(f"{path} {metric} {sizes[metric]:,} B exceeds {kind} budget {limit:,} B")
+
+    stories = report["stories"]
+    if stories["max_images"] > budgets.get("max_images_per_story", float("inf")):
+        failures.append(f"story {stories['max_images_story']} has {stories['max_images']} images "
+                        f"(budget {budgets['max_images_per_story']})")
+    if stories["largest_bytes"] > budgets.get("max_story_bytes", float("inf")):
+        failures.append(f"story {stories['largest_story']} is {stories['largest_bytes']:,} B "
+                        f"(budget {budgets['max_story_bytes']:,} B)")
+
+    # Regressions: growth beyond the tolerance relative to the accepted baseline
+    if baseline:
+        tolerance = budgets.get("regression_tolerance", 0.05)
+        for group, total in report["totals"].items():
+            old = baseline["totals"].get(group)
+            if not old:
+                continue
+            for metric in METRICS:
+                if total.get(metric) and old.get(metric) and total[metric] > old[metric] * (1 + tolerance):
+                    failures.append(f"{group} {metric} grew {total[metric] / old[metric] - 1:.1%} "
+                                    f"({old[metric]:,} -> {total[metric]:,} B)")
+        old_largest = baseline["stories"]["largest_bytes"]
+        if old_largest and stories["largest_bytes"] > old_largest * (1 + tolerance):
+            failures.append(f"largest story grew {stories['largest_bytes'] / old_largest - 1:.1%} "
+                            f"({old_largest:,} -> {stories['largest_bytes']:,} B)")
+    return failures
+
+
+def print_report(report):
+    def fmt(value):
+        return f"{value / 1024:,.1f}K" if value is not None else "n/a"
+
+    print(f"{'group':<10} {'files':>6} {'raw':>10} {'gzip':>10} {'brotli':>10}")
+    for group in sorted(report["totals"], key=lambda g: g == "all"):
+        total = report["totals"][group]
+        print(f"{group:<10} {total['count']:>6} {fmt(total['raw']):>10} {fmt(total['gzip']):>10} {fmt(total['brotli']):>10}")
+    stories = report["stories"]
+    print(f"Stories: {stories['count']}, most images {stories['max_images']} (story {stories['max_images_story']}), "
+          f"largest {fmt(stories['largest_bytes'])} (story {stories['largest_story']})")
+    if brotli is None:
+        print("(brotli not installed; brotli sizes skipped)")
+
+
+def main():
+    report = measure()
+    print_report(report)
+
+    if "--update-baseline" in sys.argv:
+        with open(BASELINE_FILE, "w", encoding="utf-8") as f:
+            json.dump({"totals": report["totals"], "stories": report["stories"]}, f, indent=2)
+        print(f"Saved baseline to {BASELINE_FILE}")
+        return 0
+
+    with open(BUDGET_FILE, "r", encoding="utf-8") as f:
+        budgets = json.load(f)
+    baseline = None
+    if os.path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    failures = check(report, budgets, baseline)
+    for failure in failures:
+        print(f"BUDGET FAILED: {failure}")
+    print("Within budget" if not failures else f"{len(failures)} budget failures")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
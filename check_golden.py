@@ -0,0 +1,178 @@
+"""
+Golden-output regression check for the extraction pipeline.
+Re-runs the pipeline stages in a scratch directory, then compares
+deeds_content.json and the assembled fazail_data records against the
+committed copies in golden/. Records are matched by id and compared by
+content hash; only mismatched records get a (word-level) sequence diff.
+
+Usage:
+    python check_golden.py            # run pipeline in a scratch dir and compare
+                                      # (exit 2 if a stage could not run and its check was skipped)
+    python check_golden.py --no-run   # compare the current outputs in place
+    python check_golden.py --update   # refresh golden/ from the current outputs
+"""
+import difflib
+import hashlib
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+GOLDEN_DIR = "golden"
+GOLDEN_DEEDS = os.path.join(GOLDEN_DIR, "deeds_content.json")
+GOLDEN_FAZAIL = os.path.join(GOLDEN_DIR, "fazail_data.json")
+
+# Files and directories a scratch pipeline run needs
+PIPELINE_INPUTS = ["easy-good-deeds.pdf", "data.js", "fazail_full_content.json", "fazail_data.js",
+                   "book_structure.json", "index.html", "data_shards", "layout_cache"]
+
+# Maximum diff lines printed per mismatched record
+DIFF_CONTEXT_LINES = 20
+
+
+def record_hash(record):
+    canonical = json.dumps(record, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def current_outputs():
+    """deeds_content.json and the assembled fazail data from the working directory."""
+    from fazail_store import load_fazail_data
+
+    with open("deeds_content.json", "r", encoding="utf-8") as f:
+        deeds = json.load(f)
+    return deeds, load_fazail_data()
+
+
+def run_pipeline():
+    """Run every stage whose inputs are available; returns the names of stages that ran."""
+    ran = []
+    has_fitz = importlib.util.find_spec("fitz") is not None  # PyMuPDF
+
+    if has_fitz and os.path.exists("easy-good-deeds.pdf"):
+        import extract_deeds
+        extract_deeds.main()
+        ran.append("extract_deeds")
+    else:
+        print("Skipping extract_deeds (PyMuPDF or easy-good-deeds.pdf not available)")
+
+    if os.path.exists("fazail_full_content.json"):
+        import process_full_extraction
+        import cleanup_placeholders
+        process_full_extraction.extract_stories()
+        cleanup_placeholders.cleanup()
+        ran.extend(["process_full_extraction", "cleanup_placeholders"])
+
+    return ran
+
+
+def word_diff(label, old, new):
+    """Unified diff over words of two JSON-serialized records."""
+    old_words = json.dumps(old, indent=1, sort_keys=True, ensure_ascii=False).split()
+    new_words = json.dumps(new, indent=1, sort_keys=True, ensure_ascii=False).split()
+    lines = list(difflib.unified_diff(old_words, new_words, f"golden {label}", f"current {label}", n=3, lineterm=""))
+    for line in lines[:DIFF_CONTEXT_LINES]:
+        print(f"    {line}")
+    if len(lines) > DIFF_CONTEXT_LINES:
+        print(f"    ... {len(lines) - DIFF_CONTEXT_LINES} more diff lines")
+
+
+def compare_records(kind, golden, current):
+    """Compare two lists of id-keyed records; returns the number of mismatches."""
+    golden_by_id = {r["id"]: r for r in golden}
+    current_by_id = {r["id"]: r for r in current}
+
+    missing = sorted(set(golden_by_id) - set(current_by_id))
+    extra = sorted(set(current_by_id) - set(golden_by_id))
+    changed = sorted(i for i in golden_by_id.keys() & current_by_id.keys()
+                     if record_hash(golden_by_id[i]) != record_hash(current_by_id[i]))
+
+    if missing:
+        print(f"  {kind}: missing ids {missing}")
+    if extra:
+        print(f"  {kind}: unexpected ids {extra}")
+    for record_id in changed:
+        print(f"  {kind} {record_id} changed:")
+        word_diff(f"{kind} {record_id}", golden_by_id[record_id], current_by_id[record_id])
+
+    total = len(missing) + len(extra) + len(changed)
+    print(f"{kind}: {len(golden_by_id)} golden, {len(current_by_id)} current, {total} mismatches")
+    return total
+
+
+def compare(deeds, fazail):
+    """Mismatch count; deeds or fazail of None skips that comparison."""
+    mismatches = 0
+    if deeds is not None:
+        with open(GOLDEN_DEEDS, "r", encoding="utf-8") as f:
+            mismatches += compare_records("deed", json.load(f), deeds)
+    if fazail is not None:
+        with open(GOLDEN_FAZAIL, "r", encoding="utf-8") as f:
+            golden_fazail = json.load(f)
+        for kind, key in (("book", "books"), ("chapter", "chapters"), ("story", "stories")):
+            mismatches += compare_records(kind, golden_fazail[key], fazail[key])
+    return mismatches
+
+
+def update_golden():
+    deeds, fazail = current_outputs()
+    os.makedirs(GOLDEN_DIR, exist_ok=True)
+    with open(GOLDEN_DEEDS, "w", encoding="utf-8") as f:
+        json.dump(deeds, f, indent=1, ensure_ascii=False)
+    with open(GOLDEN_FAZAIL, "w", encoding="utf-8") as f:
+        json.dump(fazail, f, indent=1, ensure_ascii=False)
+    print(f"Updated {GOLDEN_DEEDS} and {GOLDEN_FAZAIL}")
+
+
+def main():
+    if "--update" in sys.argv:
+        update_golden()
+        return 0
+
+    if "--no-run" in sys.argv:
+        return 1 if compare(*current_outputs()) else 0
+
+    root = os.path.abspath(os.path.dirname(__file__))
+    with tempfile.TemporaryDirectory() as scratch:
+        for name in PIPELINE_INPUTS + ["deeds_content.json"]:
+            src = os.path.join(root, name)
+            if os.path.isdir(src):
+                shutil.copytree(src, os.path.join(scratch, name))
+            elif os.path.exists(src):
+                shutil.copy2(src, scratch)
+        os.makedirs(os.path.join(scratch, GOLDEN_DIR))
+        for name in (GOLDEN_DEEDS, GOLDEN_FAZAIL):
+            shutil.copy2(os.path.join(root, name), os.path.join(scratch, name))
+
+        cwd = os.getcwd()
+        os.chdir(scratch)
+        try:
+            ran = run_pipeline()
+            print(f"Ran: {', '.join(ran) or 'nothing'}")
+            # Outputs of stages that didn't run are just the copied inputs; comparing them proves nothing
+            skipped = []
+            deeds, fazail = current_outputs()
+            if "extract_deeds" not in ran:
+                skipped.append("deed")
+                deeds = None
+            if "process_full_extraction" not in ran:
+                skipped.append("story data")
+                fazail = None
+            mismatches = compare(deeds, fazail)
+        finally:
+            os.chdir(cwd)
+
+    if mismatches:
+        print(f"FAILED: {mismatches} mismatched records")
+        return 1
+    if skipped:
+        print(f"INCOMPLETE: {' and '.join(skipped)} check skipped because its stage could not run")
+        return 2
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Resumable page-range checkpoints for long extractions.
+A stage writes its output for each completed range of pages as a chunk
+file, then records the chunk and its SHA-256 in a manifest; both writes
+are atomic (tmp file + os.replace). A rerun verifies every recorded chunk
+against its hash (plus any files the chunk says it produced) and resumes
+after the last intact one. Checkpoints are keyed by stage, PDF hash and
+stage settings, so a changed PDF or changed settings start from scratch.
+"""
+import hashlib
+import json
+import os
+import shutil
+
+CHECKPOINT_DIR = "checkpoints"
+# Pages per checkpointed chunk
+CHECKPOINT_PAGES = 25
+
+
+def _write_atomic(path, data):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class Checkpoint:
+    """Completed page-range chunks of one stage run over one PDF."""
+
+    def __init__(self, stage, pdf_hash, settings=None, chunk_pages=CHECKPOINT_PAGES, root=CHECKPOINT_DIR):
+        self.chunk_pages = chunk_pages
+        self.directory = os.path.join(root, stage, pdf_hash[:16])
+        self.manifest_path = os.path.join(self.directory, "manifest.json")
+        self.settings = dict(settings or {}, chunk_pages=chunk_pages)
+        self.chunks = []  # payloads of verified chunks, in page order
+        self.next_page = 0
+        self._entries = []
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.manifest_path):
+            return
+        with open(self.manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("settings") != self.settings:
+            print(f"  Checkpoint settings changed; discarding {self.directory}")
+            self.clear()
+            return
+
+        for entry in manifest["chunks"]:
+            path = os.path.join(self.directory, entry["file"])
+            if entry["start"] != self.next_page or not os.path.exists(path):
+                break
+            with open(path, "rb") as f:
+                data = f.read()
+            if hashlib.sha256(data).hexdigest() != entry["sha256"]:
+                print(f"  Checkpoint {entry['file']} is corrupt; resuming before it")
+                break
+            payload = json.loads(data)
+            if not all(os.path.exists(p) for p in payload.get("files", [])):
+                print(f"  Checkpoint {entry['file']} is missing output files; resuming before it")
+                break
+            self._entries.append(entry)
+            self.chunks.append(payload)
+            self.next_page = entry["end"]
+
+        if self.next_page:
+            print(f"  Resuming from checkpoint: pages 1-{self.next_page} already done")
+
+    def save(self, start, end, payload):
+        """Record pages [start, end) as done; payload["files"] lists outputs to verify on resume."""
+        os.makedirs(self.directory, exist_ok=True)
+        name = f"pages-{start + 1:05d}-{end:05d}.json"
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        _write_atomic(os.path.join(self.directory, name), data)
+
+        self._entries.append({"start": start, "end": end, "file": name, "sha256": hashlib.sha256(data).hexdigest()})
+        self.chunks.append(payload)
+        self.next_page = end
+        manifest = {"settings": self.settings, "chunks": self._entries}
+        _write_atomic(self.manifest_path, json.dumps(manifest, indent=2).encode("utf-8"))
+
+    def is_chunk_end(self, page_index, page_count):
+        """True when page_index is the last page of a chunk (or of the document)."""
+        return (page_index + 1) % self.chunk_pages == 0 or page_index + 1 == page_count
+
+    def chunk_start(self, page_index):
+        return page_index - page_index % self.chunk_pages
+
+    def clear(self):
+        """Remove the checkpoints once the stage's final output is safely written."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self.chunks = []
+        self._entries = []
+        self.next_page = 0
@@ -0,0 +1,107 @@
+"""
+Background PNG writer for rendered Arabic clips.
+The extraction loop hands off raw pixmap samples; worker threads encode
+them to PNG with zlib (which releases the GIL) and write them to disk.
+Already-encoded bytes can be queued too and are written as-is.
+The queue is bounded so a slow disk applies back-pressure instead of
+buffering every clip in memory. Worker errors are re-raised in the caller
+on the next submit() or on close().
+"""
+import os
+import queue
+import struct
+import threading
+import zlib
+
+# PNG colour types by number of channels (without / with alpha)
+COLOR_TYPES = {(1, False): 0, (3, False): 2, (2, True): 4, (4, True): 6}
+
+
+def _chunk(kind, data):
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+
+def encode_png(width, height, n, alpha, samples, dpi=None, level=6):
+    """Encode raw 8-bit pixmap samples as PNG bytes."""
+    stride = width * n
+    raw = b"".join(b"\x00" + samples[y * stride:(y + 1) * stride] for y in range(height))
+    header = struct.pack(">IIBBBBB", width, height, 8, COLOR_TYPES[(n, alpha)], 0, 0, 0)
+    png = b"\x89PNG\r\n\x1a\n" + _chunk(b"IHDR", header)
+    if dpi:
+        ppm = round(dpi / 0.0254)
+        png += _chunk(b"pHYs", struct.pack(">IIB", ppm, ppm, 1))
+    png += _chunk(b"IDAT", zlib.compress(raw, level)) + _chunk(b"IEND", b"")
+    return png
+
+
+def png_size(path):
+    """(width, height) from a PNG file's IHDR chunk."""
+    with open(path, "rb") as f:
+        header = f.read(24)
+    return struct.unpack(">II", header[16:24])
+
+
+class ClipWriter:
+    """Encode and save clips on a small thread pool behind a bounded queue."""
+
+    def __init__(self, workers=4, max_pending=32):
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._error = None
+        self._lock = threading.Lock()
+        self._threads = [threading.Thread(target=self._run, daemon=True) for _ in range(workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                path, args = job
+                data = args if isinstance(args, bytes) else encode_png(*args)
+                tmp_path = path + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except Exception as e:
+                with self._lock:
+                    if self._error is None:
+                        self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _raise_if_failed(self):
+        if self._error is not None:
+            raise RuntimeError(f"Clip writer failed: {self._error}") from self._error
+
+    def submit(self, pix, path, dpi=None):
+        """Queue a fitz.Pixmap for saving; blocks while the queue is full."""
+        self._raise_if_failed()
+        self._queue.put((path, (pix.width, pix.height, pix.n, bool(pix.alpha), bytes(pix.samples), dpi)))
+
+    def submit_bytes(self, data, path):
+        """Queue already-encoded image bytes (e.g. a passthrough JPEG) for saving."""
+        self._raise_if_failed()
+        self._queue.put((path, bytes(data)))
+
+    def flush(self):
+        """Wait until every queued clip has been written."""
+        self._queue.join()
+        self._raise_if_failed()
+
+    def close(self):
+        """Flush, stop the workers and re-raise any worker error."""
+        self._queue.join()
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._raise_if_failed()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
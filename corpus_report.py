@@ -0,0 +1,172 @@
+"""
+Corpus statistics report.
+Walks each generated artifact once (story shards, deeds_content.json,
+fazail_full_content.json, the clip and image directories) and reports
+per-book and per-chapter character counts, Arabic segment density, clip
+counts and bytes, story size distributions and the largest payload
+contributors. Writes corpus_report.json and prints a text table.
+
+Usage:
+    python corpus_report.py [--top N]
+"""
+import glob
+import json
+import os
+import sys
+
+import patterns
+from arabic_text import ARABIC_PATTERN
+from book_structure import book_for_page, load_structure
+from fazail_store import load_fazail_data
+
+REPORT_FILE = "corpus_report.json"
+DEEDS_FILE = "deeds_content.json"
+PAGES_FILE = "fazail_full_content.json"
+CLIP_DIR = "arabic_clips"
+IMAGE_DIR = "extracted_images"
+TOP_CONTRIBUTORS = 10
+
+# Inline Arabic: remapped text spans, rendered clips and <arabic> markers from extract_complete
+ARABIC_SEGMENT = patterns.compile_pattern(r'<span class="arabic-text"|<img\b[^>]*class="arabic-text"|<arabic>')
+CLIP_SRC = patterns.compile_pattern(r'<img\b[^>]*\bsrc="([^"]+)"')
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0
+    rank = max(1, -(-len(sorted_values) * p // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def _new_group(**fields):
+    return dict(fields, items=0, chars=0, arabic_chars=0, arabic_segments=0, clips=0, clip_bytes=0, sizes=[])
+
+
+def _file_size(path, cache):
+    if path not in cache:
+        cache[path] = os.path.getsize(path) if os.path.exists(path) else 0
+    return cache[path]
+
+
+def _measure(html, group, size_cache):
+    """Add one story/deed's numbers to a group; returns (payload bytes, clip bytes)."""
+    text = patterns.TAG_PATTERN.sub(" ", html)
+    clips = CLIP_SRC.findall(html)
+    clip_bytes = sum(_file_size(src, size_cache) for src in clips)
+    payload = len(html.encode("utf-8"))
+
+    group["items"] += 1
+    group["chars"] += len(text)
+    group["arabic_chars"] += sum(len(run) for run in ARABIC_PATTERN.findall(text))
+    group["arabic_segments"] += len(ARABIC_SEGMENT.findall(html))
+    group["clips"] += len(clips)
+    group["clip_bytes"] += clip_bytes
+    group["sizes"].append(payload)
+    return payload, clip_bytes
+
+
+def _finish(group):
+    """Replace the raw size list with its distribution and add densities."""
+    sizes = sorted(group.pop("sizes"))
+    group["bytes"] = sum(sizes)
+    group["size_p50"] = percentile(sizes, 50)
+    group["size_p95"] = percentile(sizes, 95)
+    group["size_max"] = sizes[-1] if sizes else 0
+    group["arabic_char_ratio"] = round(group["arabic_chars"] / group["chars"], 4) if group["chars"] else 0
+    group["arabic_segments_per_10k"] = round(group["arabic_segments"] * 10000 / group["chars"], 2) if group["chars"] else 0
+    return group
+
+
+def _directory_stats(pattern):
+    paths = glob.glob(pattern)
+    return {"files": len(paths), "bytes": sum(os.path.getsize(p) for p in paths)}
+
+
+def build_report(top=TOP_CONTRIBUTORS):
+    size_cache = {}
+    contributors = []
+
+    # Stories, in one pass over the shards
+    data = load_fazail_data() or {"books": [], "chapters": [], "stories": []}
+    books = {b["id"]: _new_group(id=b["id"], title=b["title"], pages=0, page_arabic_segments=0) for b in data["books"]}
+    chapters = {}
+    for story in data["stories"]:
+        html = f'{story.get("title", "")} {story.get("content", "")}'
+        book = books.setdefault(story["bookId"], _new_group(id=story["bookId"], title="", pages=0, page_arabic_segments=0))
+        chapter = chapters.setdefault((story["bookId"], story["chapter"]),
+                                      _new_group(book_id=story["bookId"], title=story["chapter"]))
+        payload, clip_bytes = _measure(html, book, size_cache)
+        _measure(html, chapter, size_cache)
+        contributors.append({"kind": "story", "id": story["id"], "title": story["title"],
+                             "bytes": payload, "clip_bytes": clip_bytes})
+
+    # Deeds (easy-good-deeds), one pass
+    deeds = _new_group(title="Easy Good Deeds")
+    if os.path.exists(DEEDS_FILE):
+        with open(DEEDS_FILE, "r", encoding="utf-8") as f:
+            for deed in json.load(f):
+                payload, clip_bytes = _measure(deed["content"], deeds, size_cache)
+                contributors.append({"kind": "deed", "id": deed["id"], "title": deed["title"],
+                                     "bytes": payload, "clip_bytes": clip_bytes})
+
+    # Extracted pages: Arabic segment density per book before story assembly
+    if os.path.exists(PAGES_FILE):
+        structure = load_structure()
+        with open(PAGES_FILE, "r", encoding="utf-8") as f:
+            for page in json.load(f):
+                book = books.get(book_for_page(structure, page["page"]))
+                if book:
+                    book["pages"] += 1
+                    book["page_arabic_segments"] += len(ARABIC_SEGMENT.findall(page["content"]))
+
+    contributors.sort(key=lambda c: c["bytes"] + c["clip_bytes"], reverse=True)
+    return {
+        "books": [_finish(b) for b in books.values()],
+        "chapters": sorted((_finish(c) for c in chapters.values()), key=lambda c: -c["bytes"]),
+        "deeds": _finish(deeds),
+        "files": {
+            "clips_png": _directory_stats(os.path.join(CLIP_DIR, "*.png")),
+            "clips_vector": _directory_stats(os.path.join(CLIP_DIR, "vector", "*")),
+            "extracted_images": _directory_stats(os.path.join(IMAGE_DIR, "page_*")),
+            "data_shards": _directory_stats(os.path.join("data_shards", "*.js"))
+        },
+        "largest_contributors": contributors[:top]
+    }
+
+
+def print_report(report):
+    def kb(value):
+        return f"{value / 1024:,.1f}K"
+
+    header = f"{'':<34} {'items':>5} {'chars':>9} {'ar/10k':>7} {'clips':>6} {'clip KB':>8} {'p50':>8} {'p95':>8} {'max':>8}"
+
+    def row(label, g):
+        return (f"{label[:34]:<34} {g['items']:>5} {g['chars']:>9,} {g['arabic_segments_per_10k']:>7} {g['clips']:>6} "
+                f"{kb(g['clip_bytes']):>8} {kb(g['size_p50']):>8} {kb(g['size_p95']):>8} {kb(g['size_max']):>8}")
+
+    print(header)
+    for book in report["books"]:
+        print(row(f"{book['id']}. {book['title']}", book))
+    print(row("Easy Good Deeds", report["deeds"]))
+
+    print(f"\nLargest chapters:\n{header}")
+    for chapter in report["chapters"][:10]:
+        print(row(f"  [{chapter['book_id']}] {chapter['title']}", chapter))
+
+    print("\nFiles:")
+    for name, stats in report["files"].items():
+        print(f"  {name:<18} {stats['files']:>6} files {kb(stats['bytes']):>10}")
+
+    print("\nLargest payload contributors:")
+    for c in report["largest_contributors"]:
+        print(f"  {c['kind']:<5} {c['id']:>4} {kb(c['bytes']):>9} (+{kb(c['clip_bytes'])} clips)  {c['title'][:50]}")
+
+
+if __name__ == "__main__":
+    top = int(sys.argv[sys.argv.index("--top") + 1]) if "--top" in sys.argv else TOP_CONTRIBUTORS
+    report = build_report(top)
+    with open(REPORT_FILE, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print_report(report)
+    print(f"\nSaved {REPORT_FILE}")
@@ -0,0 +1,207 @@
+// Fazail-e-Amaal Data Shard: book 1
+fazailData.stories.push(...[
+    {
+        "id": 11,
+        "bookId": 1,
+        "chapter": "Steadfastness in the Face of Hardships",
+        "title": "Steadfastness in the Face of Hardships",
+        "preview": "STEADFASTNESS IN THE FACE OF HARDSHIPS Prophet's Journey to Taif . . . . . . . . . . . . . . . . . . . . ... 15 Martvrdom of Anas bin Nadhr .. . . . ....",
+        "content": "<div class=\"story-content\"><p>STEADFASTNESS IN THE FACE OF HARDSHIPS Prophet's Journey to Taif . . . . . . . . . . . . . . . . . . . . ... 15 Martvrdom of Anas bin Nadhr .. . . . .. . . . . . . . . . . . 18 The Truce of Hudeybiah and story of Abu Jandal and Abu Basir. . . . . . . . . . . . . . . . . . . .. . . . . . . . . . .. . 19 Bilal and his sufferings. . . . .. . . . . .. . . . . . . . . . . . . . 2 1 Abuzar's conversion to Islam . . . . . . . . . . . . . . . . . . . 2 3 The afflictions of Khubab bin Alarat . . . . . . . . . . . . . 25 Ammar and his Parents . . . . . . . . . . . . . . . . . . . . . . . . 2 6 Sohaib's coming into Islam ... . . . . . . . . . . . . . . . . . . 27 Umar's coming into Islam .. . . . . . . . . . . . . . . . . . . . . 28 The Flight to Abyssinia and Ostracism in the Gorge of Ibn-Abi-Talib . . . . . . . . ... . . . . .. . . . . . . . . 3 1 CHAPTER I1</p></div>"
+    },
+    {
+        "id": 12,
+        "bookId": 1,
+        "chapter": "Fear of Allah",
+        "title": "Fear of Allah",
+        "preview": "FEAR OF ALLAH The Prophet's apprehensions at the Time of s!orm ........................................ 3 6 Anas and other Sahabah's action at the tim...",
+        "content": "<div class=\"story-content\"><p>FEAR OF ALLAH The Prophet's apprehensions at the Time of s!orm ........................................ 3 6 Anas and other Sahabah's action at the time of storm ........................................ 3 7 The Prophet at the time of solar eclipse . . .. . . . . . . . 3 8 The Prophet's weeping for the whole night . . . . . . . 38 4 Abu Bakr and the fear of Allah .................. 3 9 Umar and the fear of Allah ...................... 40 An admonition by Abdullah-bin-Abbas .......... 43 The Prophet's passing near the ruins of Thamud . . . 44 Ka'ab's failure to join theTabuk Expedition ....... 4 5 The Prophet's reprimand on the Sahabah's laugh- ing .......................................... 53 Hanzlah's fear of Nifaq ......................... 53 A few Miscellaneous Stories about the fear of Allah ........................................ 55 CHAPTER I11 ABSTENENCE AND SELF-DENIAL OF THE SAHABAH Page No . The Prophet's dislike for gold ................... 60 The Prophet's life of abstinence ................. 60 Abu Hurairah in state of hunger ................. 62 Abu Bakr's daily allowance frbm Baitul-ma1 ...... 63 Umar's daily allowance from Baitul-ma1 ......... 65 Bilal's story about the Prophet .................. 6 7 Another story of Abu Hurairah's hunger .......... 69 The Prophet's opinion about two persons ........ 70 Privations go with</p></div>"
+    },
+    {
+        "id": 13,
+        "bookId": 1,
+        "chapter": "Piety and Scrupulousness",
+        "title": "Piety and Scrupulousness",
+        "preview": "PIETY AND SCRUPULOUSNESS The Prophet accepts a woman's invitation ........ The Prophet's sleepless night ................... Abu Bakr and a Soothsayer...",
+        "content": "<div class=\"story-content\"><p>PIETY AND SCRUPULOUSNESS The Prophet accepts a woman's invitation ........ The Prophet's sleepless night ................... Abu Bakr and a Soothsayer's food ............... Umar vomits out milk of Sadaqah .............. Abu Bakrgives his garden to Baitulmal .......... The story of Ali bin Ma'bad ..................... Ali passes by a grave ........................... The Prophet's verdict about haram food .......... Umar does not like his wife to weigh musk ........ Umar-bin-Abdul Aziz dismisses a governor ...... CHAPTER V</p></div>"
+    },
+    {
+        "id": 14,
+        "bookId": 1,
+        "chapter": "Devotion to Salaat",
+        "title": "Devotion to Salaat",
+        "preview": "DEVOTION TO SALAAT Blessing of Nafl (non-obligatory) Prayers ......... The Prophet spends the Whole Night in Salaat .... The Prophet's Recitation of t...",
+        "content": "<div class=\"story-content\"><p>DEVOTION TO SALAAT Blessing of Nafl (non-obligatory) Prayers ......... The Prophet spends the Whole Night in Salaat .... The Prophet's Recitation of the Qur'an in Salaat ... Salaat of a few eminent Sahabah . . . . . . . . . . . . . . . . . Salaat while keeping watch ................... Abu Talhah and Salaat ......................... Ibn Abbas and Salaat ........................... Sahabah suspending trade at the time of Salaat .... Martyrdom of Khubaib. Zaid and Asim ........... Prophet's company in Paradise ................. CHAPTER VI SYMPATHY AM) SELF SACRIFICE Page No . Feeding the guest in darkness ................... 97 Feedinga fasting Sahabi ........................ 98 Over payment of Zakaat ........................ 98 Umar trying to emulate Abu Bakr ................ 100 Sahabah dying thirsty for others ................. 101 Hamzah's shroud ............................. 101 The story of the goat-head ...................... 103 Umar's wife acts as a midwife ................... 104 Abu Talhah gives his garden to Allah ............ 106 Abuzar reprimands his servant .................. 107 Story of Abdullah-bin-Zubeyr and Abdullah-bin- jaafar ........................................ 109 CHAPTER VII</p></div>"
+    },
+    {
+        "id": 15,
+        "bookId": 1,
+        "chapter": "Valour and Heroism",
+        "title": "Valour and Heroism",
+        "preview": "VALOUR AND HEROISM Page No . Ibn-Jahsh and Sa'ad pry for each other ........... 11 3 Ali's valour in Uhud ........................... 114 Hanzlah is m...",
+        "content": "<div class=\"story-content\"><p>VALOUR AND HEROISM Page No . Ibn-Jahsh and Sa'ad pry for each other ........... 11 3 Ali's valour in Uhud ........................... 114 Hanzlah is martyred ........................... 11 5 Amar-bin-Jarnooh's love for martyrdom .......... 116 . Musab-bin-Umair gets martyred ................ 11 8 Sa'ad's epistle to Rustam ....................... 119 Wahab-bin-Qabus gets martyred ................ *g 120 IB 3 Tragedy of Bir-Maoona ......................... 1 2 1 3 Umair Givequp eating dates .................... 123 Umar's emigration to Madina ................... 124 Expedition to Mauta ........................... 125 Story of Said-bin-Jubair ........................ 128 CHAPTER VIII MISCELLANEOUS STORIES ABOUT</p></div>"
+    },
+    {
+        "id": 16,
+        "bookId": 1,
+        "chapter": "Zeal for Knowledge",
+        "title": "Zeal for Knowledge",
+        "preview": "ZEAL FOR KNOWLEDGE S-habah's Panel for Fatwa ........................ 135 Abu Bakr burns his collection ..................... 136 . . . . . . . . . . ...",
+        "content": "<div class=\"story-content\"><p>ZEAL FOR KNOWLEDGE S-habah's Panel for Fatwa ........................ 135 Abu Bakr burns his collection ..................... 136 . . . . . . . . . . . . . . . . . . Musab-bin-Umair doing Tabligh 137 Ubai-bin-Ka'ab teaches Hadith . . . . . . . . . . . . . . . . . . . . 138 Huzaifah's anxiety regarding tribulations . . . . . . . . . . . 140 . . . . . . . . . . . . . . . . 142 Abu Hurairah's memory for Hadith Death of Musailmah and compilation of the Qur'an . . 143 145 Ibn-Masood's cautiousness about Hadith . . . . . . . . . . . A person travels from Madinah to Damascus for one ......................................... Hadith 147 Ibn Abbas's thirst for knowledge ................... 149 CHAPTER IX</p></div>"
+    },
+    {
+        "id": 17,
+        "bookId": 1,
+        "chapter": "Pleasing the Prophet",
+        "title": "Pleasing the Prophet",
+        "preview": "PLEASING THE PROPHET Ibn-Amar burns his shawl ...................... An Ansari razes his building ................... Sahabah's discard of sheets of c...",
+        "content": "<div class=\"story-content\"><p>PLEASING THE PROPHET Ibn-Amar burns his shawl ...................... An Ansari razes his building ................... Sahabah's discard of sheets of cloth .............. Wail has his hair cut ........................... Khuraim Asadi discards what is not liked by the Prophet ...................................... Ibn-Umar discards speaking with his son . . . . . . . . . IbnTUmar replies a question .................... Ibn-Mughfal severs relations with his nephew .... Ibn-Jizam's gives up begging .................... Huzaifah goes for spying ....................... CHAPTER X THE</p></div>"
+    },
+    {
+        "id": 18,
+        "bookId": 1,
+        "chapter": "Women's Courage and Spirit",
+        "title": "Women's Courage and Spirit",
+        "preview": "WOMEN'S COURAGE AND SPIRIT FOR ISLAM Fatimah's Tasbih .............................. Aishah's spending in the path of Allah ........... Aishah gets an...",
+        "content": "<div class=\"story-content\"><p>WOMEN'S COURAGE AND SPIRIT FOR ISLAM Fatimah's Tasbih .............................. Aishah's spending in the path of Allah ........... Aishah gets angry with Ibn-Zubair . . . . . . . . . . . . . . Aishah and fear of Allah ........................ Story of Umme Salmah ......................... Women in Khaibar campaign .................. Umme Haram in the battle of Cyprus ............ Story of Umme Sulaim ......................... Umme Habibah's behaviour with her father ....... The story of Zainab ............................ Khansa exhorts her sons ........................ Safiyyah kills a Jew ............................ Asma's interview with the Prophet .............. The story of Umme Ammarah ................... Story of Umme Hakim ......................... Martyrdom of Sumiyyah ....................... The story of Asma-bint-Abi Bakr ................ Asma pacifies her grand-father .................. Asma's spending in charity ..................... The story of the Prophet's daughter Zainab ....... Rabayyi's high-mindedness . . . . . . . . . . . . . . . . . . . . Life sketches of Ummuhat-ul-Mominin .......... 1 . Khadijatul Kubra .......................... 2 . Saudah .................................. 3 . Aishah ................................... 4 . Hafsah ................................... 5 . Zainab-Bint-Khuzamiah ................... 6 . Umme Salmah . . . . . . . . . . . . . . . . . . . . . . . . . . . . 7 . Zainab-bint-Jahsh ......................... 8 . Juwairiah-bint-ul-Harith ................... 10 9 . Umme Habibah ........................... 207 10 . Safiyyah ................................. 208 11 . Maimoonah .............................. 209 The sons of the Prophet ........................ 210 The daughters of the Prophet ................... 211 1 . Zainab ................................... 211 2 . Ruqayyah ................................ 212 3 . Umme-Kulsum ........................... 212 4 . Fatimah .................................. 214 CHAPTER XI</p></div>"
+    },
+    {
+        "id": 19,
+        "bookId": 1,
+        "chapter": "The Children",
+        "title": "The Children",
+        "preview": "THE CHILDREN . THEIR DEVOTION TO ISLAM Children keep fast ............................. 216 Aishah's zeal for knowledge .................... 21 7 Umai...",
+        "content": "<div class=\"story-content\"><p>THE CHILDREN . THEIR DEVOTION TO ISLAM Children keep fast ............................. 216 Aishah's zeal for knowledge .................... 21 7 Umair goes to battle ............................ 218 Umair-bin-Abiwaqas hides himself .............. 218 Two Youngsters of Ansar kill Abu Jahl ........... 219 I Contest between Rafe and Samarah .............. 220 Zaid gets preference for his Qur'an . . . . . . . . . . . . : . 223 Abu Said Khudri's restraint . . . . . . . . . . . . . . . . . . . . . 223 Salmah-bin-Akwa faces the bandits ............. 224 Bara's eagerness to join Badr . . . . . . . . . . . . . . . . . . . . 226 Abdullah-bin-Abdullah-bin-Ubayy disgraces his . Munafiq father ................................. 227 Jabir's eagerness to fight .......................... 229 Ibn Zubair's valour against the Romans . . . . . . . . . . . . . Amr-bin-Saldah leads in Salaat ................... Ibn-Abbas teaches his slave . . . . . . . . . . . . . . . . . . . . . . . Ibn-Abbas memorises Qur'an in childhood . . . . . . . . . Abdullah-bin-Amar notes down Ahadith ........... Zaid-bin-Thabit memorises Qur'an . . . . . . . . . . . . . . . . Hasan's knowledge of Islam . . . . . . . . . . . . . . . . . . . . . . . Husain's zeal for knowledge . . . . . . . . . . . . . . . . . . . . . . CHAPTER XI1 LOVE FOR THE PROPHET Abu Bakr's sufferings for Islam ................. Umar's grief at the Prophet's death ................. An Ansari woman's anxiety about the Prophet The behaviour of Sahabah at Hudeybiyah . . . . . . . . . Ibn-Zubair's disposal of blood . . . . . . . . . . . . . . . . . . . . . Abu Ubaidah loses his teeth ....................... Zaid refuses to go with his father ................... 250 Anas-bin-Nadhr's martyrdom in Uhud ............. 253 Sa'ad's message for the Muslims ................... 253 A woman dies on seeing the Prophet's grave ......... 254 Sahabah's IovefortheProphet and other anecdotes . . . 255 Miscellaneous stories about Sahabah's love for the Prophet ........................................ 256 The Epilogue: Sahabah's virtues and privileges ...... 262 AUTHOR'S FOREWORD We glorify Allah and ask blessings and salutations of peace for the noble Prophet (Sallallaho alaihe wasallam) and his companions and those who follow him in up- holding the cause of the right religion. It was in the year 1353 A.H. that an eminent Sheikh, who is my patron and for whom I have every respect, en- joined me to compile a book containing stories of the com- panions of the Holy Prophet (Sallallaho alaihe wasallam), with special reference to the Faith and Practices of the women and children of his time. The main idea underlying this behest was that Muslim mothers, while going to bed at night, instead of telling myths and fables to their children, may narrate to them such real and true tales of the golden age of Islam that would create in them an Islamic spirit of love and esteem for Sahabah, and thereby improve their 'Imaan'; and the proposed book may, thus, be a useful sub- stitute for the currenttstory books. It became essential for me to comply with tKe desire of the Sheikh, for, besides being under moral debt and obligation to him for his im- mense beneficence, I consider the goodwill of such godly people to be the source of success in this world and the Hereafter. I knew my shortcomings and difficulties and, therefore, had been postponing the execution of this work for four years, when in Safar 1357 A.H., it so happened that I was advised by the doctors to suspend my regular duty of teaching for some time. I decided to utilize this period of rest for complying with the long-standing desire of the Sheikh, with the belief that even if my attempt did not come up to his expectation, it would any\\ow be a pleasant engagement for me and one likely to bring me spiritual blessings, in addition. 0, 13 -5% FOREWORD as rn ar -5 I It is an admitted fact that the stories of the godly s* people deserve to be studied rather deeply, in order to derive proper benefit from them. This is more important in case of Sahabah, who were chosen by Allah for the com- pany of His beloved and our dear Prophet (Sallallaho alaihe wasallam). Their stories not only serve as a beacon of Faith and Practice but also cause Allah's blessings and mercy to descend on the readers. Junaid Baghdadi (Rahma- tullah alaih), a head of the Sufees, once said: \"Stories of the pious and godly are Allah's special de- vices, which encourage the hearts of those who strive in His Path.\" Somebody inquired of Junaid (Rahmatullah alaih) if he could cite something in support of his statement. He re- plied: \"Yes. Allah has said in His Book- \"And all that we relate unto thee of the stories of the messengers is in order that thereby We may make the heart firm. And herein hath come unto thee the Truth and an exhortation and a reminder for believers.\" (XI: 1 2 0) One cannot lay too much stress on the point that whether these be the sayings of the Holy Prophet (Sallal- laho alaihe wasallam) or the stories of other God-fearing people, or the books on Islamic practices, or the epistles and written discourses of the saints, it is not enough to go through them once only, but they have to be studied over and over again in order to derive proper benefit from them. Abu Sulaiman Darani (Rahmatullah alaih), a famous Sairlt, writes: \"I attended a discourse by a Sheikh at his residence. It had some effect on me, but only till the time that I rose from the meeting. I went to his audience for the second time to listen to his discourse, and this time the effect remained with me till I reached my home. When I vis- ited him for the third time, the effect of his discourse 14 12 stayed with me even after reaching home. Then I hoke the shackles that had kept me away from Allah, and set out on His path to seek His pleasure.'' Such is the case with religious books. A cursory reading of these seldom produces the desired effect, and a frequent and thorough study thereof is therefore necessary. For the convenience of the readers, and to interest them, I have divided this book into the following twelve chapters together with an epilogue. Chapter I Steadfastness in the face of hardships. Chapter I1 Fear of Allah. Chapter I11 Abstinence and Contentment. Chapter IV Piety and Scrupulousness. Chapter V Devotion to Salaat. Chapter VI</p></div>"
+    },
+    {
+        "id": 20,
+        "bookId": 1,
+        "chapter": "Sympathy and Self-Sacrifice",
+        "title": "Sympathy and Self-Sacrifice",
+        "preview": "Sympathy and Self-sacrifice and spending in the path of Allah. Chapter VII Valour and Heroism. Chapter VIII Zeal for knowledge. Chapter IX Ready Compl...",
+        "content": "<div class=\"story-content\"><p>Sympathy and Self-sacrifice and spending in the path of Allah. Chapter VII Valour and Heroism. Chapter VIII Zeal for knowledge. Chapter IX Ready Compliance with the Prophet's Wishes. Chapter X The Women's love of Faith and their Cour- age. Chapter XI The Children's Devotion to Islam. Chapter XI1 Love and Devotion for the Prophet (Sallal- laho alaihe wasallam). The Epilogue: ~ahabah's Virtues and Privileges. CHAPTER I STEADFASTNESS IN THE FACE OF HARDSHIPS It is really very hard for the Muslims of to-day to imagine, and much less to endure or even to attempt to endure, the hardships that were borne by the Prophet (Sallallaho alaihe wasallam) and his illustrious compan- ions in the path of Allah. Books of history are full of stories of their sufferings. It is a pity that we are so indifferent to those events and our knowledge is so poor in this regard. I open this chapter with a story about the Prophet (Sallallaho alaihe wasallam) himself to get the blessings of Allah, which are sure to attend his auspicious mention. I. The Prophet's (Sallallaho alaihe Wasallam) Journey to Taif For nine years, since his selection by Allah for His mission, the Prophet (Sallallaho alaihe wasallam) had been delivering the message of Allah in Mecca and making all- efforts to guide and reform his community. Excepting a few persons who had either embraced Islam or who helped him though not accepting his creed, all the rest in Mecca left no stone unturned in persecuting and deriding him and his followers. His uncle Abu Talib was one of those good- hearted people who helped him, in spife of his not entering into the fold of Islam. The following year, on the death of Abu Talib, the Qu- reysh got a free hand and therefore accelerated their sinis- ter pursuits without check and hindrance. At Taif, the sec- ond biggest town of Hijaz, there lived Banu Thaqif, a clan strong in number. The Prophet (Sallallaho alaihe wasallam) left for Taif with the hope of winning them over to Islam, thus giving quarter to Muslims from the persecution of the Qureysh, and also establishing a base forxthe future propa- gation of Islam. On reaching Taif he visited the three chief- tains of the clan separately, and placed before each of them the message of Allah, and called upon them to stand by his Propher's (Sallallaho alaihe wasallam) side. Instead of ac- cepting his message, they refused even to listen to him and. notwithstanding the proverbial Arab hospitality. each of them treated him most contemptuously a11d rudely. They 34 16 2 / plainly told him that they did not like his stay in their town. The Prophet (Sallallaho alaihe wasallam) had ex- pected a civil, even a cordial treatment and due courtesy in speech from them, as they were the heads of the clan. But one of them sneered: \"Hey, Allah has made you a Prophet!\" The other exclaimed with derision: \"Could Allah not lay His hand on anyone else, beside you to make him His Prophet?\" The third one gibed at him: \"I do not want to talk to you, for if you are in fact a Prophet, then to oppose you is to invite trouble, and if you only pretend to be one, why should I talk with an impostor?\" The Prophet (Sallallaho alaihe wasallam), who was a rock of steadfastness and perseverance, did not lose heart over this check from the chieftains, and tried to approach the common people; but nobody would listen to him. Instead they asked him to clear off from their own town and go wherever else he liked. When he realised that fur- ther efforts were in vain, he decided to leave the town. But they would not let him depart in peace, and set the street urc.hins after him to hiss, to hoot, to jeer at, and to stone Iiirn. He was so much pelted at with stones that his whole body was covered with blood, and his shoes were clogged to his feet. He left the town in this woeful plight. When he cvns far out of the town, and safe from the rabble, he prayed to Allah thus: - 0 ,*i u', Fj,k @, 3 219, t & qj &J' -, $i \"0, my Allah! To Thee I complain of the feebleness of my strength, of my lack of resources and my being '8% unimportant in the eyes of people. 0, Most Merciful of 8 a all those capable of showing mercy! Thou art the Lord of the weak, and Thou art my own Lord. To whom art Thou to entrust me; to an unsympathetic foe who would sullenly frown at me, or to an alien to whom Thou hast given control over my affairs? Not in the least do I care for anything except that I may have Thy protection for myself. I seek shelter in Your light-the light which illuminates the Heavens and dispels all sorts of darkness, and which controls all affairs in this world as well as in the Hereafter. May it never be that I should incur Thy wrath, or that Thou should be dis- pleased with me. I must remove the cause of Thy dis- pleasure till Thou art pleased. There is no strength nor power but through Thee.\" The Heavens were moved by the prayer, and Jibrail (Alayhis salaam) appeared before the Prophet (Sallallaho alaihe wasallam), greeting him with Assalamu Alaikum and said: \"Allah knows all that has passed between you and these people. He has deputed an angel in charge of the mountains to be at your command.\" Saying this, Jibrail (Alayhis salam) ushered the angel before the Prophet (Sallallaho alaihe wasallam). The angel greeted the Prophet (Sallallaho alaihe wasallam) and said: \"0, Prophet of Allah! I am at your service. If you wish, I can cause the mountains overlooking this town on both sides to collide with each other, so that all the people therein would be crushed to death, or you may suggesTany other punishment for them.\" The merciful and noble Prophet (Sallallaho alaihe wasal- lam) said: \"Even if these people do not accept Islam, I do hope from Allah that there will be persons from among their progeny who would worship Allah and serve His cause.\" Behold the conduct of our noble Prophet (Sallallaho alaihe wasallam], whom we profess to follow! We get so much irritated over a little trouble or a mere abuse from somebody that we keep on torturing and taking our revenge throughout our lives in every possible manner. Does it become people who claim to follow the magnanimous 18 19 Prophet (Sallallaho alaihe wasallam)? Look, even after so much suffering at the hands of the Taif mob, he neither curses them nor does he work for any revenge, even when he has the full opportunity to do so. 2. Martyrdom of Hadhrat Anas bin Nadhr (Radhiyallaho anho): Hadhrat Anas bin Nadhr (Radhiyallaho anho) was one of the Sahabah who could not take part in the campaign of Badr. He very much regretted to have missed the honour of participating in the first and the most illustrious battle for Islam. He longed for a chance wherein he could make amends for Badr. He did not have to wait for long. The battle of Uhud came about in the following year. He joined the army with the most determined zeal. Despite heavy odds, the Muslims were gaining the upper hand, when some people made a blunder and the Muslims had to suffer a reverse. The Prophet (Sallallaho alaihe wasallam) had posted a band of fifty archers to guard a pass in the rear against the enemy cavalry. They had definite instructions not to move from their position till further orders from him. But when they saw the Muslims gaining victory and the enemy in full flight, they left their position in the belief that the battle was over and it was time to join in the pur- suit and get on to the booty. The leader of the band tried his utmost to check them by reminding them of the Prophet's (Sallallaho alaihe wasallam) command and sol- icited them to stay on, but no more than ten persons would listen to him, arguing that the orders given by the Prophet (Sallallaho alaihe wasallam) were only for the duration of the actual fight. Th'e enemy cavalry then noticed the un- guarded pass in the rear, made a flank movement, forced a passage through it, and fell right on the rear of the Mus- lims, who were pre-occupied with the booty. It was in this state of affairs that Hadhrat Anas (Radhiyallaho anho) saw Hadhrat Sa'ad bin Ma'az (Radhiyallaho anho) passing in front of him. He shouted to him: \"0, Sa'ad! where are you going? Bv Allah! I smell the fragrance of Paradise coming from Mount Uhud.\" Saying this, he threw himself into the very thick of the enemy, and fought tooth and nail till he met his martyr- dom. After the battle, it was found that his body had been mauled and mutilated to such an extent that only his sister . The Truce of Hudeybiah and Story of Hadhrat Abu Jandal and Hadhrat Abu Basir (Radhiyallaho anhu- ma) In the 6th year of Hijrah, the Prophet (Sallallaho alaihe wasallam) along with his companions left for Mecca to per- form Umrah. The Qureysh heard of the news and decided to resist his entry into Mecca even as a pilgrim, and so he had to encamp at Hudeybiah. The devoted Sahabah, 1 400 in number, were however determined to enter, even if it involwd an open fight; but the Prophet (Sallallaho alaihe wasallam) viewed the matter differently and in spite of the Sahabah's eagerness to fight, entered into a treaty with the Qureysh, accepting their conditions in full. This one-sided and seemingly ungraceful truce was a very bitter pill for the Sahabah to swallow, but their devo- tion to the Prophet (Sallallaho alaihe wasallam) would not allow them to demur, and even the most valiant man like Hadhrat Umar (Radhiyallaho anho) could not but submit to his decision. According to one of the articles of the treaty, converts to Islam during the period of the truce were to be returned, but not so the deserters from Muslims to Qureysh. Hadhrat Abu Jandal (Radhiyallaho anho) a Muslim in Mecca, was suffering great persecution at the hands of Qureysh. They kept him constantly in chains. On hearing about the arrival of the Prophet (Sallallaho alaihe wasal- lam) in Hudeybiah, he escaped somehow and managed to reach the Muslim camp at a time when the truce was about to be signed. His father, Suhail (till then a non-Muslim) was the envoy of Qureysh in the negotiations for the truce. He smote Hadhrat Abu Jandal (Radhiyallaho anho) on his face and insisted on taking him back to Mecca. The Prophet (Sallallaho alaihe wasallam) represented that, since the truce had not till then been written, its application in Abu Jandal's case was premature. Suhail, however, would not listen to any argument and was not inclined to leave his 20 I son with the Muslims even at the personal request of the Prophet (Sallallaho alaihe wasallam), and would have for- gone the truce even. Abu Jandal (Radhiyallaho anho) counting his hardships remonstrated at the top of his voice but, much to the grief of the Sahabah, the Prophet (Salalla- ho alaihe wasallam) agreed to his return. He however en- joined patience on him saying: \"Do not be distressed, Hadhrat Abu Jandal (Radhiyalla- ho anho), Allah will shortly open a way for you.\" After the truce was signed and the Prophet (Sallallaho alaihe wasallamj had returned to Madinah, another Meccan Muslim Hadhrat Abu Basir (Radhiyallaho anho) escaped to Madinah and besought the Prophet's (Sallallaho alaihe wa- sallam) protection. The Prophet (Sallallaho alaihe wasal- lam) refused to accept his implorations and, in deference to the truce condition, handed him over to the two persons who had been deputed by the Qureysh to claim him. He, however, advised him as he had advised Hadhrat Abu Jan- dal (Radhiallaho anho) to be patient and to hope for the help of Allah. When Hadhrat Abu Basir (Radhiyallaho anho) and his escort were on their way back to Mecca, Hadhrat Abp Basir (Radhiyallaho anho) said to one of them: \"Friend, your sword is extremely fine.\" The man was flattered and took it out from the sheath and said: \"Yes it is really very fine, and I have tried it on so many persons. Ybu can have a look at it.\" Most foolishly he made over the sword to Abu Basir (Rad- hiyallaho anho), who immediately 'tried' it on its owner and killed him. The other man took to his heels and reach- ed Madinah to report to the Prophet (Sallallaho alaihe wa- sallam). In the meantime Abu Basir (Radhiyallaho anho) also arrived. He said to the Prophet (Sallallaho alaihe wa- sallam): \"0, Prophet of Allah, you once returned me and absolved yourself of the truce obligations. I had no obligations to fulfil and I managed my escape from them by this trick, as I was afraid of their forcing me to forsake my faith.\" The Projhet (Sallallaho alaihe wasallam) remarked: \"You are a war-monger. I wish you could be helped.\" Hadhrat Abu Basir [Radhiyallaho anho) came to under- stand from this that he would be returned to Qureysh again when they demanded him. He therefore left Madinah and fled to a place in the desert on the sea shore. Abu Jandal (Radhiyallaho anho) also managed his escape and joined him there. More Muslims of Mecca followed, and in a few days quite a small group of such fugitives gathered in the wilderness. They had to undergo untold sufferings in the desert. where there was neither habitation nor vegetation. They, however, being bound by no treaty proved a great nuisance for the Qureysh by dealing blows after blows on their caravans passing that way. This compelled the Qu- reysh to approach the Prophet (Sallallaho alaihe wasallam) and beseech him to intervene and call the fugitives to Mad- inah, so that they might be bound by the terms of the treaty like other Muslims, and the caravans might pass in safety. It is said that Hadhrat Abu Basir (Radhiyallaho anho) was on his death bed when the letter sent by the Prophet (Sal- lallaho alaihe wasallam) permitting his return to Madinah reached him. He died while holding the Prophet's (Sallalla- ho alaihe wasallam) letter in his hand. No power on the earth can make a person forsake his faith, provided it is a true faith. Moreover, Allah has given an assurance to help those who are genuine Muslims. 4. Hadhrat Bilal (Radhiyallaho anho) and his Sufferings: Hadhrat Bilal (Radhiyallaho anho) is one of the best known of the galaxy of Sahabah as moazzin of the Proph- et's (Sallallaho alaihe wasallam) masjid. He was an Abys- sinian slave of a disbeliever in Mecca. His conversion to Is- lam was, naturally, not liked by his master and he was, therefore, persecuted mercilessly. Ummay ah bin Khalaf , who was the worst enemy of Islam, would make him lie down on the burning sand at midday and would place a heavy stone on his breast, so that he could not even move a limb. He would then say to him: \"Renounce Islam or swelter and die.\" Even under these afflictions, Bilal (Radhiyallaho anho) would exclaim:- \"Ahad\"-The One (Allah). \"Ahad\"-The One (Allah). 0 2 2 He was whipped at night and with the cuts thus received, made to lie on the burning ground during the day to make him either forsake Islam or to die a lingering death from wounds. The torturers would get tired and take turns (Abu Jahl, Umayyah and others) and vie with one another in afflicting more and more painful punishment, but Hadhrat Bilal (Radhiyallaho anho) would not yield. At last Abu Bakr (Radhiyallaho anho) bought his freedom, and he be- came a free Muslim. As Islam taught implicitly the oneness of the Almighty Creator, ,while the idolaters of Mecca believed in many gods and goddesses with minor godlings, therefore Bilal (Radhiyallaho anho) repeated: \"Ahad (The One), Ahad (The One).\" This shows his love and devotion to Allah. Allah was so dear to him that no amount of persecution could distract him from reciting His Holy name. It is said that the urchins of Mecca would drag him in the streets, with his words \"Ahad!, Ahad!\" ringing in their wake. Look how Allah rewarded his steadfastness! He was to have the honour of becoming the Prophet's moazzin. He was always to remain with him at home and abroad to call out the Azabn for his Salaat. After the Prophet's death it became very1 hard for him to continue his stay in Madinah where he would miss him at every step and in every cor- ner. He therefore left Madinah, and decided to pass the rest of his life striving in the path of Allah. Once he beheld the Prophet (Sallallaho alaihe wasallam) in his dream saying to him: \"0, Bilal! How irs it that you never visit me.\" No sooner did he get up than he set out for Madinah. On reaching there, Hadhrat Hasan and Hadhrat Husain (Rad- hiyallaho anhuma) (The Prophet's (Sallallaho alaihe wasal- lam) grandsons) requested him to call out the Azaan. He could not refuse them, for they were very dear to him. But as soon as the Azaan was called, the people of Madinah cried openly out of their anguish at the memory of the hap- py old days of the Prophet's (Sallallaho alaihe wasallam) time. Even the women came out of their houses weeping. Hadhrat Bilal (Radhiyallaho anho) Ieft Madinah again after a few days and died in Damascus in 20 A.H. d a ad c 0.p 5. Hadhrat Abuzsr Ghifari's (Radhiysllaha anho) Con- -8 4 s m version to Islam: cA Hadhrat Abuzar Ghifari (Radhiyallaho anho) is very famous among the Sahabah for his piety and knowledge. Hadhrat Ali (Radhiyallaho anho) used to say: \"Abuzar is the custodian of such knowledge as other ~ e o p l eare incapable of acquiring.\" When he first got news of the Prophet's (Sallallaho alaihe wasallam) mission, he deputed his brother to go to Mecca and make investigations regarding 'the person' who claimed to be the recipient of Divine revelation. His brother returned after necessary enquiries, and informed him that he found Muhammad (Sallallaho alaihe wasallam) to be a man of good habits and excellent conduct, and that his wonderful revelations were neither poetry nor sooth-say- ings. This report did not satisfy him, and he decided to set out for Mecca and find out the facts for himself. On reach- ing Mecca, he went straight to the Haram. He did not know the Prophet (Sallallaho alaihe wasallam) and he did not consider it advisable (under the circumstances prevailing at that time) to enquire about him from anybody. When it became dark, Hadhrat Ali (Radhiyallaho anho) noticed him and seeing in him a stranger, could not ignore him, as hos- pitality and care for :he travellers, the poor and the strang- ers, were the Sahabah's second nature. He, therefore, took him to his place. He did not ask him about the purpose of his visit to Mecca, nor did Abuzar (Radhiyallaho anho) himself disclose it. Next day, he again went to the Haram and stayed there till nightfall without being able to learn who the Prophet (Sallallaho alaihe wasallam) was. In fact everybody knew that the Prophet (Sallallaho alaihe wasal- lam) and his companions were being persecuted in Mecca, and Abuzar (Radhiyallaho anho) might have had misgiv- ings about the result of his quest for the Prophet (Sallallaho alaihe wasallam). Hadhrat Ali (Radhiyallaho anho) again took him home for the night, but again did not have any talk with him about the purpose of his visit to the city. On the third night, however, after Hadhrat Ali (Radhiyallaho anho) had entertained him as on the two previous nights, he asked him: \"Brother, what brings you to this town?\" Before replying, Hadhrat Abuzar (Radhiyal!aho anho) took 24 an undertaking from Hadhrat Ali (Radhiyallaho anho) that he would speak the truth, and then he enquired from him about Muhammad (Sallallaho alaihe wasallain). Hadhrat Ali (Radhiyallaho anho) replied: \"He is verily the Prophet of Allah. You accompany me tomorrow and I shall take you to him. But you have to be very careful, lest people come to know of your asso- ciation with me, and you get into trouble. When on our way I apprehend some trouble, I shall get aside pre- tending some necessity or adjusting my shoes, and you will proceed ahead without stcgping so that the people may not connect us.\" The next day, he followed Hadhrat Ali (Radhiyallaho anho), who took him before the Prophet (Sallallaho alaihe wasallam). In the very first meeting, he embraced Islam. The Prophet (Sallallaho alaihe wasallam), fearing that the Qureysh might harm him, enjoined upon him not to make an open declaration of his Islam, and bade him to go back to his clan and return when Muslims had gained the upper hand. Hadhrat Abuzar (Radhiyallaho anho) replied: \"0, Prophet of Allah! By Him who is the master of my soul, I must go and recite the Kalimah in the midst of these unbelievers.\" True to his word, he went straight to the Haram and, right in the midst of the crowd and at the pitch of his voice, recited Shahadah viz: \"I bear witness that there is no god save Allah, and I bear witness that Muhammad (Sallaliaho alaihe wasal- lam) is the Prophet of Allah.\" People fell upon him from all sides, and would have beaten him to death if Abbas (the Prophet's uncle, who had not till then embraced Islam) had not shielded him and saved him from death. Abbas said to the mob: \"Do you know who he is? He belongs to the Ghifar clan, who live on the way of our caravans to Syria. If he is killed, they will waylay us and we shall not be able to trade with that country.\" This appealed to their prudence and they left him alone. 3 b, = a The next day. Hadhrat Abuzar (Radhiyallaho anho) re- 4 peated his perilous confession of Imaan and would have 3, surely been beaten to death by the crowd, had not Abbas intervened once again and saved him for the second time. The action of Hadhrat Abuzar (Radhiyallaho anho) was due to his extraordinary zeal for proclaiming Kalimah among the disbelievers, and the prohibition by the Prophet (Sallallaho alaihe wasallam) was due to the soft corner in his heart for Hadhrat Abuzar (Radhiyallaho anho), lest he be put to hardships that might prove too much for him. There is not the least shadow of disobedience in this episode. Since the Prophet (Sallallaho alaihe wasallam) himself was under- going all sorts of hardships in spreading the message of Is- lam, Abuzar (Radhiyallaho anho) also thought it fit to follow his example rather than to avail of his permission to avoid danger. It was this spirit of Sahabah that took them to the heights of material and spiritual progress. When a person once recited the Kalimah and entered the fold of Islam, no power on earth could turn him back and no oppression or tyranny could stop him from Tabligh. 6. The AMictions of Hadhrat Khabbab bin Alarat (Rad- hiyallaho anho): Hadhrat Khabbab (Kadhiyallaho anho) is also one of those blessed persons who offered themselves for sacrifice and suffering for the cause of Allah. He was the sixth or se- venth person to embrace Islam and, therefore, he suffered long. He was made to put on steel armour and lie in the sun to sweat and swelter. Very often he was made to lie flat on burning sand. which caused the flesh on his back to waste away. He was the slave of a woman. When she came to know that he was visiting the Prophet (Sallallaho alaihe wasallam), she used to brand his head with a hot iron rod. Hadhrat 'Umar (Radhiyallaho anho) during his caliphate once inquired of him about the details of his sufferings after embracing Islam. He showed him his back, seeing which Hadhrat 'Umar (Radhiyallaho anho) remarked, \"I have never seen such a back before.\" He said, \"My body was dragged over heaps of smouldering charcoal, and the blood and fat coming out of my back put out the fire.\" It is said that, when Islam spread and the hluslims conquered all the surrounding territory, he used to weep and say: \"Allah seems to he compensating us in this world for all our sufferings, and perhaps nothing would be left for us as reward in the Hereafter.\" 2 6 Hadhrat Khabbab (Radhiyallaho anho) narrates: \"The Prophet (Sallallaho alaihe wasallam) once per- formed an unusually long rakaat while leading a Sa- laat. When the Sahabah mentioned it to him, he said, \"This was a Salaat of yearning and humility. I asked three boons from Allah. I besought Him: '0, Allah! Let not my Ummat perish by famine; let not my Ummat be annihilated by an enemy gaining an upper hand on them; and let not my Ummat fight among themselves.' Allah granted the first two prayers, but not the third one.\" Hadhrat Khabbab (Radhiyallaho anho) died in 37 A.H. He was the first of the Sahabah to be buried at Koofah. Hadhrat Ali (Radhiyallaho anho) once passing his grave said: \"May Allah bless and show mercy on Hadhrat Khab- bab (Radhiyallaho anho). He embraced Islam willingly. He emigrated with great pleasure in Allah's path, and spent his whole life in striving and suffering for Islam. Blessed is the person who is mindful of the Day of judgement, prepares for his reckoning, remains con- tented with very little of this world, and is able to please his Lord.\" To be able to please Allah, was really, the Sahabah's greatest achievement, for this was the sole purpose of their life. I 7. Hadhrat Ammaar (Radhiyallaho anho) and His Par- ents: Hadhrat Ammaar (Radhiyallaho anho) and his parents were also subjected to the severest afflictions. They were tormented on the scorching sands of Mecca. The Prophet (Sallallaho alaihe wasallam) while passing oy them would enjoin patience giving them glad tidings about paradise. Ammaar's father Yasir (Radhiyallaho anho) died after pro- longed sufferings at the hands of persecutors, and his mother Sumayya (Radhiyallaho anha) was killed by Abu Jahl, who put his spear through the most private part of her body, causing her death. She had refused to renounce Islam in the face of terrible torture in her old age. The blessed ;% 2 lady was the first to meet martyrdom in the cause of Islam. ; % The first mosque in Islam was built by Ammaar (Radhiyal- 3 2 m laho anho). When the Prophet (Sallallaho alaihe wasallam) emi- grated to Madinah, Ammaar (Radhiyallaho anho) offered to build a structure for him where he could sit, take rest in the afternoon, and say his Salaat under its roof. He first col- lected the stones and then built the musjid in Quba. He fought against the enemies of Islam with great zeal and courage. Once he was fighting in a battle when he said re- joicingly: \"I am to meet my friends very soon, I am to meet Muhammad (Sallallaho alaihe wasallam) and his com- panions.\" He then asked for water. He was offered some milk. He took it and said: \"I heard the Prophet (Sallallaho alaihe wasallam) say- ing to me, \"Milk shall be the last drink of your worldly life.\" He then fought till he met his coveted end. He was then aged about ninety-four. 8. Hadhrat Sohaib's (Radhiyallaho anho) coming into Is- Iam: Hadhrat Sohaib and Hadhrat Ammaar (Radhiyallaho anhuma) became Muslims at the same time. The Prophet (Sallallaho alaihe wasallam) was staying at Arqam's (Rad- hiyallaho anho) place, when they both came separately with the same intention of embracing Islam and met each other at the door of the house. Sohaib (Radhiyallaho anho) also suffered very much at the hands of his persecutors, like other poor Muslims of that time. At last he decided to emigrate to Madinah. The Qureysh would not tolerate this and, soon after his departure, a party went in pursuit to bring him back to Mecca. As the party drew near, he shouted to them: \"You know that I am a better archer than all of you. So long as I have a single arrow left with me, you will not be able to approach me and, when I finish all my arrows, I shall fight you with my sword, as long as it is in my hand. If you like you can get my money which I have left in Mecca and my two women slaves, in lieu of me.\" 28 And they agreed. He told them the whereabouts of his money, and they allowed him to proceed to Madinah. At this, Allah revealed the following verse of the Qur'an to the Prophet (Sallallaho alaihe wasallam): \"And of mankind is he who would sell himself, seek- ing the pleasure of Allah, and Allah has compassion on His bondsmen.\" The Prophet (Sallallaho alaihe wasallam) was at that time at Quba. When he saw Hadhrat Sohaib (Radhiyallaho anho) coming, he remarked: \"A good bargain, Sohaib!\" Sohaib (Radhiyallaho anho) narrates: \"The Prophet (Sallallaho alaihe wasallam) was eating dates at that time. I also joined him in eating. One of my eyes was sore.\" He said, \"Sohaib! you are taking dates when your eye is sore.\" 'But I am taking them by the side of the other eye, which is not sore, 0, Prophet of Allah,' I replied. The Prophet (Sallallaho alaihe wa- sallam) was much amused with my retort.\" Hadhrat Sohaib (Radhiyallaho anho) was very gener- ous and he spent his money on others most lavishly. 'Umar (Radhiyallaho anho) once told him that he was rather ex- travagant. He replied: \"But I spend only where it is right.\" When Hadhrat 'Umar (Radhiyallaho anho) was about to die, he expressed the wish that his funeral service be led by Hadhrat Sohaib (Radhiyallaho anho). 9. Hadhrat 'Umar (Radhiyallaho anho) coming into Is- lam. Hadhrat 'Umar (Radhiyallaho anho), of whom all the Muslims are justly proud, and the disbelievers still dread, was most adamant in opposing the Prophet (Sallallaho alaihe wasallam) and very prominent in persecuting the Muslims before he embraced Islam. One day, the Qureysh in a meeting called for somebody to volunteer himself for the assassination of the Prophet (Sallallaho alaihe wasal- lam). 'Umar (Radhiyallaho anho) offered himself for this job, at which everybody exclaimed: \"Surely, you can do it, 'Umar!\" With sword hanging from his neck, he set out straight away on his sinister errand. On his way he met Sa'ad bin Abi Waqqas of the Zuhrah clan. Sa'ad inquired: \"Whither! 'Umar?\" 'Umar: \"I am after finishing Muhammad.\" Sa'ad: \"But do not you see that Banu Hashim, Banu Zuhrah and Banu Abde Munaf are likely to kill you in retaliation?\" 'Umar (upset at the warning): \"It seems-that you also have renounced the religion of your forefathers. Let me settle with you first.\" So saying, Umar drew out his sword. Sa'ad announcing his Islam, also took out his sword. They were about to start a duel when Sa'ad said: \"You had better first set your own house in order. Your sister and brother-in-law both have accepted Islam.\" Hearing this, Umar flew into a towering rage and turned his steps towards his sister's house. The door of the house was bolted from inside and both husband and wife were receiving lessons in the Qur'an from Hadhrat Khabbab (Radhiyallaho anho). 'Umar knocked at the door and shouted for his sister to open it. Hadhrat Khabbab (Rad- hiyallaho anho) hearing the voice of 'Umar, hid himself in some inner room, forgetting to take the manuscript pages of the Holy Qur'an with him. When the sister opened the door, 'Umar hit her on the head, saying: \"0, enemy of yourself. You too have renounced your religion.\" Her head began to bleed. He then went inside and inquired, \"What were you doing? And who was the stranger I heard from outside?\" His brother-in-law replied, \"We were talk- ing to each other.\" 'Umar said to him, \"Have you also for- saken the creed of your forefathers and gone over to the new religion?\" The brother-in-law replied, \"But what if the new religion be the better and the true one'?\" 'Umar got 30 31 beside himself with rage and fell on him, pulling his beard and beating him most savagely. When the sister intervened, he smote her so violently on her face that it bled most profusely. She was, after all, 'Umar's sister; she burst out: \"'Umar! we are beaten only because we have become Muslims. Listen! we are determined to die as Muslims. You are free to do whatever you like.\" When 'Umar had cooled down and felt a bit ashamed over his sister's bleeding, his eyes fell on the pages of the Qur'an left behind by Hadhrat Khabbab (Radhiyallaho anho). He said, \"Alright show me, what are these?\" \"No,\" said the sister. \"vou are unclean and no unclean person can touch the Scripture.\" He insisted, but the sister was not prepared to allow him to touch the leaves unless he washed his body. 'Umar at last gave in. He washed his body and then began to read the leaves. It was Surah \"Taha\". He started from the beginning of the Surah, and he1 was a changed man altogether when he came to the verse: \"Lo! I, indeed I am Alfah. There is none worthy of worship savz Me. So serve me and establish Salaat for My remembrance.\" He said: \"Alright, take me to Muhammad (Sallallaho alaihe wasallam).\" On hearing this, Hadhrat Khabbab (Radhiyallaho anho) came out from insidwand said: \"0, 'Umar! Glad tidings for you. Yesterday (on Thurs- day night) the Prophet (Sallallaho alaihe wasallam) prayed to Allah, '0, Allah strengthen Islam with either 'Umar or Abu Jahl, whomsoever Thou likest'. It seems that his prayer has been answered in your favour.\" 'Umar then went to the Prophet (Sallallaho alaihe wasal- lam) and embraced Islam on Friday morning. 'Umar's Islam was a terrible blow to the morale of the unbelievers, but still the Muslims were few in number and the whole coun- try was against them. The disbelievers intensified ,their efforts for the complete annihilation of Muslims and the extinction of Islam. With 'Umar (Radhiyallaho anho) on their side, the Muslims now started saying their Salaat in . The Flight to Abyssinia and Ostracism in the Gorge of Ibn-Abi Talib: The hardships and sufferings borne by the Muslims were ever on the increase. The Prophet (Sallallaho alaihe wasallam) at last permitted them to emigrate to some other place. Abyssinia at that time was ruled by a Christian King (who later on embraced Islam). famous for his mercy and equity. In Rajab of the fifth year of the Mission, the ,first group emigrated to Abyssinia. The group comprised about twelve men and five women. The Qureysh pursued them to the port to capture them, but their vessels had left the shore. When the group reached Abyssinia, they heard the rumour that the whole tribe of the Qureysh had accepted Islam. They were naturally very much pleased at the new, and returned to their country. On approaching Mecca, they learnt that the rumour was false and the persecutions wen: going on unabated. Some of them decided to return to Abyssinia and the rest entered Mecca, seeking the protec- tion of a few inflyential people. This is known as the first migration to Abyssinia. Later on, a bigger group of eighty- three men and eighteen women emigrated to Abyssinia (separately). This is called the second emigration to that country. Some Sahabah took part in both the migrations. The Qureysh did not like the emigrations, and the thought of peace enjoyed by the fugitives gave them no rest. They sent a delegation to Abyssinia with handsome presents for the king, his courtiers and the clergy. The delegation first met the chiefs and the priests and, by offering them pres- ents, succeeded in winning the court officials to their side. Having thus made their way to the royal court, they pros- trated themselves before the king and then presenting the gifts put their case before him. They &id: \"0, king! A few foolish lads of our community have re- nounced their ancestral faith, and have joined an absolutely new religion, which is opposed to'our as well as your religions. They have come and-settled in your country. The nobility of Mecca, their own parents 3 2 and kith and kin have sent us to take them back to their country. We beseech you to make them over to us.\" The king replied: \"We cannot make over the people who have sought our shelter, without proper investigation. Let us call them to our presence, and hear them out. If your charge of apostasy against them is genuine, we shall make them over to you.\" The king thereupon summoned the Muslims to his court. They were at first greatly distressed and did not know what to do, but Allah gave them courage, and they decided to go and place the true facts before the king. On appearing before him, they greeted him with 'Salaam'. Someone from the courtiers objected that they had not prostrated before the king according to the rules of the land. They explained: \"Our Prophet (Sallallaho alaihe wasallam) has forbid- den us from prostrating before any one except Allah.\" The king then asked them to submit what defence they could make to the charges brought against them. Ja'far (Radhiyallaho anho) rose and addressed the king thus: \"0, king! we were an ignorant people. We neither knew Allah nor His Prophets A.S. We worshipped stones. We used to eat carrion and commit all sorts of undesirable and disgraceful acts. We did not make good our obligations to our relatives. The strong among us would thrive,at the expense of the weak. Till at last, Allah raised a Prophet (Sallallaho alaihe wasallam) for our reformation. His noble descent, up-right conduct, integrity of purpose, and pure life are only too well known amongst us. He called upon us to worship Al- lah, and exhorted us to give up idolatry and stone- worship. He enjoined upon us right conduct, and for- bade us from indecency. He taught us to tell the truth, to make good our trust, to have regard for our kith and kin, and to do good to our neighbours. From him we learnt to observe Salaat. Fasting, Zakaat and good con- duct; and to shun everything foul, and to avoid blood- shed. He forbade adultery, lewdness telling of lies, misappropriating the orphan's heritage, bringing false accusations against others, and all other indecent things of that sort. He taught us the Qur'an, the won- derful book of Allah. So we believed in him, followed him and acted up to his teachings. Thereupon our people began to persecute us, and to subject us to tor- tures, thinking that we might abjure our faith and re- vert ta idolatry. When, however, their cruelties exceeded all bounds, we took shelter in your country by the permission of our Prophet (Sallallaho alaihe wa- sallam).\" The king said: \"Let us hear something of the Qur'an that your Prophet (Sallallaho alaihe wasallam) has taught you.\" Hadhrat Ja'far (Radhiyallaho anho) recited a few verses from the beginning of Surah \"Maryam\", which touched the hearts of the king and the priestly class so much that tears flowed down their cheeks and wetted their beards. The king remarked: \"By Allah, these words and the words revealed to Moosa ('Alayhis Salam) are the rays of one and the same light,\" and he told the Qureysh embassy that he would by no means hand over the refugees to them. Then, disappointed and disgraced, they held a counsel. One of them said: \"I have hit upon a plan that is sure to draw the king's wrath upon their heads.\" Although the others did not agree to sukh a drastic step (for after all they were their own flesh and blood), yet he would not listen. The next day, they excited the king by telling him that those heretics denounced 'Isa ('Alayhis Salam) and did not believe in his Divinity. The Muslims were again summoned to the court. They were much more dis- tressed this time. When the king inquired about their belief in 'Isa ('Alayhis Salam). they said: \"We believe in what Allah has revealed about him to our Prophet (Sallallaho alaihe wasallam), i.e. he is a servant and Prophet of Allah, and is His word, which He conveyed to the virgin and pure Maryam.\" Negus said: \"'Isa ('Alayhis Salam) himself does :not say anything beyond that.\" The priests then began to murmur in protest, but the king would not listen to them. He returned to the de1t:gatioil the 34 presents they had brought f.or him, and said to the Mus- lims: \"Go and live in peace. If anybody ill-treats you, he will have to pay heavily for it.\" A royal declaration was also issued to that effect. This enhanced the prestige of the Muslims in the country, and the Qureysh delegation had to return crestfallen. This failure of the Qureysh embassy to Abyssinia, and the triumph of Muslims over them, led to an increase in the exasperation of the idolaters; the conversion of 'Umar (Rad- hiyallaho anho) to Islam added fuel to fire. They grew more and more embittered, till things came to such a pass that a large number of the Qureysh chiefs conspired to kill Mu- hammad (Sallallaho alaihe wasallam) outright and deal summarily with the whole affair. But this was not so easy. Banu Hashim to which clan the Prophet (Sallallaho alaihe wasallam) belonged, were strong in number and still stronger in influence. Although all of them were not Mus- lims, yet even the non-Muslims among them would not agree to, or tolerate the murder of the Prophet (Sallallaho alaihe wasallam). The Qureysh, therefore, decided to place a social ban on the Banu Hashim, and their chiefs drew up a document to the effect that none of them or their clans would associate with, buy from or sell to those who sided with the Banu Hashim, unless and until they surrendered Muhammad (Sallallaho alaihe wasallam) for the death pen- alty. All of them signed this document on 1st Moharram of 7th year of the Mission, and the scroll was hung up in the Ka'abah in order to give it full sanctity. Then, for three long years. the Prophet (Sallallaho alaihe wasallam) was shut up with all his kinsfolk in the glen, which was a sub-section of one of the gorges that run down to Mecca. For three long years, nobody could see them nor could they see anybody. They could not purchase anything in Mecca nor from any trader coming from outside. If any person was found out- side this natural prison, he was beaten mercilessly and if he asked for anything it was flatly refused. Soon their stock of food was exhausted and they were reduced to famine rations. Their women and, more specially, the children and suckling babies would cry with hunger, and this was harder on them than their own starvation. During the last part of this period, their sole subsistence was the little food that the husbands of Hashimite women married into other clans managed td smuggle into the glen in the darkness of night. At last by the Grace of Allah, after three years the scroll was eaten up by white ants and the ban was removed. The severity of the afflictions, which they bore during this period of ostracism, cannot be imagined. But the Sahabah not only remained steadfast in their faith, but also kept busy in spreading the light of Islam amongst their com- rades in distress. Look! How much the Sahabah have suffered in the path of Allah and for the cause of Islam. We claim to follow their footsteps, and dream of the material progress and spiritual elevation which was theirs, but how much have we suffered in the true cause? what sacrifice have we offered for the sake of Allah in His path? Success is always proportionate to the sacrifice. We wish to live in luxury and comfort, and are too eager to race shoulder to shoulder with the non-Muslims in enjoying the good things of this world, forgetting the Hereafter, and then at the same time we expect to receive the same help from Allah which the Sahabah received in their time. We cannot beguile anybody but ourselves by working like this. As the Poet has said, 'I am afraid, 0 wayfarer, that you will not reach the Ka'aba because the path that you are following goes (in the oppo- site direction) to Turkistan.' FEAR OF ALLAH Coupled with the remarkable spirit of sacrifice, the Sa- habah had genuine and deep-rooted fear of Allah in their hearts. I wish today's Muslims could have an iota of that fear of Allah. Here are a few stories about this aspect of their lives. 1. The Prophet's [Sallallahoalaihe wasallam) Apprehensionsat the time of a storm. Hadhrat Aishah (Radhiyallaho anha) relates that when- ever a strong wind bringing dense clouds started blowing, the Prophet's (Sallallaho alaihe wasallam) face turned pale with the fear of Allah. He became restive and would go in and out with perturbation, and would recite the following prayer: \"0, my Allah! I ask of Thee the good out of this wind, the good out of that which is in this wind, and the good out of that which is the outcome of this wind. I seek refuge in Thee from the evil of this wind, from the evil out of that which is in this wind, and from the evil out of that which is the outcome of this wind.\" She says: \"And further when it began to rain, signs of delight ap- peared on his face. I said to him once, '0, Prophet of Allah when clouds appear everybody is happy as they foretell rain, but why is it that I see you so much per- turbed at that time?' He replied, '0, 'Aishah! How can I feel secure that this wind does not portend Allah's wrath? The people of A'ad were punished with the wind. They were happy when they beheld the gather- ing dense clouds, believing that they brought rain; but actually those clouds brought no rain but utter destruc- tion to 'A'ad.\" 4 The Prophet [Sallallaho alaihe wasallam) was. obviously 4 4 referring to the following verses of the Qur'an: S Ln \"Then, when they (A'ad) beheld a dense cloud coming toward their valleys, they said: \"Here is a cloud bring- ing us rain.\" Nay, but it is that very calamity which you did seek to hasten, a wind wherein is grievous penalty, destroying all things by commandment of its Lord. And morning found them so that naught could be seen, save their dwellings. Thus we treat the guilty folk.\" (XLVI: 24 & 25) Look at the fear of Allah in the heart of a person who is the best of all creation (Sallallaho alaihe wasallam). In spite of a clear verse in the Qur'an that Allah would not punish the people so long as the Prophet (Sallallaho alaihe wasal- lam) was with them (Al-Qur'an VIII: 33), he has so much fear of Allah in him that a strong wind reminds him of the punishment awarded to the people in the past. Now let us peep into our own hearts for a moment. Although we are fully saturated with sins, yet none of the unusual phenom- ena viz: earthquake, lightning, etc., arouses the least fear of Allah in our hearts and, instead of resorting to Istighfaar or Salaat at such times, we only indulge in absurd investiga- tions. 2. What Hadhrat Anas (Radhiyallaho anho) used to do when a storm approached: Hadhrat Nadhr-bin-Abdullah relates: \"One day while Hadhrat Anas (Radhiyallaho anho) was alive, it became very dark during the day time. I went to him and said, \"Did you ever see much a thing in the Prophet's time?\" He replied, \"I seek refuge in Allah! In those days if the breeze grew a little stronger than normal, we would hasten towards the musjid, fearing the approach of the Last Day.\" Hadhrat Abu Darda (Radhiyallaho anho) narrates: \"Whenever there was a storm, the Prophet (Sallallaho 33 38 Br CI o* alaihe wasallam) would get perturbed and would go to \"If Thou punish them, they art Thy slaves; and if Thou the musjid.\" forgive them, Thou only art the Mighty, the Wise.\" (V:118) 3 .! * Who thinks of going to musjid, now-a-days, even at the time of the worst of calamities? Leave aside the common people, even those who regard themselves as good and practising Muslims do not practise this Sunnat. What a de- terioration! 3. The action of Prophet (Sallallaho alaihe wasallam) at the Time of Solar Eclipse. The Sun once was in eclipse in the Prophet's (Sallal- laho alaihe wasallam) time. The Sahabah left their jobs. Even the young boys, practising archery, hastened towards the musjid to know what the Prophet (Sallallaho alaihe wa- sallam) would do at that time. The Prophet (Sallallaho alaihe wasaliam) started Salaat of two rakaat, which were so long that some people fainted and fell down. He wept in his Salaat and said: \"0, My Lord! Thou has said that Thou y~ouldst not punish them as long as I am with them and so long as they seek Thy forgiveness.\" This refers tai. a verse in the Qur'an wherein Allah says: \"But Allah would not punish them while Thou art with them, nor will He punish them while they seek forgiveness.\" (VIII-33) t He then addressed the people saying: \"You should hasten'for Salaat whenever you happen to find the Sun or the Moon in eclipse. If you happen to know the signs of the Last Day as I do. then surely you would weep more and laugh less. In all such hap- penings, repair to Salaat; pray to Allah and distribute alms to the poor.\" 4. The Prophet's weeping the whole night: The Rophet once (Sallallaho alaihe wasallam) kept weeping the whole night through, repeating again and again the following verse: It is said about Imam Abu Hanifah (Rahmatullah alaih) that he also once wept the whole night, reciting the follow- ing verse of the Qur'an in Tahajjud: \"But avaunt ye, 0, ye guilty, this day.\" (XXXVI: 58) This verse means that on the Day of Judgement, the guilty will be asked to separate themselves from the good, and will not be allowed to mix with them as they were doing in the worldly life. Why should not the people with fear of Allah in their hearts weep in anxiety regarding which class they will belong to on that Day? 5. Hadhrat Abu Bakr (Radhiyallaho anho) and The Fear of Allah: According to our belief, Abu Bakr (Radhiyallaho anho) is the most exalted person after the Prophets (may peace be on all of them). The Prophet (Sallallaho alaihe wasallam) himself conveyed to him the glad tidings of his being the head of a group of persons in Paradise. The Prophet (Sallal- laho alaihe wasallam) once remarked: \"Abu Bakr's name shall be called out from all the gates of Paradise, and he will be the first of my followers to enter it.\" With all these virtues and privileges, Abu Bakr (Radhiyal- laho anho) used to say: \"I wish I were a tree that would be cut and done away with.\" Sometimes he would say: \"I wish I were a blade of grass, whose life ended with the grazing by some beast.\" He also said: \"I wish I were a hair on the body of a Mo'min.\" Once he went to a garden, where he saw a bird singing. He sighed deeply and said: 40 \"0, bird! How lucky you are! You eat, you drink and fly under the shade of the trees, and you fear no reck- oning of the Day of Judgement. I wish I were just like you.\" Hadhrat Rabiah Aslami (Radhiyallaho anho) narrates: \"Once I had some argument with Abu Bakr (Radhiyal- laho anho), during which he uttered a word that I did not like. He realized it immediately and said to me 'Brother, please say that word back to me in retali- ation.' I refused to do so. He persisted, and even spoke of referring the matter to the Prophet (Sallallaho alaihe wasallam), but I did not agree to utter that word. He got up and left me. A few people of my clan remarked, 'Look! How strange! The person does wrong to you and, on the top of that, he threatens to complain to the Prophet (Sallallaho alaihe wasallam)'. I said, 'Do you b o w who he is. He is Abu Bakr (Radhiyallaho anho). To displease him is to displease the Prophet (Sallal- laho alaihe wasallam) and to displease the Prophet (Sallallaho alaihe wasallam) is to displease Allah, and if Allah is displeased then who can save RabiAh from ruin?' I went to the Prophet (Sallallaho alaihe wasal- lam) and narrated the whole story to him. He said, 'You were quite right in refusing to utter that word. But you could have said this much in reply: '0, Abu Bakr, (Radhiyallaho anho) May Allah forgive you!\" Look at the fear of Allah in Hadhrat Abu Bakr (Radhiyal- laho anho)! He is so anxious to clear his accounts in this world that no sooner has a slightly unpleasant word been addressed by him to a person, than he regrets it and re- quests him to say that word back to him in retaliation. He is so particular in this that he threatens to have the retaliat- ion done through the intervention of the Prophet (Sallal- laho alaihe wasallam). We are in the habit of saying offensive words to others, but we fear neither the retaliat- ion nor the reckoning in the Hereafter. 6. Hadhrat 'Umar (Radhiyallaho anho) and the Fear of Allah. Umar (Iiadhiyallaho anho) would often hold a straw in his hand and say: \"I wish I were a straw like this.\" 2 =% o* Sometimes he would say: 8: -e a 3 m \"I wish my mother had not given birth to me.\" m Once he was busy with some important work when a person came to him and, complaining about some petty grievance, requested for its redress. Hadhrat Umar (Radhi- yallaho anho) laid a lash across his shoulders, saying: \"When I sit for that purpose, you do not come to me but when I am engaged in other important work you come with your grievances to interrupt me.\" The person walked away. But Hadhrat 'Umar (Radhiyal- laho anho) sent for him and, handing his whip over to him, said: \"You now lash me to even the matter.\" He said: \"I forgive you for the sake of Allah.\" Hadhrat Umar (Radhiyallaho anho) went home, prayed a Salaat of two rakaats in repentance and upbraided himself saying: \"0, Umar! You were low but Allah elevated you. You were wandering astray but Allah guided you. You were base but Allah ennobled you and gave you sovereignty over His people. Now one of them comes and asks you for redress of the wrong done to him, and you beat him? What answer have you to give before Allah?\" He kept on chiding himself thus for a very long time. Once Hadhrat Umar (Radhiyallaho anho) was going on his usual round towards Harrah (a suburb of Madinah) with his slave Aslam, when he saw a distant fire in the desert. He said: \"There seems to be a camp. Perhaps, it is a caravan that could not enter the town due to night fall. Let's go and look after them and arrange for their protection during the night.\" When he reached there, he found a woman and some chil- dren. The children were crying. The woman had a pan of water over the fire. Hadhrat 'Umar (Radhiyallaho anho) greeted her with salaam and, with her permission, went near her. 4 2 Umar: \"Why are these children crying?\" The Woman: \"Because they are hungry.\" Umar: \"What is in the pan?\" The Woman: \"Only water to soothe the children, so that they may go to sleep in the belief that food is being prepared for them. Ah! Allah will judge between Umar (Rad- hiyallaho anho) and me, on the Day of Judgement, for neglecting me in my dis- tress. \" 'Umar (weeping): \"May Allah have mercy on you! How can Umar know of your distress?\" The Woman: \"When he is our Amir, he must keep himself informed about us.\" Hadhrat 'Umar (Radhiyallaho anho) returned to the towd and straightway went to Baitul-Ma1 to fill a sack with flour, dates, fat and clothes, and also drew some money. When the sack was ready, he said to Aslam: \"Now put this sack on my back, Aslam.\" Aslam: \"No please, Amir-ul-Mo'mineen! I shall carry this sack.\" 'Umar refused to listen to Aslam, even on his persistant re- quests to allow him to carry the sack, and remarked: \"What! Will you carry my load on the Day of Judge- ment? I must carr this bag, for it is I who would be questioned (in the l I ereafter) about this woman.\" Aslam most reluctantly placed the bag on Umar's (Radhi- yallaho anho) back, who carried it with a swift pace right to the woman's tent. Aslam followed at his heels. He put a little flour and some dates and fat in the pan and began to stir. He blew (with his mouth) into the fire to kindle it. Aslam says: \"I saw the smoke passing through his thick beard.\" After some time, the pottage was ready. He himself served it to the family. When they had eaten to their fill, he made aver to them the little that was left for their next meal. The children were very happy after their meal and began to ae % 3 play about merrily. The woman felt very grateful and re- 8 3 .E 4 marked: S m m \"May Allah reward you for your kindness! In fact you deserve to take the place of Khalifah instead of 'Umar.\" 'Umar consoled her and said: \"When you come to see the Khalifah, you will find me there.\" He sat for a while at a place close by and kept on watching the children. He then returned to Madinah. On his way back, he said to Aslam: \"Do you know why I sat there, Aslam? I had seen them weeping in distress; I liked to, see them laughing and happy for some time.\" It is said that Hadhrat Umar (Radhiyallaho anho) while leading Fajr Salaat used to recite 'Kahf', 'Taha' and other such Soorahs in his Salaat, and would weep so much that his crying could be heard way back to several rows. Once he was reciting Surah 'Yusuf' in Fajr. When he came to the verse: \"I only plead for my distress and anguish unto Allah,\" (XII: 86) he wept so much that he could not recite any further. In Tahajjud, he would sometimes fall to the ground and would get indis osed with excessive weeping. Such was t E e fear of Allah in Hadhrat Umar (Radhiyal- laho anho) whose name struck terror in the hearts of the mightiest monarchs of his time. Even today, the people are filled with awe when they read about him. Is there any person in power today who is prepared to show such kind- ness to the people in his charge? 7. An Admonition by Hadhrat Abdullah bin Abbas (Radhiyallaho anho). Wahab bin Munabbah says: \"Abdullah bin Abbas (Radhiyallaho anho) lost his eye- sight in his old age. I once led him to the Haram in Mecca, where he heard a group of people exchanging 44 hot words among themselves. He asked me to lead him to them. He greeted them with 'Assalamu Alaikum.' They requested him to sit down, but he refused and said: 'May I tell you about people whom Allah holds in high esteem? These are those whom His fear has driven to absolute silence, even though they are neither helpless nor dumb. Rather they are possessors of eloquence and have power to speak and sense to understand. But constant glorification of Allah's name has so over-powered their wits that their hearts are overawed and their lips sealed. When they get estab- lished in this state, they hasten towards righteousness. Whither have you people deviated from this course? After this admonition, I never saw an assembly of even two persons in the Haram.\" It is said that Hadhrat Ibne Abbas (Radhiyallaho anho) used to weep so much with Allah's fear that the tears streaming down his cheeks had left permanent marks on them. In this story, Hadhrat Abdullah bin Abbas (Radhiyal- laho anho) has prescribed a very easy way to righteousness. This is to meditate over the greatness of Allah. If this is done, it becomes very easy- to perform all other acts of righteousness with full sincerity. Is it so very difficult to devote a few minutes, out of the twenty four hours of a day at one's disposal, to this spiritual meditation? 8. The Prophet's (Sallallaho alaihe wasallam) passing near the ruins of Thamud during Tabuk expedition: The Tabuk expedition is one of the major campaigns of the Prophet (Sallallaho alaihe wasallam), and the last one in which he personally took part. When he received the news that the Caesar (of Rome) had mustered a large force to crush the power of Islam and was on his way (through Syria) to invade Madinah, he decided to lead the Sahabah to check him on his way. On Thursday the 5th of Rajab, 9 A.H., the devoted band marched out of Madinah. As the weather was hot and the fighting was expected to be very tough. the Prophet (Sallallaho alaihe wasallam) made an open declaration that the Muslims should gather in strength and prepare fully to face the forces of the Roman Empire. He also exhorted them to contribute towards the equipment of the expedition. It was on this occasion that Hadhrat Abu Bakr (Radhiyallaho anho) contributed all his S c CI a belongings. When he was questioned by the Prophet (Sal- .z 0 s 4 lallaho alaihe wasallam) as to what he had left for his 2\" family, he replied: \"I have left Allah and His Prophet (Sallallaho alaihe wasallam) for them.\" Hadhrat Umar (Radhiyallaho anho) contributed half of his belongings and Hadhrat 'Usman (Radhiyallaho anho) pro- vided for the equipment of one-third of the whole army. Although everybody, contributed beyond his means, yet the equipment fell far short of the requirements. Only one camel was available for each group of ten persons, who were to ride it in turn. This is why this campaign is known as: \"The campaign of hardship.\" The journey was long and the weather hot and dry. The or- chards were laden with ripe dates (the staple crop of Madi- nah) and it was just the time for harvesting, when all of a sudden the Sahabah were required to start on this cam- paign. It was really an acid test of their Imaan. They visual- ised the long and arduous journey, the scorching heat, the formidable enemy opposed to them and, to top all, the prospective loss of the year's crop, but they could not even dream of evading the call to arms, and that solely on ac- count of the deep-rooted fear of Allah in their hearts. Except the women, children (who were excusable), those who were ordered to stay behind by the Prophet (Sallallaho alaihe wasallam) himself, and the munafiqin, nearly every- body joined the expedition. Also among those left behind were such persons as could neither arrange conveyance for themselves, nor was the Prophet (Sallallaho alaihe wasal- lam) able to provide them with any. It is about such people that Allah says in his Book: \"They turned back with eyes flowing with tears in sorrow that they could not find means to spend.\" (IX: 92) Of the true believers, those who stayed behind without any excuse whatsoever were three in number. Their story would be presently related. On their way to Syria when the expedition reached the habitat ion of Tharnud, the Prophet (Sallallaho alaihe wasallam) covered his face with his shirt and quickened the pace of his camel. He also instructed the 46 4 7 Sahabah to do the same, since that was the scS.ne of Tha- mud's destruction. They were advised to pass there weep- ing and fearing lest Allah should punish them as he had punished the Thamud. The dearest and the most beloved Prophet of Alish and his privileged companions pass by the ruins of the Fun- ished people in fear and tears, lest they meet the same fate; on the other hand today, if any place is struck with an earthquake, it becomes a place of sightseeing for us and, if we come across any ruins, our eyes remain dry and our hearts unaffected. What a change of attitude! 9. Hadhrat Ka'ab's (Radhiyallaho anho) Failure to Join the Tabuk Expedition: Among the Munafiqin who did not join the Tabuk ex- pedition, there were more than eighty persons from among the Ansar and an equal number from amongst the nomadic Arabs and a large number from the out-stations. Not only did they stay behind themselves, but they induced others to do SO saying: \"Go not forth in the heat.\" Allah's reply to thie was: (*\\ $9) I> bi * ju ji \"Say the fire of Hell is of more intense heat.\" From amongst the .f&thful, there were only three persons who failed to rally to the Prophet's call. They were Mura- rah bin Rabi, Hilal MR Umayyah and Ka'ab bin Malik (Rad- hipallaho anhum). Murarah had orchards of dates, laden with fruit. He pershaded himself to lag behind with the piea: \"I have taken part in all the campaigns so far. What possible harm would befall the Muslims, if I miss this one?\" He feared the loss of his entire crop in his absence, and this prevented him from going out. But when he realised his folly, he gave away in charity the whole crop and garden, too, that had caused him to tarry behind the Prophet (Sal- lallaho alaihe wasallam). Hilal's case was different. Some of his kinsfolk who had been away for a long time had just returned to Madinah. It was for the sake of their company that he did not join the expedition. He also had partici- pated in all the campaigns previously and thought (like Murarah) that it would not matter much if he missed just that one campaign. When he came to know of the serious- ness of his default, he made up his mind to sever all his connections with those relatives who had been the cause of that blunder. Ka'ab himself gives his account in detail, which is quoted in all books of Hadith. He says: \"I had never been financially so well off as I was at the time of Tabuk. I had two dromedaries of my own. I had never possessed this number before. It was a habit with the Prophet (Sallallaho alaihe wasallam) that he never disclosed the destination of his expeditions, but he would k e e ~ enquiring about the conditions prevailing elsewhere. But this time in view of the distance, the hot season, and the strength of the enemy, he had de- clared his destination, so that preparations could be made thorough and complete. The number of the par- ticipants was so large that it was difficult to note down their names even, so much so, that absentees could hardly be detected in the large host. The gardens of Madinah were full of fruit. I intended every morning to make preparation for the journey but, somehow or other, the days passed by and I made no progress. I was satisfied that I had all the necessary means at my disposal and that I would be ready in no time if I once did decide to do so. I was still in this state of indeci- sion when I learnt that the Prophet (Sallallaho daihe wasallam) had left with his companions. The idea still lingered in my mind that I would take a day or two to get ready and overtake the party. This procrastination continued till the time for the Prophet's arrival in Tabuk drew very near. I then tried to get ready but again, somehow or other, I did not do so. Now, when I came to look at the people left behind, I realised that there was none in Madinah except those who had been condemned as Munafiqin or had been specially exempted from going for certain reasons. The Prophet (Sallallaho alaihe wasallam) on reaching Tabuk in- quired as well, 'How is it that I do not see Ka'ab?' Somebody said, '0, Prophet of Allah: His pride in wealth and ease has caused him to stay behind.' Ma'az 48 Stories of the ~ a h a a b a h 4 interrupted and said, No, this is wrong. As far as our knowledge goes, he is a true Muslim.' The Prophet (Sallallaho alaihe wasallam) however, kept quiet.\" Ka'ab (Radhiyallaho anho) says: \"After a few days I heard the news of the Prophet's return. I was struck with grief and remorse. Good ex- cuses one after the other entered my mind, and I was sure that I could escape the Prophet's wrath with one of them for the time being, and later on I could pray for forgiveness to Allah. I also sought advice of the wise men of my family in the matter. But when I knew that the Prophet (Sallallaho alaihe wasallam) had actually arrived, I was convinced that nothing but the truth would save me; so I decided to speak out the plain truth. It was a habit with the Prophet (Sallallaho alaihe wasallam) that whenever he returned from a journey he would repair to the musjid, first of all, say two rakaat 'Tahiyyatul musjid' and then stay there for a while to meet visitors. Now also, as he sat in the musjid, the Munafiqin came and placed before him on solemn oaths, their excuses for failing to accompany him on the campaign. He took them at their words, leaving the rest to Allah. Just then I came and greeted him with 'salaam'. He turned his face with a sardonic smile. I besought him with the words: '0, Prophet of Allah! You turn your face from me. By Allah! I am neither a Munafiq, nor have I the least doubt in my faith.' He asked me to draw near and I did so. He then said to me: 'What prevented you from going out? Had you not purchased the dromedaries? I made a reply: '0, Prophet of Allah: If I were dealing with a worldly man, I am sure I would escape his displeasure through (seemingly) reasonable excuses, for Allah has endowed me with the gift of the gab. But in your case I am sure that if 1 appease you with a false statement, Allah would be displeased with me. And, on the other hand, I am sure that if I displease you by confessing the simple truth, then Allah would very soon blow away your displeasure. I, therefore, make bold to speak the very truth. By Allah, I had no excuse at all. I had never been so we11 to do as I was at that time.' The Prophet (Sallallaho alaihe wasallam) remarked: 'He is speaking the truth.' He then said to me: 'You go away, Allah will decide about you. When I left the musjid, many a man of my clan blamed me and admonished me thus; 'Never before you had committed any wrong; if after making some good excuse for once, you had requested the Prophet (Sallallaho alaihe wasallam) to pray for your goodness, surely his prayer would have sufficed you.' I inquired of them if there were any more people like me. They informed me that there were two other persons viz. Hilal bin Umayyah and Murarah bin Rabi, who also had admitted their faults like me and re- ceived the same reply from the Prophet (Sallallaho alaihe wasallam). I knew that both of them were very good Muslims and had participated in the campaign of Badr. The Prophet (Sallallaho alaihe wasallam) issued instructions that none was to speak with the three of us.' It is a cqmmon principle that displeasure is shbwn where some attachment exists, and a reprimand is given when there is hope for correction. A reprimand to an incor- rigible person would be a futile effort. Ka'ab (Radhiyallaho anho) continues: \"Under the instructions of the Prophet (Sallallaho alaihe wasallam), the Sahabah completely boycotted us. Nobody was prepared to mix with or even speak to us. It seemed as if I was living in a strange land alto- gether. My own birth-place looked like a foreign local- ity and my bosom friends behaved like strangers. 'The earth, vast as it is, was straightened' (Al-Qur'an IX: 113) for me. The thing that worried me most was that, if I died in this condition, the Prophet (Sallallaho alaihe wasallam) would not lead my funeral prayer, and if the Prophet (Sallallaho alaihe wasailam) died in the meantime, I would be doomed for ever, with none to talk to me and with none to pray at my funeral. The other two companions of mine confined themselves to their houses. I was the most daring of the three: I would go to the market, and join the Jamaat for Salaat, but nobody would talk to me. I would approach the Prophet (Sallallaho alaihe wasallam) and say 'Assa- lamo alaikum' and would watch eagerly to see if his lips moved in reply. After Fardh, I used to complete the Salaat by standing close to him, and I would look at him from the corner of my eye to learn if he ever cast a single glance at me. I noticed that when I was 50 51 engaged in Salaat he did glance at me, but when I was out of it, he would avert his face from me.\" Ka'ab (Radhiyallaho anho) continues: \"When'this complete social boycott became too hard for me to bear, I, one day, climbed up the wall of Qata- dah, my dear cousin, and greeted him with 'Assalamo- alaikum'. He did not return my greetings. I said to him, 'For Allah's sake, do answer me one question. Do not you know that I love Allah and His Prophet (Sallallaho alaihe wasallam)?' He kept quiet. Again I repeated my request, but again he would not speak. When I in- quired for the third time. he simply said, 'Allah and His Prophet (Sallallaho alaihe wasallam) know best.' At this, tears welled out of my eyes and he left me alone.\" \"Once, I was passing through a street of Madinah, when I noticed a Coptic Christian, who had come from Syria to sell his grain, inquiring about Kaab-bin-Malik. When people pointed me out to him, he came and made over a letter to me from the Christian King of Ghassan. Thus it read: 'We have come to know that your master has ill-treated you. Allah may not-keep you in abasement and in disgrace. You had better come to us. We shall extend all help to you.' When I read this letter, I uttered \"Inna-lillahi-wa-Inna-ilaihi-raaji- oon\" To Allah we belong and to Him is our return; and said; 'So my state of affairs (had) reached such an ebb that even the Kafirs were aspiring to draw me away from Islam.' I codld not imagine a calamity worse than that. I went and threw the letter into an oven. There- after I presented myself to the Prophet (Sallallaho alaihe wasallam) and exclaimed: '0, Prophet of Allah! Your indifference towards me has lowered me to such an extent that even the Kafirs are building up their hopes over me.\" When forty days had passed in this condition, a mess- enger of the Prophet (Sallallaho alaihe wasallam) brought me this mandate: 'Be separated from your wife' I inquired, 'Am I to divorce her?' He replied: 'No, only be separated.' A similar message was delivered to my other two companions as well. I consequently said to my wife: 'Go to your parents and wait till Allah de- , Prophet of Allah! Hilal is an old man and there is nobody else to look after him. If I go away from him, he will perish. If it is not very serious, kindly permit me to keep attending to him.' The Prophet (Sallallaho alaihe wasallam) replied; 'There is no harm, provided you don't indulge in coha- bitation with each other.' She remarked! '0, Prophet of Allah: He has no urge for such a thing; since the day his ordeal has started, he has been spending his entire time in weeping.\" Ka'ab (Radhiyallaho anho) says: \"It was suggested to me that I might also request the Prophet (Sallallaho alaihe wasallam) for permission to keep my wife with me for service, but I said; 'Hilal is old, while I am young. I do not know what reply I shall get and, as such, I have no courage to make the re- quest.' Another ten days passed and now our ordeal had lasted for a full fifty days. On the morning of the fiftieth day, when I had said my 'Fajr' prayer and was sitting on the roof of my house stricken with grief, and the earth had 'straightened' for me and the life had become dismal for me, I heard a crier's cry from over the top of the mount Sula; 'Happy tidings to you, 0, Kaab.' The moment I heard this, I fell prostrate on the ground and tears of joy rolled down my cheeks, as I understood that the ordeal was now over. In fact, the Prophet (Sallallaho alaihe wasallam) had announced the Divine forgiveness for all three of us after the Salaat that morning. At this, a person ran up the top of the mountain and yelled out the cry that had reached me. Thereafter, a rider came galloping to deliver the same happy news to me. 1 gave away as a gift the clothes, I was wearing, to the messenger of glad tid- ings. I swear by Allah I had no other clothes in my pos- session at that time. I dressed up by borrowing clothes from some friend and went to the Prophet (Sallallaho alaihe wasallam). As I entered the musjid, the people in the audience of the Prophet (Sallallaho alaihe wasal- lam) ran to congratulate me. Abu Talha (Radhiyallaho anho) was the first to approach me. He shook my hand with a warmth that I shall never forget. Thereafter I of- fered my salutation to the Prophet (Sallallaho alaihe wasallam). I found his face beaming and radiant like 5 2 the full moon. This was usual with him at times of ex- treme joy. I said to him, '0, Prophet of Allah! I propose to give away in charity all that I possess as thanks for the acceptance of my Taubah.' He said: 'This will be too much for you. Keep a portion with you.' I agreed to keep my share of the booty that fell in our hands in the Khaiber campaign.\" He says: \"It is the truth that brought me salvation, and as such I am determined to speak nothing but the truth in future.\" The above story brings out the following salient characteristics of the Muslims of that time:- (1) The importance of striving in the path of Allah. Even the persons who had hitherto faithfully par- ticipated in every expedition, had to bear the brunt of the Prophet's (Sallallaho alaihe wasallam) anger when they failed to respond to Allah's call even though for the first time in their lives. (2) Their devotion and obedience to the Prophet (Sal- lallabo alaihe wasallam). For full fifty days the whole Muslim community, even their nearest and dearest, would not speak to the three persons, in obedience to the Prophet's (Sallallaho alaihe wa- sallam) orders. The three persons themselves went most steadfastly through the ordeal imposed on them. I (3) Their strong faith. Kaab was so much perturbed when he received the letter from the Christian King, exciting him against the Prophet (Sallallaho alaihe wasallam). His words and his action at that time are a testimony to the strong faith in his heart. Let us search our hearts and see how much devotion we have in them for the observance of the duties we owe to Islam. Leaving aside Zakaat and Hajj, which involve the sacrifice of money, take the case of Salaat alone, which is the most important pillar of Islam after Imaan. How many of us are particular about it? $= %S 10. The Prophet's (Sallallaho alaihe wasallam) reprimand .$l on the Sahabah's Laughing: 3~ r a Once, the Prophet (Sallallaho alaihe wasallam) came to -a the musjid for Salaat, where he noticed some people laugh- ing and giggling. He remarked: \"If you remembered your death, I would not see you like this. Think of your death often. Not a single day passes when the grave does not call out: 'I am a wilder- ness', I am a place of dust, I am a place of worms'. When a Mo'min is laid in the grave, it says; 'Welcome to you. It is good of you to have come into me. Of all the people walking on the earth, I liked you best. Now that you have come into me, you will see how I enter- tain you'. It then expands as far as the occupant can see. A door from Paradise is opened for him in the grave and: through this door, he gets the fresh and fra- grant air of Paradise. But when an evil man is laid in the grave it says; 'No word of welcome for you. Your coming into me is very bad for you. Of all the persons walking on the earth, I disliked you most. Now that you have been made over to me, you will see how I treat you!' It then closes upon him so much that his ribs of one side penetrate into the ribs of the other. As many as seventy serpents are then set upon him, to keep biting him till the Day of Resurrection. These ser- pents are so venomous that if one of them happened to spurt its venom upon the earth, not a single blade of grass would ever grow.\" After this, the Prophet (Sallallaho alaihe wasallam) said: \"The grave is either a garden of Paradise or a pit of Hell. \" Fear of Allah is the basic and essential qualification of a Muslim. The Prophet (Sallallaho alaihe wasallam) ad- vised the believers to remember death, off and on, and to keep the fear of Allah ever present in their hearts. 11. Hadhrat Hanzlah's (Radhiyallaho anho) Pear of Nifaq: Hadhrat Hanzalah (Radhiyallaho anho) says: \"We were once with the Prophet (Sallallaho alaihe wa- sallam) when he delivered a sermon. Our hearts 54 55 became tender, our eyes were-flowing with tears, and we realised where we stood. I left the Prophet and re- turned home. I sat with my wife and children and cracked jokes with my wife, and I felt that the effect of the Prophet's sermon had completely vanished from my heart. Suddenly, it occurred to me that I was not what I had been, and I said to myself; '0, Hanzalah! You are a Munafiq'. I was striken with grief and I left my house repeating these words in sorrow; 'Hanzlah has turned Munafiq'. I saw Abu Bakr (Radhiyallaho anho) coming towards me and I said to him; 'Hanzalah has turned Munafiq.' He said; 'Subhanallah' What are you saying? Hanzalah can never be a Munafiq'. I ex- plained to him: 'When we are with the Prophet (Sallal- laho alaihe wasallam) and listen to his discourses about Paradise and Hell, we feel as if both are present before our very eyes but when we return home and are absorbed in our domestic and family affairs, we forget all about the Hereafter. Abu Bakr (Radhiyallaho anho) said: 'My case is exactly the same.' We both went to the Prophet (Sallallaho alaihe wasallam) and I said; 'I have turned Munafiq, 0 Prophet of Allah!' He inquired about the matter, and I repeated what I had said to Abu Bakr (Radhiyallaho anho). Thereupon the Prophet (Sal- lallaho alaihe wasallam) remarked: 'By Him Who con- trols my life, if you could keep up for all times the fervour aroused in you when you are with me, angels would greet you in your walks and in your beds. But, 0, Hanzlah! This is rare! This is rare!\" We have to attend to our personal and impersonal worldly affairs, and therefore we cannot be contemplating the Hereafter for all the twenty-four hours of the day. According to what has been said by the Prophet (Sallallaho alaihe wasallam), complete absorption in the Hereafter is rare, and it should not be expected by all. It is only for the angels to remain in the same state for ever. In case of men, the state of their mind changes with circumstances and en- vironments. But we can see from this story how anxious the Sahabah were about the condition of their Imaan. Hanz- lah (Radhiyallaho anho) suspects Nifaq in himself wher, he feels that the condition of his mind at home is not the same as it is when he is with the Prophet (Sallallaho alaihe wa- sallam). . A Few Miscellaneous Stories about the Fear of Allah: It is very difficult to cover all that is said in the Qur'an and the Hadith about the importance of fear of Allah. It may, however, be understood that fear of Allah is an essen- tial step towards all spiritual advancement. The Prophet (Sallallaho alaihe wasallam) said: \"Fear of Allah is the root of all wisdom\". Hadhrat Ibn 'Umar (Radhiyallaho anho) used to weep so much with the fear of Allah that he lost his eyesight. He said to somebody watching him: \"You wonder at my weeping. Even the sun weeps with the fear of Allah.\" On another occasion, he is reported to have said: \"Even the moon weeps with His fear.\" The Prophet (Sallallaho alaihe wasallam) once passed by one of the Sahabah who was reciting the Qur'an. When he came to the verse: \"And when the heaven splitteth asunder and beco- meth rosy like red hide\", (LV: 37) the hair of his body stood on end, and he was nearly choked, with excessive weeping. He would cry and say: \"Alas; what will happen to me on the day when even the Heaven splitteth asunder. Woe is me!\" The Prophet (Sallallaho alai-he-wasallam) said to him: \"Your crying has made even the angels weep\". Once an Ansari sat and wept after Tahajjud, saying: \"I cry to Allah for protection from the fire of Hell\". The Prophet (Sallallaho alaihe wasallam) said to him: \"You have made the angels weep today\". Hadhrat Abdullah bin Rawahah (Radhiyallaho anho) was once weeping. His wife also began to weep on seeing him in this condition. He enquired of her: \"Why are you weeping?\" 56 57 She replied: \"Whatever makes you weep makes me weep too\". He said: \"The idea that I have to cross the bridge of Siraat across Hell makes me weep. I don't know whether I shall be able to cross over or fall into Hell\". Zurarah bin Aufa was leading the Salaat in a musjid. When he recited the verse: \"For when the Trumpet shall sound; Surely that day will be a day of anguish\"! (LXXIV: 8 & 9) he fell down and expired. People carried his body to his house. Khulaid was saying his Salaat. During his Qiraat, when he reached the verse: \"Every soul will taste of death\" (111: 185) he began to repeat it again and again. He heard a voice from a corner of the room saying: \"How often are you going to repeat this verse? Your recitation has already caused the death of four Jinns\". It is reported about another Sheikh that (while reciting the Qur'an) when he reached the verse: \"Then are they returned unto Allah, their Lord, the Just, is not His the Command?\" (VI:62) he gave out a cry, shivered and breathed his last. There are many stories of this type. Fudhail, a famous Sheikh, says: \"Fear of Allah leads to everything that is good\". Shibli, another Sheikh of high position, says: \"Whenever I have felt Allah's fear in me, I have found a fresh door of knowledge and wisdom opened for me\". Ch. 11: Fear of Allah In a Hadith, it is said: \"Allah says; 'I do not impose two fears on my slave. If he does not fear me in this world, I shall give him fear in the next, and if he fears me in this world I shall save him from all fears in the Hereafter\". The Prophet (Sallallaho alaihe wasallam) says: \"All things fear a person who fears Allah, while every- thing is a source of fear to him who fears somebody other than Allah.\" Yahya bin Ma'az (Rahmatullah alaih) says: \"If a man fears Hell as much as he is afraid of poverty then he may enter into Paradise.\" Abu Sulaiman Daarani (Rahmatullah alaih) says: \"There is nothing but ruin for a heart that is devoid of fear of Allah.\" The Prophet (Sallallaho alaihe wasall'am) says: \"The face that gets wet with the smallest drop of tear from the fear of Allah is safe from entrance into the fire of Hell.\" He also said: \"When a Muslim shivers with the fear of Allah, his sins fall away from him like the falling leaves of a tree.\" The dear Prophet (Sallallaho alaihe wasallam) has said: \"A person weeping with fear of Allah cannot go to Hell until milk goes back into the teats (which is an im- possibility)\". Hadhrat Uqbah bin Amir (Radhiyallaho anho) once in- quired of the Prophet (Sallallaho alaihe wasallam). \"What is the way to salvation?\" He replied: \"Hold your tongue, stay indoors and cry over your sins.\" Hadhrat A'ishah (Radhiyallaho anha) once inquired of the Prophet (Sallallaho alaihe wasallam). \"Is there anybody among your followers who will go to Paradise without reckoning?\" 58 \"Yes,\" replied the Prophet, \"the person who often cries over his sins.\" There is another Hadith, in which my dear Master, Muhammad (Sallallaho alaihe wasallam) has said: \"No drop is more dear to Allah than two drops; a drop of tear shed in the fear of Allah, and a drop of blood shed in the path of Allah.\" It is said in a Hadith that seven persons would be under the shade of the Arsh on the day of judgement. One of them would be the person who remembered Allah when all alone by himself, and tears flowed from his eyes with awe of Allah and in repentence for his sins. Hadhrat Abu Bakr [Radhiyallaho anho) says: :'One who can weep should do so, and one who cannot should make the appearance of a weeping person.\" It is reported of Muhammad bin Munkadir (Radhiyal- laho anho) that, when he wept, he smeared his tears over his face and beard saying: \"I have heard that the fire of Hell does not touch the place touched by these tears.\" Thabit Banani was suffering from a disease of the eyes. His doctor said to him: \"Your eyes would be all right, provided you do not weep in future.\" He replied: \"What is the good of an eye if it cannot shed tears.\" Yazid bin Maisarah (Rahmatullah alaih) says: 'There can be seven reasons for weeping viz., extreme joy, insanity, extreme pain, horror, artifice, intoxica- tion and fear of Allah. A single tear shed in the fear of Allah is sufficient to quench oceans of fire (of Hell).\" Hadhrat Ka'ab Ahbar (Radhiyallaho anho) says: I 3= Cl a There are numerous other sayings of the Saints and 'E ;i 4 other pious people, indicating that weeping because of the 3, rm fear of Allah, and over one's sins, is very effective and ben- eficial in attaining spiritual elevation. We should not, how- ever, lose hope in Allah. His Mercy is all-embracing. Hadhrat 'Umar (Radhiyal!aho anho) says: \"If it be announced on the Day of Judgement that all except one individual shall go to Hell, my expectation of the Mercy of Allah would make me hope that I may be that chosen one. Again, if it be announced on that day that all except one individual shall go to Paradise, then my sins would make me fear that I may be that condemned one.\" It is therefore necessary that we should combine fear and hope together in our hearts. Especially when the time of death is apprdaching, we should have more hope than fear. The Prophet (Sallallaho alaihe wasallam) says: \"None of you should die, except with a strong hope in the Mercy of Allah.\" When Imaam Ahmad bin Hanbal (Radhiyallaho anho) ap- proached his end, he sent for his son and asked him to read to him the Ahaadith that induce hope in Allah and His Mercy. \"By Him who holds my life in His (hands), I love to weep for fear of Allah, with tears flowing down my cheeks, rather than spend a mountain of gold in charity\" CHAPTER I11</p></div>",
+        "sections": [
+            [
+                30,
+                16454
+            ],
+            [
+                16454,
+                32880
+            ],
+            [
+                32880,
+                49285
+            ],
+            [
+                49285,
+                65770
+            ],
+            [
+                65770,
+                82251
+            ],
+            [
+                82251,
+                87265
+            ]
+        ]
+    },
+    {
+        "id": 21,
+        "bookId": 1,
+        "chapter": "Abstinence and Self-Denial",
+        "title": "Abstinence and Self-Denial",
+        "preview": "ABSTINENCE AND SELF-DENIAL OF THE SAHABAH There is such a wealth of Ahadith about this aspect of the Prophet's life that it is really difficult to cho...",
+        "content": "<div class=\"story-content\"><p>ABSTINENCE AND SELF-DENIAL OF THE SAHABAH There is such a wealth of Ahadith about this aspect of the Prophet's life that it is really difficult to chose a few ex- amples. He said: \"Abstinence is an asset of a Mo'min.\" 1. The Prophet's (Sallallaho alaihe wasallam) Dislike for gold: The Prophet (Sallallaho alaihe wasallam) said: \"My Lord offered to turn the mounts of Mecca into gold for me. But my supplication to Him was; '0, Allah! I like to eat one day and feel hungry the next, so that I may cry before Thee and remember Thee when I am hungry; and be grateful to Thee and glorify Thee when my hunger is gone!\" Thus said our Prophet '(Sallallaho alaihe wasallam). We profess to follow him and are proud of being in the fold of his Ummat. Isn't. it incumbent upon us to follow him in practice also? 2. The Prophet's (Sallallaho alaihe wasallam) Life of Abstinence: Once, the prophet (Sallallaho alaihe wasallam) de- cided to stay away from his wives for one month, as he was displeased with them on some account. He lived for that one month in a separate room in the upper storey. A rumour that the Prophet (Sallallaho alaihe wasallam) had divorced his wives got afloat among the Sahabah. When 'U mar heard of this, he came running to the musjid and found the Sahabah sitting in groups, struck with grief over the Prophet's suffering. He went to his daughter Hafsah (Radhiyallaho anha), who was a wife of the Prophet, and found her weeping in her room. He said to her: \"Why are you weeping now? Have I not been warning you all these .times to refrain from any act likely to cause the Prophet's displeasure'?\" He returned to the musjid and found some of the Sahabah sitting near the pulpit and weeping. He sat there for some time, but could not sit for long due to his excessive grief. He went towards the room where the Prophet (Sallallaho alaihe wasallam) was staying. He found Rabah (Radhiyal- laho anho), a slave, sitting on the steps. He asked him to go and inquire of the Prophet (Sallallaho alaihe wasallam) if he could allow 'Umar (Radhiyallaho anho) to see him. Rabah went inside and came back to inform him that the Prophet (Sallallaho alaihe wasallam) held his peace and said nothing. 'Umar (Radhiyallaho anho) returned to the musjid and sat near the pulpit. Again the anguish eating his heart would not allow him any rest, and he requested Rabah to convey his request to the Prophet a second time. The Prophet (Sallallaho alaihe wasallam) did not make any answer this time too. After tarrying near the pulpit for some time more, 'Umar (Radhiyallaho anho) craved per- mission to see the Prophet (Sallallaho alaihe wasallam) for the third time. This time, his request was acceded to. When he was ushered in, he saw the Prophet (Sallallaho alaihe wasallam) lying on a date leaf matting. The crossed pattern of the matting could easily be seen imprinted on his hand- some body. He had a leather bag filled with the bark of the datepalm as his pillow. Hadhrat 'Umar (Radhiyallaho anho) says: \"I greeted him with Assalamo alaikum and inquired: 'Have you divorced your wives, 0, Prophet of Allah?\" He answered in the negative. Much relieved, then I made bold to remark, a bit amusingly; '0, Prophet of Allah! we the Qureysh have always been having the upper hand over our women, but in case of the Ansar of Madinah, it is the women who have the upper hand. Our women have also got influenced by the women over here'. I said a few more similar things which made him smile. I noticed that the contents of his room consisted of only three pieces of tanned skin and a handful of barley lying in a corner. I looked about, but I failed to find anything else. I began to weep. He said; 'Why are you weeping?' I replied: '0, Prophet of Allah! why should I not weep? I can see the mat's pat- tern imprinted on your body, and I am also beholding all that you have got in this room. 0, Prophet of Allah! Pray that Allah may grant ample provisions for us. The Persians and the Romans who have no true faith and 62 who worship not Allah but their kings-Caesar and Chosroes-presently live in gardens with streams run- ning in their midst, but the chosen Prophet and the ac- cepted slave of Allah does live in such a dire poverty!' The Prophet (Sallallaho alaihe wasallam) was resting against his pillow, but when he heard me talk like this, he sat up and said; '0, 'Umar! are you still in doubt about this matter? Ease and comfort in the Hereafter are much better than ease and comfort in this world. The unbelievers are enjoying their share of the good things in this very world, whereas we have all such things in store for us in the next. I implored him: '0, Prophet of Allah! Ask forgiveness for me. I was really in the wrong\" Look at the household effects of the sovereign in this world and in the hereafter, and the beloved Prophet of Allah. See how he rebukes 'Umar when he asks him to pray for some relief and comfort. Somebody inquired of A'ishah (Radhiyallaho anha) about the bedding of the Prophet (Sallallaho alaihe wasal- lam) in her house. She said: \"It consisted of a skin filled with the bark of date- palm.\" The same question was put to Hafsah (Radhiyallaho anha); she said: \"It consisted of a piece of canvas, which I spread doublefolded under him. Once I laid it fourfold in an effort to make it more comfortable. The next morning he asked me: 'What did you spread under me last night?' I replied! 'The same canvas, but I had four- folded it instead of the customary double fold.' He said: 'Keep it as it was before. The additional softness stands in the way of getting up for Tahajjud.\"' Now let us look around and survey the furniture of our bedrooms. We, who live in so much comfort, never hesitate to complain of hard times, instead of being grateful and more obedient to Allah for his bounties. 3. Hadhrat Abu Hurairah (Radhiyallaho anho) in a State of Hunger . Once, Hadhrat Abu Hurairah (Radhiyallaho anho) after wiping his nose with piece of fine linen remarked to him- self: %, 5 b \"4 a \"Look at Abu Hurairah (Radhiyallaho anho)! He cleans .g his nose with fine linen, today. I remember the time ~ v l when he used to lie down between the pulpit and the [\" Prophet's house. People took him to be suffering from epilepsy and put their feet on his neck. But there was no other malady with him, other than spasms of hunger.\" Hadhrat Abu Hurairah (Radhiyallaho anho) had to remain hungry for days together. At times, he was over- powered with hunger so much that he fell unconscious, and people mistook this as attacks of epilepsy. It seems that in those days they treated epilepsy by placing a foot on the neck of the patient. Hadhrat Abu Hurairah [Radhiyallaho anho) is one of those people who suffered from extremes of want and poverty in the early days of Islam. He however, saw better days in later years when Muslim conquests fol- lowed in succession. He was very pious, and loved very much to say the Nafl Salaat. He had with him a bag full of date-stones. He used these stones for his Zikr. When the bag was exhausted, his maid filled it again with date- stones. Somebody was always busy in Salaat in his house during the night; his wife and his servant taking turns with him in the prayers. 4. Hadhrat Abu Bakr's (~adhiyallaho anho) Daily Al- lowance from the Bait-ul Ma1 Hadhrat Abu Bakr (Radhiyallaho anho) was a cloth merchant and lived by that trade. On the death of the Prophet (Sallallaho alaihe wasallam), people selected him as the Khalifah. Next day with some cloth slung on his arms, he was proceeding to the market as usual when 'Umar (Kadhiyallaho anho) met him in the way. 'Urnar: \"Where are you going to, Abu Bakr?\" Abu Bakr: \"To the market\". 'Umar: \"If you get busy with your trade, who will carry out the duties of the caliphate?\" Abu Bakr: \"How am I to feed my family then?\" 'Umar: \"Let's go to Abu 'Ubaidah (In charge of\"Bait-ul- Mal), who will fix some daily allowance for you from the 13ait-ul-Mal.\" They both went to Abu 'Ubaidah (Kadhiyallaho anho). 64 5 * Sq He fixed for Abu Bakr an allowance equal to that usually paid to an average Muhajir. Once Abu Bakr's (Radhivallaho anho) wife said to him: \"I would like to have a sweet dish.\" Abu Bakr: \"I have no money to arrange for the dish.\" His wife: \"If you permit, I shall try to save something daily from our allowance, which will some day make enough to enable us to prepare the sweet dish.\" He agreed. A little money was saved in many davs. When his wife brought him the money to make purchases for the sweet dish, he said: \"It seems that we have received so much over and above our needs.\" He deposited the saving in the Bait-ul-Mal and for the future got his allowance cut down by the amount saved by his wife. Hadhrat A'ishah (Radhiyallaho anha) narrates: \"When Abu Bakr (Radhiyallaho anho) was selected as Khalifah. he said to the people: 'You well know that I live bv trade, and my income therefrom is sufficient to meet mv expenses. Now I have to devote my full time to the affairs of the state and therefore my family al- lowance shall be paid from the 'Bait-ul-Mal.'\" ~ a d h r a tA'ishah (Radhiyallaho anha) says: \"At the time of his death, Abu Bakr (Kadhiyallaho anho) directed rjle to hand over to his successor all that was issued to him from the Bait-ul-Mal for his house- hold needs. It is said that Hadhrat Abu Bakr (Radhivallaho anho) left no cash after him. Anas (Radhiyallaho anho) savs: \"Abu Bakr (Radhivallaho anho) left a milch she-camel, a bowl and a servant.\" A(;c;ording to some other narrators. he left a bedding also. When all these were made over to 'Umar (Radhiyallaho anho), his successor, he remarked: \"Mav Allah be merciful to Abu Bakr! He has set a pre- cedent for his successors which is very hard t o follow.\" 5. Hadhrat 'Umar's (Radhiyallaho anho) Daily Allowance: Hadhrat 'Umar (Radhiyallaho anho) also lived by trade. When he was made Khalifah after Hadhrat Abu Bakr (Radhivallaho anho), he assembled the people and said to them: \"I earned my living through trade. As you people have engaged me as Khalifah, I cannot attend to my busi- ness. Now, what about my living?\" Different amounts of daily allowance from the Bait-ul-Mal were suggested by different people. Hadhrat Ali (Radhiyal- laho anho) did not speak. 'Umar inquired of him: \"Oh Ali! what is vour suggestion?\" He replied: \"I suggest that you should take such amount as may be on average be sufficient for vour family.\" Hadhrat Umar (Radhiyallaho anho) accepted his suggestion and a moderate amount was fixed as his daily allowance. Later on. some people including Hadhrat Ali. Hadhrat Usman, Hadhrat Zubair and Hadhrat Talhah (Radhivallaho anhum) once proposed that Hadhrat Umar's (Kadhiyallaho anho) allowance might be increased, as it was hardlv suffi- cient for him. but nobody dared to suggest that to Hadhrat 'Umar (Kadhiyallaho anho). People approached Ummul- momineen Hadhrat Hafsah (radhivallaho anha), his daugh- ter, and requested her to ascertain 'Umar's (Kadhivallaho anho) reaction to the suggestion without mentioning their names to him. When Hadhrat Hafsah (Kadhiyallaho anha) talked about it to tladhrat IJmar (Kadhivallaho anho), he became angry and said: \"Who are the persons making this suggestion?\" Hadhrat Hafsah (Radhiyallaho anha): \"Let me first know your opinion.\" Hadhrat 'Umar (Radhiyallaho anho): \"If I knew them, I would smite them on their faces I-jafsah! just tell me what was the Prophet's best dress in your house?\" Hadhrat Hafsah (Radhiyallaho anha): \"It was a pair of reddish brown clothes, which the Prophet (Sallallaho alaihe wasallam) wore on Friday or while receiving some envoy.\" 66 Hadhrat 'Umar (Radhiyallaho anho): \"What was the best of food that the Prophet (Sallallaho alaihe wasallam) ever took at your house?\" Hadhrat Hafsah (Radhiyallaho anha): \"Simple barley bread was the only food we used to take. One day I anointed a piece of bread with the sedi- ments from an empty butter tin, and he ate it with relish and offered it to others as well.\" Hadhrat 'Umar (Radhiyallaho anho): What was the best bedding that the Prophet ever used in your house?\" Hadhrat Hafsah (Radhiyallaho anha): \"It was a piece of thick cloth. In the summer it was spread in four layers, and in the winter in two, half he spread underneath and with the other half he covered himself .\" Hadhrat mar (Radhiyallaho anho): \"Hafsah! Go and tell these people that the Prophet (Sallallaho alaihe wasallam) has set a standard by his personal example. I must follow him. My example and that of my other two companions viz., the Prophet (Sallallaho alaihe wasallam) and Abu Bakr (Radhival- laho anho) is like that of three men travelling on the same road. The first man started with a provision and reached the goal. The second followed the first and joined him. Now the third is on his way. If he follows their way, he will also join them, otherwise he can never reach them;' Such is the life of the person who was a dread for the monarchs of the world. What a simple life he lived! Once he was reciting the Khutbah when it was noticed that his lower cloth had as many as twelve patches, including one of leather. Once he came late for his Jumu'ah prayer and told the congregation: \"Excuse me, people! I got late because I was washing my clothes and had no other clothes to put on.\" Once he was having his meal when 'Utbah bin Abi Farqad (Radhiyallaho anho) asked permission to see him. He allowed him in and invited him to share the food with him. 'Utbah (Radhiyallaho anho) started eating, but the bread was so coarse that he could not swallow it. He said: \"Why don't you use fine flour for your bread, 'Umar?\" Mesaid: \"Can every Muslim afford fine flour for his bread?\" 'Utbah replied, \"No. Everybody cannot afford it.\" He remarked, \"Alas! You wish to fulfill all my pleasures while I am in this world.\" There are thousands of such stories about the illus- trious Sahabah. Everybody should not try to imitate them, for we lack the physical strength of those people; and that is why the Sufi Sheikhs of our time do not'recommend such exercise, which tax the body too much, as the people are already low in physical strength. We should however keep the life of the Sahabah as an ideal before us, so that we may at least give up some of our luxuries and lead a simpler life (judged by modern standards). With the Saha- bah's lives as an ideal, we can at least feel ashamed when vieing with one another in running after the luxuries of this world. 6. Bilal's (Radhiyallaho anho) story about the Prophet: Someone inquired of Bilal (Radhiyallaho anho) how the Prophet (Sallallaho alaihe wasallam) met his expenses. He replied: \"He never kept back anything for future use. I arranged money for him. Whenever a needy person, whether hungry or naked, came to him, he would make him over to me and I would then arrange for his needs by borrowing money from somebody. This is what usually happened. Once a Mushrik came to me and said: 'Look here! I have a lot of money to spare. Don't borrow money from anvbody else. Whenever you need it, come straight to me.' I exclaimed: 'This is indeed fine.' I began to borrow money from him to meet the needs of the Prophet (Sallallaho alaihe wasallam). One day, after I had taken mv Wudhu and was about to call Azaan, the same Mushrik accompanied bv some people came and shouted, '0, Negro!' When I attended to him. he began to abuse me, using filthv language and said: 'How manv davs are left of this month? 'I 68 Stories of the Saltaabah Ch. Ill: Abstinence and Self-Denial of the Sahaabah 69 said: 'It is about to finish. 'He said most insolently: 'Look here! there are only four days left of this month. If you fail to clear up your debts by the end of the month. 1 shall take you as my slave for my money and then you will be grazing sheep as you have been doing before.' After saying this he went away. I remained melancholy and full of grief throughout the day. After Isha when the Prophet (Sallallaho alaihe wasallam) was alone, I went and narrated the story to him, saying: '0, Prophet of Allah! you have nothing with you. nor can I arrange any money from somewllere so quickly. I am afraid the Mushrik will disgrace me. I therefore intend to keep away for such time as you get sufficient money to clear the debts.' I went home, took my sword, shield, and shoes, and waited for the morn- ing to make for some other place. lust before dawn, somebody came to me and said. 'Hurry up. The Prophet (Sallallaho alaihe wasallam) wants you.' I hur- ried to the musjid and found four loaded camels sitting near the Prophet. He said: 'Good news. Bilal. Allah has made arrangements for clearing your debts. Take these camels with their load. The Chief of Fidak has sent them as a gift to me.' I thanked Allah and took the camels and cleared up all the debts. In the meantime, the Prophet (Sallallaho alaihe wasallam) kept sitting in the musjid. When I returned, I said: 'Alhamdulillah.' All the debts are now clear, 0. Prophet of Allah' He in- quired: 'Is there anvthing left from the gift?\" I said, \"Yes, somethirlg is still left.\" He said. \"Go and spend that as well. I shall not go home until the whole lot is spent.' The Propket kept sitting in the musjid all day long. After Isha he inquired again if everything had been spent. I said: 'Something is still left unspent. A few of the poor have not turned up so far.' He slept in the nlusjid that night. Next dav after Isha'a he again called me to him and said: 'Bilal! Is everything fin- ished now?\" I said: 'Yes, Allah has blessed you with peace. Everything is now spent and gone.' The Prophet (Sallallaho alaihe wasallam) begail to hymn the Glory of Allah over this news, for he did not like death to overtake him while any of the riches were in his pos- session. He then went home and met his family.\" It is common with pious people that they do not like to keep any wealth with them. How could the Prophet (Sallal- laho alaihe wasallam), being the fountain-head of all piety, like to keep anything in his possession? It is said of Mau- lana Abdur Rahim (May Allah have mercy on him), a Saint of our time, that all that he received as gifts from the people was immediately spent by him and he did not keep anything for himself. A few days before his death, he gave over all his clothes to one of his attendants and said: \"If I need to wear any clothes in my life. I shall borrow them from you.\" And I also know about my late father, who whenever had any money left after Maghrib, would give it to someone of his creditors (he was several thousand rupees in debt) and would say 'I would not like to keep this source of trouble with me for the night.' e 7. Another story of Hadhrat Abu Hurairah's (Radhiyal- laho anho) Hunger: Hadhrat Abu Hurairah (Radhiyallaho anho) says: \"I wish you had seen some of us living on a starvation diet for several days, successively, so much so that we could not even stand erect. On account of spasms of hunger, I would lie on my belly and press my stomach against the ground or keep a stone tied to mv abdomen. Once, I intentionally sat in wait for some notable people to pass that way. As Hadhrat Abu Bakr (Radhi- yallaho anho) came along, I joined in conversation with him, intending to continue the talk till we reach his home, where I expected him to invite me to share his meals, as was his wont. But his answer was brief, and my plan did not work. The same thing happened with Hadhrat Umar, (Radhiyallaho anho) when he chanced that way. The Prophet (Sallallaho alaihe wa- sallam) himself was the next to come. A smile spread on his face when he saw me, for he at once divined why I was sitting there. 'Come with me, Abu Hurairah', lie said, and I accompanied him to his house. He took me in. where a bowl of milk was brought before him. He asked, 'Who brought this milk?\" and was told that somebody had sent it as a present. HA bade me to go and invite all the Suffah friends. The Suffah people were treated as everyone's guests by all the Muslims. I'hev were such persons who had neither hearth nor home of their own, nor anv other means of livelihood. 70 Their number varied with time. But at this particular juncture, they mustered seventy in all. The Prophet (Sallallaho alaihe wasallam) would send them in groups of two or four each to the well-to-do Sahabah as guests. He himself would pass on to them all that came to him as 'Sadaqah', and would share the gifts too with them.\" Hadhrat Abu Hurairah (Radhiyallaho anho) says: \"When the Prophet (Sallallaho alaihe wasallam) asked me to invite all these persons, I naturally had some misgivings, for the! milk was so little that it could hardly suffice a single person. Also, I was aware that the Prophet (Sallallaho alaihe wasallam) would ask myself to serve the milk to the others first, and a server is always the last and, more often than not, gets the least of the lot. Anyway, out I went, and fetched them all. The Prophet (Sallallaho alaihe wasallam) said to me: Hadhrat 'Abu Hurairah (Radhiyallaho anho), do serve the milk to them.' I took the bowl to each person in turn, and he drank the contents to his heart's desire, and returned the same to me, till all of them were served. The Prophet (Sallallaho alaihe wasallam) then held the,goblet in his own hand, smiied at me, and re- marked, 'Only two of us are left now!' 'Quite so', I re- plied. 'Then take it,' he said. I needed no second bidding, and took enough. He exhorted me to have more, and I had my fill; till I declared that I had no room for any more. He then took hold of the bowl, and drained the still remaining milk.\" I 8. The Prophet's (Sallallaho alaihe wasallam) opinion about two persons: Some people were sitting with the Prophet (Sallallaho alaihe wasallam) when a person passed that way. The Prophet (Sailallaho alaihe wasallam) asked of the company: I \"What do you think of this person?\" They replied: , \"0. Pro het of Allah! He is the scion of a good family. : By Alla R , he is such that if he seeks in marriage the hand of a woman of the most illustrious family, ne would not be rejected. If he recommends anybody, his recommendation would be readily accepted.\" Thereupon the Prophet (Sallallaho alaihe wasallam) held his peace. A little later, another person happened to pass that way, and the Prophet (Sallallaho alaihe wasallam) put the same question to his companions about that person also. 'They replied: \"0, Prophet of Allah! He is a very poor Muslim. If he is betrothed somewhere, chances are that he will not get married. If he happens to recommend anybody, his recommendation is not likely to be accepted. If he talks, few would listen to him.\" Thereupon the Prophet (Sallallaho alaihe wssallam) re- marked: \"This latter person is better than a whole lot of such persons as the former.\" Belonging to a good- family carries absolutely no weight with Allah. A poor Muslim, who is of little esteem and who commands but little respect in this world, is far nearer tc~ Allah than hundreds of the so-called noblemen who, though respected and attended upon by the wordly people, are far from the path of Allah. It is said in Hadith: \"It will be the end of this world when there remains not a single soul to hymn the name of Allah. It is by the holy name of Allah that the system of this universe is running.\" 9. Privations go with love for the Prophet (Sallallaho alaihe wasallam) A person came to the Prophet (Sallallaho alaihe wasal- lam) and said: \"0 Prophet of Allah! I love you so much.\" The Prophet (Sallallaho alaihe wasallam): \"Think well before you say this.\" The person: \"I have already given thought. I love you very much, 0, Prophet of Allah.\" The Prophet (Sallallaho alaihe wasallam): \"Think once again before you declare such a thing.\" 7 2 The person: \"I still love you very much, 0, Prophet of Allah.\" The Prophet (Sallallaho alaihe wasallam): \"Well, if you are sincere in what you say, then be pre- pared to face privation and want coming to you from all directions, for it pursues .all those who love me, as swiftly as water running down-stream.\" That is why we find the Sahabah living mostly a life of poverty. Similarly the eminent Muhaddithin, Sufi's and theologians lived hand to mouth throughout their life. 10. The Al-Ambar Expedition: The Prophet (Sallallaho alaihe wasallam) despatched towards the sea-shore an expedition of three hundred men, under the command of Hadhrat Abu Ubaidah (Radhiyal- laho anho) in 8 A.H. He gave them a bag full of dates for their rations. They had been hardly out for fifteen days when they ran short of rations. In order to provide the con- tingent with food, Hadhrat Qais (Radhiyallaho anho) began buying three camels daily from his own men, to feed the Mujahideen, with a promise to pay on return to Madinah. The Amir seeing that the slaughter of camels would de- prive the party of their only means of transport, prohibited him to do so. He collected the dates that had been left with each person and stored them in a bag. He would issue one date to each man as his daily ration. When Hadhrat Jahir (Radhiyallaho anho) later on narrated this story to the people, one of his aud?ence inquired: \"How did you manage to live upon one date only for the whole day?\" He replied: \"We longed even for that one date, when the whole stock was exhausted. We were on the verge of starva- tion. We moistened the dry tree-leaves with water and ate them.\" When they reached this stage, Allah had mercy on them, for He always brings ease after every hardship, provided it is endured patiently. A big fish known as \"Ambar\" was thrown out of the sea for them. The fish was so big that they lived on it for eighteen days altogether. They also 2 - 4 2 s filled their satchels with the remaining portion, which -22 lasted them right up to Madinah. When the episode was $2 * narrated to the Prophet (Sallallaho alaihe wasallam), he said: \"The fish was a provision arranged for you by Allah.\" Difficulties and hardships are not uncommon in this world to the people of Allah; these are bound to come. The Prophet (Sallallaho alaihe wasallam) says: \"The worst trials in this world are reserved for the Prophets, then for those who are next to them, and then for those who are best of the rest.\" The trial of a person is proportionate to his position near Allah, and He bestows solace and comfort by His Grace and Mercy after each trial. Look how much our ancestors in Islam have suffered in the path of Allah. They had to live on leaves of trees, starve and shed their blood in the service of the true faith, which we now fail to preserve. 75 r CHAPTER IV PIETY AND SCRUPULOUSNESS The habits and traits of character of the Sahabah, as a whole, are worth following, as they were the people specially chosen and selected by Allah to be the compan- ions of His beloved Prophet (Sallallaho alaihe wasallam). The Prophet (Sallallaho alaihe wasallam) says: \"I have been sent in the best period of human history.\" The time of the Prophet (Sallallaho alaihe wasallam) was itself a blessed period, and the people favoured with his company were really the cream of that age. ? 1. The Prophet (Sallallaho alaihe wasallam) accepts a woman's invitation: The Prophet (Sallallaho alaihe wasallam) 'was once re- turning from a funeral, when a woman invited him to par- take of some food at her house. He went in with some of his Sahabah. When the food was served, it was noticed that the Prophet (Sallallaho alaihe wasallam) was trying to chew a morsel, but it would simply not go down his throat. He said: \"It seems that the animal has been slaughtered without the permission of its owner.\" The woman said: \"0, Prophet of Allah! I had asked a man to purchase a goat for me from the market, but he could not obtain one. My neighbour also had recently purchased a goat. So I sent the man thither with some money to buy the ! same from him: My neighbour was out and his wife made over the goat to my man.\" The Prophet (Sallallaho alaihe wasallam) directed her to go and serve the meat to the captives. It has been noted of pious and saintly Muslims that I food obtained from doubtful sources would simply not go down their throats. So this is not such a surprising thing in . The Prophet's (Sallallaho alaihe wasallam) Sleepless Night: Once the Prophet (Sallallaho alaihe wasallam) spent a sleepless night. He would turn from side to side and could not sleep. His wife asked him: \"0, Prophet of Allah! Why can you not sleep?\" He responded: \"A date was lying about. I took it up and ate it, lest it should be wasted. Now I am troubled lest it might be from Sadaqah.\" Most probably the date belonged to the Prophet him- self, but because people sent him their 'Sadaqah' as well (for distribution), he could not sleep with the apprehension that it might be of Sadaqah. This is the last word in scruples from the master himself, that he could not sleep because of a suspicion in his mind. How would it go with those who claim themselves to be the slaves of that very master but indulge in usury, corruption, theft, plunder and every other type of 'haraam' business without the least scruple. 3. Hadhrat Abu Bakr (Radhiyallaho anho) and a sooth- sayer's food: Hadhrat Abu Bakr (Radhiyallaho anho) had a slave who used to give him a portion of his daily income as the masier's share. Once he brought him some food, and Hadh- rat Abu Bakr (Radhiyallaho anho) took a morsel out of it. Then the slave remarked: \"You always enquire about the source of what I bring to you, but today you have not done so.\" He replied: \"I was feeling so hungry that I failed to do that. 'Tell me now, how did you come by this food?\" The slave said: \"Before I embraced Islam, I practised sooth-saying. During those days I came across some people for 7 6 I whom I practised some of my charms. They promised t I to pay me for that later on. I happened to pass by those people today, while they were engaged in a marriage ceremony, and they gave me this food.\" Hadhrat Abu Bakr (Radhiyallaho anho) exclaimed: 'Ah! you would have surely killed me?\" Then he tried to vomit the morsel he had swallowed, but could not do so, as his stomach had been quite empty. Somebody suggested to him to take water to his fill and then try to vomit. He sent for a goblet of water and kept on taking water and forcing it out, till the morsel was vomit- ted out. Somebody remarked: \"May Allah have mercy on you! You put yourself to such trouble for one single morsel.\" 1 To this he made reply: \"1 would have thrust it out even if I had to lose my life. I have heard the Prophet (Sallallaho alaihe wasallam) saying. 'The flesh nourished by haraam food, is des- tined for the fire of Hell.' I, therefore, made haste to vomit this morsel, lest any portion of my body should receive nourishment from it.\" Many stories of this nature have been reported about Hadhrat Abu Bakr (Radhiyallaho anho). As he was very scrupulous and would not taste anything but that about which he was perfectly sure, even the slightest doubt about its being 'halal' would make him vomit what he had taken. 4. Hadhrat Umar (Radhiyallaho anho) vomits out milk of Sadaqah: A person once brought some milk for Hadhrat Umar (Radhiyallaho anho). When he took it, he noted its queer taste, and asked the person as to how he had come in pos- session of the milk. He replied: \"The camels given in Sadaqah were grazing in the desert, and the attendants gave me this milk out of what they got from them.\" LJpon this. I-iadhrat Umar (Radhiyallaho anho) put his hand in his throat and vomited all that he had taken. These God-fearing people not only totally abstained from 'haraam' food. but were most anxious to avoid anv w 3s: %d i; doubtful morsel finding its way inside them. They could .c 2~ not dare taking anything that was 'haraam', which is so usual these days. 5. Hadhrat Abu Bakr (Radhiyallaho anho) gives his garden to Bait-ul-Maal: Ibn-Seereen writes: \"When Hadhrat Abu Bakr (Radhiyallaho anho) was about to die, he said to his daughter, Hadhrat Aishah (Radhiyallaho anha), 'I did not like to take anything from the Bait-ul-Maal, but Hadhrat Umar (Radhiyallaho anho) insisted on it, to relieve me of my occupation, and to enable me to devote nly full time to the duties of the 'Khilafat: and I was left no choice. Now make over that garden of mine to my successor, in lieu of what I have received from the Bait-ul-maal'. When I-Iadhrat Abu Bakr (Radhiyallaho anho) died, Aishah (Radhiyallaho anha) asked Hadhrat Umar (Radhiyallaho anho) to take over that garden, as desired by her late father. Hadhrat Umar (Radhiyallaho anho) remarked: \"May Allah bless your father! He has left no chance for anybodv to open his lips against him.\" Hadhrat Abu Bakr (Radhiyallaho anho) received his subsistence allowance from the Bait-ul-maal in the interest of all the Muslirns, and that too at the request of the most prominent Sahabah. Again the amount taken was almost the minimum possible, and hardly sufficient for him, as we have already seen in the story (in the last chapter) about his wife's inability to cook one sweet dish during the whole month. In spite of all this he was so scrupulous that he made over his garden to the Bait-ul-nlaal i l l lieu of ~vhat he had received from the public funds. 6. The story of Ali bin Ma'bad: (Rahmatullah alaih) Ali bin Ma'bad (Rahmatullah alaih) is a Mohaddith. He savs: \"I was living in a rented Iiouse. Once I wrote some- thing which 1 wanted to drv up quicklv. The house walls were of mud and 1 intended to scrape a little mud from there to dry up the ink. But I thought: \"This house is not mine, and I cannot scrape the walls with- 79 7 8 6 . Hadhrat Ali (Radhiyallaho anho) passes by a grave: Hadhrat Kumail (Radhiyallaho anho) says: \"I was with Ali (Radhiyallaho anho) once on a journey, when he reached an uninhabited place; he approached a grave and said: '0 you dwellers of the graves! 0 you who live amongst ruins! 0 you who live in the wilder- ness and solitude! How fare you in the other world? How has it gone with you there?' He continued: 'The news from our side is that all you did leave of the wealth and riches here, has long been distributed; your children are orphans; your widows have long since re- married. Now let us hear about you.' He then turned to me: '0 Kumail! If they could speak, they would have informed us that the best provision for the Hereafter is Taqwa.' Tears yelled out of his eyes, as he added: '0 Kumail! The grave is a container of the deeds; hut one realizes it only after death.\" Our good or bad actions are stored up in our graves. It is said in a Hadith that every person meets his good deeds in the grave in the person of an agreeable companion who befriends and consoles him there. But his wicked deeds assume hideous shapes emitting bad smells, which add to his misery. In another Hadith it is said: \"Three things accompany a person to his grave viz: His wealth (as was the prevalent custom among the Arabs of the time), his relatives, and his deeds. His wealth and his relatives turn back after his burial, but his ac- tions go in and stay with him in the grave.\" Once the Prophet (Sallallaho alaihe wasallam) asked the Sahabah: \"Do you know in what relation your relatives, your wealth, and your deeds stand to you?\" The Sahabah expressed their desire to know about it. Me re- plied: \"It can be likened to a person having three brothers. When he is about to die, he calls one of his brothers to him, and asks him: 'Brother! You know what plight is mine? What help can you render me at this juncture?' That brother replies: ''I shall call the doctor to you, nurse you and attend upon you. And when you are dead, I shall bathe you, enshroud you, and carry yau to the grave. .Then I shall pray for you after you are buried. This brother is his kith and kin. He puts the same question to the second brother, who delivers himself like this: 'I shall remain with you as long as you are alive. No sooner you are dead than I shall betake myself to someone else,' This brother is his wordly wealth. He then questions the last brother in the same strain, who makes response: 'I shall not for- sake you even in your grave; and I shall accompany you into that place of utter solitude. When your deeds are weighed in the balance. I shall forthwith lend my weight to the scale of your good deeds and weigh it down.' This brother is the personification of his good deeds. Now, tell me, which of the brothers you regard to be the most useful to the person?' The Sahabah re- plied: '0, Prophet of Allah! The last brother is really the most useful to him. There is no doubt about it. The other two brothers were of no avail.\" 8. The Prophet's (Sallallaho alaihe wasallam) verdict about haraam food: The Prophet (Sallallaho alaihe wasallam) once said: \"As Allah Himself is above all blemishes, likewise. He blesses with His grace only the unblemished thi~igs. He enjoins upon the Muslims, what He has laid 3own for His Prophets. He savs in His Holy Book: 80 6 , Prophets! Eat of the good things and do right. Lo! I amaware of what ye do.\" (XXIII: 511. \"0 Ye who believe Eat of the good things where-with we have provided you.\" (11: 172) Then the Prophet (Sallallaho alaihe wasallam) did mention of a person who is a way-farer with dishevelled hair and dusty clothes; raising his hands towards the heaven, he calls out: \"0, Allah! 0, Allah!\" but his food, drink and dress all were from haraam sources. So, Allah would never listen to him and answer his prayers, even though his outward condition showed him deserving. People wonder why the prayers of the Muslims are not alwavs fulfilled bv Allah: the reason is easy enough to understand in the light of the above Hadith. 'l'hough Allah does sometimes grant the prayers of even a Kafir (not to mention the prayer or requests of a sinful Muslim). but it is pnrticularlv the prayer of a pious person that is seldom re- jected. That is the reason why people generally seek the prayers of such persons for themselves. It follows that those who wish to have their prayers often granted must abstain from haraam. No wise person would like to run the risk of his prayers being rejected. 9. Hadhrat Umar (Radhiyallaho anho) does not like his wife to weigh musk: I-ladhrat (Jmar (Kadhiyallaho anhn) once received some nli~skfrom Bahrain. I-le said: \"I tvant someone to weigh it, so that it mav be equally distri1)uted among the Muslims.' llis ~viit? said: \"1 shall weigh it..\" tiiiclhriit Umar (Kadhivallaho anho) kept quiet. A little later ht: again asked for someone to weigh the musk, and again his wife volullteered to do so. But he kept quiet this tiine too. C'lrhen she repeated her offer for the third time, he said: \"I do not like your touching the musk with your hands (while weighing it) and rubbing those hands on your body afterwards, as that would amount to something over and above my legitimate share.\" Any other person weighing the musk would, for that matter, have had the same advantage, but Hadhrat Umar (Radhiyallaho anha) did not like this preference particu- larly for any member of his own family. Look at this scru- pulous anxiety to avoid charge of selfishness. A similar story is related about Hadhrat Umar bin Abdul Aziz (Rahmatullah alaih) (who is known as the second Umar). While he was holding the reins of the Khila- fat, musk belonging to the Bait ul-Maal was being weighed. He closed his own nostrils, with the remark: \"The use of musk is to smell it.\" These were the scruples of the Sahabah, and their suc- cessors, and our elders in Islam. 10. Hadhrat Umar-bin-Abdul Aziz (Rahmatullah alaih) dismisses a governor: Hadhrat Umar-bin-Abdul Aziz (Rahmatullah alaih) ap- pointed a person as governor of a province. Somebody re- marked that this person had held the same post under Hajjaj-bin-Yusuf (the notorious blood shedder) also. Hadh- rat Umar bin Abdul Aziz (Rahmatullah alaih) immediately issued orders of his dismissal. The man protested: \"I had been with Hajjaj only for a very short time.\" To this, the Khalifa replied: \"His company for a day or even less is sufficient t~ render a man unfit for public service.\" \"A man is known by the companv he keeps.\" The company of pious people leaves an imperceptible impres- sion of piety on the character, and likewise evil company has its evil influence. That is why association with bad people is always discouraged. Even the companv of ani- mals is not without its own effect. The Prophet (Sallallaho alaihe wasallam) said: 82 \"Pride and arrogance are prone to be found in those who own camels and horses, while meekness and hu- mility characterise those who tend sheep and goats.\" The Prophet (Sallallaho alaihe wasallam) is reported to have said: \"A person who associates with a pious man is like one who sits with a musk-seller. Even if he does not re- ceive any musk from the latter still the pleasant smell would be a source of pleasure to him. But bad com- pany may be likened to a furnace; a man sitting near one cannot escape the smoke and the fumes, even if a spark does not fall on him.\" CHAPTER V DEVOTION TO SALAAT Salaat is the most important of all forms of worship. It is, in fact, the first and foremost item to be reckoned with on the Day of Judgement. .The Prophet (Sallallaho alaihe wasallam) is reported to have said: \"Salaat is the only line of demarcation between Kufr and Islam.\" There are many Ahadith about Salaat, which. I have col- lected in a separate book. 1. Blessings of Nafl (non-obligatory) Prayers: The Prophet (Sallallaho alaihe wasallam) reported that Allah told him: \"My wrath descends upon a person who bears ill-will towards My friends. And only those are blessed with My love who implicitly carry out Fardh (obligatory) in- junctions. A person keeps on advancing in my esteem through 'Nafl'; till I choose him as 'My beloved'. I then become his ear by which he listens, his eye by which he looks, his hands by which he holds, and his feet by which he walks (i.e. his listening, looking, holding and walking are all in perfect accord with My injunctions, and he would never even dream of employing any part of his body in any action contrary to My commands). If such a person prays for anything, I grant it to him and if he seeks My protection I do protect him.\" Those people are really blessed who, after performing their Fardh, are in the habit of observing Nafl profusely. May Allah give me and all my friends the strength to earn this blessing. 2. The Propet (Sallallaho alaihe wasallam) spends the whole night in Salaat: A certain person asked A'ishah (Radhiyallaho anha): \"Tell me something noteworthy concerning the Prophet (Sallallaho alaihe wasallam).\" 84 She answered: \"There was nothing which was not unusual about him. Everything he did was noteworthy. One night he came and lay down with me. After sometime, he got up saying, 'Now let me pray to my Lord, the Sustainer.\" With this, he stood up in Salaat, humbling himself before his Creator with such sincerity that tears rolled down his cheeks to his beard and on to his breast. He then bowed for Ruku' and Sajdah, and his tears flowed down as fast as before and after raising his head from his Sajdah, he con- tinued weeping in this manner till Hadhrat Bilal (Radhiyal- laho anha) announced the approach of Fair. I pleaded with him: \"0, Prophet of Allah! vou are sinless, as Allah has in His munificence forgiven your each and every sin (even if committed) in the past and which may happen in the life to come (XLVIII: 2) and still you grieve so much\". He replied: Why, then, should I not be a grate- ful slave of Allah? Then he added, 'Why should I not be praying like this when Allah has today revealed to me these verses?' 'Lo! in the creation of the Heavens and the Earth, and in the difference of night and day, are tokens (of His Sov- ereignty) for men of understanding, such as remember Allah. standing'sitting and reclining . . . (111: 190-191)' \" It has been reported in many Ahadith that the Pro- phet's feet would get swollen because of his very long ra- kaats in Salaat; people tried to reason with him: \"0, Prophet of Allah! You are sinless and still you labour so hard!\" He would reply: \"Should I not be a grateful slave of my Allah, then?\" 3. The Prophet's (Sallallaho alaihe wasallam) recitation of the Qur'an in Salaat: Hadhrat 'Auf (Radhiyallaho anho) narrates: sa 2 2 \"I was once with the Prophet (Sallallaho alaihe wasal- lam). He brushed his teeth with a Miswak, performed .g 4 s w his Wudhu and stood up for Salaat. I also availed of * the opportunity to join him. He recited surah 'Baqarah' in his first rakaat; he would pray for mercy when he re- cited any verse extolling the Grace of Allah, and would supplicate for Divine forgiveness when reciting any verse referring to His wrath. He took as much time in Ruku' and Sajdah each as he had taken in Qiyaam. In Ruku' he recited: 'Glory to Allah the Lord of Majesty, sovereignty and magnificence. ' He recited the next three successive Soorahs in the re- maining three rakaats, and each rakaat was of about the same length as the first one.\" Hadhrat Huzaifah (Radhiyallaho anho) has also narrated a similar story about his Salaat with the Prophet (Sallallaho alaihe wasallam.) The Qiraat (recitation) of the Qur'an by the Prophet (Sallallaho alaihe wasallam) in the above mentioned four rakaats amounts to more than one-fifth of he whole Qur'an. And the Prophet (Sallallaho alaihe wasallam) recited the Qur'an with proper intonation (Tajweed), and would also pray and seek forgiveness after relevant verses. Again his Ruku' and Sajdah also would last as long as his Qiyaarn. We can thus have a fair idea of how much time he must have taken to say his Salaat. This can only be possible when Salaat is a source of great inner satisfaction and spiri- tual ecstasy. That is why the Prophet (Sallallaho alaihe wa- sallam) has often been quoted as saving: \"The comfort of mv eyes lies in Salaat.\" 4. Salaat of a Few Eminent Sahabah: Hadhrat Mujahid (Radhiyallaho anho), describing the Salaat of Hadhrat Abu Bakr (Kadhiyallaho anho), and that of Hadhrat Abdullah bin Zubair (Kadhiyallaho anho) says: \"They stood in Salaat motionless like pieces of wood stuck in the ground.\" 'Ulama agree that Hadhrat Abdullah bin Zubair (Radhiyai- laho anho) learnt to say his Salaat from Hadhrat Abu Hakr 86 (Radhiyallaho anho), who in turn learnt it direct from the Prophet (Sallallaho alaihe wasallam). It is said about Hadhrat Abdullah bin Zubair (Rad- hiyallaho anho) that he remained in Sajdah for so long, and kept so motionless therein, that birds would come and perch on his back. He would sometimes remain in Sajdah or Ruku' all night long. During an attack against him, a mis- sile came and hit the wall of the musjid wherein he was saying his Salaat. A piece of masonry flew from the wall and passed in between his beard and throat. He neither cut short his Salaat, nor was he the least perturbed. Once he was saying his Salaat while his son Hashim was sleeping near him. A snake fell from the ceiling and coiled round the child. The child woke up and shrieked, and the whole household gathered round him. They killed the snake after a great hue and cry. Ibne Zubair (Radhiyallaho anho), calm and quiet, remained engaged in his Salaat all the while. When he had finished it, he said to his wife: \"I heard some noise during my Salaat; what was that?\" His wife exclaimed: \"May Allah have mercy on you! The child's life was in danger, and you took least notice of it.\" His answer Mas: \"Had I turned my attention to anything else, what would have remained of the Salaat?\" Hadhrat 'Umar (Radhiyallaho anho) was stabbed at the close of his career, and this same wound caused his death. He bled profusely and remained unconscious for long in- tervals. But when hewas informed of the time of Salaat, he would perform it in that very condition, and say: \"There is no portion in Islam for the person who dis- cards Salaat.\" Hadhrat Uthman (Radhiyallaho anho) would remain in Salaat all night long, finishing the whole of the Qur'an in one rakaat. It is reported about Hadhrat Ali (Radhiyallaho anho) that he would turn pale and tremble at the time of Salaat. Somebody asked him the reason, and he said: \"It is the time to discharge that trust which Allah of- fered to the Heavens and the Earth and the hills, but they shrank from bearing it, and I have assumed it.\" me11 for safety, but he never even heard the noise. Somebody asked Haatim Asam as to how did he say his Salaat. He replied: \"When the time for Salaat comes, I perform my Wudhu and go to the place where I have to say my Salaat. I sit down for some time, till all the parts of my body are re- laxed. Then I stand up for Salaat, visualising the Ka'bah in front of me, imagining my feet upon the Bridge of Siraat, with Paradise to my right, and Hell to my left, and Izraa-eel close behind me, and thinking that it may be my last Salaat. Then I say my Salaat with full sincerity and devotion. And I finish my Salaat between fear and hope about its acceptance. 5. Salaat of a Muhajir and an Ansari keeping watch: While returning from a campaign, the Prophet (Sallal- laho alaihe wasallam) happened to halt for the night at some place. He inquired: \"Who would keep watch over the camp this night?\" Hadhrat Ammar bin Yasir (Radhiyallaho anho) of the Mu- hajirin and Hadhrat Abbaad bin Bishr (Radhiyallaho anho) of the Ansar offered their services. Both of them were posted to watch from a hill-top against any possible night attack by the enemy. Abbaad (Radhiyallaho anho) said to Ammar (Radhiyal- laho anho): \"Let us keep watch and sleep turn by turn. In the first half of the night I shall keep awake, while you go to sleep. In the next half. you may keep watch while I go to sleep.\" Hadhrat Ammar (Radhivallaho anho) agreed and went to sleep, and Hadhrat Abbaad (Radhivallaho anho) started his Salaat. But an enemy scout made him out in the dark from a distance. and let flv an arrow at him. Seeing that he made no movernent, he shot another and still another arrow at him. Hadhrat Abbaad (Radhivallaho anho) drew out arid threw away each arrow as it struck him, and at last awakened his conlpanion. The enemy fled when he saw them both together. fearing that there might be many more of them. Hadhrat Ammar (Radhivallaho anho) rioticed Abbaad (Radhiyallaho anho) bleeding from three places. He said: \"Subhanallah! whv did you not awake me earlier?\" Abbaad replied: \"I had started.reciting Surah 'Kahf' in my Salaat. I did not like to cut it short. but when I was struck by the third arrow. ,I was greatly concerned that my death might jeopardise the safety of the Prophet (Sallallaho alaihe wasallam). I therefore finished the Salaat and awakened you. But for this fear. I would not have gone to Ruku' before finishing the Surah even if I had been killed. \" I Look at the devotion of'the Sahaba to Salaat. One arrow after another is piercing Hadhrat Abbaad's (Rad- hiyallaho anho) body and he is bleeding profusely, but is not prepared to sacrifice the pleasure of reciting the Qur'an in his Salaat. On the other hand, the bite of a wasp, nay of a mosquito, is sufficient to distract us from our Salaat. According to the Hanafiyvah school of jurisprudence, Wudhu breaks with bleeding, while according to the Sha- fi'iyyah it does not. lt is just possible that Abbaad might be having the latter view. or that this point might not have been brought to an issue till then. 6. Hadhrht Abu Talha (Radhiyallaho anho) and his m Salaat: .- ,om V1 Hadhrat Abu Talha (Radhiyallaho anho) was once saying his Salaat in his garden. His attention was drawn to- wards a bird that flitted about, but could not find a way out of the dense foliage. For a short moment, he followed the bird with his eyes, and forgot the number of his rakaat. Upon this mishap, his sorrow knew no bounds. He re- paired to the Prophet's (Sallallaho alaihe wasallam) pres- ence straightway and submitted thus: \"0 Prophet of Allah, this garden of mine has been the cause of a diversion in my Salaat. I give it away in the cause of Allah. Kindly spend it as may appear proper to you.\" A similarchance befell one of the Ansaar in the time of Hadhrat Usman (Radhiyallaho anho). He was saving his Salaat in his garden. The branches of the trees were weighed down with ripe juicy dates, luxurious abundance, which caught his eyes, and he felt pleased with it. This made him forget the number of his rakaat. He was so much stricken with grief that he decided to part with the garden that had distracted him from his Salaat. He approached Usman (Radhiyallaho anho) and made over the garden to him for utilising it in the path of Allah. LJsman (Radhiyal- laho anho) had the garden sold for fifty thousand dirhams and spent the money as desired. This shows the value the Sahaba set on their faith; and Hadhrat Abu Talha (Rad- hiyallaho anho) could give away his orchard worth fifty thousand dirhams because it had interfered with his Salaat. According to Shah Waliullah, the Sufis give preference to obedience to Allah over anything that distracts from it. 7. Hadhrat Ibn Abbas (Radhiyallaho anho) and his Salaat: Hadhrat Abdullah bin Abbas (Radhiyallaho anho) suf- fered from cataract of the eye. A doctor told him: \"A treatment is possible, provided you are willing to take precautions. For five davs, it will be essential for you to avoid prostrating yourself on the ground. You can, however, use a wooden desk for performing Sajdah.\" 90 r Hesaid: \"This cannot be so. I would not say a single rakaat like that. I have heard the Prophet (Sallal- laho alaihe wasallam) saying, \"A person who in- tentionally foregoes a single Salaat shall have to face Divine wrath on the Day of Judgement.\" Although it is quite permissible to perform Salaat in the way advised by the doctors,. and it involves no direct transgression of the Law of Allah, yet due to his utter devo- tion to Salaat and implicit regard for the Prophet's warning, he was ready to lose his eyesight rather than allow the slightest modification in the Salaat as performed by the Prophet (Sallallaho alaihe wasallam) himself. In fact, the Sahabah would sacrifice the whole world for their Salaat. We may dub it as 'fanaticism', or make any other remark about that devoted band, but the verdict in the Hereafter would prove, beyond doubt, that they were the personages who really feared and loved their Creator above everything else in this world. 8. Sahabah's suspending trade at the time of Salaat: Hadhrat Abdullah bin 'Umar (Radhiyallaho anho) once visited the market. He noticed that at the time of Salaat, everybody closed his shop and flocked to the musjid. He remarked: \"These are people about whom Allah has remarked: \"Men whom neither merchandise nor sale beguileth from remembrance of Allah and constancy in Salaat and paying to the poor their due; who fear a day when hearts and eyeballs will be overturned. (XXIV: 3 7)\" i Hadhrat Ibn Abbas (Radhiyallaho anho) says: \"These people were completely absorbed in their trade, but when they heard Azaan they left everything 1 and hastened towards the musjid.\" I He once remarked: \"By Allah, they were such traders whose trade did not hinder them from the remembrance of I Allah.\" SJZ L. - \"9 Hadhrat Abdullah bin Masood (Radhiyallaho anho) once chanced to be in the market when Azaan was called 3, m out. He noticed everybody leaving his shop as it was, and proceeding to the musjid. He remarked: \"These are surely the persons of whom Allah says: 'Men whom neither merchandise nor sale beguileth from remembrance of Allah and constancy in Salaat and paying to the poor their due. (XXIV:37).' Another Hadith has it: \"All the people shall be gathered on the Day of Judge- ment, when it will be asked, 'Who are those who glori- fied Allah in ease and adversity?\" A group will arise and enter Paradise without any reckoning. Again it will be asked, 'who are those who kept away from their beds and passed their nights in worshipping their Cre- ator.' Another group will arise and enter Paradise with- out any reckoning. The angel will ask yet again, 'where are those whom trade did not hinder from remember- ing Allah.' And yet another group will arise and enter Paradise without any reckoning. After these three groups have departed, and reckoning would com- mence for the people in general.\" 9. Martyrdom of Hadhrat Khubaib, Hadhrat Zaid and Hadhrat 'Asim (Radhiyallaho anhum): The Qureysh writhed with fury and rage at the loss of some of their greatest men in Uhud. Sulaifah, whose two sons had fallen in action, had taken a solemn vow that she would drink wine in the skull of 'Asim (Radhiyallaho anho), who had killed both of them, if she could get possession of his head. She had proclaimed a prize of one hundred camels (a stupendous sum for the place and the time) for the person who brought 'Asim's head to her. Sufyan bin Khalid worked out a plan to secure the prize. He sent a few men of Adhal Waqarah to Madinah, who pretended to em: brace Islam: they besought the Prophet (Sallallaho alaihe wasallam) to detail some persons to accompany them to their locality to preach Islam to the populace. They made a special request for 'Asim (Kadhiyallaho anho) saying: 92 93 \"Our people will very much appreciate his mode of address.\" The Prophet (Sallallaho alaihe wasallam) deputed ten (or six according to another report) of his companions to go with them, and 'Asim (Radhiyallaho anho) was of course in- cluded in these. They started satisfactorily from Madinah, but treachery awaited them on the way; they were attacked by not less than two hundred of the enemy, including one hundred crack selected archers. The Sahabah climbed up a hill called Fadfad. The eneniy called out to them: \"We do not want to kill you; we shall only take you to Mecca and sell you to the Qureysh.\" The Sahabah (Radhiyallaho anhum) rejected this parley and chose to fight to the finish. When they ran short of arrows, they attacked the enemy with their spears. Hadhrat Asim (Radhiyallaho anho) called out to his companions: \"No doubt you have been betrayed by these treacher- ous people, but you should not lose heart; because martyrdom is itself the acme of your aspirations. Allah, the most beloved, is with you, and your celestial spouses are this minute waiting for you.\" With these words, he rushed into the very thick of the enemy, and when his spear broke he fought on with his sword. Thus he fell fighting to the last. His last prayer was: \"0, Allah! inform the Prophet (Sallallaho alaihe wasal- lam) about our fate.\" Allah, in His compassion, answered his prayer by revealing the news to the Prophet (Sallallaho alaihe wasallam). As 'Asim (Radhiyallaho anho) had come to know about Sula- fah's vow to drink wine in his skull, he also prayed: \"0, Allah! I have laid down my life in Thy cause: 0, Allah, do save my head from the sacriligeous hands of these unbelievers.\" This prayer was also granted. After his death, a swarm of bees (or wasps according to another report) settled upon his body, and foiled all attempts of the enemy to sever his head. They left the body alone, intending to do their.dirty job during the night, when the bees would have gone. But during the night, there was a cloud-burst, which washed the body away. \\I ,11 hluhalnmad (Sallallaho alaihe wasal- lam) to be in vour place today, and you be let off to enjoy life with your family?\" Zaid's (Kadhivallaho anho) replv amazed them all: \"Hv Allah!\" he said. \"the trerv tho~~ght of enjoying life with nlv family is unbearable to me. if the Prophet (Sallallaho alaihe wasallam) were even to suffer a thorn-prick in his foot for that.\" 94 The Qureysh simply could not understand this reply, and Abu Sufyan (Radhiyallaho anho) remarked: \"There is absolutely no parallel, anywhere in the world, to the love that the companions of Muhammad (Sallallaho alaihe wasallam) bear him.\" Hadhrat Zaid (Radhiyallaho anho) was then martyred. Hadhrat Khubaib (Radhiyallaho anho) remained in the captivity of Hujair for a long time. A woman slave of Hujair (who later embraced Islam) says: \"When Hadhrat Khubaib (Radhiyallaho anho) was in captivity with us, I noticed one day that he was eating grapes from a bunch as big as a human head, though it was not the season of grapes in Mecca at that time. When the day for his execution drew near, he asked for a razor, which was handed over to him. Meanwhile a child of the house, in his play, went close to Hadhrat Khubaib (Radhiyallaho anho). All the inmates of the house got alarmed at the sight. Hadhrat Khubaib (Rad- hiyallaho anho) having been marked for death, they thought there was nothing to prevent him from killing the child with the razor. But to remove their fears on observing their alarm, Hadhrat Khubaib (Radhiyallaho anhoj remarked: 'Do you think that I would stoop to the killing of an innocent child? This heinous crime is simply not possible for me.'\" When he was brought to the gallows, and asked to make his last wish, if any, he requested: \"Allow me to say two rakaat of Salaat, for it is time for me to leave the'world and meet my Allah.\" They let him say his Salaat. On finishing the two rakaat most calmly, he said: \"But for your thinking that I was afraid of death, I would have said another two rakaats.\" He was then tied to the gallows. At that time he said: \"0, Allah! There is nobodv to convey my last Salaam to Thy Prophet (Sallallaho alaihe wasallam).\" And Allah sent his Salaam to the Prophet (Sallallaho alaihe wasallam) through an angel. The Prophet (Sallallaho alaihe wasallam) answered: \"Wa alaikumus salaam! 0 Khubaib.\" I11 and observed to the Sahabah: 'C C, \"Khubaib has been martyred by the Qureysh.\" m S m At the gallows, forty of the Querysh speared him simul- taneously. One of those teased him: Say by Allah, if you now wish Muhammad (Sallallaho alaihe wasallam) to be in your place and you to be let off.\" He replied: \"By Allah the Most Magnificent. I will not tol- erate a thorn pricking the Prophet (Sallallaho alaihe wasallam) in ransom for my life.\" Every word of this story is a lesson for us all. The de- votion and love of the Sahabah narrated therein is really something to esteem and covet. They would lay down their very lives, but they would not tolerate even a thorn piick- ing the Prophet (Sallallaho alaihe wasallam). Again, look at Hadhrat Khubaib's (Radhiyallaho anho) last wish. He neither remembers his family members nor wishes to see any of them; what he wishes is to send his last Salaam to the Prophet (Sallallaho alaihe wasallam) and to say two last rakaats of Salaat. 10. Prophet's (Sallallaho alaihe wasallam) company in Paradise: Rabee'ah (Radhiyallaho anho) narrates: \"1 used to remain in attendance upon the Prophet (Sal- lallaho alaihe wasallam) at night. I would keep water, miswak, praying mat, etc., ready for his Tahajjud. Once he (being very pleased with my services) asked me, 'What would you wish most?' I submitted, '0, Prophet of Allah. I wish your company in Paradise.' He asked me if there was anything else I wished for. But I re- plied. 'This is the only thing I long for.' Upon this, he remarked. 'All right. You should help me by prostrat- ing in prayer frequently.' \" Here is a lesson for us. We should not depend on verbal prayers alone, but we should also make some practi- cal efforts to gain our object. The best of all efforts is Salaat. Also, it would be wrong to depend entirely on the prayers of saints and pious people alone. This is a world of cause and effect: and, no doubt, Allah sometimes in His Wisdom and Might does bring into effect things for which there is 96 7 no apparent and tangible cause, but this happens only on very rare occasions. For us, as in this world we make all possible efforts, and never depend on prayers alone nor rest contented with our lot, so in all gains pertaining to the Hereafter, we should try our best to conform to the conduct demanded by religious and ethical standards, and not regard verbal prayer as the only factor which counts, nor like a fatalist leave all to a ruthless destiny. No doubt, the prayers of pious people and lovers of Allah have their due effect, but they only go to augment our own sincere efforts, and even the Prophet (Sallallaho alaihe wasallam) asked Rabee'ah (Radhiyallaho anho) to \"help\" him by prostrating frequently (i.e., saying Salaat in his leisure hours too). CHAPTER VI SYMPATHY AND SELF-SACRIFICE The Sahabah, as a class, were an embodiment of right- eousness. They attained a standard that is rather difficult to emulate in a modern society. We would be fortunate if we really attain even a partial resemblance to their character. Some of their qualities are peculiarly their own, and self- sacrifice is one of these. Allah has made a mention of this in the Holv Qur'an in these'words. \"They prkfer others above themselves. even though poverty become their lot. (LIX: 9).\" 1. Feeding the guest in darkness: A Sahabi came to the Prophet (Sallallaho alaihe wasal- lam) and complained of hunger and distress. Just then, the Prophet (Sallallaho alaihe wasallam) had nothing in hand, or in his home to feed him. He asked the Sahabah: \"Would anybody entertain him as a guest tonight on my behalf?\" One of the Ansaar said: \"0. Prophet of Allah, I will do that.\" The Ansari took the person to his house and instructed his wife: \"Look here, this man is a guest of the Prophet [Sallal- laho alaihe wasallam). We will entertain him as best as we can, and won't spare anything in doing so.\" The wife replied: \"By Allah! I have got no food in the house, except a verv little-something just enough for the children.\" The Ansari said: \"You lull the children to sleep without feeding them, while I sit with the guest over the meagre meal. When we start eating, put out the lamp pretending to set it 98 right, so that the guest may not become aware of my not sharing the meal with him.\" The scheme worked out nicely, and the whole family, including the children, stayed hungry to enable the guest to eat to his fill. It was over this incident that Allah revealed the verse: \"They prefer others above themselves, even though poverty become their lot (LIX: 9).\" There are quite a number of similar incidents about the Sahabah. The following is one of these. 2. Feeding a fasting Sahabi: \\ One of the Sahabah was keeping fast after fast, as he could not get anything to eat. Hadhrat Thabit (Radhiyallaho anho) came to know of this. He told his wife: \"I shall bring a guest tonight. When we sit at the meal, put out the lamp, pretending to set it right, and you are not to eat anything until the guest has taken his fill.\" The scheme worked out as in the last story. The husband and wife sat with the guest and the simple soul never sus- pected in the least that neither of them had partaken at all of the food, though their hands and jaws seemed to be moving all right. When Hadhrat Thabit (Radhiyallaho anho) repaired to tbe Prophet's (Sallallaho alaihe wasal- lam) presence next morning, he was greeted with the happy news; \"0, Thabit! Allah has very much appreciated your en- tertainment of the guest last night.\" 3. Overpayment of Zakaat: Hadhrat Ubay bin Kaab (Radhiyallaho anho) says: \"The Prophet (Sallallaho alaihe wasallam) once dep- uted me to collect Zakaat dues from a locality. I went to a person there, and asked about the details of his possessions. A baby camel one year old was due from him in Zakaat. When he heard this, he exclaimed, 'Of what use is a baby camel, one year old? You can BG 'E;d neither milk it, nor ride it. Here is a fine grown-up she- 8 4 camel. You had better take this .instead.' I replied. 'My 3 3 commission does not permit me to take more than rn what is actually due from you. I, therefore, cannot accept what you offer. The Prophet (Sallallaho alaihe wasallam) is visiting this locality, and tonight he will be camping at a place not very far from here. It is better you should go and place your offer before him. If he does not object, I would gladly accept your offer, other- wise you shall have to give me exactly what is due from you.' Thereupon, he took the she-camel to the Prophet (Sallallaho alaihe wasallam) and besought him thus: '0, Prophet of Allah! Your deputy came to re- ceive Zakaat from me. By Allah! before this time, I have never had the honour of paying anything to the Prophet (Sallallaho alaihe wasallam) or his deputy. I therefore placed everything that I possessed before him. He decided that a baby camel one year old was due from me. Now, 0, Prophet of Allah! This baby camel is of no use. It can neither yield milk nor carry a load. I, therefore, pressed him to accept a fine grown- up she-camel in-stead; which he refused to accept without your permission. I have now come to you with the she-camel. The Prophet (Sallallaho alaihe wasal- lam) observed, 'No doubt only that much is due from you which he has worked out, but if you are willing to give more than that, of your own accord, it would be accepted.' I then presented the she-camel to the Prophet (Sallallaho alaihe wasallam), which he accord- ingly accepted and sought Allah's blessings for the donor.\" Look, with what magnanimity of heart the Sahabah parted with their best things for the sake of Allah. On the other hand, we too claim to be the true followers of Islam, and ardent devotees of the Prophet (Sallallaho alaihe wa- sallam) but, leaving apart the bestowing of alms in general to the poor and the needy, we are most reluctant to pay the actual obligatory dues. Zakaat, as a pillar of Islam, is not even known to our upper classes. Of the middle classes, only the religiously conscious strata keep up a form of paying Zakaat, in as much as even the expenditure in- curred on their own relatives and acquaintances, and all other charitable donations squeezed out of them by the force of circumstances and face-savings are debited to this account. 100 4. Hadhrat 'Umar (Radhiyallaho anho) trying to emulate Hadhrat Abu Bakr (Radhiyallaho anho): Hadhrat 'Umar (Radhiyallaho anho) narrates: \"Once the Prophet (Sallallaho alaihe wasallam) asked for contributions in the path of Allah. In those days, I was in possession of some wealth. I mused thus, 'Time and again Abu Bakr (Radhiyallaho anho) has surpassed me in spending for the sake of Allah. I shall by the Grace of Allah surpass him this time, because I have just now some wealth with me to spend'. I went home buoyant with the idea. I divided my whole property into two exactly equal parts. One I left for my family, and with the other I rejoined the Prophet (Sallallaho alaihe wasallam), who accosted me thus: The Prophet (Sallallaho alaihe wasallam): 'Did you leave anything for your family, 'Umar?' 'Umar (Radhiyallaho anho): 'Yes, 0 Prophet of '4llah.' The Prophet (Sallallahd alaihe wasallam): 'How mu~h'?' 'Umar (Radhiyallaho anho): 'Exactly one-half.' By and by, Hadhrat Abu Bakr (Radhiyallaho anho) came along with his load. It transpired that he had brought everything that he possessed. This is what I heard: ' The Prophet (Sa/lallaho alaihe wasallam): 'What did you leave for your family, Abu Bakr?' Hadhrat Abu Bakr (Radhiyallaho anho): 'I have left Allah and his Prophet for them.' Hadhrat 'Umar (Radhiyallaho anho) says that on that day he admitted to himself that he could never hope to surpass Hadhrat Abu Bakr (Radhiyallaho anho). Allah says in his Holy Book. \"Vie one with another in good works (V:48).\" Such healthy emulation in sacrifice is therefore quite & b a 0s desirable and welcome. This incident happened at the time -8 4 of Tabuk, when the Sahabah in response to the Prophet's 2~ (Sallallaho alaihe wasallam) appeal for help contributed beyond their means. This has already been mentioned in Chapter 11. May Allah grant them best rewards on behalf of all the Muslims! 5. Sahabah dying thirsty for others: Hadhrat Abu-Jahm-bin-Huzaifah (Radhiyallaho anho) narrates: \"During the battle of Yarmuk, I went out in search of my cousin, who was in the forefront of the fight. I also took some water with me for him. I found him in the very thick .of battle in the last throes of death. I ad- vanced to help him with the little water I had. But, soon, another sorely wounded soldier beside him gave a groan, and my cousin averted his face, and beckoned me to take the water to that person first. I went to this other person with the water. He turned out to be Hishaam bin Abil Aas (Radhiyallaho anho). But I had hardly reached him, when there was heard the groan of yet another person lying not very far off. Hisham (Rad- hiyallaho anho) too motioned me in his direction. Alas, before I could approach him, he had breathed his last. I made all haste back to Hishaam and found him dead as well. Thereupon, I hurried as fast as I could to my cousin, and, lo! in the meantime he had also joined the other two. j U! j p, 6! Many an incident of such self-denial and heroic sacri- fice is recorded in the books of Hadith. This is the last word in self-sacrifice, that each dying person should forego slaking his own thirst in favour of his other needy brother. May Allah bless their souls with His choicest favours for their sacrifice for others even at the time of death, when a person has seldom the sense to make a choice. 6. Hadhrat Hamzah's (Radhiyallaho anho) shroud: The Prophet's (Sallallaho alaihe wasallam) dear uncle, and one of his earliest supporters. Hadhrat Hamzah (Rad- hiyallaho anho) fell in Uhud, and the ruthless enemy bru- tally cut off his nose, ears and vitals. He was ripped open, 102 and h ~ s heart, lungs and liver were torn out; and the whole body was thoroughly mutilated. While the Prophet (Sallal- laho alaihe wasallam) was making arrangements for the burial of the dead, he caught sight of Hadhrat Hamzah's (Radhiyallaho anho) body, and was shocked to find it in that condition. He covered the body with a sheet of cloth. Presently, Hadhrat Hamzah's (Radhiyallaho anho) sister Sa- fiyyah (Radhiyallaho anha) also came to see her martyred brother for the last time. The Prophet (Sallallaho alaihe wa- sallam) feared that the sight might be too much for her to bear, bade her son Hadhrat Zubair (Radhiyallaho anho) to dissuade.her from seeing the body. She however, rejoined: \"Yes, I have heard that the wretches have mutilated my dear brother's body. It is not too much in the path of Allah, and we should be resigned to it. I will bear all this patiently, and may Allah in His Grace have mercy on us all.\" Hadhrat Zubair (Radhiyallaho anho) informed the Prophet (Sallallaho alaihe wasallam) of his mother's re- solve, and he gave his assent to her seeing the body. When she beheld what they had done to it, she simply exclaimed, 'Inna lillahi wa inna ilaihi raaji-oon' and offered a prayer for his soul.\" In another Hadith, Hadhrat ZuLair (Radhiyallaho anho) himself narrates the incident. He says: \"We rnade out a woman drawing near the place where the martyrs of Uhud had been gathered. On her close approach, I recognised her to be my own mother. I ad- vanced to stop her, but she proved to be too strong for me. She thrust me aside, with the words, 'Leave me alone.' Whgn I told her that the Prophet (Sallallaho alaihe wasallam) had prohibited her from seeing the dead body, she at once desisted from her purpose and explained. \"Hearing the news of my brother's death, I have brought a couple of sheets for his shroud. Take these sheets and make use of them.' We took the sheets and had begun to enshroud the body, when the dead body of an Ansari named Hadhrat Suhail (Radhiyal- laho anho) caught our eyes. It was also lying close by 1 0) L. O Q * the two bodies. Now, one sheet was bigger than the other, so we drew lots, and the bigger sheet came to the 9 m * lot of Hadhrat Suhail (Radhiyallaho anho) and the smaller one to that of Hadhrat Hamzah (Radhiyallaho anho). We found that the sheet meant for Hadhrat Hamzah (Radhiyallaho anho), being too small, would not cover his body: if we covered the head the feet re- mained uncovered, and when we pulled it down to cover the feet, the head was exposed. The Prophet (Sal- lallaho alaihe wasallam) said, \"Cover the head with the sheet, and the feet with tree leaves.\" This is how the body of Hadhrat Hamzah (Radhiyal- laho anho), the dear uncle of him (Sallallaho alaihe wasal- lam) who wore the crown of perfection, was buried. Look at the spirit of the Sahabah, who could not tolerate Hadhrat 'Hamzah (Radhiyallaho anho) being enshrouded in two sheets and another Muslim brother remaining without a shroud at all. Again, although Hadhrat Hamzah (Radhiyal- laho anho) deserved preferential treatment due to his exalted position, his body was covered with a smaller sheet that had fallen to his lot. Can there be a better example of sympathy, equality and self-sacrifice? Is it not shameful on our part that we, who call ourselves the followers of these illustrious people, do not possess any of these qualities. 7. The Story of the Goat's Head: Hadhrat Ibn Umar (Radhiyallaho anho) says: \"One of the Sahabah received a goat's head as a pres- ent. He thought of a neighbour who had a larger family and was in greater need of it thar, himself, and pre- sented the same to him. 'This brother, on receipt of the present, recollected yet another person whom he con- sidered even more deserving than himself, and sent on the head to him. The goat's head is, thus, said to have changed hands no less than seven times, and at last came back to the original person from whom the circu- lation had started.\" We learn from the $tory how poor and needy the Saha- in the same condition. We considered it a shame to bah usually were, and yet how they indeed preferred others enshroud Hadhrat Hamzah (Radhiyallaho anho) in two above themselves. sheets, while the body of another Muslim brother lay bare. We, therefore, decided to use one sheet each for 104 105 8. Hadhrat 'Urnar's (Radhiyallaho anho) wife acts as a midwife: Amir-ul-Mominin Hadhrat 'Umar (Radhiyallaho anho), during the time of his Khilafat, used to patrol the streets and suburbs of Madinah himself during the night to keep a watch. During one of his night-patrols, he noticed a camel- hair tent pitched in an open space. He had never seen this particular tent before. Approaching the tent, he found an individual sitting outside, and heard a sort of groan coming out of the tent. Hadhrat 'Umar (Radhiyallaho anho) greeted the stranger with \"Assalaam-o-alaikum\" and sat down beside him. Hadhrat 'Umar (Radhiyallaho anho): \"Whence brother?\" The person: \"I am from the desert, and a stranger to this place. I have come to request Amir-ul-Momnin for some help in my need.\" Hadhrat 'Umar (Radhiyallaho anho): \"Who is there groaning like this inside the tent?\" The person: \"Please mind your own business.\" Hadhrat 'Umar (Radhiyallaho anho): \"Do tell me please. May be that I can help you.\" The Derson: \"If you must know, inside there is my wife groaning with labour pains.\" Hadhrat 'Umar (Radhiyallaho anho): \"Is there anybody else to attend her?\" The person: \"No one.\" Hadhrat 'Umar (Radhiyallaho anho), thereupon, got up and hurried homewards. He broached the subject to his wife Hadhrat Umme-Kulsum (Radhiyallaho anha) thus: \"Allah has brought you an opportunity to receive great blessings.\" Wife: ' \"What is it, 0, Amir-ul-Mominin?\" Ch. VI: Sympathy and Self-sacrifice Hadhrat 'Umar (Radhiyallaho anho): \"Yonder, a poor woman of the desert is in child birth, with none to attend her.\" Wife: \"I am ready to attend her, if it may please you so.\" Hadhrat Umme-Kulsum (Radhiyallaho anho) was after all the daughter of Hadhrat Fatimah (Radhiyallaho anho), and grand-daughter of the Prophet; how could she hesitate at the time of such need of a forlorn sister, such a service and a devotion which Allah loves best? Hadhrat 'Umar (Radhiyallaho anho): \"Then you should make all due haste. Also take a pan, some butter, provisions and other things needed during the child birth.\" Hadhrat Umme-Kulsum (Radhiyallaho anho) did as she was bidden and left for the place where the tent was pitched. Hadhrat 'Umar (Radhiyallaho anho) followed her close. She entered the tent, while Hadhrat 'Umar (Rad- hiyallaho anho) made a fire and occupied himself with cooking something which those people could eat. After some time, Hadhrat Umme-Kulsum (Radhiyallaho anha) called out from inside the tent, \"Amir-ul-Mominin, congratulate your friend on the birth of a son.\" The person was much embarrassed when he heard the ad- dress of 'Amir-ul-Mominin' and realized the position of the person who had been serving him. But Hadhrat 'Umar (Radhiyallaho anho) put all his fears to rest, saying: \"That is all right, there is nothing to worry about.\" He then placed the pan near the tent, asking his wife to take it and feed the woman. She fed her and returned the pan. Then Hadhrat U'mar (Radhiyallaho anho) asked the bedouin to partake of the food, as he had kept awake the whole night. Having rendered this service, Hadhrat U'mar (Kadhiyallaho anho) returned home with his wife, telling the person \"Come to me tomorrow, and I shall see what I can do for you.\" Is there any king, nay a petty chief, or even an ordinary middle class person of our time, who will thus take his 106 t wife out at the dead of night, and out in the wilderness, to attend a poor strange woman, while he himself gladly en- gages in making a fire and cooking food. Leave the worldly rich aside, how many of the religious people would do that? We should realize that unless we really follow in the footsteps of those God-fearing people whom we profess to look up to as our models, we cannot deserve and wish for the special blessings that Allah bestowed on them. 9. Hadhrat Abu Talhah (Radhiyallaho anho) gives his garden to Allah: I Hadhrat Anas (Radhiyallaho anho) says, \"Abu Talhah owned the best gardens in Madinah, and they were more numerous than those of any other Ansari. One of his gar- dens was known by the name of Bir I-Ia, and this was his most favourite resort. It was close to the Prophet's (Sallal- L laho alaihe wasallam) musjid and the water of its well was sw,eeR and abundant. The Prophet (Sallallaho alaihe wasal- lam) often visited that garden, and drank of the water. When Allah revealed the verse, \"You will not attain unto piety until you spend of that which Ye love (111: 92).\" Hadhrat Abu Talhah (Radhiyallaho anho) repaired to the I Prophet's presence and thus opened his heart, 1 \"0, Prophet of Allah! I love Bir Ha very much. As Allah wants us toppend precisely that which we love, I make over that garden to be spent in the path of Allah as you please.\" The Prophet (Sallallaho alaihe wasallam) was very much pleased, and remarked: 1 \"What a fine present (to Allah)! I think it would be best utilized if you distribute it among your own heirs.\" Hadhrat Abu Talhah (Radhiyallaho anho) went and acted upon the Prophet's advice. 1 . Are we prepared to part with any of our dear things for l the sake of Allah so quickly, after reading a verse of the I 1 Qur'an or listening to a well-delivered sermon? 3, Ll 0% a Even when we wish to make a charitable endowment, .g 4 usually we do it only for our death-beds or else when we s, are so displeased with some relatives that we decide to dis- inherit them. But, when an occasion of public spending like marriage comes round, we are eager to win popularity even if we have to take a loan on interest. 10. Hadhrat Abuzar (Radhiyallaho anho) reprimands his servant: Hadhrat Abuzar Ghifari (Radhiyallaho anho) was well known for his piety and abstinence. He kept no money with him, and likewise did not like others to hosrd it. He was always fighting against the moneyed class. Hadhrat Usman, (Radhiyallaho anho), therefore, during his caliph- ate advised him to shift to Rabzah (a small village in the desert). He had a few camels to live on, and an old servant to look after them. A tribesman from Banu Sulaim onca presented himself with a request: \"I wish to stay with you to benefit from your knowl- edge of Allah's commandments and the Prophet's (Sal- lallaho alaihe wasallam) ways and habits; I shall also help your servant in looking after the camels.\" Hadhrat Abuzar (Radhiyallaho anho) replied: \"I cannot keep with me a person who does not comply with my wishes; but if you can always do as bidden, you may remain with me, else I wish good-bye to you.\" The person asked: \"In what way do you like me to carry out your wishes.\" Hadhrat Abuzar (Radhiyallaho anho) replied: \"When I ask you to spend from my belongings, you are required to spend the best of them.\" The person says, \"I accepted Hadhrat Abuzar's (Rad- hiyallaho anho) condition and stayed on with him. One day, somebody informed him that there were some poor folk camping near the spring close-by and were in dire need of food. He asked me to fetch a camel. Accordingly, I went and intended to select the best of the lot, as I had pledged to do. It was a very fine and submissive animal and good for riding. so I decided to let it be, and selected the second best, as after all it was only to be slaughtered and eaten and, for this purpose, just as good as the other. 108 The other one was very good for riding and much more useful to Hadhrat Abuzar (Radhiyallaho anho) and his family, while the poor would find the one as tasty as the other. I, therefore, led the other camel to Hadhrat Abuzar (Radhiyallaho anho). He retorted. \"So, after all you have broken your pledge.\" Knowing well what he meant, I turned back and fetched the best camel instead. He addressed the people about him, \"I want two persons to do a job for Allah.\" As two persons volunteered themselves, he bade them go and slaughter the camel, and distribute the meat equally among the families camping near the water, including his own, saying, \"My family will also share equally with the rest.\" The volunteers carried out his instruct~ons. He then sent for me and asked: 'Did you intentionally ignore my instructions about spending the best out of my belongings, or you just happened to forget about it?' I: 'I did not forget you instructions, but thought it better to preserve the one for transport duties, while the other was as good for eating.' Abuzar: 'Was it for my personal need that you left it?' I: 'Yes.' Hadhrat Abuzar (Radhiyallaho anho): 'Come, let me tell you the occasion of my needs. That is the day when I shall be laid all alone in the solitude of the grave. Remember, there are three partners in your wealth, viz. (1) Your destiny, which does not wait to take away its share. Good or bad it would take away all that it has to take. (2) Your heirs, who are waiting for the day of your death, so that they may take over their share, and (3) Yourself. If you can manage, don't be the most helpless of the three partners. Take your full share, while you can. Allah says: 'Ye will not attain unto piety until you spend of tnat . which you love. (111: 92). I, therefore, think it advisable to send in advance the things which I love best, so that they may be in safe deposit for me there.' u 2% i 0% I That man is the worst loser of the three partners who $4 does not spend his wealth in the path of Allah, and keeps Sv! postponing the event till at last destiny takes it away from him, or Re dies and his heirs appropriate it. It is very seldom that the heirs give away in the path of Allah the wealth inherited from another person, so that his soul may benefit by it. The Prophet (Sallallaho alaihe wasallam) once remarked: \"Man cherishes his worldly belongings, hugging them to his soul, and gloating, 'my wealth, my wealth,' but I in reality only that much of it is his wealth, which he either enjoys in the form of food or dress or spends in the path of Allah to be stored up for him in the Here- after. What is left of his wealth belongs to others; he is only acting as a custodian.\" In another Hadith, it is reported that once the Prophet (Sal- lallaho alaihe wasallam) inquired of the Sahabah. \"Which of you would rather like to see his wealth in the hands of his heirs than keep it with himself?\" I I They replied: \"Who would like to be such a person, 0 I Prophet of Allah? (Sallallaho alaihe wasallam)\" I I Thereupon the Prophet (Sallallaho alaihe wasallam) ex- plained: \"Whatever you send in advance by spending it in the path of Allah is yours, and whatever is left behind be- longs to your heirs.\" 1 11. The Story of Hadhrat Abdullah bin Ja'far and Hadhrat .Abdullah Bin Zubair (Radhiyallaho anhuma): Hadhrat Ja'far Tayyar (Radhiyallaho anho) is a cousin of the Prophet (Sallallaho alaihe wasallam) and a brother of Hadhrat Ali (Radhiyallaho anho). His whole family is re- i nowned for magnanimity, generosity, valour and heroism, but Hadhrat Ja'far (Radhiyallaho anho) had a special love for the poor and often mingled and associated with them. He emigrated to Abyssinia with the other Muslims at the time of the persecution by Qureysh, and he was the spokes- man who so successfully defended the emigrants in the court of the Negus. This story we have already given in Chapter I. After returning from Abyssinia, he emigrated to Madinah and was martyred in the expedition of Mootah. Self-sacrifice 110 8 On receiving the news of his death, the Prophet (Sallallaho alaihe wasallam) went to his house to coridole with his family. He called his sons Abdullah, Aun and Muhammad (Radhiyallaho anhum), consoled them and blessed them with his prayers. All his sons were cast in the mould of their father, but Hadhrat Abdullah (Radhiyallaho acho) was so generous and large-hearted that people called him \"Qutbus Sakha\" (the chief of the generous). He embraced Islam at the hands of the Prophet (Sallallaho alaihe wasal- lam) when he was barely seven. Once on his recommenda- tion, his uncle Hadhrat Ali (Radhiyallaho anho) helped some person in his need. The person sent four thousand dirhams as a present to Hadhrat Abdullah (Radhiyallaho anho), but he returned the whole lot saying: \"We people don't sell our good deeds.\" Upon another occasion, somebody sent him two thousand dirhams as a present: and he spent all of them in charity there and then. A trader once happened to bring a large quantity of sugar for sale in the market, but as chance would have it, there was no demand for the commodity just then and this grieved him very much. Hadhrat Abdul- lah (Radhiyallaho anho) purchased the whole lot through his agent, and distributed it (free) among the people. He always acted as a host to all the strangers who were stranded in the city during the night. Hadhrat Zubair (Radhiyallaho anho), when participat- ing in his last battle, called his son Hadhrat Abdullah (Rad- hiyallaho anho) to his side and confided to him that he had a premonition that this was going to be his last fight, in which he was destiried to fall, adding that if it turned out to be so, Hadhrat Abdullah (Radhiyallaho anho) was to clear all his debts. He further admonished his son to call upon his 'Master' if he encountered any difficulty in doing so. His son, a bit puzzled, inquired as to who his Master was? \"Allah,\" replied Hadhrat Zubair (Radhiyallaho anho). The same day he met his fate. When Hadhrat Abdullah bin Zubair (Radhiyallaho anho) checked the accounts of his father, he discovered debts that amounted to no less than two million dirhams. Having the reputation of being as honest and trustworthy a person as any that ever breathed, people flocked to him for the safe deposit of their money. He invariably address them like this: \"Dear brethren, I posses no vaults for the safe-keeping of your deposits. I will treat them as loans to me, and you may take the same back when you please.\" He would then spend the money on the poor and the needy. By and by, Hadhrat Abdullah bin Zubair (Radhiyal- laho anho) cleared all the debts of his father. He says: \"Whenever I experienced any difficulty, I would pray (to Allah) '0, Master of Zubair help me,' and the diffi- culty would be removed.\" He narrates an incident with Hadhrat Abdullah bin Ja'far (Radhiyallaho anho) to whom he had gone on business. Abdullah bin Zubair (Radhiyallaho anho): \"I find from the accounts of my father that you owe him one million dirham.\" Abdullah bin Ja'far (Radhiyallaho anho): \"All right. You can have the money when you please.\" On checking the accounts once again, however, he found that it was his mistake, and in fact this much money was due to Hadhrat Abdullah bin Ja'far (Radhiyallaho anho) from his father. He therefore went to him again and said: Abdullah bin Zubair (Radhiyallaho anho): \"Excuse me. It was my mistake. In fact my father owed you that much money.\" Abdullah bin Ja'far (Radhiyallaho anho): \"If that is the case, I remit the debt.\" Abdullah bin Zubair (Radhiyallaho anho): \"No, I must pay it.\" Abdullah bin Ja'far (Radhiyallaho anho): \"All right. You may pay it at your convenience.\" Abdullah bin Zubair (Radhiyallaho anho): \"Will you accept some land in lieu thereof? (He had re- ceived some land as his share of booty. and he wanted to dispose of it.\") Abdullah bin Ja'far (Radhiyallaho anho): \"Yes, if it suits you.\" Abdullah bin Zubair (Radhiyallaho anho). says, \"I made over to him a piece of waterless land. He asked his 112 8 slave to go and spread his prayer-mat in that land. He then went and said two rakaats of Salaat, spending a long time in Sajdah. On finishing the Salaat, he pointed out a certain spot to his slave, and ordered him to dig at that particular place. After a little digging, water gushed forth from the pit.\" The qualities of the Sahabah mentioned in this Chap- ter, were part of their every-day life. In fact, these things were not considered to be anything unusual. CHAPTER VII VALOUR AND HEROISM Fear of death was unknown to the Sahabah. They were therefore most fearless and valorous. A person who can look death in the face can meet all situations. There is left for him no attraction in the wealth of this world, and no fear of an enemy. I wish I could inherit this quality from these true heroes. 1. Ibn Jahsh (Radhiyallaho anho) and Sa'd (Radhiyal- laho d o ) Pray for Each Other: On the eve'of Uhud, Abdullah bin Jahsh (Radhiyallaho anho) said to Sa'd bin Abi Waqqaas (Radhiyallaho anho): \"0. Sa'd! come, let us pray together. Let each pray to Allah for the grant of his sole desire, and the other would say Ameen to it. This way, the praye:s are more likely to be answered by Allah.\" Sa'd (Radhiyallaho anho) agreed, and they both went to a corner to pray. Sa'd (Radhiyallaho anho) was first to pray, saying: \"0, Allah, when the battle rages tomorrow, let me face a very strong and fierce enemy. Let him attack me with might and main, and let me repulse him with all my strength. Then 0, Allah, let me be triumphant by kill- ing him for your sake, and allow me to have his pos- sessions as booty.\" Abdullah (Radhiyallaho anho) said; \"Ameen .\" Then Abdullah (Radhiyallaho anno) started his prayer, saying: \"0, Allah, let me face one of the toughest fighters among the enemy tomorrow. Let him attack me with full fury and let me attack him with my full strength. Then let him have the upper hand and kill me. lie may cut my nose and ears from my body. And when I appear before You on the day of Judgement, You may ask me, 'How did you lose your nose and ears, 0, Ab- 114 115 dullah!,' to which I may reply, 'These were lost in the way of Allah and His Prophet (Sallallaho alaihe wasal- lam).' Then You will say, 'Yes! surely these were lost in My way.' \" Sa'd (Radhiyallaho anho) said: \"Ameen. In the battle field next day, both of the Sahabah saw their prayers answered exactly as they had asked. Sa'd (Radhiyallaho anho) says: \"Abdullah's prayer was better than mine. In the even- ing I noticed his ears and nose strung in a thread.\" This story on the one hand depicts great chivalry and valour on the part of Sahabah, in as much as they were anxious to face the brave and the strong amongst the enemy, and on the other hand it shows their devotion and love for Allah. Abdullah (Radhiyallaho anho) wishes Allah to confirm on the Day of Judgement that his sacrifice was really for Allah's cause. What an excellent wish! 2. Hadhrat Ali's (Radhiyallaho anho) valour in Uhud: Neglect of the Prophet's orders changed the victory at Uhud into a defeat, the details of which we have already seen in Chapter I. That was a very hard time for the Mus- lims. They were simply caught between the two groups of the enemy, and many were killed. The Prophet (Sallalaho alaihe wasallam) was surrounded by the enemy, who spread the rumour that he had died. Most of the Sahabah lost their balance of mind at this rumour, and that was the main cause of their c6nfusion. Hadhrat Ali (Radhiyallaho anho) says: \"We were surrounded by the enemy, and I could not see the Prophet (sallalaho alaihe wasallam). I first sea- rched for him among the living and then among the I dead, but I could not find him. I said to myself, 'It is impossible for him to fly from the battle-field. It seems that Allah is angry with us due to our sins, and He has lifted him up to the heavens. There is no way left for me except to jump into the enemy lines and fight till I am killed.' I therefore attacked the enemy, clearing them with my sword till I caught sight of the Prophet (Sallallaho alaihe wasallam); I was very happy and was sure that Allah had been protecting him through His . Hadhrat Hanzalah (Radhiyallaho anhoj is martyred When the battle of Uhud started, Hadhrat Hanzalah (Radhiyallaho anho) had just been wedded and therefore did not join the battle from the beginning. It is said that he had just left the bed of his wife and had hardly started taking his bath, when he heard somebody breaking the news about the defeat. He postponed the bath and, with sword in hand, rushed towards the battle-field. He jumped into the enemy concentration, fighting and penetrating till he was killed. Now the body of the person killed in the path of Allah is not washed, unless a bath has been incum- bent on him before his death. Not knowing his failure to take the bath incumbent on him, the Sahabah buried him without a wash. Just before his burial, the Prophet (Sallal- laho alaihe wasallam) said: \"I see the angels washing Hanzalah's body.\" 116 117 Hadhrat Abu Saeed Sa'di (Radhiyallaho anho) says: \"On hearing this from the Prophet (Sallallaho alaihe wasallam), I went to have a look at Hanzalah's face and I noticed drops of water trickling down his hair.\" When the Prophet (Sallallaho alaihe wasallam) returned to Madinah, he made queries and the facts of Hadhrat Hanza- lah's (Radhiyallaho anho) postponing his bath came to light. This, again, shows the valour of those people. A brave person cannot tolerate any delay and jumps into the jaws of death. Hadhrat Hanzalah (Radhiyallaho anho) also could not wait to finish the bath incumbent on him. 4. Hadhrat 'Amr bin Jamooh's (Radhiyallaho anho) desire for martyrdom. 'Amr bin Jamooh (Radhiyallaho anho) was lame. He had four sons, who often remained in the company of the Prophet (Sallallaho alaihe wasallam) and took part in the campaigns. In Uhud, Amr (Radhiyallaho anho) desired very much to join the battle. People said to him: \"You ar excusable, as you are lame. You need not go to the battle.\" He replied: \"How sad! that my sons go to Paradise, and I stay behind.\" His wife also wanted him to fight and get martyred, so that she might have the honour of being the widow of a martyr. To exhort him, she said to him: \"I do not believe that people have stopped you from going. It seems that you are yourself afraid to go to the battlefield.\" Hearing this, Hadhrat 'Amr (Radhiyallaho anho) equipped himself with arms and, facing Qiblah, prayed to Allah: \"0, Allah! Let me not come back to my family again.\" He then went to the Prophet (Sallallaho alaihe wasallam) and said: \"I had always wished for martyrdom, but my people have always been stopping me from going into the , Prophet of Allah! I cannot resist my desire any more. Do permit me to join the battle. I hope to walk in Paradise with my lame foot.\" The Prophet (Sallallaho alaihe wasallam) said to him: \"You have an excuse. There is no harm if you stay behind.\" But he still insisted, and at last the Prophet (Sallallaho alaihe wasallam) permitted him to fight. Hadhrat Abu Talha (Radhiyallaho anho) says: \"I saw 'Amr (Radhiyallaho anho) fighting. He walked proudly and said, 'By Allah! I am fond of Paradise'. One of his sons was following him at his heels. The father and the son fought till both of them were killed.\" . His wife on hearing of the death of her husband and son, came with a camel to fetch their bodies. It is said that when the bodies were loaded on the camel, it refused to stand up. When it was made to stand up after great beating, it would not go to Madinah and would turn towards Uhud, again and again. When the Prophet (Sallallaho alaihe wa- sallam) was informed of this, he said: \"The camel is charged to do that. Did 'Amr (Radhiyal- laho anho) say anything at the time of leaving his home?\" His wife informed the Prophet (Sallallaho alaihe wasallam) that he had prayed to Allah, facing Qiblah: \"0, Allah! Let me not come back to my family again.\" The Prophet (Sallallaho alaihe wasallam) said: \"This is why the camel is refusing to go toward his home.\" Look at Hadhrat 'Amr's (Radhiyallaho anho) desire to die in the path of Allah. It was their lova and devotion for Allah and His Prophet that led the Sahabah to the height of such attainment. Even after death, 'Amr (RadhiyaHaho anho) wants to remain in the battle-field, and the camel re- fused to take his body back to Madinah. 118 119 5. Hadhrat Mus'ab bin 'Umair [Radhiyallaho anho) gets martyred. Hadhrat Mus'ab bin 'Umair (Radhiyallaho anho) had been brought up with great love and affection by his well- to-do parents. Before embracing Islam, he lived in luxury and comfort. It is said that he was the most well-dressed youth of Mecca. In fact his parents would buy a dress worth two hundred dirhams for him. He embraced Islam in its early days, without the knowledge of his parents. When, however, they came to know of it, they tied him with a rope and compelled him to stay at home. He got an oppor- tunity to escape and emigrated to Abyssinia. On return from Abyssinia, he emigrated again to Madinah. So a person like him, brought up in luxury and comfort, was now living a life of abstinence and austerity. Once the Prophet (Sallallaho alaihe wasallam) was sitting when Mus'ab (Radhiyallaho anho) passed in front of him. He had only one sheet of cloth to clothe his body, and this bore a number of patches, including one of leather. The Prophet (Sallallaho alaihe wasallam) with tears in his eyes men- tioned Mus'ab's life of luxury before Islam. In the battle of Uhud, Musab (Radhiyallaho anho) held the flag of Islam. When the Muslims on meeting defeat were dispersing in confusion, he held the flag and stood at his post like a rock. An enemy came and cut his hand with a sword, so that the flag might fall and the defeat might be accomplished. He at once took the flag in the other hand. The enemy then cut the other hand also. He held the flag to his bosom with the help of his bleeding arms. The enemy at last pierced his body with an arrow. He fell dead and, with him fell the flag that he had not allowed to fall while he was alive. Another Muslim ran and took over the flag. At the time of his burial, he had only one sheet to cover his body. This sheet was too short for his size. When it was drawn to cover the head, the feet would be exposed, and when it was drawn to cover the feet, the head would become uncovered. The Prophet (Sal- lallaho alaihe wasallam) said: \"Cover his head with the sheet, and his feet with 'Azk- har'leaves.\" Such was the end of the youth who was brought up in luxury and comfort. The person who used to wear a dress worth two hundred dirhams does not have sufficient cloth to cover his dead body. Look! With what valour he tried to . Hadhrat Sa'd's (Radhiyallaho anho) epistle to Rustam. In the Iraq expedition, Hadhrat 'Umar (Radhiyallaho anho) wanted to lead the army himself. There were, on sev- eral days, deliberations separately among the common people and among the chiefs, whether Amir-ul-Mominin should lead the expedition or stay in Madinah to direct the operations and arrange reinforcements from the headquar- ters. The common people were in favour of the former, and the chiefs in favour of the latter alternative. Somebody mentioned the name of Hadhrat Sa'd bin Abi Waqqaas (Radhiyallaho anho) as a substitute for Umar (Radhiyallaho anho) to command the expedition. Both the groups agreed, and it was decided that Hadh- rat Sa'd (Radhiyallaho anho) should lead the expedition and Hadhrat Umar (Radhiyallaho anho) should stay behind in Madinah. Hadhrat Sa'd (Radhiyallaho anho) was very brave and considered to be one of the heroes of Arabia. Iraq was a part of the Persian Empire and Yazdjard was the Em- peror at that time. He sent for one of his best generals named Rustam and charged him with the task of checking the Muslim advance. Rustam tried to avoid going to the front, because of the fear of the Muslims, and requested the Emperor again and again to keep him back, saying: \"I shall make arrangements for the despatch of re- inforcements and shall be of use to your Majesty at the time of counsel.\" But the Emperor did not agree, and he had to go to the battlefield. When Hadhrat Sa'd (Radhiyallaho anho) was about to leave Madinah, Hadhrat Umar (Radhiyallaho anho) gave him the following instructions: \"0, Sa'd! Let this fact not beguile you that you are one of the trusted companions of the Prophet (Sallallaho alaihe wasallam) and that people call you his uncle. Allah does not repel evil with evil, but He repels evil with good. Allah has no relation with His creation. All 120 s men, high and low, are equal before Him, for all are His creation and He is their sole Lord. One can win His favours only through devotion to His service. Remem- ber that the Sunnat of the Prophet (Sallallaho alaihe wasallam) is the only correct way of doing things. You are going on a very heavy task. This you can discharge only by following the truth. Inculcate good habits in yourself and your companions. Choose fear of Allah as your chief asset, for this will lead you to His obedience and prevent you from His disobedience. Obedience to Allah's commarld is the lot of those alone who hate this world and love the Hereafter.\" Sa'd (Radhiyallaho anho) faced the heavy odds with full confidence in Allah. When both the armies were ready to fight, he sent an epistle to Rustam, which read: r 4, +ql de.& & &$\\ b e g G9 .& ;$ . - \"Rustam! there are people with me to whom death (in the path of Allah) is more attractive than is wine to the people in your army.\" Ask the people who are addicted to liquor, how much they love to taste it. The Sahabah loved to meet death in the Path of Allah even more. This was the chief cause of their success. 7. Hadhrat Wahb bin Qabus (Radhiyallaho anho) gets martyred. Wahb bin Qabus (Radhiyallaho anho) was a shepherd and had been a ~usl\"lm for some time. He lived in his vil- lage in the desert. He came to Madinah to see the Prophet (Sallallaho alaihe wasallam). He was accompanied by his nephew and his herd of goats, which he had tied with a rope. He learnt that the Prophet (Sallallaho alaihe wasal- lam) was in Uhud. He left his goats and went to Uhud to fight by the side of the Prophet (Sallallaho alaihe wasal- lam). A group of the enemy was at that time advancing to attack the Prophet (Sallallaho alaihe wasallam). The Prophet announced: b \"The person who disperses these people will be my companion in Paradise.\" Hadhrat Wahb (Radhiyallaho anho) attacked them fiercely and repulsed all of them. A second and third group of the 2 3 0s I enemy tried to advance, and each time it was Hadhrat .gs Wahb (Radhiyallaho anho) who fought them and put them $ g m to flight single handed. The Prophet (Sallallaho alaihe wa- sallam) gave him good tidings of Paradise. No sooner did he hear this, than he jumped into the enemy lines and fought till he was no more. Hadhrat Sa'd bin Abi Waqqaas (Radhiyallaho anho) says: \"I have never seen a person fighting so bravely and fearlessly as Wahb did. I saw the Prophet (Sallallaho alaihe wasallam) standing beside his dead body, saying, '0 Wahb! You have pleased me. May Allah be pleased with you.\" Although the Prophet (Sallallaho alaihe wasallam) himself was wounded in this battle, yet he buried Wahb's body with his own hands. Hadhrat Umar (Radhiyallaho anho) used to say: \"I never envied anybody more than Wahb (Radhiyal- laho anho). I wish I could appear before Allah with a record as good as his.\" What is it in the life of Hadhrat Wahb (Radhivallaho anho) that makes an illustrious and exalted person like Hadhrat Umar (Radhiyallaho anho) to envy him. It is the same spirit of sacrifice for the sake of Allah and His Prophet (Sallallaho alaihe wasallam) even though Hadhrat 'Umar (Radhiyallaho anho) and other Sahabah have better deeds. 8. Tragedy of Bi'r Ma'oona. In the tragedy of Bi'r Ma'oona, seventy Sahabah were massacred. All of them were Hafiz of Qur'an. Their Jama'at was called the Jama'at of Qwaa and consisted mostly of Ansaar. The Prophet (Sallallaho alaihe wasallam) loved them very much, for they engaged themselves in Zikr and recita- tion of the Qur'an during the night, and attended upon the Prophet (Sallallaho alaihe wasallam) and his family during the day. A person named Amir bin Malik and known as Abu Bara, belonging to Bani Amir clan of Najd, came to the Prophet (Sallallaho alaihe wasallam) and took this Jama'at with him for the Tabligh and the Ta'leem of his clan. The 122 ? Prophet (Sallallaho alaihe wasallam) expressed his appre- hensions, saying: \"I fear some harm may come to my Sahabah.\" But the person assured him that he was personally respon- sible for their safety. The Prophet (Sallallaho alaihe wasal- lam), after much hesitation, agreed to send the Jama'at of seventy Sahabah with him. He also gave them an epistle to 'Amir bin Tufail (the head of the clan), inviting him to Islam. These Sahabah camped at Bi'r Ma'oona. Hadhrat 'Umar bin Umayyah (Radhiyallaho anho) and Hadhrat Munzir bin 'Umar (Radhiyallaho anho) took the camels for grazing and Hadhrat Haraam (Radhiyallaho anho) with two companions went to deliver the Prophet's epistle to 'Amir bin Tufail. On reaching near his place, Hadhrat Haraam (Radhiyallaho anho) said to his companions: \"You both stay here, I shall go alone to him. If 1 am safe, you mav also come after me, but if I am betrayed you may return from here, as the loss of one is better than of three.\" 'Amir bin Tufail was the nephew of 'Amir bin Malik, who had brought the Jama'at. He was a bitter enemy of Islam and hated the Muslims to the core. When Hadhrat Haraam (Kadhiyallaho anho) delivered the Prophet's (Sallallaho alaihe wasallam) epistle to him, he did not even care to read it and attacked Hadhrat Haraam (Kadhiyallaho anho) with his spear, which pierced through the latter's body. Hadhrat Haraam (RadHiyallaho anho) uttered \"By the Lord of the Ka'bah, I have triumphed,\" and died. The heartless person had no consideration for the guarantee given by his uncle, nor for the accepted tradition all over the world, that nobody would kill the envoy. He then assembled the people of his clan and exhorted them to kill all the Saha- bah camping at Bi'r Ma'oona. The people hesitated, in view of the guarantee given by 'Amir bin Malik. He collected a large number of people from the neighbouring tribes and attacked the Muslims. They massacred each one of them, except Hadhrat Ka'b bin Zaid (Radhiyallaho anho), who had some life left in him and the enemy left him as dead. Hadhrat Munzir and Hadhrat Umar (Radhiyallaho anhuma), while grazing the camels, noticed vultures hover- ing in the air. They exclaimed. 'Something foul has hap- pened, and returned to the camp. They saw from some distance that their companions were dead and the murder- ers were standing around their bodies with bloody swords in their hands. They stopped a while to think what they might do. Hadhrat 'Umar (Radhiyallaho anho) said: \"Let us go back to Madinah and inform the Prophet (Sallallaho alaihe wasallam).\" ~ a d h r a t Munzir (Radhiyallaho anho) did not agree. He said: \"The Prophet (Sallallaho alaihe wasallam) will get the information sooner or later. I do not like to miss mar- tyrdom and run away from the place where our com- panions are lying in their peaceful sleep. Let us go forward apd meet them.\" They both went and jumped into the thick of battle. Hadh- rat Munzir (Radhiyallaho anho) was killed and Hadhrat 'Umar (Radhiyallaho anho) was captured. As 'Amir's mother had to set free a slave in connection with some vow that she had made, 'Amir set Hadhrat 'Umar (Radhiyallaho anho) free and let him go. 'Amir bin Fuhairah (Radhiyal- laho anho), a slave of Abu Bakr (Kadhiyallaho anho), was also among those who were killed at Bi'r Ma'oona. Jabbar bin Salmi, who killed him says: When I thrust my spear through him, he uttered, 'By Allah, I have triumphed and to my amazement I saw his body lifted upwards towards the sky. I made enqui- ries later on as to what was the triumph that 'Amir bin Fuhairah (Radhiyallaho anho) meant when he uttered, 'By Allah, I have triumphed.' I was told that it was that of entering into Paradise. This made me embrace Islam. These are the illustrious people, of whom Islam is rightly proud. Death had really more attraction for them than wine for their enemies. As they did deeds which were sure to win Allah's pleasure, they felt most triumphant at the time of surrendering their souls. 9. Hadhrat 'Umair (Radhiyallaho anho) gives up Eating Dates. In Badr, the Prophet (Sallallaho alaihe wasallam) was sitting in a tent. He exhorted the Sahabah to fight, saying: 124 125 \"Rise up and race one with another for a Paradise as wide as are the Heavens and the Earth, prepared for the Muttaqin.\" Hadhrat 'Umair ibnul Humaam (Radhiyallaho anho) was also listening to this. He exlaimed: \"Bakh! Bakh! (How wonderful).\" The Prophet (Sallallaho alaihe wasallam) asked Hadhrat 'Umair (Radhiyallaho anho) what he rneant by that exclama- tion. He said: \"I wish to be one of those for whom this Paradise has been prepared.\" The Prophet (Sallallaho alaihe wasallam) said: \"Rest assured, you are one of them.\" Hadhrat 'Umair (Radhiyallaho anho) then took out a few dates from his bag and began to eat. While he was eating, he suddenly said: \"To wait till the dates finish will be a very long time. I cannot do that.\" Saying this, he threw away the dates, and with sword in hand jumped into the battle-field and fought till he was killed. In fact, these people appreciated the value of Paradise, for their Yaqeen was firm. If we too get that Yaqeen in our hearts, nothing will be too difficult or too much for us. 10. Hadhrat 'Umar's IRadhiyallaho anho) Emigration to Madinah. Hadhrat Umar (Radhiyallaho anho) is well known for his valour and heroism by one and all. When the Muslims were very weak in the beginning, the Prophet (Sallallaho alaihe wasallam) prayed to Allah to strengthen the Mus- lims with Hadhrat 'Umar's (Radhiyallaho anho) Islam. This prayer was answered by Allah in no time, as we have seen in Chapter I. Hadhrat Abdullah bin Ma'sood (Radhiyallaho anho) says: \"We could not say our Salaat in the Haram till %mar had accepted Islam.\" Hadhrat Ali (Radhiyallaho anho) says: . Expedition to Moota. Of the epistles that the Prophet (Sallallaho alaihe wa- sallam) despatched to various kings, inviting them to Islam, one was sent to the King of Busra through Hadhrat Haris bin Umair Azdi. When Hadhrat Haris (Radhiyallaho anho) reached Moota, he was killed by Sharjeel Ghassani, one of the governors of Caesar. The murder of the envoy was against all laws of inter-tribal morality. The Prophet (Sallal- laho alaihe wasallam) was naturally very much upset when the news reached him. He collected an army, 3 000-strong, to advance against the enemy. While nominating Hadhrat Zaid bin Harithah (Radhiyallaho anho) to command the army, the Prophet (Sallallaho alaihe wasallam) said: \"If Zaid is killed, then Ja'far bin Abi Talib will be your Amir and if he is also martyred, then Abdullah bin Ra- wahah will take the command. If he also dies, then you can select a commander from among yourselves.\" A Jew, who was listening to this, said: \"All the three must die. This is exactly how the earlier Prophets used to prophesy.\" The Prophet (Sallallaho alaihe wasallam) gave Hadhrat I Zaid (Radhiyallaho anho) a white flag made by himself. He then accompanied the army for some distance out of Madi- nah and prayed for them saying: \"May Allah bring you back safely and triumphantly. ! May He guard you against all evils.\" At that moment, Hadhrat Abdullah bin Rawahah (Rad- hiyallaho anho), who was o poet too. recited three couplets. I i which meant: 126 \"I only wish forgiveness of my sins and a sword to cause my blood to gush out like water from a fountain. Or a spear to pierce me through my liver and my stom- ach. And when people pass my grave they say: 'May you, who have died for Allah's cause, Triumph and prosper. You are really triumphant and prosperous.\" Sharjeel received the intelligence about this army. He prepared himself to meet them with an army, 100 000- strong. When they proceeded further, they heard the rumour that the Caesar himself was coming with another army of 100 000-men to help Sharjeel. The Sahabah hesi- tated whether they should face such heavy odds or inform the Prophet (Sallallaho alaihe wasallam) for further instruc- tions. At this Hadhrat Abdullah bin Rawahah (Radhiyal- laho anho) called aloud: \"Friends! what are you bothering about? What are you here for? You are here to be martyred. We have never fought by dint of our strength in arms and numbers. We have always fought on the score of Islam, through which Allah has exalted us. You are sure of one of the two triumphs: Victory or Martyrdom.\" Thus exhorted by Hadhrat Abdullah bin Rawahah (Radhiyallaho anho), the Sahabah decided to advance till they faced the Christian army in the battle-field of Moota. Hadhrat Zaid (Radhiyallaho anho) with flag in his hand di- rected the field operations. A fierce battle raged; Sharjeel's brother was killed in action. Sharjeel himself fled from the field and took shelter in a fort. He sent a message to the Caesar, who immediately despatched for his help and an army, which was 200 000-strong. The Muslims were fight- ing against very heavy odds. Hadhrat Zaid (Radhiyallaho anho) was killed and the flag was taken over by Hadhrat Ja'far (Radhiyallaho anho). He intentionally disabled his horse to dispel any idea of returning home from the battle- field. He then recited a few couplets, which meant: \"0, people! What a beautiful place is Paradise. And how happy is its approach! How fine and how cool is its water. The Roman's doom is at hand, I must finish them all.\" With flag in one hand and sword in the other, he jumped .$i into the enemy lines. The enemy cut his right hand, which 8~ held the flag. He at once transferred it to his left. When that was cut off, he held the flag in his teeth and supported it with his bleeding arms. His body was cut into two by somebody from behind and fell dead. He was thirty-three at that time. Hadhrat Abdullah bin Umar (Radhiyallaho anho) says: \"When we removed him from the battle-field, we counted as many as ninety wounds on his body--all on the front side.\" When Hadhrat Ja'far (Radhiyallaho anho) was killed, Hadh- rat Abdullah bin Rawahah (Radhiyallaho anho) was eating a piece of meat in a corner of the battle-field. He had been hungry for three days. On hearing about Hadhrat Ja'far's (Radhiyallaho anho) death, he threw away that piece of meat, saying to himself: \"Abdullah! You are busy in eating. while Ja'far has reached Paradise.\" He took the flag and began to fight. His finger was severely injured and hung loose. He put the hanging finger under his foot and tore it off from the hand, and then rushed for- ward. Knowing the Muslims were fighting against very overwhelming odds, and his own weakness, made him pause for a moment. He at once recovered from his despair and said to himself: \"0, Heart! what makes you tarry now? Is it for the love of wife? If so, then I divorce her this very moment. Is it for the slaves? Then I set them all free. Is it for the garden? I give it over in Sadaqah. He then recited a few couplets, which meant: '0, Abdullah! You have to go down after all; whether you do it willingly or unwil- lingly. You have had enough of peace. 0, you, who are only a drop of dirty fluid! See how the disbelievers are assaulting the Muslims. Why does Paradise not entice you? Even if you are not killed in this battle, remem- ber, you have to die one day.\" He then got down from his horse. Meanwhile his cousin brought him a slice of meat, sayin \"You have had neither sleep nor food for so many days. % at thiranrftake a little rest before you fight.\" He held the slice and was about to 9 eat it when he heard an uproar of the enemy's assault from one direction. He threw away the slice and jumped into the crowd, striking with his sword till he was killed. The history of the Sahabah is full of episodes, which show that worldly pleasures were most insignificant in their eyes, and their only concern was to get success in the Hereafter. 12. The Story of Saeed bin Jubair and Hajjaj Bin Yusuf. We see the same spirit even in their successors (the Ta- bi'ees). I close this chapter with an account of Saeed bin Jubair, who is famous Tabi'ee. The Prophet (Sallallaho alaihe wasallam) has said: du #-& $& Hajjaj: \"What is your name?\" Hadhrat Saeed: \"My name is Saeed (lit. auspicious).\" Hajjaj: \"What is your father's name?\" Hadhrat Saeed: \"Jubair (lit. Trimmed).\" Hajjaj: \"No, you are in fact Shaqi (lit. wretched) son of Kusair (lit. a broken thing).\" Hadhrat Saeed: \"My mother knew my name better than you do.\" Hajjaj: \"You are wretched and your mother is also wretched.\" 0 I 0 2w\\ Hadhrat Saeed: \"The Knower of the hidden things is r! . . \"To utter truth in the face of a tyrant is the best Jihad.\" Hajjaj: - someone else\" \"Look! I am putting you to sword.\" This is a story of Jihad of that type. At that time, Hajjaj bin Yusuf, the notorious blood-shedder was in power. Hajjaj's harshness and tyranny are well known in human history. The rulers in those days, in spite of their shortcomings, never lagged behind in propagating the faith, yet we treat them as the worst among rulers because of the contrast with the just and God-fearing rulers. He was the viceroy of king Abdul Malik bin Marwan for Hijaz and Iraq. The king lived in Damascus and Hajjaj had his headquarters at Koofah. Saeed bin Jubair had fought against Hajjaj on the side of Ibnul Ash-ath. After the defeat. Saeed (Rahmatullah alaih) ran away and took asylum in Mecca. The Govern- ment posted a very stern person as the Governor of Mecca, with instructions to'arrest Saeed. The Governor assembled all the people of Mecca and read before them the order of Abdul Malik, which said: \"Any person who gives shelter to Hadhrat Saeed (Rah- matullah alaih) shall meet the same fate as Hadhrat Saeed (Rahmatullahi alaih) himself.\" He then announced to the people: \"By Allah, I must kill the person who gives shelter to Hadhrat Saeed (Rahmatullah alaih). His and his neigh- bours houses shall be razed to the ground.\" Hadhrat Saeed (Rahmatullahi alaih) was arrested with great difficulty and sent to Koofah. When he was brought before Hajjaj, the following conversation took place: Hadhrat Saeed: \"Then my mother was right in giving me this name.\" Hajjaj: \"I shall send you to Hell.\" Hadhrat Saeed: \"If I knew that you had that power. would have taken you as my god.\" Hajjaj: \"What is your belief about the Prophet (Sallallaho alaihe wasallam)?\" Hadhrat Saeed: \"He was an apostle of Mercy and a Prophet of Allah, sent'with the best Guid- ance for the whole creation.\" Hajjaj: \"What do you say about the Khalifas?\" Hadhrat Saeed: \"I am not a warder over them. Everybody is responsiLle for his own actions.\" Hajjaj: \"Who is the most exalted of the four Khali- . fahs?\" Hadhrat Saeed: \"The one who had been able to please . Allah more than the rest.\" Hajjaj: \"Which of them had 'been able to please Allah more than the rest?\" Hadhrat Saeed: \"This is known only to Him Who knows what is hidden in the bosoms and what the hearts conceal.\" I 130 Hajjaj: \"Is Ali in Paradise or in Hell?\" Hadhrat Saeed: \"I can answer only after I visit the two places and meet their dwellers.\" \"How shall I fare on the Day of Judge- Hajjaj: ment?\" Hadhrat Saeed: \"I am not fit to receive the knowledge of the unseen?\" \"You do not intend to tell me the truth.\" Hajjaj: Hadhrat Saeed: \"But I did not tell a lie either.\" \"Why do you never laugh?\" Hajjaj: Hadhrat Saeed: \"I do not see anything to laugh at; and indeed why should one laugh, who is cre- ated from dust, who has to appear on the Day of Judgement, and is always sur- rounded by tribulations. Hajjaj: \"But I do laugh.\" Hadhrat Saeed: \"Allah has created us with different tem- peraments.\" \"I am now going to kill you.\" Hajjaj: Hadhrat Saeed: \"The time and mode of my death have already been decreed.\" ~ a j j a j \"Allah has preferred me to you.\" f Hadhrat Saeed: \"Nobody can be proud of his relation with Allfh, unless he knows his position; and Allah is the only knower of the unseen.\" \"Why should I not be proud of my relation Hajjaj: with Allah, when I am with the Amir-ul- Mominin and you are with the rebels.\" Hadhrat Saeed: \"I am with the other Muslims. I myself shun mischief, but nobody can change the decree of Allah.\" \"What do y0.u say about what we collect Hajjaj: for Amir-ul-Mominin?\" Hadhrat Saeed: \"I do-not know what you collect for him.\" Hajjaj sent for gold, silver and dresses fiom the trea- sury and showed these to Saeed. sc %2 Hadhrat Saeed: \"These are useful, provided you are able to obtain with them the things that may pro- -8 4 $, vide you peace on the Day of Consterna- tion (i.e Day of Judgement), when every nursing mother will forget her nursing, and every pregnant one will be delivered of her burden, and when nothing but good will be of any avail.\" Hajjaj: \"Are our collections not good?\" Hadhrat Saeed: \"You have collected them, and you are the best judge.\" Hajjaj: \"Do you like any of these things for your- self?\" Hadhrat Saeed: \"I only like the things which Allah likes.\" Hajjaj: \"Woe to you!\" Hadhrat Saeed: \"Woe is for the person who is deprived of Paradise and is made to enter Hell.\" Hajjaj: (Annoyed): \"Say how should I kill you?\" Hadhrat Saeed: \"As you would like to be killed.\" Hajjaj: \"Should I forgive you?\" Hadhrat Saeed: \"Allah's forgiveness is real. Your aforgive- ness is of no value.\" Hajjaj: (To the executioner): \"Kill this man.\" Hadhrat, Saeed laughed while he was being taken for execution. Hajjaj was informed of this. He called him back. \"What made you laugh?\" Hadhrat Saeed: \"Your boldness with Allah, and His,clem- ency to you. \" Hajjaj: \"I am killing a person who has caused dis- sent among the Muslims. (To the ex- ecutioner) Kill him in front of me.\" Hadhrat Saeed: \"Let me say my Salaat of two rakaats.\" After finishing Salaat, he faced Qiblah and recited: 132 133 \"Verily, I have turned my face toward Him Who cre- ated the heavens and earth, as one by nature upright, and I am not of the idolaters\" (VI: 80). Hajjaj: \"Turn him from our Qiblah and let him face the Qiblah of the Christians, who also caused dissension and dispute among their community.\" His face was immediately turned to the other direction. Hadhrat Saeed: \"And wither-so-ever you turn, there is Allah's count- enance\" (11: 115). Who is knower of the hidden thoughts. \"Make him lie on his face. We are only re- Hajjaj: sponsible for appearance.\" Hadhrat Saeed (Rahmatullahi alaih) was made to lie on his face. Saeed: \"Thereof We created you, and thereunto We return you, and thqnce We bring you forth a second time.\" (XX: 55). Hajjaj: \"Kill him\" Hadhrat Saeed: I call you to witness what I recite: Ch. VII: Valour and Heroism He was then beheaded (Inna lillahi wa inna ilaihi raaj-oon). After the execution, too much blood came out from Hadhrat Saeed's (Rahmatullahi alaih) body. Hajjaj himself marvelled greatly at it. He inquired the reason from his doctors, who said:- \"His tranquillity and composure at the time of death had kept his blood in its original form. Generally, people to be executed are so much scared and afraid of death that their blood curdles and does not flow pro- fusely.\" There are many such incidents in the annals of the Taabi'een. Hadhrat Imam Abu Hanifa, Hadhrat Imam Malik, Hadhrat Imam Ahmad bin Hambal and other div- ines had to undergo trials and tribulations because of their truthfulness; but they remained steadfast in the righteous path. \"I bear witness that there is no god except Allah, who is all alone and Who has no partner and I bear witness that Muhammad (Sallallaho alaihe wasallam) is His slave and His Prophet.\" CHAPTER-VIII ZEAL FOR KNOWLEDGE The Kalimah is the essence of Islam and the basis for all achievements. No good action is acceptable with out belief in Kalimah. The Sahabah, therefore, devoted most of their energy, specially in the early days of Islam, to the propagation of the Kalimah and to fighting with the forces that resisted it. Although their engagements left them very little time to drink deep from the ocean of learning with the single-mindedness demanded thereof, yet their zeal even in this direction has left us a legacy in the form of knowledge about the Qur'an and Hadith, which is quite highly credita- ble and a glaring example. When Sahabah go) a little lei- sure from the work that kept them engtiged in the beginning of Islam, and also when the number of people in Islam grew considerably. Allah revealed the following verse in the Qur'an: \"And the believers should not all go out (in the path of Allah). Of every group of them, a party only should go forth that they (who are left behind) may gain sound knowledge in feligion and that they may warn their folk when they come to them, so that they may beware.\" (IX: 122). Hadhrat ~bdullah bin Abbas (Radhiyallaho anho) says: \"The verses of the Qur'an which were revealed in the beginning of Islam, demanding every Muslim to move out in the path of Allah; for example: \"If you go not forth, He will afflict you with a painful doom; (IX: 39)\" your wealth and your lives in the way of Allah; s m m (IX:41).' These verses were later on superceded by the foregoing verse, which advised only a party from each group to leave their places. The Sahabah, very few in number as they were, had to assume the responsibilities of Islam in all fields. Allah therefore endowed them with the versatility that was theirs. After the Sahabah, the Islam spread far and wide and the Mu~lims swelled in number. Again, the later people lacked the versatility of the Sahabah. Allah then caused different people to specialize in different branches of Islamic learning. Mohaddit.hin were to devote them- selves to the collection and propagation of Hadith. Simi- larly the Fuqaha (jurists) Soofia (Experts in Zikr), Qurraa (Experts in recitation of Qur'an), Mujahidin (Fighters in the path of Allah), etc, each own group had its own field to take up as a whole-time task. This was very necessary at that time, for otherwise different branches of Islamic learn- ing would not have developed so nicely, as it is difficult for one man to specialize in all the branches. The Prophets (alaihimus salaam), and specially Muhammad (Sallallaho alaihe wasallam) the chief among them, were specially en- dowed with such a capacity. This will explain why the stories of other eminent personalities, besides the Sahabah have also been narrated in this chapter. 1. Sahabah's Panel for Fatwa. Although all the Sahabah, along with their engagement in Jihad and propagation of faith, were devoted to acquir- ing and further spreading of knowledge, yet there was a panel of Sahabah who were exclusively entrusted with Fatwa, even during the life tirne of the Prophet (Sallallaho alaihe wasallam). The panel comprised the following Saha- bah:- Hadhrat Abu Bakr, Hadhrat 'Umar, Hadhrat Usman, Hadhrat Ali, Hadhrat Abdur Rahman bin 'Auf. Hadhrat 136 IJbayy bin Kaab, Hadhrat Abdullah bin Mas'ood, Hadhrat Ma'aaz bin Jabal, Hadhrat Ammaar bin Yaasir, Hadhrat Hu- zaifah, Hadhrat Salman Farsi, Hadhrat Zaid bin Thabit, Hadhrat Abu Musa, Hadhrat Abu Darda (Radhiyallaho anhum). To give Fatwa during the lifetime of the Prophet (Sal- lallaho alaihe wasallam) was a big privilege for these Saha- bah, and speaks of their deep and dependable knowledge. 2. Hadhrat Abu Bakr (Radhiyallaho anho) burns his col- lections: Hadhrat Aishah (Radhiyallaho anha) says: \"My father (Hadhrat Abu Bakr) (Radhiyallaho anho) had a collection of five hundred Hadiths. One night I noticed that he was very restless. He was tossing about in the bed and could not sleep. I got worried over this and inquired, 'Are you suffering from any trouble or worried about anything.' But he did not speak and re- mained restless throughout the night. Next morning he called me and said, 'Bring the collection of Hadith that I gave you to keep.' I brought the book and he set fire to it, till it was burnt. He said, 'The collection con- tained many Hadiths that I had heard from other people. I thought if I died and left behind a Hadith ac- cepted as authentic by me, but really not so, then I should have to answer for that.\" It was Hadhrat Abu Bakr's (Radhiyallaho anho) zeal for knowledge, that cau2ed him to compile a book of five hun- dred Hadiths. But it was due to his extreme cautiousness that he burnt the collection. The Sahabah were very careful and cautious about Hadith. That is why you find very few Hadiths narrated by eminent Sahabah; those people who do riot hesitate to quote Hadith (without authority) in their sermons from the pulpit should take a lesson from this story. Hadhrat Abu Bakr (Radhiyallaho anho) remained in the Prophet's com- pany for most of his time; many Sahabah say: L Hadhrat \"Abu Bakr (Radhiyallaho anho) was the most learned amongst us;\" Hadhrat 'Umar (Radhiyallaho anho) says: 4, ~r * 0 s \"After the death of the Prophet (Sallallaho alaihe wa- .K 8 5 4 Q* sallam), when the Khalifah's selection was under con- sideration, Hadhrat Abu Bakr (Radhiyallaho anho) * addressed the people quoting all those verses of the Qur'an and all such Hadiths of the Prophet (Sallallaho alaihe wasallam) which dealt with the virtues and privileges of the Ansar.\" This shows how much knowledge of the Qu'ran he had, and how many Hadiths he remembered. In spite of all this, there are very few Ahadith that have been narrated by Hadhrat Abu Bakr (Radhiyallaho anho). For similar reasons, Imam Abu Hanifah (Rahmatullah alaih) too was not so liberal in reporting Hadith. 3. Hadhrat Mu'sab bin Umair (Radhiyallaho anho) Car- ries out Tabligh. A story about Hadhrat Mus'ab bin Umair (Radhiyal- laho anho) has already been given in Chapter VII. When the first group of people from Madinah embraced Islam in Mina, the Prophet (Sallallaho alaihe wasallam) deputed Hadhrat Mus'ab bin Umair (Radhiyallaho anho) to go with them to teach Islam and preach to others. He remained busy all the time in teaching the Qur'an and other Islamic practices to the people. He stayed with Hadhrat As'ad bin Zararah (Radhiyallaho anho) and was known as 'Muqree' (the teacher). Sa'd bin Ma'az and Usaid bin Hudhairiyah, who were among the chiefs of Madinah, did not like Mus'ab's activi- ties. Sa'd said to Usaid: You go to As'ad and tell that we do not like his having brought a stranger with him to Madinah, who misleads the poor and simple folk of the town.\" Usaid went to Hadhrat As'ad (Radhiyallaho anho) and talked to him very harshly. Hadhrat As'ad (Radhiyallaho anho) said to him: \"You first listen to him; if you like his teachings, you may accept them; if not, you have every right to de- nounce and stop him.\" Usaid agreed to it. Hadhrat Mus'ab (Radhiyallaho anho) ex- plained the virtues of Islam and recited a few verses of the Qur'an before him. Usaid said: 138 139 \"These teachings are very fine and these verses are simply beautiful. How do you admit a person to your faith?\" He said: \"You take a bath, put on clean clothes and recite the Kalimah.\" Usaid immediately complied with all these formalities and embraced Islam. He then went to Sa'd and brought him to Mus'ab (Radhiyallaho anho) to listen to his Tabligh. Sa'd also embraced Islam. No sooner had Sa'd accepted Islam than he went to people of his clan (Banu Ash-hal) and said to them: \"What type of person do you think I am?\" They replied: \"You are the best and the noblest of clan.\" the He then said: \"I have vowed not to talk to your men and women until you all embrace Islam and be- lieve in Muhammad (Sallallaho alaihe was- sallam).\" All the men and women of Banu Ash-ha1 embraced Islam then and there. Hadhrat Mus'ab (Radhiyallaho anho) began to teach them and train them in Islam. No sooner did anybody embrace Islam than he began to preach it. Everyone of them considered it incumbent upon him to preach and teach to others what he know about Islam. His trade, farm or occupation was no barrier to Tabligh. 4. Hadhrat 'Ubayy bin Ka'ab (Radhiyallaho anho) Teaches Hadith. Hadhrat Ubayy bin Ka'ab (Radhiyallaho anho) is one of the most eminent Sahabah and was an expert in the reci- tation of the Qur'an. Very few Arabs were literate before Islam, and he was one of these. The Prophet (Sallallaho alaihe wasallam) used to dictate the revealed Qur'an to , Prophet of Allah! Did Allah mention me by my name?\" The Prophet (Sallallaho alaihe wasallam) replied: \"Yes, He mentioned you by your name.\" Tears began to roll down his cheeks with excessive joy. Hadhrat Jundub bin Abdullah (Radhiyallaho anho) says: \"When I went to Madinah to acquire knowledge, I found that people were sitting in groups, and each group wag entrusted to a teacher. In one of the groups I saw a person teaching Hadith, clad in two sheets of cloth and looking like a traveller. I asked the people, 'Who is this person?' They said, 'He is our esteemed Imam, Hadhrat Ubayy bin Ka'ab (Radhiyallaho anho).' When he finished teaching, I followed him to his house. He was staying in a very old and dilapidated building, with little or no furniture. I noticed Hadhrat Ubayy (Radhiyallaho anho) living in a very simple and ascetic life.' Hadhrat Ubayy (Radhiyallaho anho) says: \"Once the Prohet (Sallallaho alaihe wasallam) tested me in my knowledge of the Qur'an. He asked me, 'Ubayy, which is the most august verse of the Qur'an?' I said, 'Allah and His Prophet (Sallallaho alaihe wasal- lam) know best.' He again asked my the same question and I gave the same modest and respectful reply. When he put the same question once again, I replied, 'The most august verse in the Qur'an is Ayatul Kursi (11: 255).' My reply made him very happy. He said, 'May - Allah bless you through your knowledge.' him. He memorised the Qur'an during the life time of the Once the Prophet (Sallallaho alaihe wasallam) was leading Prophet (Sallallaho alaihe wasallam) and had thorough . Salaat when he missed one verse. Ubayy (Radhiyallaho understanding of it. The Prophet (Sallallaho alaihe wasal- anho) pointed out the correction from behind. On finishing lam) is reported to have said: Salaat, the Prophet (Sallallaho alaihe wasallam) inquired \"Hadhrat Ubayy bin Ka'ab (Radhiyallaho anho) is the 'Who corrected me?' He was told that it was Hadhrat Ubayy greatest Qari of my Ummat.\" 141 140 F (Radhiyallaho anho). He remarked, 'I also thought that it was he.\" In spite of his devotion to knowledge and his special job of writing the Qur'an, he took part in all the battles by the side of the Prophet (Sallallaho alaihe wasallam). He did not miss a single campaign or expedition led by the Prophet (Sallallaho alaihe wasallam). 5. Hadhrat Huzaifah's (Radhiyallaho anho) Anxiety Re- garding Tribulations. Hadhrat Huzaifah (Radhiyallaho anho) is one of the well-known Sahabah. He is known as 'Keeper of Secrets.' The Prophet (Sallalaho alaihe wasallam) had confided to him the names of Munafiqin, and had informed him in 1 chronological order all the tribulations which the Muslims were to face till the last day. He gave him full details (viz. the name of the mischief maker, his parents' names, his community, etc.) about the incidents that were going to affect three hundred or more people. Hadhrat Huzaifah (Radhiyallaho anho) says: \"Other people used to -ask the Prophet (Sallallaho alaihe wasallam) about good things, while I always asked him about the adverse events, so that I might guard against them.\" He then narrated the following conversation with the Prophet: Huzaifah: \"0, Prophet of Allah! Shall we revert to evil, after the good that you have brought us?\" The Prophet: \"Yes. The evil is coming.\" Huzaifah: \"Shall we have good again after that evil?\" TheProphet: \"Huzaiiah! Go and read the Qur'an, medi- tate on its meaning and follow its com- mandments.\" But Huzaifah anxiety grew more and more, and he con- tinued his queries about evils that were to befall the ,Mus- lims. Huzaifah: \"0, Prophet of Allah! Tell me if good will come after that evil?\" do not know whether, at this time of my departure from this world. Allah is pleased with me or not .\" He then prayed: \"0, Allah, these are the last moments of 143 my life. You know that I have always loved Thee. Bless my meeting with Thee.\" 6. Hadhrat Abu Hurairah's (Radhiyallaho anho) Memory for Hadith. Hadhrat Abu Hurairah (Radhiyallaho anho) is another eminent Sahabi. No other person has narrated as many Ahadith as he has done. He embraced Islam in 7 A.H. and, as the Prophet (Sallallaho alaihe wasallam) died in 11 A.H., he had been with him for four years only. People used to marvel how he could remember so many Ahadith in such a short period. He explains this himself, saying: \"People wonder how I narrate so many Ahadith. The fact is that my Muhajir brothers remained busy in trade and my Ansar brothers did their farming, while I was always with the Prophet (Sallallaho alaihe wasallam). I was among the people of Suffah. I never cared to earn my living; I was contented with the little food that the Prophet (Sallallaho alaihe wasallam) could give me. I would be with the Prop-het (Sallallaho alaihe wasal- lam) at times when no one else was there. I once com- plained to the Prophet (Sallallaho alaihe wasallam) about my poor memory. He said, 'Spread your shawl!' I did so. He made some signs on the shawl with his own hands and said, 'Now wrap this shawl around you.' I wrapped it around my breast. Since then, i never have forgotten anything that I have wished to remember.\" The people of Suftah were residents in the Prophet's mosque. They had no regular source of income. They were the guests of the Prophet (Sallallaho alaihe wasallam), who transferred to them the Sadaqah and shared with them the gifts that he received. Abu Hurairah (Radhiyallaho anho) was one of them. He would, sometimes, go without food for days together and sometimes would behave like a lunatic, due to 5p-.cessive hunger, as we have already seen in Chap- ter I1I:Iri spite of such difficulties, he was all the time occu- pied in memorising the sayings of the Prophet. This enabled him to narrate such a large number of Ahadith Imaam Ibn Jauzi (Rahmatullahi alaih) has attribu- ted as many as 5 374 Ahadith to him. Once he narrated the following Hadith:- \"A person participating in a funeral gets one Qeeraat of reward if he returns after the funeral service, but gets two Qeeraats of reward if he remains there till the burial is over, and one Qeeraat is weightier than mount Uhud.\" Hadhrat Abdullah bin 'Umar (Radhiyallaho anho) heard this and doubted authenticity of the Hadith, saying: \"0. Abu Hurairah! Think before you speak.\" Hadhrat Abu Hurairah (Radhiyallaho anho) got upset over this and took Hadhrat Abdullah bin Umar (Radhiyallaho anho) to Hadhrat 'Aishah (Radhiyallaho anha), and said to her: \"0, Ummul-Mo'minin, I request you to say by Allah if you have beard from the Prophet (Sallallaho alaihe wa- sallam) the Hadith regarding Qeeraats of reward?\" She said: \"Yes. I have heard this Hadith.\" Hadhrat Abu Hurairah (Radhiyallaho anho) then said to Hadhrat Abdullah bin Umar (Radhiyallaho anho): \"During the Prophet's time, I had no tree to plant in the orchard and no merchandise to sell in the market. I was always with the Prophet. My only job was to mem- orise what the Prophet said, and to eat only what he gave me.\" Hadhrat Abdullah bin Umar (Radhiyal.lQho anho) said: \"No doubt. Of us all, you were the most constant in at- tendance to him and therefore most informed about ths Prophet (Sallallaho alaihe wasallam).\" With all these achievements, Hadhrat Abu Hurairah (Radhiyallaho anho) says: \"I recite Istighfar 12000 time daily.\" He had a piece of thread with 1000 knots. He would not go to sleep until he had said Subhanallah on all of these knots. 7. Death of Musailamah and Compilation of QW'&. Musailamah was an imposter who called himself a Rrophet, even during the life time of the Prophet (Sallal- 144 10 & laho alaihe wasallam). After the death of the Prophet (Sal- lallaho alaihe wasallam), people of the weak faith, especially among wandering Arabs, began to desert Islam and become renegades. Musailamah took advantage of the situation and succeeded in causing a large number of people to fall a prey to his seduction. Abu Bakr (Radhiyal- laho anho) decided to put a stop to this onslaught on Islam. A fierce battle was fought with him, in which the Muslims triumphed with the help of Allah, and Musailamah was killed. A good number of Sahabah, including many Huffaz, however, lost their lives. After this battle, Hadhrat Umar (Radhiyallaho anho) went to Hadhrat Abu Bakr (Radhiyal- laho anho) and said: \"Many Huffaz gave been slain in this battle. I am afraid we are likely to lose a good portion of the Qur'an if we fight a few more battles and suffer loss of Hufaaz at this rate. I, therefore, suggest that the Qur'an may be compiled and preserved in the form of one complete book.\" Hadhrat Abu Bakr (Radhiyallaho anho) remarked: \"How can I venture on a thing that was not done in the life of the Prophet (Sall'alkaho alaihe wasallam)?\" But Hadhrat Umar (Radhiyallaho anho) pressed his point so much that Hadhrat Abu Bakr (Radhiyallaho anho) agreed to it. He sent for Hadhrat Zaid bin Thabit (Radhiyal- laho anho) and informed him of what had passed between him and Umar (Radhiyallaho anho), and then said: t \"You are young and intelligent. Everybody considers you trustworthy. Moreover you were charged by the Prophet (Sallallaho alaihe wasallam) with the writing of the Qur'an during his life time. I, therefore, request you to go to the people and collect the Qur'an from them and compile it in the form of a book.\" Hadhrat Zaid (Radhiyallaho anho) says: \"By Allah, if Abu Bakr (Radhiyallaho anbo) had asked me to shift a mountain from one place to another, it would not have been so hard for me as the compilation of the Qur'an. I said, 'How do you both dare to take up a thing which was not done by the Prophet (Sallallaho k = o* alaihe wasallam)?\" They explained to me their point. .g 3 till Allah made the truth dawn on me, and I also was s, convinced of the importance of the task. I then started going to the people and collecting the Qur'an from those who had written it and from those who had learnt it by heart, till the final collection was ready.\" Look at the spirit of the Sahabah as regards their strictly following the Prophet (Sallallaho alaihe wasallam). Shifting of a mountain from its position was not so difficult for them as doing a thing that they had not seen the Prophet (Sallallaho alaihe wasallam) doing. Allah gave them the honour of doing the greatest service to Islam by compiling the Qur'an, which is the source-book of Islam. Hadhrat Zaid (Radhiyallaho anho) was so particular and cautious that he would accept the fragments only when these were proved to be written during the Prophet's time and after they were duly oorroborated -by the recitation of those who had preserved the Qur'an in their hearts. No doubt, he had to go from door to door and person to person, but Allah caused, thanks to his labours, every word revealed by Him to be collected and compiled. He was con- stantly assisted by Hadhrat Ubayy bin Ka'ab (Radhiyallaho anho), whom the Prophet (Sallallaho alaihe wasallam) had declared a great expert in Qur'anic knowledge. The Mus- lims of all times are highly indebted to the Sahabah for their marvellous achievement. 8. Hadhrat Ibn Mas'ood's (Radhiyallaho anho) Cautious- ness About Hadith: Hadhrat Abdullah bin Mas'ood (Radhiyallaho anho) is one of those eminent Sahabah who were entrusted with the task of issuing Fatwa, even during the Prophet's (Sallallaho alaihe wasallam) time. He had been in the fold of Islain since its advent and was one of the emigrants to Abyssinia. He accompanied the Prophet (Sallallaho alaihe wasallam) in all his campaigns and worked as his attendant. He car- ried the shoes of the Prophet (Sallallaho alaihe wasallam), provided him with a pillow when he needed one, and brought him water for his Wudhu. He was therefore cailed \"The Keeper of the shoes\", \"The Keeper of Pillow\" and \"The Manager for Wudhu\". The Prophet (Sallallaho alaihe wasallam) once said: \"Abdullah bin Mas'ood (Radhiyallaho anho) is the 146 147 only person whom I can safely appoint as an Amir without consulting anybody.\" He was permitted by the Prophet (Sallallaho alaihe wasal- lam) to visit him at all times. The Prophet (Sallallaho alaihe wasallam) is reported to have said: (1) \"If you want to recite the Qur'an as it was revealed to me, then copy the recitation of Abdullah bin Mas'ood.\" (2) \"Believe in what Abdullah bin Mas'ood (Radhiyal- iaho anho) narrates about me.\" Hadhrat Abu Moosa Ash'ari (Radhiyallaho anho) says: \"Abdullah bin Masood (Radhiyallaho anho) and his mother visited the Prophet's (Sallallaho alaihe wasal- lam) house so often and were so at home there that the people of Yemen, who had come to see the Prophet (Sallallaho alaihe wasallam), took him as one of the Ahlul Bait (family member.)\" Though he was so near to the Prophet (Sallallaho alaihe wasallam), yet he was very cautious about narrating the words of the Prophet (Sallallaho alaihe wasallam). Hadhrat Abu 'Amir Shai- bani (Radhiyallaho anho) says: \"I stayed with Abdullah bin Mas'ood (Radhiyallaho anho) for one year. I never heard him attributing any words direct to the Prophet (Sallallaho alaihe wasal- lam). Whenever he intended doing so, he would shiver with fear.\" Hadhrat 'Amr bin Idairnoon (Radhiyallaho anho) says: \"I have been visiting Abdullah bin Mas'ood (Radhiyal- laho anho) every Thursday for one year: I never heard him attributing any words direct to the Prophet (Sallal- laho alaihe wasallam). Once he was narrrating Hadith. When he uttered the words 'The Prophet (Sallallaho alaihe wasallam) said so,' then his body began to shiver, his eyes became full of tears, his forehead sweated, his veins swelled and he said 'Insha-Allah' the Prophet said so, or something like that, it might be something less or something more.\" Look at the Sahabah's caution and care about Hadith. The Prophet (Sallallaho alaihe waaallam) said: . A Person Travels from Madinah to Damascus For One Hadith. Kathir bin Qais narrates: \"I was sitting with Hadhrat Abu Darda (Radhiyallaho anho) in a musjid in Damascus, when a person came to him and said, '0, Hadhrat Abu Darda (Radhiyallaho anho), I have come all the way from Madinah to learn one Hadith from you, as I understand you have heard it directly from the Prophet (Sallallaho alaihe wasal- lam). \" Hadhrat Abu Darda (Radhiyallaho anho): \"Have you any other business in Damascus?\" The person: \"No.\" Hadhrat Abu Darda (Radhiyallaho anho): \"Are you sure that you have no other work in Damas- cus?\" The person: \"I have come to this place with the sole purpose of learning this Hadith,\" Hadhrat Abu Darda (Radhiyallaho anho): \"Listen. I have heard the Prophet (Sallallaho aliahe wasallam) saying, 'Allah eases the way to Paradise for 148 149 one who traverses some distance to seek knowledge. The angels spread their wings under his feet, and all things in heavens and earth (even the fish in the water) pray for his forgiveness. The superiority of a person possessing knowledge over a person doing worship is as the superiority of the moon over the stars. The Ulama are the inheritors of the Prophet (Sallallaho alaihe wassallam). The legacy of Prophets (Alaihimus- salaam) is neither gold nor silver. Their legacy is knowledge. A person who acquires knowledge ac- quires a great wealth.\" Hadhrat Abu-Darda (Radhiyallaho anho) is foremost among the Sahabah who possessed very sound knowledge in religion. He is called 'Hakim-ul-Ummah' (The Sage of Islam). He once said: \"Before Islam, I lived on trade. After accepting Islam, I tried to combine the service of Allah with my business, but I could not do so. I therefore gave up business and devoted myself solely to the service of Allah. Now if I have a shop at the gate of a musjid and have no fear of losing a single Salaat thereby, and even if the shop gives me a daily profit of 40 dinars to spend the whole lot in the path of Allah, even then I am not willing to turn to business.\" Somebody inquired the reason. He replied:- \"Because of the fear of reckoning.\" He used to say: \"I love death, so that I may meet Allah. I love destitutioq, so that I be meek. I love sickness, so that I be pardoned my sins.\" In this story, we find a person travelling all the way from Madinah to Damascus for the sake of one Hadith. This was not at all hard for those people. Hadhrat Sha'abi (Kah- matullahi alaih) is a famous Muhaddith of Koofa. He once narrated a Hadith to one of his students and said: \"You are listening to this Hadith while sitting in your home town. People had to travel all their way to Madi- nah for even less important things, because Madinah was the only of seat learning in those days.\" , Saeed ibnul Musayyab (Rahmatullahi alaihf is a famous Tabi'ee. He says: A.H. He started learning Hadith in 205 A.H. i.e., when he was only eleven. He had memorised all the books writ- ten by Abdullah bin Mubarak (Rahmatullahi alaih) while he was in his early teens. After collecting Ahadith from all the learned men of his own locality, he set out in 216 A.H. in search of further knowledge. His father died and he could not leave his widowed mother alone. He therefore took her with him on his long and strenuous journey to Balkh, Baghdad, Mecca, Basra, Koofah, Asqalan, Hims and Damascus. He collected all the available Ahadith from these seats of learning. He was accepted as an expert in Hadith, while he had not a single hair on his chin. He writes: I was eighteen when I compiled the Fatwah of the Sa- habah and Tabi'ees.\" Hashad (Rahmatullahi alaihe) and one of his companions say:- \"Bukhari and we two used to go together to the same teacher. We noted down all the Ahadith that we learnt, but he wrote nothing. After many days we said to him, 'Bukhari, you are wasting your time.' He kept quiet. When we admonished him again and again, he said, 'You are now annoying me too much. Bring your notes.' We brought our notes, which covered about 15,000 Ahadith. He, to our utter amazement, recited all those Ahadith by heart.\" 10. Hadhrat Ibn Abbas's (Radhiyallaho anho) Thirst For Knowledge. Hadhrat AbdulIah bin Abbas (~adhiyallaho anho) says: \"After the passing away of the Prophet (Sallallaho alaihe wasallam), I said to an Ansari friend of mine. The Prophet (Sallallaho alaihe wasallam) is not now with us. But a large number of Sahabah are still among us. Let us go to them and get knowledge of the Islamic practices\". He said. 'Who is going to approach you for learning a regulation in the presence of these eminent Sahabah?' I was not discouraged. I kept up my quest for knowledge and approached every person who was 150 supposed to have heard something from the Prophet (Sallallaho alaihe wasallam). I managed to gather sub- stantial information from the Ansar. If on my visit to someone of the Sahabah, Ifound him asleep, I spread my shawl at the gate and sat waiting. Sometimes my face and body would get covered with dust, but I kept sitting till they woke and I was able to contact them. Some of them said: 'Abdullah you are the cousin of the Prophet (Sallallaho alaihe wasallam); you could have sent for us. Why did you take the trouble of coming to our places?' I said to them: 'I must come to you, for I am a student and you are my teachers.' Some people for whom I had waited said: 'Since when have you been waiting for us?' I informed them that I had been sitting there for a pretty long time. They said: 'What a pity! You could have awakened us from our sleep.' I said:\"I did not like to disturb you for my own sake.' I thus carried on my pursuits, till there came a time when people began to flock to me for learning. My Ansari friend realised this at that time and remarked. 'This boy has surely proved himself more sensible than us.\" It was \\this devotion to knowledge, which caused Hadhrat Abdullah bin Abbas (Radhiyallaho anho) to be known as ~ i b r - u l - ~ m m a t (the most learned man of Islam) and Bahrul Ulum (ocean of knowledge) in his time. At the time of his death, he was in Taif. Hadhrat Muhammad bin Ali (Radhiyallaho anho) led the funeral service and said: \"Today we have lost our godly leader.\" Hadhrat Abdullah bih Umar (Radhiyallaho anho) says: \"Abdullah~bin Abbas (Radhiyallaho anho) is noted for his knowledge of the occasions when various verses of the Qur'an were revealed.\" According to Hadhrat Umar (Radhiyallaho anho) Hadhrat Ibne Abbas (Radhiyallaho anho) is one of the most eminent Ulama of Islam. This is all due to his hard labour in acquir- ing knowledge. Had he considered himself a member of the Prophet's family (Sallallaho alaihe wasallam), and as such 4 demanded respect from the people instead of going to them for knowledge, he could not have attained this position. The Prophet (Sallallaho alaihe wasallam) has said: ~ h . 151 VIII: Zeal for Knowledge \"Be most humble and respectful to persons from whom you receive knowledge.\" Mujahid says: \"A proud or shy student cannot gain much.\" Hadhrat Ali (Radhiyallaho anho) says: \"I am a slave to the person who has taught me even a single word. He may sell me or set me free.\" Hadhrat Yahya bin Kathir (Rahmalullahi alaih) says: \"Knowledge and easy living cannot go hand in hand.\" Hadhrat Imam Shaf'i (Rahmatullah aiaih) says: \"A student who learns half-heartedly and ungratefully can never succeed. A student who is humble and hard- living often reaches his goal.\" Mughirah says: \"We feared our teachor Hadhrat Ibrahim (Rahmatullah alaih) more than even the kings of our times.\" Hadhrat Bukhari (Rahmatullah alaih) writes about Yahya bin Ma'een, the famous Mohaddith: \"I have never seen a person more respectful to the Muhad- dithin than Yahya.\" Imam Abu Yusuf (Rahmatullah alaih) says: \"I have heard from eminent people that a student who does not respect his teacher is never successful.\" This story shows that Hadhrat Abdullah bin Abbas (Radhiyallaho anho) was very humble and respectful to those from whom he learnt Islam. It also shows his devo- tion to knowledge. He did not mind any amount of labour or inconvenience in going to persons who had some knowl- edge of Hadith. In fact, nothing can be achieved without in- convenience. As the Arabic proverb goes \"A person who wishes to excel1 others must burn the midnight oil.\" It is said about Hadhrat Harith bin Yazid, Hadhrat Ibn Shu- brumah, Hadhrat Qa'qaa, and Hadhrat Mughirah (Rahma- 152 tullahi alaihim) that they held discussions over religious matters among themselves after Isha and would not dis- perse before Azaan of Fajr. Hadhrat Laith bin Sa'eed (Rah- matullah alaih) says: \"Imam Zilhri (Rahmatullah alaih) sat after Isha with Wudhu and continued his discussion on Hadith till it was Fajr.\" Darawardi says: \"I saw Imam Abu Hanifa and Imam Malik in the Prophet's musjid after Isha, discussing some religious point very calmly and without offending each other. They dispersed only after performing Fajr Salaat.\" Ibn Furat Baghdadi (Rahmatullah a1aih)-a Milhaddith, left on his death, eighteen boxes full of books. Most of these books were written in his own hand. He is famous among Muhaddithin for his authentic and systematic record. Ibn Jauzi (Rahmatullah alaih) is another famous Mu- haddith. He was brought up as an orphan, as he lost his father when he was only three. He was so studious that he would not leave his house except for Jum'uah prayer. He once declared from the pulpit, pointing to his fingers: \"With these fingers I have written or copied no less than two thousand books.\" He was himself the author of more than two hundred and fifty books. It is said that he never remained idle. He used to write four parts of a book daily. His lessorls were so pop- ular that as many as 400000 students at a time listened to him. The kings, their ministers and chiefs would also attend his lectures. He himself says: \"As many as 100000 disciples have pledged devotion to me, and not less than 20000 disbelievers have ac- cepted Islam at my hands.\" He also had to suffer much at the hands of Shiahs, who were in power those days. While mending his reed pen, he preserved the chips, and at the time of his death expressed I the desire that those chips be used for warming the water 1 for washing his dead body. It is said that not only the pre- served stock was sufficient for warming water, but a part was still left unused. 8 , \"0s Yahya bin Ma'een (Rahmatullah alaih) is a famous shaikh -8 4 of Ahadith. He says: w SW \"I have written one million Ahadith with my own hand\". Ibn Jarir Tabari (Rahmatullah alaih) is a historian of great fame. He is an authority on the history of the Sahabah and Tabien. For forty years, he wrote 80 pages daily. After his death, his output in written work (since his maturity) was calculated to come to 28 pages daily. The book on history written by him which is generally available is very famous and popular. When he planned to write this book, he said to the people round him: \"You will be pleased to learn that intend writing a book on world history. They inquired- \"How big will that book be?\" He said: \"About 30 000 leaves.\" They remarked: \"Who will live to finish this book?\" He said: \"Inna lillahi wa inna ilaihi raaji-oon. People have become so unaspiring.\" He then decided to condense the material, which still cov- ered 6 000 pages. The same story is reported about his book on the meaning and commentary of the Qu'ran. This is also a very famous and popular book. Daaraqutni (Rahmatullah alaih) is a famous writer on Hadith. He travelled to Baghdad, Basrah, Koofah, Wasit, Egypt and Syria for learning Hadith. Once he was attending the class of his teacher. During the teacher's lecture he was once seen copying from a certain book. One of the fellow students admonished him saying: \"How can you listen to the Shaikh while doing that work?\" IIe said: \"There is a difference in my listening and yours. Tell me how many Hadiths has the Shaikh recited so far?\" The student began to think. Daaraqutni (Rahmatullah alaih) said: \"Now let me tell you. The Shaikh has so far recited eighteen Hadiths and these are . . .\" I 154 - He then repeated all the eighteen Ahadiths that the Shaikh had recited in the same order, quoting the chain of narra- tion in each case. Hafiz Athram (Rahmatullah alaih) is a Muhaddith. He had a wonderful capacity for memorising Ahadith. Once he was in Mecca for Hajj. Two reputed Shaikhs from Khurasan were holding their lectures on Hadith in the Haram separa- tely, and a large number of people were listening to each Shaikh. He sat between the two groups and noted down the lectures of both the Shaikhs at one and the same time. Abdullah bin Mubarak (Rahmatullah alaih) is a Mo- haddith of great fame. His labours and efforts in collecting Hadiths are known to everybody. He says: \"I have learnt Hadith from four thousand teachers.\" Ali bin Hasan (Rahmatullah alaih) says: ':It was a very cold night when I and Ibn Mubarak step- ped out from the musjid after lsha. We continued dis- cussion on a Hadith while standing there, till we heard the Azaan for Fajr.\" Humaidi (Rahmatullah alaih) is a Muhaddith, who has combined Bukhari and Muslim in one compilation. It is said that he wrote throughout the night. When it was very hot, he would write while sitting in a tub of water. He also wrote poetry. The following verses have been written by him:- Mixing with people does not benefit Beyond waste of time in gossip; Don't go to the people, except For acquiring knowledge and piety Imam Tabrani (Rahmatullah alaih) is a reputed Muhad- L dith and author of numerous books. Somebody inquired: , \"How could you write so many books, Shaikh?\" He replied: \"I have been on my mat for thirty years.\" 4.r 0 % E a Abul Abbas Shirazi (Rahmatullah alaih) says: -c C, srij \"I have learnt 300000 Ahadith from Tabrani.\" m Imam Abu Hanifa (Rahmatullah alaih) laboured very hard in going deep into those Ahadiths which contradicted some others. Koofah was the centre of Islamic learning in those days. He had collected Hadith from all the Muhaddi- thin of that place. Whenever a Muhaddith from outside came to Koofah, he sent his students to him to ascertain if he knew any such Hadith that was not known to him. The Imam had established a circle where scholars of Hadith, Fiqah, and Philology gathered together. They had dis- cussions on regulations about Islamic practices. Sometimes the discussions continued for one month before a point was agreed upon, and written in the book of regulations for the people of his school of thought. Imam Tirmizi (Rahmatullah alaih) is known to one and all. He was unique in his capacity for memorising and re- taining Ahadith. His memory was marvellous. Some Mu- haddithin once tested his memory. They recited before him forty-one Hadiths. Imam Tirmizi (Kadmatullah alaih) im- mediately repeated all of them. He himself writes: \"On my way to Mecca, I copied two parts from the col- lections of Hadith by a Shaikh. I happened to come across that Shaikh personally. I said to him, 'I have copied two parts of your collections. I wish to compare those Hadiths by listening to them directly from you.' The Shaikh agreed. While going to his place I, by rnis.% take, took a blank book instead of the note book in which I had copied the Hadiths. The Shaikh started re- citing the Hadiths, while I held the blank book in my hand. When he noticed it, he was very angry with me. I explained to him how that had happened, and said, 'Shaikh, your time is not wasted. I remember every- thing that you have said.' He did not believe me and asked me to repeat all that he had recited. I repeated all the Ahadith. He thought I had memorised them before I came to him. I said, 'You may recite some other Hadiths.' He recited forty new Hadiths. I re- peated all of them without any error.\" It is very difficult to work and labour as hard as these Muhaddithin did in collecting, memorising and propagat- ing Hadith. It is difficult even to cover all such stories. Qar- 156 6 ramah (Rahmatullah alaih) is a Muhaddith who is not very famous. One of his students, Daud, says: \"People speak about the memory of Abu Hatim (Rah- matullah alaih). I have never seen a person with better memory than Qartamah. Once he said to me, \"Pick any of the books from my library. I shall recite it from my memory.\" I picked up 'Kitabul-Ashribah.' He recited the whole book in the reverse order i.e.. reading from the end to the beginning of each chapter.\" Abu Zur'ah (Rahmatullahi alaih) says: \"Imam Ahmad bin Hambal (Rahmatullah alaih) re- membered one million Ahadith by heart. I have col- lected 100 000 Ahadith and I know 30 000 of them by heart.\" Khafaf (Rahmatullah alaih) says: \"Ishaq (Rahmatulla alaih) once dictated to us 11000 Ahadith from his memory. He then repeated all of them in the same order, with no error at all.\" Abu Sa'd Isbahani, (Rahmatullah alaih) when he was only sixteen, left from Baghdad to learn Hadith from Abu Nasr (Rahmatullah alaih). He heard about his death on the way. He cried bitterly like a child, and would say: \"How shall I know the chain of narrators of his Ha- diths?\" Such crying is not possible without love and devotion. He knew the 'Muslim' collection of Ahadith by heart and taught the book to histpuplis from memory. Abu Umar Dharir (Rahmatullah alaih) was blind by birth, but is counted among the Huffaaz of Hadith. He was an expert in History, Fiqah, L,aw of inheritance and math- ematics. Abul Husain Isfahani (Rahmatullah alaih) remembered the Bukhari and Muslim compilations both by heart. Buk- hari was so deeply fixed in his memory that he would give the chain of narrators for any text or vice versa. Shaikh Taqi-ud-Din Ba'albakki (Rahmatullah alaih) memorised the 'Muslim' in four months. He was also Hafiz of Hadith common in Muslim's and Bukhari's compila- tions. He was a saint, and many miracles are attributed to him. He had also memorised the Qur'an. It is said that Soorah Al-An'aam was memorised by him in one day. Ibnus-Sunni (Rahmatullah alaih) is a famous pupil of Imam Nasai (Kahmatullah alaih). He was writing Hadith even upto the last moments of his life. His son says: \"My father was writing Hadith when he put aside the pen, raised his hands in prayer and breathed his last.\" Allamah Saaji (Kahmatullah alaih) mastered Fiqah in his teens. Then he began to acquire knowledge about Iiadith. Ile stayed in Herat for ten years and wrote the whole of 'Tirmizi' six times during that stay. His teacher Ibn Mandah (Rahmatullah alaih) died while teaching him 'Gharaib Sho'bah' after Isha. Abu-Umar Khafaf (Rahmatullah alaih) remembered 100 000 hadiths by heart. More than 100 000 persons at- tended the lectures of Asim bin Ali (Rahmatullah alaih) (Shaikh of Imam Bukhari) when he was in Baghdad. One day, an audience of 120 000 was estimated during his lec- ture. The words uttered by hinl were relayed a number of times, before these could be heard by all the people. The words \"Al-Laith (Rahmatullah alaih) reported to me,\" ut- tered by him, once had to be relayed fourteen times. Abu Muslim Basri (Rahmatullah alaih) on reaching Baghdad took his class to a big ground. Seven hucdred men were relaying his lecture. 40 000 ink-pots, used for taking down his lecture, were counted in one lecture. There were many more who simply listened. In the lectures by Faryabi (Rdhmatullah alaih) there used to be 316 per- sons who would relay his words to enable people to write these down. It was this labour and devotion which has caused the sacred knowledge to live upto our time. Imam Bukhari (Rahmatullah alaih) says: \"I cornpiled my collection of 7 275 Ahadith by selec- tion from 600 000. I have been saying Salaat of 2 ra- kaats before writing each Hadith\".' When Imaam Bukhari (Kahmatullah alaih) came to Bagh- dad, the Muhaddithin tested his knowledge. Ten persons were nominated for the test. Each of these persons selected ten Ahadith of his choice and, after making some changes 11 in the wording, recited each Hadith before Imam Bukhari (Rahmatullah alaih). On each recital, he would say: \"1 do not know such Hadith.\" spread and brought into practice while we remain absorbed in our luxuries, comforts, pleasures and other worldly en- gagements. .g % P cn ~ r n When all had finished, he addressed each man saying: \"Brother, the first Hadith you recited as such (reciting as the man had done), but actually it is such (reciting the correct wording) . . . and so on.\" He repeated all the hundred Ahadith first in the form in which those men had recited, and again in the correct form in that very order. Imam Muslim (Rahmatullah alaih) started learning Hadith when he was fourteen, and remained engaged in that till his death. He says: \"I have compiled my book of from 300 000 Ahadith.\" 12 000 after selecting Abu Daud (Rahmatullah alaih) says: \"I had collected 500 000 Ahadith, but I selected only 4 800 for inclusion in my book.\" Yusuf Muzi (Rahmatullah alaih) is a famous Muhadith. He is an Imam in the science of Asmaa-ur Rijaal (classifica- tion of reporting persons). After learning Fiqh and Hadith from the teachers in his own town he went to Mecca, Madi- nah, Halb, Hamat Ba'albak etc, in search of further knowl- edge. He is the writer of many books. 'Tahzib-ul-Kamal' is in 200 parts and 'Kitab-ul-Atraaf' has more than 80 parts. He often kept quiet and spoke very little. Most of the time, he was engaged intreading or writing. He suffered at the hands of his enemies, who were jealous of him, but he never retaliated. It is really very difficult to cover all the stories of other illustrious people about their service to knowledge. The de- tails of their toils cannot be covered even in several vol- umes. What has been written above is only meant to give a few glimpses of the pains that our elders in Islam have taken in the development of knowledge about Hadith and leaving it to us in such an accomplished form. Let those people who profess to seek knowledge see for themselves what sacrifices they are really making in this field: It is futile to hope that the knowledge about the Prophet (Sallal- laho alaihe wasallam), which has thus reached us, will be CHAPTER IX PLEASING THE PROPHET (SALLALLAHO ALAIHE WASALLAM) As we have already seen from the stories in previous chapters, obedience to Allah and His Prophet (Sallallaho alaihe wasallam) was the guiding factor in the Sahabah's life. Stories given exclusively in this chapter are to enable us to examine our way of living and see how far we are pre- pared to please Allah and His Prophet (Sallallaho alihe wa- sallam), in order to deserve the necessary progress and other blessings, which the Sahabah received. If we are desi- rous of similar results, we shall have to live the way they lived. 1. Hadhrat Ibn Amr (Radhiyallaho anho) Burns His Sheet. Hadhrat Abdullah bin Amr ibnul Aas (Radhiyallaho anho) says: \"Once we were accompanying the Prophet (Sallallaho alaihe wasallam) on a journey. I went to see him and I was wearing a saffron coloured sheet. He said to me, 'What is this that you are wearing?' I felt that he did not like my wearing a dress of that colour. When I reached home, ,I found a fire burning in the hearth. I threw my garment into the fire. The next day when I went to the Prophet (Sallallaho alaihe wasallam), he inquired, 'Where is that sheet?' I told him what I had done with it. He remarked, \"You could have given it to one of the ladies in your house, women are permitted to wear clothes of that colour.\" In fact, Abdullah was so much perturbed at the Prophet (Sallallaho alaihe wasallam's) displeasure that he did not hesitate to avail of the first opportunity of doing away with the sheet that caused the displeasure. He did not even think of making any other use of that garment. If we had been in his place, we would have thought of some excuse or the other for keeping it, or at least finding some other use for it. . An Ansari razes a building to the ground. The Prophet (Sallallaho alaihe wasallam) was once 8 passing through a street of Madinah when he saw a build- ine with a dome. He inauired of the comoanions, \"What is thrs?\" They informed him that it was a n'ew building built by one of the Ansar. The Prophet (Sallallaho alaihe wasal- lam) ramained silent. At some other time, the Ansari who had built that house came to the Prophet (Sallallaho alaihe wasallam) and greeted him with 'Assalamo alaikum'. The Prophet (Sallallaho alaihe wasallam) turned his face from him. He repeated the greetings, but the Prophet (Sallallaho alaihe wasallam) again gave him the cold shoulder. He was very much shocked to notice the Prophet's aversion for him. When he investigated, he was given the account of the Prophet's inquring about his new building. He immediately went and razed the new building to the ground, and'did not even inform the Prophet (Sallallaho alaihe wasallam) about his action. The Prophet (Sallallaho alaihe wasallam) happened to pass that way again. He inquired: \"Where is that building with a dome that I saw at this spot last time?\" The Sahabah informed him of Ansari's razing it to the ground, as it had been the likelv cause of the Prophet's dis- pleasure. He remarked. \"Every new structure is a sinful burden for its owner, except that which is absolutely essdntial.\" This is a matter of love and devotion. The Sahabah could not bear the displeasure of the Prophet (Sallallaho alaihe wasallam) and, no sooner did they smell such a thing, than they removed the cause thereof at all costs. Again the person does not even inform the Prophet (Sallal- laho alaihe wasallam) of his drastic action in removing the cause of his displeasure, till he himself happened to notice it. The Prophet (Sallallaho alaihe wasallam) had a special aversion for the people wasting their monev on buildings. His own house was a temporary structure of date palm, with mats serving the purpose of walls to secure privacy. Once, during his absence from Madinah, Ummul Mp'minin Umme Salma (Radhiallaho anha) who had some money in hand, erected walls of unbaked bricks for her house. When 162 163 the Prophet (Sallallaho alaihe wasallam) returned from his journey, he asked her: \"Why did you do this?\" She replied: \"0, Prophet of Allah. This is only to have better privacy.\" The Prophet (Sallallaho alaihe wasallam) remarked: \"The worst use of money is to spend it in raising up buildings.\" Hadhrat Abdullah bin Amr (Radhiyallaho anho) narrates: \"I and my mother were once repairing a wall of our house. The Prophet (Sallallaho alaihe wasallam) hap- pened to see us working and remarked: 'Your own fall (death) is more at hand than the fall of this wall.\" 3. Sahabah's Discard of Red Sheets of Saddle Cloth. Hadhrat Rafe' (Radhiyallaho anho) says: \"We were once with the Prophet (Sallallaho alaihe wa- sallam) on a journey. The sheets that we had spread on our camels were decorated with red thread work on the borders. The Prophet (Sallallaho alaihe wasallam) said, 'I notice that the red colour has begun to catch your fancy.' We stood up and dispersed in confusion at this rebuke; so much so that our camels seeing our b,e- wilderment began to run about. We immediately re- moved the sheetsfrom their backs.\" We are surprised on hearing such stories about Saha- bah, as we are living in a different atmosphere with quite a different frame of mind. When the Truce of Hudeybiyah was being negotiated, Urwah bin Mas'ood (Radhiyallaho anho) an envoy of Qureysh, had an opportunity of studying very carefully the behaviour of Sahabah. When he returned to his people, he said to them: \"I have been to the courts of great kings and monarchs as an envoy. I have met the Emperors of Persia, Rome and Abyssinia. Nowhere have I seen people around a sovereign so respectful to him as I saw the companions of Muhammad (Sallallaho alaihe wasallam). When he spits, his sputum is not allowed to fall on the ground. ery person hastens to carry it out. When he makes Wu ihu, his companions race one with another to snatch the water trickling down from his limbs, in such a way that an observer would think they are going to fight over that water. When he speaks, everybody is silent as if they were dumb. Nobody raises his eyes to look at him, out of respect for him.\" 4. Hadhrat Waa'il (Radhiyallaho anho) Has His Hair Cut. Hadhrat Waa'il bin Hajar (Radhiyallaho anho) says: \"I once visited the Prophet (Sallallaho alaihe wasal- lam) when the hair on my head was long. While I was sitting with him, he uttered the words. 'Zubab, Zubab' (Meaning something evil or ominous). I though he was referring to my hair. I returned home and had my hair cut. Next day when I again went to him, he said, 'I never referred to your hair when I uttered those words yesterday. Any how, it is good that you had your hair cut.\" This shows the frame of mind of those people. They tolerated no delay in acting upon the wishes of the Prophet (Sallallaho alaihe wasallam), whether they understood it rightly or wrongly. They never thought it necessary to fur- ther inquire or clarify. In the early years, talking in Salaat was permissible. Once Hadhrat Abdullah bin Mas'ood (Radhiyallake-anho) visited the Prophet (Sallallaho alaihe wasallam) while he was saying his Salaat. He greated him with \"Assallamo'a- laikum\" but received no reply, as to talk in Salaat had meanwhile been forbidden. He says: \"For receiving no reply, all sorts of explanations began to haunt my mind. I thoLdht perhaps he is displeased with me, or he is angry with me on such and such ac- count, and so on.' At last when the Prophet (Sallallaho alaihe wasallam) finished his Salaat and informed me that Allah had forbidden talking in Salaat I heaved a sigh of relief.\" 164 165 5. Hadhrat Khuraim Asadi (Radhiyallaho anho) gives up what is not liked by the Prophet: Hadhrat Suhdil bin Hanzalah CRadhiyallaho anho) was living a life of seclusion in Damascus. He did not mix with people, nor did he go anywhere. He was either busy in Salaat or in Zikr throughout the day. While going to musjid, he would pass by Hadhrat Abu Darda (Radhiyal- laho anho), one of the eminent Sahabah. Abu Darda (Rad- hiyallaho anho) would say to him: \"0, Suhail! Let us hear some good words from you. We shalI'gain much, though you will lose nothing.\" Hadhrat Suhail (Radhiyallaho anho) would then relate something that he had heard from the Prophet (Sallallaho alaihe wasallam), or some event that he had seen in his life time. Once on Hadhrat Abu Darda (Radhiyallaho anho's) request as usual, he said: \"Once the Prophet (Sallallaho alaihe wasallam) made a mention of Hadhrat Khuraim Asadi (Radhiyallaho anho) and said, \"He is a good man except for two habits, viz, he keeps the hair of his head too long and he allows his izaar to go below his ankles. When Khu- raim leal'nt this, he immediately cut the hair up to his ears and began to keep his izaar up to the middle of the calf of his leg.\" 6. Hadhrat Ibn Umar (Radhiyallaho anho) gives up speaking with his son. Hadhrat Abdullah bin Umar (Radhiyallaho anho) once said: \"I have heard the Prophet (Sallallaho alaihe wasallam) saying. 'Allow your women to go to the musjid.\" One of his sons remarked: \"We cannot allow our women to go to the musjid, as this may lead to corruption later on.\" Hadhrat Ibn-Umar (Radhiyallaho anho) became very angry and rebuked his son, saying: \"When I tell you that the Prophet (Sallallaho alaihe wasallam) has allowed our women folk to go to musjid, how dare you say that you cannot allow them.\" Ch. IX: Pleasing the Prophet He then, refused to speak to him throughout his.life. Hadhrat Ibn Umar (Radhiyallaho anho's) son obviously had no intention of disobeying the Prophet (Sallallaho alaihe wasallam). He feared corruption in allowing the women-folk of that time to go to the musjid. For the same reason, Hadhrat Aishah (Radhiyallaho anha) is reported to have said: \"If the Prophet (Sallallaho alaihe wasallam) had seen the women of our time, he would have stopped them from going to the musjid.\" Now, Hadhrat Aishah (Radhiyallaho anha) said this not very long after the death of the Prophet (Sallallaho hlaihe wasallam). Notwithstanding all this, Hadhrat Ibn Umar (Radhiyallaho anho) could not tolerate his son refusing to do something which the Prophet (Sallallaho alaihe wasal- lam) had desired to be done, and he gave up talking to him for the rest of his life. The Sahabah sometimes found them- selves faced with a dilemma regarding the women visiting the musjid. On the one hand, there was the explicit desire of the Prophet (Sallallaho alaihe wasallam) in favour of permitting them to go to the musjid, and on the other there was the possibility of looseness in society (the signs of which were becoming visible) that demanded an immedi- ate check on this permission. Hadhrat 'Atikah (Radhiyal- laho anha) the wife of Hadhrat Umar (Radhiyallaho anho) went to musjid regularly but Umar (Radhiyallaho anho) did not like it. Somebody told her that Hadhrat Umar (Rad- hiyallaho anho) did not like her going to the musjid. She said: \"Why does he not prevent me from doing it then?\" After the death of Hadhrat Umar (Radhiyallaho anho) Hadhrat 'Atikah (Radhiyallaho anha) was married to Hadh- rat Zubair (Radhiyallaho anho). He also did not like her going to musjid, but could not check her for the above ob- vious reason. Once he sat in her way to musjid and, as she passed by him, he teased her. In the dark, she could not make out who it was. After this incident, she stopped going to musjid. When Zubair inquired of her: \"Why do not you go to the musjid now?\" She replied: \"Times have changed.\" 166 167 7. Hadhrat Ibn Umar (Radhiyallaho anho) Replies to a Question. Somebody said to Hadhrat Ibn Umar (Radhiyallaho anho): \"Allah has said in the Qur'arl something about Salaat in peace and Salaat in fear. but He has not said any- thing about Salaat during a journey.\" He replied: \"0, my nephew! Allah sent Muhammad (Sal- lallaho alaihe wasallam) as his Apostle to us, when we were ignorant and knew nothing. We must do what we have seen him doing.\" This shows that it is not necessary that each and every regulation should be explicitly mentioned in the Qur'an. The acts of the Prophet (Sallallaho alaihe wasallam) is a very good guide for our practice. The Prophet (Sallallaho alaihe wasallam) says: \"I have been given the Qur'an and also other com- mandments. Beware of the time, which is coming shortly, when carefree people sitting on their couches will say. 'Stick to the Qur'an only. Carry out only the commandments contained therein.' \" Such corrup!ted views are generally inspired by arrogance due to wealth, and perhaps that is why the word \"carefree\" is used for such people. 8. Hadhrat Ibn Mughaffal (Radhiyallaho anho) Discon- tinues Relations With His Nephew. A young nephe& of Hadhrat Abdullah-bin-Mughaffal (Radhiyallaho allaho anho) was playing 'Khazaf'. He said to him: \"0 nephew! Stop doing that. The Prophet (Sallallaho alaihe wasallam) has prohibited this play. It can neither shoot a bird nor harm an enemy it is likely to injure somebody's eye or tooth. The boy stopped playing but, after some time when he thought that his uncle was not watching him, he started doing it again Hadhrat Ibne-Mughaffal (Radhiyallaho anha) was very angry and said: \"How dare you do a thing after knowing that the Prophet (Sallallaho alaihe wasallam) has forbidden it? will never visit you when you are sick, nor join your funeral if you die during my life time.\" 'Khazaf' is a game in which a pebble is placed on the thumb and then thrown with the force of other fingers. Children are fond of playing such games. Hadhrat Ibn Mug- haffal [Radhiyallaho anho) could not tolerate his nephew's ignoring the words of the Prophet (Sallallaho alaihe wasal- lam). Do we not know the instructions of the Prophet (Sal- lallaho alaihe wasallam) about many things we are wont to do from morning till evening? How much regard do we have in our hearts for his verdict? Let everybody ponder over it himself and answer. 9. Hadhrat Ibn Hizam (Radhiyallaho anho) Gives up Begging. . Hadhrat Hakim bin Hizam (Radhiyallaho anho) came to the Prophet (Sallallaho alaihe wasallam) and begged him for help. He gave him something. Next time he came and asked for something. The Prophet (Sallallaho alaihe wasal- lam) gave him something this time also. When he came to beg the third time, the Prophet (Sallallaho alaihe wasal- lam), after giving him something, said: \"Hakim! Money has a deceptive appearance. It appears to be very sweet (but it is really not so). It is a blessing when earned with contentment of heart, but there is no satisfaction in it when it is got with greed.\" Hakim said: \"0, Prophet of Allah, I will not bother any- body after this.\" Hadhrat Abu Bakr (Radhiyallaho anho) in the time of his Khilafat offered to help Hakim from Baitul Mal, but he refused. Again Umar (Radhiyallaho anho) as Amir-ul-Mo- minin requested Hakim many times to accept something from him, but he did not agree. Our greed and avarice know no bounds; this is why we find no blessings in what we earn. 10. Hadhrat Huzaifah (Radhiyallaho anho) Goes For Spying. Hadhrat Huzaifah (Radhiyallaho anho) narattes: \"In the war of the Trench, we were facing a very big 168 army of the enemy, comprising of non-believers from Mecca and other such groups. At the same time, the Jews of Banu Quraizah in Madinah were preparing to stab us in the back, and we apprehended their plun- dering our houses and families, for all of us were out- side defending Madinah against the invaders. The Munafiqin started asking permission from the Prophet (Sallallaho alaihe wasallam) to go back to Madinah, on the pretext of their homes being unattended and open to the enemy. He permitted every one of them. During those days of trial, one night it was unusually very dark and windy, It was so dark that one could not see one's own hand, and the wind was blowing wildly. The Munafiqin were returning to their homes. We, three hundred strong, were sticking to our posts. The Prophet (Sallallaho alaihe wasallam) approached every one and made enquiries about him. I had no arms to defend myself, nor clothes to resist the cold. I had only one small sheet, which belonged to my wife and was lent to me. I wrapped it round my loins and sat with my knees clinging to the ground. When the Prophet (Sallallaho alaihe wasallam) passed by me, he said, 'Who are you? I said, 'Huzaifah!' I could not stand up due to severe cold and I clung to the ground more tightly with shame. He said, 'Huzaifah, stand up and go to the enemy camp and bring us their news.' Of all the Sahabah, I was the most ill-equipped, both against the enemy and against the cold that night, but as soon as I got the order I stood up and left for the enemy camp. As I was going, the Prophet (Sallallaho alaihe wasallam) prayedffor me saying, '0 Allah! Protect him from all directions.' Immediately after his prayer, I was completely relieved of my fear and cold. I felt as if I were walking in a warm and peaceful atmosphere. The Prophet (Sallallaho alaihe wasallam) warned me thus, 'Return immediately after observing what they are doing. Do not take any other step.' When I reached the enemy camp, I found a fire burning and people sitting round it. Each person warmed his hands before the fire and then rubbed them over his abdomen. The shouts of retreat were heard from all directions. Every one was shouting to the people of his clan to pack up and go back. The wind was causing the stones to fly and strike against their tents. The guy ropes of the tents were breaking and the animals were dying. I found Abu S= CI a Sufyan, the Commander-in-Chief of the enemy forces, ;% sitting near the fire warming himself. I thought of fin- 33 m ishing him off. I had actually taken out an arrow from my quiver and placed it in my bow, when I remem- bered the directive of the Prophet (Sallallaho alaihe wasallam). I put the arrow back into the quiver. While I was among them, they seemed to become aware of my presence. They shouted, 'There is a spy among us. Every one of us should catch the hand of the person next to him I immediately caught the hand of a person and shouted, 'Who are you? 'He said, 'Subhanallah! you do not know me. I am so and so. 'I then returned to my camp. While I was on my way back, I met twenty horsemen with turbans on their heads. They said to me, 'Tell your master that Allah has dealt with his enemy and that he has nothing to worry about now.' Whgn I reached my camp, I found the Prophet (Sallallaho alaihe wasallam) saying his Salaat with a small shawl around him. Whenever he faced a diffi- ~ ~ l l t y . he immediately turned towards Salaat. When he had finished, I reported to him what I had seen in the enemy camp. When I narrated how I escaped their 'search for the spy', I could see his beautiful teeth shin- ing. He then asked me to lie down near his feet and put a corner of his shawl over my body. I lay down and pressed my breast against the soles of his feet.\" Look at their spirit of carrying out the orders of the Prophet (Sallallaho alaihe wasallam) under very adverse and trying conditions. May Allah favour us with such spirit of obedience, even though we do not deserve it. Aameen! I ! CHAPTER-X THE WOMEN'S COURAGE AND SPIRIT OF ISLAM The lap of the mother is admitted to be the best field of instruction. Mothers imbued with the religious spirit are more likely to bring up children who will have similar ap- titudes. Alas! our children are brought up in surroundings that draw them away from Islam or at least make them in- different to the duties they owe therein; the results are ob- vious. 1. Hadhrat Fatimah (Radhiyallaho anha's) Tasbih: Hadhrat Ali (Radhiyallaho anho) once said to one of his pupils: \"Shall I tell you the story of Hadhrat Fatimah (Rad- hiyaliaho anha), the dearest and the most loved daugh- ter of the Prophet (Sallallaho alaihe wasallam)?\" When the pupil replied in the affirmative, he said: \"Hadhrat Fatimah (Radhiyallaho anha) used to grind the grain herself, which caused corns on her hands. She carried water for the house in a leather bag, which left a mark on her breast. She cleaned the house her- self, which made her clothes dirty. Once some war- captives were brought to Madinah. I said to her, 'Go to the Prophet (Sallallaho alaihe wasallam) and request him for an assistant to help you in your house-work.' She went to him, but found many people round him. As she was very modest, she could not be bold enough to request the Prophet (Sallallaho alaihe wasallam) in the presence of other people. Next day the Prophet (Sallalaho alaihe wasallam) came to our house and said, \"Fatimah! what made~you come to me yester- day?'' She felt shy and kept quiet. I said, \"0, Prophet of Allah! Fatimah has developed callusses on both her hands and breast, on account of grinding and carrying water. She is constantly busy in cleaning the house and in other domestic jobs, causing her clothes to remain dirty. I informed her about the captives and ad- vised her to go to you and make a request for a ser- 3 A Ud 0s a YI 4 vant.' It has also been reported that Hadhrat Fatimah (Radhiyallaho anha) made a request, 'I and Ali own 31 only one bedding and that also is a skin of a goat. We use it in the morning to put the feed of the camel.' The Prophet (Sallallaho alaihe wasallam) said, \"Fatimah! Be patient. The Prophet Moses (Alayhis Salam) and his wife owned only one bedding, which was the cloak of Moses. Fear Allah; acquire Taqwa and keep doing your service to Allah and attend to your domestic jobs. When you go to bed, recite Subhanallah 33 times, Al- hamdulillah 33 times and Allahoakbar 34 times. You will find this more helpful than an assistant.' Hadhrat Fatimah (Radhiyallaho anha) remarked, 'I am happy with what Allah and His Prophet (Sallallaho alaihe wasallam) would be pleased with.\" Look! This is the life of the Prophet's dear daughter. In moderately rich families of our times, the ladies think it below their dignity to attend to domestic work. They need assistance in each and every thing, even in their bathroom! What a difference! In this Hadith, the prescribed Zikr is before sleep. In other Ahadith, the Prophet (Sallallaho alaihe wasallam) is reported to have advised Hadhrat Fatimah (Radhiyallaho anha) to recite after every Salaat. Subhanallah 33 times. Al- hamdulillah 33 times, Allahoakbar 33 times and Lailaha-il- lallaho wahdahu-lasharikalahu-lahulmulku walahulhamdu- wahuwa-ala-kulli-sha-in-Qadir, once, 2, Hadhrat Aishah (Radhiyallaho anha's) Spending In the Path of Allah. Once Aishah (Radhiyallaho anha) received a gift of two bags containing one lakh (100,000) Dirhams. She started distributing these among the poor, till by the evening not a single dirham was left with her. She was fasting that day. Her maid servant brought her a loaf of bread and a little olive oil for Iftar, and remarked, \"I wish we had kept one dirham for ourselves to get some meat for Iftaar.\" Aishah said: \"Do not be sorry now. If you had told me at that time I would have perhaps spared one dirham.\" 172 Gifts of this nature were often received by Hadhrat Aishah (Radhiyallaho anha) from Amir Muawiah, Hadhrat Abdullah bin Zubair (Radhiyallaho anhuma) and others. for that was the time of ease and plenty for the Muslims as territory after territory fell into their hands. In spite of this abundance, Hadhrat Aishah (Radhiyallaho anha) led a life of abstention. Look! She distributes 100 000 dirhams to the poor, but she does not remember to get some meat for her own Iftar. In our own atmosphere today, such stories seem to be impossible but, to the people who have understood the Sahabah's frame of mind, hundreds of such incidents are quite credible. There are many stories of this nature re- ported about Aishah (Radhiyallaho anha). Once she was fasting and had nothing for her Iftar except one piece of bread. A poor man came and begged for some food. She asked her maid to give him that piece of bread. The maid said: \"If I give him the piece of bread, there will be nothing left for your Iftar\". She said: \"Never mind. Let him have the piece\". Once she killed a snake. She saw a vision in her dream, saying: \"Aishah (Radhiyallaho anha) you killed a Muslim\". She replied: \"How could a Muslim come into the house of the Prophet's widow?\" Thevisionrejoined: \"But he had come in Purdah (dis- guise)\". She abruptly got uptfrom her sleep and at once spent 12 000 dirhams in Sadaqah, which was the blood-money fixed for a Muslim killed by mistake. Hadhrat Urwah (Rad- hiyallaho anho) says: \"I once saw Hadhrat Aishah (Radhiyallaho anha) spending 70 000 dirhams in charity, while she herself was wearing a dress with patches.\" 3. Hadhrat Aishah (Radhiyallaho anha) Gets Angry With Hadhrat Ibn Zubair (Radhiyallaho anhol: Hadhrat Abdullah bin Zubair (Radhiyallaho anho) was Hadhrat Aishah's (Radhiyallaho anha) nephew. He was very dear to her, as she had brought him up. He did not like her spending so much in charity, while she herself 173 5 s Spirit for Islam Ll a 0s I lived in want and poverty. He mentioned this to somebody -8 q and said: m 3 m \"I must stop my aunt from doing that\". She learnt about this and was so much displeased that she swore not to speak to Hadhrat Abdullah for the rest of her life. Hadhrat Abdullah bin Zubair (Radhiyallaho anho) was very much shocked by her oath. He deputed many people to speak to her for him, but she told them, \"I have taken an oath and I am not prepared to violate it.\" He, at last, took two persons from the family of the Prophet's mother to her house to intercede for him. Aishah (Rad- hiyallaho anha) allowed the persons to enter the house and to speak to her from behind a curtain. Ibn Zubair (Rad- hiyallaho anho) also stealthily got in with these persons. When these persons started talking, he could not control himself and crossed the curtain and clung to his aunt, crying and entreating her for pardon. The two persons also interceded and reminded her of the Prophet's forbidding a Muslim from forswearing speech with another Muslim. When she heard this Hadith, she got frightened of Allah's displeasure and the result thereof, and began to weep very bitterly. She forgave Hadhrat Zubair (Radhiyallaho anho) and began to speak with him. She then began liberating slave after slave in expiation of her oath, till 40 slaves had been set free by her. Even later on, whenever she thought of the violation of her oath, she wept so much that her shawl would become wet with her tears. How much do we worry about the oaths we take from morning till evening? It is for every one to examine his own self and answer. Come and see the people who had real reverence for Allah and His name; how deeply did they feel.when they were unable to fulfil an oath. We see Hadhrat Aishah (Radhiyallaho anha) weeping so much whenever she remembered that incident about the violation of her oath. 4. Hadhrat Aishah (Radhiyallaho anha) and Fear of Allah: Who does not know about the love that the Prophet (Sallallaho alaihe wasallam) had for his dear wife Hadhrat Aishah (Radhiyallaho anha)? It is said that when he was asked whom he loved most, he replied, \"Aishah\". She was so well-versed in Islamic jurisprudence that many eminent Sahabah would go to her for solving their problems in this 174 12 1 field. Jibrail used to greet her with 'Assalamo alaikum'. The He said: \"I want you to take a husband after my death\" Prophet once told her that she would be his wife in the Par- adise. When she was slandered by the Munafiqin, Allah exonerated her from the slander and confirmed her inno- cence by revealing verses in the Qur'an. According to Hadhrat Ibn Sa'd (Radhiyallaho anho) Hadhrat Aishah (Radhiyallaho anha) once enumerated as many as ten special virtues that Allah had given her over the other wives of the Prophet (Sallallaho alaihe wasallam). Her spending in the path of Allah has already been nar- rated in the previous stories. In spite of all these privileges and virtues, she feared Allah so much that she was often heard saying; \"I wish I was a tree, so that I could be always busy in Allah's tasbih and be absolved of reckoning on the Day of Judgment\". \"I wish I had been a stone or a clod of earth\". \"I wish I had been a leaf of tree or a blade of grass\". \"I wish I had not been born at all\". The stories about the awe and fear of Allah, which Sahabah had in their hearts, have already been given in Chapter 11. This was the guiding factor of their lives. 5. Story of Hadhrat Umme Salmah (Radhiyallaho anha): Ummul-Momineen Hadhrat Umme Salmah (Radhiyal- laho anha) was first,married to Abu Salmah (Radhiyallaho anho). The husband and wife were very much attached to each other. Once Umme Salmah said to her husband: \"I have heard that if a husband does not marry another woman during the life or after the death of his wife, and also if the wife does not remarry after the death of her husband, the couple when admitted to paradise is allowed to live there as husband and wife. Give me your word that you will not marry after my death, and I too pledge that I will not marry again if you happen to die before me\". Hadhrat Abu Salmah (Radhiyallaho anho) said: \"Will you do as I say?\" She replied: \"Of course\". He then prayed, saying, \"0, Allah! Let Umme Salmah be married after my death to a husband better than I. May he give her no trouble whatsoever\". In the beginning, the couple emigrate'd to Abyssinia. After their return, they again emigrated to Madinah Hadh- rat Umme Salmah (Radhiyallaho anha) says: \"When my husband made up his mind to emigrate to Madinah, he loaded the camel with the luggage. He then made me and our son Salmah ride the camel. He led the camel out of the town, holding the string in his hand. The people of my father's clan (Banu Mughirah) happened to see us leaving. They came and snatched the,string from Hadhrat Abu Salmah (Radhiyallaho anho's) hqnd saying, 'You can go wherever you like but we cannot allow our girl to go and perish with you.' They forcibly took me and my son back to their clan. When the people of my husband's clan (Banu Abdul Asad) learnt this, they came to Banu Mughirah and began to argue with them saying, \"You can keep your girl if you like, but you have no claim over the child who belongs to our clan. Why should we allow him to stay in your clan, when you have not allowed your girl to go with her husband\". They forcibly took the boy away. Hadhrat Abu Salmah (Radhiyallaho anho) had already gone to Madinah. All the members of the family were thus separated from each other. Daily, I would go out in the desert and weep there from morning till night. I lived in this condition for one full year, separated from my husband and my son. One day, one of my cousins taking pity on me said to the people of the clan, 'You have separated this poor woman from her husband and son. Why don't you have mercy on her and let her go? Due to the humani- tarian efforts of this cousin of mine, the people of Banu Mughirah agreed to let me go and join my husband. Banu Abdul Asad also made over my son to me. I got a camel ready and, with my son in my lap, I sat on its back and set off for Madinah all alone. I had hardly gone four miles, when 'Hadhrat Usman-bin-Talhah (Radhiyallaho anho) met me at Tan'eem. He inquired, 'Where are you going?' I said, 'To Madinah! He re- marked, 'With none accompanying you!, I said 'No, I 176 have nobody except Allah to accompany me.' He took the rope of my camel and began to lead. By Allah, I have never come across a person more noble than Hadhrat Usman (Radhiyallaho anho). When I had to get down, he would make the camel sit and himself go behind a hush and when I had to climb up he would bring the camel and make it sit close to me. He would then hold the rope and lead the animal. Thus we reached Quba (a suburb of Madinah). He informed me that Hadhrat Abu Salmah (Radhiyallaho anho) was staying there. He then made us over to my husband and then returned all the way back toXMecca. By Allah, no one else could bear the hardships that I bore during that single year\". Look at Hadhrat Umme Salmah (Radhiyallaho anha's) faith and trust.in Allah. She set out on a long and hazard- ous journey all alone. See how Allah sent His help to her. No doubt.Allah can depute anybody to render help to those who place trust in Him, for the hearts of all people are in His control. As a rule, a lady is not permitted to travel alone on a long journey, except in the event of obligatory emigration for the sake of Allah. 6. Ladies in the Khaibar Campaign: Shoulder to shoulder with their menfolk, the ladies of those times, imbued with the same spirit of sacrifice, were striving heart and soul in the path of Allah, and no service in this c~nnectionwa: too much for them. Hadhrat Umme Ziyad (Radhiyallaho anha) says: \"In the Khaibr campaign. I along with other five women reached the battle-field. The Prophet (Sallalaho alaihe wasallam), having learnt this, sent for us. He said with anger. 'Who permitted you to come over here? Who brought you to this place?' We said. '0, Prophet of Allah! we know knitting and we have some medicines with us. We shall help the Mujahidin by supplying them with arrows, by attending them when they are sick, and by preparing food for them.' The Prophet (Sallqllaho alaihe wasallam) permitted us to stay.\" The women of that time were blessed with the spirit which even the men of our times do not possess. Look at the courage of these women who reached the battle-field on their own accord, and who offered to attend tb different jobs in the field. Hadhrat Umme Salim (Radhiyallaho anha) joined thb Huneyn campaign in the state of pregnancy. She kept a dagger on her person. The Prophet (Sallallaho alaihe wasal- lam) inquired: \"What is this dagger for, 0, Omme Salim?\" She replied: \"I shall run it through the belly of any Kafir approaching me\". She bad also taken part in'the battle of Uhud. ~herein~she tended the wounds of the fi&ting men. Anas (Radhiyal- laho anho) says: \"I saw ~ a d h r a t Aishah and Hadbat Umme Sglim (Radhi~allaho anhuma) ,running to and fro in the battle-field, carrying water for the wounded\". 7. Hadhrat Umme Haram (Radhiyallaho Pnha) in the battle for Cyprus: Upme Yaraq (Radhiy llaho anha) was an qunt of Anas'[Radhiyallaho anhi). $hel\"Pophet (Sallallaho'alaihe wasallam) often visited her and sometimes had his after- noon nap at her, place. Once,he was ,sleeping in her house, when he woke up smiling. Hadhrat Umme Haiam (Radhiyallaho a+a) said: \"0, Prophet (Sallallaho alaihe wasallam)! You are dearer to .me than my parents, teli me what made you smile\". He said: \"I saw in my dream a few of my followers going for Jihad across the sea. They, in their barges, looked like kings sitting on their thrones\". Hadhrat Umme Haram (Radhiyallaho anhaj said: \"0, Prophet of Allah! Pray that I may also be one among those people\". He replied: \"Rest assured, you will be one of themv He went to sleep again, and got up smiling for the second 178 time. On Hadhrat Haram (Radhiyallaho anha's) query he said: \"I again saw some more people going for Jihad across the sea\". Hadhrat Umme Haram (Radhiyallaho anha) requested him to pray for her joining them also, he said: \"No, you are with the first group only.\" During the Khilafat of Hadhrat Usman (Radhiyallaho anho) Amir Muawiyah, the Governor of Syria, sought permission to send an expeditionary force to Cyprus Island. This per- mission was granted by Hadhrat Usman (Radhiyallaho anho). Hadhrat Umme Haram (Radhiyallaho anha), with her husband Hadhrat Ubadah [Radhiyallaho anho), was in that force. While returning from the island she fell from her mule, broke her neck and died. She was buried in Cyprus. Look at the spirit of Hadhrat Umme Haram (Radhiyal- laho anha). She wanted to join both the expeditions. As she was destined to die during the first expedition, the Prophet (Sallailaho alaihe wasallam) did not pray for her partici- pation in the second one. 8. Story of Hadhrat Umme Sulaim (Radhiyallaho anha): Umme Sulaim [Radhiyallaho anha) was the mother of Hadhrat Anas (Radhiyallaho anho). After the death of her husband, she remained a widow for some time with a view to devoting herself to the proper upbringing of her son. She was then married to,Hadhrat Abu Talhah [Radhiyallaho anho) and got a son named Abu Umair from him. The Prophet (Sallallaho alaihe wasallam) used to go to her hbuse and play with the child. One day, Abu Umair was ill and Hadhrat Abu Talhah (Radhiyallaho anho) was fasting. While Hadhrat Abu Talhah (Radhiyallaho anho) was out on his job, the child died. She washed and enshrouded the dead body and laid it on the cot. She then herself took a bath changed her clothes and made her toilet. When the husband returned home and had his Iftar he asked her: \"How is the child?\" When they got up in the morning, they had the following conversation. Hadhrat Umme Sulaim (Radhiyallaho anha): \"I have a question to ask you.\" Hadhrat Abu Talhah (Radhiyallaho anho): \"What is that?\" Hadhrat Umme Sulaim (Radhiyallaho anha): \"Suppose a person is ,entrusted with something. Should he deliver up on demand that which is en- trusted to him or not?\" Hadhrat Abu Talhah (Radhiyallaho anho): \"He must deliver up. He has no right to hold it back\". Hadhrat Umme Sulaim (Radhiyallaho anha): \"Abu Umair was entrusted to us by Allah. He has taken him back.\" Hadhrat Abu Ta'lhah (Radhiyallaho anho) was filled with grief. He simply said: \"But why did you not inform me before?\" He went to the Prophet (Sallallaho alaihe wasallam) and narrated the story to him. He prayed for him and said: \"Allah is likely to bless your sharing the bed with your wife last night.\" One of the Sahabah says: \"I lived to see the effect of the Prophet's blessing. As a result of his union with his wife on that night, Hadhrat Abu Talhah (Radhiyallaho anho) got a son named Ab- dullah. This Abdullah had nine sons, all of whom were Qaris.\" It needs much courage and patience to do what Hadh- rat Umme Sulaim (Radhiyallaho anha) did at the death of her son. She did not like her husband to know about the death of the child while he was fasting and while he needed food and rest. 'She replied: \"He is now in peace.\" I He was satisfied. The couple shared the bed for the night. I 180 9. Hadhrat Umrne Habibah (Radhiyallaho anha's) Be- haviour With Her Fatht~r: Hadhrat Ummul Mominin Umme Habibah (Radhiyal- I laho anha) was previously married to Ubaidullah bin Jahsh. She emigrated with her husband to Abyssinia. The hus- band turned renegade and died there ,as a Kafir. The Prophet (Sallallaho alhihe wasallam) sent his offer to marry her through king Negus, while she was still passing her days in Abyssinia as a widow. She accepted the offer and came to Madinah to live with the Prophet (Sallallaho alaihe wasallam). During the period of truce between the Muslims and the idolaters of Mecca, her father Hadhrat Abu Sufyan (Radhiyallaho anho) once came to Madinah for negotia- tions in connection with reinforcing the truce. He went to see Umme Habibah. As he was about to sit on the bedding in her room, she removed it from under him. He was sur- prised over her behaviour and said: \"Was the bedding unfit for me or I unfit for the bed- ding?\" She replied: \"This bedding is meant for the dear and holy Prophet (Sallallaho alaihe wasallam), while you are an idolater pnd therefore unclean. How can I allow you to sit on this bedding?\" Abu Sufyan was full of grief and remarked: I \"Since you left us, you have developed bad manners.\" In the face of the great reverence that she had for the Prophet (Sallallaho al9ihe wasallam), she dould not tolerate an unclean mushrik (though he be her own father) to sit on the Prophet's bedding. Once she came to know from the Prophet (Sallallaho alaihe wasallam) about the virtues of twelve rakaats of Chasht. Since that time, she kept on offering this Salaat regularly. Her father Hadhrat Abu Sufyan (Radhiyallaho anha) later embraced Islam. On the third day of his death, she sent for some perfume and bsed it saying: \"I neith'er need nor like the perfume. I have heard the Prophet (Sallallaho alaihe wasallam) saying, 'A woman is not permitted to mourn the death of any person (except her husband's) for more than three days. (The 4 -4 \"1 mourning period in case of husband's death is how- ever four months and ten days.) I am using the per- '!J fume simply to show that 1 am not mourning the death of my father any longer.\" When she was about to die, she sent for Hadhrat Aishah (Radhiyallaho anha) and said: \"We have been rivals in sharing the love of the Prophet (Sallallaho alaihe wasallam). It is just possible that we might have offended each other. I forgive .you. Please forgive me too.\" Hadhrat Aishah (Radhiyallaho anha) said: \"I forgive you by all means. May Allah forgive you too.\" She remarked: \"0, Aishah, you have made me very happy. May Allah keep you happy.\" Similarly, she sent for Hadhrat Umme Salmah (Radhiyal- laho anha) and secured her forgiveness. The tension between two rival wives is natural and proverbial. Hadhrat Umme Habibah (Radhiyallaho anha) wanted to be forgiven by people before she appeared before Allah. Her reverence and love for the Prophet (Sallallaho alaihe wasallam) can be judged from her behaviour towards her own father. 10. The Story of Hadhrat Zainab (Radhiyallaho anha) Hadhrat Ummul Mominin Zainab (Radhiyallaho anha) was a cousin of the Prophet (Sallallaho alaihe wasallam). She accepted Islam soon after its advent. In the beginning, she was married to Hadhrat Zaid (Radhiyallaho anho), who was a liberated slave and the adopted son of the Prophet (Sallallaho alaihe wasallam). He was therefore, known as Hadhrat Zaid bin Muhammad (Radhiyallaho anho). Hadh- rat Zaid (Radhiyallaho anho) could not pull on smoothly with Zainab and at last divorced her. Now, according to the pre-Islamic customs, an adopted son was treated as a real son, so much so that his widow or divorced wife could not be married to his adopted father. The Prophet (Sallallaho alaihe wasallam), with a view to break this unjustified custom, communicated to Hadhrat Zainab (Radhiyallaho 182 0 anha) his proposal for marriage. When Hadhrat Zainab (Radhiyallaho anha) received the proposal, she said: \"Let me consult my Lord!\" She then performed Wudhu and stood up in her Salaat. Her action was so much blessed by Allah that the following verse was revealed to the Prophet [Sallallaho alaihe wasal- lam): - \"So when Zaid had performed the necessary formality (of divorce) from her, we gave her unto thee in mar- riage, so that (hence forth) there mav be no sin for be- lievers in respect of the wives of their adopted sons, when the latter have performed necessary formality (of release) from them. The commandment of Allah must be fulfilled.\" When Hadhrat Zainab (Radhiyallaho anha) was in- formed of the good news that Allah had given her in the Prophet's mdrriage and had revealed a verse to that effect, she made over to the reporter in gratification all her jewell- ery that she was wearing at that time. Then she fell down . in Sajdah and vowed to keep fast for two months. She was justly proud of the fact that, while every other wife of the Prophet (Sallallaho alaihe wasallam) was given in the mar- riage to him by her relations, she was given by Allah, as mentioned in Qur'an! As Hadhrat Aishah (Radhiyallaho anha) was also proud of being the most beloved wife; of the Prophet (Sallallaho alaihe wasallam), there was always some rivalry between the two. In spite of all this, when the Prophet (Sallallaho alaihe wasallam) asked Hadhrat Zainab (Radhiyallaho anha's) opinion about Hadhrat Aishah (Kad- hiyallaho anha) in the matter of the slander against Hadhrat r Aishah (Radhiyallaho anha), she said: \"I find everything good in Aishah.\" Look at her integrity and strong character. Had she i wished, she could have harmed the reputation of her rival and lowered her, in the eyes of their common husband, who loved Hadhrat Aishah (Radhiyallaho anha) so much. On the other hand, she praised her in very strong words. 8 3 Hadhrat Zainab (Radhiyallaho anha) was a very pious .= % lady. She fasted very often and would say her Nafl Salaat Wm very frequently. She earned by working with her hands, and spent all that she earned in the path of Allah. At the time of the Prophet's death, his wives asked him: \"Which of us will join you first?\" Me said: \"The one with long arms.\" They began to measure their arms with a stick. They, how- ever, came to know later that long hands symbolised lavish spending in charity. Hadhrat Zainab (Radhiyallaho anha) was indeed the first to die after the Prophet (Sallallaho alaihe wasallam). Hadhrat Barazah (Radhiyallaho anho) narrates: Hadhrat \"Umar (Radhiyallaho anho) decided to pay an annual allowance to the Ummahat-ul-Mominin from the Baitul Maal. He sent 12 000 dirhams to Hadhrat Zainab (Radhiyallaho anha) through me as her share. She thought that it was for all of them, and said to me, 'Umar should have asked somebody else to distribute this money.' I said, 'It is the annual share for you alone.' She asked me to throw it in the corner of a room and cover it with a piece of cloth. Then she men- tioned the names of some poor persons. widows and her relatives, and asked me to give one handful to each of them. After I had distributed as desired, some money was still left under the cloth. I expressed a desire to have something for myself. She said, 'You take the rest.' I counted the money. It was eighty four dirhams. Then she lifted her hands in prayer and said, '0, Allah keep this money away from me, for it brings temptation.' She died before the allowance for the next year could be paid to her. When Hadhrat Umar (Rad- hiyallaho anho) came to know of what she had done with the money, he sent her another 1 000 dirhams for her personal needs but even those she spent in no time. Although during the last portion of her life, the Muslims were conquering territory after territory, and wealth was pouring into Madinah, yet she left no money or other wealth after her, except the house where she lived. She was called Ma'wal Masaakeen, 184 3 a . , = (refuge of the poor), due to her lavish spending in in His path. You must remember that the everlasting charity.\" life of the Hereafter is far better than the transitory life 0.p 4 .! A woman narrates: 1 \"I and Hadhrat Zainab (Radhiyallaho anha) were dyeing our clothes with red ochre. The Prophet (Sallal- laho alaihe wasallam) came in, but went out again when he saw us engaged ih dyeing. Hadhrat Zainab (Radhiyallaho anha) felt that the Prophet (Sallallaho alaihe wasallam) had perhaps not liked our dyeing in that colour. She immediately washed all the dyed clothes till their colour was gone.\" Everybody knows the love and liking of women for money and colours. But look at these ladies, who would push away the money coming to them and who were pre- pared to discard any colour on receiving the least hint of the Prophet's disapproval. 11. Hadhrat Khansa (Radhiyallaho anha) Exhorts Her Sons to Bravery. Hadhrat Khansa (Radhiyallaho anha) was a famous po- etess. She embraced Islam in Madinah, along with some others of her clan. Ibn Athir writes: \"All masters of literature are unanimous in declaring I-iadhrat Khansa (Radhiyallaho anha) as the best woman poet in Arabic. No woman in history has ever written such poetry as Hadhrat Khansa (Radhiyallaho anha) .\" ? During the time of 'Hadhrat Umar (Radhiyallaho anho) in 16 A.H, the famous hattle of Qadisivyah was fought be- tween the Muslims and the Persians. Hadhrat Khansa (Rad- hiyallaho anha), along with her four sons, took part in this battle. On the eve of the battle, she exhorted all her four sons, saying: I \"0, My sons! You embraced Islam and emigrated of your own free will. By Allah, beside Whom there is no God, you all are the sons of the same father, just as you are the sons of the same mother. I never betrayed your ,* father, nor defamed your maternal uncle. I never al- lowed a blot to come on your high birth nor polluted your pedigree. You know what rewards Allah has promised for those who fight against the disbelievers of this world. Allah has said in His Holy Book: bd& $& 'A, ,p, ' ,. .$ ,*- ' \\&j, lj>L#, \\j>, a+, '+k .. \"0, Ye who believe! Endure, outdo all others in endur- ance, be ready and observe your duty to Allah, in order that Ye may succeed. (III:200)\" When you get up tomorrow morning, be prepared to contribute your best in the battle. Go ahead into the enemy lines, seeking help from Allah. When you see the flames of war rising high, get right into the centre and face the enemy chiefs. Inshallah you will get your abode in paradise with honour and success.\" Next day, when the battle was in full swing, all the four sons.advanced towards the enemy lines. One by one, they attacked the enemy, reciting the words of their mother in verses and fought till all of them were martyred. When the mother got the news, she said: \"Alhamdulillah. Glory to Allah Who has honoured me with their martyrdom. I hope that Allah will unite me with them under the shade of His Mercy.\" Here is a mother of that time. She exhorts her sons to jump into the flames of battle and, when all the sons are killed in quick succession, she glorifies Allah and thanks Him. 12. Hadhrat Safiyyah (Radhiyallaho anha) Kills A Jew Hadhrat Safiyyah (Radhiyallaho anha) was the aunt of the Prophet (Sallallaho alaihe wasallam) and a real sister of Hadhrat Hamzah (Radhiyallaho anho). She took part in the battle of Uhud. When the Muslims were defeated and some of them began to flee from the battle, she would smite their faces with her spear and excite them to go back and fight. In the war of the Khandaq (Trench), the Prophet (Sal- lallaho alaihe wasallam) had collected all the Muslim women in a fortress and had deputed Hadhrat Hassaan bin Thabit (Radhiyallaho anho) to look after them. The Jews, who were always on the look-out for such opportunities for doing mischief, surrounded the place and sent one of them 3, 'a 186 to find out if there were any men with the ladies. Hadhrat Safiyyah (Radhiyallaho anha) happened to see the Jew ap- proaching the fort. She said to Hadhrat Hassaan (Radhiyal- laho anho): \"There is a Jew coming to spy on us. You go out and kill him.\" Hadhrat Hassaan (Radhiyallaho anho) was a weak person. He did not make bold to do the job. Safiyyah (Radhiyallaho anha) got hold of a tent peg and went outside the fortress and gave a blow on the head of the Jew that killed him on the spot. She came back and said to Hassaan: \"The man is dead. I have not removed the clothes and arms from his body for reasons of modesty. Now you go and remove everything from his body. Also bring his head after severing it from the body.\" Hadhrat Hassaan (Radhiyallaho anho) was too weak- hearted to do that even. She herself went again and brought his head, and threw it over the wall amidst the Jews. When they saw this, they said: \"We were wondering how Muhammad (Sallallaho alaihe wasallam) could keep the womenfolk alone in this fort. Surely, there are men inside to guard the ladies.\" Safiyyah died in 20 A.H. at the age of seventy three. The war of the Trench was fought in 5 A.H. She was, there- fore, 58 then. These days, a lady of that age is hardly able to do her domestic work. But look how Saffiyyah (Rad- hiyallaho anha) goes and kills a Jew all alone. 13. ZIadhrat Asma (Radhiyallaho anha's) Interview With the Pmphet (Sallallaho alaihe wasallam) Regarding the Reward for Women. Hadhrat Asrna birityazid Ansari (Radhiyallaho anha) came to the Prophet (Sallallaho alaihe wasallam) and said: \"0. Prophet of Allah! You are dearer to me than my parents. My Muslim women have deputed me as their representative to talk to you on their behalf. Verily you are the Prophet of Allah for both men and women. We stay for most part of our time within the four walls of our houses. We remain pinned to our duties of fulfil- ling the sexual desires of men, bearing children for 187 2% a Spirit for Islam 0 B them and looking after their homes. Notwithstanding .C M 4 3 all this, men excel us in getting rewards for things s m which we are unable to do. They go and say their daily Salaat and weekly Jumu'ah in the musjid, visit the sick, attend the funerals, perform Hajj after Hajj and, above all, fight in the way of Allah. When they go for Hajj or Jehad, we look after their property, bring up their children and weave cloth for them. Do we not share their rewards with them?\" The Prophet (Sallallaho alaihe wasallam) addressing the Sahabah sitting round him, said: \"Did you ever hear a woman asking a better question?\" Sahabah replied: \"0, Prophet of Allah! We never thought that a woman could ever put such a question.\" The Pmphet (Sallallaho alaihe wasallam) addressing Asma said: \"Listen attentively, and then go and tell the ladies who have sent you that when a woman seeks the pleasure of her husband and carries out her domestic functions to his satisfaction, she gets the same reward as the men get for all their services to Allah.\" Hadhrat Asma (Radhiyallaho anha) returned very happily after getting this reply to her question. Obedience to and good behaviour towards husbands is a very great asset for the women, provided they know its value. The Sahabah once said to the Prophet (Sallallaho alaihe wasallam): \"In foreign countries, people prostrate before their kings and chiefs. You deserve such reverence much more.\" He said, \"No. If it were permissible to prostrate before any- body besides Allah. I would asked the women to prostrate before their husbands.\" He then said, \"By him Who has my life in His hand, a woman cannot do what she owes to Allah until she has done what she owes to her husband.\" 188 0 9 It is reported in a Hadith that once a camel bowed in prostration before the Prophet (Sallallaho alaihe wasallam). The Sahabah on seeing this, said: \"When this animal prostrates before you, why should we not have this honour too?\" He replied: \"Never. If I could make somebody prostrate before any- body besides Allah, I would ask the wives to prostrate before their husbands.\" The following is reported to have been said by the Prophet (Sallallaho alaihe wasallam) in this connection: (1) \"A woman whose husband is pleased with her at the time of her death goes straight into Paradise.\" (2) \"A woman is cursed by the angels if her husband is displeased with her, and she stays away from him in anger for the night.\" (3) \"The Salaat of two persons hardly rises beyond their heads in its flight to heaven. These two per- sons are a run-away slave and a disobedient wife.\" 14. The Story of Hadhrat Umme Ammarah (Radhiyallaho anha). Hadhrat Umme Ammarah (Radhiyallaho anha) is one of those Ansar who embraced Islam in the very beginning. She was among the group that vowed allegience to the Prophet (Sallallaho alaihe wasallam) at Al-Aqabah. Al- Aqabah in Arabic means a narrow Mountain Pass. In the early days of Islam, the new Muslims were persecuted by Qureysh very badly. They would put all hurdles in the way of Tabligh. The Prophet (Sallallaho alaihe wasallam), there- fore, carried on his mission quietly and secretly. People from Madinah who used to come to Mecca for Hajj usually embraced Islam secretly in a mountain pass near Mina, so that Qureysh might not see them. She was in the third such group from Madinah. She participated in most of the battles that were fought after emigration. She took promi- nent part in Uhud, Hudeybiah, Khaiber. Umratul Qadha, Huneyn and Yamamah. In the battle of Uhud, she was forty-three. Her husband and two sons were also fighting in the battle. She took a Q) $ 3 8 2 leather bottle full of water and headed for Uhud. In the be- .e ginning, the Muslims had an upper hand, but the tables g* were turned in another moment and the enemy were in the winning position. She had reached the Prophet (Sallallaho alaihe wasallam), when wave after wave of enemy troops rushed to attack and kill him. She shielded the Prophet (Sallallaho alaihe wasallam) whenever anybody ap- proached him. She had a cloth-belt round her waist full of pieces of lint. She tended the wounded. She herself got about twelve wounds, one of which was very serious. Hadhrat Umme Sa'eed (Radhiyallaho anha) says: \"I once saw a very deep cut on the shoulder of Hadhrat Umme Ammarah (Radhiyallaho anha). I inquired how she had got that. She said, 'I got it in Uhud. When people were running about in confusion, I saw Ibn Qumiah coming towards us and shouting, 'where is Muhammad (Sallallaho alaihe wasallam). Let some- body tell me his whereabouts. If he is saved today, I am no more.' I, Hadhrat Mus'ab bin Umair (Radhiyal- laho anho) and some others intercepted him. He gave me this deep cut on my shoulder. I also attacked him, but he escaped on account of the double coat of mail that he was wearing.\" In spite of a year's treatment, the wound would not heal. In the meantime, the Prophet (Sallallaho alaihe wasallam) de- cided about the expedition to Hamra-ul-Asad. Hadhrat Umme Ammarah (Radhiyallaho anha) also got ready to join the expedition. But as her wound was still unhealed, she could not participate. When the Prophet (Sallallaho alaihe wasallam) returned from the expedition, he straight away went to visit Hadhrat Umme Ammarah (Radhiyallaho anha). He was very happy to find her better. She says: \"In fact, we were very much handicapped in Uhud. The enemy had very strong cavalry, while we fought on foot. There would have been a fair fight if they too had been on foot. When somebody came riding on his horse to attack me, I stopped his sword on my shield and when he turned about, I attacked his horse from the rear and cut its leg. This caused the horse as well as the rider to fall on the ground. As soon as this hap- pened, the Prophet (Sallallaho alaihe wasallam) would 190 shout to my son, who would run to my help and then we both finished the man in no time.\" Her son Hadhrat Abdullah bin Zaid (Radhiyallaho anho) says: \"I had a wound on my left arm, which would not stop bleeding. The Prophet (Sallallaho alaihe wasallam) said to my mother, 'Put a bandage over it.' My mother took out a bandage from her belt and after bandaging f' my wound, said, 'Now, son. go and fight again with the idolaters.' The Prophet (Sallallaho alaihe wasal- lam) was watching us. He said, '0, Umme Ammarah, who can have courage like yours?\" The Prophet (Sallallaho alaihe wasallam) at that time prayed again and again for Hadhrat Umme Ammarah (Rad- hiyallaho anha) and her family. Hadhra: Umme Ammarah (Radhiyallaho anha) says: \"I was standing with the Prophet (Sallallaho alaihe wa- sallam), when one of the enemy passed in front of me. The Pro~;?et (Sallallaho alaihe wasallam] said to me, Umme Ammarah! He is the man who wounded your son.' I jumped at hirn and hit his leg. It made him fall down. We then went foiward and finished him. The Prophet (Sallallaho alaihe wasallam) smiled and said, 'Umme Ammarah has avenged her son.' When the Prophet (Sallallaho alaihe wasallam) was praying for us, I said to him, '0, Prophet of Allah! Pray for my company with you in Paradise.' He favoured me with this prayer too, and after that I cared little for what happened to me ,in this life.\" As has already been said, she also participated in many other battles with the same zeal and spirit. After the death of the Prophet (Sallallaho alaihe wasallam), she took part in the fierce battle of Yamamah, which was fought with the renegades. She lost one of her arms and received eleven other wounds in this battle. She was forty-three in Uhud and fifty-two in Yamamah. Her heroism in these battles at that age was really miraculous. 15. Story of Hadhrat Umme Hakim (Radhiyallaho anha). Hadhrat Umme Hakim (Radhiyallaho anha) was the wife of Ikramah bin Abi Jahl. She participated in Uhud on the enemy side. She embraced Islam on the fall of Mecca. . Spirit for Islam 191 She loved her husband very much, who would not become a Muslim on account of his father, who was the worst enemy of Islam. After the fall of Mecca, her husband fled to Yemen. She secured pardon for him from the Prophet (Sal- lallaho alaihe wasallam) and went to Yemen and induced her husband to return to his home. She told him: \"You can be safe from the sword of Muhammad (Sal- lallaho alaihe wasallam) only when you put yourself in his lap.\" She returned with him to Madinah, where Ikramah em- braced Islam and the couple began to live together happily. They both participated in the Syrian war during the caliph- ate of Hadhrat Abu Bakr (Radhiyallaho anho). Ikmmah was killed in a battle. She was then married to another wuja- hid, Hadhrat Khalid bin Sa'eed (Radhiyallaho anho). It was at a place called Marja-us-Safr that her husband wanted to meet her. She said: \"We have enemy concentrating on all fronts. We shall meet after they are done away with.\" He said: \"I am sure I shall not survive this battle.\" They then shared the bed for the first time in a tent at that place. Next day, Hadhrat Khalid bin Sa'eed (Radhiyallaho anho) was arranging for the Walimah when the enemy at- tacked with full force and he was killed in the battle. Hadh- rat Umme Hakim (Radhiyallaho anha) packed up her tent and other luggage, and, with a tent-peg in her hand, fought the enemy till she had killed seven of them. In war times, not to speak of a woman, no man would like to get married under such circumstances. Look at her marriage in the battle-field and her fight with the enemy! Instead of mourning the loss of her husband on the day of his death, she rushes in to the battle-field and kills seven of the enemy soldiers single-handed. Is this not enough to show the wonderful strength of Iman in women of that time? 16. Martyrdom of Hadhrat Sumayyah (Radhiyallaho anha). Hadhrat Sumayyah (Radhiyallaho anha) is the mother of 'Hadhrat Ammar (Radhiyallaho anho), whose story we have already read in Chapter V. Just like 'Hadhrat Ammar (Radhiyallaho anho) her son, and Yasir her husband, she 192 193 Ch. X : Women's Courage S. Spirit for Islam 13 patiently bore the hardships in various forms in the cause i of Islam. She would not weaken in her love for and devo- tion to Islam in spite of all these afflictions. One day, Hadhrat Sumayyah (Radhiyallaho anha) was standing when Abu Jahl passed that way. He flung all sorts of dirty words at her and then put his spear through her private parts. She died on account of the wound. She is the first to meet martyrdom for the cause of Islam. Patience, perseverence and sacrifice of these ladies are really enviable. No affliction is too much when a person blessed with the spirit of Islam is determined to bear it. We hear about hundreds of persons dying for one cause or the other. It is only dying for the cause of Allah that brings eternal happiness and comfort in the life to come. Persons losing their lives for material gains really lose twice, i.e., in this world as well as in the Hereafter. 17. The story of Hadhrat Asma bint Abu Bakr (Radhiyal- laho anha). Hadhrat Asma bint Abu Bakr (Radhiyallaho anha) is the daughter of Hadhrat Abu Bakr (Radhiyallaho anho), mother of Hadhrat Abdullah bin Zubair (Radhiyallaho anho) and step-sister of Hadhrat Aishah (Radhiyallaho anha). She is one of the famous women of her time. She was the eighteenth person to embrace Islam. She was twenty-seven years old at the time of the Hijrat. After the migration from Mecca, when the Prophet (Sallallaho alaihe wasallam) and Hadhrat Abu Bakr (Radhiyallaho anho) reached Madinah safely, they sent Hadhrat Zaid (Radhiyal- laho anho) and some other Sahabah to bring their families from Mecca. Hadhrdt Asma (Radhiyallaho anho) came to Madinah with Hadhrat Abu Bakr (Radhiyallaho anho's) family. When she reached Quba, she gave birth to Hadh- rat-Abdullah bin-Zubair (Radhiyallaho anho), the first Muslim baby born since the Hijrat. She says: \"When I was married to Hadhrat Zubair (Radhiyallaho anho), he had neither money nor property of any kind. He had only one camel for carrying water and one horse. I would bring fodder for the animals and date- stones to feed them in lieu of grass, bring water from the well, mend bucket myself when needed, and attend to other domestic duties. Attending to the horse was the most difficult of all jobs. I was not good at baking and, therefore, after kneading the flour, I would take it to Ansar women in my neighbourhood, who would bake bread for me. When we arrived in Madi- nah, the Prophet (Sallallaho alaihe wasallam) alloted a piece of land to Hadhrat Zubair (Radhiyallaho anho) two miles away from the town. I would bring date stones from there on my head. One day when I was coming in this fashion, I met the Prophet (Sallallaho alaihe wasallam) with a group of Ansar in the way. He stopped his camel. From his gesture, I understood that he intended to give me a lift. I felt shy of going with men, and I also remembered that Hadhrat Zubair (Rad- hiyallaho anho) was very sensitive in this matter. The Prophet (Sallallaho alaihe wasallam) understood my hesitation and left me alone. When I reached home, I narrated the story to Hadhrat Zubair (Radhiyallaho anho) and told him that, due to my own shyness and his sensitiveness, I did not avail of the offer of the Prophet (Sallallaho alaihe wasallam). He said, 'By Allah I am more sensitive about your carrying the load over such a long distance, but I cannot help it. (In fact, Sahabah remained occupied in striving in the path of Allah and all other such jobs had to be done by their womenfolk. Sometime later, Hadhrat Abu Bakr (Rad- hiyallaho anho) transferred to us a servant that the Prophet (Sallallaho alaihe wasallam) had given to him. I was therefore relieved of attending to the horse, which had been really very hard for me.\" 18. Hadhrat Asma (Radhiyallaho anha) Pacifies her Grandfather. When Hadhrat Abu Bakr (Radhiyallaho anho) emi- grated to Madinah in the company of the Prophet (Sallal- laho alaihe wasallam), he took with him all his money, thinking that the Prophet might need it. It was about 6 000 dirhams. After his departure, his father Abu Quhafah (who was blind and who had not till then accepted Islam) came to express his synlpathy with his granddaughters. Hadhrat Asma (Radhiyallaho anha) says: \"Our grandfather came to us and said, 'Your father has shocked you with his migration to Madinah, and seems to have put you to further hardship by taking all his money with him.' I said, 'No grandfather, do not worry. He has left a lot of money for us.' I collected some pebbles and deposited them in the recess where 194 my father used to keep his money; I covered it with a cloth. I then took my grandfather to the place and placed his hand over the cloth. He thought that the recess was really full of dirhams. He remarked: 'It is good that he has left something for you to live on.' By Allah, my father had not left a single dirham for us: I played this trick simply to pacify my grandfather.\" Look at this brave Muslim girl. Strictly speaking, the girls needed more consolation than their grandfather. Judged by normal course of things, they should have com- plained of their destitution to their grandfather to win his sympathy, as there was nobody else in Mecca to extend them any sympathy or help. But Allah had given such a frame of mind to Muslim men and women of those days that everything they did was really wonderful and worthy of emulation. Hadhrat Abu Bakr (Radhiyallaho anho) was quite a well-to-do person in the beginning, but he always spent lib- erally in the path of Allah. At the time of Tabuk, he con- tributed all that he possessed (This we have already read in Chapter VI). The Prophet (Sallallaho alaihe wasallam) once said: \"No body's wealth has benefited me so much as that of Hadhrat Abu Bakr (Radhiyallaho anho). I have com- pensated everybody for the good done to me, except Hadhrat Abu Bakr (Radhiyallaho anho). He shall be compensated by Allah Himself.\" 19. Hadhrat Asma ' (Radhiyallaho anha's) Spending in Charity. Hadhrat Asma (Radhiyallaho anha) had a very large heart for spending in the path of Allah. In the beginning, she used to spend carefully with measure and weight. Once the Prophet (Sallallaho alaihe wasallam) said to her: \"0, Asma, do not put by and be calculating; spend in the path of Allah liberally.\" After this, she started spending most generously. She would advise her daughters and house maids: \"Don't wait for any surplus or excess' of requirements before spending in the path of Allah. As the require- ments go on increasing in the chances of having some- thing, excess will become more and more remote, and the time for spending in the path of Allah will never come. Remember that you will not lose by spending in charity.\" Although these people were poor and lived hand to mouth, yet they were liberal in spending and generous of heart. The Muslims today complain of their poverty, but there will be hardly any group op people among them who are so poor and needy as the Sahabah used to be. We have already read how they had to go without food for several days together, and how some of them had to keep stones tied on their bellies to relieve their pangs of hunger. 20. The Story of the Prophet Sallallaho alaihe wasallam's Daughter Hadhrat Zainab (Radhiyallaho anha): Hadhrat Zainab (Radhiyallaho anha) was born after five years of the Prophet's (Sallallaho alaihe wasallam) marriage to Hadhrat Khadijah (Radhiyallaho anha), when the Prophet (Sallallaho alaihe wasallam) was thirty years of age. She came of age and then accepted Islam. She was married to her cousin Abul Aas bin Rabi. Her husband fought in Badr for Qureysh and fell a captive to the Mus- lims. When the Qureysh were paying ransom to secure re- lease of their prisoners, Hadhrat Zainab (Radhiyallaho anha) gave over as ransom for her husband the necklace she had received in dowry from her mother Hadhrat Khadi- jah (Radhiyallaho anha). When the Prophet (Sallallaho alaihe wasallam) saw the necklace, the memories of Hadh- rat Khadijah (Radhiyallaho anha) came to his mind and tears were in his eyes. After consultation with Sahabah, he returned the necklace to Hadhrat Zainab (Radhiyallaho ahna) and released her husband without ransom on the condition that he would send Hadhrat Zainab (Radhiyal- laho anha) to Madinah on his return to Mecca. Two men were sent to stay outside Mecca and bring Hadhrat Zainab (Radhiyallaho anha) safely to Madinah, when she was made over to them. Her husband asked his brother Kinanah to take Hadhrat Zainab (Radhiyallaho anha) outside Mecca and make her over to the Muslim escort. As Hadhrat Zainab (Radhiyallaho anha) and Kinanah were moving out of the town on camel's back, the Qureysh sent a party to in- tercept them. Her own cousin Habar bin Aswad flung a 196 spear at her, which wounded her and made her fall from the camel. As she was pregnant, she had an abortion. Kina- nah started sending arrows towards the interceptors, when Abu Sufyan said to him: \"We cannot tolerate the daughter of Muhammad leav- ing Mecca so openly. Let her go back and you can send her secretly after a few days.\" Kinanah agreed. Hadhrat Zainab (Radhiyallaho anha) was despatched after a few days. She suffered from this wound for a long time, till at last she died of the same in 8 A. H. The Prophet said at the time of her death: \"She was my best daughter, for she has suffered much on my account.\" The Prophet (Sallallaho alaihe wasallam) buried her with his own hands. As he went into the grave to lay her down, he looked very sorrowful but, when he came out of the grave, he was quite composed. On the query by the Saha- bah, he said: \"In view of the feebleness of Zainab, I prayed to Allah to remove from her the tortures of the grave, and this prayer has been answered by Allah.\" Just imagine, even the daughter of the Prophet who sacrificed her life for Islam needed a prayer from the Prophet (Sallallaho alaihe wasallam) for protection from difficulties in the grave. What about us people who are so much steeped in sins? It is but necessary that we should always seek protection from the difficulties in the grave. The Prophet (Sallallaho alaihe wasallam) would often seek refuge in Allah from the horrors of the grave. This was all for the instruction of his followers. (0, Allah! protect us from the horrors of the grave by Thy special Favour. Grace and Bounty). I *, +;C, & i; Chi;, r;611, 21. Hadhrat Rubayyi (Radhiyallaho anha's) High-minded- ness: Rubayyi-bint-Mu'awiz (Radhiyallaho anha) was a woman of Ansar, who had participated in many battles, by the side of the Prophet (Sallallaho alaihe wasallam). She nursed the wounded and carried the dead bodies during 3 h = 0s the battle. She had accepted Islam before the Prophet emi- 'G 8 a grated to Madinah. She was married when the Prophet was ~m i in Madinah. He graced her marriage with his presence. He '\" heard some girls singing an epic poem about the battle of Badr at her place. One of them sang a verse, which meant: \"We have among us the Prophet (Sallallaho alaihe wa- sallam), who knows what is to happen tomorrow.\" He stopped her from saying such things , because nobody except Allah knows what is going to happen in future. It was Hadhrat Rubayyi (Radhiyallaho anha's) father Hadhrat Mu'awiz (Radhiyallaho anho) who was one of those who killed Abu Jahl in Badr. Abu Jahl, as we know, was one of the big chiefs of Qureysh and the worst enemy of Islam. There was a woman named Asma who used to sell perfumes to the ladies. She once came to Hadhrat Ru- bayyi (Radhiyallaho anha) to sell perfume. When Hadhrat Rubayyi (Radhiyallaho anha) was introduced to her as the daughter of Hadhrat Mu'awiz (Radhiyallaho anha), she re- marked: \"So you are the daughter of him who killed his chief.\" Hadhrat Rubayyi (Radhiyallaho anha's) high mind could not tolerate the wretched person like Abu Jahl to be men- tioned as the chief of her father. She, therefore, retorted: \"No. I am the daughter of one who killed his slave.\" Asma did not like this epithet for Abu Jahl, and said with anger: \"It is haram for me to sell perfume to you.\" Hadhrat Rubayyi (Radhiyallaho hnha) said, in the same strain, \"It is haram for me to buy perfume from you. I have never found stink in any. perfume except yours.\" Hadhrat Rubayyi (Radhiyallaho anha) says: \"I had used the last words simply to provoke her.\" Look at her sensitiveness and feeling for Islam. She could not tolerate an enemy of Islam being mentioned as a chief. We hear from the lips of Muslims most flowery and high 198 3 CI 0 4 3 4 .! 2 m sounding epithets being used for the open enemies of (Radhiyallaho anho) died in Abyssinia. Hadhrat Saudah Islam. When they are reminded, they call it narrow-mind- (Radhiyallaho anha), now a widow, returned to Mecca. The f edness. The Prophet (Sallallaho alaihe wasallam) says: i Prophet (Sallallaho alaihe wasallam), on the death of Hadh- \"Don't call a Munafiq a chief. You displease Allah when you take him as a chief.\" 22. Life Sketches of Ummuhat-ul-Momineen: Every Muslim likes to know (and he must know) about the members of the family of the Prophet (Sallallaho alaihe wasallam). A very brief account of their lives is, therefore, given in the following pages. The Muhaddithin and histori- ans all agree that eleven ladies had the honour of being the wives of the Prophet (Sallallaho alaihe wasallam). b (1) Hadhrat Khadijah (Radhiyallaho anha) was the first among them. At the time of her marriage, she was 40 years old and the Prophet (Sallallaho alaihe wasallam) was twenty-five. She begot all his children, except a son, Ibra- him. She was first to be married to Waraqah bin Naufal, but this marriage could not take place. Her first husband was Atiq bin Aa'iz. She had a daughter from him, whose name was Hind. H'nd grew up and embraced Islam, and she was the mother o \\ many children. On the death of Atiq. Khadi- jah (Radhiyallaho anha) was married to Abu Halah and got two children from him viz. Hind and Halah. Hind lived up to the time of Ali's Caliphate. On the dzath of Abu Halah, the Prophet (Sallallaho alaihe wasallam) married her as his first wife. She died in Ramadhan of the 10th year of the mission at the age df sixty-five. He loved her very much and did not marry any other woman during her life time. She was populprly called Tahirah (Clean and pure) even before Islam. Her children from other husbands are there- fore known as Banu Tahirah. Her virtues and privileges have been mentioned extensively (in Hadith). The Prophet (Sallallaho alaihe wasallam) laid her in the grave with his own hands. The funeral service had not till then been en- joined. (2) Hadhrat Sauda (Radhiyallaho anha): L. Hadhrat Sauda bint Zam'ah bin Qais (Radhiyallaho anha) was previously married to her cousin Hadhrat Sukran bin 'Amor (Radhiyallaho anho). The couple em- braced Islam and emigrated to Abysinnia. Hadhrat Sukran rat Khadijah (Radhiyallaho anha) (in Shawwal of the same year), married Hadhrat Saudah (Radhiyallaho anha). We know the devotion of the Prophet (Sallallaho alaihe wasal- lam) in his salaat. Once Hadhrat Saudah (Radhiyallaho anha) stood after him in Tahajjud. The next day she said to him: \"0, Prophet of Allah! Last night you took so long in your Ruk'u that I apprehended bleeding from my nose.\" (As she was bulky, the strain might have been too much for her). The Prophet (Sallallaho alaihe wasallam) once in- tended to divorce her. As meanwhile Hadhrat Aishah (Rad- hiyallaho anha) had also been married to the Prophet (Sallallaho alaihe wasallam), she said: \"G, Prophet of Allah! I am ready to forego my turn in favour of Hadhrat Aishah (Radhiyallaho anha), but I don't like to be divorced (by you). I wish to be in Par- adise as one of your wives.\" The Prophet (Sallallaho alaihe wasallam) agreed to this suggestion. She died in about 55 A. H. towards the end of the Khilafat of Hadhrat Umar (Radhiyallaho anho). There was another Qureysh woman of the same name. She was also a widow having about six children. The Prophet offered to marry her, but she said: \"0, Prophet of Allah! You are dearer to me than any other person in this world. I do not like my children to be a nuisance to you.\" He appreciated this, and withdrew the offer. (3) Hadhrat A.ishah (Radhiyallaho anha): Hadhrat Aishah (Radhiyallaho anha) too was married to the Prophet (Sallallaho alaihe wasallam) in Swawwal of the 10th year of the Nubuwwat. She was born in the 4th year of Nubuwwat and was married when she was six, but was actually sent by her parents to live with the Prophet (Sallallaho alaihe wasallam) after his emigration to Madi- nah, when she was nine. She was eighteen at the time of 200 .C thes Prophet Sallallaho alaihe wasallam's death. She died on the night of Tuesday, the 17th Ramadhan, 57 A. H., at the age of sixty-six. She desired at the time of her death that she might be buried, along with other Ummahat-ul- Momineen, in the public graveyard, though she could be buried by the side of the Prophet's grave, which was in her house. She was the only wife of the Prophet who had not been married previously. All the remaining wives had either been widowed or divorced (some quite a few times) before they became Ummuhat-ul-Momineen. To be married in Shawwal was considered a bad omen among the Arab women. Hadhrat Aishah (Radhiyallaho anha) says: \"I was married in Shawwal. It was also Shawwal when I was sent to live with the Prophet (Sallallaho alaihe wasailam). Which of the Prophet (Sallallaho alaihe wa- sallam's) wives has been more blessed with his love ! and Allah's other favours than me?\" Oh the death of Hadhrat Khadijah (Radhiyallaho anha), Hadhrat Khaulah bint Hakim (Radhiyallaho anha) came to the Prophet (Sallallaho alaihe wasallam) and said: \"0, Prophet of Allah! Don't you like to marry again?\" The Prophet (Sallallaho alaihe wasallam): \"Whom can I marry?\" Khaylah: \"I know one virgin and one widow.\" The Prophet (Sallallaho alaihe wasallam): \"Name them.\" Khaulah: t \"The virgin is Aishah, (Radhiyallaho anha) the daugh- ter of your bosom friend Abu Bakr (Radhiyallaho anho), and the widow is Saudah bint Zam'ah.\" The Prophet (Sallallaho alaihe wasallam): \"All right! You may make the proposal.\" Hadhrat Khaulah (Radhiyallaho anha) then went to Hadhrat Aisha (Radhiyallaho anha's) mother Hadhrat Umme-Rooman (Radhiyallaho anha) and said to her: C \"I have come with good tidings for your family.\" 2 a LI 0s a Hadhrat Khaulah (Radhiyallaho anha): 8 : \"The Prophet (Sallallaho alaihe wasallam) has sent me $d * to seek Hadhrat Aishah (Radhiyallaho anha's) hand for him\" Hadhrat Umme Rooman (Radhiyallaho anha): \"But 'Hadhrat Aishah (Radhiyallaho anha) is like his niece. How can she be married to him? Let me consult her father.\" Hadhrat Abu Bakr (Radhiyallaho anho) was not at home at that time. When he came, the proposal was placed before him, and he expressed the same difficulty. Hadhrat Khaulah (Radhiyallaho anho) returned to the Prophet (Sal- lallaho alaihe wasallam) and apprised him of their diffi- culty. The Prophet (Sallallaho alaihe wasallam) said: \"Abu Bakr is my bosom friend and brother-in-Islam, but this does not forbid my marrying his daughter.\" Hadhrat Khaulah (Radhiyallaho anho) went and informed Hadhrat Abu Bakr (Radhiyallaho anho) accordingly. Abu Bakr (Kadhiyallaho anho) was extremely glad to call the Prophet (Sallallaho alaihe wasallam) to his home and per- form Aishah's (Radhiyallaho anha) Nikah with him. A few months later, when the Prophet (Sallallaho alaihe wasal- lam) had emigrated to Madinah, Hadhrat Abu Bakr (Rad- hiyallaho anho) said to the Prophet: \"Why don't you have your wife Hadhrat Aishah (Rad- hiyallaho anho) to live with you?\" He said: \"I have to make some preparations, etc., before I do that.\" Hadhrat Abu Bakr (Radhiyallaho anho) presented him with some money, with which necessary things were arranged. Hadhrat Aishah (Radhiyallaho anho) then started living with the Prophet from Shawwal of 1 or 2 A. H. She shared the bed with the Prophet (Sallallaho alaihe wasallam) for the first time in Hadhrat Abu Bakr (Radhiyallaho anho's) house. These are the three marriages, which the Prophet (Sal- lallaho alaihe wasallam) had before Hijrah. All the remain- ing wives were taken by him in Madinah. Hadhrat Umme Rooman (Radhiyallaho anha): (4) Hadhrat Hafsah (Radhiyallaho anho): \"What is that?\" Hafsah was the daughter of 'Hadhrat Umar (Radhiyal- 202 laho anho) who was born in Mecca five years before the Nubuwwat. She was first married to Hadhrat Khunais bin Huzaifah (Radhiyallaho anho), who was one of the very early Muslims. He first emigrated to Abyssinia and then to Madinah. He participated in Badr, and was fatally wounded in Badr (or in Uhud) and died of the wound in the year 1 or 2 A. H. Hadhrat Hafsah (Radhiyallaho anho) had also emigrated to Madinah with her husband. When her husband died, Hadhrat Umar (Radhiyallaho anho) went to Hadhrat Abu Bakr (Radhiyallaho anho) and said: \"I want to give Hafsah in marriage to you.\" Hadhrat Abu Bakr (Radhiyallaho anho) kept quiet and said nothing. Meanwhile Ruqayyah (Radhiyallaho anho) the daughter of the Prophet (Sallallaho alaihe wasallam) and the wife of 'Hadhrat Usman (Radhiyallaho anho) died. 'Hadhrat Umar (Radhiyallaho anho) went to Hadhrat Usman (Radhiyailaho anho) and offered Hadhrat Hafsah (Radhiyallaho anho's) hand to him. He declined by saying. \"I have no mind to marry for the present.\" 'Hadhrat Umar (Radhiyallaho anho) complained of this to the Prophet. The Prophet said: \"I tell you of a husband for Hafsah better than 'Usman, and of a wife for 'Usma.n better than Hafsah.\" He then took Hadhrat Hafsah (Radhiyallaho anho) as his next wife, and gave his own daughter Hadhrat Umme Kulsum (Radhiyallaho anha) in marriage to 'Hadhrat (Rad- hiyallaho anho) Usman. Hadhrat Abu Bakr (Radhiyallaho anho) later said to 'Hadhrat 'Usman Umar (Radhiyallaho anho): I \"When you offered Hafsah's hand to me, I kept quiet as the Prophet had expressed to me his intention of mar- rying her. I could neither accept your offer nor disclose the Prophet's secret to you. I, therefore. kept quiet. If the Prophet (Sallallaho alaihe wasallam) had changed his mind, I would have gladly married her.\" 'Hadhrat Umar (Radhiyallaho anho) says: \"Abu Bakr's silence over the offer was in fact more shocking to me than 'Usman's rejection.\" Hadhrat Hafsah (Radhiyallaho anha) was a very pious woman, and very much devoted to Salaat. She would often fast during the day and spend the night in prayers. Once the Prophet (Sallallaho alaihe wasallam), for some reason, was displeased with Hafsah and even pronounced the first divorce to her. 'Hadhrat Umar (Radhiyallaho anho) was na- turally very much shocked over this. Jibra-eel Alayhis came to the Prophet (Sallal Salaam laho alaihe wasallam) and said: \"Allah wants you to take Hafsah back, as she is fasting often and spending her nights in Salaat, and also Allah wants it for Hadhrat Umar's (Radhiyallaho anho) sake.\" The Prophet (Sallallaho alaihe wasallam) therefore took her back. She died in Jamadil oola, 45 A. H., at the age of 63. (5) Hadhrat Zainab bint Khuzaimah (Radhiyallaho anha): Hadhrat Zainab (Radhiyallaho anha) was the next to be married to the Prophet (Sallallaho alaihe wasallam). There are divergent reports about her previous husbands. Accord- ing to one report, she was first married to Hadhrat Abdul- lah bin Jahsh (Radhiyallaho anho) who was killed in Uhud, as we have already seen in his story in chapter VI1. Accord- ing to another report, she was first married to Tufail ibnul a1 Harith and when divorced by him was remarried to his brother Ubaidah ibnul Harith, who was killed in Badr. The Prophet (Sallallaho alaihe wasallam) married her in Ramadhan, 3 A. H. She lived with the Prophet (Sallallaho alaihe wasallam) for eight months only, as she died in Rabi-ul-Akhir, 4 A. H. Hadhrat Zainab and Hadhrat Khadi- jah (Radhiyallaho anhuma) are the two wives of the Prophet who died during his life time. All the other wives lived on after him and died later. Hadhrat Zainab (Rad- hiyallaho anha) spent very liberally on the poor, and was known as 'Ummul Masakin' (mother of the poor) even before Islam. After her death, the Prophet (Sallallaho alaihe wasal- lam) married Hadhrat Umme Salmah (Radhiyallaho anha). (6) Hadhrat Umme Salamah (Radhiyallaho anha): She was the daughter of Hadhrat Abu Ummayvah. (Radhiyallaho anho). She was first married to her cousin Hadhrat Abdullah bin Abdul Asad known as Abu Salamah (Radhiyallaho anho). The couple embraced Islam in the very beginning and emigrated to Abyssinia, due to the per- 204 secutions of Qureysh. A son was born to them in exile, who was named Salamah. After returning from Abyssinia, the family emigrated to Madinah. Hadhrat Umme Salamah's (Radhiyallaho anha) story about her journey to Madinah has been already given in the early part of the chapter. After reaching Madinah, Hadhrat Umme Salmah (Radhiyal- laho anha) got another son 'Umar and two daughters, Durrah and Zainab (Radhiyallaho anhum). Hadhrat Abu Salamah (Radhiyallaho anho) was the eleventh man to em- brace Islam. He participated in the battle of Badr as well as in Uhud. He got a severe wound in Uhud, which did not heal for a long time. He was sent by the Prophet (Sallallaho alaihe wasallam) in an expedition in Safar, 4 A. H. When he returned from the expedition, the old wound again started giving trouble and at last he died of the same on 8th Jamadil-Akhir, 4 A. H. Hadhrat Umme Salamah (Radhiyal- laho anha) was pregnant at the time. Zainab was born to her after the death of her husband. After she had completed her Iddat (waiting period), Hadhrat Abu Bakr (Radhiyal- laho anho) proposed to marry her, but she declined. Later, the Prophet (Sallallaho alaihe wasallam) offered to marry her. She said: \"0, Prophet of Allah! I have quite a few children with me and I am very sensitive by nature. Moreover, all my people are in Mecca, and their permission for getting remarried is necessary.\" The Prophet (Sallallaho alaihe wasallam) said: \"Allah will look after your children and your sensi- tiveness will vanish in due course. None of your people will dislige the proposed marriage\". She then asked her (eldest) son Hadhrat Salamah (Rad- hiyallaho anho) to serve as her guardian and give her in marriage to the Prophet (Sallallaho alaihe wasallam). She was married in the end of Shawwal, 4 A. H. She says: \"I had heard from the Prophet (Sallallaho alaihe wasallam) that a person struck with a calamity should recite this prayer: \"0, Allah! Recompense me for this affliction by giving me something better than what I have lost: then Allah 205 k 5 a, oe c . Spirit for Islam L :\" 8 3 k \" would accept his prayer.\" I had been reciting this .=% prayer since the death of Hadhrat Abu Salamah (Rad- z m hiyallaho anho), but I could not imagine a husband better than he. till Allah arranged my marriage with the Prophet (Sallallaho alaihe wasallam).\" 1 Hadhrat Aishah (Radhiyallaho anha) says: i i \"Umme Salamah (Radhiyallaho anha) was famous for her beauty. Once I contrived to see her. I found her much more beautiful than I had heard. I mentioned this to Hafsah who said. \"In my opinion, she is not as beautiful as people say.\" She was the last of the Prophet (Sallallaho alaihe wasal- lam's) wives to die. It was in 59 or 62 A. H. She was 84 at the time of her death, and as, such she was born 9 years 1 before Nubuwwat. As has already been said, the Prophet (Sallallaho alaihe wasallam) married her after the death of Hadhrat Zainab bint Khuzaimah (Radhiyallaho anha). She therefore lived in Hadhrat Zainab (Radhiyallaho anha's) house. She found a hand-mill, a kettle and some barley in an earthen jar, lying in the house. She milled some barley and after putting some fat cooked a preparation, which she served to the Prophet (Sallallaho alaihe wasallam) on the very first day of her marriage with him. (7) Hadhrat Zainab bint Jahsh (Radhiyallaho anha): She was the Prophet (Sallallaho alaihe wasallam's) i cousin. She was first given in marriage by the Prophet (Sal- I lallaho alaihe wasallam) to his adopted son Hadhrat Zaid I bin Hari thah (Radhiyallaho anho). When Hadhrat Zaid i (~adhi~allaho anho) divorced her, she was married to the Prophet (Sallallaho alaihe wasallam) by command of Allah, 1 1 as mentioned in Soorah A1 Ahzab. This took place in 5 A. I H; at that time, she was 35. She w 2s therefore born 17 years before Nabuwat. She was always proud of the fact that, while all the other wives were given in marriage to the Prophet by their guardians, it was Allah Himself Who did this for her. When Hadhrat Zaid (Radhiyallaho anho) div- orced her and she had completed her Iddat, the Prophet t (Sallallaho alaihe wasallam) sent the proposal to her. She said: \"I cannot say anything until I have consulted my 206 Allah.\" She performed Wudhu, said two rakaat of Salaat, and prayed to Allah: \"0, Allah! Thy Prophet proposes to marry me. If I am fit for the honour, then give me in his marriage.\" Allah answered her prayer by revealing the following verse to the Prophet (Sallallaho alaihe wasallam): \"So when Zaid had performed the necessary formality (of divorce) from her, we gave her unto thee in mar- riage, so that (henceforth) there may be no sin for be- lievers in respect of the wives of their adopted sons, when the latter have performed the necessary formality (of release) from them. The Commandment of Allah must be fulfilled.\" (XXXIII: 3 7) When she received the good news about this revel- ation, she prostrated before Allah in thanksgiving. The Prophet (Sallallaho alaihe wasallam) arranged a big feast of Walimah for this marriage. A goat was slaughtered and mutton-curry with bread was served to the guests. People came in groups, and were served till all of them were fed. Hadhrat Zainab (Radhiyallaho anha) had a very large heart for spending in the way of Allah. She earned by working with her hands and spent all her earnings in charity. It was about,her that the Prophet (Sallallaho alaihe wasallam) prophesied: \"My wife with long hands will be the first to meet me after my death.\" The wives took this to mean the physical length of arms and began to measure their hands with a stick. The hands of Hadhrat Saudah (Radhiyallaho anha) came out to be the longest by measurement. But when Hadhrat Zainab (Rad- hiyallaho anha) died first, the meaning of the metaphor used by the Prophet (Sallallaho alaihe wasallam) dawned upon them. She fasted very often. She died in 20 A. H. and 'Umar (Radhiyallaho anho) led the funeral service. She was fifty at the time of her death. (8) Hadhrat Juwairiah bintul Harith (Radhiyallaho anha): Spirit for Islam 207 114 Hadhrat Juwairiah (Radhiyallaho anha) was the daugh- / ter of Harith, the chief of Banu Mustaliq and was married to Musafe' bin Safwan. She was one of the large number of captives who fell ! into Muslim hands after the battle of Muraisee', and she was given to Hadhrat Thabit bin Qais (Radhiyallaho anho). He offered to release her for 360 Dirhams. She came to the Prophet (Sallallaho alaihe wasallam) and said: \"0, Prophet of Allah! I am the daughter of Harith who is the chief of the tribe, and you know my story. The ransom demanded by Hadhrat Thabit (Radhiyallaho anho) is too much for me. I have come to seek your help in the matter.\" The Prophet (Sallallaho alaihe wasallam) agreed to pay her ransom, set her free, and offered to take her as his wife. She was very glad to accept this offer. She was married to the Prophet in 5 A. H. and as a consequence of this marriage, the prisoners of Banu Mustaliq (Juwairiah's tribe), about a hundred families, were all set free by the Muslims. \"The tribe which was so honoured by the Prophet's relation- ship,\" they said, \"should not remain in slavery.\" Such were the noble expediences in all the marriages of the Prophet. Hadhrat Juwairiah (Radhiyallaho anha) was very pretty, her face was very attractive. Three days before her falling captive in the battle, she had seen in her dream the moon coming out from Madinah and falling into her lap. She says: \"When I was captured, I began to hope that my dream would come true.\" She was 20 at the time of her marriage with the Prophet (Sallallaho alaihe wasallam). She died in Rabi-ul-Awwal, 50 A. H., in Madinah at the age of 65. , (9) Hadhrat Umme Habibah (Radhiyallaho anha): She was the daughter of Abu Sufyan, and was first married to Ubaidullah bin Jahsh in Mecca. The couple em- braced Islam, and then emigrated to Abyssinia due to per- secution by the Qureysh. One night she saw her husband (in a dream) in the most ugly and obnoxious form. The next day she came to know that he had turned Christian. She, however, remained a Muslim and was therefore separated from him. She was now all alone in exile. But Allah soon 208 14 . Spirit for Islam 209 recomperised her loss. The Prophet (Sallallaho alaihe wa- sallam) sent her an offer of marriage through the King Negus, who sent a woman named Abrahah to her with the message. She was so happy with the good news that she made over the bracelets and other jewellery that she was wearing to the woman in gratification. King Negrls rep- resented the Prophet (Sallallaho alaihe wasallam) in the Nikah ceremony, and gave her 400 dinars as her portion and many other things in dowry from himself. He also gave a feast and dinars as gift to all those who were present in the ceremony. The Negus then despatched her to Madinah with her dowry and other gifts such as perfume, etc. This marriage took place in 7 A. H. (Her father was not a Muslim then). She most probably died in 44 A. H. (10) Hadhrat Safiyyah (Kadhiyallaho anha): She was the daughter of Hayi, who was a descendant of Hadhrat Harun (Alaihis salaam) the brother of Hadhrat Moosa (Alaihis salaam). She was first married to Salam bin Mishkam and then to Kinanah bin Abi Huqaiq at the time of Kheybar. Kinanah was killed in the battle and she was captured by the Muslims. Hadhrat Dahya Kalbi (Radhiyal- laho anho) requested for a maid, and the Prophet made her over to him. At this, the other Sahabah approached the Prophet (Sallallaho alaihe wasallam) and said: \"0, Prophet of Allah! Banu Nazir and Banu Quraizah (the Jewish tribes of Madinah) will feel offended to see the daughter of a Jewish chief working as a maid. We therefore suggest that she may be taken as your own wife.\" I The Prophet paid a reasonable sum of money to Hadhrat Dahya (Radhiyallaho anho) as ransom, and said to Sa- fiyyah: \"You are now free: if you like you can go back to your tribe or can be my wife.\" She said: \"I longed to be with you while I was a Jew. How can I leave you now, when I am a Muslim?\" This is probably a reference to the fact that she once saw in -her dream a portion of the moon falling into her lap. When she mentioned her dream to Kinanah, he smote her face. so severely that she developed a mark on her eye. He said: \"You seem to be desiring to become the wife of the King of Madinah.\" Her father is also reported to have treated her similarly when she related the same or similar dream to him. She again saw (in her dream) the sun lying on her breast. When she mentioned this to her husband, he remarked: \"You seem to be wishing to become the Queen of Mad- inah.\" She says: \"I was seventeen when I was married to the Prophet (Sallallaho alaihe wasallam). She came to live with the Prophet (Sallallaho alaihe wasallam) when he was camping at the first stage from Khaiber. Next morning, he said to the Sahabah: \"Let everybody bring whatever he has got to eat.'' They brought their own dates, cheese, butter, etc. A long leather sheet was spread and all sat round it to share the food among themselves. This was the Walimah for the mar- riage. She died in Ramadhan, 50 A. H., when she was about 60. (II ) Hadhrat Maimoonah (Radhiyallaho anha): She was the daughter of Harith bin Hazan. Her original name was Barrah, but she was later renamed Maimoonah by the Prophet (Sallallaho alaihe wasallam). She was first married to Abu Rahm bin Abdul Uzza. According to some reports, she was married twice before she became Ummul Mominin. She had been widowed lately when the Prophet (Sallallaho alaihe wasallam) married her at Saraf, a place lying on his journey to Mecca for 'Umrah in Zul Qa'dah 7 A. H. He had intended to start living with her when in Mecca after performing 'Umrah but, as Qureysh did not allow him to enter Mecca, he called her over to him in the same place on his return journey. Many years later she died and was buried exactly at the same place in 51 A. H. (when she was 81). This is a strange coincidence that at a certain place during one journey she is married, at the same place on the return journey she starts living with the Prophet. (Sallallaho alaihe wasallam) and at the very place during another journey she dies and is buried. Hadhrat Aishah (RAdhiyallaho anha) savs: 210 \"Maimoonah was the most pious, and the most mind- ful of her kith and kin, among the Prophet's wives.\" Hadhrat Yazid bin Asam (Radhiyallaho anho) says: \"She was seen either engaged in Salat or in domestic work. When she was doing neither, she was busy in Miswak.\" She was the last woman to be married by the Prophet (Sal- lallaho alaihe wasallam). Certain Muhaddithin have, how- ever, mentioned one or two other marriages contracted by the Prophet (Sallallaho alaihe wasallam). Appendix: The Sons of The Prophet (Sallallaho alaihe wasallam): The Prophet (Sallallaho alaihe wasallam) had three sons and four daughters. All the children were born from Hadhrat Khadija (Radhivallaho anha), except the son Ibra- him. Qasim was his first son, born to him before Nubuw- wat. He died when he was two. Abdullah, the second son, was born after Nubuwwat. He was, hence, called Tayyab and Taahir. He also died in his childhood. At the time of his death, the Qureysh rejoiced and said: \"Muhammad is without a son, and will therefore be without posterity. His name will also die out with his death.\" It was on this occasion that Soorah Al-Kauthar was re- vealed by Allah. It said: \"Lo! We have given thee Abundance. So pray unto thy Lord, and sacrifice. Lo! it is thy detractor (not thou) (XVIII: 1 to 3) who is without posterity.\" Even after more than thirteen hundred years, tci :v there are millions who are proud to be connected to him in love and devotion. Ibrahim, the third son and last child, was born in Mad- inah in 8 A. H. The Prophet (Sallallaho alaihe wasallam's) wonla11 slave Mariah begot this for him. The Prophet (Sal- lallaho alaihe wasallam) performed the Aqiqah ceremorly on the seventh day of his birth. Two lambs were slaugh- tered, the child's head was shaved by Hadhrat Abu Hind Bayazi (Radhiyallaho anho), silver equal in weight to his hair was spent in charity, and the hair was buried. The Prophet (Sallallaho alaihe wasallam) said: \"I am naming my child after the name of my forefather Ibrahim (Alaihis salaam).\" This son also died, on 10th of Rabi-ul-Awwal, 10 A. Ii., when he was only 18 months old. The Prophet (Sallallaho alaihe wasallam) then remarked: \"Allah has appointed a heavenly nurse to tend to Ibra- hirn in the gardens of Paradise.\" The Daughters of the Prophet (Sallallaho alaihe wasal- lam): (1) Hadhrat Zainab (Radhiyallaho anha): She was the eldest daughter of the Prophet (Sallallaho alaihe wasallam) and was born in the fifth year of his first marriage, when he was thirty. She embraced Islam and was married to her cousin Abul Aas bin Rabi. The story of her emigration to Madinah and her getting wounded by the Qu- reysh has already been given in the early part of this chap- ter. She suffered long from that wound, and at last died of it in the beginning of 8 A. H. Her husband also embraced Islam later and joined her in Madinah. She had a son Ali (Radhiyallaho anho). and a daughter Amamah. Ali died during the life time of the Prophet (Sallallaho alaihe wasal- lam). This same Ali (Radhiyallaho anho) was the person who sat with the Prophet (Sallallaho alaihe wasallam) on the camel's back at the time of his triumphal entry into Mecca. We read frequently in Hadith about a little girl riding on the back of the Prophet (Sallallaho alaihe wasal- lam) as he prostrated in Salaat; this was Amamah, Zainab's (Radhiyallaho anha) daughter. She lived long after the death of the Prophet (Sallallaho alaihe wasallam). Ali (Rad- hiyallaho anho) married her on the death of Fatima (Rad- hivallaho anha)-his first wife. It is said that Fatimah (Radhiyallaho anha) at the time of her death had expressed a desire for this union. She had no issue from Ali (Rad- hiyallaho anho). After Hadhrat Ali's (Radhiyallaho anho) death she was again married to Hadhrat Mughirah bin Naufal (Radhiyallaho anho), from whom she probably got one son named Yahya. She died in 50 A. H. 212 (2) Hadhrat Ruqayyah (Radhiyallaho anha): She was born three years after the birth of Hadhrat Zainab (Radhiyallaho anha), when the Prophet (Sallallaho alaihe wasallam) was 33. She was married to Utbah, son of Abu Lahab, the Prophet's (Sallallaho alaihe wasallam) uncle, but had not yet started living with him when Soorah Al-Lahab was revealed. Abu Lahab called his sons Utbah and Utaibah (to whom Umme Kulsum, another daughter of the Prophet (Sallallaho alaihe wassallam) was married), and said to them: \"Unless you both divorce the daughters of Muham- mad, I am not going to see your faces.\" They divorced their wives. Later, upon the fall of Mecca, Utbah embraced Islam. Hadhrat Ruqayyah (Radhiyallaho anha) after this divorce was married to Hadhrat 'Usman (Radhivallaho anho). The couple emigrated to Abyssinia twice. as we have already seen in chapter I. Since the Prophet (Sallallaho alaihe wasallam) had an- nounced to the Sahabah that he was expecting to receive Allah's command for emigration to Madinah any time, they started shifting to Madinah even before the Prophet's (Sal- lallahoalaihe wassallam) Hijrat. Hadhrat Usman (Radhiyal- Laho anho) and Hadhrat Ruqayyah (Radhiyallaho anha) had also emigrated to Madinah before the Prophet (Sallallaho alaihe wasallam) arrived in the town. At the time of Badr, Ruqa!lvah was ill (she died subsequently of this illness). 'Usman (Radhiyallaho anho) was, therefore, asked by the Prophet (Sallallaho alaihe wasallam) to stay in Madinah and look after her. The news about the victory in Badr was received in Madinah when people were returning from Ru- qayyah's funeral. The Prophet (Sallallaho alaihe wasallam) was, therefore, not present at her burial. A son was born to Hadhrat Ruqayyah (Radhiyallaho anha) in Abvssinia. He was named Abdullah and survived his mother. but died in 4 A. H. when he was six years old. (3) Hadhrat U~nme Kulsum (Radhiyallaho anha): She is the third daughter of the Prophet (Sallallaho alaihe wasallam). She was married to Utaibah son of Abu Lahab, but had not yet started living with him when Utai- bah divorced her after the revelation of Soorah Al-Lahab, as has already been mentioned. After divorcing her, Utaibah . Spirit for Islam 213 g 4 $.p came to the Prophet (~allall'aho alaihe wasallam) and used most insolent words to him. The Prophet (Sallallaho alaihe $4 g m wasallam) cursed him by praying: \"0, Allah! depute one of Thy dogs to punish him.\" Abu Talib, who had also not embraced Islam, was alarmed at the curse and said to Utaibah: \"YOU have no way out now.\" Once Utaibah was accompanying Abu Lahab in a caravan going to Syria. Abu Lahab; in spite of his disbelief, said to the people: \"I am afraid of Muhammad's curse. Everybody should be very careful of my son.\" They happened to camp at a place which was inhabited by lions. The people piled up all their luggage and Utaibah was made to sleep on top of the pile, while the rest of the people slept around the pile. A lion came at night; it smelt all the people sleeping round the pile. Then it jumped over the people and reached Utaibah. He gave out a shriek, but meanwhile the lion had severed his head from his body. It is very necessary that we avoid, offending the eople dear to Allah. The Prophet (Sallallaho alaihe wasal am) has re- P ported Allah as saying: \"I give a challenge of war to one who offends My friends.\" After the death of Hadhrat Ruqayyah (Radhiallaho anha), Hadhrat Umme Kulsum (Radhiyallaho anha) was also married to Hadhrat 'Usman (Radhiyallaho anho) in Rabi-ul-Awwal, 3 A. H. The Prophet (Sallallaho alaihe wa- sallam) said: \"I have given Umme Kulsum in marriage to Usman by Allah's command.\" She died issueless in Shaaban, 9 A. H. After herdeath, the Prophet (Sallallaho alaihe wasallam) is reported to have re- marked: \"Even if I had one hundred daughters, I would have given all of them in marriage to 'Usman (one after the other), if each one had died.\" 214 (4) Hadhrat Fatimah (Radhiyallaho anha): Hadhrat Fatimah (Radhiyallaho anha) the fourth and the youngest daughter of the Prophet (Sallallaho alaihe wa- sallam), and the \"head of the ladies in Paradise\" was born in the 1st year of Nubuwwat, when he was 41. It is said that the name Fatimah (lit: safe from fire) was revealed by Allah. She was married to Ali (Radhiyallaho,anho) in 2 A. H. and she began to live with him seven and a half months later. She was about fifteen and Ali was 21 at the time of their union. Of all the daughters, she was the most loved by the Prophet (Sallallaho alaihe wasallam); whenever he went out on a journey, she was the last one to part with and when he returned home she was the first one to meet him. When Ali (Radhiyallaho anho) intended to marry Abu Jahal's daughter, she was very much grieved and expressed her grief to the Prophet (Sallallaho alaihe wasallam). The Prophet (Sallallaho alaihe wasallam) said to Ali (Radhiyal- laho anho): \"Fatimah is a part of my body. Whoever grieves her, grieves me. \" Ali (Radhiyallaho anho) gave up the idea of the second marriage during her life time. After her death, he married her niece Amamah (Radhiyallaho anha), as we have already seen in the previous pages. 1 It was about six months after the death of the Prophet (Sallallaho alaihe wasallam) that Fatimah fell ill. One day, she said to her maid: \"I want to takep bath. Arrange some water for me.\" She took a bath and changed her clothes. She then desired her bed to be placed in the middle of the room. She laid herself down on the bedding, with her face towards Qiblah, and her right hand under her right cheek, and said: \"I am now going to die.\" The next moment she was no more. The Prophet's (Sallal- laho alaihe wasallam) progeny continued and shall con- tinue (inshallah) through her children. She had three sons and three daughters. Hasan (Radhiyallaho anho) and Hus- sain (Radhiyallaho anho) were born in the second and the third year after the marriage, respectively. Muhassan (Rad- hiyallaho anho), the third son, was born in 4 A. H.,. but died in childhood. . Spirit for lslam 215 Ruqayyah, her first daughter, died in infancy and has, therefore, not been mentioned much in history. Her second daughter Umme Kulsum was first married to Hadhrat Umar (Radhiyallaho anho), begetting one son Zaid and one daughter Hadhrat Ruqayyah. On Hadhrat 'Umar (Radhiyal- laho anho's) death, Hadhrat Umme Kulsum (Radhiyallaho anhaj was married to Aun bin Ja'far, but had no issue from him. After his death, his brother Muhammad bin Ja'far mar- ried her. A daughter was born to them, who died in child- hood Even Muhammad (Radhiyallaho anho) died in her lifetime and she was again married to the third brother, Abdullah bin Ja'far (Radhiyallaho anho), from whom she had no issue. She died as Abdullah's wife. Her son Zaid also died the same day, and both were carried for burial at the same time. Abdullah, 'Aun and Muhammad (Radhiyal- laho anhum) have already been mentioned as sons of Ja'far (Radhiyallaho anho) and nephews of Ali (Radhiyallaho anho) in chapter VI. Zainab, Hadhrat Fatima's (Radhiyallaho anha) third daughter, was married to Abdullah bin Ja'far and had two sons Abdullah and Aun from him. It was after her death that he married her sister Hadhrat Umme Kulsum (Rad- hiyallaho anha). Hadhrat Ali (Radhiyallaho anho) had many other children from his wives after Fatimah. It is stated that he had as many as thirty-two issues. Hasan (Radhiyallaho anho) had fifteen sons and eight daughters, while Husain (Radhiyallaho anho) was the father of six sons and three daughters. 217 CHAPTER XI THE CHILDREN-THEIR DEVOTION TO ISLAM The true spirit of Islam that we find in the children of Sahabah's time was the fruit of the upbringing which they received at the hands of their parents. The parents and guardians of our times spoil the children by over fondling them. If, instead, they inculcated in their young hearts the importance of Islamic practices, these could easily become their habits when they grow up. When we see a child doing something undesirable, we simply brush it off by saying, 'He is but a child.' We have seen some parents even feeling happy over their darling (child) having sufficient grown up to do such unseemly things. We deceive ourselves when we say, on seeing a child doing something un-Islamic, that he will be all right when he grows up. How can a bad seed grow up into a good plant? If you really wish your child to be a good Muslim when he is grown up, you have to sow the seed of Iman and Islam in his heart right from his childhood. The Sahabah were very particular about training their children in Islamic practices. and they kept a watchful eye on their doings. In Hadhrat 'Umar's (Radhiyallaho anho) time, a person was arrested by the police for drinking in Ramadhan. When he was brought before Hadhrat 'Umar (Radhiyallaho anho), he said to him: t \"Woe to you! Even our children are keeping fast in this month.\" He was punished with eighty lashes and was banished from Madinah for ever. 1. Children keep fast. Hadhrat Rubbayi' bint Mu'awwaz (Radhiyallaho anha) (who was mentioned in the last chapter) says: \"Once the Prophet (Sallallaho alaihe wasallam) en- joined on us to fast on the 10th of Muharram. Since then we have always been fasting on that day. Even the children were made to fast with us. When they cried endurance were dec:idecllv of much higher standard than ours. But. are we really doing even what we can easily bear'! Surely. we should not impose on our children what they cannot stand, but we rllust tax them with what they (:an easilv endure. 2. Hadhrat Aishah's (Radhiyallaho anha) Zeal for Knowledge. kiadhrat Aishah (Kadhivallaho anha) was given in Nikah when she was six. She started living with the Prophet (Sallallal~oalaihe wasallam) when she was nine. She was only 18 at the time of the Prophet's passing awav. Notwith- standing her age. she is responsible for innunlerable Aha- diths and regulations of Islanlic practices. Masrooq (Kahmatullah alaih) says: \"I saw man!^ enlinent Sahnbah coming to Aishah (Rad- hiyallaho anha) for seeking kilowledge about Islamic: jurisprudence.\" 'Ata (Kahmatullah alaih) says: \"Aishah (Kadhivallaho anha) was more learned than any of the men of her time.\" kladhrat Abu Moosa (lladhivallaho anho) says: \"With the help of Hadhrat Aishah (Kadhiyallaho anha). a solution was found to each and every problem we had to face in the field of religious knowledge.\" The books of Hadith contain as many as 2 210 Ahadith nar- rated I ~ J Hadhrat Aishah (Kadhivallaho anha). She says: \"I was a child and playing with my playmates in Mecca when the verse. (Nay. but the Ilour is their appointed tryst. and the Hour will be more wretched and more bitter-LIV: 46). was revealed to the Prophet (Sallallaho alaihe wasal- lam).\" 218 219 We know she emigrated to Madinah when she was only eight. She would have been much younger at the rev- elation of this early Meccan verse. This clearly shows her great zeal and devotion for Islamic knowledge right from her childhood. 3. Hadhrat 'Umair (Radhiyallaho anho) goes to Battle. Hadhrat Umair (Radhiyallaho anho) was a slave of Abil Lahm (Radhiyallaho anho) and of very tender age. Every soul in those days. irrespective of age, was eager to strive in the Path of Allah, '1Jmair (Kadhiyallaho anho) requested the Prophet (Sallallaho alaihe wasallam) to permit him to fight in the battle of Khaiber. His master also recommended him very strongly. The Prophet (Sallallaho alaihe wasallam) permitted him and gave him a sword. which 'Umair (Radhiyallaho anho) hung round his neck. Now the sword was too big for his size. and he had to drag it with him. He fought in the battlettill it ended in victorv. As he was a minor and a slave. he was not entitled to full share in the booty. The Prophet (Sallallaho alaihe wasallam). however. allotted him a share as a very special case. Although 'Umair (Radhiyallaho anho) knew that he was not going to get any share from the spoils of war, vet he was so eager to fight in the battle and sought recommen- dations for it. What could be his motive other than the reward of the Hereafter. as promised by Allah and reported by the Prophet (Sallallaho alaihe wasallam). 4. Hadhrat 'Umair' bin Abi Waqqaas (Radhiyallaho anho) hides himself. Hadhrat 'Umair bin Abi Waqqaas (Radhivallaho anho) was a Sahabi of tender age, who had embraced Islam in its early days. He was a brother of Hadhrat Sa'd bin Abi Waq- qaas (Radhiyallaho anha) the famous Muslim general. Hadhrat Sa'd (Radhiyallaho anho) narrates: t \" t i t the time when we were preparing to march for Badr, I noticed 'Umair (Radhiyallaho anho) trying somehow to hide himself. This surprised me. I said to k him. 'What has happened to you? What makes you hide like this?' He replied, 'I am afraid the Prophet (Sallallaho alaihe wasallam) mav stop me from taking part in the battle on account of my voung age. though I . Two Youngsters of the Ansar Kill Abu Jahl. Hadhrat Abdur Rahman bin 'Auf (Radhiyallaho anho), one of the most eminent Sahabah, narrates: \"In the battle of Badr, I was standing in the fighting line when I noticed two Ansar youngsters, one on either side. I thought it would have been better if I had been between strong men who could then help me in need. Suddenly, one of the boys caught my hand and said, 'Uncle, do you know Abu jahl?' I said, 'Yes, but what do you mean by this?' He said, 'I have come to know that the wretched man reviles the Prophet (Sal- lallaho alaihe wasallam). By Him who holds my life in His hand, if I see him, I will not leave him until I kill him or I am killed.' His words left me wonderstruck. Then the other boy had a similar talk with me. I hap- pened to notice Abu Jahl dashing about in the battle- field on the back of his horse. I said to the boys, 'There is the object of your quest.' Both of them immediately darted towards him and started attacking him with their swords, till I saw him fall from the horse's back.\" These b o p were Hadhrat Ma'az bin Amr bin Jamooh and Ma'az bin Afra (Radhiyallaho dnhuma). Ma'az bin Amr bin Jamooh says: \"I had heard the people say, 'No one (:an kill Abu Jahl. He is very well guarded'. At that time, 1 took upon myself to finish him.\" Abu ]ah1 was arranging his lines for assault, when he 220 221 was spotted by liadhrat Abdur Kahman bin Auf (Kadhiyal- laho anho). The boys were on foot, while Abu Jahl was on horse back. One of the boys hit a leg of the horse and the other that of Abu Jahl. This caused both to fall down and Abu Jal~l was unable to get up. The boys left him in this c:onrlition. Mu'awwez bin Afra brother of I-ladhrat Ma'az bin Afra (Radhi~lallaho anho) then went and further dis- abled him with his sword, so that he might not drag him- self to his camp. Hadhrat Abdullah bin Masood (Kadhiyallaho anho), last of all, attacked him and severed his head from the body.\" Hadhrat Ma'az bin Anlr bin Jamooh (Radhiyallaho anho) savs: \"When I hit Abu Jahl with my sword, his son Ikramah was with him. He attacked me on my shoulder and cut my arm. leaving it hanging bv the skin only. I threw the broken arm over my shoulder and kept fighting with one hand. But when I found it too cumbersonie. I severed i t from my body, by placing it ulicler my foot and pulling myself up. and threw it awav.\" 6. A Contest Between Rafe' and Samurah. Whenever an army of Mujahidin moved out from Mad- inah for a campaign. the Prophet (Sallallaho alaihe wasal- lam) inspected them at some distance outside to ensure that nothing was lacking in men and equipment. It was here that he usually returned to Madinah all those tender- aged bovs who had come out with the army in their zeal to fight for Islam. While setting out for Uhud. the Prophet (Sallallaho alaihe ~rasallam) carried out this inspection just outside Madinah. He ordered the young boys to go back. Among them were Abdullah bin 'Umar, Zaid bin Thabit. Usamah bin Zaid, Zaid bin Arqam. Bara bin Azib. Amr bin Hazarn. Usaid bin Zubair. 'Urabah bin Aus, Abu Sa'eed Khudri. Samurah bin Jundub and Rafe' bin Khudaij (Rad- hiyallalio anhum). All of them had just entered their teens. Khudaij said to the Prophet (Sallallaho alaihe wasallam): \"0. Prophet of Allah! My son Rafe' is a very good archer.\" + Hadhrat Rafe' (Kadhiyallaho anho) too, stood on his toes to show himself taller than lie actually was. The Prophet (Sal- lallaho alaihe 1uasa1l;lm) permitted him to stav on. When tvas more cfeservina of the Prophet's (Sallallaho alaihe wasallam) fa\\Jour.\" This was reported to the Prophet (Sallallaho alaihe wasal- lanl). who allowetl Saiilrah to prove his claim bv wrestling with Rafe': Samurah did at:tuallv beat Rafe' in the bout and he too was permitted to stay ill the army. A few more boys made similar efforts to stay on, and some of them did suc- ceecl. Meanwhile it becanle dark. The Prophet (Sallallaho alaihe wasallanl) made necessary arrangements for the watch and ward of the camp during the night, and then in- quiretl: \"No~v, who is going to guard niy tent during the night?\" A person (standing at his place): \"I. 0 Prophet of Allah!\" The Prophet (Sallallaho alaihe wasallam): \"What is vour name?\" The person: \"Zakn an.\" The Prophet (Salldllaho alaihe wasallarn): \"All right. You take !lour seat.\" He a-gain inquired: \"Who else is volunteering to guard night'?\" A voice: \"I. 0 Prophet of Allah!\" The Prophet (Sallallaho alaihe wasallam): \"Who are vou?\" A voice: \"Abu Saba' (father of Saba').\" my tent for to- 222 0) sz Ir 4 0 .! o e The Prophet (Sallallaho alaihe wasallam): 7. Hadhrat Zaid (Radhiyallaho anho) Gets Preference for His Qur'an. \"All right. Sit down.\" m S m He enquired for the third time: Hadhrat Zaid bin Thabit (Radhiyallaho anho) was six when he lost his father. He was eleven at the time of Hijrah. \"Who will be the third nian to guard mv tent. tonight'!\" Again came a voice from the crowd: \"I. 0 Prophet of Allah!\" The Prophet (Sallallaho alaihe wasallam): \"Your name?\" The voice: \"Ibn Abdulqais (son of Abdul Qais).\" The Prophet (Sallallaho alaihe wasallam): \"All right. You also sit down.\" Then the Prophet (Sallallaho alaihe wasallam) bade all the three volurlteers to colne to him. Only one person came for- ward. The Prophet (Sallallaho alaihe wasallam): \"Where are your other two comrades'?\" The Person: \"0 Prophet of Allah! It was I who stood up all the three times. The Prophet (Sallallaho alaihe wasallam) blessed him with his pravers. and allowed him to guard his tent. He kept watching the tent all night long. Just look! How eager the Sahabah were to face death for the sake of Allah and His Prophet (Sallallaho alaihe wa- sallam). The children and adults. young and old, men and women. all were intoxicated with the same spirit of sacri- fice and devotion. Rafb bin Khudaij had offered to fight in Badr too, but he was not permitted. 111 Uhud. however, he was allowed to fight for the first time. Since then, he had bee11 partici- pating in almost all the campaigns. In Uhud the enemy's arrow struck him in his chest. When it was drawn but, a small remnant remained inside his bodv. This caused a wound. whic;li eventually proved fatal in his old age. He offered himself for the battle of Badr, but was re- jected on account of his tender age. He again volunteered for Uhud. This time also he was not permitted, as we saw in the last story. He had since then been participating in all the campaigns. While the Mujahidin were marching to- wards Tabuk, the flag of Banu Malik clan was held by Am- marah. The Prophet (Sallallaho alaihe wasallam) bade him make over the flag to Zaid. Ammarah (Radhiyallaho anho) thought that perhaps somebody had made a complaint against him, which had displeased the Prophet (Sallallaho alaihe wasallam). He therefore said: \"0, Prophet of Allah! Is it due to somebody com- plaining against me?\" The Prophet (Sallallaho alaihe wasallam) said: \"No. But Zaid knows more Qur'an than you do. His Qur'an has given him preference.\" It was common with the Prophet (Sallallaho alaihe wa- sallam) that he gave preference to the people in accordance with their virtues. Although this was an occasion of battle. and a knowledge of the Qur'an had no direct bearing on the issue, yet the Prophet (Sallallaho alaihe wasallam) gave preference to Zaid (Radhiyallaho anho) for his Qur'an. This distinction we find on other occasions as well. When a number of dead persons had to be accommodated in one grave (as in Uhud), they were buried in the order of their knowledge of the Qur'an, priority being given to those who knew more of it. 8. Hadhrat Abu Saeed Khudri's (Radhiyallaho anhoj Re- straint. Abu Sa'eed Khudri (Radhiyallaho anho) says, \"I was presented to the Prophet (Sallallaho alaihe wasallam) by my father for fighting at Uhud, when I was thirteen. My father recommended me saying: '0, Prophet of Allah! He has a very good body. His bones are very well-developed.\" 224 16 The Prophet (Sallallaho alaihe wasallam) looked at me again and again, and finally rejected me due to my young age. My father, however, participated in the battle and was killed. He left me nothing to live on. I went to the Prophet (Sallallaho alaihe wasallam) to seek some financial help from him. Before I could express myself, he addressed me saying: 'Abu Saeed! Whoso seeks endurance from Allah! gets it; Whoso seeks chastity from Him, gets it; And whoso seeks contentment from Him will surely get it.' After hearing this, I returned home without making any re- quest to him. On this, Allah blessed him with such an exalted position that, among the younger Sahabah, there is nobody endowed with so much knowledge and learning as Hadhrat Abu Sa'eed (Radhiyallaho anho). Look at the restraint of Abu Sa'eed at such a young age. As we know, in Uhud he had lost his father who had left him nothing to live on and therefore he fully deserved all help; yet a few words of the Prophet (Sallallaho alaihe wa- sallam) stopped him from talking of his distress and seek- ing a favour. Can a person much older than him show such a strength of character? In fact, the persons selected by Allah for the company of his dear Prophet (Sallallaho alaihe wasallam) did really deserve that honour. That is why the Prophet (Sallallaho alaihe wasallam) had said: \"Allah has preferred my conlpanions over all other men.\" 9. Hadhrat Salmih bin Akwah (Radhiyallaho anho) faces the Bandits. Ghabah was a small village at four or five miles from Madinah. The Prophet's (Sallallaho alaihe wasallam) camels were sent to that place for grazing. Abdur Rahman Fazari, with the help of a few disbelievers, killed the person looking after the camels and took them away. The bandits were riding their horses, and all of them were armed. Salmah bin Akwah (Radhiyallaho anho) was going on foot in the morning with his bow and arrows, when he happened to see the bandits. He was only a boy but he ran very fast. It is said that he could beat the fastest horse in race. He was also a very good archer. No sooner did he see the bandits than he climbed up a hill and shouted towards Madinah to raise an alarm. He then chased the bandits and, on approaching near them, started sending arrows one after the other. He did this so swiftly and incessantly that the bandits thought they were being chased by a large number of people. If any of the bandits happened to turn his horse towards him, he hid behind a tree and inflicted wounds on the animal with his arrow. The bandits at once retreated at full speed to escape from being captured. Salmah (Rad- hiyallaho anho) says: \"I kept on chasing the bandits till all the camels taken away by them were behind me. Besides, in their flight they left behind 30 spears and 30 sheets of cloth of their own. Meanwhile, Uyainah bin Hisn (another bandit) and his party arrived on the scene to reinforce the bandits. They had meanwhile come to know that I was all alone. They now chased me in large concentra- tion and I was compelled to climb up a hill. As they were about to approach me I shouted, 'Stop. First listen to me. Do you know who am I? I am Ibnul Akwah. By Him who has given glory to Muhammad (Sallallaho alaihe wasallam), if anyone of you chases me. he cannot catch me. On the other hand, if I run after any of you he cannot escape me.' I kept on talking to them in that strain to beguile them till, I thought. help would reach me from Madinah. I looked anx- iously through the trees, as I talked to them when at last, I noticed a group of riders headed by Akhram Asadi (Radhiyallaho anho) coming towards me. As Akhram approached the bandits, he attacked Abdur Rahman and cut one leg of his horse. Abdur Rahman, as he fell down from the horse, attacked Akhram and killed him. Abu Qatadah (Radhiyallaho anho) had meanwhile arrived. In the combat that ensued. Abdur Rahman lost his life and Abu Qatadah his horse.\" It is written in some books of history that, when Akhram was going to attack Abdur Rahman, Salmah ad- vised him to wait till the rest of his people had joined him. But he did not wait. saying: \"I wish to die as a martyr in the path of Allah.\" He was the only person killed from among the Muslims. The bandits lost a good number of their men. The11 more reinforcement reached the Muslims, and the bandits took to their heels. Salmah (Radhiyallaho anho) sought the 226 227 Prophet's (Sallallaho alaihe wasallam) permission to pursue them saying: \"0. Prophet of Allah! Let me have one hundred men, I shall teach them a lesson.\" But the Prophet (Sallallaho alaihe wasallam) said: \"No. They would have by now reached their bases.\" Most of the historians say that Salmah (Radhiyallaho anha) was hardly 12 or 13 at that time. Look how a boy of such a small age was able to chase so many bandits single-handed. He recovered all the plunder and besides took a consider- able booty from them. This was the outcome of Iman and Ikhlas, with which Allah had imbued the hearts of those blessed people. 10. Hadhrat Bara's (Radhiyallaho anho) eagerness to Join in Badr. Badr was the most gallant and illustrious battle ever fought by the Muslims, who were faced with very heavy odds. There were 313 men, 3 horses, seventy camels, six or nine coats of arms and eight swords with the Prophet (Sal- lallaho alaihe wasallam), while the Qureysh had about 1000 men, 100 horses, 700 camels, and were armed to their teeth. The Qureysh were so sure of their victory that they had brought with them musical instruments and song- stresses to celebrate the victory. The Prophet (Sallallaho alaihe wasallam) was very anxious because of the heavy odds against him. Heprayed to Allah saying: \"0, Allah! Thy faithful slaves are barefooted; Thou and only Thou can provide them with animals to ride upon. They are naked; Thou and only Thou can clothe them. They are poor; Thou and only Thou can sustain them.\" Allah granted his prayer and gave the most glorious victory to the Muslims. In spite of knowing the strength of the Qureysh, Ab- dullah bin 'Umar and Bara bin Azib (Radhiyallaho anhuma), in eagerness to join the battle, had come out with the Mujahidin. The Prophet (Sallallaho alaihe wasallam), however, in consideration of their tender age, did not permit them to proceed to the battle-field. . Hadhrat Abdullah bin Abdullah bin Ubayy (Radhiyal- laho anha) disgraces his Munafiq Father During the famous campaign of Banul Mustaliq in 5 A. H., a Muhajir had a strife with Ansari over some trifling matter. Each of them called his own people for help, and there was a serious danger of a fight among the two groups of the Muslims but, through the efforts of some sane paople, this was averted. Abdullah bin Ubayy was the chief of Munafiqin. He was a very bitter enemy of Islam. As he posed to be a Muslim, he was treated as such by the other Muslims. When he came to know of this incident, he used some insolent words for the Prophet (Sallallaho alaihe wa- sallam) and, exploiting the situation, addressed his people thus: \"All this is the outcome of the seed that you people have sown with your own hands. You provided refuge to these strangers (meaning Muhajirin) in your town and shared your wealth equally with them. If you withdraw your help from them, they will be obliged to go back.\" He further said: \"By Allah! On return to Madinah, we, the respected people, shall drive out these mean people from there.\" Hadhrat Zaid bin Arqam (Radhiyallaho anho), an Ansari boy was listening to him. He could not tolerate these words and at once retorted by saying to him: \"By Allah! You yourself are wretched. Even your own people look down upon you, and nobody will support you. Muhammad (Sallallaho alaihe wasallam) is most honoured. He is exalted by Rahman and revered by his followers.\" Abdullah bin Ubayy said: \"All right. Do not mention it to anybody. It was only a jest; I was not serious in w h t I said.\" 228 Hadhrat Zaid (Radhiyallaho anho) however went straight to the Prophet (Sallallaho alaihe wasallam) and narrated to him what the Munafiq had said. 'Umar (Radhiyallaho anho) sought the Prophet's (Sallallaho alaihe wasallam) permission to kill Abdullah bin Ubayy, but the Prophet re- fused. When Abdullah bin Ubayy learnt that the Prophet (Sallallaho alaihe wasallam) had received the report about his insolent talk, he came to him and swore by Allah saying: \"I never said such a thing. Zaid is a liar; he has given you false report.\" A few of the Ansars were also sitting with the Prophet (Sallallaho alaihe wasallam). They also pleaded his case by saying: \"0, Prophet of Allah! He is chief of his clan and is a big man. His statement is more reliable than the report by a mere boy. It is just possible that Zaid might have misheard or misunderstood him.\" The Prophet (Sallallaho alaihe wasallam) accepted his statement and took no action against him. When Zaid (Rad- hiyallaho anho) came to know that the Munafiq had suc- ceeded in , beguiling the Prophet (Sallallaho alaihe wasallam) through false oaths, he would not come out for shame of being considered a liar by the people. He would not even go to the Prophet (Sallallaho alaihe wasallam). At last, Allah revealed Soorah A1 Munafiqoon, in which the report of Zaid (Radhiyallaho anho) was confirmed and the Munafiq was exposed. After this, all people began to honour Zaid and look down upon the Munafiq. Now the Munafiq (Abdullah bin Ubayy) had a son. His name was also Abdullah and he was a very sincere Muslim. When the Mujahidin were about to reach Madi- nah, he drew out his sword and stood just outside the town and, in a challenging tone, said to his Munafiq father: \"I will not allow you to enter Madinah, until you admit with your own tongue that it is you who is mean and Muhammad (Sallallaho alaihe wasallam) is most exalted.\" This surprised him very much, as the son had always been very respectful to kim, but now he was prepared to kill him, his own father, for the honour of the Prophet (Sallal- laho alaihe wasallam). The Munafiq had to declare: 0) 3% L. 0 4 \"By Allah! I am mean, and Muhammad (Sallallaho 8 g alaihe wasallam) is most exalted.\" 2; G He was then allowed to enter the town. 12. Hadhrat Jabir's (Radhiyallaho anho) Eagerness to Fight. When the battle of Uhud was over, the remnant of Sa- habah returned to Madinah, most tired and broken. When the Qureysh, on their way back to Mecca, were camping at a place called Hamra-ul Asad, their chief, Abu Sufyan, sat in council with his lieutenants. They said among them- selves: \"The Muslims are defeated in Uhud. Their morale must be very low. This is the best time to finish Mu- hammad.\" They, therefore, decided to return and attack Madinah. When the Prophet (Sallallaho alaihe wasallam) received in- telligence about this council, he ordered all those Sahabah who had participated in Uhud, and who had just returned from the battle, to move out of Madinah and meet the enemy on the way. Jabir (Radhiyallaho anho) came to the Prophet (Sallal- laho alaihe wasallam) and said: \"0, Prophet of Allah! I was very eager to fight in Uhud, but my father prevented me from going, on the plea that there was no other member in the house to look after my seven sisters and only one of us could join the campaign. As he had made up his mind to go, he bade me stay back with the family. He met the most coveted end [i.e., martyrdom) in Uhud. Now I am very eager to go with you this time and fight the Qureysh.\" The Prophet (Sallallaho alaihe wasallam) allowed him to go. He was the only person in that campaign who had not fought in Uhud. Hadhrat Jabir's (Radhiyallaho anho) father was mar- tyred in Uhud. He left Jabir a big family to look after and large debts to clear, with nothing to live on. The debts were due to one of the Jews, who as we know seldom have any soft corner in their hearts for their debtors. Also his seven sisters for whose sake he was not allowed to go to Uhud- were still there to be boked after. Now look! inspite of all 230 these difficulties, Jabir (Radhiyallaho anho) requests the Prophet (Sallallaho alaihe wasallam) for permission to go to the battle. His spirit is really wonderful! 13. Hadhrat Ibn Zubair's (Radhiyallaho anho) Valour against the Romans. In 26 A.H., 'Usman (Radhiyallaho anho), the then Kha- lifah, appointed Abdullah bin Abi Sarah (Radhiyallaho anho) as the Governor of Egypt in place of Amr bin Aas (Radhiyallaho anho). Abdullah (Radhiyallaho anho), with 20 000 Mujahidin, advanced to meet the Roman Army numbering 200 000. It was a very fierce battle. The Roman commander Jarjir made a proclamation saying: \"The person who kills Abdullah will get my daughter's hand in marriage and also 100 000 dinars in prize.\" Some of the Muslims grew anxious over this proclamation. i When Abdullah bin Zubair was informed of this, he said: 1 \"There is nothing to worry about. We may also an- nounce that the person killing Jarjir will get Jarjir's daughter in marriage, 100 000 dinars in prize, and also governorship over the area now ruled by him.\" The fighi was very tough and went on for a long time. Ibn Zubair (Radhiyallaho anho) succeeded in spotting Jarjir seated behind his forces, under an umbrella of peacock feathers held by two maids. Ibn Zubair (Rad- hiyallaho anho), all at once, outskirted the Roman troops and approached him. He attacked Jarjir with his sword and severed his head from his body. He then fixed the head oh the point of his spear and returned to his camp, to the utter amazement of both the armies at his matchless valour. When the Sahabah emigrated to Madinah, no son was borne to any of the emigrants for one year after the emigra- tion. The Jews of Madinah said: \"We have cast a spell on the emigrants. They cannot have male issue.\" Abdullah 'bin Zubair (Radhiyallaho anho) was the first male child born to the Muhajirin. The Muslims were, natu- rally, very happy over his birth. The Prophet (Sallallaho alaihe wasallam) would not generally allow the children to take oath of allegiance to him. But Abdullah bin Zubair gz Gm ;g a (Radhiyallaho anho) had the honour of pledging allegiance .= + to the Prophet (Sallallaho alaihe wasallam) when he was g m * only seven. During this battle, he was barely in his early twenties. To go single-handed and kill the commander, after hoodwinking his army of 200 000 men, at this age is really marvellous. 14. Hadhrat Amr bin Salamah (Radhiyallaho anho) Leads in Salaat. Hadhrat Amr bin Salamah (Radhiyallaho anho) says: \"We lived with our father at a place on the caravan route to Madinah. When a caravan from Madinah passed our village, we asked the people therein about Muhammad (Sallallaho alaihe wasallam). They would tell us that he claimed to be receiving revelations from Allah, and they would also recite a few verses of the Qur'an before us to give us an idea about his claim. Then I immediately used to commit those verses to memory. In this way, I remembered a good portion of the Qur'an, even before I embraced Islam. All the desert tribes were waiting for Mecca to fall to the Prophet (Sallallaho alaihe wasallam) before they em- braced Islam. On his victorious entry into Mecca, deputations from all the tribes began to come to the Prophet (Sallallaho alaihe wasallam) in order to accept Islam. My father headed the group who went to the Prophet (Sallallaho alaihe wasallam) to pledge alle- giance to him on behalf of our tribe. The Prophet (Sal- lallaho alaihe wasallam) taught them the basic regulations about Salaat and other Islamic practices. He said to them, \"The person who knows more Qur'an is entitled to lead in Salaat. Now it so happened that none in my tribe knew so much Qur'an as I did. They searched for an Imam, but they could not find a person knowing more Qur'an than me. I was, therefore, made Imam. At that time, I was only seven. I led the congre; gational Salaat and funeral service if any.\" It was his natural inclination and affinity towards Islam that made him remember so much of the Qur'an when he was only a boy and he had not even embraced Islam. 232 233 15. Hadhrat Abdullah bin Abbas (Radhiyallaho anho) Teaches His Slave. Ikramah the slave of Abdullah bin Abbas (Radhiyal- laho anho) is one of the eminent ulama. He says: \"During my learning the Qur'an and Hadith, I was kept in chains by my master, so that I might not go any- where and devote full time to my lessons.\" In fact, real knowledge can only be acquired when one is totally devoted to it. The students who are in the habit of wasting their time in roaming about and enjoying them- selves can seldom acquire deep knowledge. It was the result of this labour that Ikramah was later on called. \"The ocean of knowledge\" and \"The most learned man of the Ummat.\" Qatadah says: \"There are four most learned men among the Tabi'ees, and Ikramah is one of them.\" 16. Hadhrat Ibn Abbas (Radhiyallaho anho) Memorises the Qur'an in His Childhood. Hadhrat Abdullah bin Abbas (Radhiyallaho anho) used to say to the people: \"Come to me for your difficulties in understanding the Qur'an. I memorised it while I was only a child.\" In another Hadith, he is reported to have said: \"I had completed my reading of the Qur'an when I'was only ten.\" r The reading of the Qur'an by Sahabah was not done like the reading by the non-Arabs of today. Whatever they read, they read with full meaning and explanation. As the impression of something memorised in childhood is very deep and permanent, so Abdullah bin Abbas (Radhiyallaho anho) is accepted as Imam in Tafsir. None of the Sahabah has narrated more Ahadith explaining the meaning of Qur'an than was done by Ibn Abbas. Abdullah bin Mas'ood (Radhiyallaho anho) says: \"Abdullah bin Abbas (Radhiyallaho anho) is the best commentator of the Qur'an.\" Abu Abdur Rahman (Rahmatullah alaih), on the authority of Sahabah who taught him the Qur'an, says: at the time of the Prophet's death. It is miracle that he knew so much of the Qur'an and Hadith at such a young age. Many eminent Sahabah used to come to him to solve their diffi- culties about the interpretation of the Qur'an. This was, however, all due to the blessing of the Prophet (Sallallaho alaihe wasallam), who once coming out from the closet had found water lying ready for his use and inquired: \"Who put this water here?\" Somebody said: \"Ibn Abbas.\" The Prophet (Sallallaho alaihe wasallam) appreciated the service and prayed for Ibn Abbas: ''0, Allah! Give him the knowledge and understanding of the Qur'an and practices of Islam.\" On another occasion, the Prophet (Sallallaho alaihe wasal- lam) was saying his Salaat. Ibn Abbas (Radhiyallaho anho) joined him in Salaat by standing behind him. The Prophet caught him by the hand and drew him to his side. (When there is only one follower in Salaat with Jamaat, he stands by the side of Imam and not after him). While the Prophet (Sallallaho alaihe wasallam) was busy in Salaat, he moved back a little distance. When the Salaat was over, the Prophet (Sallallaho alaihe wasallam) asked him: \"What made you recede from your place?\" Hesaid: \"You are the Prophet of Allah!. How could I stand with you.\" On this occasion too, the Prophet (Sallallaho alaihe wasal- lam) prayed for his knowledge and understanding. 17. ~ b d u l l a hbin Amr bin Aas Notes Down Ahadith: Abdullah bin Amr bin Aas (Radhiyallaho anho) was one of the most pious Sahabah. Daily he used to fast during the day, and finish one Qur'an during the night. The Prophet (Sallallaho alaihe wasallam) restrained him from this excessive devotion and said: 234 \"You will get weak by daily fasting, and your eye-sight will suffer by keeping awake very night. You owe some obligation to your body, the members of your family, and those who come to visit you.\" He says: \"The Prophet (Sallallaho alaihe wasallam) then advised me to take not less than a month to finish one Qur'an. I said, \"0, Prophet of Allah! This is too little. Let me make full use of my strength while I am still young.\" He then re- duced the period to 20 days. I kept on repeating my words and the Prophet (Sallallaho alaihe wa- sallam) continued reducing the period, till fi- nally I was permitted to take three days in finishing one reading of the Qur'an.\" He had a collection of the Hadith compiled by him, which he had named \"Sadiqah (True)\". He says: ':I used to put down all that I heard from the Prophet ballalaho alaihe wasallam). People once said to me, 'The Prophet (Sallalaho alaihe wasallam) is after all a human being and many words uttered by him in anger or humour are actually not meant by him. You should not write each and every thing spoken by him.' I ac- cepted the advice. On my once mentioning this to the Prophet (Sallallaho alaihe wasallam), he said, 'You keep doing as before. By Him who holds my life in His hand, my lips do not utter anything except the truth, even in anger or joy.\" Abu Hurairah (Radhiyallaho anho) says: \"No one has narrated about the Prophet (Sallallaho alaihe wasallam) more than me, except Abdullah bin Amr. This is because he used to note down what he heard, while I relied on my memory.\" This is really wonderful, especially when we know that most of his time was reading the Qur'an and other acts of piety. 18. Zaid bin Thabit Memorises the Qur'an. Zaid bin Thabit (Radhiyallaho anho) is one of those eminent Sahabah who are considered to be most learned and whose words in religious matters carry much weight. He was an expert in regulations regarding obligatory prac- tices. It is said that he was among the top ranking jurists, (I - sq judges and Qaris. He was only 11 when the Prophet (Sallal- -3 0P 1 laho alaihe wasallam) emigrated to Madinah. That is why, 5 2 m in spite of his eagerness, he was not allowed to participate in the early battles like Badr, etc. He had lost his father when he was six. When the Prophet (Sallallaho alaihe wa- sallam) arrived in Madinah, people brought their children to him to receive his blessing. Zaid was also brought to him for the same purpose. He says: \"When I was presented to the Prophet (Sallallaho alaihe wasallam), he was informed that I had then memorised seventeen soorahs of the Qur'an. In order to test me, he bade me to recite some of these. I recited Surah Qaaf. He rewarded me with his words of appre- ciation.\" The Prophet (Sallallaho alaihe wasallam), when writ- ing letters to the Jews outside Madinah, used to utilise the services of the local Jews. Once he said to Zaid: \"I am not satisfied with what the Jews write and read for me. I apprehend mischief from them in miswriting or misreading. I desire you to learn the Jewish lan- guage.\" Zaid (Radhiyallaho anho) says: \"In fifteen days, I mastered Hebrew and after that I started doing all such correspondence for him.\" According to another Hadith, Zaid (Radhiyallaho anho) is reported to have similarly mastered the Syriac language at the instance of the Prophet (Sallallaho alaihe wasallam). He managed this within the short period of 17 days only. 19. Hasan's Knowledge of Islam. The head of Sayyids, Hasan (Radhiyallaho anho) was born in Ramadhan, 3 A. H. He was thus a little over seven years old at the time of the Prophet's death. In spite of his tender age, quite a few Ahadith have been narrated by him. Abul Howraa once asked him: \"Do you remember any saying of the Prophet (Sallal- laho alaihe wasallam)?\" He said: \"Yes. Once I was going with him. On the way I saw a large quantity of dates of Sadaqah piled up at one 236 place. I took a date from the pile and put it into my mouth. The Prophet (Sallallaho alaihe wasallam) ex- claimed, 'Kakh! Kakh!' (exclamation of disapproval) and then he took out the date from my mouth with the help of his finger, saying: 'Eating the Sadaqah is not permissible for us (i.e. family of the Prophet)'. The Prophet (Sallallaho alaihe wasallam) had taught me how to say my five times daily Salaat.\" Hasan (Radhiyallaho anho) says: \"The Prophet (Sallallaho alaihe wasallam) advised me to recite the following prayer for my Witr: J %J&j 49s &, Q& 9 >&, &\" s - I ., J4yG!&&?* ,&&!,uL *-.,&\\a $j , 2 &J .I d ~ gj &jY j a.,j \"0, Allah! Guide me along with those whom Thou hast guided. Keep me in ease along with those whom Thou hast kept in ease. Be my protecting friend along with those whose protecting friend Thou has been. Bless me in what Thou hast granted me. Grant me pro- tection against the ill-effects of what may have been or- dained for me, for Thy decision is final and nobody can decide against Thy will. He who has Thee as the protecting Friend cannot be abased. 0, Our Lord! Thou art blessed and Thou art the Highest.\" Hasan (Radhiyallaho anho) narrates that he heard the Prophet (Sallallaho alaihe wasallam) saying: \"The person who keeps sitting till sunrise at the place where he said his Fajr prayers shall be saved from the Hell.\" Hasan (Radhiyallaho anho) performed his Hajj many times by covering the distance from Madinah to Mecca on foot and, when asked about his reasons for undergoing such hardships. he remarked: \"I feel ashamed to face Allah (after my death) without having gone to Mecca on foot for pilgrimage tp his House.\" Hasan is reputed for his piety and mildness. He is respon- sible for narrating many Ahadith, collected by Imaam Ahmad in his Musnad. The author of 'Talqih' has included Hasan (Radhiyallaho anho) among those who have reported as many as 13 Ahadith. To have remembered so many Aha- dith at the age of 7 shows his devotion to Islam and his re- markable memory. On the other hand, our children at this age generally do not know even the elements of Islam. 20. Husain's Zeal for Knowledge. Husain (Radhiyallaho anho) was one year junior to Hasan (Radhiyallaho anha), his brother. He was a little over 6 at the time of the Prophet's death. Nothing much can be expected from a child of this age, but there are quite a few Ahadith narrated by Husain (Radhiyallaho anho). Muhad- dithin count him among those Sahabah who are respon- sible for giving us at least 8 Ahadith. The following Ahadith are among those narrated by Husain (Radhiyallaho anho): 1. \"Each time a person recites 'Inna-lillahi-wa-inna- Ilaihi-raaji-oon' when he recalls or is otherwise re- minded of an adversity previously met by him, he receives a reward from Allah as good as he would have had at the time of actual infliction.\" 2. \"A Muslim gets immunity from drowning while crossing a river if, at the time of embarking, he re- cites: \". O * 0 ! ; 0 , . ( t r y) wj jpJ JJ d! kL> j G$+ & (In the name of Allah be its course and its moor- ing. Lo! My Lord is, surely, most Forgiving, most Merciful).\" 3. \"To shun vain things makes one a good Muslim.\" Rabee'ah (Radhiyallaho anho) says: \"I once asked Husain (Radhiyallaho anho) if he re- membered any incident in the life of the Prophet (Sal- lallaho alaihe wasallam). He said, 'Yes. Once managed to get on to a few dates lying near a window and put one of them into my mouth. The Prophet (Sal- lallaho alaihe wasallam) bade me take out and throw away the date, as we (i.e. his family members) were not permitted to eat anything from Sadaqah.\" I 238 Husain (Radhiyallaho anho) had gone on foot 25 times for pilgrimage to Mecca. He was very punctual in fasting, saying Nafl and spending on the poor. We find quite a few Sahabah narrating many sayings, which they had heard from the Prophet (Sallallaho alaihe wasallam) in their childhood. Mahmood bin Rab-ee' (Rad- hiyallaho anho) was only five at the time of the Prophet's death. He says: \"Once the Prophet (Sallallaho alaihe wasallam) came to our house. We had a well inside the house. He filled some water in his mouth from that well and then squirted it on my face. I shall never forget this inci- dent.\" We are in the habit of engaging our children in vain talk, confusing their minds by telling them fictitious stories and frightening them with the giants and the Jinns. If, instead, we induce them to read the lives of great men of Islam, nar- rate to them stories of the pious people and warn them of the consequences of Allah's disobedience, they may be greatly benefited in their life in this world and in the Here- after. In childhood the memory is at its best. Anything memorised at that time is seldom forgotten. If children are made to memorise the Qur'an, they will be able to do so very easily and quickly. I have heard very frequently from the elderly ladies of my family and from my respected father himself that he had memorised one fourth of the thirtieth part of the Qur'an even before he was weaned, and he had finished memorising the whole Qur'an and, on the top of that, he had read a few standard books in Persian lit- erature (the latter 6f his own accord) while he was only seven. He once narrated to me: \"When I had finished memorising the Qur'an, my father required me to repeat (from memory) the full Qur'an once daily, and permitted me to play for the rest of the day. I used to sit on the roof of the house (being summer) and start reciting the Qur'an just after Fajr. I would finish the whole of it in about seven hours. I then had my lunch. In the evening, I used to have lessons in Persian, though it was not compulsory for me. To this routine I stuck for full six months.\" It is not an ordinary thing for a child of seven to recite the Qur'an once daily for full six months, along with learn- ing other things. As a result, he would never forget or commit an error when reciting the Qur'an from memory. Apparently, he earned his livelihood by trade in books. He was found reciting the Qur'an with his lips, even when his hands were engaged in his job. Sometimes he would even teach the boys (who wanted to learn from him after the school hours), while himself reciting the Qur'an and doing his job. He thus attended to three things at a time. But his way of teaching his students was different from that adopted currently in the schools, where the entire burden is on the teachers. He simply listened to the student reading, translating and explaining the meaning. If the stu- dent was correct, he simply said, \"'Go ahead,\" but if the student made some error or needed some further explana- tion, then he only would correct or explain as the gase might be. Now, this story is not of ancient times; this has happened only recently. It is therefore wrong to presume jhat the Muslims of today, being of poor physical strength, cannot try to follow the footsteps of their ancestors in Islam. CHAPTER XI1 LOVE FOR THE PROPHET What we have hitherto read about the achievement of the Sahabah in their time was in fact the result of their love for Allah and for His Prophet (Sallallaho alaihe wasallam). Love, as a matter of fact, was a great dynamic force in the Sahabah's career. It was this force that made them forego their luxuries, forget their lives, give up all their desires for wealth, ignore all afflictions, and have no fear of death even. There is no room for any other consideration (except that of beloved) in the heart saturated with love. May Allah through His Grace grant us His own love and that of His Prophet (Sallallaho alaihe wasallam), so that we may be blessed with devotion in His worship and have sense of comfort in all difficulties faced in His service. 1. Abu Bakr's [Radhiyallaho anho) Sufferings for Islam. In the beginning, those who embraced Islam had to keep their faith secret, as far as possible. As the Muslims were being constantly persecuted by the Qureysh, even the Prophet (Sallallaho alaihe wasallam) advised all new con- verts to practise Islam secretly, so that they might not have to suffer at the hands of Qureysh. When, however, the number of Muslims reached 39, Abu Bakr (Radhiyallaho anho) made a suggestion for the open preaching and prac- tising of Islam. ThepProphet (Sallallaho alaihe wasallam) would not agree, but, when Abu Bakr (Radhivallaho anho) insisted. he gave his consent and so all of them went to Haram for Tabligh. Abu Bakr (Radhiyallaho anho) began to speak, and the Khutbah given by him was the first ever de- livered in the annals of Islam. Hamzah (Radhiyallaho anho) i the Prophet's uncle and the Chief of Martyrs embraced k Islam on that very day, while 'Umar (Radhiyallaho anho) came into the Muslim fold on the third day of this address. No sooner did Abu Bakr (Radhiyallaho anho) start speaking I than the idolaters and disbelievers from amongst the Qu- reysh fell upon the Muslims from all sides. Despite the fact that he was considered to be the noblest and most respect- able of all the people in Mecca, Abu Bakr (Radhiyallaho anho) was beaten to such an extent that his nose and ears 4c $2 and his entire face were besmeared with blood. He was kicked. thrashed with shoes, trampled under feet and han- 8 1 dled most roughly and savagely. He became unconscious vl I g and half-dead; none hoped that he would ever survive this brutal onslaught. Banu Teem, the people of his clan, came and carried him to his house. They also announced in the Haram that if Abu Bakr succumbed to the injuries, they would in retaliation take the life of Utbah bin Rabee'ah, who had taken the most active part in the attack. Abu Bakr (Radhiyallaho anho) remained unconscious the whole day. People round him shouted his name again and again to know if he was in senses, but he would not speak. Late in the evening however he opened his eyes and showed signs of consciousness. As soon as he was able to speak, he en- quired: \"How is the Prophet (Sallallaho alaihe wasallam)?\" The people were most disappointed with him and they said: \"How is it that, despite all this calamity and after vir- tually remaining in the jaws of death all day long on account of the Prophet, (Sallallaho alaihe wasallam), as soon as he has come back to consciousness he has nothing else to talk about, but the Prophet himself.\" They left Abu Bakr (Radhiyallaho anho), much disgusted at his devotion for the Prophet (Sallallaho alaihe wasallam), while they were satisfied that he was out of danger. They advised Umme Khair, his mother, to give him something to eat. But least minding his food, Abu Bakr (Radhiyallaho anho) would incessantly and impatiently ask his mother the same question again and again i.e. \"How is the Prophet (Sallallaho alaihe wasallam)?\" On her showing ignorance about the welfare of the Prophet (Sallallaho alaihe wasallam), Abu Bakr entreated her to go to Umme Jamil (Umar's sister) and find out from her the latest news about the Prophet (Sallalaho alaihe wa- sallam). The mother could not refuse the request of her son in this pitiable condition, and hurried to Umme Jamil's (Radhiyallaho anha) house to enquire about the welfare of Muhammad (Sallallaho alaihe wasallam). Like,other Mus- lims of that time, Umme Jamil (Radhiyallah anha) was also keeping her faith secret. She therefore concealed her 242 243 Stories of the Scrhaabah knowledge about the Prophet (SallalIaho alaihe wasallam), saying: \"Who is Muhammad and who is Abu Bakr? Why should I know anything about them? I am however sorry to learn about the condition of your son; if you like, I can go with you to see him.\" Umme Khair agreed and they both came to Abu Bakr. On seeing Abu Bakr (Radhiyallaho anho) in that miserable con- dition, Umme Jamil (Radhiyallaho anha) could not control herself and began to cry, saying: \"Woe to the ruffians for what they have done to a man like Abu Bakr. May Allah punish them for their mis- conduct.\" Regardless of what Umme Jamil (Radhiyallaho anha) said, Abu Bakr (Radhiyallaho anho) had the same words on his lips viz: \"How is the Prophet (Sallallaho alaihe wasallam)?\" Umme Jamil (pointing towards Umme Khair): \"Is it safe to say anything in her presence?\" i Abu Bakr: \"Do not worry about her. Tell me quickly i how is the Prophet (Sallallaho alaihe wasal- lam)?\" Umme Jamil: \"He is quite well.\" i Abu Bakr: \"Where is he at this moment.\" Umme Jamil: \"Heis at Arqam's place.\" Abu Bakr: \"By Allah! I will not eat anything until I have looked at him.\" Now, his mother was very anxious to feed him. She knew that when he had sworn by Allah he would not break his oath and, therefore, would not eat under any circum- stances. She therefore agreed to take him to Arqam's place. She had to wait till the street was least-frequented by the people and she was able to take him to that place unde- tected by Qureysh. When they both reached Arqam's place, Abu Bakr (Radhiyallaho anho) saw the Prophet (Sallallaho alaihe wasallam) and clung to him weeping profusely. The Prophet (Sallallaho alaihe wasallam) reciprocated, and all the Muslims who were present there also began to weep , Prophet of Allah! Pray for her and induce her to accept Islam.\" The prophet first prayed for her and then preached to her. She accepted Islam there and then. Many people can claim to be lovers while in ease and comfort. But a lover is a real lover when he is able to prove his love even in the tribulation and adversity. 2. 'Umar's (Radhiyallaho anho) Grief at the Prophet's Death. None can deny the proverbial valour, courage and strength of 'Umar (Radhiyallaho anho), over whose men- tion, even after the lapse of 1400 years, hearts are struck with awe and respect. Islam could not be professed and preached openly before 'Umar's coming into its fold. As soon as he embraced Islam, the Muslims started saying Salaat in the Haram, as none could dare harm them with 'Umar (Radhiyallaho anho) on their side. Notwithstanding all this, he could not bear the shock of the Prophet passing away. So much so that he stood with sword in his hand, ut- terly confused and bewildered, saying: \"I shall behead the person who says that the Prophet (Sallallaho alaihe wasallam) has passed away. The Prophet (Sallallaho alaihe wasallam) has only gone to visit his Lord, just as Moosa (Alayhis salaam) had gone to Toor. He will shortly return and cut off the hands and feet of those who were spreading the false news of his death.\" On the other hand, 'Usman (Radhiyallaho anho) was stunned with grief on this event. He could not utter a single word, even till the next day, and walked about as if bereft of speech. Ali (Radhiyallaho anho), too, was in terrible grief. He was still and motionless. Only Abu Bakr, (Rad- hiyallaho anho) for all his love of the Prophet (Sallallaho alaihe wasallam) as we have seen in the last story, stood firm as a rock against this terrible storm of grief and did not lose his mental composure. He calmly entered the Proph- et's house, kissed his forehead and came back to the 244 people. He called 'Umar (Radhiyallaho anho) to sit down, and began to address the people. He said: \"Whoso worshipped Muhammad (Sallallaho alaihe wasallam), let him know that Muhammad is no more, and whoso worshipped Allah should know that Allah is Everliving and Eternal. He then recited the following verse of the Qur'an: \"Muhammad is but a messenger; messengers, the like of those who have passed away before him. Will it be that when he dies or is slain, Ye will turn back on your heels. He who turneth back doth not hurt Allah, and Allah will reward those who recognise the Truth. (111: 144).\" As Abu Bakr (Radhiyallaho anho) was destined to be the Khalifah after the Prophet, (Sallalaho alaihe wasallam) E it is significa~t that, unlike other Sahabah, he behaved with the composure and patience that were needed on an oc- casion like this. Again. it was Abu Bakr (Radhiyallaho anho) alone who knew better than anybody else about the regulations regarding the burial, inheritance, etc, of the Prophet (Sallalaho alaihe wasallam). When difference of opinion arose among the Sahabah whether the burial place of the Prophet (Sallallaho alaihe wasallam) be at Mecca or Madinah or jerusalenl, it was Abu Bakr (Radhiyallaho anho) who settled the difference by saying on the authority of the Prophet (Sallallaho alaihe wasallam) that the Proph- ets are buried where they have died. There were several other Ahadith known only to Abu Bakr (Radhiyallaho anho) that helped solve many of the other problems arising / out of the death of the Prophet (Sallallaho alaihe wasal- t lam). Some of these Ahadith were: i (1) \"Prophets have no heirs. All that a Prophet leaves behind is Sadaqah.\" i 1 (2) \"Allah's curse is on the Amir who does not take proper interest and excercise proper care in the ap- pointment of his deputies.\" 4 %I (3) \"The state affairs shall remain in the custody of 8 Qureysh. \" *= 3 1 m 3. An Ansari Woman's Anxiety About the Prophet. In the battle of Uhud, the Muslims suffered heavy losses and quite a large number of them were killed. When the sensational news of their heavy casualties reached Madinah, the women came out of their houses eager to know the actual details of these casualties. On seeing the crowd of people at a place, a woman of the Ansar anx- iously inquired: \"How is the Prophet (Sallallaho alaihe wasallam)?\" When told that her father was killed in the battle, she ut- tered 'Inna Lillah' and impatiently repeated the same ques- tion about the Prophet (Sallallaho alaihe wasallam), This time she was told that her husband was no more, her brother was dead and that her son too was slain. With ever- growing anxiety, she repeated the same question about the welfare of the Prophet (Sallallaho alaihe wasallam). She was told that he was safe and sound, but she would not rest contented, and insisted on seeing him herself. When at last she had satisfied her eyes with his sight, she said: \"0 Prophet of Allah, every affliction is eased and every worry removed with the blessing of seeing you.\" According to another version, she herself clung to the Prophet's robes and said: \"0 Prophet of Allah! you are dearer to me than my par- ents. The death of my kinsmen has lost all its sting for me when I have seen you living.\" There are several incidents of this kind that occurred after the battle of Uhud. It is, perhaps, for the large number of such incidents that different names have been reported by different narrators about these women. In fact, such in- cidents happened in large numbers with many women of that time. 4. The Behaviour of Sahabah at Hudeybiyah. The campaign of Hudeybiyah took place in 6 A.H., when the Prophet (Sallallaho alaihe wasallam) with a large number of Sahabah was going to Mecca with the intention 246 of performing 'Umrah. The Qureysh came to know of this and decided to prevent their entry into Mecca. They also decided to invite the neighbouring tribes of Mecca for help, r and made large-scale preparations for battle. When the Prophet (Sallallaho ala$e wasallam) reached Zul Hulaifah, he sent a man to bring intelligence about the Qureysh. i When the Prophet (Sallalleho alaihe wasallam) reached Asfan, the person returned from Mecca with the informa- tion that the Qureysh were equipped to the teeth to resist the Prophet's entry into Mecca and that the neighbouring tribes also were by their side. At this, the Prophet (Sallal- laho alaihe wasallam) consulted the eminent Sahabah to consider the situation. One proposal was to attack the houses of the tribes who had sent their men to help the Qu- reysh (so that they might forsake Qureysh in order to pro- tect their own homes), and the other was to march straight towards Mecca, Abu Bakr (Radhiyallahoanho) said: i I \"0 Prophet of Allah! We have come to perform 'Umrah. We have no intention of fighting with the Qu- reysh. Let us go ahead. If they stop us we shall fight, otherwise not.\" The Prophet (Sallallaho alaihe wasallam) agreed to the pro- posal of ~ b b to Bakr (Radhiyallaho anho) and decided march ahead towards Mecca. When he reached Hudey- biyah, Budail bin Waraqa Khuza'i met him with a group of ! people. He said: \"The Qureysh uncler no circumstances will permit i your entry intb Mecca. They are already drawn up in battle array.\" At this, the Prophet (Sallallaho alaihe wasallam) replied: I \"We have come to perform 'Umrah only and have no intention to fight. Frequent battles have already inflic- ted heavy casualties on Qureysh. If, therefore, they agree, I am prepared to talk over a no-war pact with them, so that they do not fight with me and I may deal with others. If, however, Qureysh do not see their way to accepting this proposal, then by Him who holds my i life in His hand, I will fight them till at last either i Islam prevails or I am slain.\" I 7 Budail returned to the Qureysh and conveyed to them what the Prophet had told him. But they did not agree to the peace proposal of the Prophet (Sallallaho alaihe wasallam). Parleys between the two sides however continued and, at one time, Urwah bin Mas'ood Thaqafi was sent by Qureysh as a plenipotentiary. Urwah had not then accepted Islam. The Prophet (Sallallaho alaihe wasallam) talked to him in the same strain as he had done to Budail. 'Urwah said: \"0 Muhammad (Sallallaho alaihe wasallam)! If you want to slay all the Arabs you cannot possibly do so, as none before you has ever succeeded in putting an end to all the Arabs. On the contrary if the Arabs get the upper hand, then take it from me that these persons round you will disappear in no time, leaving, you all alone, for I don't find any people of high birth among them. In fact they all come from a low stock drawn from all corners who will desert in trouble.\" Abu Bakr (Radhiyallaho anho), standing close by, was infu- riated at this statement, and resentfully told 'Urwah: \"Go and faun upon your goddess 'Lat'! We will by no means flee away and leave the Prophet (Sallallaho alaihe wasallam) by himself.\" 'Urwah asked: \"Who is he?\" The Prophet: 'Urwah: \"He is Abu Bakr.\" \"Abu Bakr! I am in turn you have done for this, I would abuse.\" debted to m have to you f replied e in the or a to good past. But your 'Urwah then resumed his deliberations with the Prophet (Sallallaho alaihe wasallam). 'Urwah occasionally touched the beard of the Prophet (according to the Arab custom) as he talked. The Sahabah could not tolerate this. Accord- ingly, 'Urwah's own nephew Mughirah bin Shu'bah (Rad- hiyallaho anho), who was standing armed near by, struck Urwah's hand with the handle of his sword and said: \"Keep your hand away.\" 'Urwah: \"Who is he?\" 248 The Prophet: (Sallallaho alaihe wasallam): \"He is Mughirah.\" 'Urwah: \"0. you betraver! How dare you maltreat your uncle. who is still suffering for your misbehaviour.\" (Before Islam. Mughirah, [Radhiyallaho anho) had killed a few persons. Urwah paid the blood money on his 1 behalf, and was referring to this incident). During his long discourse with the Prophet (Sallallaho alaihe wasallam), 'Urwah's had been quietly observing the behaviour of the Sahabah towards their Master: so when he returned to Qu- reysh he said to them: \"0, Qureysh! I have been an envoy to many great kings. 1 have seen the courts of Caesar, the Chosroes and the Negus. By Allah! Nowhere have I seen the people around a sovereign so respectful to him as I I found the companions of Muhammad (Sallallaho alaihe wasallam). When Muhammad spits, they rush to 1 I / receive the sputum in their hands before it touches the ground arid anoint their faces with it. Hardly a word escapes his lips before all of them run to carry out his wish. When he makes Wudhu, they fight with one an- other to collect some drop of the used water before it t falls on the ground. If any one fails to get that water. he touches the wet hands of the persori who had got it arid then rubs his own hands on the face. When they speak in his presence, they speak in low voice. They I do not lift their gaze to look at his face, out of respect ! for him. A hair falling from his head or beard is pre- served to get benediction from it arid is looked upon as i a sacred relic. In short, I have never seen any group of people so devoted to their master as I have seen the companions of Muhammad (Sallallaho alaihe wasal- lam) towards him.\" At long last, 'Usman (Radhiyallaho anho) was commis- sioned by the Prophet (Sallallaho alaihe wasallam) to nego- tiate with the Qureysh, as he, in spite of his conversion to Islam, commanded respect with them. When 'Usman (Rad- hivallaho anho) had left for Mecca, some of the Sahabah envied Usman's luck in (as they thought) being able to per- form l'awaf of the house of Allah. The Prophet (Sallallaho alaihe wasallam) on the other hand remarked: s= a\"\" o a \"I do not think he will ever like to do 'l'awaf without me.\" However when 'Usman (Radhiyallaho anho) entered Mecca, Abaan bi'il Sa'eed took him in his protection and said to him: .:$ Svl fa \"You roam where you like. Nobody car1 touch vou.\" 'Usman (Radhiyallaho anho) carried 011 his negotiations with Abu Sufyan and other chiefs of Mecca on behalf of the Prophet (Sallallaho alaihe wasallam) and, when he was about to return, the Qureysh the~nselves said to him: \"Now when vou are here at Mecca, you can perforin Tawaf before you return.\" He replied: \"How can it be possible for me when the Prophet (Sallallaho alaihc wasailam) has been prevented by you people from ellterilig Mecca.\" This reply was nlost unpalatable for the Qureysh and they decided to detain 'Usman (Kadhivallaho anho) at Mecca. A news reached the Muslims that 'Usnlan (Kadhiyallilho aliho) had been martyred. On this news reaching the Prophet (Sallallaho alaihe wasallam), he took the oath of al- legiance from all Sahabah ta fight to the litst drop of their blood. When the Qureysh learnt of this, they got frighteried and imrnediatelv released 'Usrnan (liadhiyallaho anho). In this story, Abu 13akr's (liadhivallaho anho) insultitlg 'Urrvah. Mughirah's (Kadhiyallaho anho) treatment of his uncle, the Sahabah's behaviour to\\vards the Prophet (Sal- lallaho alaihe ~lasallanl) as evidenc:ed by 'IJrwiih. and 'IJsman's (Kacllii~~allaho anho) refusing to do 'Tawiif '. all speak volumes. aboi~t the love and devotioll of Sahabah for the Prol~het (Sallallnho alaihe wasallam). Tile oath of nlle- giance mentioned in this story is known Bai'atush Shajarah (The Oath of a1 legiance beneath the tree) and is mentioned in the Quran (XLVIII: 18). 5. Ibn Zubair's (~adhi~all'aho anho) disposal of blood. Once the Prophet (Sallallaho alaihe wasallam) was bled by cupping. The blood was given to Abdullah bin Zubair (Kadhiyallaho anho) to bury it somewhere. He re- turned ant1 informed the Prophet (Sallallaho alaihe wasal- 250 251 lam) that the blood had been disposed of. The Prophet (Sallallaho alaihe wasallam) inquired: \"What did you do with it?\" Ibn-Zubair said: \"I have swallowed it.\" The Prophet (Sallallaho alaihe wasallam) remarked: \"The person who has my blood in his body cannot be touched by fire of Hell. But you will kill people and people will kill you.\" Everything coming out of the Prophet's body is clean. No doubt, therefore. remains in understanding Ibn Zubair's action. The last words of the Prophet (Sallallaho alaihe wa- sallam), however, make prophesy about the battles for power. which Ibn Zubair (Radhiyallaho anho) had to fight with Yazid and Abdul Malik. In the later part of his life, Ibn Zubair (Radhiyallaho anho) was killed in one of these battles. Even at the time of Ibn Zubair's (Radhiyallaho anho) birth, the Prophet (Sallallaho alaihe wasallam) had remarked that he was a sheep among the cloaked wolves. 6. Abu 'Ubaidah (Radhiyallaho anho) loses His Teeth. During the battle of Uhud, when at one time the Prophet (Sallallaho alaihe wasallam) was fiercely attacked by the enemy and two links of the helmet worn by him were struck deep into his head (or face). Abu Bakr and Abu 'Ubaidah (Radhiyallaho anhuma) ran to help him. Abu 'Ubaidah (Radhiyallaho anho) started pulling out the links with his teeth. By the time one of the links was out, he had lost one of his teeth. Without minding this, he again used his teeth to pull up the other link as well. He succeeded in taking out that one too, but he had to lose another tooth in the effort. When the links were drawn out, the blood began to ooze out from the Prophet's body. Malik bin Sinaan (Radhiyallaho anho), the father of Abu Sa'eed Khudri (Rad- hiyallaho anho), licked the blood with his lips. At this, the Prophet (Sallallaho alaihe wasallam) remarked: \"The fire of Hell cannot touch the person who has my blood mixed with his.\" 7. Zaid (Radhiyallaho anho) Refuses to Go With His Father. Once in pre-Islam days, Zaid (Radhiyallaho anho) was , Zaid, By Allah, no knowledge I have, whether you are killed on soft soil or on a rock.\" \"Ah, I wish I knew whether you would ever come back to me, for that is the only desire I am living for.\" \"I remember Zaid when the sun rises in the East. I re- member him when the rain comes from the clouds.\" \"The blowing wind kindles the fire of his memory. Alas, my lengthening grief and unending distress.\" \"I shall run my swift camels in search of him. I shall search for him round the universe.\" \"The camels may get tired, but I shall not rest, till I die, for death is the end of every hope.\" \"I shall still enjoin on my sons and such and such people, to keep searching for Zaid even after my death.\" .Some people of his clan happened to meet Zaid (Rad- hiyallaho anho) during their pilgrimage to Mecca. They re- lated to him the story of his father's grief and anguish, and recited to him the couplets which he sang in his memory. Zaid (Radhiyallaho anho) sent a letter to his father through these people. The letter consisted of three couplets ad- dressed to his father assuring him that he was quite well and happy in the present environments with his noble master. When the people went back, they informed his father of his whereabouts and delivered him Zaid's (Rad- hiyallaho anho) message. On receiving the letter, his father and his uncle left for Mecca with sufficient money to ransom Zaid (Radhiyallaho anho). When they came to the Prophet (Sallallaho alaihe wasallam) they said: 252 253 \"0, son of Hashim and the chief of Qureysh. You are the dweller of the Haram and the neighbour of Allah. You are known for freeing the captives and feeding the hungry. We have come to you in quest of our son. Accept the ransom money for Zaid and set him free. We are willing to pay even more than the ransom money. Pray, show mercy and be kind to us.\" The Prophet: \"What do you wish to do with Zaid?\" Zaid's father: \"We want to take him with us to our place.\" The Prophet: \"Is that all? Allright, then call Zaid and ask him. If he wishes to go with you, I shall let him go without any ransom. But I shall not send him against his wishes.\" Zaid's father: \"You have shown us more favour than we deserve. We most gladly agree to what you say.\" Zaid (Radhiyallaho anho) was presently sent for. The Prophet (Sallallaho alaihe wasallam) said to Zaid: \"Do you know these men?\" Zaid: \"Yes, I know them. This is my father and that is my uncl'e.\" The Prophet: \"And you know me too. They have come to take you back to your home. You have my full permission to go with them. If, on the other hand, you chose to stay on with me, you shall have your choice.\" Zaid: \"How can I prefer anybody else to you? You are everybody for me, including my father and my uncle.\" Zaid's father and uncle: \"0. Zaid! Do you prefer to be a slave? How can you leave your own father, uncle and other members of your family, and remain a bondsman?\" Zaid: \"Verily, I have seen something in my master that makes me prefer him to everybody else in the world.\" On this, the Prophet (Sallallaho alaihe wasallam) took Zaid (Radhiyallaho anho) in his lap and said: \"From today, I adopt Zaid as my son.\" . Anas bin Nadhr's (Radhiyallaho anho) Martyrdom in Uhud. When the Muslims were facing defeat in Uhud, some- body started the rumour that the Prophet (Sallallaho alaihe wasallam) had been killed. You can imagine the Sahabah's grief and anguish over this tragic news. This, quite natu- rally, caused most of them to lose heart in despair. Anas bin Nadhr (Radhiyallaho anho) happened to see 'Umar and Talhah (Radhiyallaho anhuma) with a group of Muslims in a state of utter bewilderment. He said to them: \"Why am I seeing you all so bewildered?\" They said: \"The Prophet (Sallallaho alaihe wasallam) is slain.\" Anas (Radhiyallaho anho) exclaimed: \"Then who will like to live after him? Come, let us go forward with our swords and join o,ur dear Prophet.\" No sooner did he utter these words than hr plunged into the enemy lines and fought till he was martyred. In fact, Anas (Radhiyallaho anho) had such an extreme love for the Prophet (Sallallaho alaihe wasallam) that he did not consider this life worth living without him. 9. Sa'd's (Radhiyallaho anho) Message For The Muslims. During the battle of Uhud, the Prophet (Sallallaho alaihe wasallam) inquired: \"What about Sa'd bin Rabee'? I don't know how things have gone with him.\" One of the Sahabah was despatched to search for him. He went to the spot where the bodies of martyrs lay in heaps. He shouted Sa'd's (Radhiyallaho anho) name to know if he 254 was alive. At one place, while he was announcing that he was deputed by the Prophet to enquire about Sa'd bin Rabee' (Radhiyallaho anho), he heard a feeble'voice coming from one direction. He turned to that direction and found that Sa'd (Radhiyallaho anho) was lying among the killed and was about to breathe his last. Sa'd (Radhiyallaho anho) was heard saying: \"Convey my Salaam to the Prophet with my message, '0 Prophet of Allah! May Allah grant you on my behalf a reward more exalted and more handsome than the one Allah has ever granted a Prophet on behalf of any of his followers, and tell my Muslim brothers, 'Nothing will absolve you from blame, on the Day of Judgement, if the enemy succeeds in reaching the Prophet (Sallal- laho alaihe wasallam) before all of you have fallen.\" With these words, Sa'd (Radhiyallaho anho) drew his last breath and passed into the presence of Allah. As a matter of fact, the Sahabah have given a true proof of their devotion to the Prophet (Sallallaho alaihe wasal- lam). While they suffered wound after wound and were on their last breath, they had no complaint nor wish on their lips and could not think of anything else except about the safety and welfare of the Prophet. Would that a sinner like me be blessed with an atom of the love that the Sahabah bore for the Prophet (Sallallaho alaihe wasallam). 10. A Woman Dies d n Seeing the Prophet's Grave. A woman. came to Aishah (Radhiyallaho anha) and said: \"Take me to the grave of the Prophet (Sallallaho alaihe wasallam), so that 1-may be blessed with its sight.\" Aishah (Radhiyallaho anha) opened the room that con- tained the grave of the Prophet (Sallallaho alaihe wasallam) and let her go inside. The woman on seeing the grave started crying in love and memory of the Prophet. In fact she wept so bitterly and incessantly that she swooned and expired there and then (May Allah bless her). The blessed lady recollected the happy days when the Prophet (Sallal- laho alaihe wasallam) was alive, and then the pangs of sep- I I I I I 11. Sahabah's Love For the Prophet [Sallallaho alaihe wa- sallam) and other Anecdotes. Somebody asked Ali (Radhiyallaho anho): \"How much was the Sahabah's love for the Prophet (Sallallaho alaihe wasallam).\" He replied: \"By Allah! To us the Prophet (Sallallaho alaihe wasal- lam) was dearer than our riches, our children and our mothers, and was more cherishable than a drink of cold water at the time of severest thirst.\" There is no exaggeration kn Ali's (Radhiyallaho anho) statement. As a matter of fact, the Sahabah reached this state because of the perfection of their Iman. It could not be otherwise, in the face of what Allah has enjoined viz: \"Say! If your fathers and your sons and your brethren and your wives and your tribe and the wealth you have acquired and the merchandise, for which you fear that there will be no sale, and the dwellings you desire are dearer to you than Allah and His messenger and striv- ing in His way, then wait till Allah bringeth His com- mand to pass. Allah guideth not the wrong-doing folk.\" (IX: 24). This verse sounds a note of warning against anything else becoming more attractive than the love of Allah and that of the Prophet (Sallallaho alaihe wasallam). Anas (Radhiyal- laho anho) and Abu Hurairah (Radhiyallaho anho) report that the Prophet (Sallallaho alaihe wasallam) once said: \"None of you can be a Mo'min until his love-for me is more than his love for his parents, children and all the people of the marld.\"</p></div>",
+        "sections": [
+            [
+                30,
+                16451
+            ],
+            [
+                16451,
+                32866
+            ],
+            [
+                32866,
+                49397
+            ],
+            [
+                49397,
+                65861
+            ],
+            [
+                65861,
+                82268
+            ],
+            [
+                82268,
+                98745
+            ],
+            [
+                98745,
+                115171
+            ],
+            [
+                115171,
+                131690
+            ],
+            [
+                131690,
+                148267
+            ],
+            [
+                148267,
+                164704
+            ],
+            [
+                164704,
+                181098
+            ],
+            [
+                181098,
+                197504
+            ],
+            [
+                197504,
+                214045
+            ],
+            [
+                214045,
+                230459
+            ],
+            [
+                230459,
+                246879
+            ],
+            [
+                246879,
+                263346
+            ],
+            [
+                263346,
+                279773
+            ],
+            [
+                279773,
+                296163
+            ],
+            [
+                296163,
+                312612
+            ],
+            [
+                312612,
+                329076
+            ],
+            [
+                329076,
+                345471
+            ],
+            [
+                345471,
+                357301
+            ]
+        ]
+    }
+]);
@@ -0,0 +1,91 @@
+// Fazail-e-Amaal Data Shard: book 2
+fazailData.stories.push(...[
+    {
+        "id": 22,
+        "bookId": 2,
+        "chapter": "Virtues of Reciting the Qur'aan",
+        "title": "Content for Virtues of Reciting the Qur'aan",
+        "preview": "256 'Ulama say that the love mentioned in this Hadith and others of its kind is the voluntary love and not instinctive love. If, however, it is taken ...",
+        "content": "<div class=\"story-content\"><p>256 'Ulama say that the love mentioned in this Hadith and others of its kind is the voluntary love and not instinctive love. If, however, it is taken to mean the natural and in- stinctive love, then the word Mo'min will denote the Iman of the highest degree, for instance that of Sahabah. Anas (Radhiyallaho anho) says that he heard from the Prophet (Sallallaho alaihe wasallam). \"There are three things which when found in a person enable him to taste the sweetness of real Iman. These are: (1) When Allah and His Prophet (Sallallaho alaihe wasallam) are dearer to him than anything else in this world. (2) When his love for anyone is solely for the pleasure of Allah, and (3) When turning to 'Kufr' is as abhorrent to him as being flung into the fire.\" 12. Miscellaneous Stories About Sahabah's Love for the Prophet (Sallallaho alaihe wasallam). (1) 'Umar (Radhiyallaho anho) once said to the Prophet (Sallallaho alaihe wasallam): \"0 Prophet of Allah, you are dearer to me than anybody else in the world except my own self.\" The Prophet: \"No body can be a perfect Momin until I am dearer to him than even his own self.\" t 'Umar: \"Now you are dearer to me than my own self.\" The Prophet: \"Now, O'Umar.\" The 'Ulama have given two meanings to the conclud- ing words of the Prophet viz: (i) \"Now you have the real Iman.\" (ii) \"Why is it that it is only now that I am dearer to you than your own self? This should have been so long ago.\" Suhail Tastari (Rahmatullah alaih) says: \"No one can have the relish of Sunnat until he takes 17 $ 4 the Prophet (Sallallaho alaihe wasallam) as his Master arid considers himself his (the Prophet's) slave.\" .f 4 s3 (2) A person came to the Prophet (Sallallaho alaihe wa- * sallam) axid asked: \"When shall be the Day of Judgement? 0, Prophet of Allah!\" The Prophet: \"What preparations have you made for that Day?\" The person: \"0. Prophet of Allah! 1 do not claim much Salaat, fast and Sadaqah to my credit, but I do have in my heart the love of Allah and that of His Prophet (Sallallaho alaihe wasal- lam).\" The Prophet:' \"On the Day of Judgement, you will surely 1 be with'him whom you love.\" i What the Prophet (Sallallaho alaihe wasallam) told the I person in this story has also been narrated by several other f Sahabah, namely Abdullah bin Mas'ood, Abu Moosa i Ash'ari. Safwan. Abu Zar, (Radhiyallaho anhum) etc. Anas (Radhiyallaho anho) says: \"Nothing did ever make Sahabah more happy than these words of the Prophet (Sallallaho alaihe wasal- lam).\" They had every reason to be ha py when the love of the Prophet (Sallallaho alaihe wasa P lam) had gone deep into every tissue and fibre of their body. (3) In the beginning. Fatimah's (Radhiyallaho anha) house was at some distance from the Prophet's. The Prophet (Sallallaho alaihe wasallam) once said to her: I I \"Would that you were living near me.\" Fatimah: 1 \"Harithah's house is close by. If you ask him to ex- change his house with mine. he will very gladly do it.\" i The Prophet: \"He has already exchanged once on my request. I feel I shy to request him again.\" 1 258 But Harithah (Radhiyallaho anho) somehow came to know that the Prophet (Sallallaho alaihe wasallam) likes Fatimah (Radhiyallaho anha) to live near him. He at once came to the Prophet (Sallallaho alaihe wasallam) and said: \"0, Prophet of Allah! I have come to know that you wish Fatimah to live near you. Here are my houses at your disposal. No other house is closer to yours than these. Fatimah can have her house exchanged with any of these. 0, Prophet of Allah, what you accept from me is dearer to me than what you leave for me.\" The Prophet (Sallallaho alaihe wasallam) accepted the offer, saying: \"I know you are quite sincere in what you say\", and gave him his blessings. (4) A person came to the Prophet,[Sallallaho alaihe wa- sallam) and said: \"0, Prophet of Allah! You are dearer to me than my life, my wealth and my family. When I am at my house and happen to think of you, I become restless till I come and see you. 0, Prophet of Allah, death ismre to come to both of us. After death, you will be in your exalted position as a Prophet, while I shall be some- where else and perhaps I may not be able to see you. I am very anxious and distressed when I think of this separation from you.\" The Prophet (Sallallaho alaihe wasallam) observed silence over this and he did not know what to say; then Jibra'eel (Alayhis Salaam) appeared and revealed the following verse: \"Whoso obeyeth Allah and the Prophet, they are with those unto whom Allah has shown favour among the Prophets and the Saints and the Martyrs and the Right- eous. The best of company are they. Such is the bounty of Allah, and Allah. sufficeth, as knower. (IV: 69 & 70)\" 4 A 5% These incidents were of frequent occurrence with the Saha- bah. Such fears in the hearts of the lovers are quite natural. fi The Prophet (Sallallaho alaihe wasallam) recited these verses for their consolation. A person once came to the Prophet (Sallallaho alaihe wa- sallam) and said: \"0, Prophet of Allah, my love for you is such that when I think of you, I cannot rest till I run to see you, for I am sure I would die if I did not see you. Now I grow very anxious when I imagine that, even if I am able to enter Paradise, it will be very difficult for me to see you, for you will be in a position far above my reach. \" The Prophet (Sallallaho alaihe wasallam) consoled him by reciting the foregoing verses in his reply. The Prophet (Sallallaho alaihe wasallam) saw a person from the Ansar looking very much distressed. He inquired: \"What makes you look so distressed?\" The Person: \"0, Prophet of Alldh! I have a worry.\" The Prophet: \"What is it?\" The person: \"0, Prophet of Allah! We come to you every morning and evening. We are blessed with your sight and de- lighted to be in your presence. But one day, we will be deprived of your company for you will be placed on heights inaccessible to us.\" The Prophet (Sallallaho alaihe wasallam) observed silence over this, but when the foregoing verses were revealed he sent for that person and gave him the glad tidings con- tained therein. According to another Hadith, a number of Sahabah had expressed similar fears until the Prophet (Sallallaho alaihe wasallam) rec,ited these verses to them, and they were satis- fied. According to another version, the Sahabah once asked the Prophet (Sallallaho alaihe wasallam): \"The Prophets on account of their ranks will surely be in much higher position than their followers. How will the followers be able to see them?\" 260 The Prophet (Sallallaho alaihe wasallam) replied: 1 \"Those in higher positions will come down to their friends in lower positions to sit with them and talk to them.\" I (5) The Prophet (Sallallaho alaihe wasallam) once said: t i \"Some of my followers coming after me will love me 1 very much. They will wish that they could see me, even if they had to spend their wealth, forego their i families and sacrifice all their possessions for it.\" i ! Khalid's daughter Abdah (Radhiyallaho anhuma) says: \"My father while in bed would talk about and remem- ber the Prophet (Sallallaho alaihe wasallam) with love and eagerness for him. He would also remember each and every M,uhajir and Ansari (by name) and would say, \"They are my elders and they are my youngers. My heart is eager to meet them. 0 , Allah! Call me back l soon, so that I may be able to meet all of them. He would keep on doing this till he would be overtaken by sleep.\" (6) Abu Bakr (Radhiyallaho anho) once said to the Prophet (Sallbllaho alaihe wasallam): t \"I have a greater wish for your uncle Abu Talib to I come into Islam than for my own father, as I know it i would please you more.\" 'Umar (Radhiyallaho anho) similarly, once said to 'Abbas (The prophet's uncle): \"I was more pleased at your Islam that at that of my father, for that gave pleasure to the Prophet (Sallallaho alaihe wasallam).\" (7) One night, 'Umar (Radhiyallaho anho) was on his security patrol when he saw a light and heard a sound coming from a house. He peeped in to find an old lady spinning wool and singing a few couplets with the follow- ing meaning: \"May Allah accept the prayers Of the pious and the elect.\" \"Seeking blessings for Muhammad (Sallallaho alaihe wasallam).\" s= c. 0 \"0. Allah's Prophet! You worshipped each night. And 0 % .f 4 you wept before the dawning of each day.\" S m 111 \"I wish to know if I could be together with my beloved \"A (Prophet).\" \"For death comes in different states (of mind) And I do not know how I shall die.\" 'Umar (Radhiyallaho anho) on hearing these couplets, sat down weeping in love and memory of the Prophet (Sal- lallaho alaihe wasallam). (8) The story of Bilal (Radhiyallaho anho) is known to all. At the time of his death, his wife sat by his side ex- claiming in excessive grief: \"0, dear! Alas!\" He retorted: \"Subhanallah! What a lovely thing it is to die and be able to meet Muhammad (Sallallaho alaihe wasallam) and his Sahabah.\" (9) We have already read the story of Zaid (Radhiyal- laho anho) in Chapter V While he stood at the gallows, about to be executed, Abu Sufyan said to him: \"How would you like it if Muhammad (Sallallaho alaihe wasallam) be killed in your place and you be let off to enjoy life with your family.\" Zaid (Radhiyallaho anho) replied: \"By Allah, it is unbearable for me to sit happily with my family while (even) a thorn is pricking the Prophet (Sallallaho alaihe wasallam).\" On this, Abu Sufyan remarked: \"There is no parallel anywhere in the world to the love which the companions of Muhammad (Sallallaho alaihe wasallam) have for him.\" A note: What is expected of those who claim to love the Prophet (Sallallaho alaihe wasallam)? The Ulama have given various answers to this question. Qaadhi Iyaadh writes: \"A lover prefers his beloved above all other things and persons. If this is not the case, the love is not sincere. It 262 is, therefore, essential for those who claim to love the Prophet (Sallallaho alaihe wasallam) that they follow him in his words and deeds, carry 'out his command- ments, give up everything that he has disliked and adopt his code of life (Sunnat) in ease and in adversity. Allah has said in His holy book: t I differences, but we have no right to comment on them. We must beware of the stories forged by Shiahs, inno- vators or biased historians, whose mischievous motive is to slander some of the Sahabah and slight the others. We must never doubt the sincerity and honesty of Sa- habah. When we come across any event in history which appears likely to lower their status in our eyes, jc %a 8 a $3 we must explain it as far as we can in their favour and attribute it to sincere motives, for they really deserve this line of action. We should always speak of their vir- tues and must hold our tongue in uttering anything Say (0, Prophet): If ye love Allah, follow me; Allah I likely to slight them. The Prophet (Sallallaho alaihe will love you and forgive you your sins. Allah is For- wasallam) himself has said, \"Observe silence in re- giving, Merciful.\" (111: 31). spect of my Sahabah (when they are mentioned wiih disrespect).\" There are many virtues and privileges of the Sahabah The Epilogue. given in the Qur'an and Hadith. Allah says in His holy book: The stories given in the previous pages are meant to serve as specimens. In fact a detailed account of Sahabah's lives can not be covered even in big volumes. It is now quite a few months since I started writing this small book. My engagements in Madrasah and other matters needing immediate attention have already delayed this work. I, therefore, propose to finish the book at this stage, so that people may at least benefit from these pages. I have to write an important warning before I close. Just as we are today lacking in our other duties we owe to Islam, so are we very seriously neglectful in our respect and esteem of the Saha- bah. Some negligent people go to the extent of even making adverse remarks against them, We must remember that the Sahabah are those people who laid the foundations of Islam. They are the pioneers in Tabligh. We can never be too grateful to them. May Allah shower His choicest bles- sings on their souls for their efforts in acquiring Islam from the Prophet (Sallallaho alaihe wasallam) and handing it down to their successors. I am reproducing below the translation of a chapter from \"Shifa\" by Qaadhi Iyaadh: \"Muhammad is the Prophet of Allah. And those with him are hard against the disbelievers and merciful among themselves. Thou (0, Muhammad) see-est them bowing and falling prostrate (in Salaat), seeking bounty from Allah and (His) acceptance. On their faces there are marks, being the traces of their prostration. Such is their likeness in the Torah and their likeness in \"If we claim to revere and honour the Prophet (Sallal- laho alaihe wasallam), we must also respect his Saha- bah. As Muslims, it is incumbent on us to appreciate what we owe to them, to follow them and to ask for- Gospel; like as sown corn that sendeth forth its shoot and strengthenth it and riseth firm upon it stalk, de- lighting the sowers-that He may enrage the disbelievers with (the sight of) them. Allah has promised, unto such of them as believe and do good works, His for- giveness of Allah for them. No doubt they had their giveness and immense reward. (XLVIII 291.\" 265 2) Allah was well-pleased .with the believers when they swore allegiance unto thee beneath the tree, and He knew what was in their hearts, and He sent dowri peace and reassurance on them and rewarded them with a near victory. And much booty that they cvill capture. Allah is ever Mighty, Wise. (XLVIII: 18: 19)\" 3) Of the believers are men who are true to what they Covenanted with Allah. Some of them have paid their vow by death (in battle), and some of them are still waiting to receive their martyrdom; and they have not altered in the least. (XXXIII: 23).\" 4) And the first to lead the way (in accepting Islam) among the Muhajirin and the Ansar, and those who followed them in'sincerity, Allah is well pleased with them and they are well pleased with Him; and He hath made ready for them Gardens underneath which rivers flow, wherein they will abide for ever. That is the su- preme triumph. (IX: loo).\" In the above verses of the Qur'an, Allah has praised Sa- habah and expressed His pleasure with them. Similarly the books of Hadith are full of their virtues e.g.: (1) Follow Abu Bakr and 'Umar when I am no more with you.\" (2) My Sahabah are like (guiding) stars. Whomsoever you follow, you will be guided (on the right path):\" ) \"The likeness of my Sahabah (amongst mankind) is as the likeness of salt in food. There is no relish in the food without the salt.\" (4) \"Beware (of opening your tongue) in slighting my Sahabah. Do not make them the target of your cal- umny. Who loves them, loves them for his love for me, and who spites them spites them for his spite for me. Who annoys them, annoys me, and who annoys me annoys Allah. Allah will very soon seize the person who annoys Him.\" (5) \"Do not revile my Sahabah. If any of you (persons coming after Sahabah) has spent gold (in Sadaqah) equal in weight to. Mount Uhud, he cannot get a reward equal to what my Sahabah get while spending one or half mudd of grain only.\" (A mudd equals 1.;' lbs.) ( 6 ) \"On the person who reviles my Sahabah rests the curse of Allah and of angels and of men combined. Neither his Fardh no his Nafl is accepted by Allah.\" (7) \"After the Prophets, Allah has preferred my Saha- bah above all His creation. I-le has again preferred four of my Sahabah over the rest of them. Thev are Abu Bakr. 'Umar, 'Usinan and Ali (Kadhiyallaho aniiurn).\" (8) \"0, people! I am pleased with Abu Bakr. You should realize his rank. I am also pleased with 'Umar, Ali. 'Usman, 'Talhah, Zubair, Sa'd, Sa'eed, Abdur Kahman bin Auf and Abu Ubaidah (Rad- hivallaho anhum). You should realize their rank. 0, people! Allah has anrlounced the forgiveness of all those who participated in Uhud and who swore allegiance at Hutfeybiah. 0, people! You should have regard for me while dealing with my Saha- bah. especially those who are mv kindred by mar- riage. Beware doing wrong to them, lest they complain against you on the Day of Judgement and you mav not be pardoned.\" (9) \"Have regard for me in dealing with my Sahabah and my kindred ill marriage. The person who has regard for me shall be in the protectio~l of Allah on the Day of Judgement. Allah is free of anv obliga- tion to him who has no regard for me. He may seize him any time.\" (10) \"On the Day of Judgement, I shall be the guardian of those who have regard for me in their dealing with my Sahabah.\" (11) \"The person who has regard for me in his dealing with my Sahabah, shall be able to reach me, when I shall be at Kauthar; while the person who has no regard for me in his dealing with them shall not be able to approach me. He may have a look at me from a distance.\" Ayub Sakhtiani (Rahmatullah alaih) says: \"Whoso loves Abu Bakr (Radhiyallaho anho), he estab- lishes his faith. Whoso loves 'Umar (Radhiyallaho anho), he receives guidance on the right path. Whoso loves Usman (Radhiyallaho anho), he is illumined with the light of Allah. Whoso loves Ali (Radhiyallaho anho), he holds fast to the cable of Allah. Whoso hon- ours Sahabah, can never be a Munafiq. Whoso reviles them, he is surely an innovator or Munafiq or anti- Sunnat. No good action of such person, I am afraid, will be accepted by Allah until he cleans his heart of their spite, and begins to love all of them.\" Sahl bin Abdullah (Rahmatullah alaih) says: \"He, who does not honour Sahabah, has actually not believed in the Prophet (Sallallaho alaihe wasallam).\" May Allah save me, my friends, my patrons, my ac- quaintances, my Shaikhs, my pupils and all Muslims from His wrath and from, His beloved Prophet's (Sallallaho alaihe wasallam) displeasure, and may He fill our hearts with the love for the Sahabah (Radhiyallaho anhum). Translated by:-Abdul Rashid Arshad By MUHAMMAD ZAKARIYYA 12 Shawaal 1357 (HIJRI) KANDHLAVI Virtues of the HOLY QUR'AAN a C Revised translation of z.? the Urdu book Faza'il-e-Qur'aan ;b Eg T x by Shaikhul Hadith Maulana Muhammad Zakariyya Kaandhlawi translated by Aziz-ud-Din CONTENTS c z a FOREWORD ...................................... 7 : , a O 2 M o ' 3 h -5 = > x PART 1 -FORTY AHADITH Hadith No: 1 Who is the best person?. ................... 17 2 Blessings of recitation and virtues of the Word of Allah ............................ 18 3 Rewards of two, three and four ayaat ........ 19 4 Rewards for fluent recitation and for falter- ing recitation. ............................ 22 5 Two things for which jealously is permiss- ible ..................................... 23 6 Similitude of those who recite the Holy Qur'an and those who do not ............... 23 7 Rise and fall of nations by reason of the Holy Qur'an .............................. 25 8 Three things shall be under 'Arsh (of Allah) on the Day of Judgement ................... 26 Reading it completely twice a year is the . right of the Holy Qur'an .................... 2 7 Commentary requires expert knowledge of fifteen sciences ........................... 28 9 Elevated stage in Paradise by virtue of the Holy Qur'an .............................. 32 10 A reward of ten virtues for every word of the Holy Qur'an .............................. 36 4 5 18 Contents Contents Hadith No: 11 Parents of one who recites the Holy Qur'an and acts according to it, shall wear a crown more brilliant than the sun . . . . . . . . . . . . . . . . . 37 12 Fire does not burn the Holy Qur'an . . . .. . . . . . 40 , I 3 One who memorizes and acts upon the Holy Qur'an shall be granted the right to inter- cede on behalf of ten persons . . . . . . . . . . . . . . . 41 14 Similitude of one who learns and recites the Qur'an is like a bag full of musk . . . . . . . .. . . . . 42 15 A heart devoid of the Holy Qur'an is like a deserted house . . .. . . . . . . . . .. . ... . . .. . . . . . 43 16 Recitation of the Holy Qur'an in Salaat is morevirtuous ............................ 44 17 The reward of reciting three ayaat in Salaat 45 18 Rewards of visual recitation and recitation by memory . . . . . . . . . . .. .. . . . . . . . . . . . . . . . . 45 19 Recitation of Qur'an cleans the rust of hearts 47 20 The Holy Qur'an is the honour and distinc- tion of Muslims I. . . . . . . . . . . . . . . . . . . . . . . . . . 48 21 Secitation of the Holy Qur'an is Nur (efful- gence) in the life and a provision in the Hereafter . . . . . . . . . . . . . . . . . . . . . . . . . .. . . . . . 49 Houses of recitation shine like the moon and stars, for those in Heaven . . . . . . . . . . . . . . . . . . 50 Number and subject-matter of Heavenly Booklets and Divine books . . . .. . . . . . . . . . . . . 51 22 Descent of Sakinah and mercy upon, and the surrounding by Angels of a group engaged in recitation of the Holy Qur'an . . . . . . . . . . . . . 53 Hadith No: 23 Those seeking nearness to Allah have no act more effective than recitation of the Holy Qur'an .................................. The dream of Imam Ahmad ibn Hambal . . . . . 56 56 aJ c = 3 L - O 2 $? 52 A means of attaining the stage of 'Ihsan' . . . . . . 57 24 Men of Qur'an are of the household of Allah 59 25 Allah's special attention towards the Prophet who recites the Holy Qur'an in a sweettone . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 60 26 Allah's special attention towards recitation byaQari . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 61 Hadhrat 'Abdullah ibn Mas'ood and a singer 62 27 The Holy Prophet's exhortation for reciting the Holy Qur'an day and night . . . . . . . . . . . . . . 63 An extract from the Torah. . ... . . . . . . . . .. . . . 65 / 28 The Holy Qur'an contains the essence of all previous Revelations-and more. '. .. . . . . . . . . 66 I 29 30 The Holy Prophet sits in the company of poor Muhajirin . . . . . . . . . . . . . . . . .. . . . . . . . . , The reward for reciting and listening to reci- tation of the HolvQur'an. . . . . . . . . . . . . . . . . . . - 67 69 31 Kewardsof loud and silent recitation . . . . . . . . 70 32 The Qur'an as an interceder . . . . . . . . . . . . . . . . 72 , 33 Intercessiori of Fast and the Holy Qur'an . . . . . 73 Stories of recitation . . . . . . . . . . . . . . . . . . . . . . . 74 i Kules for completing the reading of the floly Qur'an . . . . .. . . . . . . . . . . . . ,. .. . . . . . . . . . . . . . 75 Virtues,of the Holy Qur'an Contents Hadith No: 34 35 No interceder shall be better than the Holy Qur'an . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . Protection afforded by the Qur'an in the grave . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . One who reads the Holy Qur'an secures in his heart the knowledge of prophethood ..... 76 77 77 ' 7 Punishment for one who reads the Holy Qur'an for wordly benefits alone. . . . . . . . . . . . PART 3-FINAL NOTE . . . . . . . . . . . . . . . . . . . . . . . . . . PART 4- COMPLEMENTARY NOTE . . . . . . . . . . . . . 93 96 11 5 w fi 2-I ;6 e+ Sx 36 Three persons shall be strolling on mounds of musk ................................. 78 37 Learning of one ayat is more rewarding than hundred raka'at of Nafl Salaat .............. 79 38 One who recites ten ayaat shall not be reck- oned among the neglectful ...............:. 80 39 One steadfast in Salaat is not of the neglect- ful ...................................... 80 40 The Book of Allah is protection against evil disorders . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 81 PART 2 -CONCLUDING SECTION t 1 Surah Fatihah as a balm for all ailments. . . . . . 83 2 3 Virtues of Surah Fatihah and some other Sowar and ayaat . . . . . . . . . . . . . . . . . . . . . . . . . . Blessings of Surah Yasin . . . . . . . . . . . . . . . . . . . Blessings of Surah Waqi'ah . . . . . . . . . . . . . . . . 83 86 88 I 4 Blessings of Surah Tabarak-al-lazi . . . . . . . . . . 89 5 Which is the most virtuous act?. . . . . . . . . . . . . 91 6 Need for devotion to the Holy Qur'an . . . . . . . . 92 9 In the name of Allah, the Most Benevolent, the Most Merciful FOREWORD All praise be to Allah Who created man, gave him the gift of expression and revealed for him the Holy Qur'an, which is a source of advice, healing guidance and mercy for those who have faith. The Qur'an contains nothing that is doubt- ful or crooked. It is absolutely straight, and authority and I Nur (enlightenment) for the believers. Abundant and per- fect salutation be on Muhammad Rasulullah (Sallallaho alaihe wasallam) (blessing and peace from Allah be upon him), the person who is the best of all creation, whose Nur illuminated the hearts of the living and their graves after I death, whose appearance was a bounty for the whole uni- j verse. Peace be upon his descendants and Companions, who are the stars of guidance and propagators of the Holy t Qur'an, and also upon those believers who are their fol- lowers in faith. After this praise and salutation, I (the author), Zaka- i riyya, son of Yahya. son of Isma'il, state that these hur- I I FOREWORD riedly written pages contain forty ahadith (Plural of hadith-a saying of the Holy Prophet (Sallallaho alaihe wa- sallam)), which I have compiled on virtues of the Holy Qur',an, in obedience to such people whose words are law for me and following whom is most valuable to me. One of 3 3 I-- the special favours of Allah, the Sanctified and Pure, which have always descended upon the higher Madrasah (relig- ;& ious school) of Mazahir-ul-Ulum, Saharanpur, has been the @ Q annual gathering of this Madrasah for the purpose of briefly F x mentioning the progress of the institution. For this gather- ing at the Madrasah, not much effort is made to collect speakers, preachers and the famous people of India, but more attention is paid to invite men whose hearts are full of love for Allah and Masha'ikh (saintly people) who prefer to live unknown. Although those days have receded in the past when 'Hujjat-ul-Islam' (a title meaning a great author- ity on Islam) Maulana Mohammad Qasim Nanautvi Saheb (Rahmatullah alaih) and Qutbul Irshad (a title meaning a great savant) Hadhrat Maulana Rashid Ahmad Ganghoi Saheb (Nawwarallahu marqadahu) used to honour this gathering with their presence and illuminate the hearts of all who attended, and the scene has not yet disappeared from the eyes when the spiritual descendants of those revi- valists of Islam-Hadhrat Shaikh-ul-Hind (Rahmatullah alaih), Hadhrat Shah Abdur Rahim (Rahmatullah alaih), Hadhrat Maulana Khalil Ahmad Saheb (Rahmatullah alaih), and Hadhrat Maulana Ashraf Ali Thanwi Saheb (Nawwarallahu marqadahu) used to assemble at the annual gathering of the Madrasah. Their presence was a fountain source of life and light for deadened souls and quenched the thirst of those who sought Divine love. At present, though the annual gatherings do not have the illuminations of even such sources of guidance, their true spiritual descendants still honour these gatherings with their presence and enrich the audience with bounties and blessings. The people who attended the gathering this year are witnesses to this. Only those who possess eyes that see can experience the effulgence, but sightless beings like us can also feel something unusual. At the annual gathering of this Madrasah, if a person comes to listen to polished speeches and forceful lectures, he will perhaps not return so much happy as one who seeks a balm for his heart. FOREWORD 11 10 .. .' \".* 6-+ MJ\\ ,...& +vj ,,& .+ i,,w,J, -.. &ii . All praise and supplication is for Allah. In the same connection, during this year on 27th Zil- qa'dah (name of the eleventh month of Islamic calendar), 1348 Hijri, Hadhrat Shah Hafiz Mohammad Yasin Naginwi (Rahmatullah alaih) visited the Madrasah. His coming was like a shower of affection and kindness, and I cannot ad- equately thank him for this. After knowing about him that - I he is one of the spiritual heirs of Hadhrat Gangohi (Rahma- tullah alaih), there is no need of mentioning his fine quali- ties of devotion and piety, and the presence of Anwaar (Plural of 'Nu'-enlightenment and blessings) in his own person. When this gathering was over, he returned home and honoured me with a kind letter asking me to compile forty ahadith regarding the virtues of the Glorious Quran and send them to him along with their translations. He also wrote to me that, if I did not carry out his wishes, he would ask the successor to my Shaikh (teacher) and elderly uncle, Maulana Hafiz Alhaj Maulvi Mohammad Ilyas (Rahmatul- lah alaih), to confirm this order of his. He made it certain that he wanted me to do this job. Incidentally, I received I that honourdd message when I was out travelling and my uncle was present (at Saharanpur). On my return, my uncle gave this letter to me along with his own firm orders for compliance. Now there was no occasion for me for any I excuse or to plead lack of ability. Although my occupation with the commentary of 'Mo'atta' (a book of Ahadith) of Imam Malik (Rahmatullah alaih) was a good excuse, I had to postpone that work for a few days and, in compliance with the urgent orders, produce my effort for his esteemed consideration. I beg to be excused for such shortcomings as are inevitable because of my incompetence. +\\ & & 2 --&, & &\\ '& JG 2 & 2 ;&j r h , $ > au d\\ t% 3 & j f ~ 4, & 3, q+ $j\\ ,-. i; -. '&\\ $ J A. r , .. & 3 \\ j A$\\ ?& Q, s ~ i l L>, gG91 *>j -3, 5 x - . J! $jp ,.> 3 &b\\ Lj * *$, . . ,$! &,jc L j J ail$\\ &@ ?*ii . . L+ g j 9 1 +!ii &&I2 &j I have done it in the hope of being raised together on the day of judgement together with such people as were re- ferred by Rasulullah (Sallallaho alaihe wasallam) when he said: \"Whoever will preserve for my Ummah (followers of the Prophet) forty 'Ahadith' concerning important matters of their faith, Almighty Allah will raise him, on the Day of Judgement, as an Alim (religious scholar) and I will inter- cede on his behalf and stand witness in his favour.\" Alqami (Rahmatullah alaih) says that the word 'pre- serve' occurring in this hadith is used in the sense of secur- ing something and guarding it against loss by either committing it to memory without recording it or by record- ing in black and white, without even memorizing it. So any one writing them in the form of a book and passing them on to others will also be covered by the blessings men- tioned in this 'hadith.' Munaawi (Rahmatullah alaih) is of the opinion that \"preserve for my Ummat\" means reporting of a hadith along with its authority. According to some, \"preserve\" in- cludes even those who are reporting it to other Muslims without memorizing it or even Without knowing its mean- ings. Also the expression \"forty ahadith\" has been used in general sense, i.e., these ahadith may be all sahih (authen- tic), hasan (correct) or even da'if (weak) to the degree that can be acted upon because of their virtues. 9, ' \\* h.&: 56 Lf.J, >, Gj j& u; JG Allaho akbar! (How great Allah is!). Many are the fa- .$ &, &;$ d!j +&\\ 2 i j ~ j &$ , - Ji+ cilities provided in Islam. And commendable indeed has : L!j 4 6 #\\ ,. - , . O been the role of scholars and theologians who took such d j JG; &\\&j 2 9; JJ, J,, $2 +g 3 * pains to explain the subtleties of various expressions. May J ,& @ &\\ ; \\ , , , '$ I&& > Almighty Allah bless us all with perfection in Islam. $ $; &+\\; @$, . - &+ $\\ - , < 12 13 Virtues'of the Holy Qur'an It is important to note that whenever I have quoted a hadith without mentioning'the name of the book, it should be deemed to have been taken from one of the five books, viz., 'Al-Mishkat', 'Tanqih-ur-Ruwat', 'Al-Mirqat'. 'Sharah- ul-Ihya' and 'At-Targhib' of Mundhiri, on which I have relied and from which I have drawn extensively. Whenever I have quoted from any other book, the source has been mentioned. It is incumbent upon the reader of the Qur'an to ob- serve the rules of reverence for its recitation. Before proceeding further, it seems desirable to men- tion first some of the requirements of decorum for reading of the Holy Qur'an; because, as admitted. One who is devoid of reverence misses Allah's special favour, In brief, the essence of all the rules of reverence is to consider the Glorious Qur'an as the words of Almighty Allah. Whorq we worship, and as the Word of One Whom we love and seek. Those who have ever experieced love, know how worthy of adoration is a letter or speech of the beloved. The ecstatic raptures caused by such a communication are beyond all rules of propriety because, as it is said. Love itself will teach one the rules of conduct in love. So, while reading the Qur'an, if we attempt to \"isualise the real beauty and limitless bounty of our Beloved Allah, our hearts will be swayed by emotions of heavenly love. At the same tine, the Qur'an is the Word of the Master of mas- ters and thacommands of the Emperor of all kings. It is the law promulgated by the All-powerful Monarch, Who re- mains unequalled for ever. Those who have served at the courts of kings know by experience, while others can just visualise the extreme awe insprired by the king's orders. FOREWORD The Qur'an is the word of our Beloved Lord, Who is also the Supreme Monarch. We should, therefore read the Qur'an with the emotions of love and awe. It is said that whenever Hadhrat 'Ikramah (Radhiyal- laho anho) (may Allah be pleased with him) opened the Book for recitation, he became unconscious and fell down. Then he would utter, \"This is the Word of my Allah, this is the Word of my Allah.\" The aforesaid contains briefly the spirit of the require- ments of decorum as written in great detail by the Muslim scholars. It will further be explained in the following para- graphs. In short, a Muslim should read the book of Allah not just as a servant, but as a slave in the spirit of complete humility towards his Lord, Master and Benefactor. The Sufia (Plural of Sufi-mystic) have written that, if a person feels his shortcomings in exercising due respect and rever- ence while reciting the Qur'an, he will continue to progress along the path of nearness to Almighty Allah but a person who regards himself with approval or pride will not ad- vance further. Rules of Revere~re for readivg the Holy Qur'an After cleaning the teeth with a miswak (a green twig of special varieties of trees used for brushing the teeth) and wudhu (ablution), one should sit in a quite place with grace and humility and face towards Qiblah (direction to- wards the Ka'bah in Mecca). Then, with an attentive heart, deep devotion and zest befitting the occasion, one should recite, imagining all the time that he is reciting it to Almighty Allah. If one understands the meaning, one should pause and reflect on ayaat (Plural of 'ayat'-a verse of the Qur'an) of promise and mercy and should beg for His forgiveness and compassion. On ayaat of punishment and admonition, one should seek His refuge, as except Him there is no Helper. On ayaat pertaining to His Majesty and Sanctity, one should say \"Subhaanallah\" (Glory to Allah). If one does not spontaneously shed tears while reading the Book, one must induce oneself to weep a little. 15 14 1 For a lover, the moments of greatest pleasure are those when, in the presence of his beloved, he is full of self- reproach and shedding tears profusely. One should not read fast unless one desires to memor- I ize it. The Qu'ran should be placed in a slightly elevated position on a wooden stand or a pillow. One should not talk to others during recitation. If one is forced by necessity to speak to someone, it should be done after first closing the Book, and then recite 'Ta'awwudh' (seeking refuge of Allah against Satan), before reading again. If people nearby are occupied in their work, reading in a low voice is appre- ciated otherwise reading loudly is more rewarding. The Masha'ikh have mentioned six external and six in- ternal rules of reverence for reading the Holy Qu'ran, which are given below: I Rules of External Iieverence (1) Perform Wudhu and then sit facing Qiblah in an extremely dignified manner. (2) Do not proceed fast, but read with measure and correct pronunciation. (3) Try to weep, even if vou have to compel yourself to do so. (4) The response to ayaat of mercy or 01 punishment should be as explained above. (5) Reading should be in a low vo~ce. if insincerity is apprehended on your own part or disturbance is caused to others. Otherwise read in a loud voice. (6) Read in a melodious voice, because there are nu- v merous ahadith laying emphasis on this. Rules oflnternal Reverence (1) The heart should be full of the glory of Qur'an i.e. realizing how sublime it is. (2) Bear in the heart the Loftiness, Majesty and Mag- nificence of Almighty Allah, Whose Revelation the Qu'ran is. FOREWORD (3) The heart should be free from distraction and doubts. (4) Dwell upon the meanings and enjoy reading it. Rasulullah (Sallallaho alaihe wasallam) once spent the whole night reading over and over again the following ayat: If Thou should chastise them, they are Thy servants, and if Thou should forgive them, Thou art the Mighty, the Wise (V: 118). Once, Hadhrat Sa'eed ibn Jubair (Radhiyallaho anho) spent the whole night repeating the following ayat: And withdraw aside today, 0 guilty ones! (XXXVI: 59). (5) Submit your heart to the subject-matter of the verses you are reading. For instance, on ayaat con- taining a message of mercy, the heart should be filled with delight. And on ayaat of chastisement, the heart should tremble with awe. (6) The ears should be made as attentive as if Almighty Allah Himself is speaking and the reader is listening to Him. May Allah, out of His mercy and kindness, grant all of us the ability to read the Qu'ran according to these rules of reverence. A Heligious Principle The memorizing of that much of the C;lorious Qu'ran as is necessary for the offering of salaat is obligatory for every Muslim, whereas memorizing the whole of the Holy Qur'an is Fard Kifavah, i.e. an act obligatory on all, but which may suffice if performed by an adequate number. If there were not a single hafiz (may Allah forbid) all the Muslims would be held responsible for this sin. Mulla'Ali Qari (Rahmatullah alaih) has further reported from Zarka- shi (Rahmatullah alaih] that if, in a town or a village, there were no person to read the Holy Qur'an, all the Muslim in- habitants of that place would be considered sinful. In this 16 age of darkness and ignorance when the Muslims have boc:ome misguided in respet:t of manv aspects of Islam, it is gr:nerally (:onsidered useless and stupid to nlemorize the Qur'an and a sheer waste of time and mental energy to repeat its words without understanding their meaning. If this were the only case of our aversion to faith, something in detail could be written about it. But today all our acts are erring and all our thoughts are leading us astray. For how manv should one wail and about how many should one complain. So to Allah do we complain and from Him do we seek help. PART I FORTY AHADITH Hadhrat Uthman (Radhiyallaho anha) narrates that Ra- sulullah (Sallallaho alaihe wasallam) said: \"The best amongst you is he who learns the Qur'an and teaches it.\" In most of the books, this hadith is quoted with the word 'and' between 'learns' and 'teaches' as above. Thus the greatest reward would be for him who learns the Holy Qur'an and thereafter teaches it to others. But in some of the books this 'hadith's is narrated with the word 'or', in which case the meaning would be: \"The best amongst you is he who learns the Qur'an or teaches it.\" Accbrding to this version, the reward is general, i.e., I equally great whether one learns himself or teaches to others. Thus there would be equal virtue for both. I The Qur'an is the basis of the religion of Islam, and on the preservation and propagation of the Qur'an depends the .very existence of this faith. Hence the virtue of learning and teaching the Qur'an is self-evident and does not need further elucidation. There are, however, various degrees of excellence. The t highest is to learn the Qur'an along with its meanings and purport, and the least is to learn its words only. The hadith mentioned above is supported also by an- other saying of Rasulullah [Sallallaho alaihe wasallam) as reported by Hadhrat Sa'eed ibn Saleem (Radhiyallaho anho): \"If a person who has acquired knowledge of the Holy Qur'an considers another person who has been gifted with something else to be more fortunate than himself, he has shown disrespect to the blessings of Allah bestowed on 18 19 him on account of his learning the Qur'an.\" It is evident that since the Qur'an, being the Word of Allah, is superior to all other discourses as mentioned in some of the ahadith quoted later, its reading and teaching must be superior to everything else. Mulla Ali Qari quotes from another hadith that who- ever acquires the knowledge of Holy Qur'an stores the knowledge of prophethood in his forehead. Sahl 'i'astari (Rahmatullah alaih) says that the proof of love for Allah is the existence of love for the Word of Allah in one's heart. In 'Sharhul Ihya', the list of people who will be given shelter in the shade of the Arsh (Throne of Allah) on the fearful Day of Judgement includes those persons who teach the Qur'an to the children of Muslims and also those who learn the Holy Qur'an in their childhood and are devoted to its recitation when grown up.<br><hr><br>Hadhrat Abu Sa'eed (Radhiyallaho anho) narrates that Rasulullah (Sallallahotalaihe wasallam) said: \"Almighty Allah says; \"If anybody finds no time for My remembrance and for begging favours of Me, because of his remaining busy with the Holy Qur'an, I shall give him more than what I give to all those who beg favours of Me. The superiority of the Word of Allah over all other words is like the super- iority of Allah over the entire creation. In other words, compared to those who are begging favours of Allah, He will surely confer some better reward on a person who remains so occupied with committing the Qur'an to memory or learning and understanding it that he hardly gets time for du'a (prayer). It is commonly known that when a man distributes sweets, or something else amongst others, a share is set<br><hr><br>) aside for the person who cannot attend the function be- cause of the task of distribution given to him by the dis- tributor himself. In another hadith, in the same context, it is mentioned that Allah would give such a person a better 2 5 reward than what He would give to His ever grateful ser- =-a vants. ;!3<br><hr><br>Hadhrat 'Uqbah ibn Aamir (Radhiyallaho anho) has said: \"Rasulullah (Sallallaho alaihe wasallam) came to us while we were sitting on the Suffah and asked if any one of us would like to go to the market of But-haan or Aqeeq and fetch from there two she- camels of the finest breed without commiting any sin or severing a tie of kinship. We replied that everyone of us would love to do so. Rasulullah (Sallallaho alaihe wasallam) then said that going to the musjid and recit- ing or teaching two ayaat of the Qur'an is more pre- cious than two she-camels, three ayaat are most precious than three she-camels, and that similarly re- citing or teaching of four ayaat is better than four she- camels and an equal number of camels.\" \"Suffah\" is the name of a particular raised platform in the Mosque of the Holy Prophet (Sallallaho alaihe wasal- lam) in Medina. It used to be occupied by the poor Muslim muhajirin (Plural of muhajir-emigrant from Mecca to Medina) who are known as \"Ashab-us-Suffah\" (Men of Suffah). The number of these men varied from time to time: 'Allamah Suyuti (Rahmatullah alaih) has listed one hun- dred and one names and also written an independent book- let about their names. 2 0 18<br><hr><br>) 21 But-han arid Aqeeq were the two market-places for camels near Medilia. 'l'he camel, more particularly a she- camel having a fat hump, was a favourite of the Arabs. The expression \"without sin\" is significant. A thing can be acquired without labour either by extortion, through illegal inheritance (by forcefully taking over the property of some relative) or by theft. Kasullullah (Sallallaho alaihe wasallam) thus ruled out all such acquisitions. Acquiring a thing without any sin is certainly preferred by all, but much more valuable is the learning of a few ayaat. It is a clear fact that let alone one or two camels, even if one acquires the kingdom of all the seven continents one will be forced to leave it, if not today surely tomorrow (at the time of death), but the reward of one ayat will be ever- lasting. We see even in this life that a man feels happier when he is given only one rupee (without the condition of returning it), rather than if he is given one thousand rupees for keeping in his safe custody for a while only. In the latter case, he is merely burdened with a trust without get- ting any benefit out of it. in fact, this hadith implies an admonition not to compare something temporary with sonlething eternal. Whether in action or at rest, a man should corisider if his efforts are being wasted on acquiring the temporary gains of this world, or, are directed towards achieving the everlasting ones. Woe be to the waste of effort for which we earn eternal misery. The last phrase of the hadith \"superior to an equal number of camels\" con- tains three meanings. First, upto the number four, the reward has been mentioned in detail. Beyond this, it is brieflv mentioned t h d the more ayaat a person acquires, the greater will be their superiority over the number of camels. In this case, the word \"camels\" at the end refers to the species-either he-camels or she-camels-and the number implied is more than four because, upto the number four. the reward has been mentioned in detail. The second meaning is that the numbers mentioned are the same as referred to earlier, the significance being that incli- nations are always different; some are fond of she-camels, others prefer a he-camel. Therefore Rasulullah (Sallallaho alaihe wasallam) has used this expression to signify that every ayat is superior to a she-camel, and if one prefers a he-camel, an ayat is also superior to a he-camel. The third meaning is that the numbers mentioned are the same as re- ferred to before and not more than four. According to the second meaning, the explanation that an ayat is superior to a she-camel or he-camel does not hold good, but it implies a collection, i.e.. one ayat is superior to a he-camel and a she-camel considered together, and likewise every ayat is superior to the combination of an equal number of he- camels or she-camels. Thus a single ayat has been com- pared to a pair or couple (of camels). My late father (May Allah bless his grave with Divine light) has preferred the latter interpretation because it points to a superior virtue. This however, does not mean that the reward of an ayat can be equalled to a camel or two camels. All this is for induce- ment arid illustration. It has been clearly written before that an ayat whose reward is permanent and enduring is superior and preferable even to a kingdoni over the seven continents. which is bound to disintegrate. Mulla 'Ali Qari has writteri an account of a pious Shaikh who went to Mecca for Hajj on the 9th day of Dhul Hijjah--the 12th month of the Islamic calendar. When he landed at Jicldah, some of his friends in business requested him to prolo~ig his stav in Jiddah, so that they could earn more profit for their merchandise by virtue of his blesskd presence. In fact thev wanted that some of the servants of the Shaikh be benefited by the profits of their business. At first the Shaikh expressed his inability to prolong his stay. but when thev insisted the Shaikh asked them as to the maximum profit that they woutd earn for their goods. Thev explained that the profit was r7t the same in all cases; but the maximum that they could expect was hundred per cent. The Shaikh said, \"You have taken all this trouble for such a petty gain: for such ari insignificant gain. I cannot miss the salaat in the respected Harani (the most Sacred Mosque), where the reward of salaat gets multiplie(l one hundred thousand times.\" 111 fact, we Muslims should con- sider how, for petty worldly gains, we some~imes sacrifice great spiritual benefits. 3 22 1.9 Iladhrat 'Aa'ishah (Kadhiyallaho anha) narrates that Rasulullah (Sallallaho alaihe wasallam) once said. \"One who is well versed in the Qilr'an will be in the c:ompanv of those angels who are scrihes, noble and righteous; and one who falters in reading the Qur'an, - and has to exert hard for learning, gets double the reward.\" \"Orie who is well versed in the Qur'an\" means one \\vho is proficierit in riiemorizitlg as well as in reciting it. It is highly praiseworthy if one masters its meaning and sig- nifir:anc:e as well. \"To be with the angels\" means that, like tht? i~ngels who transferred tlie Qur'a~i from the. Lowhul Mahfooz' (Protectetl 'I'ablet in the Heavens), he also (:on- \\lovs it to othors through its recitatioti and, therefore, both Ilave the salnc occupation; or that he will join the company of such angels on the Day of Judgement. One who faltcrs ivill get double reward-olio for his reading and the other tor liis effort in readi~tg the Qur'an, in spite of fitltt?~.i~~g ag,lin atid again. It does liot rnean that liis reward will c:xc.eed that of a well-versed person. The reward tliot is mt:ntioned for a well-versed person is far gleater. so nluc:h so that he ivill be in the company of special angels. 'The ex- plii~iation is that the labour involved in faltering and tlie tlifficllltics in the reading of the Qur'an carry an indeperi- don1 reward. As such, reading of the Qur'ali should not be given up, even though faltering 1lliiv be ail excuse. M ~ ~ I 1 ; ~ 'Ali Qari has reproduc:t?ci fmm the riwbyat of Ta- broni and Unihaqi that one ~ ~ 1 1 0 (:a11110t menlorizt* the (211r'an well and yet persists i l l loarning it by heart gets doi~blt: reward. Sitnilarly, one who cherishes a longing for 111cmorizi.ing it and does not posst!ss the iibilitv to do so, but doc.s not give up his efforts. will t)e reckoned by Almighty hllah atnorig the hl~ffaili! (Plural of hafiz-one who has laarnt !he whole Qur'an hv heart) on the Day of Kesurrec- t ion. $ r<br><hr><br>) 2 3 Hadhrat Ibn Umar (Radhiyallaho anho) narrates that Rasulullah (Sallallaho alaihe wasallam) said, \"Hasad (jealousy) is not permitted except in respect of two persons-one whom Allah blesses with recitation of a = Qur'an and he remains engaged in it day and night, = ar and the other who is given a lot of wealth by Allah and he spends it day and night.\" ;$ c* On the authority of many ayaat of the Qur'an and nu- g merous ahadith, hasad is an evil and is absolutely forbid- den. This hadith, however appears to permit hasad in respect of two persons. Because there are many well-known traditions dealing with hasad, the Ulama (Plural of aalim- religious scholar) have interpreted this hadith in two ways. Firstly, hasad as denoted by the Arabic word 'ghibtah', is taken here in the sense of emulation. There is a difference between jealousy and emulation. Hasad is a desire that one possessing a blessing should be deprived of it: whether the person who feels jealous acquires it or not, while emu- lation signifies a desire to possess a thing, whether the actual owner is deprived of it or not. Since hasad is haram (religiously unlawful) under Ijma (consensus of opiniod), the Ulama have translated, by way of metaphor, this word hasad as ghibtah, meaning emulation. Ghibtah is permiss- ible in worldly affairs and commendable in religious mat- ters. The second interpretation is that the term hasad has been used in a hypothetical sense, i.e., if hasad were per- missible it would have been so with regard to the two per- sons mentioned above.<br><hr><br>24 Hadhrat Abu Musa (Radhiyallaho anho) narrated that Rasulullah (Sallallaho alaihe wasallam) said: \"The example of a mo'min (believer) who reads the Qur'an is like that of citron which has a pleasant smell and a sweet taste. The example of a mo'min who does not read the Qur'an is like that of a date, which has no smell, though its taste is sweet. The munafiq (hyp- ocrite) who does not read the Qur'an is like a wild gourd, which has a bitter taste and no smell, and the munafiq who reads the Qur'an is like a raihan [sweet- smelling flower), which is fragrant but has a bitter taste. \" In this hadith an abstract quality of reading the Glor- ious Qur'an, has been compared to concrete objects in order to illustrate the difference between reading and not reading the tIoly Qur'an. Otherwise it is obvious that ma- terial objects of this world like citrons and dates cannot match the sweetness and perfume of the Qur'an. There are, however, special points in this similitude, which pertain to the deep knowledge of the Prophets and testify to the vast understanding of Rasulullah (Sallallaho alaihe wasallam). Consider, for example, the citron, which gives flavour to the mouth, cleans the stomach and stimulates digestion. These are the qualities specially associated with the reading of the Qur'an since, fragrance in the mouth. inter- nal purity and spiritual strength result from reading the Qur'an. It is also said that if there is citron in the house, no jinn can enter it. If it is true. then such is the speciality of the Qur'an. Some physicians say that citron strengthens the memory and it is rep'orted in 'Ihya' by Hadhrat Ali (Rad- hiyallaho anho) that three things, i.e., cleaning the teeth with miswak, fasting and reading the Holy Qur'an strengthen the memory. i In the book of Abu Dawood, it is mentioned at the con- 5 clusion of the hadith given above that a good companion is like a person having musk. Even if vou do not get musk, you will at least enloy its fragrance. An evil companion is like a person with a furnace, near whom, even if you do not get blac:kened, vou certainly cannot avoid the smoke. It is, / i therefore. important that one should be very careful in choosing his companions, with whom he has to mix gener- I ally. i<br><hr><br>) 2 5 ,I i > ... ,, b, $>&l3!& $1 J$, JG J & ~ ~ - + U ~ J . ;r-; 9 'p (V) - \"L Hadhrat 'Umar (Radhiyal~aho anho) narrates that Ra- is sullullah (Sallallaho alaihe wasallam) said: \"Allah E 3 exalts many people by means of this Book (the Holy sa Qu'ran), and He also degrades and disgraces many others by means of the same.\" People who believe in the Holy Book and act upon it are given by Allah position of honour and respect, both in this life as well as in the Hereafter, while those who do not act upon it are disgraced by Allah. This principle is also borne out by the various ayaat of the Holy Qur'an. At one place it reads: \"He misleads many by this Book and guides many thereby.\" At another place we come across: \"And We send down in the Qur'an that which is a healing and mercy for believers, though it increases for the evil-doers naught save ruin.\" The Prophet (Sallallaho alaihe wasallam) is also re- ported to have said: \"Many hypocrites of this Ummat will be the qurraa, i.e., those who recite the Qur'an correctly.\" In 'Ihya-ul-Ulum' it is reported ffom some Mashaa'ikh. \"As soon as a man starts reading a surah (chapter of the Holy Qur'an), the Angels start invoking mercy for him and they continue to do so till he stops reading; on the contrary an- other person starts reading a surah and the Angels start cursing him and they continue to do so till he completes the reading.\" Some scholars have stated that sometimes a man reads the Holy Qur'an and invokes curses on himself without even knowing it. For instance, he reads in the Holy Qur'an: 26 Virtues of the Htdy Qur'an \"Beware, the curse of Allah is on the wrong-doers\" and he exposes himself to this warning because of his wrong- doings. In the like manner, he reads in the Qur'an: \"The curse of Allah is upon the liars\". In fact he exposes himself to the warning by reason of his being himself a liar. 'Aamir ibn Waathilah (Radhiyallaho anho) say$ that Hadhrat 'Umar (Radhivallaho anho) had appointed Naafi' ibn Abdul Harith as the Governor of Mecca. Once he asked the latter as to whom he had appointed as the administra- tor of forests. \"Ibn Abzi\" replied Naafi'. \"Who is Ibn-e- Abzi?\" said Hadhrat 'Umar (Radhiyallaho anho). \"He is one of our slaves\" was the reply. \"Why have you appointed a slave the ameer (leader)?\" objected Hadhrat 'Umar (Rad- hiyallaho an\\ho). \"Because he recites the Book of Allah\" said Naafi'. At this, Hadhrat 'Umar (Radhiyallaho anho) narrated the hadith that it had been said by Rasullullah (Sallallaho alaihe wasallam) that, because of this Book. Allah elevates many people and degrades many. Hadhrat 'Abdur Rahman ibn 'Auf (Radhiyallaho anho) narrates that Rasulullah (Sallallaho alaihe wasallam) said, \",On the Day of Judgement, three things will be under the shade of the Arsh (Allah's Throne). One, the Holy Qur'an which will argue with men-the Qur'an has both an exterior and an interior. The second will<br><hr><br>) 2 7 be amaanat (trust). The third will be kinship, which shall proclaim, '0. Allah! have mercy wn the person who upheld me. and deprive him of Your merry who- soever severed me.' \" \"Three things will be under the shade of the 'Arsh\" signifies their utmost nearness in the sublime preserlce of Allah. \"The Qur'an will argue\" nieans that it will pleacl tht: cause of those people who read it, respect it and act upon its commandments. It will intercede on their behalf and solicit the upgrading of their rank. Mulla 'Ali Qari has tiar- b rated on the authority of 'Tirmizi' (a book of Hadith) that. in the presence of Almighty Allah, the Holy Qur'iin will beg Allah to grant an apparel to its reader. Almightv Allah will give him a crown of honour. The Qur'an will again beg for additional favoitrs for him. Thereupon Alrnighlv All;th will award the reader a complete robe of honour. 'I'llu Qur'an will again beseech Allah to be pleased with him. and Almighty Allah will express His pleasure to him. We find in this life that the pleasure of the belovt:d is considered to be the most coveted gift. Similarly ill the life Hereafter, no bountv shall stand comparison with the pleasure of our ljeloved Alnlighty Allah. And in c a w of those who ignore their duty towards the Qur'an. it will challenge them saving, \"Did you care for me'? Ilid vou fullil your obligations towards me?\" It has been reported on the authority of Irnnrn Abu Hariifa (Rahn~atullah alaih) in 'Ihya' that it is the clue right of the Qur'an that it should be read completely tu' ,I year. Those of us who never care to reaci the Qur'an shoultl first consider how they will defend themselves agilir~st such a strong plaintiff. Death is inevitable and thew (:an l)e no escape from it. i The meaning of the expression \"exterior and interior of the Qur'an\" is evident. The Qur'an has an apparcxlt mean- ing which can be understood by all. but the doepcr spiri- 1 t tual significance is not understood by everybody. It is in this connection that Rasulullah (Sallallaho alaihe wasal- lam) has said: \"Whosoever expresses his personal opinion in respect of anything .in the dur'an commits niistake. even if he be right in his opinion.\" Some scholars hold that the word 'exterior'. refers to its words, which can be recited properlv by evervbodv and the word 'interior', i.e., spirit, refers to its n~eanings. and its ! underlying ideas, the understanding of which varies with the ability of the readers. E I i 28 29 Hadhrat Ibn Mas'ood (Radhiyallaho anho) said, \"If vou seek knowledge, you should meditate on the meanings of I the Qur'an, because it embodies the history of former as well as of latter times.\" It is, however, essential to observe the pre-requisites for interpreting the Qur'an. An unbecom- I ing present-day fashion is that even those who possess little or no knowledge of Arabic vocabulary offer their per- sonal opinion on the basis of vernacular translations of the 1 Qur'an. Specialists have laid down that any one atte~npti~lg I a commentary of the Holy Qur'an should be well versed i11 fifteen subjects. These, as briefly given below, will show that it is not possible for everybody to understand the underlying significance and real meanings of the Holy Qur'an. (1) Lughat, i.e., philology of language, which helps in understanding the appropriate meanings of words. Mujahid (Kahmatullah alaih) says, \"one who be- lieves in Allah and the Day of Judgement should not open his lips in respect of the Qur'an, unless he is thoroughly conversant with the philology of the Arabic language. Quite often an Arabic word has several meanings. A person may be knowing only one or two of them, though in a given context the gctual meaning may be quite different.\" (2) Nahw, i.e., syntax, a branch of grammar. w11ic:h helps in understanding the relation of a sentence 1 with another and also of I'raab (vowel sounds) of the letters of a word. A change in I'raab often means a change in the meaning. (3) Sarf. i.e., et$mology, a branch of grammar, which helps in knowing the root words and conjugations. The moaning of a word changes with the change in the root and with a change in its conjugation. Ibri Faris (Rahmatullah alaih) says, \"One who loses the knowledge of etymology loses a great deal.\" 'Allamah Zamakhshari (Rahmatullah alaih) mentions that, when a certain person set to translate the ayat- On the day that We shall call each and every people after their leader,<br><hr><br>) he ignorantly rendered it thus: \"On the day that We shall call each people after their mothers.\" He supposed that the singular Arabic word 'imam' (leader) was the plural of the Arabic word 'urnm' (mother). if he had been conversant with etymology, he would have known that the plural of 'umm' is not 'imam'. (4) Ishtiqaaq, i.e., derivatives, It is necessary to have the knowledge of derivatives and their root words, because if a word has been derived from two dif- ferent root words, it will have two different mean- ings, e.g.. the word 'maseeh' is derivable from 'masah' which means to touch or to move wet hands over, and also from 'masaahah' which means measurement. (5) Ilrnul Ma'aani, i.e., knowledge of semantics, be- cause phrase constructions are understood from their meanings. (6) Ilrnul Buyaan, i.e., knowledge of figures of speech, like similes and metaphors, due to which express- ions or shades of meaning or similes and meta- phors become known. (7) llrnul Badee', i.e., knowledge of rhetoric, the knowledge which reveals the beauty of language and its implications. The last three are the branches of Ilmul Balaaghah (knowledge of oratory), clnd are considered very important subjects, which a cornmelltator should master, because the Glorious Qur'an is a perfect miracle and its amazing con- structions can only be understood after mastering these subjects. (8) llmul Qirrta'ah, i.e., knowledge of the art of pro- nunciation. because different methods of recita- ti011 sc~metimes convey different meanings, anci so~nekimesone meaning is to be preferred over the other. (9) IlmuJ Aqaa'id, i.e., knowledge of the fundamentals of faith. This is necessarv to explain certain ana- logies. The literal meaning of certain ayaat refer- ring to Almighty Allah is not the correct one. For example, the analogy in the ayat-- 31 (The hand of Allah is over their hands) will have to be explained because Allah has no physical hands. (10)Usoolul Fiqh i.e., Prin~iples of Islamic Jurispru- dence. These are necessary for reasoning out and finding arguments in the basic support of state- ments. (11) Asbaabun Nuzool, i.e., the particular circum- stances which caused revelation. The meaning of an ayat will be better understood if we know how arid when it had been revealed. Someti~nes the true meaning of an ayat is understood only if we know the circumstances in which the ayat had been revealed. (12) An Naasikh wal Mansookh, i.e., knowledge of commandments that have subsequently been abro- gated or changed. so that abrogated command- ments may be distinguished from the standing ones. (13) IImul Fiqh, i.e., knowledge of Islamic Jurispru- dence, because it is only through this knowledge that' we arrive at a complete understanding of gen- eral principles. (14)Knowledge of such ahadith that happen to be com- mentary on cerfain brief verses of the Qur'an. (15)The last but most important is the Wahbi ilm, or the gifted understanding, bestowed by Almighty Allah upon Ilis selected ones, as is referred in the hadith- Whosoever acts upon what he knows, Almighty Allah bestows upon him the knowledge of things not known to him. . It is this special understanding that was implied in the reply of Hadhrat 'Ali (Karramallaahu wajhahu) (may Allah<br><hr><br>) be kind to him) when he was asked by the people if he had received from Kasulullah (Sallallaho alaihe wasallam) any special knowledge or instructions which were not received by others. Hadhrat Ali (Radhiyallaho anho) said, \"I swear by Him Who made the Paradise and created life that 1 pos- sess nothing special, except the clear understanding which Almighty Allah bestows upon a person ill respect of the Qur'an.\" Ibri Abid Dunyaa (Rahmatullah alaih) says that the knowledge of the Holy Qur'an and that which can bc de- rived out of it are as vast ss a boundless ocean. The branches of knowledge described above are like tools, i.e. essential pre-requisite for a c.ommentator. A com- mentary written by a person who is not thoroughly ac- quainted with these branches of knowledge will be based on his personal opinion, which is prohibited. The Sahabah (Companions of the Holy Prophet (Sallallaho alaihe wasal- lam) already had Arabic language as their mother-tongue, and they reached the depth of the rest of the knowledge by means of their illuminati~lg contact that they had with Ra- sulullah (Sallallaho alaihe-wasallam). Allamah Suyuti says that those who think that it is beyond the capacity of a man to acquire Wahbi ilm, or gifted understanding, are not right. To get this k~iowledge from Allah, one should adopt the means to this end, e.g., acting upon the kllowledge that one has acquired, and dis- inclination towards the world. It is stated in 'Keemiyaa-e-Sa'aadat' that three persons are not blessed with complete understanding of the Qur'an. First, one who is not well versed in Arabic, seco~ldly, one who persists in committing a major sin or indulges in act of religious innovation, because these actions blacken his heart, which in turn prevents him from understanding the Qur'an. Thirdly, one who is a rationalist, even in the niatter of faith, and feels enibarassed when he reads an ayat of the Qur'a~i which he is not able to fully rationalize. May Allah protect us from all such sins and evils. 32<br><hr><br>I-Iadhrat 'Abdullah ibn Amr (Radhiyallaho anho) re- ports that Rasulullah (Sallallaho alihe wasallam) said: \"On the Day of Judgement, it will be said to the Man devoted to the Qur'an, 'Go on reciting the Qur'an and continue ascending the storeys of Jannat (Paradise) and recite in the slow manner you had been reading in worldly life; your final abode will be where you reach at the time c)f the last ayat of your recitation.\" \"The man of Qur'an\" apparently means a hafiz. Mulla 'Ali Qari has explained it fully that this honour is reserved for. a!hafiz, and that this hadith does not apply to one who reads by looking into the Holy Book. First, because the words \"Man of Qur'an\" point towards a hafiz and secondly there is a tradition in Musnad Ahmad- Till he reads of whatever Qur'an is with him. This word more clearly refers to a hafiz, although a reader who remains very often engaged in reciting the Qur'an inay also be implied. It is written in ' ~ i 6 a a t ' that this hadith does not apply to a reader who is accursed by the Qur'an. This is with re- ference to the hadith that there are many readers of the Qur'an who read the Qur'an but the Qur'an invokes curses upon them. Therefore, the reading of Qur'an by a person who does not adhere to the correct tenets does not consti- tutc ar! argument that he is acceptable to Allah. Many Aha- dith of this type relate to the Khawarij (a sect who were opposed to Hadhrat 'Ali (Radhiyallaho anho). In this conimentary, Shah Abdul Aziz (Rahmatullah alaih) has written that 'tarteel' literally means reading with good and clear pronunciation, while according to Islamic pri~ciples it means reading in accordance with certain rdes as follows:<br><hr><br>) 3 3 (1) The letters of the alphabets should be correctly ut- tered to ensure their correct pronunciation so that (b) ' is not read as ' (b) ' and ' (Lb) ' and so on. (2) Stopping correctly at the pauses, so that the join- 2 5 ing or finishing of the verses may not take place at 5 .: inappropriate places. m& (3) The correct pronunciation of the vowel sounds. gg 3 h (4) Raising the voice slightly so that the words of Qur'an uttered by the mouth. may reach the ears and thus influence the heart. (5) Setting the sound in a way that it may become full of pathos and may affect the heart quickly, be- cause a pathetic voice influences the heart at once, i moves and strengthens the soul more affectively. The physicians are of the opinion that if a medicine is re- quired to affect the heart quickly, it should be given a sweet smell by means of a perfume, for the heart is sensi- tive to sweet smell and if the medicine is required to affect the liver, it should be sweetened with sugar because the liver likes sweet things. Therefore, if a perfume is used at the time of recitation, it will have a better influence on the heart. I (6) Tashdeed ( (5) ) (doubling of letters) and madd ( (3) ) (prolongation of letters) should be fully pro- nounced because this reveals the grandeur of the Qur'an and adds to its effectiveness. (7) As stated earlier, the reader's heart should respond to the ayat indicating mercy of Allah or chastise- ment by Him. The aboce-me~~tioned seven rules constitute the cor- rect way of reciting the Qur'an, which is called tarteel, and the sole object of all this is to reach the correct understand- ing and grasp of the deeper meaning of the Holy Qur'an. Hadhrat Umm-e-Salamah (Radhiyallaho anha) was once askecl by someone as to how Rasulullah (Sallallaho aleihe wasallam) used to recite Qur'an. She said, \"In a way that all vowel sounds were clear and the pronunciation of each letter was distinct.\" It is desirable to recite the Qur'an with propriety even if one may not understand the mean- I ing. Ibn Abbas (Radhiyallaho anho) said that he preferred I 34 to recite with propriety, short surahs like Al-Qaari'ah ( (kpk) or Izaa zulzilah (+)j \\i!)) rather than to recite (otherwise long) surahs like Aal-e-Imran ((dl& ~i,) without it. The commentators and learned scholars explain the above-mentioned hadith to mean that, for each ayat recited. the reciter will be elevated to a higher level in Paradise. From other ahadith, it appears that there are as many levels in Paradise as the number of ayaat in the Holy Qur'an. Therefore, the status of a persori will be raised by as many levels in Paradise as the number of ayaat in which he is well versed. As such, the one best versed in the whole Qur'an will reach the highest level in Paradise. According to Mulla 'Ali Qari, it is mentioned in a hadith that there is no level in Jannat higher than that given to the reader of the Qur'an. So the readers will ascend in proportion to the number of ayaat recited by them in the world. 'Allamah Daani (Rahmatullah alaih) says that authorities agree that there are six thousand ayaat in the Qur'an. But there is some difference of opinion about the numbers over and above six thousand. These are vari- ously reported'to be 204,14,19,25,36. It is written in 'Sharhul-Ihya' that each ayat corre- sponds to a higher level in Paradise. So a reader will be asked to ascend according to his recitation. One who reads the whole of the Qur'an will attain the highest level in Par- adise. And one who knows only a part of the Qur'an will rise up to the proportionate level. In brief, the stage or level reached will be fixed by the number of ayaat recited. According to my understanding, the above hadith has a different meaning- (If my interpretation is corect, it is from Allah and, if it is wrong, it is from me and from Satan, and Allah and His Prophet are free from it.) I think that the elevation implied in this hadith is not that which can be determined by the number of ayat to be recited. i.e., when one ayat be recited, the status will be raised by one step, whether it be read with propriety or<br><hr><br>) 35 without. But this hadith points to another kind of elevation which is a type of an inner experience and is related to the recitation being with proprietv or without it. So a person will be able to read in the same way as he reads in this = worldly life. Mullah 'Ali Qari (Rahmatullah alaih) has quoted from one hadith that, if a person reads the Qur'an very often in this life, he will remember it in the life Here- ;g after, otherwise he will forget it. May Allah help us there. .gg h x There are many among us who memorized the Qur'an in their childhood through the religious zeal of their parents, bu! through sheer carelessness and negligence on their own part, have forgotten this capability in the later part of this very life. It is mentioned in other ahadith that one who dies while labouring and working hard to commit the Glorious Qur'an to memory, will be reckoned amongst the huffaaz. Allah's bounty has no limits. We should only seek it. As a poet says: 0' Shaheedi! His bounties are common for all, You could not be denied [these bounties), if you were all worthy.<br><hr><br>Hadhrat Ibn Mas'ood (Radhiyallaho anho) narrates that Rasullullah (Sallallaho alaihe wasallam) said, \"Whoso- ever reads one letter of the Rook of Allah is credited with one blessing and one blessing is equal to~~enfold the like thereof in its reward. 1 do not say that @Jl (Alif Laam Meem) is one letter, but ' (9 ' (alif) is one letter, ' (J, ' (laam) is one letter, and '(r)' (meem) is one letter.\" The hadith affirms that whereas, ordinarily for the pur- pose of reward an act as a whole is taken into account but in the case of Qur'an it is not so, parts also count. Thus, in 3 3 6<br><hr><br>) reading each letter is counted as one good deed. And the \"Whoever reads the Qur'an and acts upon what is con- reward of each good deed will be increased ten times, as tained in it, his parents will be made to wear a crown promised by Almighty Allah. I on the Day of Judgement, the brilliance of which will \"One who brings a good deed, for him will be tenfold the like thereof.\" 'Ten times, however, is the minimum increase. Allah multiplies the reward for whomsoever He de- sires. That each letter of the Holy Qur'an, when read, amot~ntsto a good deed, has been illustrated by Rasulullah (Sallallaho alaihe wasallam) by saying that '91' (Alif Laam Meem) is not one letter, but ' (9' (alif). '(J)' (laam) and '(9' (meem) are three separate letters, so it will comprise thirty blessings. There is a differeilce of opinion anlong scholars whether 'dl' (alif, laam, meem) is the beginning of Surah Baqarah or of Surah Feel. If it is the beginning of Surah Ba- qarah, and only three letters are counted, as they are writ- ten, then the blessings wi!l be thirty. And if it is the beginning of Surah Feel, then ' ( I ) ' (alif), '(3)' (laam) and '(f)' (meem). which is the beginning of Surah Eaqarah will be nine letters. Therefore, its reward will be ninety blessings. Baihaqi (Rahmatullah alaih) has reported another hadith similar to this portion of the above-mentioned hadith, viz.. \"I do nolt say that '(Ale)' (Bismillah) is one letter, but uphold that '(d)' (ha) '(,.I)' (sin) and '(9' (meem), etc, are separate letters.\"</p></div>",
+        "sections": [
+            [
+                30,
+                16471
+            ],
+            [
+                16471,
+                54642
+            ],
+            [
+                54642,
+                71142
+            ],
+            [
+                71142,
+                76053
+            ]
+        ]
+    },
+    {
+        "id": 23,
+        "bookId": 2,
+        "chapter": "Virtues of Memorizing the Qur'aan",
+        "title": "Content for Virtues of Memorizing the Qur'aan",
+        "preview": "Hadhrat Mu'aaz Juhani (Radhiyallaho anho) reports that Kasulullah (Sallallaho alaihe wasallam) said. excel that of the sun, if the same were within yo...",
+        "content": "<div class=\"story-content\"><p>Hadhrat Mu'aaz Juhani (Radhiyallaho anho) reports that Kasulullah (Sallallaho alaihe wasallam) said. excel that of the sun, if the same were within your wordly houses. So, what do you think about the person 4 I , Zi , who himself acts upon it?\" Thus, it is through the virtues of his reading the Qur'an .- W W + and acting upon it that the parents of the leader will be a- x honoured with a crown, the brilliance of which will far excel the light of the sun even if the sun were within one's own house. The sun is at a great distance from us and even then its light is so bright. If the sun comes down into one's house, its light and brilliance will surely increase mani- fold. The light of the crown to be worn by the parents of the reader will be still more brilliant. When this is in $tore for the parents, what will be the reward of the reader him- self? Surely if the beneficiaries get so much, the reward of the person who is the real cause should be much more. The parents get this reward solely because they were the cause of the reader coming into being, or were responsible for his education. In addition to the fact that the light of the sun will he far greater if it were in one's own house, this simile implies yet another delicate point. Attachment and liking for a thing increase when it always remains with a person. Therefore, the feeling of strangeness for the sun due to dis- tance will give place to attachment, because of its close nearness all the time. Thus, in addition to describing the brilliance of the crown, the hadith implies this attachment with the crown and also the great satisfaction that it be- longs to oneself. Everybody gets benefited by the sun, but if it were to be given entirely to a person, how very proud he would feel. Haakim (Rahmatullah alaih) has reported from Burai- dah, (Radhiyallaho anho) saying of Rasulullah (Sallallaho alaihe wasallam); \"One who recites the Qur'an and acts upon it will be made to wear a crown woven with noor, and his parents will be made to wear garments, which will be more valuable than the entire world. They will say, 'Almighty Allah! what is it that we are being given these garments for?' 'In lieu of the reading of Qur'an by your child', will be the reply.\" It is given in Jam'ul Fawaa'id by Tabrani (Rahmatullah 38 20 Pa? 1 (<br><hr><br>) 39 alaih) that Hadhrat Anas (Radhiyallaho anho) had reported the saying of Rasulullah (Sallallaho alaihe wasallam), \"Whoever teaches the reading of Qur'an to his son (without memorizing it), all his sins, whether previous or subse- quent, will be forgiven; and whoever makes his child mem- orize the Qur'an will be raised on the Day of Judgement in the semblance of a full moon; and his son will be asked to start reciting, and for every ayat read by the child, the status of the parent will be raised to the next higher grade of jannat, till the recitation of the Holy Qur'an is com- pleted.\" Such are the blessings for teaching the Qur'an to your children. This is not all. There is another point. God forbid. if you deprive your child of the knowledge of (deen) (relig- ion) for the sake of a few coppers, not only shall you be de- prived of eternal reward but you shall be held answerable before Allah. Is it not a fact that you are depriving your dear child of reading the Qur'an for fear that mullahs and huffaaz, after memorizing the Qur'an become dependent on others for their living? Please remember that not only do vou expose your children to eternal misery, but carry on iour shoulders a very heavy accountability. The hadith that- Each one of you is a guardian, and will be questioned about those under his control means that everyone s,hall be questioned about his subordi- nates and dependents as to what extent he taught (deen) to them. Surely one should guard himself and his dependents against these shortcomings. But (as the proverb goes) \"should one discard clothes for fear of lice?\" Nav, one should surely try to keep his clothes clean. If you impart religious education to your child, you will be free from vour responsibilities. As long as the child lives, and what- ever good deed he does and salad he performs and forgive- ness that he seeks from Allah for you, will elevate your position in Paradise. If for the sake of this life and for the lust of a few coppers, you keep him ignorant of (deen), not only wiil you have to suffer for this misdeed but whatever evil and misdeeds he does. your account will not be free from their burden. For God's sake, have pity on yourselves. This life is only a passing phase and death will put an end to a!l its hardships, however great, but the sufferings for which there is no end, will be everlasting. HADITH NO- 12 a c 'Uqbah ibn 'Aamir (Radhiyallaho anho) narrated that Rasulullah (Sallallaho alaihe wasallam) said, \"If the Qur'an is placed in a skin and then put in the fire, it will not get burnt.\" The scholars of hadith have interpreted this hadith in two ways. Some of them take the words 'skin' and 'fire' in the literal sense. In this case the hadith refers to a miracle which was particular in the lifetime of Rasulullah (Sallal- laho alaihe wasallam) in the same way as the miracles of other prophets were specific to their lifetime. In the second case, the word 'skin' is interpreted to mean the human skin and the word 'fire' means the fire of Hell. Thus the applica- tion of the hadith is general arid not confined to any par- ticular period. It means that if any hafiz of Qur'an were cast in due to any crime on his part, the fire of Hell will not affect him. In another hadith it is said that the fire will not even touch him. The second interpretation of the above- mentioned hadith is also supported by another hadith re- ported by Abu Umaamah (Radhiyallaho anho) and also given in the book Sharhus Sunnah, by Mulla Ali Qari, which says, \"Learn the Qur'an by heart, because Almighty Allah does not punish the heart which contains the Qur'an .\" In its meanings this hadith is clear and confirmed by the Qur'an. Those who regard memorizing the Qur'an as useless should, for God's sake, ponder over these merits. The last-mentioned one alone should prompt everybody to dedicate his life to learning the Qur'an by heart, because there is no one who has not committed sins and does not deserve the fire of Hell. In Sharhul Ihya there is a list of those people who wiil rest in the shade of Allah's mercy (protection) on the hor- rible Day of Judgement. It is mentioned therein that. according to a hadith reported from Hadhrat Ali (Radhiyal- laho anho) by Dailami that the custodians of Qur'an, in other words those who learn the Qur'an by heart, will be in 40 the shade of Allah, in the company of the Prophets and other virtuous people.<br><hr><br>Hadhrat Ali (Radhiyallaho anho) says that Rasulullah (Sallallaho alaihe wasallam) said, \"Whoever reads Qur'an and learns it by heart, and regards what it makes lawful as lawful and its unlawful as forbidden, will be admitted into Jannat by the Almighty Allah who will also accept his intercession in respect of ten such persons of his family who shall have been doomed to Hell.\" By the grace of Allah, entry into Jannat is ensured for every believer though it may come after his being punished for his misdeeds. The hafiz will, however, be favoured with this entry right from the beginning. The ten persons in whose favour his intercession will be accepted will be those sinful and disobedient Muslims who are guilty of major sins. There can be no intercession, however, for the unbelievers. Almighty Allah has said: Whosoever ascribes partners unto Allah, for him Allah has forbidden Jannat, and their place is Hell - and for evil-doers there will be none amongst the helpers. It is also said in the Qur'an: The Prophet and the believers are not allowed to pray for the forgiveness of 'mushrikin' (Plural of mushrik, one who ascribes partners unto Allah) the polytheists even if they are their relatives.<br><hr><br>) 4 1 The Qur'anic ayat clearly say that polytheists will never be forgiven. The intercession of huffaaz will, there- fore, be for those Muslims whose entry into Hell has been determined bv their sins. Those who are not huffaaz and cannot memorize the - 8 ! - Qur'an should at least make one of their relatives a hafis. :& so that by His grace they may be saved from their own evil- doings. s.$ $21 Allah be thanked for this gracious favour on the person whose father, uncles and grandfathers both maternal and paternal, were all huffaaz. (This applies to the author May Allah bless him with more favours).<br><hr><br>Hadhrat Abu Hurairah (Radhiyallaho anho) narrated that Rasulullah (Sallallaho alaihe wasallam) said, \"Learn the Qur'an and recite it, because the example of one who learns the Qur'an, reads it and recites it in Ta- hajjud (salaat late after midnight) is like an open bag full of musk, the fragrance whereof spreads over the entire place, and a person who has learnt the Qur'an but sleeps while the Qur'an is in his heart, is like a bag full of musk but with its mouth closed.\" It means that the example of one who learns the Quran and cares for it and recites it in Tahajjud salaat is like that of a musk-container which, if opened, fills the whole house with its sweet smell. In the same way, the entire house is lit up with divine light and blessings due to the recitation by the hafiz. Even if the hafiz remains asleep or does not recite through his negligence, the Qur'an in his heart is in any case the musk. This negligence resulted in the loss that others were deprived of the blessings of Qur'an, but his heart does, in any case, contain the musk of Qur'an. 42 2.3 HADITH NO-15 Hadhrat Abdullah ibn Abbas (Radhiyallaho anho) has narrated the saying of Rasulullah (Sallallaho alaihe wa- sallam): \"He in whose heart there is no part of the Qur'an is like a deserted house.\" The allusion to a deserted house has a subtle meaning, which is expressed by the proverb that \"an idle man's brain is the devil's workshop (literally the demon gets hold of an empty house). Similarly a heart, devoid of Qur'an, gets more and more possessed by Satan. What an emphasis is there in this hadith for memorizing the Holy Qur'an, that the heart which has not secured it has been likened to a de- serted house. Hadhrat Abu Hurairah (Radhiyallaho anho) says: \"In the house where the Qur'an is read, the household mem- bers increase, virtues and blessings multiply, angels de- scend upon them and Satan quits the house. Whereas the house in which Qur'an is not recited, life therein becomes straitened and devoid of blessings, angels leave the house and Satan ravages it.\" Hadhrat Ibn Mas'ood (Radhiyallaho anho) and some others have reported Rasulullah (Sallallaho alaihe wasal- lam) to have said thdt a deserted house is one in which the Holy Qur'an is not recited.<br><hr><br>*. iwl dig\\ ii13 ~d & 2\\ @ &j @G 2 (1,) , , 1 o f @j @&j\\ 2 3 @ .I$\\ ikIj, !*, 2 3 +Tg\\ !;\\,j > p\\ I 0 , I. d , e>\\ 2 ,J& 1 u&J\\, &j\\ 2 &i +I, &\\, @\\ 2 ,* C*, 8 . 5 c J dl ,y e fCp j Hadhrat 'Aa'ishah (Radhiyallaho anha) says that Rasu- lpllah (Sallallaho alaihe wasallam) said, \"Recitation of<br><hr><br>) 43 the Qur'an in salaat is more rewarding than the recita- tion outside salaat; recitation outside salaat is prefer- able to tasbeeh and takbeer (repeating words of Praise for Allah); tasbeeh is superior to sadaqah (alms); sada- = qah to sowm (fasting) and sowm is protection against Fire.\" o L The superiority of recitation of the Qur'an over zikr $? (glorification and remembrance of Allah) is evident be- 5~ cause Qur'an is the Word oi Allah. As mentioned earlier, the superiority of the Word of Allah over the speech of others is like His superiority over His creation. The superi- ority of zikr over sadaqah has been stressed in other aha- dith as well. But the superiority of sadaqah over sowm as given in this hadith, seems contrary to that given in some other ahadith where sowm is said to be better than sada- qah.' This difference is due to the variations in the type of people and their conditions of life. According to this hadith sowm comes last in the order of merit. When sowm is protection against the Fire of Hell, we can imagine numerous blessing of the recitation of Qur 'an. The author of 'Ihya' reports on the authority of Hadh- rat' Ali (Radhiyallaho anho) that for every letter recited there are hundred blessings for one who reads the Qur'an while standing in salaat, fifty blessings for one who reads while sitting in salaat, twenty-five blessings for one who reads in the state of wudhu outside salaat, ten blessings for one who reads without wudhu, and one blessing for him who does not read himself but listens eagerly to the reader. Hadhrat Abu Hurairah (Radhiyallaho anho) savs: \"Ra- sulullah (Sallallaho alaihe wasallam) asked us. 'Does any one of you like that when he returns homc, ht? should find three she-camels, pregnant and fat.' We said, 'We would love to do so.' Then Rasulullah (Sal- 44<br><hr><br>) 45 lallaho alaihe wasallam) said, \"Three ayaat which one the Book. By reason of other ahadith, and because reciting of you may recite in his salaat are better than three big from memory is conducive to greater devotion and is free pregnant and fat she-camels.\" from riyaa' (dissimulation) and because this was the way of A similar subject-matter has been described in hadith 3. In this hadith there is a reference to recitation of the Qur'an inside salaat which is more virtuous than recitation outside salaat. That is why a comparison has been made to pregnant she-camels. Because, just as in one case, there is a reference to two virtues, that is salaat and recitation, in the other case there is a reference to two things that is a she- camel and her pregnancy. It has been mentioned under hadith 3 that ahadith of this kind are only for the purpose of a simile, otherwise the everlasting reward of one ayat is more valuable than thousands of mortal she-camels.<br><hr><br>1 Hazrat Uthman bin Abdullah bin Aus Thaqafi (Rad- hiyallaho anhum) narrates from his grand-father that Rasulullah (Sallallaho alaihe wasallam) said, \"Reciting the Qur'an from memory carries one thousand degrees of spiritual reward, while reading the Qur'an from the i Book increases it,up to two thousand degrees.\" Many virtues of being a hafiz have been mentioned before. In this hadith, however, preference is shown to reading from the Holy Book as compared to reciting it from memory, because reading from the Book is not only condu- cive to deeper understanding and meditation but also in- cludes several other devotional acts, such as looking into I the Qur'an and touching it, etc. The difference in the ap- parent meanings of the various ahadith has led to a differ- ence of opinion among the scholars of hadith as to whether reading from the Holy Book is better than reciting it from memory. By reason of the above hadith, and because reading from the Book safeguards against making mistakes and includes the virtuous act of looking at the Holy Book, some scholars give preference to reading by looking into recitation of Rasulullah (Sallallaho alaihe wasallam) him- self, some scholars consider that reciting from memory is $ -3 preferable. Imam Nawawi (Rahmatullah alaih) has decided 0 2 that the preference between the two depends upon the in- dividuals. Some people concentrate and meditate better Z Q T x while reading from the Book, while others do so, reciting from memory. Therefore, reading from the Book is prefer- able for some and reciting from memory for others. Hafiz Ibn Hajar (Rahmatullah alaih) also has favoured this inter- pretation in his book 'Fat-hul Baari.' It is said that on account of excessive reading by Hadh- rat Uthman (Radhiyallaho anho) two scripts of the Holy Qur'an tore. Amr ibn Maimoon (Rahmatullah alaih) has mentioned in 'Sharhul Ihya', that one who opens the Holy Qur'an after Fajr (dawn) salaat and reads a hundred ayaat gets a reward as large as the entire world. Reading the Qur'an by looking into it is reported to be beneficial for eyesight. Hadhrat Abu Ubaidah (Radhiyallaho anho) has narrated a lengthy hadith in which each reporter says that he had some trouble with his eyes and that his teacher bade him to recite the Qur'an by looking into it. Hadhrat Imaam Shaafi'ee, (Rahmatullah alaih) often used to open the Qur'an after Ishaa (night) salaat and close it only a little before Fajr salaat.'<br><hr><br>Abdullah ibn Umar (Radhiyallaho anhuma) narrated: \"Rasulullah (Sallallaho alaihe wasallam) said, \"The hearts get rusted as does iron with water. When some- one asked, \"What could cleanse he~rts again?' Rasulul- lah (Sallallaho alaihe wasallam) said, \"Frequent remembrance of death and recitation of Qur'an.\" Excess of sins and negligence in the remembrance of Allah cause the hearts to rust, as water causes iron to rust. 46 The reading of Qur'an and the remembrance of death polish the rusted hearts. The heart is like a mirror. If it is not cleaned, it will not properly reflect the recognition of Allah. The more burnished and brighter it is, the better will it show from the enlightenment. Therefore, the more we in- dulge in sinful lust and devilish acts, the more are we de- prived of the recognition of Almighty Allah. It is with a view to polishing the mirror of the heart that mashaa'ikh enjoin upon their disciples to devote themselves to self-dis- cipline endeavours, spiritual occupation, incantation and remembrance of Allah. It is mentioned in some ahadith that when a man com- mits a sin, a black dot stains his heart. If he repents in real earnest, this dot is removed, but if he commits another sin, another black dot appears. In this way, if he goes on com- mitting sin after sin, his heart gets completely blackened. At this stage the heart becomes quite disinclined to do good!, and keeps on turning to evil. May Allah save us from such a stage. \"Verily their evil deeds have covered their hearts with rust\" refers to this blackening of the heart. According to another hadith, Rasulullah (Sallallaho alaihe wasallam) said, \"I leave two 'wu'aaz' (plural of waa'iz-preacher)-one speaking and the other silent. That which speaks is the Holy Qur'an and that which is silent is the remembrance of death.\" Certainly the words of Rasulullah (Sallallaho alaihe wasallam) are worthy of loving acceptance. But only those who take proper heed derive benefit from a sermon. On the other hand, if we consider deen itself as being a useless oc- cupation and an obstacle in the way of material progress, we will neither feel the need of spiritual advice nor act upon it. Hadhrat I-Iasan Basri (Rahmatullah alaih) says, \"People .of earlier times believed the Holy Qur'an to be the Com- mandment of Allah, they contemplated over it throughout the night and acted upon it during the day. Whereas today Part 1 (<br><hr><br>) 4 7 you exercise particular care to pronounce its words and vowels correctly, but do not take it as the Commandment of Allah, and do not contemplate over it.\" Hadhrat Aa'ishah (Radhiyallaho anha) reports that Ra- sulullah (Sallallaho alaihe wasallam) said, \"Certainly there is always a thing in which people take pride. And that which is glory and pride for my Umlnat is the Holy Qur'an.\" People indicate their nobility and dignity by virtue of their lineage, their familv and other similar things. ?'he Qur'an is the source of nobility and pride for the Ummat in the sense that reading, memorizing and teaching it, as also acting upon it; in short, everything related to it, confers an honour upon them. Why should it not be so? After all, it is the Word of the Beloved and the Commandment of the Master. Its dignity excels all worldly honours, however great. The achievements of this worldly life, however splendid vanish sooner or later, while the splelldour and dignity of the Qur'an is eternal and unbounded. Even the minor attributes of the Glorious Qur'an are such as we should be proud of, let alone its excellence in other respects, for example, its beautiful composition, won- derful coherence, the right choice of words, the proper de- velopment of arguments, the narration of past events and prophecies about the future. Its assailing remarks concern- ing other people are such as cannot be contradicted, e.g., the remark about the Jews, that they profess their love for Allah, but they never long for death. The listener is im- pressed by its recitation and the reader never gets tired of reading it. It is usual that, however lovely a discorirse may be, it may even be a letter from a beloved who has made one mad: we will become tireti of reading it for the twen- tieth time if not the tenth: or the fortieth time, if not the twentieth. On the other hand, if we just memorize one sec- tion of the Qur'an, one may read it two hundred times or four hundred times or go on doing so for the whole life. but one shall never lose interest. And if something prevents us from enjoying it, that will be for a while only. In fact, the more we read the Qur'an, the greater will be our enjoyment 48 and satisfaction. Even if a few of the above excellent quali- ties were to be found in any composition, we would be all praise for it. So, if all these qualities were present in a com- position to a perfect degree, surely it would have to be re- garded with the greatest honour and pride. Now, we should just reflect on our own condition. How many of us feel really proud of having memorized the whole Qur'an? Does a hafiz command real respect in our eyes? Alas! our honour and pride lie in high university de- grees, in big titles, in worldly pomp and show, and in the wealth which we will have to leave behind us on our death. 0, Allah! have mercy up011 us.<br><hr><br>1 Hadhrat Abu Zar (Radhiyallaho anho) says that he re- quested Rasulullah (Sallallaho alaihe wasallam) to give him some lasting advice. Rasulullah (Sallallaho alaihe wasallam) said, \"Cultivate the fear and reverence of Allah in your heart, because this is the root of all virtu- ous deeds.\" I asked him to add something more and he said, \"Stick to the reading of the Qur'an, because it is a noor in this life and a provision for the Hereafter.\" The fear of Allah is the root of all good actions. A man whose heart is filled with fear of Allah, does neither commit any sin nor experience any difficulty. Whoever fears Allah, Allah will make a way for him out of every difficulty and provide from whence he has no expectation. Some of the foregoing traditions also disclose that the Qur'an is illuminating. In Sharahul Ihya, Hadhrat Abu Na'eem (Rahmatullah alaih] states that Hadhrat Baasit (Radhiyallaho anho) has reported from Rasulullah (Sallal- laho alaihe wasallam) that the houses in which the Holy<br><hr><br>) 49 Qur'an is read shine unto the inhabitants of the Heaven as do the stars shine unto the inhabitants of the Earth. This hadith, which has been quoted from 'At-Targhib', is only a part of a long hadith reported from Ibn Hibban by 2 Mulla Ali Qari in detail and by Suyuti in brief. Although : P the above-mentioned part of the hadith is sufficient for the 5 purpose of this book. yet the whole hadith includes many 3 essential and useful subjects and, therefore, its subject- - . P matter is given in the following paragraphs. Hadhrat Abu Zar (Radhiyallaho anha) says that he in- quired from Rasulullah (Sallallaho alaihe wasallamj about the number of books revealed by Almighty Allah. Rasulul- lah (Sallallaho alaihe wasallam) replied, \"One hundred booklets and four books. Fifty booklets were revealed to Hadhrat Sheeth (Alaihis salaam) (peace be upon him), thirty to Hadhrat Idrees (Alaihis salaam), ten to Hadhrat Ibrahim (Alaihis salaam) and ten to Hadhrat Musa (Alaihis salaam) before the Torah. In addition. four books, i.e., the Torah, the Bible, the Psalms and the Holy Qur'an have been revealed by Almighty Allah.\" Hadhrat Abu Zar (Rad- hiyallaho anho) enquired about the contents of the booklets revealed to Hadhrat Ibrahim (Alaihis salaam). Rasulullah (Sallallaho alaihe wasallam) replied that they consisted of proverbs, e.g., \"0, you strong and proud king! I did not ap- point you to hoard wealth, but to prevent the complaint of the oppressed from reaching me by redressing it before- hand, because I do not reject the complaint of the op- pressed person, even though he may be a disbeliever.\" The author states that whenever Rasulullah (Sallallaho alaihe wasallam) deputed any of his Companions as an ameer or governor, in addition to giving other advice, he used to emphasize: Beware of the invocation of the oppressed because be- tween him and Allah there is no veil or intermediary. As a Persian verse goes: 5 0 \"Beware of the sigh of those oppressed, when they Pray 9 Divine acceptance readily greets them. These booklets also mentioned that it is incumbent on a wise man, unless he is deprived of sanity, to divide his time in three parts: one for worship of his Lord; one for self-reckoning to consider what acts, good or bad, he did<br><hr><br>) 51 much of laughter, because it causes the heart to wither, and the face loses its lustre.\" (Too much of laughter is injurious both for the outward and inward disposition of man.) Hadhrat Abu Zar (Radhiyallaho anho) sought further S advice, whereupon Rasulullah (Sallallaho alaihe wasallam) -: said, \"Stick to jihaad because this is the rahbaaniyyat of my g 6 ummat.\" (Rahbaan - singular raahib - were those people of 3 .! > x previous ~ ~ ~ n m a t s who severed all their worldly connec- and one for his lawful earning of livelihood. It is also in- cumbent upon him to watch of his time and be thoughtful tions and turned towards Allah.) Hadhrat Abu Zar (Radhiyallaho anho) asked for more about improving his conditions and to guard his tongue against unnecessary and useless talk. Whoever keeps a advice and Rasulullah (Sallallaho alaihe wasallam) said, \"Associate yourself with the poor and the needy, be friendly with them and sit in their company.\" When Hadh- rat Abu Zar (Radhiyallaho anho) requested further advice, Rasulullah (Sallallaho alaihe wasallam) said, \"Look to- wards those who rank below you (so that you may get used to being thankful) and do not look at those who rank above you, lest you should despise the favours of Allah upon you.\" check on his own speech, his tongue will indulge less in useless talk. Also, a wise man should not travel except for three purposes. viz., for making provision for the life Hereafter, or in search of livelihood, or for such recreation as is per- missible. Hadhrat Abu Zar (Radhiyallaho anho) then enquired about the contents of the booklets revealed to Hadhrat When Hadhrat Abu Zar (Radhiyallaho anho) again asked for more advice, Rasulullah (Sallallaho alaihe wasal- lam) said, \"Let your own faults prevent you from criticiz- ing others and do not try to find fault with others, because Musa (Alaihis salaam). Rasulullah (Sallallaho alaihe wasal- lam) said, \"They contained monitions only, such as 'I am astonished by one who finds pleasures in anything in spite of his faith in the certainty of death.' (Naturally when a person becomes sure of his sentence of hanging, and mounting the gallows, he can never find pleasure in any- thing). 'I am astonished by one who laughs in spite of his you commit those faults yourself. It is enough to prove you guilty that you should find in others such faults as you yourself possess, though you may not be aware of them, and that you should find in others such misdeeds as you yourself commit.\" After this, Rasulullah (Sallallaho alaihe faith in certainty of death'. 'I arn astonished by one who ob- serves accidents, changes and revolutions of the world all the time, and still finds satisfaction in it.' 'I am astonished wasallam) patted the chest of Abu Zar (Radhiyallaho anho) with his loving hand and said, \"0, Abu Zar! there is no wisdom better than prudence, nor any piety better than re- fraining from the unlawful, nor any nobility better than polite manners.\" (In stating the contents of this long hadith, the gist and meaning has been kept in view, in preference to the literal translation.) by one who believes in predestination, still suffers from grief and hardship.' 'I am astonished by one who believes that he will soon be required to render an account and still does no good deed.\" Hadhrat Abu Zar (Radhiyallaho anho) goes on saying that he asked for more advice. Rasulullah (Sallailaho alaihe wasallam) advised that he should cultivate fear of Allah, because it is the root and basis of all spiritual actions. Hadhrat Abu Zar (Kadhivdllaho anho) then begged for more advice. Rasulullah (Sallallaho alaihe wasallaln) said, \"Be consistent in recitation of Qur'an and remembrance of Allah, because it is a noor in this world and a provision in Heaven.\" Hadhrat Abu Zar (Radhivallaho anho) again sought further advice and was told. \"Abstain from too<br><hr><br>5 2 Hadhrat Abu Hurairah (Radhiyallaho anho) narrates that Rasulullah (Sallallaho alaihe wasallam) said, \"Never do a people collect in one of the houses of I Allah (mosque) reciting the Qur'an and reading it out to one another, but sakeenah (tranquillity) descends 1 upon them, rahmat (mercy) enshrouds them, the angels throng around them and Almighty Allah mentions them, in the assembly of angels.\" ! This hadith describes the special virtues of religious schools and institutions. Acquisition of either reward men- tioned above is so sublime that even if one devotes his whole life to acquire it, it will be worth while. But here there are so many rewards, especially the last one. Mention in the Court of Almighty Allah and remembrance in the company of the beloved are bounties that can hardly be surpassed. Descending of sakeenah has been mentioned in many ahadith. The scholars of ahadith have interpreted its real significance in many ways. The various interpretations, however, do not contradict each other and can be meaning- fully put together. Hadhrat Ali (Radhiyallaho anho) has interpreted sakee- nah as a special breeze, which has a face like that of a human being. Allamah Suddi (Rahmatullah alaih) is reported to have said that it is the name of a large golden dish in Paradise used for washing the hearts of the Prophets (Alaihimus salam) (peace be upo? them). Some have said that it is a special form of mercy. Tabari (Rahmatullah alaih) prefers the view that it means peace of heart. Some interpret it as grace, others consider it as dignity, and some take it to mean angels. There are other views as well. Hafiz has written in 'Fat-hul Baari' that sakeena includes all the above mentioned bles- sings. In the opinion of Nawawi (Rahmatullah alaih), it is a combination of tranquility, mercy, etc., and descends along with the angels. It is mentioned in the Qur'an as follows: Then Allah caused His sakeenah to descend upon him. It is He Who sent down sakeenah into the hearts of the believers (XLVIII: 4). Wherein is sakeenah from your Lord (I1 : 248). Thus this happy blessing is mentioned in several ayaat of the Qur'an, and there are many ahadith containing tid- ings of this. It is narrated in 'Ihya' that once Ibn Thauban (Rad- hiyallaho anho) had promised one of his relatives thqt he would break his fast with him, but reached the house of his relative next morning. When the host complained about the guest being so late, the guest said, \"But fon the promise that I owe you, I would never disclose what prevented me from coming to you. I just got late by chance until it was time of Ishaa salaat. I thought I should complete my Witr (compul- sory salaat of three raka'at following Isha) as well, lest I should die during the night without offering this salaat, be- cause there can be no surety against death. While I was re- citing qunoot (a special invocation in Witr salaat), I saw a green garden of Paradise, which had all sorts of flowers. I was so absorbed in the vision that it was dawn.\" There have been hundreds of similar incidents in the lives of our righteous ancestors. Such things are, however, experienced only when there is complete separation from everyone be- sides Allah, and perfect attention towards Him. Similarly there are many ahadith mentioning en- shrouding by the angels. A detailed story about Usaid ibn Hudhair (Radhiyallaho anho) is given in the books of Hadith. It is said that while he was reciting the Holy Qur'an, he felt a sort of cloud spread over himself. The Prophet (Sallallaho alaihe wasallam) informed him that these were angels who had gathered to listen to the recita- tion of the Qur'an. Due to their great throng they appeared like a cloud. Once a Sahabi felt a sort of cloud over himself. Rasu- lullah (Sallallaho alaihe wasallam) told him that it was sa- keenah, which was sent down by reason of the recitation of the Qur'an. 54 In Muslim Sharif, this hadith is given in greater detal~. The concluding sentence is- One whose evil deeds drive him away from the mercy of Allah, the superiority of his lineage or nobility of his family cannot bring him near it. Thus a person who has a continuous noble pedigree, but indulges in disobedience and impiety, cannot be equal in the presence of Allah to a Muslim who is of low birth and abject ir, humility, but otherwise God-fearing and devout. ;\\ $$; & &\\ $&, Verily the noblest of you in the view of Allah is the one who is most God-fearing. Part 1 (<br><hr><br>) 21 55 That the reading of the Qur'an is the best means of get- ting access to Almighty Allah is explained in the commen- i tary of Maulana Shah Abdul Aziz Dehlavi (Nawwarallaho marqadahu), who is an authority for the prosterity. Its sub- stance is that sulook ilallaah (the path of mystics towards Allah) which is also.called the stage of Ihsaan can be at- tained in three ways:- , (1) 'Tasawwur', known as meditation in Sharee'at and muraqabah in the terminology of mystics. (2) Remembrance of Allah by repeating words of praise for Him. (3) Reading of the Holy Qur'an. Since the first method is remembrance in the heart, so there remain in fact two ways only; first the remembrance by heart or by word of mouth, and secondly recitation of the Qur'an. The essence of zikr is that the word which is used for or refers to Almighty Allah should be repeated over and over again. This repetition helps the mudrakah</p></div>",
+        "sections": [
+            [
+                30,
+                16470
+            ],
+            [
+                16470,
+                32889
+            ],
+            [
+                32889,
+                34321
+            ]
+        ]
+    },
+    {
+        "id": 24,
+        "bookId": 2,
+        "chapter": "Virtues of Learning and Teaching",
+        "title": "Content for Virtues of Learning and Teaching",
+        "preview": "Hadhrat Abu Zar (Radhiyallaho anho) reports that Ra- sulullah (Sallallaho alaihe wasallam) said, \"You cannot turn to Allah and gain nearness to Him wi...",
+        "content": "<div class=\"story-content\"><p>Hadhrat Abu Zar (Radhiyallaho anho) reports that Ra- sulullah (Sallallaho alaihe wasallam) said, \"You cannot turn to Allah and gain nearness to Him with anything superior to that which directly proceeded from Him, i.e., the Holy Qur'an.\" It is evident from numerous ahadith that there is no better means of seeking nearness to the presence of Allah than recitation of the Qur'an. Imam Ahnlad ibn Hambal (Rahmatullah alaih) says. \"I saw Almighty Allah in a dream and asked Him what was the best means for seeking nearness to His presence. Allah said, '0, Ahmad! It is My Word (i.e. the Qur'an).' I enquired whether it is only reading while understanding the meaning, or reading with- out understanding. Allah said 'Whether by understanding the meaning or without understanding. it is a means of nearpess either way.\"' I (the faculty of understanding) in concentrating upon the person of the one being remembered. It would give rise to a feeling of immediate presence of that person. Constancy in this state is called 'ma'iyyat' (togetherness), which is refer- red to in the hadith below: My servant ceases not to seek nearness to Me through - nafil (optional) deeds, until I make him My favourite, and thus I become his ears wherewith he hears, his eyes wherewith he sees, and his hands wherewith he holds, and his feet wherewith he walks. It means that when a person, through excessive devo- tion becomes a favourite of Allah, Allah becomes a guard- ian of all the limbs of his body so that his eyes, ears, etc., all submit to His will. This blessing is said to be the result of constancy in nafil salaat, because fard (obligatory) salaat are specified and do not admit of excess, while nearness and close attachment demand constancy and concentra- tion, as mentioned above. But this mode of seeking nearness is exclusive for that 57 5 6<br><hr><br>) P ~ r eand Beloved Being (Allah), and it is impossible to seek nearness to anybody else by remembering his name over and over again. This is because the one whose near- ness is being sought must have two attributes. First, he should be omniscient, so that he comprehends the zikr of all the zaakireen, whether by word of mouth or by heart, ir- respective of language, time and place. Secondly, he should have the power to illumine the understanding and fulfil the yearning of one who remembers, which is known as 'dunuww' (nearness), 'tadalli' (proximity), 'nuzul' (de- scent) and 'qurb' (nearness). Since these two prerequisites are possessed only by Allah, the abovementioned method of seeking nearness is effective only in respect of Him. The following hadith-e-qudsi (a revelation of Allah quoted by Rasulullah Sallallaho alaihe wasallam), points to this fact: Whoever comes near Me by one span, I go near him by an arm's length; whoever comes near Me by one arm's length, I go near him by one 'baah' (stretch of both arms); whoever comes to Me walking, I go towards him running. This similitude is only for illustration. Otherwise, Allah is above walking and running. It only meails that those who remember and seek Him are helped and looked after by Almighty Allah in a measure far in excess of their own inner urge and efforts. This is so, because it behoves His Benevolence. So, the steadfastness of those who re- member Him invokestconstant attention and results in the descent of favours of Almighty Allah, the Glorious. The Qur'an altogether is zikr of Allah, in the sense that no ayat of the Qur'an is devoid of remembrance and attention to- wards Allah, and as such it bears characteristics of zikr as mentioned above. There is, however, another distinction of the Qur'an, which is the cause of increased nearness to Allah. And it is this: that every discourse carries the quali- ties and influencing traits of the speaker. It is obvious that recitation of the poetry of sinful and wicked people has its evil effects, while the verses of righteous people excercise a noble influence. It is for this reason that excessive study of knowledge of logic and philosophy produces pride and conceit, while excessive devotion to the study of hadith leads to humility. Although as languages, both English and Persian are equal, they produce varying influences upon the readers due to the divergence in the beliefs and atti- tudes of the various authors. It can be concluded that re- peated recitation of the Qur'an will result in the reader's * = being influenced by the qualities of the Originator of the (a verses and in developing a natural affinity for them. More- over, if a person is devoted to the publications of an author, ; d he naturally starts liking and favouring that person. In the f .$ &me way, the reader of the Qur'an is sure to win Allah's * X abundant grace, which in turn promotes nearness to Him. May Allah bless us all with His favours.<br><hr><br>Hadhrat Anas (Radhiyallaho anho) reports that Rasu- lullah (Sallallaho alaihe wasallam) said, \"For Allah, from amongst the people, there are some who are those of His household.\" The Sahabah (Radhiyallaho anhum) (may Allah be pleased with them) asked, \"Who are those people?\" He replied \"Men of the Qur'an. They are of the household of Allah, and are his favoured ones.\" \"Men of the Qur'an are those who always remain occu- pied with the Qur'an and have got a special attachment to it. That such people are of the household of Allah and His favourites is evident. It is, therefore, clear from the fore- going that, as long as such people always remain occupied with the Qur'an, special favours of Almighty Allah con- tinue to be conferred upon them. Certainly those who live in constant company do become as one of the household. What a great honour it is to belong to His household, to be reckoned amongst the 'Men of Allah' and to become His favourites, with such little striving and endeavour. What sacrifices of comfort and money are not made by people for admittance to worldly courts or to be elected as members of an assembly. They flatter the voters and bear all sorts of hu- miliations; yet they consider all this worthwhile. But the endeavour for the Qur'an is considered as a waste of time and energy: 59 Look at the difference between the paths; what a great divergence!<br><hr><br>Hadhrat Abu Hurairah (Radhiyallaho anho) narrates that Rasulullah (Sallallaho alaihe wasallam) said, \"Almighty Allah never gives attention so much to any- thing as He does to the voice of a Prophet reading the Qur'an in a sweet tone.\" It has been mentioned earlier that Almighty Allah de- votes special attention to the recitation of Qur'an, which is His own Word. Since Prophets meticulously observe all the rules of reverence in reading the Qur'an, Allah's listening to them with greater attention is evident. And the sweet- ness of voice itself adds to the embellishment. As for people other than Prophets, their recitaticn attracts Divine attention according to the standard of its excellence.<br><hr><br>Hadhrat Fudhaalah Ibn Ubaid (Radhiyallaho anho) narrates that Rasulullah (Sallallaho alaihe wasallani) said, \"Almighty Allah listens to the voice of the reader of the Qur'an more eagerly than does a master to the song of his singing slave girl.\" ! It is natural that singing should attract attention. But religious people do not listen to singing because of the re- striction in Islam. However, Islam does not prohibit listen- ing to the song of a slave woman in one's lawful<br><hr><br>) possession, even though, this may attract the fullest atten- tion. It is, however, necessary that the Qur'an shall not be recited in a singing tone, because doing so is forbidden according to several ahadith. In one hadith it is said: Beware of reciting the Qur'an in a musical tone, like that of lovers singing their love poems as musical com- positions. The mashaa'ikh say that one who reads the Glorious Qur'an like a musical song is a faasiq (evil-doer), and even a listener to such recitation commits a sin. It is, however, desirable to recite the Qur'an in a sweet voice without fol- lowing the rules of singing. There are various ahadith con- taining exhortation for reading the Qur'an in a sweet voice. Rasulullah (Sallallaho alaihe wasallam) has said at one place, \"Adorn the Qur'an with a good voice.\" In another hadith it is said, \"A sweet voice makes the beauty of the Qur'an twice as beautiful.\" Hadhrat Shaikh Abdul Qaadir Jilani (Rahmatullah alaih) has written in his book 'Ghunyah that once Hadhrat Abdullah ibn Mas'ood (Radhiyallaho anho) happened to pass a place in the vicinity of Kufa and saw a gathering of evil-doers in a house. A singer named Zaazaan was singing and playing his instrument. On hearing his voice, Ibn Mas'ood (Radhiyallaho anho) said, \"What a sweet voice, only if it were used for reciting the Glorious Qur'an,\" and thus saying he covered his head with a piece of cloth and went his way. Zaazaan had seen him saying something. On enquiring from the people, he came to know that Ibn Mas'ood (Radhiyallaho anho) was a Sahabi who had passed saying those words. Zaazaan got very much perturbed by that remark and, to cut the story short, he broke all his mu- sical instruments arid became a follower of Ibn Mas'ood (Radhiyallaho anho) and thereafter rose to the position of a distinguished scholar of his time. There are various ahadith that commend reading of the Holy Qur'an in a good voice and at the same time prohibit reading it in a voice resembling singing, as has been stated before. 60 Hadhrat Huzaifah (Radhiyallaho anho) reports that Ra- sulullah (Sallallaho alaihe wasallam) said, \"Recite the Qur'an in the Arabic accent, do not recite it in the tone of lowers or in the voice of Jews and Christians. There will shortly arise a people who will recite the Qur'an with affec- tation like singers and mourners, and such reading will be of no advantage to them at all. They themselves will get into trouble, and so also those who admire their reading.\" Taa'oos (Rahmatullah alaih) writes that someone asked Rasulullah (Sallalaho alaihe wasallam) \"Who it was who read the, Glorious Qur'an in the best voice?\" Rasulullah (Sallallaho alaihe wasallam) replied, \"It is he whom you hear and feel that he is under the fear of Allah, i.e., his voice shows his being overwhelmed with fear.\" This is, however, the extreme benevolence of Allah that He does not expect from a person anything beyond his capacity. There is a hadith that Allah has deputed an angel on a special duty. If there be somebody who recites the Qur'an, but is unable to do so as correctly, as it should be done, this angel corrects his recitation before he takes it up to the Heavens.\" \"Oh, Allah! 1,cannot enumerate the praises due to Thee. Hadhrat Ubaidah Mulaiki (Radhiyallaho anho) narrates that Rasulullah (Sallallaho alaihe wasallam) said, \"0, you devotees of the Qur'an! do not use the Qur'an as a pillow, but read it properly day and night, as it ought to be read. Propagate the Holy Qur'an, read it in a good voice and ponder over its contents, so that you may, succeed. Do not seek a reward for it (in this life], be- cause it has got a magnificent reward (in the Here- after).\"<br><hr><br>) 6 1 A few points in this hadith are as follows: (1) It is said that the Qur'an should not be used as a pillow. Doing so is an act of disrespect towards the Holy Book. It has been written by Ibn Hajar (Rah- 2 5 matullah alaih) that using the Qur'an as a pillow, C a -- 2 stretching one's feet towards it, and trampling over it, are acts which are all forbidden. Secondly, the 9 g r q expression \"using as a pillow\" also implies show- g x ing neglect towards the Holy Qur'an. It serves no purpose to place it on a pillow, as it is sometimes found placed on a stand by the side of a grave in a shrine for barakah (blessings). This is utter dis- regard of the Holy Book. We owe it to the Holy Book that it should be read. (2) The expression \"Read it as it ought to be read\" means that it should be read with the highest degree of reverence. Commandment to this effect is there in the Qur'an itself. Those to whom We have given the Book, read it as it ought to be read. The orders of a king are received with great respect, and a letter from the beloved is read with great fond- ness; similarly the Qur'an sould be read with great re- spect and fondness. (3) The expression \"propagate the Qur'an\" means that we should do so by speech, by writing, by persuas- ion, by practising and by all other possible means. Rasulullah (Sallallaho alaihe wasallam) ordered its propagation and spreading, but some of our bright thinkers consider it a vain task, and at the same time they claim that they have great love for Rasu- lullah (Sallallaho alaihe wasallam) and for Islam. According to a Persian verse: 63 62 I am afraid, 0, Bedouin! you can never reach Ka'bah. Because the path you are following leads to Turkistan. Rasulullah (Sallallaho alaihe wasallam) has ordered spreading of the Qur'an, but we do not hesitate to put all sorts of hurdles in the way of its propagation. We make laws for compulsory secular education so that children, instead of learning the Qur'an, are forced to join primary schools. We are displeased with teachers in religious schools for spoiling the lives of children, and, therefore, we do not send our children to them. Even if this apprehen- sion is correct, it does not absolve us of our responsibility. On the other hand, our responsibility becomes even greater because we are all duty-bound, individually and collecti- vely, to propagate the Qur'an. The religious teacher is, no doubt, responsible for his shortcomings, but if, because of his defects, we prevent children from going to religious schools, get notices issued to their parents in the name of compulsory primary education, compelling them to de- prive their children of learning the Qur'an, then this is like killing a tuberculosis patient by giving him poison. An at- tempt to justify our hostile conduct by the supposed omis- sion on the part of the religious teacher is a lame excuse, and this argument will not avail in the court of Almighty Allah. We may consider it necessary to educate our chil- dren in subjects like elementary arithmetic, to make them fit for running a petty grocery shop or for getting employ- ment with the country's rulers, but according to Almighty Allah the learning of the Qur'an is the most important. 141 , 'That recitation should be in a . sweet voice has already been dxplained under the previous hadith. (5) We are required to ponder over tile meaning of the Qur'an. There is a quotation from the Torah in 'Ihya', in which Allah says, \"My servant! are you not ashamed of your behaviour towards Me? If you receive a letter from a friend while you are going on a road you stop and sit at a suitable place and read it with full attention and try to understand every word therein. But in case of My Book, wherein 1 have explained everything and have re- peatedly emphasized important matters, so that you may ponder over and understand them, you show an attitude of indifference. Do you consider Me inferior to your friend even? 0, My servant! I I i<br><hr><br>) some of your friends sit with you and talk to you; you pay them full attention. You listen to them and try to understand them. If anybody tries to in- terrupt you, you stop him with a gesture. I talk to you through My Book, but you pay no heed. Do you consider Me inferior to your friends?\" The merits of meditation and contemplation on the contents of the Qur'an have already been men- tioned in the Foreword of this book and again under hadith 8. The expression \"do not seek prompt reward\" means that no wages should be accepted for reciting the Qur'an, because your recitation is going to fetch you a great reward in the Hereafter. To accept reward for it in this life is just like being content with shells instead of money. Rasulullah (Sallal- laho alaihe wasallam) said, \"When my Ummat will attach more value to money, it will lose the dignity which Islam confers on it, and when it will give up enjoining good and forbidding evil, it will be deprived of the blessings of Divine Revelation, viz., the understanding of the Qur'an.\" 0, Allah! guard us against this. Hadhrat Waathilah (Radhiyallaho anho) narrates that Rasulullah (Sallallaho alaihe wasallam) said, \"I have been given 'as-Sab'ut Tuwal' in lieu of the Torah, 'al- Mi'een' in lieu of the Psalms, 'al-Mathaani' in lieu of the Bible and al-Mufassal as a special favour to me.\" The first seven surahs are called 'as-Sab'ut Tuwal' (the seven longest ones); the next eleven are called 'al-Mi'een' (surahs consisting of about a hundred ayaat each); the fol- 64 65 lowing twenty surahs are known as 'al-Mathaani' (the oft- repeated ones), while all the remaining surahs are called 'al-Mufassal' (the explicit ones). This division is according to a popular interpretation, but there is some difference of opinion as to whether a certain surah is included in 'as- Sab'ut Tuwal' or 'al-Mi'een'. Similarly there is a dis- agreement as to whether a surah falls under 'al-Mathaani' or 'al-Mufassal'. But this disagreement does not affect the meaning or purpose of this hadith. This hadith shows that the Holy Qur'aan contains the equivalents of all the import- ant Heavenly Books that had been revealed earlier, and moreover contains 'al-Mufassal' as a special addition, the like of which is not to be found in the earlier books. Hadhrat Abu Sa'eed Khudri (Radhiyallaho anho) nar- rates: \"Once I was sitting with a group of indigent muhaji- reen, who did not even have sufficient clothes to cover their whole body and as such some of them were hiding themselves behind others. A qaari (one who is well versed in reciting the Qur'an) was reciting the Glorious Qur'an. Suddenly Rasulullah (Sallallaho alaihe wasallam) came and stood near us. On his arri- val the reader stopped reciting. He invoked peace upon us, and asked us what we had been doing. We replied that we had been listening to the Holy Qur'an. Then<br><hr><br>) Rasulullah (Sallallaho alaihe wasallam) said, \"All praise is for Allah, Who created such people in my Ummat that I have been ordered to stay with them.' Ra- sulullah (Sallallaho alaihe wasallam) sat in our midst so as to be equidistant from all of us. Then he asked all 4 '\" of us to get closer to him. All of us sat with our faces towards him. Thereafter, Rasulullah (Sallallaho alaihe d wasallam) said, '0, you poor muhajireen, I give you -5 + glad tidings of perfect noor on the Day of Judgement, * X and you shall enter Paradise before wealthy people by half a day, and this half day will be equal to five hun- dred years. \" That muhajireen did not even have sufficient clothes to cover their whole body apparently refers to the exposure of that part of the body which it is not obligatory to cover. But in public one feels shy at the exposure of even such parts. This is the reason why they were sitting behind one another. They did not become aware of the arrival of Rasulullah (Sallallaho alaihe wasallam) as he came, because of their pre-occupation. They saw him when he had come very near to them and then, out of respect, the reader stopped reading. Although Rasulullarh (Sallallaho alaihe wasallam) had seen one of them reading the Qur'an, he inquired about what they had been doing. This enquiry was to express his pleasure over what he had seen them doing. One day in the next life will be equal to one thousand years of this world, as is given in the Holy Qur'an: \"Lo! a day with your Lord is as a thousand years of that ye reckon.\" This is the reason why the Arabic word (ghadan) (tomorrow) is generally used while referring to the Day of Judgement. Even this will be the probable length of a day for the believers in general. As for the disbelievers, the Qur'an says that: \"A day will be equal to fifty thousand years.\" 66 For true believers, this day will be shorter according to their status. It is reported that, for some true believers, it will be like the time spent in two rakaat of Fajr salaat. The merits of reading the Qur'an are given in many ahadith. Similarly, the merits of listening to the Qur'an are also found in numerous ahadith. The act of listening to the recitation of the Qur'an is so virtuous that Rasulullah (Sal- lallaho alaihe wasallam) had been ordered to stay among those engaged in reading the Qur'an, as given in this hadith. Some learned scholars are of the opinion that lis- tening to the Qur'an is more virtuous than reading it, be- cause reading the Qur'an is nafl and listening fard, and fard act is always better than a nafl one. From this hadith there is one more deduction, in re- spect of which the learned scholars differ in their opinion. There is disagreement as to whether a destitute but stead- fast person, who conceals his poverty from others is better, or a wealthy person who is grateful to Allah and discharges his obligations. This hadith provides an argument in favour of the destitute one who is steadfast. Hadhrat Abu Hurairah (Radhiycilaho anho) reports that Rasulullah (Sallallaho alaihe wasallam) said, \"Whoever listens to one ayat of the Holy Qur'an, there is written for him a twofold virtue, and whoever re- cites it (one ayat), it shall be noor for him on the Day of Judgement.\" The scholars of hadith have questioned the above hadith with respect to its authority, but its subject-matter is also affirmed by various other traditions to the effect that even listening to the recitation of the Holy Qur'an carries great reward, so much so that according to some scholars, listening to the.recitation of the Glorious Qur'an is more<br><hr><br>) 6 7 virtuous than its reading. Ibn Mas'ood (Radhiyallaho anho) narrates that once Rasulullah (Sallallaho alaihe wasallam), while sitting on the mimbar (pulpit), said to him, \"Recite the Qur'an for me.\" Ibn Mas'ood (Radhiyallaho anho) said, \"It does not behove me to read out the Qur'an to you, be- cause it is you to whom it was revealed.\" Rasulullah (Sal- lallaho alaihe wasallam) said, \"It is mv heart's desire to listen.\" Ibn Mas'ood (Radhiyallaho anho) adds that when he recited the Qur'an, tears started flowing from the eyes of Rasulullah (Sallallaho alaihe wasallam). Once Saalim (Rad- hiyallaho anho), the freed slave of Huzaifah (Radhiyallaho anho) was reciting the Glorious Qur'an and Rasulullah (Sallallaho alaihe wasallam) stood by, listening to him for a long time. Once Rasulullah (Sallallaho alaihe wasallam) listened to recitation of the Glorious Qur'an by Abu Musa Ash'ari (Radhiyallaho anho) and admired his reading.<br><hr><br>Hadhrat 'IJqbah ibn Aarnii (Radhiyallaho anho) reports that Rasulullah (Sallallaho alaihe wasallam) said, \"One reading the Qur'an loudly is like one who gives alms openly, and one who reads silently is like one who gives alms secretly.\" Sometimes it is more rewarding to give alms openly, when there is some good reason and. the intention is to induce others by example. At other times, giving alms secretly is more virtuous, for instance, when 'the intention is to avoid show on one's own part or to save the recipient from humiliation. In the same way, recitation of the Qur'an in a loud voice carries more reward when the intention is to induce others; besides, in this there is reward also for those who listen. At times it would be preferable to rear1 silently, so as to avoid inconvenience to others or show on one's part. Thus the reading, either way, has independent virtue. Sometimes one mode is preferable, and sometimes the other. 68 Many people have argued on the basis of this hadith that reading in a low voice is more virtuous. Imam Baihaqi (Rahmatullah alaih) in his book, 'Kitabush Shu'ab', has written that Hadhrat 'Aa'ishah (Radhiyallaho anha) had re- ported that the reward of doing a good act secretly is se- venty times more than that of doing it openly. But, according to the rules laid down by the muhadditheen I (scholars of ahadith), this hadith is dha'eef (weak). I Hadhrat Jaabir (Radhiyallaho anho) reports that Rasu- lullah (Sallallaho alaihe wasallam) said, \"Do not read in a loud voice, lest the voice of one should get mixed up with the other.\" Hadhrat Umar ibn Abdul Aziz (Radhiyallaho anho) found a person reading the Qur'an in a loud voice in Musjid-i-Nabawi and had stopped him. The reader, how- ever, tried to argue, whereupon Hadhrat 'Umar ibn Abdul Aziz (Radhiyallaho anho) said, \"If you read for the sake of Allah, read in a low voice and, if you read for the sake of men, then such reading is of no use.\" Similarly an advice of Rasulullah (Sallallaho alaihe wasallam), for reading the Qur'an in a loud voice, has also been reported. 'Sharhul Ihya' contains both 'riwaayaat' (Plural of 'ri- wayat-Narrative tradition) and 'aathaar' (sayings of Saha- bah) urging the reading of the Glorious Qur'an in a loud as well as in a low voice.<br><hr><br>d S # - I., j?Sj & 2~ a,?\\ s\\ , * & h\\ &, J &k 2 (Yl') t& Hadhrat Jaabir (Radhiyallaho anho) reports that Rasu- lullah (Sallallaho alaihe wasallam) said, \"The Qur'an is such an interceder whose intercession is accepted, and a disputant whose dispute is upheld. Whoever keeps it in front of him, it draws him to Paradise, and whoever puts it behind his back, it hurls him, into Hell.\" This means that, if the Qur'an intercedes on behalf of anybody, its intercession is accepted by Almighty Allah.<br><hr><br>)' 22 69 The meaning of the \"pleading of the Glorious Qur'an\" has already been explained under hadith 8. The Qur'an pleads in the Court of Allah for increasing the sfatus of those who abide by it, and-takes to task those who neglect it. If one keeps it in front of him, i.e., follows it and acts upon its commands throughout his life, it leads him to Paradise. And if one turns his back towards it, i.e., does not follow it, he will, no doubt, fall into the pit of Hell. According to the author, indifference to the Qur'an can also amount to put- ting it behind the back. In many ahadith there are several warnin s for those who neglect the Word of Allah. In the book o f Sahihul Bukhari' there is a long hadith, according to which Rasulullah (Sallallaho alaihe wasallam) was once made by Almighty Allah to view some of the punishments given to the sinful ones. He was shown a person on whose head a stone was being struck with such force that the head was crushed. On the enquiry of Rasulullah (Sallallaho alaihe wasallam) it was said that Allah had taught His Gin- rious Word to that person, but he neither recited it during the night nor acted upon it during the day. so now this treatment for him will continue till the Day ot Judgement. May Allah through His grace save us from His chastise- ment. In fact, the Holy Qur'an is such a great blessing that any indifference to it certainly deserves the severest pun- ishment.<br><hr><br>3 Hadhrat 'Abdullah ibn Amr (Radhiyallaho anho) re- ports that Rasulullah (Sallallaho alaihe wasallam) said, \"The sowm (fast) and the Qur'an both intercede for the obedient person. The fast submits, '0 Allah! I pre- vented him from eating and drinking during the day, so You accept my intercession on his behalf, and the Holy Qur'an says, '0, Allah! I denied him sleep at night, so You accept my intercession for him.' Conse- quently, the intercession of both of them is accepted.\" In the book 'Targhib', the hadith mentions the words 70 22<br><hr><br>) 71 'ta'aam' and 'sharaab' i.e. food and drink, as translated above, but in the book of Haakim we find the word 'shaha- waat' (passions) in place of 'sharaab', i.e. fasting prevented a person from eating and indulging in his passions. It is im- plied here that one should abstain even from such acts of physical pleasure which are permissible e.g. kissing and embracing (one's own wife). It is given in some ahadith that the Holy Qur'an will appear in the semblance of a youth and will say, \"It is I who kept you awake during the night and thirsty during the day.\" This hadith implies that a hafiz should recite the Qur'an in nafl salaat at night, as explained already in detail under hadith 27. In the Holy Qur'an itself at various places there are encouragements to this effect. Some verses are given below: (1) And keep awake some part of the night for reciting it in Tahajjud salaat. (2) And worship Him in a portion of the night and glorify Him during the long night. I (3) They recite verses revealed by Allah during the night and thqy fall in sajdah (prostration) before Him. (4) And who spend the night before their Lord, pros- trate and standing. Consequently, Rasulullah (Sallallaho alaihe wasallam) and his Sahabah (Radhiyallaho anhum) sometimes spent the whole night in reciting the Holy Qur'an. It is reported ahout Hadhrat 'Uthman (Radhiyallaho anho) that some- times he recited the whole of Qur'an in a single rak'at of his Witr salaat. In the same way, 'Abdullah ibn Zubair (Radhiyallaho anho) used to recite the whole Qur'an in a single night. Ga'eed ibn Jubair (Rahmatullah alaih) read out the whole Qur'an in two rakaats inside the Ka'bah. Thabit Banaani (Rahmatullah alaih) used to read out the whole Qur'an in one day and night, and so was also the case with Abu Hurairah (Radhiyallaho anho). Abu Shaikh Hannaa'i (Rahmatullah alaih) said, \"I read the whole Qur'an twice, and ten parts in addition, in a single night. If I wanted, I y could have completed the third reading as well.\" In the eg course of his journey for the Haj pilgrimage, Salih ibn KaGaan (Radhiyallaho anho) often used to complete two 5 x readings of the Qur'an each night. Mansoor ibn Zaazaan (Rahmatullah alaih) completed one reading during nafl salaat before noon, and the second reading in the interval between Zuhr (afternoon) and Asr (late afternoon) salaat, and he spent the whole night in offering nafl salat, weeping so much that the end of his turban would become wet. Similar had been the case with many others, as described by Muhammad ibn Nasr (Rahmatullah alaih) in his book 'Qiyaamul Lail' It is written in 'Sharhul Ihya' that our ancestors in deen differed from one another in their practices of com- pleting the reading of the whole Qur'an. Some of them completed one reading of the whole Qur'an every day, as was the practice of Imam Shaafi'ee (Rahmatullah alaih) in months other than Ramadhap; and some completed two readings everyday, as was also done by Imam Shaafi'ee (Rahmatullah alaih) during the month of Ramadhan. Such was also the practice ofAswad, Salih bin Kaisaan, Sa'eed bin Jubair and of . ~ others. Some used to complete y three readings every day. This was the practice of Sulaim ibn Atar, who was an eminent Taabi'ee (the follower-of a Sahabi). He had taken part in the conquest of Egypt during the regime of Hadhrat 'Umar (Radhiyallaho anho) and was also appointed wler of Qasas by Hadhrat Ameer Mu'aa- wiyah (Ra&ryallaho anho). He used to complete three readingd the whole Qur'an every night. Imam Nawawi writes in 'Kitabul Azkar' that the maxi- mum daily recitation reported is of Ibnul Kaatib who used to complete eight readings of the Holy Qur'an during each day and night. Ibn Quddamah has reported that, according to Imam Ahmad (Rahmatullah alaih), there is no limitation in this respect and that it entirely depends on the zest of the reader. Historians have stated that Imam Abu Hanifah (Rahmatullah alaih) used to complete sixty-one readings in 7 2 the month of Ramadhan-once everyday, once everynight, and one reading was completed in Taraweeh salaat. On the other hand, Rasulullah (Sallallaho alaihe wasal- lam) has said that one who completes one reading of the Qur'an in less than three days cannot meditate upon it. For this reason, Ibn Hazm (Rahmatullah alaih) and some others are of the opinion that reading the whole Qur'an in less than three days is forbidden. According to the authar, this hadith refers to the capacity of the readers in general, otherwise completion of one reading of the Holy Qur'an in less than three days by a group of Sahabah has been reported. Similarly, according to the opinion of the Jamhur (general body of 'ulama), there is no limitation on the maxi- mum period in which one reading should be completed. The reading should be completed within such time as is convenient. But some 'ulama say that the maximum period should not exceed forty days. This means that at least three-fourth of a part should be read daily and if, for any reason, this much of reading-is not done on any day, the missed portion should also be covered on the next day, so that the whole reading is completed within forty days. According to the consensus of opinion, this is not obliga- tory but, in view of the belief of some 'ulama, it is better that the daily reading should not be less than this. This view is supported by some ahadith. The author of Majma' has reported in one hadith: Whoever completqd the reading of the whole Qur'an in forty nights, delayed the matter. Some 'ulama are of the opinion that the whole reading should be completed once every month, though it is prefer- able to complete one reading every week, as was the prac- tice of the most of the Sahabah. One should start on Friday and read one manziE (halting stage) daily, thus to complete on Thursday. It has+already been stated that, according to Imam Abu Hanifah (Rahmatullah alaih), we owe it to the Qur'an that it must be read at least twice a year. Therefore, under no circumstances should one do less than this. There is a hadith according to which, if the reading of the whole Qur'an is completed in the beginning of the day, the angels invoke mercy for the reader throughout the rest of the day and for rest of a night if done in the beginning of<br><hr><br>) 73 the night. Some mashaa'ikh have, therefore, concluded that the reading of the whole Qur'an should be completed pref- erably in the early part of the day during the summer season and in the early part of the night during winter, so that the reader is benefited for a longer period by the pray- 4 3 ers of the angels. \"i a&</p></div>",
+        "sections": [
+            [
+                30,
+                16477
+            ],
+            [
+                16477,
+                32883
+            ],
+            [
+                32883,
+                33977
+            ]
+        ]
+    },
+    {
+        "id": 25,
+        "bookId": 2,
+        "chapter": "Rewards for Specific Surahs",
+        "title": "Content for Rewards for Specific Surahs",
+        "preview": "*,k 531 ' e r . \" \" . r 9.. * &L& Al JrJ JU J U S , u .-. (Yf) Al &j & 2 1Srj #. I . r 62y; uy; $9 qiy\\ G\\ ~2 a2 &i + (p.l&YI j j IS.+-+ j!,JEJI J' Ul...",
+        "content": "<div class=\"story-content\"><p>*,k 531 ' e r . \" \" . r 9.. * &L& Al JrJ JU J U S , u .-. (Yf) Al &j & 2 1Srj #. I . r 62y; uy; $9 qiy\\ G\\ ~2 a2 &i + (p.l&YI j j IS.+-+ j!,JEJI J' Ul-+ obJ JG) Hadhrat Sa'eed bin Sulaim (Radhiyallaho anho) has reported that Rasulullah (Sallallaho alaihe wasallam) said, \"On the Day of Judgement, before Allah, no other intercessor will have a greater status than the Qur'an, neither a Prophet nor an angel, etc.\" It has been learnt from several other ahadith that the Holy Qur'an is an intercessor-such an intercessor whose intercession will be accepted. May Almighty Allah make I the Qur'an intercede for us all, and may He not make it an I opponent or a complainant against us. In 'La'aali Masnoo'ah' it is reported from the riwaayat I of Bazzaar, which is not considered as concocted, \"When a man dies and his relatives are busy in funeral rites, there I stands an extremely handsome man by his head. When the dead body is shrouded, that man gets in between the shroud and the chest of the deceased. When, after the burial, the people return home, two angels, Munkar and Nakeer (names of two special Angels), come in the grave and try to separate this handsome man so that they may be I. able to interrogate the dead man in privacy about his faith. But the handsome man says, \"He is my companion, he is my friend. I will not leave him alone in any case. If you are appointed for interrogation, do your job. I cannot leave him until I get him admitted into Paradise.\" Thereafter he turns to his dead companion and says, \"I am the Qur'an, which you used to read, sometimes in a loud voice and sometimes in a low voice. Do not worry. After the interrogation of Munkar and Nakeer, you will have no grief.\" When the interrogation is over, the handsome man arranges for him 74 from al-Mala'ul A'laa (the angels in Heaven) a silk bedding filled with musk. May Allah bestow this favour on all of us. This hadith in its complete form contains a description of many virtues and has not been quoted in full for the sake of brevity.<br><hr><br>Hadhrat 'Abdullah bin 'Amr (Radhiyallaho anho) reports that Rasulullah (Sallalaho alaihe wasallam) said, \"Whoever reads the Qur'an secures the knowl- edge of prophethood within his r$s (bosom), though Divine Revelation is not seht upon him. It does not befit one endowed with the Qur'an that he should be indignant ,with those in anger, nor should he indulge in any acf of ignorance with those who are ignorant, while thepur'an is there in his bosom.\" Since thd chaih of wahi (revelation) ended with Rasu- lullah (Sallyllaho alaihe wasallam), further wahi cannot come. But $ince the Qur'an is the Word of the Almighty Allah, it dofUbtlessly contains the knowledge of 'Nubuwwat (propheth d) and if anybody is blessed with this knowl- edge, it is 9\" incumbent upon him that he should display the best condbct, and should refrain from bad manners. Fud- hail bin paadh (Rahmatullah alaih) has stated that a hafiz of the Qyr'an is a bearer of the banner of Islam, and as such it does qot behove him to join those who indulge in frivol- ous puqsuits, or associate with the neglectful, or mix with t- the indolent.<br><hr><br>) Hadhrat Ibn 'Umar (Radhiyallaho anho) reports that Rasulullah (Sallallaho alaihe wasallam) said, \"Three persons are such as will have no fear of the horrors of the Day of Judgement, nor will they be required to render any account. They will stroll merrily on mounds of musk until the people are relieved of ren- dering their account. One is a person who learnt the Qur'an, merely seeking Allah's pleasure and therewith leads people in salaat in a manner that they are pleased with him; the second person is one who invites men to salaat for the pleasure of Allah alone. The third person is. one who has fair dealings between him and his master, as well as between himself and his subordinates.\" The severity, the horror, the dread and the miseries of the Day of Judgement are so great that a true Muslim is neither unmindful nor unaware of them. To be relieved of those worries in any way, on the Day of Judgement, is a favour that surpasses thousands of blessings and millions of pleasures. Those who will then be made to relax and rejoice will be the fortunate ones indeed. Utter ruin and loss is the lot of those insensible persons who consider the reading of the Qur'an as useless and waste of time. In 'Mu'jam Kabeer', it is written about this hadith that its reporter, Hadhrat 'Abdullah bin 'Umar (Radhiyal!aho anho), who was a Sahabi of Rasulullah (Sallallaho alaihe wasallam) said, \"If I had not heard this hadith from Rasu- lullah (Sallallaho alaihe wasallam) once, once again and once again (he repeated it seven times), I would never have reported it.\"<br><hr><br>) 77 Hadhrat Abu Zar (Radhiyallaho anho) reports that one hundred ayaat in a night will be written among the Rasulslllah~~SallaNaho Abu qaaniteen (the obedient).\" alaihe wasallam) said, \"0, Zar if you go in the morning and learn one ayai from the Book of Allah, it will be better for you than your offering one hundred rakaat of nafl salaat, and if you I learn one chapter of knowledge, which may m may not be practised at that time will be better for you than your offering one thousand rakaat of nafl salaat. It is mentioned in many ahadith that ac uiring kpowl- I edge of religion is more virtuous than woraip. There are so many traditions on the virtues of learning that they cannot a11 be mentioned here. Rasulullah [Sallallaho alaihe wasallam) said, \"The superiority of an aalim over an aabid (worshipper) is like my superiority over the lowest among you.\" He is also reported to have said that a single faqeeh (jurist) is harder against Satan than one thousand worship- pers. Hadhrat Abu Hurairah (Radhiyallaho anho) reports that RaduIullah (Sallallaho alaihe wasallam) said, \"Whoever recites ten ayaat in a night, is not wckoned amongst'the'neglectful.\" It takes only a few minutes to recite ten ayaat. Doing so saves a man from beiqg included in the list of the neglect- 1 ful, for that night. It is really a great reward. Hadhrat Abu Hurairah (Radhiyallaho anho) narrates that Rasulullah (Sallallaho alaihe wasallam) said, \"Whoever remains steadfast in the five salaat will not be written amongst the neglectful; and whoever reads Hadhrat Hasan Basri (Rahmatullah alaih) reports that Rasulullah (Sallallaho alaihe wasallam) said, \"Whoever 2 9 reads one hundred ayaat in a night will be exempted from the demands of the Qur'an, and one who reads two hun- go, dred ayaat will get a reward for offering salaat throughout $ the night and one who recites five hundred to one thous- + x and ayaat will get one qintaar. The Sahabah asked, \"What is meant by a qintaar?\" Rasulullah (Sallallaho alaihe wasal- lam) replied, \"It is equal to twelve thousand daraahim or danaaneer (Plural of dirham and deenaar, respectively- unit of currency used in Hijaaz in the Holy Prophet's (Sal- lallaho alaihe wasallam) days).\" Hadhrat Ibn Abbas (Radhiyallaho anho) has reported, \"Hadhrat Jibra'eel (Alayhis salaam) once informed Rasulullah (Sallallaho alaihe wasallam) that many fit- nahs will certainly appear. Rasulullah (Sallallaho alaihe wasallam) asked, 'What will be the way out, 0, Jibra'eel?' He replied, 'The Book of Allah.\" To act upon the Book of Allah serves as a safeguard against fitnahs, and its blessed recitation is a means of relief from the evils. It has already been mentioned in hadith 22 that if the Qur'an is recited in a house, peace and mercy descend upon it and Satan quits the place. The 'ulama interpret fitnahs to mean the coming of Dajjaal (Islamic Anti-Christ), the invasion by the Tatars, and like incidents. A long riwaayat from Hadhrat Ali (Radhiyallaho anho) also includes the subject-matter of this hadith. It is mentioned in this riwaayat of Hadhrat 'Ali (Rad- hiyallaho anho) that Hadhrat Yahya (Alayhis salaam) told the Israelites: \"Allah orders you to read His Book, and if you do so, you will be like the people protected in a fort, so - - 78 79 that on whichever side the enemy wants to attack you, he will find there the Word of Allah as a guard to repulse him.\" f Part 2 Concluding Section PART 2 CONCLUDING SECTION There are a few ahadith over and above the forty already narrated, which certainly need to be men- tioned, being appropriate for this place. In this section, some special virtues of certain surahs are narrated. These surahs are short, but excel in virtues and rewards. In addition, there are one or two important matters, about which the readers of the Qur'an need to be warned.<br><hr><br>Hadhrat 'Abdul Malik bin Umair (Radhiyallaho anho) reports that Rasulullah (Sallallaho alaihe wasallam) said, \"In surah Fatihah there is a cure for all ailments.\" The virtues of surah Fatihah are found in many aha- dith. It is reported in one hadith, \"a Sahabi was offering nafl salaat; Rasulullah (Sallallaho alaihe wasallam) called him, but since he was offering salaat he did not respond. After completing +e salaat he went to Rasulullah (Sallal- !ah0 alaihe wasallgm), who asked him why he did not re- spond as soon as he\\ was called. He submitted that he could not do so because he was offering salaat. Rasulullah (Sallal- laho alaih ei. wasallam) asked if he dit not read the following verse in Qu 'an: Respond to the call of Allah and His Messenger when- ever They call you. Then Rasulullah (Sallallaho alaihe wasallam) said, \"I tell you of a surah which is the greatest, the most virtuous in 80 the Holy Qur'an. It is surah Al-Hamd (The first surah of the Qur'an), which has seven ayaat. These are the 'Sab'ul I Mathaani' and represent the Grand Qur'an.\" It is said by 1 some Sufia that whatever there was in the earlier Divine I Books is condensed in the Glorious Qur'an, and the con- tents of Qur'an are condensed into 'surah Fatihah; and that which is in surah Fatihah is found in Bismillaah and that which is in Bismillah is to be found in its first letter ., (ba). It is explained that sf (ba) is a co-ordinating conjunction and stands for uniting. Surely the ultimate aim is to effect I union of a devotee with Almighty Allah. Some 'Sufia' have I gone still further and have said that whatever there is in 4, i (ba) is to be found in its dot, which signifies the Unity of Allah-a thing which is indivisible as a dot. Some scholars are reported to have said that the verse- \"We worship Thee and we seek Thy help\", is prayer for fulfilment of all our objectives, both worldly and spiri- tual. According to another hadith, Rasulullah (Sallallaho alaihe wasallam) is reported to have said, \"By Him Who is in possession of my life, a surah like this one has neither been revealed in the Torah nor in the Bible nor in the 1 Psalms, nor even in the rest of the Qur'an. I The Mashaa'ikh have stated that the reading of surah Fatihah with firm belief and faith cures all maladies, whether spiritual or worldly, external or internal. To use its writing as an amulet, and also licking its writing is useful in the treatment of diseases. It occurs in Sihaah (the six authentic books oftHadith) that the Sahabah used to read surah Fatihah and blow upon those bitten by a snake or a scorpion, and even on the epileptic and on the men- tally deranged. Rasulullah (Sallallaho alaihe wasallam) had ~ also approved of this. There is another riwaayat to the effect that Rasulullah (Sallallaho alaihe wasallam) recited this surah and blew on Saa'ib bin Yazeed and applied his saliva on the spot (where some pain was felt by the latter). According to another hadith, it is said that if, at the time of going to sleep, one reads surah Fatihah ,and surah Ikhlaas and blovs on himself he will be immune from all dangers except death. According to one riwaayat, surah Fatihah is equivalent to two-thirds of the Qur'an in reward. It is also reported Part 11 (<br><hr><br>) 8 1 that Rasulullah (Sallallaho alaihe wasallam) has said, \"I have been given four things from the special treasure of the Arsh, from which nothing has ever been given to any one before. These are surah Fatihah, Aayatul Kursi, the con- cluding ayaat of surah Baqarah and Surah Kowthar.\" Hadh- rat Hasan Basri (Rahmatullah alaih) reports the saying of Rasulullah (Sallallaho alaihe wasallam) that whoever reads surah Fatihah is like one who reads the Torah, the Gospel, the Psalms and the Glorious Qur'an. It is reported in one hadith that the devil lamented, wept and threw dust on his head on four occasions; first, when he was cursed; secondly when he was cast out of Heaven unto the earth; thirdly when Hadhrat Muhammad (Sallallaho alaihe wasallam) was given the Prophethood, and fourthly when surah Fatihah was revealed. It is reported from Sha'bi (Rahmatullah alaih) that once a man came to him and complained of pain in his kidney. Sha'bi (Rahmathulla alaih) advised him to read Asaasul Qur'an (the foundation of the Qur'an) and blow on the aching spot. When he inquired what was meant by \"Asaa- sul Qur'an\", Sha'bi replied, \"Surah Fatlhah.\" It is written in the established practices of mashaa'ikh that surah Fatihah is the Isme A'zam (r.kc'lr.l), the Most Glorious Name of Allah, and it should be read for the achievement oE all our objectives. There are two ways of reading it: One method is to read this surah forty-one times for forty days, in the interval between the sunnat (a practice of the Holy Prophet) (Sallallaho alaihe wasallam) and fardh rak'aats of the Fajr salaat. The meem of ?>I 2>1 ItJ (Bis- millaahir rahmaanir raheem) should be read jointlv with the laam of - . (Alhamdu lillaahil. Whatever the ob- A U I jective may be, it will, insha-Allah (if Allah wills), be ful- filled. In the treatment of a patient or of one who is bewitched, it should be recited and blown on water to be used for drinking. The second method is to read it seventy times between the sunnat and the fardh rak'aat of the Fajr salaat on the first Sunday of a new moon, after which the number is reduced by ten every day until the course ends with a reading of ten times on the seventh day. Then this weekly course should be repeated, so as to complete four weeks. If 82 83<br><hr><br>) the purpose is achieved at&e end of the first month, well and good, otherwise this-course should be repeated for the second and, if necessary, for the third mwth. The surah is also written with water of roses, musk and saffron, on a porcelain dish, then the writing is washed off and the wash-water is given to the patient for d~iAkifTg for forty days. This is a sure treatment of chronic diseases. To read it seven times and then blow on the patient is simi- larly an accepted treatment for toothache, headache and pain in the stomach. All these points have been briefly quoted from the book 'Mazaahir-e-Haq.\" 'Muslim Sharif' contains a hadith in which Ibn 'Abbas (Radhiyallaho anho) narrates that once Rasulullah (Sallal- laho alaihe wasallam) was sitting among us and said, \"In Heaven a door has been opened today which was never opened before, and out of it has descended an angel who had never descended before. The angel said to me, \"Re- ceive the good news of two 'antvaar' which have not been bestowed upon anyone else before. One is surah Fatihah and the other the concluding portion of surah Baqarah, i.e. its last 'ruku' (section of the. Qur'an)'.\" These two surahs have been called 'noor', because on the Day of Judgement these will travel in front of their readers (illuminating their path).<br><hr><br>Hadhrat 'Ataa' bin Abi Ribaah, (Radhiyallaho anho) says that Rasulullah (Sallallaho alaihe wasallam) is re- ported to have said, \"Whoever reads surah Yaaseen in the beginning of the day, all his needs for that day are fulfilled.\" Many merits of surah Yaaseen are mentioned in aha- dith. It is said in one hadith, \"Everything has a heart, and the heart of the Glorious Qur'an is surah Yaaseen. Whoever re.eds surah Yaaseen, Almighty Allah records for him a reward equal to that of reading the whole Qur'an ten times.\" According to another Hadith Almighty Allah recited surah Yaaseen and surah Taahaa one thousand years before the creation of Heaven and Earth, and on hearing this the angels said, \"Blessing is for the ummat unto whom the , , Qur'an will be sent down, blessing is for the hearts that 5 -Z will bear, i.e. memorize it, and blessing is for the tongues that will recite it.\" t3 There is other riwaayat like this, \"Whoever reads surah 3 Yaaseen for the pleasure of Allah only, all his earlier sins are forgiven. Therefore make a practice of reading this surah over your dead.\" According to one hadith, surah Yaaseen is named in, Torah as mun'imah (giver of good things), because it con- tains benefits for its reader in this life as well as in the Hereafter; it removes from him the afflictions of this world and the next; and takes away the dread of the next life. This 'surah' is also known as 'Raafi'ah Khaafidhaah', i.e., that which exalts the status of the believers and de- grades the unbelievers. According to a riwaayat, Rasulullah (Sallallaho alaihe wasallam) said, \"My heart desires that surah Yaaseen should be present in the heart of everyone of my ummat.\" According to another hadith, if anybody re- cites surah Yaaseen every night and then dies, he dies as shaheed (martyr). It is reported in another hadith \"Whoever reads surah Yaaseen, is forgiven; whoever reads it in hunger, is satis- fied; whoever reads it having lost his wa finds the way; whoever reads it on losing an animal fin d' s the same. And when one reads it apprehending that his food will run short, that food becomes sufficient. And if one reads it beside a person who is in the throes of death, the same are made easy for him. And if anyone reads it on a woman ex- periencing difficulty in child-birth, her delivery becomes easy.\" Maqri (Rahmatullah alaih) said, \"If surah Yaaseen is read by one who fears the ruler or an enemy, he gets rid of this fear.\" According to another hadith, if somebody reads surah Yaaseen and surah Was-Saaffaat on Friday and begs of Allah something, his prayer is granted. (Most of the above has been drawn from Mazaahir-e-Haq, though the scholars of hadith have questioned some of the riwaayaat). 84<br><hr><br>Ibn Mas'ood (Radhiyallaho anho) reports that Rasulul- lah (Sallallaho alaihe wasallam) said, \"Whoever reads surah Al-Waaqi'ah every night, starvation shall never afflict him.\" Ibn Mas'ood (Radhiyallaho qnho) used to command his daughters to recite this surah every night. The virtues of surah Al-Waaqi'ah are also reported in many ahadith. There is a riwaayat to the effect that who- ever reads surahs al-Hadeed, Al-Waaqi'ah and Ar-Rah- maan, is reckoned amongst the dwellers of Jannat-ul- Firdaus (the highest level of Paradise). In another hadith, it is stated that surah Al-Waaqi'ah, is surah Al-Ghinaa. Read it and teach it to your children. Another riwaayat says: \"Teach it to your wives.\" Hadhrat 'Aa'ishah (Radhiyallaho anha) is reported to have emphasized its reading. But it is low mentality on our part to read it only for sake of petty worldly gain. If instead, it is read for the contentment of the heart and for the sake of the next world, then worldly gains will come to us without the asking. Hadhrat Abu Hurairah (Radhiyallaho anho) narrates that Rasulullah (Sallallaho alaihe wasallam) said, \"There is in the Qur'an a surah of thirty ayaat which intercedes for a person (its reader) until he is forgiven. This is surah Tabarakal lazi. \" About surah Tabarakal lazi, there is a riwaayat also that Rasulullah (Sallallaho alaihe wasallam) said, \"My Part 11 (<br><hr><br>) 85 heart desires that this surah should be in the heart of every believer.\" According to a hadith, one who reads surah Tabarakal lazi and Alif-Laam Meem-Sajdah, between the Maghrib 3 3 (dusk) salaat and the Ishaa' salaat, is like a person who 8-, stands in Salaat throughout the night called Lailatul Qadr 8 & (27th night of Ramadhaan-the month of fasting and the 9th S ; 6 z month of the Islamic calendar). It is also reported that if somebody reads these two surahs, seventy virtues are added to his account and seventy sins are condoned. According to another riwaayat, if one reads these two surahs, a reward equal to that of standing in salaat through- out Lailatul Qadr is writtep for him. This is also mentioned in Mazaahir. Tirmidhi (Rahmatullah alaih) reports from Ibn Abbas (Radhiyallaho anho): \"Some sahabah pitched a tent, at a place without knowing that there was a grave at that place. All of a sudden, those who were putting up the tent heard somebody reciting surah Tabarakal lazi. They reported the matter to Rasulullah (Sallallaho alaihe wasallam), who ex- plained to them that this surah guards against Allah's chas- tisement and ensures deliverance.\" Jaabir (Radhiyallaho anho) reports that Rasulullah (Sal- lallaho alaihe wasallam) would not go to sleep until he had recited the surahs Alif Laam Meem-Sajdah and Tabarakal lazi. Khalid bin Ma'daan (Radhiyallaho anho) has said that he had heard it narrated, \"There was a man who was a great sinner, but he used to recite surah Sajdan. He never read anything else. This surah spread its wings over that man and submitted to Allah, '0, my Lord! this man used to recite me very frequently'. So the intercession of that surah was accepted. It was ordered that each sin in his account should be substituted by a virtue.\" Khalid bin Ma'daan (Radhiyallaho anho) has also reported, \"This surah pleads for its reader in the grave and says, '0, Allah! if I am con- tained in Thy Book, then accept my intercession, otherwise write me off from Thy Book. This surah appears in the form of a bird, spreads its wings over the dead and guards him against punishment in the grave.\" He has reported all these merits for surah Tabarakal lazi as well. He himself would never go to sleep unless he had read these two surahs. Taa'oos (Rahmatullah alaih) has said, \"These two<br><hr><br>) 87 86 23 surahs carry sixty virtues in excess of those carried by any other surah.\" The punishment in the grave is not an ordinary affair. After death, the first stage that one has to pass through is the grave. Whenever Hadhrat 'Usman (Radhiyallaho anho) stood by a grave, he used to weep so much that his beard would become wet with tears. Somebody asked him why he wept more at the mention of the grave than he did at the mention of Heaven and Hell. He replied, \"I have heard from Rasulullah (Sallallaho alaihe wasallam) that the grave is the first stage towards the Hereafter. Whoever is saved from chastisement in it, for him the subsequent events become easy, and whoever is not saved from chastisement in it, for him the coming events will be harsher still. And I have also heard that no scene is more horrible than that of the grave.\": 0, Allah! save us from this punishment through Thy Mercy and Grace.<br><hr><br>I Ibn Abbas (Radhiyallaho anho) says: \"Somebody asked Rasulullah (Sallallaho alaihe wasallam) as to which of the acts is the most virtuous. Rasulullah (Sallallaho alaihe wasallam) replied Jw ('al-haal wal-murta- i hil'). The man inquired, '0, Rasullulah (Sallallaho alaihe wasallam)! what is 'alah-a1 wal murtahil?' Rasu- lallah (Sallallaho alaihe wasallam) replied, \"It is that particular reader of the Qur'an who starts reading from the beginning and continues till he reaches its end, and after the end, he starts at the beginning again. Wherever he stops, he proceeds further.\" The Arabic word (JW ('al-haal) means one who reaches a halting place, and the word ($>I) ('al-murtahil') means one who departs. In other words, as soon as a reading of the Holy Qur'an is finished, one should start again. And it should not be that when one reading is fin- ished the other may be taken up later on. The term ($Jlj 43 ('al-haal wal murtahil') is explained in a riwaayat in Kanzul-Ummaal to mean (pll PSI) (al-khaatimatul miftaah) ah (one who concludes and opens), i.e. one who completes the 5 X whole reading of the Holy Qur'an and then immediately starts another. Probably this has led to the practice gener- ally prevalent in our country, according to which the reader while finishing the whole Qur'an does not stop after reading the last surah but also reads from the beginning of the Qur'an up to Doing so has now become a mere ritual and the people do not care to continue further and complete the reading. This hadith teaches us that, as soon as one reading of the Glorious Qur'an is completed, a fresh reading should be taken up immediately and brought to completion. It is written in Sharhul Ihya as well as in Alla- mah Suyuti's Al-Itqan that according to Daarami whenever Rasulullah (Sallallaho alaihe wasallam) read surah an-Naas (the last surah), he would also read al-Baqarah up to i,j+ after which he would offer the du'a meant to be read on completion of a reading of the whole Qur'an.<br><hr><br>Abu Musa Ash'ari (Radhiyallaho anho) reports that Ra- sulullah (Sallallaho alaihe wasallam) said, \"Be watch- ful towards the Qur'an. I swear by Him in Whose hands my life is, that the Qur'an is apt to escape from the hearts more rapidly than do the camels from their strings.\" If a man becomes neglectful in looking after an animal, and the animal frees itself from the halter, it will bolt away. Similarly if the Holy Qur'an is not looked after, it will not be remembered and will be forgotten. The fact that the</p></div>",
+        "sections": [
+            [
+                30,
+                16485
+            ],
+            [
+                16485,
+                25360
+            ]
+        ]
+    }
+]);
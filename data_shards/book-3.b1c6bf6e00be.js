@@ -0,0 +1,93 @@
+// Fazail-e-Amaal Data Shard: book 3
+fazailData.stories.push(...[
+    {
+        "id": 26,
+        "bookId": 3,
+        "chapter": "Importance of Salaat",
+        "title": "Content for Importance of Salaat",
+        "preview": "88 89 Holy Qur'an gets committed to memory is a distinct mir- acle of the Book itself. Otherwise memorizing a book one- half or even one-third of its ...",
+        "content": "<div class=\"story-content\"><p>88 89 Holy Qur'an gets committed to memory is a distinct mir- acle of the Book itself. Otherwise memorizing a book one- half or even one-third of its size is not only difficult but well-nigh impossible. Therefore, the fact that the Holy Qur'an gets committed to memory is mentioned by Almighty Allah as a Divine favour in surah al-Qamar, where it is repeated over and over- We have made the Qur'an easy for remembrance, So is there any one who will remember? The author of al-Jalalain writes that the interrogatory clause in this ayat is in fact an imperative one. Thus Almighty Allah has stressed over and over again the im- portance of memorizing the Qur'an, but if we Muslims are so perverse as to think that this act is useless and wasteful of time and energy, this blunder on our part is sufficient to justify our destruction. It is a matter of surprise indeed that, when 'Uzair (Alayhis salaam) reproduced the Torah from memory he was exalted to be called the \"Son of God;\" poor indeed is the regard that we have for the blessing and favour of Allah, that He has made the memorizing of the Glorious Qur'an easy for all of us (and not only for an indi- vidual as in the case of Torah). It is for such people that the Qur'an says: And those who dd wrong will come to know by what a (Great) reverse they will be over-turned! It is merely through the grace and blessing of Almighty Allah that the Qur'an gets memorized, but afterwards, if a person neglects it, he is made to forget it. There are severe admonitions for those who forget the Glorious Qur'an after having learnt it. Rasulullah (Sallallaho alaihe wasallam) is reported to have said, \"The sins of my ummat were shown to me. I did not find any sin as great as that of forgetting the Holy Qur'an after having read it. \"In another hadith it is said tnat any one who forgets Qur'an after having read it, will appear in the Court of Allah as a leper. According to a riwaayat of Razeen (Rahmatullah alaih) in 'Jam'ul-Fa- waa'id', the following ayat refer to it:<br><hr><br>) But whosoever turns away from My Message, verily for him is a narrowed life and We shall raise him up blind on the Day of Judgement. He shall say: \"My Lord, why hast Thou raised me blind, and I was a seeing one indeed.\" He will say, \"Even so Our Commandments came to thee, but thou didst neglect them; even thus shalt thou be forsaken today.\" (XX: 126-6).<br><hr><br>Buraidah (Radhiyallaho anho) reports that Rasulullah (Sallallaho alaihe wasallam) said, \"He who reads the Qur'an so that he might thereby get something to eat from the people, shall so appear on the Day of Judge- ment that his face will only be a bone, on which there will be no flesh. This means that those who read the Glorious Qur'an in order to fulfil the needs of this world will get no share in the Hereafter. Rasulullah (Sallallaho alaihe wasallam) has said, \"We read the Holy Qur'an. There are amongst us Arabs as well as non-Arabs. Go on reading the Qur'an as you do it now. Shortly, there will rise people who will set right the pronunciation of letters of the Qur'an as an arrow, I* I i.e., they will work hard to adorn it and spend hours in im- proving the pronunciation of each and every letter. They will take great pains over phonetics. But all this will be with a worldly motive. They will be the least concerned with the Hereafter.\" This hadith further signifies that mere recitation in a pleasing voice is of no avail if there would be no sincerity and if the purpose is only to earn worldly benefit. \"There will be no flesh\" means that whea a man makes the noblest of all things (i.e. the Qur'an) the means for earning the inferior things of this world, the noblest of 90 all parts of the body, i.e. his face, will be deprived of its beauty. Once 'Imraan bin Husain (Radhiyallaho anho) hap- pened to pass by a preacher who recited the Glorious Qur'an and then begged of the people. He was grieved to see this painful sight and recited 'Innaa lillaahi wa innaai- laihi raaji-oon' (verily we are from Allah and will return to Him). He said that he had heard from Rasulullah (Sallal- laho alaihe wasallam) that whoever recites the Glorious Qur'an should beg whatever he needs only from Almighty Allah. Shortly, there will come into existence a people who will recite and then beg of the people. It is reported from some scholars that the \"example of one who earns the gains of this world through the knowledge of deen is like that of one who cleans his shoes with his cheeks; the shoes will no doubt be cleaned, but the act is most stupid. It is such people who are referred to in the following ayat of the Glorious Qur'an: These are they who buy error at the price of guidance. I So their ,commerce doth not prosper, neither are they guided. Ubayy bin Ka'b (Radhiyallaho anho) has narrated, \"I taught a surah of the Glorious Qur'an to a man who gave me a bow as a gift. I mentioned this to Rasulullah (Sallal- I I laho alaihe wasallam), who said that I had accepted a bow from Hell.\" A similar, incident has been mentioned about himself by 'Ubaadah bin Saamit (Radhiyallaho anho) in I whose case Rasulullah (Sallallaho alaihe wasallam) he I said, \"You have hung between your shoulders a spark from Hell.\" According to another riwaayat Rasulullah (Sallal- laho alaihe wasallam) had said, \"If you are prepared to put , a yoke of Hell round your neck, you may accept it.\" r Now a word for such huffaaz who are working in Qur'anic schools, only for the sake of money. It is humbly requested that they should give a thoughtful consideration to their status and responsibility. This unbecoming con- I duct on their part is being attacked and made an excuse by some people for stopping the reading or memorizing of the Glorious Qur'an. They alone are not responsible for the evil consequences, but such huffaaz also share the responsibil-</p></div>"
+    },
+    {
+        "id": 27,
+        "bookId": 3,
+        "chapter": "Warning for Neglecting Salaat",
+        "title": "Content for Warning for Neglecting Salaat",
+        "preview": ") 91 ity for stopping the teaching of the Glorious Qur'an. These huffaaz think that they are engaged in the propagation of the Qur'an, but in reality ...",
+        "content": "<div class=\"story-content\"><p>) 91 ity for stopping the teaching of the Glorious Qur'an. These huffaaz think that they are engaged in the propagation of the Qur'an, but in reality they are obstructing it, through their misconduct and bad intentions. The ulama have not permitted the acceptance of salary for teaching the Glorious 9 1 Qur'an so that it becomes the primary motive. In fact, the 3% real motive of the teachers should only be to promote the D b . education and propagation of knowlegde of the Qur'an. No t Q S X salary can be a return for the sublime act of teaching the Qur'an. Such remuneration is on1 for meeting personal needs and has been permitted w K en forced by circum- stances, in case of dire necessity. 93 Part 111 (Final Note) FINAL NOTE The purpose of describing the beauties and in the foregoing pages is to cultivate a love for it. Love for the Holy Qur'an is needed for developing a love for Almighty Allah, and vice versa. Love for one leads to love for the other. The creation of man in this world is only for the pur- pose of acquiring a realization of Allah, and all other cre- ation is for the sake of man. As a Persian poet says: The clouds, the winds, the moon, the sun and the sky are constantly at work, So that $ou earn your living and do not eat in forgetful- ness The whole creation is involved in working for you in obedience, The law of justice will not be fulfilled if you fail to obey (Allah). So man should l6arn a lesson from their punctuality and obedience ,in their functions of rendering service to him. Sometimes, as a warning, temporary changes are caused in their functions by Almighty Allah. There is no rain when it should rain; no wind blows when it should blow; similar changes are wrought in the moon and the sun through their eclipses. In short, everything is subject to some change for admonishing those who neglect their duty to their Creator. How astonishing indeed that all these things be made subservient to fulful man's needs, yet their obedience does not lead man to his own submission to the Creator. Love alone provides the best help for obedience and submission to Almighty Allah. Verily, the lover submits to his beloved. When a person falls in love with someone, submission and obedience to the beloved becomes his habit and second nature. Disobedience to the beloved becomes as hard as it unwilling obedience to one whom one does not love. One way of developing love for someone is the obser- vation of his beauty and excellence. This observation may be through the physical senses or through inner perception. If a look at a beautiful face can lead to spontaneous love, a sweet heart-captivating voice can also sometimes produce a L magnetic effect. A Persian poet says: Looks alone do not inspire love; Often this wealth is attained through charming words. , Sometimes it is the sweetness of voice which draws the heart unconsciously and sometimes it is the beauty and wisdom of expression which causes one to fall in love. Ex- perienced men have suggested that in order to develop love, one should dwell upon the fine attributes of the be- loved, and none other than the beloved should find a place in one's heart. It is true even in the case of earthly love that the sight of a beautiful face cr a hand urges one to see the other parts of the body of the beloved, so that love may in- crease and the yearning of the heart may be satisfied, but the stage of satisfaction is never reached. As an Urdu poet r says: The disease worsened as the treatment progressed. If after sowing the seeds in a field, one does not care to water it, no crop will grow there. Similarly, after falling in love involuntarily, if one does not pay attention to the be- loved, this love will vanish in course of time. But if one 94 I keeps on visualizing the charming features, the stature as well as the gait and the manner of speaking of the beloved, love will go on increasing every moment. 1 Unusual are the ways in the school of love, One who I learns his lesson gets no leave. If you forget the lesson of love, there is a riddance for you at once. But the more you learn it, the more you are en- trapped. In the same way, if a man wants to develop love with someone worthy of love, he should find out the exczl- lence, the charms and the valued attributes of the beloved and should not remain content with what he knows, but should always be eager to know more about them. When, even in the case of mortal beloved, the lover is not satisfied with a partial view of the beloved, and is always on the lookout for more chances to see as much of the beloved as he can, then Almighty Allah, the Pure and Sanctified, Who is the fountainhead of all elegance and beauty, (and in fact there is no beauty in this world except His) is certainly such a beloved Whose loveliness and per- I fection knows no bounds and is limitless. One of the mani- festations of His utmost excellence is the Glorious Quran, which is the Word of Allah Himself. What greater plasure can there be for a lover of the Divine, than the fact that the ! Qur'an is Allah's own Revelation. A poet says: ~ ! '0, flower! how pleased am I with you, You have the smell of someone (beloved). Even if we leave aside the consideration that the Holy Qur'an has its origin in Allah and is His attribute, the re- lationship that the Qur'an has with Rasulullah (Sallallaho alaihe wasallam) is enough for a Muslim to adore it. Study of the Qur'an itself makes one realise that there is no excel- lence elsewhere that cannot be found in the Glorious Qur'an. Part 111 (Final Note) A poet says: W V The limits of sight are marrow and the flowers of your beauty numerous; > X He who plucks the flowers of your spring complains of the inadequacy of his hold. There is another verse to this effect: How many of your graces can be adored; Your charms are innumerable and my restless heart is one. It is evident to the careful reader of the above ahadith, that there is hardly any important thing of this world to which attention has not been drawn. Whatever taste for love and beauty one may possess, its excellence and perfec- tion will be found in the Qur'an. In the first hadith the ex- cellence of the Glorious Qur'an has been established over the beauty, as a whole or in substance, that lies in all worldly things; against the infinite number of excellent at- tributes that one can imagine, the Glorious Qur'an is found to be superior and matchless in respect of all of them. The Holy Qur'an is superior to all other lovable things, taken individually or collectively in every respect. If one loves somebody because of the innumerable benefits accru- ing from him, Almighty Allah has promised (hadith 2) that He will give to the reader of the Qur'an more than that begged of Him by all other persons. If somebody is adored for his personal greatness, at- tainment or excellence, Almighty Allah has said (in the same hadith) that the su eriority of the Qur'an over all other discourses is like t f'~ e superiority of Allah Himself over His creation, of the master over his slaves and of the possessor over those possessed. 96 97 If anybody is fond of wealth, property, servants and animals, and loves to rear animals of a particular kind, he is warned (in hadith 3) that the knowledge of the Qur'an is far more valuable than any number of good animals ac- quired even without labour or crime. If a mystic seeks piety and fear of Allah, and works hard to acquire them, Rasulullah (Sallallaho alaihe wasal- lam) has said (hadith 4) that those who become proficient in the study of the Qur'an, will be reckoned amongst the angels. The piety of the angels cannot be excelled by any- body, because they cannot pass even a moment in disobe- dience to Allah. Also if anybody takes pride in getting double the reward or if he likes that his words should carry a double weight, he should consider how even the reader who fal- ters in his recitation gets double the reward. Il any jealous person can delight only in evil conduct, and jealousy has become a part and parcel of his nature and he cannot give up this vice, he can be rightly jealous of a hafiz whose excellence is worth being jealous of, as said by Rasulullah (Sallallaho alaihe wasallam) (hadith 5). Let one who relishes fruit and cannot live without it, know that the Qur'an is like citron. If anybody is fond of sweets, he should know that Qur'an is sweeter than dates. (<br><hr><br>refers to this.) If anybody is desirous of honour and dignity and cannot resist being a member of some council, he should know that the Qur'an e,xalts the rank of its reader, both in this world as well as in the Hereafter. (This is mentioned in hadith 7.) If anybody wants a sincere and dedicated companion, who should be ready to defend him in every dispute, he should know that the Qur'an is ready to defend its devotee in the court of the Emperor of all emperors (as mentioned in hadith 8.) If a seeker of subtleties devotes his life to the critical study of various subjects, and appreciation of a delicate point is sufficient to turn him away from the greatest pleas- ure of this world, he should know that the body of the Qur'an is a treasure full of subtleties (as described in hadith 9). ~ I I I / I , I l I I I I 4- 1 Part 111 (Final Note) If somebody attaches importance to discovering hidden secrets, and considers that experience in the crimi- nal investigation department is an accomplishment and de- votes his life to acquiring it, he should know that the body of the Holy Qur'an reveals those mysteries whose depths are boundless and to which hadith 10 refers. Also if one hankers after the construction of lofty buildings and wants his special abode to be on the seventh floor, then verily the Qur'an raises its devotee to the seven thousandth floor in Paradise. If anybody desires to do business which should bring maximum profit with a minimum of labour, he should know that the recitation of each letter of the Holy Qur'an yields ten blessings (as referred to in<br><hr><br>). If anybody hankers after a crown and a throne, and for their sake fights battles in this world, he should consider that the Qur'an gets for the parents of its devotees a crown whose brilliance has no parellel in this world. (This is mentioned in hadith 11 .) If there is any expert in feats of jugglery who can catch a burning coal in his hand or can put a burning match-stick in his mouth, he should realize that the Glorious Qur'an provides safety even against the fire of Hell. (For this see hadith 12.) There are people who want to develop good relations with government officers and take pride in relating how, as a result of their recommendation to an officer, an accused had not been punished but had been set free. For finding access to these officers, they spend their time and money everyday in flatteries and arrange dinners and so on. Through the intercession of its devotees, the Glorious Qur'an arranges deliverance of ten people who shall have been condemned to Hell. (This is mentioned in hadith 13.) Now let us consider hadith 14. If somebody is fond of flowers and gardens and loves sweet smells, he should realize that the Holy Qur'an has been compared to musk. If someone loves perfumes and wants to bathe in dried musk, then the example of the Glorious Qur'an is like a musk- vase. This is only for illustration, otherwise musk has no comparison with the fragance of the Holy Qur'an. The par- ticles of this earth cannot be likened to the Heavenly ones. A Persian Poet says: 98 99 That sprinkling of musk is in fact the act of your looks; It is out of expediency that lovers accuse the Chinese deer (reported to yield musk). A person who is often beaten and works for fear of punishment, and persuasion is of no avail to him, will be benefited to know that one whose heart is devoid of the Qur'an, is like a ruined house (as mentioned in hadith 15.) If a devotee is in search of the best waq of all worships and is careful to devote himself to those acts which brings maximum of reward, he should know that recitation of the Holy Qur'an is superior to all other forms of worship, and it is specially mentioned in hadith 16 that it is superior to nafl salaat, fasting, tasbeeh and tahleel' (acclamation). Some people are deeply interested in pregnant ani- mals, as they fetch more price than the ordinary ones. Ra- sulullah (Sallallaho alaihe wasallam) has specifically said that the recitation of the Glorious Qur'an is far more pre- cious than such animals (see hadith 17.) Many people are always worried about their health. They take exercise and bathe every day, they run or go out for a walk in the morning. There are others who are given to grief, worry and anxiety. Rasulullah (Sallallaho alaihe wasallam) has said that the surah Fatihah provides treat- ment for every disease and the Holy Qur'an cures the ail- ment of the hearts, as mentioned in hadith 19. People take pride in so many things that it is difficult to enumerate all these, for example, some boast of their lin- eage or good habits, others of their popularity or foresight. In fact, a thing of real pride is the Glorious Qur'an, which possesses all beauty and perfection. As a Persian verse goes: \"What all the other beloveds possess collectively; You alone possess all that.\" (For this see hadith 20.) Many people are fond of accumulating wealth. For this purpose, they practise miserliness in their food and dress, Part 111 (Final Note) undergo many hardships and develop a mania that is not satisfied by any amount of wealth. Rasulullah (Sallallaho alaihe wasallam) has advised us that the only thing that should be treasured as much as possible is the Holy Qur'an. No treasure of wealth is better than this. (</p></div>"
+    },
+    {
+        "id": 28,
+        "bookId": 3,
+        "chapter": "Virtues of Jama'at",
+        "title": "Content for Virtues of Jama'at",
+        "preview": "refers to this.) Similarly if anybody is fond of illumination and uses ten electric bulbs to light up his room, he should know that the Holy Qur'an pr...",
+        "content": "<div class=\"story-content\"><p>refers to this.) Similarly if anybody is fond of illumination and uses ten electric bulbs to light up his room, he should know that the Holy Qur'an provides the best of lights. People earnestly desire to receive presents, and they expect gifts from their friends every day. They increase their sphere of acquaintance only with this motive. If anyone of their friends does not send them their share of fruit from his garden, they complain of him. They should realise that the Holy Qur'an is the best giver of gifts. Peace descends on those who recite the Glorious Qur'an. If you are enamoured of someone because he sends you a present everyday, then you would be pleased to know that the at- tachment with the Glorious Qur'an will bring you precious gifts (see hadith 22). Some people fawn on a minister, so that he may men- tion them in the court of the ruler, some flatter the subordi- nates so that they may praise him before the officer. Sometimes a person entreats others so that they may men- tion his name in the presence of his beloved. Let all such people learn how, through the Glorious Qur'an, they may make themselves worthy of being mentioned by the be- loved Lord Himself. (We find this mentioned in hadith 23.) If a person is always eager to know about the most favourite thing of the beloved, and he is prepared to per- form even the most arduous task to procure it, he should know that there is nothing more lovable to Allah than the Glorious Qur'an. Some people seek access to the court of the ruler and, with this end in view, they plan and struggle all their lives. Through the Holy Qur'an we can become the special favourites of Almighty Allah, before Whom the greatest of kings is completely helpless (see hadith 24.) It is strange that in order to become a member of some council, or to join the hunting party of some man in author- ity, people make sacrifices of time, money and comfort. They use all sorts of mean tactics for approaching them and 100 103 102 24 Part 111 (Final Note) their disapproval when they see any disobedience to Almighty Allah being committed. It is deplorable that some of our so-called enlightened eople consider it to be nar- rowmindedness on the part o !' ulama. This so-called broad- mindedness on the part of such people does not absolve them of their responsibility. They should understand that it is not the duty of the ulama alone to check disobedience to the Commandments of Allah. But it is the duty of every Muslim who sees disobedience being committed and has the power to stop it. Bilaal bin Sa'd (Radhiyallaho anho) has said, \"If evil deeds are committed secretly, only the evil-doers suffer for it, but if they are committed openly, and nobody prevents them, all the people are punished.\" There are some who are fond of history, and travel to consult old books of history wherever they may find them. Such people had better devote themselves to the study of the Qur'an, in which they will find an equivalent to all the books that are admitted to be most authoritative on the past ages. If you want to acquire such a lofty status that even Prophets be commanded to sit in your company and par- ticipate in your gathering, you can do so through the Holy Qur'an. (<br><hr><br>refers to this.) If you are so lazy that you cannot apply yourself to hard work, even then you can earn an honourable status witho-ut any labour by means of the Glorious Qur'an. You should sit down and keep on listening silently to children reciting the Qur'an in a school. Thereby you shall earn a.lot of reward without any Pard work on your part. (This is re- ferred to in hadith 30.) If you are fond of variety, you can find it in the various ideas and different subjects of the Holy Qur'an, some deal- ing with mercy, others with chastisement, some relating to different stories and others to various commandments, and so on. You can also change your mode of recitation, low at times and loud at others. (see hadith 31.) If your sins have passed all limits and you believe, you are to die one day. ahadith 32 to 34 will exhort you to lose no time and start recitation of the Qur'an, because you can never find such an influential intercessor, whose interces- sion is certain to be accepted. On the other hand, if you are very respectful and your sense of respect and honour makes you avoid disputes with quarrelsome people, even at the cost of your valuable rights, you should try to avoid dispute with the Qur'an on the Day of Judgement, when it will be the strongest complainant, whose contention will be upheld and there will be nobody to defend the respon- 4 j dent. %k If you are in need of a guide who would lead you to the house of your beloved, and one would pay any price for such a guidance, you should take to recitation of the Holy Qur'an. Again if you want to safeguard yourself against im- prisonment, you have no way out except recitation of the Glorious Qur'an. If vou want to acquire the knowledge of the Prophets and vou are its devotee, hadith 35 shows that you can spec:ialize in it through studv of the Qur'an. Similarly if voi~are keen to develop the best of character, vou can do so through rec:itation of the idol? Qur'an. If you are very fo~~tl of hilly places and they alone pro- vide you with the best recireation and satisfaction, you shoultl know that the tiolv Qur'an will provide recreation for you on mounds of musk. even on the Day of Judgement, when all creatures will be in a state of terror. (<br><hr><br>refers to this.) If vou want to excel in the worship of Almighty Allah by remaining busy it1 nafl salaat day and night, you should know that teaching and lear~lirig the Holv Qur'an is a better means of doing so. (See hadith 37.) If votr want to keep yoi~rself anray from all troubles and sava yourself from all anxieties, you can do so simply by tlevoting yourself to the Holv Qur'an. (This is pointed out in hatlith 40.) If vo11 need to consult a physiciau, you should know that si~mh E'atihah provides treatment of all diseases. vide hi~tlith 1 of part 2-Concluding Section. If your numerous daily needs remain unfulfilled. why should you not recite surnh Yaaseen. vide hadith 2 of part 2-(:o11c:ludirig Section. I t 1-ou hanker after money, you had better read surah 12'aacli'al1'. (hadith 3 under Part 2-Concluding Section. rcfttrs to this.) 104 3 If fear of chastisement in the grave haunts you, it can also be relieved by the Glorious Qur'an, vide hadith 4 of Part 11-Concluding Section. If you are looking for an occupation that will absorb all your time, you can find none better than the Holy Qur'an, vide hadith 5 of Part 2-Concluding Section. If one has acquired the wealth of the Glorious Qur'an, he should carefully guard against its loss. To lose such blessing, after having got it, is a great tragedy. He should also abstain from such unworthy acts as might convert this blessing into a curse (vide ahadith 6 and 7 of Part 2-Con- cluding Section.) I know that I am not competent enough to point out the beauties of the Glorious Qur'an. I have explained them according to my humble understanding. This has, however, opened up a field of contemplation for scholars of deep understanding. According to those who are well versed in the art of love, the following five qualities of the beloved incite love. First, it is the being of the beloved, which one loves. The vicissitudes of time have no effect on the form of the Glorious Qur'an; this guarantees its life and security. Secondly, there should be a natural relationship between the lover and the beloved. The Qur'an is the attribute of Almighty Allah. The relationship between the Creator and His creation, the Master and His servants, needs no expla- nation. A Persian poet says: The Creator of mankind has, with the life of Man, a connection that is incomprehensible and unimagin- able. An Urdu poet says: He has a relationship of friendliness with all; He reaches out to the heart of each and everyone. Part 111 (Final Note) 105 The third, fourth and fifth qualities are beauty, perfec- tion and benevolence, respectively. If the foregoing ahadith are studied, keeping the above three qualities in view, scholars will not feel contented with what has been written by me, but they will them- CP selves arrive at the natural conclusion that all consider- ations that promote love and liking, such as sense of i& respect and status, fondness and constancy, beauty and g E$ = perfection, greatness and benevolence, peace and pleasure, wealth and property, in short all such things as promote love are pointed out by Rasulullah (Sallallaho alaihe wasal- lam) to be possessed in a superb way by the Glorious Qur'an. It is but natural that some of these virtues may be hidden, and may not be directly visible as is the case with most of the wordly valuables. We do not reject a delicious fruit because of its rough outer cover. Nobody starts hating his beloved lady because she wears a veil. He would try, by all possible means, that his lady love unveils herself, but if he does not succeed, the very sight of the veil will thrill him, provided he is sure that it is his beloved indeed behind it. No doubt, the Glorious Qur'an excels in all the virtues that induce love, but if, for any reason, we fail to understand and realize them, it will not be wise on our part to become indifferent and disappointed. We should at- tribute this failure to our own shortcomings and feel sorry at our loss. We should contemplate more and more upon the beauties of the Glorious Qur'an and become worthy of understanding the Divine Book. 'Uthman (Radhiyallaho anho) and Huzaifah (Radhiyal- laho anho) have reported that, if hearts become clean of all filth, then one would never be satiated with reading the Holy Qur'an. Thaabit Banaani (Rahmatullah alaih) said, \"I put in a labour of twenty years to learn the Qur'an and it has been giving me solace for t se twenty years.\" Thus it is obvious that whoever repent ? over his sins, and then meditates upon the Glorious Qur'an, will find it to possess all beauties that all the beloveds collectively possess. I wish I were also such a person. I, however, request the readers that they should not look to the humble personality of the writer, lest it should prevent them from realizing their objective, but they should consider the subject-matter and its source. I am only a means of drawing their attention to these sublime matters. 106 Part 111 (Final Note) 107 At this stage, it is just possible that some reader of this book might be blessed by Almighty Allah with an urge to learn the Holy Qur'an by heart and become a hafiz. If anyone has a desire to make his child a hafiz, then no special effort is required because this tender age itself is most conducive to memorizing. But if some grown-up person desires to memorize the Holy Qur'an, I suggest that he should start with a special prayer, which was recom- mended by Rasulullah (Sallallaho alaihe wasallam) and has been found effective by many people. It has been reported by Tirmizi, Hakim and others as follows:- Hadhrat Ibn 'Abbas (Radhiyallaho anho) reports that he was once in the company of Rasulullah (Sallallaho alaihe wasallam) when Hadhrat Ali (Radhiyallaho anho) came in and said \"0, Prophet of Allah! you are dearer to me than my father and mother. I try to memorize the Qur'an but cannot do so, as it vanishes from my memory.\" Rasulullah (Sallallaho alaihe wasallam) said, \"Shall I tell you of a method that will benefit you as well as those to whom it is conveyed by you? You will then be able to retain whatever you learn.\" At the request of Hadhrat Ali (Radhiyallaho anho) Rasulullah (Sallallaho alaihe wasal- lam) said, \"When the night preceding Friday comes, rise up in its last third portion, if possible, for that would be ex- cellent, because this is the best part of the night, as this is the time when angels descend and prayers are specially granted at this hour. It was for this time that Hadhrat Yaqub (Alayhis salaam) had been waiting when he had said to his sons that he would, in the near future, pray to his Lord for forgivenes,s for them. If it be difficult to get up at that time, then you should do so in the middle part of the night and if even that be not possible, offer the four rak'aat in the early part of the night. After reciting surah Fatihah in each rak'aat, surah Yaaseen should be recited in the first rak'at, surah Dukhaan in the second, surah Alif Laam Meem Sajdah in the third and surah Mulk in the fourth. After completing at-tahiyaat (glorification of Allah in the sitting posture in salat) you should praise and glorify Almighty Allah abundantly, invoke peace and blessings on me and on all the Prophets, and seek forgiveness for all be- lievers and those Muslim brethern who have passed away before you, and then recite the following du'a.\" Before the du'a it may be mentioned that several forms of 'hamd-o-thana' (praise and glorification), etc., which are required to be recited before this du'a are reported in other ahadith given in 'Shurooh-e-Hisn' and 'Munaajaat Maqbul'. Those who can consult these books should themselves find the details and thereby enrich their du'a. For the con- venience of those who cannot read these books, brief ex- tracts are given as under: All praise be to Allah, the Lord of Worlds, praise up to the (countless) number of His creatures, matching His pleasure, weighty as the weight of His Throne and ex- pansive as the ink (needed) for the writing of His Words. 0 , Allah! I cannot comprehend the praise due to Thee. Thou art as Thou praisest Thyself. 0, Allah! send Thy peace, blessings and prosperity upon our Chief, the Ummi (not taught by any one), the Hashi- mite Prophet Muhammad and upon all the Prophets and Apostles and upon Thy favourite angels. 0, Allah! forgive us and our brethren who preceded us in faith, and place not in our hearts any rancour towards those who believe. 0, our Lord! You are Most Compassionate and Most Merciful. 0 , Master of the Worlds! forgive me and my parents and all believers and Muslims, whether male or female. Verily, Thou art the Hearer X and Granter of our supplications. After this, the following du'a which was taught by Ra- sulullah (Sallallaho alaihe wasallam) to Hadhrat Ali (Rad- hiyallaho anho), as mentioned in the above hadith, should be read: 108 109 '0, Allah! have mercy upon me, so that I always abstain from sinful deeds as long as I am alive, be kind to me so that I do not toil in vain pursuits, and bless me with solace in that which pleases Thee. 0 , Allah! the Originator of Heavens and Earth, Master of Glory and Honour, Lord of such Majesty, attainment of which cannot even be conceived. 0, Allah! the Most Beneficent, I pray in the name of Thy Majesty and Ef- fulgence of Thy Countenance, to impose upon by heart the merqorizing of Thy Book, as Thou hast taught me the same, and grant me such a manner of recitation as pleases Thee. 0, Allah! the Originator of Heavens and Earth, Master of Glory and Honour, Lord of such Maj- esty, attainment of which cannot even be conceived! 0, Allah, the Most Beneficent I pray in the name of Thy Majesty and Effulgence of Thy Countenance, to il- lumine my visioq with the noor of Thy Book, bless my tongue with a flow in its reading, and through its bles- sing remove heaviness of my heart, open my mind, and wash away (the sins of) my body. Certainly there is none except Thee to support me in the cause of truth, and none except Thee can fulfil this desire of mine. There can be no safeguard (against evil) nor any power (over virtue) except with tlle help of Allah, the Most High, the Most Great. Rasulullah (Sallallaho alaihe wasallam) further said to Hadhrat Ali-(Radhiyallaho anho), \"Repeat this act for three, five or seven Fridays. If Allah so wills, your prayer will .certainly be granted. I swear by Him Who made me Prophet that acceptance of His prayer will never be missed by any believer.'. - - 111 112 113 114 (40)You should not give up the recitation of the Qur'an under any circumstances.\" Salmaan (Radhiyallaho anho) says that he asked Rasu- lullah (Sallallaho alaihe wasallam): \"What reward would be given to one who memorizes these ahaadith?\" Rasulul- lah (Sallallaho alaihe wasallam) said, \"Allah will raise him up in the company of the Prophets and the ulama.\" May Almighty Allah, through His sheer Grace, forgive all our sins and include us in the company of His obedient servants by His mercy alone. This is not beyond His gener- ous grace. The readers are humbly requested to remember this sinner in their prayers. MOHAMMAD ZAKARIYA KANDHLAVI, Mazahir-ul-Ulum, Saharanpur. 29 Zilhaj 1348 HIJRI. Virtues of SALAAT Revised translation of the Urdu book Faza'il-e-Namaaz by Shaikhul Hadith Maulana Muhammad Zakariyya Kaandhlawi translated by Abdul Rashid Arshad CONTENTS FOREWORD . . . . . . . . . . . . . . :. . . . . . . . . . . . . . . . . . . . . . . 9 PART I.-IMPORTANCE OF SALAAT CHAPTER I.-THE REWARDS OF SALAAT Page No. Hadith I Salaat is a pillar of Islam . . . . . . . . 11 2, xr l Hadith I1 Salaat wipes out the sins. . . . . . . . 12 -33 Hadith I11 Salaat causes forgiveness of sins 13 Hadith IV Salaat washes away the sins. . . . . 15-16 Hadith V Salaat helps in adversities . . . . . . 17 Hadith V1 Salaat is expiation for the sins . . . 21 Hadith VII Salaat causes early entry into Paradise . . . . . . . . . . . . . . . . . . . . 22 Hadith VIII Salaat is a redeemer . . . . . . . . . . . . 23 Hadith IX ~ll'ah'scovenant with persons particular about Salaat . . . . . . . 24 Hadith X Value of two rak'aats of Salaat . . . 25 Arbaoon - Forty short Hadiths on the vir- tues of Salaat . . . . . . . . . . . . . . . . 2 7 CHAPTER 11.-WARNING AND REPROACH ON DISCARD OF SALAAT Hadith I Salaat is a partition between Islam and Kufr . . . . . . . . . . ' . . . . Hadith I1 Discarding Salaat is leaving Islam . . . . . . . . . . . . . . . . . . . . . . Hadith I11 Allah has no obligation to person discarding Salaat . . 4 5 Virtues of Salaat Hadith IV Tremendous loss on missing a single Salaat ................ 36 Hadith V Discard of Salaat is a major sin. .. 37 Hadith VI Fate of the person neglecting Salaat ...................... 38 Hadith VII Horrible consequences of neg- lecting Salaat ............... 39 Hadith VIII One Haqb in Hell for each missed Salaat ............... 48 Hadith IX No portion in Islam for person neglecting Salaat ............ 49 PART 11.-IMPORTANCE OF JAMAAT CHAPTER I.-THE REWARD OF JAMAAT Page No. Hadith I Salaat with Jamaat is 27 times superior ................... 52 Hadith I1 Salaat with Jamaat is 25 times superior .................... ' 54 Hadith I11 Vigilance of the Sahabah over Jamaat ..................... 56 Hadith IV Deliverance from Hell and Free- dom from Nifaq ............. 58 Hadith V Reward on going to the musjid 59 even if Jamaat is missed ...... Hadith VI The bigger the Jamaat the more the reward .................. 59 Hadith VII Perfect light on the Day of Judgement .................. 60 25 CONTENTS j CHAPTER 11.-WARNING AND REPROACH ON DISCARDING OF JAMAAT Page No. Hadith I Salaat without Jamaat is not accepted ................... 64 Hadith I1 To miss Jamaat does not become a Muslim ................... 65 (r Hadith I11 The Prophet's displeasure on discarding of Jamaat ......... Hadith IV Salaat without Jamaat an easy prey for Satan ............... 66 Hadith V Ibn Abbas's verdict on discard- ing of Jarnaat ................ 67 Hadith VI Person missing Jamaat shall be unable to prostrate on seeing Allah's Glory ............... 68 PART 111.-IMPORTANCE OF SINCERITY AND DEVOTION IN SALAAT CHAPTER I.--QUOTATIONS* FROM THE HOLY QUR'AN Page No. Quotation I It is the Devotion that reaches Allah ...................... 70 Quotation I1 Woe unto those who are heed- less of Salaat ................ 71 Quotation III A Munafiq performs his Salaat languidly ................... 71 Quotation IV Awful Doom of those mining their Salaat .................. 71 Quotation V Worship of an idler is not ae- ceptable .................... 72 - - I CONTENTS 7 6 Virtues of Salaat Page No. Page No. Story IX A surgical operation during Quotation VI Success on being humble in Salaat . . . . . . . . . . . . . . . . . . . . . . 81 Salaat . . . . . . . . .. . . . . . . . . . . . . 72 I Story X Abu Amir's story about a slave Quotation VII Salaat is not hard for the woman . . . . . . . .. . . . . . . . . . . . . 81 73 humble . . . . . . . . . . . .. . . . . . . . Story XI Story of Umar bin Abdul Aziz . . . 82 Quotation VIII Allah's praise for those who es- Story XI1 Muhammad bin Munkadir's tablish Salaat . . . . . .. . . . . . . . . 73 Salaat . . . . . . . . . . . . . . . . . . . . . . 83 Quotation IX Reward for those spending the Story XI11 Thabit Banani's Salaat . . . . . . . . . 83 night in Salaat . . . . . . . . . . . . . . . 74 Pursuits of a few pious Persons . . 84 Quotation X Reward for those who forsake 74 their bed to cry unto Allah . . . . CHAPTER 111.--QUOTATIONS FROM AHAADITH Quotation XI Allah's praise for vigil . . . . . . . . . . 75 Hadith I Reward proportional to Sincer- ity . . . . . . . . . . . . . . . . . . . . . . . . . 86 Quotation XI1 Distinction of paying adoration at night. .. . . . . . . . . . . . . . . . . . . 75 Hadith I1 Reward of good Salaat . . . . . . . . . . 86 Quotation XI11 Reward for constancy in Salaat :. Hadith I11 Benefit of Nafl Salaat . . . . . . . . . . . 88 CHAPTER 11.-STORIES FROM THE LIVES Hadith IV Salaat, the first thing to be reck- OF THE PIOUS oned for . . . . . . . . . . . . . . . . . . . . 89 78 Story I Sheikh Abdul Wahid's vision . . . Hadith V The worst thief . . . . . . . . . . . . . . . . 90 78 Story I1 Sheikh Mazhar Sa'adi's vision . . Hadith VI Keeping the body at rest in Salaat . . . . . . . . . . . . . . . . . . . . . . 92 Story I11 Abu Bakr Dharir's story about a young slave . . . . . . . . . . . . . . . . . 78 Hadith VII Salaat preserves from lewdness and iniquity . . . . . . . . . . . . .. . . Story IV A Sheikh's dream. . . . . . . . . . . . . . 79 94 Hadi t h VIII Qunoot in Salaat . . . . . . . . . . . . . . 95 Story V Sheikh 'Ata's story about a slave F girl . . .. . . . . . . . . . . . . . . . . . . . . 79 Requisites of good Salaat sug- gested by the Sufis . . . . . . . . . . . 99 Story VI Sirri Saqati's account of his 79 Significance of wording of slave . . . . . . .. . . . . . . . . . . . . . . . Salaat . . . . . . . . . . . . . . . . . . . . . . 102 Story VII Sirri Saqati's story about a pious Salaat of a few Sahabah, Tabi- 80 woman ..................... 'een and Sufis . . . . . . . . . . . . . . . 105 Story VIII Sheikh Abu 'Abdullah Jala's 80 An Important Note. . . . . . . . . . . . . 110 story about a porter . . . . . . . . . . L > IN THE NAME OF ALLAH, THE MOST GRACIOUS, THE MOST MERCIFUL. AUTHOR'S FOREWORD \"We glorify Allah and ask blessings on and salute His I noble Prbphet, his companions and those who follow him in upholding the cause of the right religion.\" I The indifference of Muslims towards practising Islam these days is too well known. So much so that even Salaat, I which is the most important pillar of Islam (after Imaan) 1 and the first and the foremost thing to be reckoned on the i Day of Judgement, is being badly neglected. Although every call to 'Islam', nowadays, seems to be only a cry in the wil- derness, yet experience shows that efforts in this direction are not altogether fruitless. The glorious words of the Holy Prophet (Sallallaho alaihe wasallam) are sure to benefit i those with a receptive and submissive frame of mind. With I i this idea in view and to comply with the long-standing re- L I I quest of some of my dear friends, I have taken upon myself to write this booklet, which is the second of the series on 'Tabligh', the first one being \"Virtues of Tabligh.\" FOREWORD The present-day Muslims, in respect of their behaviour towards Salaat, can be divided into three groups. A large number among them is totally unmindful of Salaat. Quite a few observe their Salaat, but are not particular about Jamaat. Then there are those who are regular in their Salaat (with Jamaat), but their Salaat is devoid of the care and thoroughness which it demands. I have divided the book into three parts to suit the requirements of each group. In each part, the illustrious Ahaadith of the Holy Prophet (Sallallaho alaihe wasallam) are quoted with their simple ig translation. The translation is idiomatic and not literal. Ex- 5 planatory notes have been added wherever necessary. The names of the books of Hadith from which the quotatims are taken have also been mentioned for reference. And my success can only come from Allah! And in Him I trust and unto Him I turn . . . . . . . . . . . . . . . . (XI:88) CHAPTER 1 THE REWARDS OF SALAAT PART I IMPORTANCE OF SALAAT There are two Chapters in this The first one is or1 '1111- portance of salaat, and the second of 'Warning and Re- Hadhrat Abdullah bin Umar (Kadhiyallaho anho) nar- proach' for those who neglect or discard salaat. rates that he heard the Prophet (Sallallaho alaihe wasallam) saying: \"Islan~ is founded on five pillars: bearing witness that there is no god but Allah, and Muhanlmad (Sallallaho alaihe wasallam) is His servant and apostle: estahlishmerlt of salaat: paying of Zakaat; pertorrnance of Hajj: axri fastirig in Kamadhaan.\" The Prophe! (Sallallaho alaihe u~asallam) has com- pared Islam to a canopy resting on five supports. The Kali- mah is the central support and the other four pillars of Islam are. so to say, the remaining four supports. one at each corner of the canopy. Without the central support, the canopy cannot possibly stand. and if any one of the corner supports is missing a collapse will result in the defective corner. Now, let us judge for ourselves how far we have kept up the canopv of Islam. Is there really any pillar that is being held in its proper place? L The five pillars of Islam mentioned in this Hadith sig- nifv the most essential duties of a Muslim. Although a hluslim cannot do without any one of them, vet salaat in Isldrn ctccupies a position next onlv to Ilnaan. Hadhrat Ab- dullah bin Mas'ood (Kadhi~allaho anho) savs: \"Once, I inquired of tht: tioly Prophet (Sallallaho alaihe wasallam), which act (of man) was the dearest to Allah. The Prophet replied, 'saiaat'. I then inquired which act came next (in order of merit) and the Prophet replied, 12 13 Virtues of Salaat 'Kindness to parents'. I again asked what was next and he answered 'Jihaad'.\" Mulla Ali Qari (Rahmatullah alaih) has quoted this Hadith in support of the belief that salaat is the most inl- portant religious duty after Imaan. This is further corrobo- rated by a hadith, in which the Holy Prophet (Sallallaho alaihe wasallam) is reported to have said: \"Salaat is the best of all that has been ordained by Allah.\" \"Hadhrat Abu Zar (Radhiyallaho anho) narrates that once the Holy Prophet (Sallallaho alaihe wasallam) came out of his house. It was autumn and the leaves were falling off the trees. He caught hold of a branch of a tree and its leaves began to drop in large number. At this he remarked, '0, Abu Zar! (Radhiyallaho anho) when a Muslim offers his salaat to please Allah, his sins are shed awav from him just as these leaves are falling off this tree.\" In autumn, usually, the leaves of the trees fall in large numbers, so much so that on some trees not a single leaf is left behind. The same is the effect of salaat performed with sincerity and devotion. All the sins of the person offering salaat are wiped off. It should, however, be remembered that according to the verdict of the theologians, it is only the saghaa'ir (minor sins) that are forgiven by the perform- ance of salaat and other services. The kabaa'ir (major sins) are r,ot pardoned without repentance. We should, there- fore, in addition to saying salaat, be particular about doing taubah (repentance) and istighfaar (seeking forgiveness). AHah may, however, pardon, by His bountiful Grace, even the kabaa'ir of any person because of his salaat. 14 15 Virtues of Salaat wasallam). They would often cherish the sweet memories of the time when the Prophet (Sallallaho alaihe wasallam) was living among them. They would, while quoting him, enact exactly what they had seen him doing at a particular moment. It is really very difficult to cover all the traditions of the Holy Prophet (Sallallaho alaihe wasallam), which deal with the importance of salaat and which declare forgive- ness for those who guard it. As had already been said before, the theologians restrict this declaration of forgive- ness to saghaa'ir (minor sins) only, but in the text of the hadith there is no such restriction. My learned father gave me two reasons for this. Firstly, it does not really become a Muslim to commit any of the kabaa'ir (major sins). If per- chance any such sins are committed by him, he cannot rest in peace (due to inherent fear of Allah in him) until he washes them with his tears of repentance in crying before Allah. Secondly, the person who performs his salaat with sincerity and thoroughness is very likely to do istighfaar quite a number of times daily. Look for instance at the clos- ing prayer of salaat itself, viz: \"0, My Lord! I have wronged my soul a great wrong, and none forgiveth sins save Thou alone. Then forgive me and have mercy on me. Verily, Thou art the For- giving, the Merciful.\" In the above hadith, mention is made of wudhu to be done properlv. We should, therefore, be sure of the regu- lations about wudhu and try to observe all of these. For example. take the case of miswaak. It is sunnat of wudhu, but is very often neglected. It is said in a hadith that the salaat offered after doing ~nisivaak is seventy times superior to the salaat ~ ~ i t h o u t miswaak. In another hadith, use of misuraak has been enjoined verv stronglv, and the follo~v- irig benefits are attributed to it:- \"It cleanses and sweetens the mouth and checks its bad smell.\" \"It is a cause of Allah's pleasure and a blow to the Ilevil.\" i Virtues of Salaat 18 19 Virtues of Salaat rode his camel reciting the following verse of the Holy Qur'an: \"Seek Allah's help with patience and salaat, and truly it is indeed hard except to the humble minded.\" (11: 45). There is yet another story about him. On hearing of the death of a wife of the Holy Prophet (Sallallaho alaihe wa- sallam), he fell down prostrate. When somebody asked him the reason he said, \"Our dear Prophet (Sallallaho alaihe wasallam) had enjoined on us to prostrate (in salaat) when- ever a calamity were to befall us. What calamity can be greater than the death of the Ummul-Mo'mineen?\" When Hadhrat Ubaada (Radhiyallaho anho) was about to breathe his last, he said to the people around him, \"I prohibit one and all from crying over me. When my soul departs, I ask every one to perform wudhu, observing all its essentials, and to go to the musjid and pray for my forgive- ness, because our Gracious Allah has enjoined on us to \"Seek help with patience and salaat.\" After that, lay me down in the pit of my grave.\" Hadhrat Nadhr (Radhiyallaho anho) narrates, \"Once it became very dark during the day in Madina. I hurriedly went to Hadhrat Anas (Radhiyallaho anho) to know if he had ever experienced similar conditions during the life- time of the Holy Prophet (Sallallaho alaihe wasallam). He said to me. \"M'aathallaah! During those blessed days, whenever the wind blew strong, we would hurry to the musjid lest it should be the approach of the Last Day.\" Hadhrat Abdullah bin Salaam (Radhiyallaho anho) narrates that whenever the members of the Prophet's family were hardpressed in any way, the Prophet (Sallallaho alaihe wasallam) would enjoin upon then1 to say salaat, and would recite the following verse of the Holy Qur'an: 20 Virtues of Salaat 26 2 2 Virtues of Salaat Imam Abu Haneefa (Rahmatullah alaih) that he could tell from the water falling down from the limbs of the person performing wudhu as to which sins had been washed off therewith. In a narration by Hadhrat Uthman (Radhiyallaho anho), the Holy Prophet (Sallallaho alaihe wasallam) is re- ported to have warned against being wrong-headed in com- mitting sins in the hope of getting them redeemed through salaat. We have, really, no ground to behave as such on this account. After all, what is the quality of the salaat that we offer? If Allah merely absolves us of our obligation it is His very special favour and grace. Again it is the height of ingratitude to disobey Allah just because He is Clement, Merciful and Forgiving. Hadhrat Abu Hurairah (Radhiyallaho anho) narrates, \"Two persons of one clan came to Prophet (Sallallaho alaihe wasallam) and embraced Islam at one and the same time. One of these was martyred in a battle and the other died a year later, Hadhrat Talha bin Ubaidul- lah (Radhiyallaho anho) says that he saw in his dream that the person who had died later was admitted into Paradise before the martyr. This surprised him. I do not recollect whether it was he or somebody else who narrated this dream. The Prophet (Sallallaho alaihe wasallam) thereupon remarked: \"Has not the person dying later fasted for one additional month of Rama- dhaan, and has he not offered six thousand or odd ra- kaats of salaat more during the year he lived after the martyr?\" Really, we do not know how valuable salaat is! The</p></div>",
+        "sections": [
+            [
+                30,
+                16483
+            ],
+            [
+                16483,
+                32989
+            ],
+            [
+                32989,
+                33391
+            ]
+        ]
+    },
+    {
+        "id": 29,
+        "bookId": 3,
+        "chapter": "Khushoo and Khuzoo",
+        "title": "Content for Khushoo and Khuzoo",
+        "preview": "X djG 5, JG I j&; j G JG A, &j gj $ hij &i 2 O , ,J+ 3. ai . . A@, +,& &i 3 b$, J&, *+ >f! Holy Prophet (Sallallaho alaihe wasallam) was often heard 2...",
+        "content": "<div class=\"story-content\"><p>X djG 5, JG I j&; j G JG A, &j gj $ hij &i 2 O , ,J+ 3. ai . . A@, +,& &i 3 b$, J&, *+ >f! Holy Prophet (Sallallaho alaihe wasallam) was often heard 26 Virtues of Salaat perform their Fajr with Jamaat and keep sitting after prayer till a little while after sunrise and then offer two rakaats of salaat.\" According to Shaqeeq Balkhi, a very famous Shaikh, five things could be acquired through five chan- nels; an increase in provisions through 'Chaasht' a light in the grave through Tahajjud, a very satisfactory answer to Munkar and Nakeer through the recitation of the Qur'an; an easy crossing of Siraat through fasting and alms, and room under the shade of Allah's Throne on the Day of Judgement through seclusion (i.e. Zikr). There are so many sayings of the Holy Prophet (Sallal- laho alaihe wasallam) enjoining salaat and explaining its virtues that it is very difficult to cover all of them in this small book. A few quotations are, however, reproduced below as a benediction: 1. \"Salaat was the first and the foremost thing or- dained by Allah, and it shall be the first and the foremost thing to be reckoned for on the Day of Judgement.\" 2. \"Fear Allah in the matter of salaat! Fear Allah in the matter of salaat! Fear Allah in the matter of salaat!. 3. \"SalCat intervenes between man and Shirk.\" 4. \"Salaat is the mark of Islam. A person who says his salaat at the fixed hours with sincerity and de- votion, observing all its regulations including the Mustahabbaat, is surely a Mo'min.\" 5. \"Of all things that have been ordained by Allah, Imaan and salaat are the most valued. If there were any otber thing better than salaat, then Allah would have ordained it for His Angels, some of whom are always in ruku and others in sajdah.\" 6. \"Salaat is the pillar of Islam.\" 7. \"Salaat abases the Devil.\" 8. \"Salaat is the light of a Mo'min.\" 9. \"Salaat is the best Jihaad.\" 10. \"Allah keeps relenting towards a person so long as he is engaged in salaat.\" 11. \"When a calamity befalls us from the heaven, Virtues of Salaat 3 0 Virtues of Salaat 3 2 Virtues of Salaat away and brings us nearer to Allah. In short, salaat is a guarantee for all that is desirable and a protection against all that is undesirable for both body and soul, equally in this world and in the Hereafter.\" WARNING AND REPROACH FOR NEGLECTING SALAAT The books on hadith mention very severe punishment for those who neglect salaat. From many traditions on the s,ubject, only a few are reproduced in this chapter. Although a single warning from the most truthful Prophet 3 E j , (Sallallaho alaihe wasallam) was enough, yet we find that, grn out of love and mercy for his followers, he has cautioned them again and again and in various manners lest they should neglect salaat and suffer the consequences. In spite of all this, alas! we are unmindful of salaat, and still we have the audacity to consider ourselves devotees of the Prophet (Sallallaho alaihe wasallam) and champions of Islam. Hadhrat Jaabir bin Abdullah (Radhiyallaho anho) nar- rates that he heard the Prophet of Allah (Sallallaho alaihe wasallam) saying: 1. \"To discard salaat is to be linked with Kufr.\" 2. \"To discard salaat is to be linked with Kufr and Shirk.\" 3. \"Discarding of salaat is the only partition between Imaan and Kufr.\" There are a number of ahaadith on the subject. On one occasion, the Holy Prophet (Sallallaho alaihe wasallam) is reported to have said: \"Hurry up with your salaat when it 34 Virtues of Salaat is cloudy (lest you should err and miss the correct time), for to discard salaat is to become a kaafir.\" What a stern warning against even missing the correct time of salaat, as (according to this quotation) to miss the correct time of salaat is to discard it. Although, according to the interpreta- tion of the Ulama, the verdict of kufr is given against a person only when he rejects (and not simply neglects) salaat, yet the words of the Prophet (Sallallaho alaihe wa- sallam) occurring in these ahaadith should be very weighty for those who have any regard for him. It may, however, be noted that some of the very important companions of the Prophet (Sallallaho alaihe wasallam) like Umar, Abduilah bin Mas'ood, Abdullah bin Abbas (Radhiyallaho anhum), etc. and eminent jurists like Ahmad bin Hanbal, Ishaaq bin Raahwayh, Ibn Mubaarak, (Rahmatullah alaihim). etc. are definitely of the opinion that verdict of kufr can be given against the person who intentionally discards his salaat. May Allah save us! Hadhrat IJbaadah bin Saamit (Radhiyallaho anho) nar- rates. 'My. dear friend the Prophet (Sallallaho alaihe wasallam) while enjoining upon me seven good prac- tices said, \"Do not ascribe anything as partner to Allah, though you may be cut into pieces or burnt alive or crucified; do not forego salaat intentionally, lest you should get out of the fold of Islam; do not perpetrate disobedience of Allah, lest you deserve His wrath; and do not take to drinking, for that is the mother of all evils'.\" In another hadith, Hadhrat Abu Darda (Radhiyallaho anho) says, \"My dear Prophet (Sallallaho alaihe wasallam) warned me saying, 'Do not ascribe anything as partner unto 36 Virtues of Salaat complain about them. To spare the rod and to spoil the child is no kindness at all. Who would like to save a child from a surgical operation under advice from a doctor for the simple reason that it would cause pain to him? The Prophet (Sallallaho alaihe wasallam) is reported to have said very often: \"Enjoin salaat on your child when he is seven years old, and beat him if he neglects it after he reaches ten.\" Hadhrat Abdullah bin Mas'ood (Radhiyallaho anho) says, \"Guard the salaat of your children and incul- cate good habits in them\". Luqmaan t$e wise used to say, \"The use of the rod on a child is as indispensable as is water for the fields.\" The Prophet (Sallallaho alaihe wasal- lam) is reported to have said, \"A person while admonish- ing his children earns more reward from Allah than when he is spending about seven pounds of grain in His path.\" In another hadith the Prophet (Sallallaho alaihe wasallam) has said, \"May Allah bless a person who keeps a lash hang- ing in his house for the admonition of his house-folk.\" On another occasion he said, \"No father can bestow anything better on his children than to teach them good manners.\" Hadhrat Naufil bin Mu'aawiyah (Radhiyallaho anho) narrates that he heard the Prophet (Sallallaho alaihe wasallam) saying, \"A person who has missed one salaat is like one who has lost all his family and wealth.\" Salaat is missed usually when either a person is in the company of his family members or is in pursuit of money. According to this hadith, the ultimate loss sustained in missing a salaat is in no way less than the loss of the whole family and property. In other words, if we miss a salaat we should be as much grieved as when we lose all of our folk and entire belongings. If we are cautioned by some reliable person about the presence of gangsters on a certain road, where people are robbed and killed during the night, we need a lion's heart to ignore the caution and travel on that road even during the day time. Strange enough to note that 39 Virtues of Salaat from doom for him who does not guard his salaat, and he shall meet the fate of Pharoah, Haamaan and Ubbay bin Khalaf.\" Everybody knows that Pharoah-the big disbeliever-- had been so arrogant that he proclaimed himself 'Lord the Highest' and made his people worship him. Haamaan was his Chief Minister and accomplice. Ubbay bin Khalaf was the most active and severest enemy of Islam among the dis- believers of Mecaa. Before the Hijrah, he used to announce to the Prophet (Sallallaho alaihe wasallam) most insolently, \"I have reared a horse, which I feed very well; I will slay you one day riding on its back.\" Once the Prophet (Sallal- laho alaihe wasallam) replied to him, \"Inshaa-allaah! you shall meet your end at my hands.\" In the battle of Uhud, he ran about in the field in search of the Prophet (Sallallaho alaihe wasallam) saying, \"If Muhammad (Sallallaho alaihe wasallam) is not slain today, then I stand no chance of sur- viving.\" He at last found the Prophet (Sallallaho alaihe wa- sallam) and advanced to attack him. The Companions decided to finish him before he reached the Prophet, but the Prophet (Sallallaho alaihe wasallam) stopped them. When he came near, the Prophet (Sallallaho alaihe wasal- lam) took a spear from one of the companions and struck him with it, causing a little scratch on his neck. He stag- gered and fell down from his horse and then fled towards his camp crying, \"By Allah, Mtlkammad (SaHallaho alaihe wasalhm) has killed me!\" His people tried to cansole him and told him that it was only a bruise and there was noth- ing to worry h u t , but he would say, \"Muhammad (~allal- laho alaihe wasellam) had once announced to me in Mecca that he would kill me. By Allah, had he only spat at me, I would be no more.\" It is said that he cried like a bull. Abu Sufyan, who was very active on that day, put him to shame for crying in that manner over a slight wound, but he said, \"Do you know who has inflicted this injury upon me? It was none other than Muhammad (Sallallaho alaihe wasal- lam). By Laat and Uzza! if my agony be distributed over all the people of Hijaaz, none of them would survive. Since the time he had declared that he would kill me, I was sure that I would meet my death at his hands. If he only spat at me after that declaration, I would be no more.\" So he died on his way hack, at a day's journey from Mecca. Look! a disbeliever like Ubbay bin Khalaf is so sure about the truth of the Prophet's words that he does not 40 Virtues of Salaat It is said in a hadith that, Allah bestows five favours on a person who is mindful of his salaat, viz: His daily bread is made easy for him; he is saved from the punishments in the grave; he shall receive his record in his right hand on the Day of Judgement; he shall cross the Siraat with the speed of lightning and he shall enter Paradise without reck- oning. As for him who neglects his salaat, he shall meet five types of punishments in this world, three at the time of death, three in the grave and three after resurrection. Those in this world are: he is not blessed in life; he is deprived of the light with which the faces of the righteous are endowed; he receives no rewards for his good practices; his prayers are not answered; and he has no share in the prayers of the pious. Those at the time of death are: he dies disgracefully; he dies hungry; he dies in thirst; which the water in the oceans of the world cannot quench. Those in the grave are: He is so squeezed there that the ribs of one side penetrate into the ribs of the other side; fire is burnt inside for him and he is rolled on cinders day and night; a serpent with fiery eyes and iron nails equal in length to a day's journey is let loose on him and shouts with a thundering voice, 'My Lord has charged me with thrashing you till sunrise for neglecting Fajr, till Asr for neglecting Zuhur, till sunset for neglecting Asr, till Ishaa 43 4 2 Virtues of Salaat been said above, it must be clearly understood that we de- serve the punishments that have been laid down for our commission of sins, but the All-embracing mercy of Allah overrides everything and knows no,bounds. I It was a habit with the Prophet (Sallallaho alaihe wa- sallam) to enquire from the companions, just after Fajr, if I anybody had seen any dream. He would then interpret the dream as related to him. One day, after enquiring from 1 others as usual, the Prophet (Sallallaho alaihe wasallam) himself narrated a long dream in which two men came and took him with them. Besides others he reported certain events which he happened to see in his dream. He said: \"I noticed the head of a person being crushed with a heavy stone. It was struck with such force that, after crushing the head, the stone rolled down over a long distance. The head would assume its normal shape by the time the stone was brought back for repeating the process. This continued in- cessantly. On inquiring from one of my companions, I was I told that the person first learnt the Qur'an, but failed to practise upon it and also used to go to sleep without offer- ing the fardh salaat.\" There is another similar narration, in 1 which the Prophet (Sallallaho alaihe wasallam) is reported to have seen (in his dream) a group of people being treated likewise. Jiba-eel (Alayhis salaam) informed him on his query that thpse were the persons who used to neglect their I salaat. I Mujahid (Rahmatullah alaih) says, \"Allah blesses the people who guard their salaat, just as he blessed Hadhrat Ibrahim (Alayhis salaam) and his descendants.\" Hadhrat Anas (Radhiyallaho anho) narrates that he heard the Prophet (Sallallaho alaihe wasallam) saying, \"If a person dies with sincere Imaan, observing the command- ments of Allah, performing salaat, and paying Zakaat, when he dies Allah is pleased with him.\" Hadhrat Anas (Radhiyallaho anho) also narrates that he heard the Prophet (Sallallaho alaihe wasallam) saying, \"Allah says, 'I hold back retribution, deserved by a locality, when I see therein some people who frequently visit the musjid, love one another for My sake, and pray for forgive- ness in the hours of darkness.\" Hadhmt Abu Darda (Radhiyallaho anho) wrote to Hadhrat Salmaan: \"Spend most of your time in the musiid. I have heard the Prophet (Sallallaho alaihe wasallam) saying, \"The musjid is the abode of the pious. Allah has taken upon Himself to bless the person who spends most of 44 45 i Virtues of Salaat I are those whom trade and business did not distract from re- membrance of Allah?\" Yet another group will rise up and enter Paradise.' In another hadith, the same account is given, with the addition that in the beginning the angel will say. \"All those gathered here will see today who are the honoured people\", and with the modification that the angel at the time of third announcement will say, 'Where are those whom their engagement in trade and business did not distract from salaat and remembrance of Allah?\" Sheik Nasr Samarqandi (Rahmatullah alaih), after quoting this Hadith writes, \"When all the three groups will have entered Paradise without reckoning, a monster with a long neck. shining eyes and most eloquent tongue will rise up from Hell and say. 'I have been deputed on all who are proud and ill-tempered.' It will then pick up all such per- sons from the crowd, as a fowl picks up grain and then it , will fling them into the Hell. It will rise up again saying, 'This time i have been deputed on all who maligned Allah l and His Apostle' (Sallallaho alaihe wassallam).' It will then pick up all such persons and throw them into the Hell; it will appear for the third time and will, in a similar manner, take away all those who made images and pictures. The reckoning will then commence after these three groups have been eliminated.\" 1 It is said that during the early times people could see Satan. A person approached him saying how could he be like him. Satan told him that had he never received such a request before and asked hin? what had prornpted him to ask for it. The person told him that he wished it from his heart. Satan told him to neglect his salaat and to swear very frequently, not caring whether he was doir~g it truthfully. The person told Satan that he would swear by Allah never to give up salaat and swear falsely. Satan told him that never before he had been tricked by a human being to seek his advice. He was determined never to do so in future. Xadhrat Ubayv (Radhiyallaho anho) narrates that he heard the Prophet (Sallallaho alaihe wasallam) saying, \"Give glad tidings to the Muslims that they shall be hon- oured and exalted, and their religion shall prevail, but there is no portion in the Hereafter for those who exploit Islam for wordlv gains.\" The Prophet (Sallallaho alaihe wasallam) is reported to have said, \"I saw Allah in His best form. He said to me, '0 'Muhammad! what are the Highest Chiefs (Angels) arguing about'?' I said, 'I have no knowledge about that.' Allah 4 6 Virtues of Salaat of Allah's Mercy, a key to the Heaven, a weight of the scales (of good deeds) a means of winning Allah's pleasure, a price of Paradise and a protection against the fire of Hell. A person who is particular of salaat, in fact, establishes deen and one who neglects it demolishes (so to say, the structure of) deen.\" According to one hadith, there is healing in salaat. Once the Prophet (Sallallaho alaihe wasallam) saw Hadhrat Abu Hurairah (Radhiyallaho anho) lying on his stomach. He said to him, \".Are you suffering from stomach pain?\" He replied in the affirmative. The Prophet (Sallallaho alaihe wasallam) said, \"Then get up and busy yourself in salaat, for that will heal you.\" Once the Prophet (Sallallaho alaihe wasallam), in his dream, saw Paradise and heard the footsteps of Hadhrat Bilaal (Radhiyallaho anha) there. Next morning he said to Bilaal: What deed of yours helped you to follow me even to Paradise?\" He replied: \"When my wudhu breaks even at night, I take a fresh wudhu and say as many 'rakaats' of nafl salaat as I can.\" Safeeri (Rahmatullah alaih) writes: \"The Angels ad- dress a person who misses Fajr as '0 you wrongdoer', and one who neglects Zuhr as '0 you loser', and one who ig- nores Asr as '0 you transgressor', and one who omits Maghrib as '0 you kaafir', and one who does not say Ishaa as '0 you violator of Allah's commandments.\" Alama Sha'raani (Rahmatullah alaih) writes: \"It should be clearly understood that a calamity is drawn off from a locality the people of which are particular about salaat, whereas a locality the people of which neglect salaat is fre- quently visited by calamities. Earthquakes, thunderbolts and sinking of houses are not unexpected where people are not particular about salaat. Simply guarding one's own salaat is not enough, because when a calamity strikes, it does not befall the wrongdoers alone. It affects everybody in that locality. Once the Sahabah asked the Prophet (Sal- lallaho alaihe wasallam): \"Can we perish while there are pious people among us?\" the Prophet (Sallallaho alaihe wasallam) replied, \"Yes, if vice becomes predominant.\" It is therefore necessary that other people should also be en- joined to stick to Allah's commandments and refrain from wrongdoing. 48 49 Virtues of Salaat pardons the sins. But are we really prepared to ask for His pardon? Ibn Hajar writes, \"A woman died. Her brother was pres- ent at her burial. By chance his purse fell into the grave and was buried with the dead body. The brother realized this after he had returned home and was very sorry for the loss. He decided to dig up the grave secretly and take out the purse. When he dug it up, he saw that the pit was in flames. He returned home, stricken with grief, and related the story to his mother, and inquired if she knew why it was so. The mother informed him that his sister used to delay in salaat and offered it after its fixed hours. May Allah save us from these habits! Hadith IX Hadhrat Abu Hurairah (Radhiyallaho anho) narrates that he heard the Prophet (Sallallaho alaihe wasallam) saying: \"There is no place in Islaam for a person who does .not say his salaat, and there is no salaat without wudhu.\" Hadhrat Abdullah bin Umar (Radhiyallaho anho) also heard the Prophet (Sallallaho alaihe wasal- lam) saying. \"There is no Islaam in a person when there is no salaat by him. The position of salaat in Islaam is as the position of the head in a body.\" Let those who do not offer salaat, and not onlv call themselves Muslims, but also boast of their being cham- pions of the Muslim cause, ponder over these words of the Holy Prophet (Sallallaho alaihe wasallam). They dream of reviving the past glory of Islaam. but would not care to know how rigidly the people responsible for that glory stuck to the practices of Islaam. Hadhrat Abdullah bin Abbas (Radhivallaho anho) suf- fered from cataract of the eve. People told him that the dis- ease could be treated, but he would have to miss his salaat for a few days. He said: \"This is not possible; I have heard 53 5 2 Virtues of Salaat \"Hadhrat Abu Hurairah (Radhiyallaho anho) narrates that he heard the Prophet (Sallallaho alaihe wasallam) saying, \"Salaat with Jamaat is twenty-five times superior to salaat which is said in a house or in a shop. It is so because when a person performs wudhu in right earnest and walks on to the musjid, with the sole intention of performing salaat, each step he takes, adds one blessing to his account and wipes out one sin therefrom. Again, if he keeps sitting in the musjid (with wudhu of course) after the salaat is over, the angels keep on seeking Allah's blessing and forgive- ness for him. And as long as he keeps sitting in the musjid waiting for salaat, he goes on earning rewards as if he is busy in salaat.\" In Hadith No. I, the superiority of salaat with Jamaat over that offered individually is described as being twenty- seven times more, while this hadith mentions only twenty- five times. Various theologians have discussed at length this seeming inconsistency. The following are some of the explanations: 1 1. \"This variation from twenty-five to twenty-seven is due to variation of ikhlaas (sincerity) in differ- ent individuals.\" I 2. \"In Sirri (quiet) salaat (i.e., Zuhr and Asr), it is twenty-five times, while in Jahri (loud) salaat (i.e., Fajr, Maghrib and Ishaa), it is twenty-seven 1 times.\" 3. \"In Fajr and Ishaa, when it is somewhat incon- venient to go out due to cold and darkness, it is twenty-seven times, but in other salaats it is twenty-five times.\" 4. \"In the beginning it was twenty-five times, but subsequently Allah (by special favour on the fol- lowers of the Prophet (Sallallaho alaihe wasallam) raised the reward to twenty-seven times.\" Part 11 (a)-Rewards of Jamaat Some others have brought forward a still finer explana- tion. They say that the reward for salaat with Jamaat men- tioned in this Hadith is not merely 25 times but a doubling (2 raised to the power) twenty-five times, which comes to 33,554,432 times. This is something not beyond the bounti- ful Mercy of Allah. When neglect of one salaat can cause punishment in Hell for one Huqb (as we have seen in the last chapter), so much reward for one salaat with Jamaat is quite conceivable. The Prophet (Sallallaho alaihe wasallam) has also ex- plained to us how the reward goes on increasing in the case of a person who, after~erforming wudhu, leaves his house with the sole intention of joining Jamaat for salaat in the musjid. Each step he takes, brings one reward as well as washes away one sin. Banu Salama, a clan in Madina, had their houses at some distance. They intended to shift close to the musjid. The Prophet (Sallallaho alaihe wasallam) however, advised them saying: \"Stay where you are. Every step you take when coming to musjid is written in your account.\" It is said in a hadith: \"The likeness of a person performing wudhu at home and then leaving for musjid is as the likeness of of a person who, after dressing in the ihraam (Hajj apparel) at his house, leaves for Hajj\". Further, in the same hadith, the Prophet (Sallallaho alaihe wasallam) points to another act of great value; i.e., as long as one remains sitting in musjid after the salaat is over, the angels pray for him asking for forgiveness and mercy. The angels are the innocent and holy creation of Allah. So, the effectiveness of their prayers is self-evident. Muhammad bin Samaak (Rahmatullah alaih) is a famous theologian and Sheikh. He died at the age of one hundred and three. He used to perform two hundred rakaats of nafl salaat daily. He writes: \"For forty years, I never _missed the first takbeer of salaat with Jamaat, except once when my mother had died.\" The same Shaikh writes: \"Once I missed the Jamaat. As I knew that salaat with Jamaat was twenty-five times superior, I repeated this salaat (individually) twenty-five times to make up the loss. I heard in my dream some one saying to me, 'Muhammad! You have repeated your salaat 25 times (in the hope of making good the loss), but what about the 'Aameen' by the Angels?\" It is reported in many ahaadith that when the Imaam says 'Aameen' after Fatihah, the Angels also say Aameen and all the past sins of a person whose Ameen coincides with that of the Angels are forgiven. This is 54<br><hr><br>Hadhrat Abdullah bin Masood (Radhiyallaho anho) says: \"If one wishes to meet Allah on the Day of Judge- ment as a Muslim, he must say his salaat at a place where Azaan is called out, viz., a musjid, as Allah has prescribed through His Prophet (Sallallaho alaihe wasallam) such practices which are nothing but guid- ance through and through: and salaat (with Jamaat) is one of them. If you start saying your salaat at your houses (as.so and so is doing), then vou will be dis- carding the Sunnah of the Prophet (Sallallaho alaihe wasallam) and no sooner you desert his Sunnah than you go astray. When a person performs wudhu cor- rectly and then leaves for the musjid, at each step that he takes, he gets one blessing and has one sin wiped out. During the lifetime of the Prophet (Sallallaho alaihe wasallam) no one would miss Jamaat except an open munaafiq or a real invalid. Even the munaafiq dared not miss the Jamaat and a sick person who could be taken to the musjid with the help of two men would be helped to join Jamaat.\" 0 , CA a o 3 a This shows the extreme vigilance of the Sahabah over their salaat with Jamaat. Even a sick person was brought to S the musjid somehow or other, even though it needed two men to help him. This concern was quite natural when they found the Prophet (Sallallaho alaihe wasallam) him- self so very particular about it. It is said that when the Prophet (Sallallaho alaihe wasallam) was on his deathbed, and he would frequently faint, he succeeded in making wudhu after several attempts and, though he could hardly stand, went to the musjid with the help of Hadhrat Abbas (Radhiyallaho anho) and another companion. Hadhrat Abu Bakr (Radhiyallaho anho) led the salaat at his instance, and he himself joined the Jamaat.\" Hadhrat Abu Darda (Radhiyallaho anho) narrates that the Prophet (Sallallaho alaihe wasallam) once said to him, \"Worship your Lord as if you see Him before you, count yourself among the dead, beware of the curse of the wronged ones and, even if you could crawl to the musjid, do not miss Ishaa and Fajr with Jamaat.\" It is said in another hadith, \"Ishaa and Fajr are very heavy on those who are munaafiq. If they knew the reward of the Jamaat, they would go to the musjid and join the Jamaat even if they had to crawl.\" Hadith IV Hadhrat Anas bin Maalik (Radhiyallaho anho) narrates that he heard the Prophet (Sallallaho alaihe wasallam) 57 Virtues of Salaat saying, \"A person who in all sincerity is constant in his salaat with Jamaat for forty days, without missing the first takbeer, recieves two awards: one for deliv- erance from Hell and the ~ t h e r for freedom from nifaaq.\" If a person is regular in his salaat (with sincerity) for forty days and joins the Jamaat from the very start (i.e., when the Imaam calls out his first takbeer), then he shan neither be a munaafiq nor shall he go to Hell. A munaafiq is a person who feigns being a Muslim, but there is kufr in his heart., Genesis of man (according to hadith) takes place in periods of forty days. This seems to be the significance of forty days in this hadith, and so the Soofis attach import- ance to this period (called Chillah in Urdu) for purposes of spiritual discipline. Lucky indeed are the persons who do not miss their first takbeer for years together. Hadith V Hadhrat Abu Hurairah (Radhiyallaho anho) narrates that he heard the Prophet (Sallallaho alaihe wasallam) saying, \"A person who performs wudhu scrupulously, and then goes to the musjid and finds that Jamaat is over, receives a reword equal to that of Jamaat. This would not diminish anything from the reward of those who have actually performed their salaat with Jamaat.\" This is indeed Allah's great favour and beneficence that the mere effort and a slight exertion is enough to en- title us to a reward of Jamaat, though actually we fail to join it. Who is the loser then if we ourselves get left, and miss the bounties of the most Bountiful? This hadith also shows that we-should not postpone going to the musjid in apprehension of the Jamaat being over. Even if we find on reaching the musjid that Jamaat is over, we will still get the reward thereof. If, however, we are certain that the Jamaat is already over, then there is of course no idea in going to the musjid for Jamaat. 58 Virtues of Salaat The value of going to .the musjid in the darkness of night shall be realised on the dreadful Day of Judgement, when everybody shall be in a very miserable plight. A person subjecting himself to inconvenience in the hours of darkness in this world shall be more than compensated in the next, as he shall carry with him a light more glorious than that of the sun. In a hadith it is reported that such per- sons shall occupy the pulpits of light, with no worry at all, while others will be in utter bewilderment. In another hadith it is said, \"Allah will say on the Day of Judgement, Where are My neighbours?\" The Angels wi!l inquire, \"Who are Thy neighbours, 0 Allah?'. Allah will reply, 'Those who used to frequent the mosques.\" In a hadith it is said, \"Of all the places on this Earth, the mosques are the dearest to Allah, and the markets are the most offensive to Hirn.\" In another hadith, the 'masaajid' are called \"The gar- dens of Paradise.\" Hadhrat Abu Sa'eed (Radhiyallaho anho) narrates, \"The Prophet (Sallallaho alaihe wasallam) once said, 'Bear testimony to the Imaan of the person frequenting the musjid, and then he recited the following verse of the Qur'an' \"He only shall tend Allah's musjid who believes in Allah and the L,ast Day.\" (IV: 18).\" The following are a few more ahaadith about the vir- tues of salaat with Jamaat:- 1. \"Making wudhu when inconvenient, walking to- wards 'the musjid and sitting there (after one salaat), waiting for the next salaat, wipe out the sins.\" 2. \"The farther a person lives from the 'musjid' the greater the hlessing he receives.\" This is so be- cause a person coming from a distance shall have to walk more and, as already mentioned, every step will fetch him a blessing. For this very reason some companions have been reported to be taking short steps in going to the musjid in order to earn more blessings. 3. \"There are three things in this world for which 60 Virtues of Salaat get it established universally by propagating it and by arranging special congregations, where it can be performed with absolute unity of form and purpose.\" \"Further, in every community or religious society. There are a few who have the capacity to lead, while the rest simply follow. There are some others who can be cor- rected with a little counsel or reproach. Then there is a third grade of people who are very weak in faith and, if they are not made to worship in public, they are prone to discard it altogether. It is therefore in the best interests of the Islamic society that all its members perform the worship collectively and in congregation, so that the delin- quents may be distinguished from the observers and the shirkers from the adherents. This will also cause the people with less knowledge to follow the Ulama, and make the ig- norant to learn from the learned the specific requirements of worship. The worshipper will distinguish right from wrong and genuine from counterfeit, so that the right and the genuine may prevail and the wrong and the counterfeit may be suppressed.\" \"Besides, these congregations of people loving Allah, seeking His Mercy, constantly fearing Him and having their hearts and souls turned to Him alone, have the wonderful effect of causing His blessings and Mercy to descend from Heaven. \"Moreover, the Muslim community has been raised so that the word of Allah be held supreme and Islamic Order be paramount over all others. This object cannot be achieved unless all Muslims, big and small, the elite and the common, the town folk and the countrymen, perform alike the most sublime service and the most sacred ritual of Islam (i.e., salaat) by assembling together in one place. It is for this reason that the Sharee-at (Islamic Law) lays such special stress on Friday congregation and on salaat with jamaat, by explaining the blessings that accrue therefrom and punishments awarded for neglect 1 lereof. For the open and conspicuous observance of this im?ortant service, two types of assemblies are required: one fr~r people of a clan or a particular locality and the other for the people of the whole town. Since the assembly or\" the former at any hour is convenient and that of the latte, comparatively difficult, so for the former, the gathering for salaat (with jamaat) five times daily, has been laid down and in the case of the latter gathering, the weekly Friday salaat has been devised and ordained.\" CHAPTER I1 REPROACH ON GIVING UP JAMAAT Just as Allah has promised rewards and blessings for adhering to His commandments, so has He warned us of the woeful consequences and punishments for their neg- lect. We are in bondage to Allah and as such it is obligatory on us to obey Him. No compensation or reward is due to us for our obedience to Him. If He gives a reward, it is surely a matter of His extreme favour on us. Similarly no punish- ments can be too much for us if we disobey Him-our Lord, for their can be no greater crime for a bondsman than to disobey his Master. Hence no warning or premonition was required to be imparted. Yet Allah and His Holy Prophet (Sallallaho alaihe wasallam) have so very kindly cautioned us in various ways, warned us frequently of the conse- quences and explained to us again and again, just to save us from disaster. If even then, we don't take a lesson, who collld there be to save us from the inevitable consequences? Hadith I Hadhrat Ibn Abbas (Radhiyallaho anho) narrates, \"I heard the Prophet (Sallallaho alaihe wasallam) saying, \"If a person in spite of hearing the azaan does not go to the musjid (and he prefers to say his salaat at home) without a strong excuse, then his salaat is not ac- cepted. When the Companions inquired as to what could be a strong excuse, he replied, \"Illness or fear.\" It may perhaps appear from this Hadith that the salaat performed at home (after hearing the Azaan) is no salaat at all; the Hanafiyyah do not hold this view. According to them, though the reward and blessings promised for fardh salaat will not be awarded, yet the person saying the salaat 62 63 Virtues of Salaat at his place does absolve himself of the obligation. But in the opinion of some of the companions and their success- ors, salaat with jamaat (after hearing the Azaan) is fardh and its discard is haraam. According to many other theo- logians, such a person is not even absolved of the obliga- tion in respect of salaat of that hour. Anyhow, he is surely committing the sin of discarding jamaat. In another hadith narrated by Hadhrat Ibn Abbas, it is stated that such a person is guilty of disobedience of Allah and his Apostle (Sallallaho alaihe wasallam). Hadhrat Ibn Abbas (Radhiyal- laho anho) also says, \"No good is done by, nor any good is done to, the person who does not join jamaat after hearing the Azaan. Hadhrat Abu Hurairah (Radhiyallaho anho) says, \"It is more appropriate to pour molten-lead into the ears of a person who does not go to join jamaat.\" Hadhrat Mu'aaz bin Anas (Radhiyallaho anho) narrates that he heard the Prophet (Sallallaho alaihe wasallam) saying, \"A person who does not go for salaat after hear- ing the Azaan is committing a great wrong and is doing an act of kufr and nifaaq.\" According to this hadith, not to join jamaat after hear- ing the Azaan is not becoming of a Muslim and is the prac- tice of a kaafir or a munaafiq. What a strong reproof! In another hadith, it is said, \"Not to join jamaat after hearing the Azaan is sufficient to render a person most un- fortunate and most wretched.\" Hadhrat Sulaimaan bin Abi Hathmah (Radhiyallaho anho) is one of the eminent people of the early days of Islam. He was born during the lifetime of the Prophet (Sal- lallaho alaihe wasallam), but was too young then to have had the honour of listening to any hadith from him. During the Caliphate of Hadhrat Umar (Radhiyaliaho anho) he was made in charge of the market. One day Hadhrat Umar (Rad- hiyallaho anha) found him missing in Fajr salaat. Hadhrat Umar (Radhiyallaho anho) went to his house and inquired from his mother why Sulaimaan was not present in Fajr. She replied, \"He kept saying nafl salaat throughout the 64 65 Virtues of Salaat jamaat. The farmers in our country are generally negligent of salaat and consider their occupation a sufficient excuse for their neglect, and even those who are considered pious prefer to perform their salaat individually. If the farmers working in the nearby fields get together at a place and per- form prayers in jamaat, they can have quite a big gathering and thereby receive the wonderful blessings of Allah. Not- withstanding the sun, rain, heat and cold, they keep busy for a trifling worldly gain, but lose tremendous amount of Allah's reward by losing salaat. On the other hand, they can earn a reward fifty times more (as conveyed in another hadith) by offering their salaat with jamaat in the fields. It is stated in a hadith, \"When a shepherd calls out the Azaan at the foot of a hill (or in the fields) and starts his salaat, Allah is greatly pleased with him and says proudly to the Angels, 'Behold My slave! He has called out the Azaan and is offering his salaat. All this he does out of fear for Me. I therefore grant him forgiveness and declare his admittance into Paradise.\" Somebody asked Ibn Abbas (Radhiyallaho anho), \"What about a person who keeps fast all day and offers nafl salaat all night, but does not go to the musjid for jamaat and Jumu'ah?\" \"He is doomed to Hell\", replied Hadhrat Ibn Abbas (Radhiyallaho anho). Such a person, being a Muslim, may ultimately get freedom from Hell, but who knows after how long. The ig- norant among the Soofis and Shaikhs are very particular about Zikr and nafl salaat and consider this an act of emi- nence in piety, while they are not particular about salaat with jamaat. It must be clearly borne in mind for all times that no person can achieve religious eminence except through complete adherence to the practices of the beloved Prophet (Sallallaho alaihe wasallam). It is stated in a hadith that Allah curses three persons: An Imaam who insists on leading the people of a place in salaat, although they do not like him on some reasonable account, a woman who is under the displeasure of her hus- 66 Virtues of Sajaat 2. These shall be infidels who did not say salaat at all. 3. These shall be the munaafiqeen. (Allah knows best and His knowledge is most perfect). What a terrible thing to be so abased and disgraced on the Day of Judgement that, while all Muslims shall fall prostrate at seeing Allah's glory, those who neglected salaat with jamaat shall be singled out by their inability to do so. Besides these, many other warnings have been given against the neglect of jamaat. But as a matter of fact, none is necessary for a good Muslim to whom the word of Allah and His Apostle (Sallallaho alaihe wasallam) is all import- ant. And for one who has no regard for their word, all such warnings are meaningless. But a time will come when every soul shall be called to account, and punished for its misdeeds, and then no amount of penitence shall be of any avail. PART 111 IMPORTANCE OF SINCERITY AND DEVOTION IN SALAAT There are many persons who offer their salaat and quite a lot of them are particular about jamaat as well, but they say it so imperfectly that, instead of earning blessings and reward for them, it is rejected forthwith. This, how- ever, is not so bad as to discard salaat altogether, which as we have already learnt, is very serious. Although we are deprived of the rewards by saying a defective salaat, which is not accepted, yet we are saved from the insolence of neg- lecting and disobeying Allah's commandments. However, when we spend our time, leave our work and undergo in- convenience, then why should we not see that we get the best return for our time and labour by saying our salaat as best as we can? This third part is divided into three chapters. In the first chapter, a few quotations from the Holy Qur'an about the people who are condemned for their bad salaat and those who are praised for their good salaat, are given. In the second Chapter, stories about the salaat of a few lovers of Allah are collected. The third chapter consists of the say- ings of the Prophet (Sallallaho alaihe wasallam) on this subject. CHAPTER I QUOTATIONS FROM THE QUR'AN \"Their flesh and their blood reach not Allah, but devo- tion from you reacheth to Him.\" (XXII: 37) Although this particular verse refers to the animal sac- rifice, yet in principle it equally applies to all other rituals. It is sincerity and devotion in a service by which its accept- ance would be judged by Allah. Hadhrat Mu'aaz (Radhiyal- 68 69 Virtues of Salaat laho anho) says, \"When the Prophet (Sallallaho alaihe wasallam) deputed me to Yemen, I requested him to give me some parting advice. He replied, 'Be sincere in all your services, as sincerity will magnify the value of an action, however insignificant it may be.\" Hadhrat Thaubaan (Radhiyallaho anho) narrates that he heard the Prophet (Sallallaho alaihe wasallam) saying, \"Blessed be the sincere ones, for they are the lamps of guidance. They cause the worst evils to be driven off through their sincerity.\" It is said in another hadith, \"It it through the presence of the weak and due to their salaat and their sincerity that Allah's help comes to all the people.' Quotation- I1 \"Woe unto worshippers who are heedless of their salaat, who want but to be seen at salaat.\" (CVII: 4-6) \"To be heedless\" has been given the following differ- ent interpretations: 1. To be so careless as to miss the correct time of salaat. 2. To be inattentive in salaat. 3. To forget the number of rakaats. \"When they (the hypocrites) stand up for salaat, they perform it without earnestness and want but to be seen by men and are mindful of Allah but little.\" (IV: 142) \"Now there hath succeeded them (Prophets) a later generation who have ruined salaat and have followed lusts. So they will meet Ghayy.\" (XIX: 59) i Part 111 (a)-Quotations from the Qur'an 29 In the dictionary 'Ghayy,' is explained as deception, which points towards the awful doom and ruin in the here- after. According to many commentators, Ghayy is a pit in Hell full of blood and pus. The persons who had ruined their salaat shall be thrown into this pit. Quotation- V I \"And naught preventeth that their (the hypocrites) contributions should be accepted from them, save that they have disbelieved in Allah and in His Apostle, and they come not to worship, save as idlers, and pay3 not i (their contribution) save reluctantly.\" (IV: 54) Note: The quotations I to V above relate to those who ruin salaat. On the other hand, the following speak of those whom Allah praises for their good salaat. I I I I 1 \"Successful indeed are the believers who are humble in their salaat. And who shun vain conversation. And I who are payers of the Zakaat. And who abstain from sex, save from their wives or the slaves that their right hand possess, for then they are not blameworthy but who craveth beyond that, such are transgressors-And who faithfully observe their pledges and their cove- nants. And who pav heed to their salaat. These are the heirs who will inherit Firdaus (Paradise). There they will abide.\" (XXIII: 1 to 11) The Prophet (Sallallaho alaihe wasallam) says, \"Fir- daus is the apex and the best portion of Paradise, where- 70 Virtues of Salaat Part 111 (a)-Quotations from the Qur'an 7 1 from all its rivers originate. Allah's throne will be placed there. When you pray for Paradise, always pray for Fir- daus.\" \"And truly it (salaat) is hard save for the humble- minded; who know that they have to meet their Lord, and that unto Him they are returning.\" (11: 45-46) I I \"The (faithful) slaves of Rahmaan (the Beneficent) are they who walk upon the earth modestly and when the foolish ever address them, they answer: Peace; and who spend the night before their Lord, prostrate and standing.\" (XXV: 63 - 64) After describing a few more qualities of His faithful slaves, Allah says in the same context: 3 2 5 Quotation- VIII \"They will be awarded the high place for as much as they were steadfast, and they will meet therein with welcome and the word of peace. Abiding there for ever. Happy is it as abode and station.\" (XXV: 75-76) \"In houses which Allah hath allowed to be exalted, and His name shall be remembered therein, do offer praise to Him at morning and evening, men whom neither merchandise nor sale beguileth from remem- berance of Allah and establishment of salaat and paying Zakaat, who fear that Day when the hearts and the eyeballs will be overturned so that Allah may reward them for the best of what they did and increase reward for them out of His bounty. Allah giveth bles- sings without measure to whom He will.\" (XXIV: 36 to 38) \"The believers in our revelations are those who forsake their beds, to cry unto their Lord in fear and hope, and spend of what We have bestowed on them. No soul knoweth what is kept hid for them of joy, as a reward for what they used to do.\" (XXXII: 16- 17) Hadhrat Abdullah bin Abbas (Radhiyallaho anho) says \"Establishment of salaat means performance of ruku and sajdah properly and constant concentration in salaat with complete humility and submission.\" Hadhrat Qataadah (Radhiyallaho anho) says: \"Wherever the words 'Establish- ment of salaat' occur in Qur'ar,, they mean to guard its hours, to perform wudhu in the right manner and to ob- serve ruku and saidah properlv.\" \"I,o! those who keep from evil will dwell amid gardens and water-springs, taking to that which their Lord 73 Virtues of Salaat giveth them; for Lo! aforetime they were doers of good. Thev used to s l e e ~ but. little in the night. And ere the dcining of ezch diy, would seek forgiveness.\" (LI: 15-18) Quotation- XI1 \"Is he who worships devotedly in the hours of the night, prostrate or standing, afraid of the Hereafter and hoping for the mercy of his Lord (to be counted equal with a disbeliever)? Say (unto them, 0 Muhammad) (Sallallaho alaihe wasallam): \"Can those who know be equal with those who know not? But only men of understanding will pay heed.\" (XXXIX: 9) And angels would be entering through every door pro- claiming: \"Peace be upon you, as a reward for your perseverance on religious practices.\" Thus how splen- I I did would be their end! (XIII: 22-23). ~ \"Lo! man was created very impatient. Fretful when I evil befalleth him. And niggardly when good befalleth him, save the worshippers who are constant at their salaat .\" (LXX: 19-23) I After giving some more qualities of these blessed 1 I people, Allah says in the same context, Part 111 [a)-Quotations from the Qur'an \"And those who guard their salaat. These will dwell in gardens, honoured.\" (LXX: 34-35). Besides the quotations given above, there are many verses of the Holy Qur'an enjoining salaat and exalting and extolling those who say their salaat properly. Salaat is indeed a great boon. That is why Muhammad (Sallallaho alaihe wasallam) has called it 'the comfort of my eyes', and Ibrahim (Alayhis salaam) prayed to Allah, \"My Lord! make me to establish Salaat, and some of my posterity (also); our Lord! and accept the prayer.\" (XIV:40) Here the eminent Prophet of Allah, whom Allah has called 'Khaleel', is asking Allah to make him say his salaat properly and regularly. The Glorious Allah Himself is or- dering His beloved Prophet (Sallallaho alaihe wasallam) thus:- \"And enjoin salaat upon the people and be constant therein. We ask not of thee a provision. We provide for thee. And the Hereafter is for righteousness.\" (XX:132). It is said in a hadith that whenever the housefolk of the Prophet (Sallallaho alaihe wasallam) were hard-pressed in any way, he enjoined salaat on them and used to recite this verse. All the Prophets of Allah (peace be upon them) are reported to have engaged themselves in salaat whenever they had any difficulty. But, alas! we are so unmindful and indifferent about salaat that, in spite of all that we proclaim about Islaam and Islamic practices, we pay no attention to it. But on the contrary, if anybody stands up to invite us and to draw our attention towards it, we cut jokes and sneer at him and oppose him, thereby harming none else but ourselves. Even those who offer the salaat, often perform it in such a way that it will not be wrong to call it a mockery of salaat, as it lacks the proper observation of its requisites 74 Virtues of Salaat and also the devotion and submission obligatory therein. The practical example of the Holy Prophet (Sallallaho alaihe wasallam), as also the practices of his illustrious i companions, should be the guiding factor in our lives. I have collected the stories about the salaat of the compan- ions in a separate book, named \"Stories of Sahabah,\" and I need not repeat them here. However, I am giving stories from the lives of a few pious persons in the following pages. The practices and the sayings of the Holy Prophet (Sallallaho alaihe wasallam) about this subject would appear in Chapter 111. I CHAPTER I1 A FEW STORIES FROM THE LIVES OF THE PIOUS Shaikh Abdul Waahid (Rahmatullah alaih) says, \"One LI day I was so much overpowered by sleep that I went to bed 2 4 g before finishing my Zikr for the night. I saw in my dream a 3 * most beautiful girl dressed in green silk. All parts of her body and even her shoes were engaged in Zikr. She said to me 'Aspire to possess me; I love you.\" And then she recited a few couplets depicting the eagerness of a lover. When I woke up from the dream, I vowed not to sleep any more during the night. It is reported that for full forty years he never slept at night, and said Ishaa and Fajr salaats with the same wudhu. Story- I1 Shaikh Mazhar Sa'di (Rahmatullah alaih), the famous pious man, kept weeping for sixty years in love and eager- ness for Allah. One night he saw in a dream a few damsels by the side of pearl trees with gold branches, on the bank of the brook brimming with fluid musk, pure and fragrant. The girls were hymning the glory of Allah. He asked their identity. In reply they recited two couplets, which meant, \"We have been created by the Sustainer of mankind and Lord of Muhammad (Sallallaho alaihe wasallam) for those people who keep standing before Allah all night long and hymning in supplication to Him.\"<br><hr><br>Abu Bakr Dharir (Rahmatullah alaih) says, \"There lived a young slave with me. He fasted all day and stood in Tahajjud all night long. One day he came to me and re- lated: \"Last night against my usual practice I went to sleep. 1 saw in my dream that the wail of the Mihraab was cracked, and from the crevice ap:3eared a few damsels. One of them was very ugly. I asked one of the pretty damsels 76 Virtues of Salaat who they were. She replied that they were my previous nights and that the ugly one was this night.\" i- An eminent Shaikh says: \"One night I was in a deep sleep and could not get up for Tahajjud. I saw in my dream a girl of such beauty as I had never seen in my life. She was emitting such fragrance as I had never smelt before. She handed over to me a piece of paper on which were written three couplets, which meant, 'You were so enamoured of deep sleep that you have become unmindful of the high r balconies of Paradise, where you have to abide for ever with no fear of death. Wake up! It is better to recite the Qur'an in Tahajjud than to sleep.\" since then, wherever I feel sleepy, these couplets come to my mind and the sleep I goes away.\" Ataa (Rahmatullah alaih) writes, \"I went to the market. A person had a slave girl to sell, who was said to be mad; I purchased her for seven dinaars and brought her to my house. After a portion of the night had passed, I noticed that she got up, performed wudhu and started her salaat. In her salaat she wept so much that I thought she would die of excessive crying. After finishing the salaat, she began to supplicate before Allah saying, '0 my Lord! By the love Thou bearest for me, show mercy on me.' I interrupted by telling her that she should rather say, 'By the love that I have for Thee . . .\" She got irritated at this suggestion and said, 'By Allah Himself! Had He not loved me, I would not be standing here before Him while you are in your bed.' Then she fell prostrate and recited a few couplets purport- ing, 'I am growing more and more restless. How can one rest whose peace of mind is taken away by love, eagerness and constant anxiety? 0, Allah! Show mercy and give some glad tidings.' Then she prayed in a lou l voice thus, '0 Allah! So far the matter between me and Thee has been a secret. Now people have come to know of it. 0, Allah! Call me back.' After saying this, she cried c l ~ u d and died on the spot.\" story -VI A similar thing happened with Sirri (Rahmatuliah alaih). He writes: \"I bought a slave woman to attend on me. 78 79 Virtues of Salaat poor boy could place his trust in Allah so much, we must as well do so in a greater degree. He, therefore, left the fish there and took me to the musjid. When we three returned after saying salaat, we found the fish lying in the same place as we had left it. The boy then carried it to our house. My father related the strange story to my mother who in- sisted that the boy should be invited to eat some fish with us, When the invitation was extended to him, he said, 'Excuse me I am fasting.' My father then requested him to have iftaar at our place. To this he said, 'It is not possible for me to return once I am gone. Just possibly, I may stay in a musjid close to your place; if so, then I shall join you in your dinner.' Saying this he went to the musjid and re- turned after Maghrib. When the dinner was over, I showed him the room where he could rest in privacy. Now, there lived a crippled woman in our neighbourhood. We were surprised to see her walking quite hale and hearty. When we enquired from her how she got cured, she said, 'I prayed to Allah to heal me for the sake of the blessings that your guest carries. No sooner I prayed than I was healed.' When we went to find the boy in the room where we had left him, the door was shut and the boy was nowhere to be seen.\" story -1X It is said of a pious man that once he had a sore on his foot. According to the opinion of the surgeons, if his foot was not amputated, the sore might prove fatal. His mother proposed that the operation should be done while he was absorbed in his salaat. This was done, and no pain was felt by him. Abu 'Aamir (Rahmatullah alaih) says, \"I saw a slave woman on sale for a very small sum. She was very ema- ciated and her hair was dirty. I took pity on her and pur- chased her. I said to her, 'Come, woman, let us go and make purchases for Ramadhaan.' She remarked, 'Alhamdu- lillah, all the months are alike for me.' She fasted on all days and stood in salaat for all nights. When Eid drew near, I said to her, 'Woman! You will go with me tomorrow to make purchases for Eid. She remarked, 'My master! You are too much absorbed in this world.' She then went into 80 81 Virtues of Salaat promise of liberty.\" Umar bin Abdul Aziz (Rahmatullah alaih) took those dinaars from the slave and deposited them in the Baitul Maal, and advised him to run away to some distant place where he could not be seized. Just before his death, Muslimah (Rahmatullah alaih) came to him and said, \"Nobody has ever treated his chil- dren as you are doing. None of your thirteen sons has any- thing to live on.\" He sat up in his bed and said, 'I have not held back from my sons what they were entitled to. I have, of course, refused them what was actually due to others. If my sons are righteous, then Allah will surely be their guardian as He has said in His Book: He is the guardian of the righteous (VII:196)', but if they are wrong-doers, then why should I care for them?\" Story -XI1 Muhammad bin Mu.nkadir (Rahmatullah alaih) was a Hafiz of Hadith. One night, he wept excessively in his Ta- hajjud. When someone inquired about it, he said, \"During Qiraat, I came across the following words of the Qur'an: \"And the evils that they earned will confront them; and they will be surrounded by what they used to scoff at.\" (XXXIX: 48) He was very anxious and worried at the time of his death, and said that these same words of the Qur'an were looming before him. Story -XI11 Thaabit Banaani (Rahmatullah alaih) is another Hafiz of Hadith. He used to cry a great deal while supplicating before Allah. Someone warned him that he would lose his eyesight if he did not stop weeping like that. He replied to him, \"What use sre these eyes if these do not weep before Allah.\" He used to ask in his prayer, \"0, Allah! Permit ms to offer my salaat in my grave, if ever you grant this privilege to any of Thy slaves!\" Abu Sanaan (Rahmatullah alaih) nar- rates, \"By Allah! I was among those present at the burial of Thaabit Banaani. Just after he had been placed in his grave, one of the bricks from the side fell off. I peeped into the pit to find to my great amazement, that Thaabit was offering Virtues of Salaat parallel. Once while in salaat, he was stung on his forehead by a wasp and though blood came out, neither did he stir nor did he allow it to disturb his devotion in salaat. It is said that in salaat, he stood motionless like a stick planted in the ground. 6. It is reported about Baqi bin Mukhallid (Rahmatul- lah alaih) that he used to recite the complete Qur'an every night in thirteen rakaats of Tahajjud and Witr. 7. Hannaad (Rahmatullah alaih) is a Muhaddith. One of his pupils narrates, \"Hannaad used to weep very much. One day after he had finished our lesson in the morning, he continued to offer nafl salaat till midday. He went to his place for a short interval and then returned for his Zuhr. He again engaged himself in nafl salaat till Asr. Between Asr and Maghrib, he recited the Qur'an. I left him after Maghrib. I said to one of his neighbours, 'Our Shaikh prays so much. It is really wonderful.' He said, \"He had been doing this for the last seventy years. You will wonder still more if you see his prayers during the night.\" 8. Masrooq (Rahmatullah alaih) is another Muhad- dith. His wife narrates, \"He used to offer such long rakaats that his legs would get swollen and I sat behind weeping in pity for him.\" 9. Abu Itaab Sulami (Rahmatullah alaih) is reported to have been fasting during the day and weeping during the night for full forty years. 10. It is said about .a Sayyid that continuously for twelve days he has been offering his salaat with the same wudhu. For fifteen years, his back had not touched the bed. He would also gc without food for days together. Eesides the above, there are numerous records of the pious pursuits of the heroes of Islamic History. It is diffi- cult to cover all of them in this book. All that has been said here is sufficient to serve as examples. May Allah, thrpugh His Grace, grant me and the readers of this book the sirength to follow in the footsteps of these blessed people! Aameen! QUOTATIONS FROM HADITH Hadhrat Ammar bin Yaasir (Radhiyallaho anho) nar- rates that he heard the Prophet (Sallallaho alaihe wa- sallam) saying: \"When a person finishes his salaat, he gets one tenth, one ninth, one eighth, one seventh, one sixth, one fifth, one fourth, one third or one half of the maximum reward (according to the quality of salaat performed by him). \" This shows that the reward is given in proportion to the sincerity and devotion with which salaat is performed. So much so, that some get only one tenth of the total reward. There are others who get a reward ranging from one tenth to one half of the maximum. It is also correct to say that there are some who receive the reward in full and there are others who get no reward at all. It is stated in a hadith that Allah has a standard for fardh salaat. An account is kept of the measure by which a salaat falls short of that standard. It is said in the hadith that devotion in salaat .will be the first thing to be taken away from the world. A time will come when not a single person in the whole congregation will offer his salaat with proper devotion. 84 Virtues of Salaat Part 111 (c)-Quotations from Ahadith 8 7 86 I Virtues of Salaat eminent. No doubt it is enough to offer fardh salaat prop- erly, but is it so easy to observe it to the proper standard? Most probably, there will always be some deficiency in one respect or the other, and there is no way out to make up that deficiency except through nafl salaat. There is another hadith which deals with this point more elaborately. It declares, \"Salaat is the foremost duty enjoined by Allah and the first thing to be presented before Allah, and the first thing to be reckoned for on the Day of Judgement. If the fardh salaat is found wanting in quality, then its deficiency will be made good through nafl salaat. The fasts of Ramadhaan will be the next to be reckoned for and any deficiency therein will be made good through nafl Fasts. Then Zakaat shall be reckoned for in a similar manner. If after adding nafl the good deeds are found heavier in the scales, the person concerned shall be sent to Paradise, otherwise he shall meet his doom in Hell.\" Such was the practice of the Prophet (Sallallaho alaihe wasal- lam) that when anybody embraced Islaam at his hand, the first thing he taught him was salaat. Hadhrat Abdullah bin Qurt (Radhiyallaho anho) nar- rates that he heard the Prophet (Sallallaho alaihe wa- sallam) saying \"Salaat will be the first thing to be reckoned for on the Day of Judgement. If this is found satisfactory, then the rest of the deeds will also come out as such. If this is not so, then the remaining deeds are sure to be found wanting. Hadhrat Umar (Radhiyallaho anho) during his cali- phate had issued a proclamation to all the officers under him saying, \"I regard salaat as the most important duty. A peran who ensures salaat is likely to observe other injuc- tions of Islam as well; but if he discards salaat, he will more easily damage the rest of Islaam.\" The above saying of the Prophet (Sallallaho alaihe wa- sallam) and the proclamation of Hazrat Umar (Radhiyal- laho anho) are also corroborated by. another hadith, \"Satan is scared of a Muslim so long as he is mindful of his salaat; but no sooner he neglects the salaat than Satan descends on him and becomes hopeful of leading him astray, and then he can easily be lured to commit more serious wrongs and major sins. This is exactly what is meant by Almighty Allah when He says, \"Lo! salaat preserveth from lewdness and inequity\" Ir (XXIX:45) : 3 Hadhrat Abdullah bin Abu Qataadah (Radhiyallaho anho) narrates, \"The Holy Prophet (Sallallaho alaihe wasallam) once said, 'The worst thief is one who steals from his salaat.' The companions inquired, 'How can one steal from his salaat? 0, Prophet of Allah!' He re- plied, 'When one does not do his ruku and sajdah properly.' There are many other Ahaadith conveying the same meaning. Stealing is a very disgraceful act and a thief is de- spised by everybody. What about a person who is declared, 'the worst thief', by no less a person than the Prophet him- self? Hadhrat Abu Darda (Radiyallaho anho) narrates, \"Once the Prophet (Sallallaho alaihe wasallam) looked up towards the sky and said, 'The knowledge of Deen is soon to be taken away from this world.' Ziyaad (Radhiyallaho anho), who was also present there inquired, 'How can the knowl- edge of Deen be taken way, 0 , Prophet of Allah (Sallallaho alaihe wasallam), when we are teaching the Qur'an to our children and this process will continue in our posterity?' The Prophet (Sallallaho alaihe wasallam) said to him, 'Ziyaad! I always took you to be an intelligent person. Don't you see that the Jews and the Christians are also teaching their Bibles to their children? Has this prevented 88 89 Virtues of Sdaat their deterioration?\" One of Hadhrat Abu Darda's (Rad- hiyallaho anho) pupils says.\"After hearing this hadith from Hadhrat Abu Darda (Radhiyallaho anha), I went to Hadhrat Ubaadah (Radhiyallaho anho) and related the hadith to him.\" He said, \"Abu Darda (Radhiyallaho anho) is quite right. May I tell you the first thing that will be taken away from this world? It is devotion in salaat. You will see that not a single person in the full congregation is saying his salaat with devotion.\" Hadhrat Huzaifah (Radhiyallaho anho), the confidante of the Prophet (Sallallaho alaihe wa- sallam), was also heard saying, \"Devotion in salaat shall be the first thing to disappear.\" It is said in a hadith, \"Allah does not pay any attention to that salaat with which ruku and sajdah are not per- formed properly.\" Another hadith says, \"A person has been offering salaat for sixty years, but in fact not a single salaat of his is accepted by Allah. This is because he has been careless about his ruku in some salaats and about his sajdah in others.\" A great stress is laid on the proper performance of salaat in the famous Epistles of Shaikh Ahmad Sirhindi (Rahmatullah alaih). His discourses on the subject cover a good portion of the Epistles. In one of them he writes, \"It is necessary adong other things that we should be particular about keeping the fingers of our hands together while in sajdah and separated while in ruku. These regulations are not without a purpose.\" He further writes, \"To keep our glance at the place of sajdah while standing, on our feet while in ruku, on our nose while in sajdah, and on our hands while in Qa'dah, goes a long way in keeping the de- sired concentration in salaat.\" When such ordinary regu- lations, which are only mustahab, increase the value of our salaat, you can well imagine how much benefit we shall derive if we be particular of other regulations, which are either sunnat or otherwise more important. I Part 111 (c)-Quotations from Ahadith gJ, eu>,!'&,& d,$&, h.& ;d 3$,&jGq s . I , . . . ..* w j! y'i\" Lj?b y 6Ljl +I *#I Hadhrat Umme Roomaan (wife of Abu Bakr) (Radhiyal- laho anha) narrates, \"Once I was offering my salaat, when I unknowingly started leaning sometimes to one side and sometimes to the other. Hadhrat Abu Bakr (Radhiyallaho anho) saw me doing this and repri- manded me so harshly that I was about to abandon my salaat with fear. He told me later that he had heard the Prophet (Sallallaho alaihe wasallam) saying, \"When a person stands for salaat, he should keep his body at rest and he should not behave like the Jews, since to remain motionless is one of the complements of salaat.\" Keeping the body at rest during salaat is enjoined in many ahaadith. In the beginning, it was a habit with the Prophet (Sallallaho alaihe wasallam) that he kept looking towards the heaven in expectation of Hadhrat Jibra-eel (Alayhis salaam) to bring him some revelation, so much so that his eyes would sometimes rise up unconsciously even during salaat. When the first two verses of Soorah XXIII (viz., (Successful indeed are the believers who are humble in their salaat) were revealed, he began to keep his gaze down while in salaat. It is also said about the companions that in the beginning they would sometime cast their glances here and there during their salaat but, after these verses were re- vealed, they gave up this practice. Explaining these verses, Hadhrat Abdullah bin Umar (Radhiyallaho anho) says, \"When the Sahabah stood for salaat they never looked this side or that side. They remained attentive in salaat with their eyes fixed at the place of sajdah, totally absorbed in Allah, their Lord. Someone inquired from Hadhrat Ali (Radhiyallaho anho), 'What is devotion?' He replied, 'Con- centration in salaat is included in devotion.\" Hadhrat Ibn Abbas (Radhiyallaho anho) says, \"Humble' (mentioned in the above verses) are those who fear Allah and remain motionless in salaat.\" Hadhrat Abu Bakr (Radhiyallaho anho) narrates, \"Once 90 Virtues of Sdaat 92 Virtues of Salaat Hadhrat Jabir (Radhiyallaho anha) narrates that he heard the Prophet (Sallallaho alaihe wasallam) saying, \"The best salaat is one with prolonged rakaats.\" Muja- hid while explaning the verse \"And stand up with Qunoot to Allah (ii-238)\" says Qunoot comprises all such things as proper bowing, devotion, long rakaat, keeping the eyes down, lowering of shoulders in submission and fear of Allah. When- ever a companion of the Holy Prophet (Sallallaho alaihe wasallam) stood for salaat, he would not look here and there or level the pebbles at the place of sajdah (while prostrating) or engage himself in any absurd act, or think of any worldly thing (except unin- tentionally), all for fear of Allah.\" Many interpretations have been given to the word Qunoot, which occurs in the Qur'an in the verse mentioned in this hadith. According to one of the interpretations, Qunoot means silence. In the beginning of Islam, it was permissible to talk or to return greetings during salaat, but when this verse was revealed, talking during salaat was ab- solutely forbidden. Hadhrat Ibn Mas'ood' (Radhiyallaho anho) says, \"In the beginning whenever I visited the Prophet (Sallallaho alaihe wasallam), I would greet him with 'Assalamu alaikum' and he would reply with 'Wa alaikumus salaam' even if he were engaged in salaat. Once I visited him while he was in salaat and greeted him as usual, but he did not reply. I grew very anxious, fearing 94 95 Virtues of Salaat It is reported in many ahaadith that the Prophet's (Sal- lallah alaihi wasallam) feet would get swollen on account of standing for long hours during Tahajjud. Out of mere kindness and affection for his followers, he, however, ad- vised them to be moderate in their worship, lest any ex- cessiveness should lead to deflection. That is why we find him forbidding a woman from tying herself up for avoiding sleep during salaat. We should remember that a salaat with long rakaat is surely better and more valuable, provided the endurance limits are not exceeded. After all, there is some meaning in the Prophet's (Sallallaho alaihe wasallam) offering such lengthy salaat that would give him swollen feet. When the companions requested him to reduce his toil in worship, as he had been assured of forgiveness in Soorah Fath: [That Allah may forgive thee of thy sins that which is past and that which is to come (XLVIII:Z), he used to say, \"Why should I not, then, be a grateful slave of Allah?\" It is stated in a hadith that when, the Prophet (Sallal- laho alaihe wasallam) offered his salaat, his bosom would give a constant groaning sound, which resembled that of a grinding mill. In another hadith, this sound is likened to that of a boiling kettle. Hadhrat Ali (Radhiyallaho anho) narrates, \"On the eve of Badr, I noticed that the Prophet (Sallallaho alaihe wasallam) stood under a tree, busy in salaat and crying before Allah all night long till daybreak.\" It is said in a number of ahaadith, \"Allah is very much pleased with certain persons one of them is he who for- sakes his bed shared with his dear and lovely wife and en- gages himself in Tahajjud on a winter night. Allah is very much pleased with him, takes pride in him, and in spite of being All-knowing inquires from the angels, 'What made this slave of mine forsake his bed and stand up like this?' The Angels reply, 'The hope of winning Thy Bounty and Grace, and the fear of Thy displeasure.' At this Allah says, 'Listen, I bestow upon him what he hopes for and grant him refuge from what he is afraid of.\" The Prophet (Sallallaho alaihe wasallam) says, \"None receives a better reward from Allah more than he who is blessed to offer two 'rakaats of salaat.\" It has often been mentioned in the Qur'an and ahaa- dith that the Angels are perpetually engaged in worship. Virtues of Salaat (c) According to the Sunnat, e.g. the ankles should not be covered. (d) Simple, and should not display vanity and pride. 4. Time: We should be: (a) Able to tell correct time at any moment. (b) Always watchful about Azaan. (c) Particular about the time of salaat, lest we should be too late for it. 5. Qiblah: There are three things to be ensured in facing Qiblah: (a) We must face Qiblah physically. (b) Have the heart in union with Allah, for He is the Qiblah of the heart. (c) Be as attentive as a slave is before his master. 6. Intention: For this we need to be particular about three things: (a) We must be definite as to what salaat we are offer- ing. (b) Remain constantly conscious of our presence before Allah, Who se6s us. (c) Have perfect faith that Allah know all that is in our hearts. 7. Takbeer Tahreemah: The essentials of 'Takbeer Tah- reemah' are: (a) TO pronounce the words correctly. (b) To raise both hands right up to the ears. This sig- nifies that we have severed our connection with all, except Allah. (c) To feel the greatness of Allah in our heart when we say Allaho Akbar. 8. Qiyaam: While in Qiyaam we should: (a) Keep our gaze at the place of sajdah. (b) Feel in our heart that we are standing before Allah. (c) Not think of anything else. 9. Qiraat: The essentials of Qiraat are: (a) To recite the Qur'an with Taj-weed. (b) 7'9 ponder on the meanings of what we recite. (c) To bind ourselves to what we recite. Part 1II (c)-Quotations from Ahadith 9 7 10. Ruku: The essentials of Ruku are: (a) To keep the back quite straight i.e. the whole body above the legs should be in one straight line. (b) To hold the knees firmly with fingers spread apart. (c) To recite Tasbeeh with humility and devotion. 11. Sajdah: The essentials of Sajdah are: (a) To place the hands flat and close to the ears. (b) To keep elbows raised above the g~ound. (c) To recite Tasbeeh with devotion. 12. Qa'dah: The essentials of Qa'dah are: (a) To sit up on the left foot, keeping the right one erect. (b) To recite Tashahhud with devotion, keeping the meaning in mind, for it contains greetings for the Prophet (Sallallaho alaihe wasallam) and prayer for the Muslim brethren. (c) To consider the concluding Salaam a definite greeting to the Angels as well as the people on the right and on the left. As has been said already, sincerity is the essence of all these points, which requires us: 1. To offer salaat with the sole purpose of pleasing Allah. 2. To understand that it is only through the grace and favour of Allah that we are able to offer salaat. 3. To hope for the reward promised by Allah. SIGNIFICANCE OF WORDING OF SALAAT Salaat is really a very blessed and auspicious observ- ance. Every word uttered in it is imbued with Allah's great- ness and sanctity. Thanaa, the opening prayer of salaat, contains extremely virtuous and devotional meaning viz: (I) Subhaanakallaahumma: 0, Allah! I praise Thy Sanc- tity. Thou art free from all blemishes. Thou art above anything that is not the best. (2) Wa biharndika: I praise Thy Glory. All vir- tues and beauties are admit- tedly for Thee and befit Thee. 98 Virtues of Salaat (3) Wa tabaarakasmuka: Thy name is blessed: and in fact so blessed that blesses everything over which it is mentioned. (4) IYa ta'ualaa jadduka: Thy eminence is most exalted. Thy magnificence is most sublime. (5) Wa Jaa iluaha ghairuk: There is no god save Thee. None has ever been and none shall ever be fit to be worshipped save Thee. Similary in ruku we recite \"Subhaana rabbiyal azeem.\" which means: \"My Magnificent and Almighty Allah is free from all blemishes. I express my humbleiiess and weakness before His Greatness by bowing my head before Him (for the bowing of head is the symbol of humbleness and submission, just as a stiff neck is the sign of haughtiness and pride). I submit before all Thy com- mandments and I take upon me Thy service. I am at Thy command. Thou art really very Great and I submit before Thy greatness.\" Similary in sajdah we express our submission before Allah the Highest, and declare Him above all defects. Our head, which is considered as the most superb part of our body along with our eyes, ears, nose and tongue, is placed on- ground before Him in the hope that He would show mercy and bestow His blessings on us. Standing with our hands folded before Him this was the first expression of our humbleness and submission. This was further aug- mented by the bending of our head in ruku and it reached its climax when we placed our head on the ground before Him. In fact the whole salaat is an indication of humble- ness and submission, and therefore a means of advance- ment and success in the world and in the hereafter. May Allah through His Kindness arouse me and all the Muslims to offer such a salaat. SALAAT OF FEW SAHAABAH, TAABI'EES AND SOOFIA It is said about Hadhrat Hasan (Radhiyallaho anho) that whenever he performed wudhu, his face grew pale. When someone inquired from him its cause, he replied. \"It Part 111 (c)-Quotations from Ahadith 99 is time to stand before the most Majestic and Irresistable Sovereign.\" On reaching the gate of the musjid he would say, \"0 Allah! Thy slave is at Thy door, 0, the most Benefi- cent! Here is a sinner before Thee: Thou hast enjoined upon the good amongst us to overlook the faults of the bad. 0 Allah, Thou art Good and I am bad So for the sake of all that is most beautiful in Thee, overlook all that is ugly in me. 0 , The most Bountiful.\" (I 0.4 He would then enter the musjid. 8 0 3 1 Zainul Aabideen (Rahmatullah alaih) used to offer one Zrij :j thousand rakaats of nafl salaat daily. He never missed his Tahajjud, whether in journey or at home. His face grew pale when he performed his wudhu and he would tremble when he stood in salaat. Somebody asked him the reason for that. He said, \"Don't you know before Whom I am going to stand?\" Once when he was engaged in salaat, a fire broke out in his house. He continued his salaat most calmly. When asked about it, he remarked, \"The fire of the hereafter kept me unmindful of the fire of this world.\" He once said, \"The pride of a proud person surprises me. The day before, he was a drop of a dirty fluid and tomorrow he will be carrion, and still he is proud.\" He used to say, \"It is strange that people do so much for the world, which is transitory, and do nothing for the hereafter, where they are to live for ever.\" He used to help the poor in the darkness of night, so that they should not even know who helped them. It came to light only after his death that no less than one hundred families were being supported by him. It is said about Hadhrat Ali (Radhiyallaho anho) that the colour of his face would change and he would tremble at the approach of the hour of salaat. On being asked by someone he said, \"This is the time for discharging the trust which the Heaven and the Earth and even the mountains were afraid to bear. I do not know if I shall be able to dis- charge it. \" It is said of Hadhrat Abdullah bin Abbas (Radhiyallaho anho) that, when he hea~d the Azaan, he wept so much that his shawl would get wet with his tears, his veins would swell and his eyes would become red. Somebody said to him, \"We do not see anything in the Azaan that should make you so nervous.\" He replied, \"If people understood what the mu'azzin announced t o them, they would give up 100 Virtues of Salaat --- - 102 103 Part 111 (c)-Quotations from Ahadith Virtues of Salaat It is said about Ali (Radhiyallaho anho) that whenever an arrow got stuck into his body (in a battle), this was drawn out during his salaat. Once he got an arrow stuck into his thigh. This could not be extracted, in spite of sev- eral efforts, due to severe pain felt by him. When he was busy in his nafl salaat and prostrate in sajdah, the people drew out the arrow with force. When he finished his salaat, he asked the people who had collected around him, \"Have you gathered to take out the arrow?\" When they told him that it was already taken out, he informed them that he had no feelin of pain during the extraction. ~ u s f i mbin Yasaar (Rahmatullah alaih), when he stood up for salaat, said to his family members, \"You may keep on talking; I shall not be aware of what you talk.\" It is said of Aamir bin Abdullah (Rahmatullah alaih) that he would not even hear the beating of a drum while in salaat, nor to speak of the talk of people around him. A person asked him, \"Are you conscious of anything while in salaat?\" He replied, \"Yes, I am conscious of the fact that I have to stand one day before Allah, whence I shall either be sent to Paradise or Hell.\" The person said, \"No, I do not mean that. Do you come to know of anything we talk around you?\" He replied, \"It is better that spears pass through my body rather than I grow conscious of your con- versation while I am in salaat.\" He used to say, \"My con- viction in the things of the Hereafter is so perfect that it is impossible for it to improve, even if I happen to see those things with my physical eves.\" A pious man was asked, \"Do you ever think of this world while you are in salaat?\" He replied, \"I never think of this world, either in salaat or out of it.\" Another such man was asked, \"Do you think of anything while in salaat?\" He replied, \"Is there anything more attractive than salaat itself to ihink of?\" In 'Bahiatun Nufoos' it is written about a Shaikh that he had eith& been offering fardh or nafl salaat or been ab- sorbed in Zikr without break, right from Zuhr to Fajr of the next day. After Fajr, while continuing Zih, he was over- owe red bv slumber, when immediately he recited Istigh- !aar and the following prayer: \"I seek refuge in Allah from the eye that does not get satiated with sleep.\" It is said about another Shaikh that he would go to bed and try to sleep. But when he failed in his attempt, he would rise up and engage himself in salaat and would say, \"0 Allah! Thou knowest very well that it is the fear of the Fire of Hell that has caused my sleep to disappear.'' There are so many stories about the pious people spending their nights praying in eagerness and love for Allah that these cannot possibly be covered in one book. We have in fact lost the taste for the pleasures of such pur- suits so much that we have begun to doubt the veracity of such facts. But these have been related so frequently and 3 - continuously that if we doubt them we can as well doubt history, for frequency and continuity in narration about an e m event vouch safe its correctness without dispute. 5 Again we see with our own eyes people spending the whole night (sometimes even standing) for witnessing a show in a cinema or a theatre. They neither get tired nor does sleep overpower them. When such impious deeds, if indulged in, have such an attraction, then what makes us doubt that the spiritual pursuits can be so attractive and tasteful, while persons partaking in them are spedally en- dowed with additional strength and endurance by Allah? The only reason for our doubt is our ignorance, which is like that of an immature child about the experiences of pu- berty. May Allah enable us to attain the heights where we may be able to taste the pleasures of His worship. AN IMPORTANT NOTE According to the Soofia, salaat is in fact a supplication to and speech with Allah, and therefore needs thorough concentration, In case of other observances, we need not be so attentive. For example, the essence of Zakaat is to spend money for the pleasure of Allah. Spending, in itself is so hard on a person that even if he does it inattentively he would feel the pinch of it. Similarly, fasting reciuires giving up eating and drinking and sexual satisfaction. All these re- strictions are realjy very hard, even if not observed by proper attention and devotion. On the other hand, Zikr and recitation of the Qur'an are the chief constituents of Salaat. If these are not done intelligently and attentively, they can make neither supplication nor speech. They are just like the ravings of a person in high fever. which do not require any conscious effort nor carry any meaning for the listener. It is therefore necessary that we should be completely at- i 1 04 Virtues of Salaat tentive when in salaat, otherwise our salaat will be like the talk of a person in his sleep, which carries no meaning for the listeners, nor any benefit accrues from it. In the same way, Allah pays no heed to a salaat that is offered inattenti- vely and without concentration. But even if our salaat is not up to the mark, as compared with that of the eminent people in the past, we should not give up the practice. It is absolutely incorrect to think that there is no use offering a salaat unless it is perfect. To offer an imperfect salaat is far better than to give it up completely, as this shall result in punishments of a very drastic nature in the Hereafter. A school of Ulama have declared that person to be a kaafir who intentionally discards salaat (as discussed in full in Chapter I). It is therefore imperative on all of us to make sincere and genuine efforts to do justice to our salaat and pray to Allah to grant us the ability to offer salaat similar to that of the eminent people in the past, so that we may have at least one salaat of that nature to our credit for presentation before Allah. In the end, it may be pointed out that the Muhaddi- theen are rather liberal in accepting the authenticity of the ahaadith relating to the rewards of different religious ob- servances. Ad for the stories about saints and pious people, these are a part of ordinary history and therefore on a dif- ferent footing. Virtues of ZIKR Translation of the Urdu book Faza'il-e-Zikr by Shaikhul Hadith Maulana Muhammad Zakariyya Kaandhlawi translated by Shafiq Ahmad VIRTUES OF ZIKR CONTENTS FOREWORD.. ................................... 11-12 CHAPTER I VIRTUES OF ZIKR IN GENERAL Hadith No: Page No. LI Section 1 Qur'anic Verses relating to Zikr . . . . . . . . 13-25 O pa EN Section 2 Ahaadith on Zikr ..................... 69 5 1. Allah's treatment is according to one's expecta- tions ....................................... 2. Advice to keep the tongue ever-busy in Zikr ..... 3. Zikr- the best of all deeds (by Allah) ........... 4. Constant Zikr-a means to elevation of status in Paradise .................................... 5. zaakir likened to the living, and the negligent to the dead .................................... 6. The superiority of Zikr over giving in charity . . . . 7. Inmates of Paradise regret the time not devoted to Zikr ..................................... 8. Allah's pleasure and His angels surround the zaakir; and Allah extolls them to His angels . . . . . 9. Allah takes pride in the groups of Muslims en- gaged in remembrance of Him ................. 10. Angel's announcement of reward for those gathered together for Zikr of Allah ............. 11. Efficacy of Zikr in avoiding the punishment of the grave ................................... 1 2 . Exaltation and facial brightness of the gathering for the Zikr of Allah .......................... 13. Gathering of Zikr described as gardens of Para- dise ........................................ 14. Zikr of Allah to compensate for a lack in spend- ingand labour in path of Allah ................ 15. Doing Zikr so much that people call you insane Hadith No: Page No. CHAPTER 11. VIRTUES OF KALIMAH TAYYABAH Section 1 Ayaat Implying the Kalimah Tayyibah 16. Seven persons, including the zaakir, under the Without mentioning it . . . . . . . . . . . . . . . . . . . . . . . 84-94 canopy of Allah's grace on the Day of Judge- ment . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 5 9 Section 2 Ayaat in Which the Kalimah Tayyibah 17. Those doing Zikr under all circumstances is Mentioned Wholly or in Part ................ 95-106 called forth as \"wise men\" on the Day of Judge- ment . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 6 1 Section 3 Ahaadith on Virtues and Blessings of 18. The Prophet (Sallallaho alaihe wasallam) di- Kalimah Tayyibah . . . . . . . . . . . . . . . . . . . . . . . . . .107-160 rected to sit with ascetic zaakireen . . . . . . . . . . . . . 6 5 19. Allah's promise to care for those who remem- Hadith No: Page No. ber Him after Fajr and Asr Salaat . . . . . . . . . . . . . . . 6 7 20. Everything of this world is accursed except the 1. Kalimah Tayyibah the best remembrance and Zikr of Allah . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 69 \"Alhamdulillaah\" the best supplication. ....... 2. Moosa (A.S.) told that 'Laa ilaaha illallaah' out- weighs the seven heavens and the earths. . . . . . . . 3. Sincere zaakir of 'Laa ilaaha illallaah' gains the Prophet's maximum intercession . . . . . . . . . . . . . . 4. Sincere zaakir of 'Laa ilaaha illallaah' to enter Paradise . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 5. Doors of Heavens opened for the reciter of 'Laa ilaaha illallaah' . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 6. Special announcement of Paradise for a gather- ing of Sahabah . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 7. Reward of Imaan by reciting 'Laa ilaaha illal- laah' . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 8. Frequent recitation of 'Laa ilaaha illallaah' before death . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 9. Sincere recitation of 'Laa ilaaha illallaah' re- deems from Hell . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 10. 'Laa ilaaha illallaahl-the keys to Paradise . . . . . . 11. Remission of sins through recitation of 'Laa ilaaha illallaah' . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 12. Trembling of the \"Pillar of Light\" on the recita- tion of 'Laa ilaaha illallaah' . . . . . . . . . . . . . . . . . . . , 13. Believer of 'Laa ilaaha illallaah' free from wor- ries in the grave and on the Day of Judgement . . . . 14. 'Laa ilaaha illallaah' is weightier than ninety nine registers of misdeeds . . . . . . . . . . . . . . . . . . . . 15. 'Laa ilaaha illallaah' weightier than all that is in the Heavens and the earth . . . . . . . . . . . . . . . . . . . . 16. 'Laa ilaaha illal1aah'-the weightiest testimony . . 17. 'Laa ilaaha illallaah' magnifies the good deeds of the Ummat . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 18. Inscription on the Gates of Paradise . . . . . . . . . . . . Hadith No: Page</p></div>",
+        "sections": [
+            [
+                30,
+                16494
+            ],
+            [
+                16494,
+                33158
+            ],
+            [
+                33158,
+                49625
+            ],
+            [
+                49625,
+                66223
+            ],
+            [
+                66223,
+                82660
+            ],
+            [
+                82660,
+                90851
+            ]
+        ]
+    },
+    {
+        "id": 30,
+        "bookId": 3,
+        "chapter": "Virtues of Tahajjud",
+        "title": "Content for Virtues of Tahajjud",
+        "preview": ". Reciter of 'Laa ilaaha illallaah' enters the Fort of Allah . . . ... . . . . . . . . . .. . . . . .. . . . . . . . . . . . . . 20. 'Laa ilaaha illal...",
+        "content": "<div class=\"story-content\"><p>. Reciter of 'Laa ilaaha illallaah' enters the Fort of Allah . . . ... . . . . . . . . . .. . . . . .. . . . . . . . . . . . . . 20. 'Laa ilaaha illallaah' the best Zikr, and Istigh- faar the best supplication . . . . . . . . . .. . . . . . . . . . . 21. Ruin of Satan through recitation of 'Laa ilaaha illallaah' and 'Istighfaar' . . . . . . . . . . . . . . . . . . . . . . 22. Sincere dying recitation of 'Laa ilaaha illallaah' ensures entry into Paradise . .. . . . . . . .. . . . . . . . . 23. Direct ascent to Allah of 'Laa ilaaha illaliaah' and a father's blessings (for his son) . . . . . . . . . . . . 24. Hell forbidden for the sincere reciter of 'Laa ilaaha illallaah' .. . . . . . . . . . . . .. . . . . . . . . . . . . . . 25. Recitation of 'Laa ilaaha illaliaah' by a dying person relieves the pangs of death and ensures entry into Paradise. ... . . . . . . . . . . .. . . . . . . .. . . . 26. Abu Bakr affirms that salvation lies in the Kali- tnah 'Laa ilaaha illallaah' . . . . . . . . . . . . . . . . . .. . . 27 Hadhrat Umar affirms that 'Laa ilaaha illallaah' is the best Kalimah of salvation and piety . . .. . . . 28. 'Laa ilaaha illallaah Muhammadur Rasulullah' written on the Arsh . . . . . . . . . . . . . . . . . . . . . . . . . . 29. 'Isme A'zam' identical with 'Laa ilaaha illal- laah' . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 30. Redemption from Hell of all those who have re- cited 'Laa ilaaha illallaah' or have an iota of Imaan ...................................... 31. The Prophet (Sallallaho alaihi wasallam) gives advice and instructions to a villager. . . . . . . . . . . . 32. Prophet (Sallallaho alaihi wasallam) tells Hadh- rat Abu Bakr that the recitation of Kalimah Tayyibah during lifetime demolishes sins . . . . . . 33. Recitation of 'Laa ilaaha illallaah' is the best of all deeds . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 34. A Kalimah which earns 40 000 virtues when re- cited ten times . . ... . . . . . . . . . . . . . . . . . . . . . . . . . 35. Special Kalimah which gets two million bles- sings for its reciter . . . . . . . . . .. . . . . . . . . . . . . . . . . 36. Supplication after wudhu that causes eight gates of Paradise to open . . . . . . . . . .. . . . . . .. . . . . 37. Reward for daily recitation of 'Laa ilaaha illal- laah' hundred times . . . . ... . . . . . . .. . . . . . . . . . . 38. Teaching 'Laa ilaaha illallaah' to children and persuation of its recitation on the death bed . . . . . Hadith No: Page<br><hr><br>. 'Laa ilaaha il-lallaah' removes all sins . . . . . . . . . . . 159 40. 'Laa ilaaha illallaah' is the most valuable of more than seventy branches of Imaan . .. . . . . . . . 160 CHAPTER I11 VIRTUES OF THIRD KALIMAH Section 1 Ayaat Mentioning the Third Kalimah viz Subhaanallaah ;ti iG ;t mi Alhamdulillaah , - Laa ilaaha illallaah 5, $1 i!g . . 3 i i Allaahu akbar . . . . . . . . . . . . . . . . . . . . . . . . . . . . . ,167-193 Section 2 Ahaadith on Virtues of the Words of Tasbeeh, 'Subhaanallaah', 'Alhamdulillaah', 'Laa ilaaha illallaah' and 'Allaahu akbar' . . . . . .194-236 Hadith No: Page<br><hr><br>. Two easy-to-utter Kalimahs that are most weighty in reward . . . . . . . . . . . . . . . . . . . . . . . . . . . 2. Two Kalimahs enjoined on the angels . . . . . . . . . . 3. The bounties of Allah will have to be ac- counted for on the Day of judgement and Zikr will help in this . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 4. Trees grow in the plains of paradise on recita- tion of the third Kalimah . . . . . . . . . . . . . . . . . . . . . 5. Reciting 'Subhaanallaahi wabihamdihi' makes up deficiencies in other deeds . . . . . . . . . . . . . . . . . 6. Four phrases most liked by Allah . . . . . . . . . . . . . . 7. The Prophet (Sallallaho alaihi wasallam) ad- vises recitation of 'Tasbeeh-e-Fatimah' to the destitute Muhajirin . . . . . . . . . . . . . . . . . . . . . . . . . . 8. Kalimahs that obtain forgiveness for countless sins (like the foam of the sea) . . . . . . . . . . . . . . . . . . 9. Reciter of 'Tasbeeh-e-Fatimah' is not disap- pointed . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 10. Three Kalimahs, each of which is equivalent in virtue to Mount Uhud . . . . . . . . . . . . . . . . . . . . . . . . 11. Five things that are very weighty near Allah . . . . . 12. Prophet Nooh's (Alayhis salaam) advice to his son . . . . . . . . . . . . . . . . . . . . . . . . \" ' ? \" \" ' 13. Rasulullah (Sallallaho alaihe wasallamj's advice to an elderly woman to recite three most rewarding Kalimahs . . . . . . . . . . . . . . . . . . 14. Angels surround thc (blessed) assemk~lies for Zikr . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 15. Reward of ten blessings for each letter of third Kalimahs . . . . . . . . . . . . . . . . . . . . . . . . . . . . 16. Prayer for atonement of adverse conse- quences of a meeting . . . . . . . . . . . . . . . . . . . . . . . 17. Third Kalimah circulates round the throne of Allah . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 18. Merit of counting the Tasbeeh on fingers. . . . . . 19. A valuable form of Tasbeeh taught to Hazrat Juwayriah . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 20. Tasbeeh-e-Fatimah better than a servant. . . . . . EPILOGUE: Virtues of 'Salaatut Tasbeeh' and method of performing it . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 219 221 222 223 228 232 c\" 0 V) L, 237-245 Z N 2 2 5 THE VIRTUES OF ZIKR FOREWORD IN THE NAME OF ALLAH, THE MOST GRACIOUS, THE MOST MERCIFUL The sacred name of Almighty Allah carries the bles- sings, taste, sweetness, thrill, and peace of mind that is in- variably experienced by one who has practised and remained absorbed in His zikr for a considerable time. This name brings joy to the heart and peace of mind. Almighty Allah has said Himself: \"Lo! the zikr of Allah provides satisfaction for the hearts.\" Today there is a wave of discontentment in the whole world; and the letters that I receive daily contain mostly ac- counts of worries and anxieties. The object of this booklet is that people who lack peace of mind, whether in an indi- vidual or collective capacity, may be told how to overcome their malady and that the good and blessed persons may be benefitted by the general publication of the virtues of zikr of Almighty Allah. It is just possible that the study of this booklet may inspire some people to recite the sacred name of Allah with sincerity (ikhlaas) and this may prove useful to me (also) at the time when only good deeds will prove helpful. Of course, Almighty Allah can, through His sheer grace, forgive one who has no good deeds to his credit. Besides this, the thing which prompted me to this undertaking was that Almighty Allah, through His extreme Benevolence and Grace has blessed my uncle, Hazrat Mu- hammad Ilyas Kandhlavi, who resides in Nizamuddin (Delhi) with a special insight and zeal for the work of Ta- bleegh, the activities of which are no longer confineti to India alone, but have reached Hijaaz as well. This move- = 8 5 KI 5 12 Virtues of Zikr 32 ment is well known and needs no introduction. Its good re- sults soon began to be visible in India and abroad generally, but especially so in the region of Mewat, as is well-known. The fundamental principles of this movement are basically very sound, good and strong, and are inhe- rently fruitful and bedicial. One 'of the important prin- ciples is that those who are engaged in Tableegh work should be particular in practising zikr, and more so when they are actually busy in Tabligh work. After observing the wonderful results of this practice, I myself felt the neces- sity of writing this booklet. I was also ordered by my re- spected uncle that the virtues of zikr of Allah should be compiled and made available to them, so that those who so far practise it out of obedience to Allah may themselves feel an urge for doing so for the sake of its virtues, and thereby realise that zikr is a great wealth. It is neither possible for a humble person like myself to compile a comprehensive treatise on the virtues of zikr, nor is it humanly possible to do full justice to this subject. I have however briefly described some narrations relating to this subject. I have divided the book into three chapters, of which the virtues of zikr in general are described in the first chapter, those of Kalimah Tayyibah in the second and those of the third Kalimah (known as Tasbeeh-Fatimah) in the third. CHAPTER I VIRTUES OF ZIKR IN GENERAL Even if there were no ayat or hadith relating to zikr, we should not have forgotten to remember our real Benefactor, Whose blessings and favours on us at all times are unlimi- ted, and have no parallel. It is but natural that we should remember our Benefactor, perform His zikr (remember Him) and thank Him. Countless virtues of zikr are de- scribed in the Qur'an and.Ahaadith, and the sayings and deeds of our elders in support thereof are available for our benefit. No doubt, the blessings of the glorious zikr of Allah are unlimited and its effulgence is so sublime. Here, I first describe a few ayaat (Verses from the Holy Qur'an) and then some ahaadith on the subject of His glorious zikr. SECTION 1 Quranic Verses relating Zikr 0 8 s 4 E N 5 1. Therefore remember Me, I will remember you. Give thanks to Me and reject not Me. 1 2. When (during the Hajj) ye pass on in the multitude from Arafaat, remember Allah by the sacred monument. Remember Him as He hath guided you, although before this ye were of those gone astray. 14 15 Virtues of Zikr 3. And when ye have completed your Hajj rites, then remember Allah as ye remember your fathers, or with a more lively remembrance. There are men who say, \"Our Creator! Give unto us, Your bounties in this world,\" but they will have no portion in the Hereafter.\" There are men (also) who say, \"Our Creator! Give unto us in the world that which is good and in the Hereafter that which is good, and guard us from the doom of Fire.\" For them, there is in store a goodly portion (in both worlds) out of that which they have earned. Allah is swift at reckon- ing. It is related in a hadith that the du'aa of three persons is not rejected rather it is surely accepted. (1) He who re- members Allah profusely (2) A wronged person (3) A ruler who avoids tyranny. 4. (During the Hajj) remember Allah all through the ap- pointed days. ( t bw Ji) Jqi~j . - p\\ g, is aj $ii\\j ( 0 ) 5. Remember thy Lord much, and praise Him in the early hours of night and morning. - 6. (Talking of the wise men, these are) such as remem- ber Allah, standing, sitting, and reclining, and consider the creation of the Heavens and the Earth, and say, (after delib- eration) \"Our Lord! Thou has not created this in vain. Glory be to Thee! Preserve us from the doom of the Fire.\" 7. When ve have performed the act of salaat, remember Allah, standing, sitting and reclining (We should remember Him in all circumstances.) . (The hypocrites) when they stand up to worship, they perform it languidly and to be seen by men, and are mindful of Allah but little. 9. Satan seeketh only to cast among you enmity and hatred by means of strong drink and games of chance, and to turn you from remembrance of Allah, and from His worship. Will ye then leave off (these bad habits)? 8 5 EG s (lt ej bjd,$ @!j gj&b gj b+& 541 ?Wj (1.1 10. Send not away those who call their Lord at morn- ing and evening, seeking His countenance (pleasure). 11. And call upon Him, making your devotion purely for Him (only). 12. Call upon your Lord humbly and in secret. Lo! He loveth not transgressors. Work not confusion in the Earth after the fair ordering thereof, and call on Him in fear and hope. Lo! The mercy of Allah is nigh unto the good. 13. Allah's are the fairest names. Invoke Him by them. 16 17 Virtues of Zikr 14. And remember thy Lord within thyself humbly and with awe, below thy breath, at morn and evening. And be thou not of the neglectful. 15. \"They only are the (true) believers whose hearts feel a tremor when Allah is mentioned, and when the rev- elations of Allah are recited unto them, they find their faith strengthened, and who trust in their Lord. Thereafter men- tioning the observance of salaat by them it is stated \"Such in truth are the believers, they shall enjoy dignified pos- itions with their Lord and blessed with His forgiveness and generous sustenance.\" 16. And He guideth unto Himself all who turn to Him in penitence: who have believed and whose hearts find sat- isfaction in the remembrance of Allah. Verily in the re- membrance of Allah do hearts rest content! 17. Say (unto mankind): call upon Allah, or call upon the Beneficient. By whatever name you call upon Him, it is well. His are the most beautiful names. . And remember thy Lord when thou forgettest. 19. Restrain thyself along with those who call upon their Lord at morning and evening, seeking His pleasure; and let not thine eyes ovedook them, desiring the pomp of this worldly life; and obey not him whose heart We have made heedless of Our remembrance, who followeth his own lust and whose case has gone beyond all bounds. 20. On that day, We shall present Hell to the disbe- lievers, plain to view; those whose eyes had been under a veil from remembrance of Me. 21. A mention of the mercy of thy Lord unto His ser- vant Zakariyya; when he cried unto his Lord a cry in secret. 22. And I shall pray unto my Lord. It may be (and I have every hope), that with prayer unto my Lord, I shall not be unblest. 23. Lo! I, even I, am Allah. There is no God save Me. So serve Me and establish salaat for My remembrance. Lo! 18 19 Virtues of Zikr the Hour is surely coming. But I will keep it hidden, that every soul may be rewarded for that which it striveth to achieve. (t, - L) if$$$ ( Y t ) y Y, 24. And be not faint in remembrance of Me. (This is a piece of advice for Prophet Moosa and Haroon (Alayhimas salaam). 25. And (mention) Nooh, (Alayhis salaam) when he cried of old; We heard his prayer (before times of Ibrahim [Alayhis salaam) 26. And (mention) Ayyoob (Alayhis salaam) when he cried unto his Lord, \"Lo! adversity afflicteth me, and Thou are Most Merciful of all who show mercy. 27. And Zun-Noon Younus (Alayhis salaam) when he went off in anger (displeased with his community) and deemed that We had no power over him; but he cried out in the darkness' (of the whale) saying \"There is no God save Thee: be Thou glorified! Lo! I have been a wrong-doer.\" 28. And (mention) Zakariyya (Alayhis salaam) when he cried unto his Lord, \"My Lord! Leave me not childless, though Thou art the best of inheritors.\" . Lo! they (the Prophets mentioned before) used to vie one with the other in good deeds, and they cried unto Us in longing and in fear, and were submissive to Us. 30. And give good tidings to the humble: whose hearts fear when Allah is mentioned. 31. (While talking to the unbeliever on the Day of m L Sk? Judgement, they will be asked whether they remember) Lo! EN There was a party of My servants who said, \"Our Lord! we believe, therefore forgive us and have mercy on us, for Thou art best of all who show mercy.\" But ye chose them for a laughing-stock, until this (past time) caused you to forget remembrance of Me, while ye laughed at them. Lo! I have rewarded them this day for as much as they were steadfast; and they verily are the tri- umphant. 32. (While praising men with perfect faith) Men whom neither merchandise nor sale beguileth from remembrance of Allah and constancy in prayer and paying to the poor their due. ( t o G . , $i ;%I $$, (YY) 33. But verily, remembrance of Allah is the most im- portant. ,j \\*tg, +** *j G*&, +\\y\\ 2 b + J ~ I \\;g Y J JJ +?! (yq) ( r y s k i ) &l; 20 Virtues of Zikr 34. (Those) who forsake their beds to call upon their Lord in fear and hope, and spend of what We have be- stowed on them. No soul knoweth what joy is kept hidden for them as a reward for what they used to do. Note: It is mentioned in a hadith that one who prays to Allah in the last portion of the night gains acceptance of Allah. If possible, you should remember Allah at this hour. 35. Verily in the messenger of Allah ye have a good ex- ample for him who looketh unto Allah and the Last Day, and remembreth Allah much. 36. (While talking of the virtues of the believers) And men who remember Allah much and women who remem- ber; Allah hath prepared for them His forgiveness and a vast reward. 37. 0 ye who believe! Remember Allah with much re- membrance. And glorify Him morning and evening. 38. And Nooh (Alayhis salaam) verily prayed unto Us, and We are the best Who grant prayers. 39. Then woe unto those whose hearts are hardened against remembrance of Allah. Such are clearly in error. 1 40. Allah hath (now) revealed the most beautiful mes- sage of the Qur'an, a Scripture consistent with itself, re- peating (its teaching in various aspects). Whereat doth tremble the skins of those who fear their Lord, so that their flesh and their hearts soften to Allah's remembrance. Such is Allah's guidance, wherewith be guideth whom He will. V) L 41. Therefore pray unto Allah, making devotion pure EN 82 for Him (only), however much the disbelievers may be y averse. 42. He is the Living One, there is no Allah save Him. So pray unto Him, making devotion pure for Him (only). 43. And he whose sight is dim to the remembrance of the Beneficent, We assign unto him a devil who becometh his comrcde. 44. Muhammad (Sallallaho alaihe wasallam) is the messenger of Allah. And those with him are hard against 23 2 2 Virtues of Zikr the disbelievers and merciful among themselves. Thou seest them bowing and falling prostrate (in worship), seek- ing bounty from Allah and His acceptance. Their mark is on their foreheads from the traces of prostration. Such is their likeness in the Torah and their likeness in the (20s- pel-like sown corn that sendeth forth its shoot (lnd strengtheneth it and riseth firm upon its stalk, delighting the farmers-In the same manner, the Companions of the Prophet (Sallallaho alaihe wasallam) were weak in the be- ginning then grew in strength day by day, that He may enrage the disbelievers with (the sight of) them. Allah hath promised, unto such of them as believe and do good works, forgiveness and immense reward. COMMENTARY In these verses though the emphasis obviously is on the blessings occurrirlg from ruku, sujood and salaat but there is also an indication about the blessings associated with the second part of the Kalimah viz. (Muhammadur Rasulullah). Imam Raazi (Rahmatullah alaih) has related that in the treaty of Hudaibiyah, on the refusal and insistence of the unbeliever not to write 'Muhammad Rasulullah' and to substitute it by 'Muhammad bin Abdullah', Allah Ta'aalaa asserts that He himself bears testimony to the Prophethood of Muhammad (Sallallaho alaihe wasallam). When the Sender confirms personally about a particular person to be His messenger, then the non-acceptance by any number of people does not matter. To confirm this testimony, Allah Ta'aalaa made the statement 'Muhammadur Rasulullah' (Muhammad is a Prophet of Allah). There are other important subjects in these verses. One of them relates to the glow on the face of a blessed person. It has been explained that a person who keeps a vigil at night for prayers develops such a glow on his face. Imaam Raazi (Rahmatullah alaih) considers it an established fact that if two persorls keep awake at night, one spending it in sensual and idle pleasures and the other uses his time in reciting the Qur'an, learning religious knowledge and offer- ing pravers, thev will get up with different facial express- ions the next morning. The latter described above will be because of his spiritual glow, will show himself quite a dif- ferent person. . Is not the time ripe for the hearts of those who be- lieve to submit to Allah's reminder? (r v, L 46. (Mentioning of the hypocrites.) The devil hath en- 0 grossed them and so hath caused them to forget remem- 4s brance of Allah. They are the devil's party. Lo! is it not the 5 devil's party who will be the losers? 47. And when the (Friday) prayer is ended, then dis- perse in the land and seek of Allah's bounty, (with the per- mission to engage yourself in worldly pursuits but even then) and remember Allah much, that ye may be success- ful. 48. 0 ye who believe! Let not your wealth nor your children distract you from remembrance of Allah. Those who do so, they are the losers. (These things will not last beyond the grave and Allah's remembrance will prove useful in the Hereafter. 24 Virtues of Zikr 49. And Lo! those who disbelieve would fain discon- cert thee with their eyes when they hear the message (the Qur'an) and they say, \"Lo! he is indeed mad.\" Note: Using the eyes in this manner indicates their ex- treme enmity. Hasan Basri (Rahmatullah alaih) advises benediction on a person, affected by malignant looks, after reciting this verse. 50. And whoso turneth away from the remembrance of His Lord; He will thrust him into ever-growing torment. 51. And when the devotee of Allah (Muhammad Sal- lallaho alaihe wasallam) stood up in prayer to Him, they crowded on him, almost stifling him. Say (unto them, 0 Muhammad), I pray unto Allah only, and ascribe to Him no partner. 52. So remember the name of thy Lord and devote thy- self to him with whole-hearted devotion. (All other attach- ments should be reversed at that time and devotion to Allah should dominate). 5 54. He is successful who purifieth himself (of evil manners) and remembereth the name of his Lord, so prayeth. 53. Remember the name of thy Lord at morning and evening; and worship Him (a portion) of the night, and glorify Him through long night in Tahajjud salaat. Lo! these eople who oppose you, love the fleeting life, and put gehind them (the remembrance of) a grievous day.</p></div>",
+        "sections": [
+            [
+                30,
+                16565
+            ],
+            [
+                16565,
+                21980
+            ]
+        ]
+    }
+]);
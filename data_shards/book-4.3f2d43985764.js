@@ -0,0 +1,103 @@
+// Fazail-e-Amaal Data Shard: book 4
+fazailData.stories.push(...[
+    {
+        "id": 31,
+        "bookId": 4,
+        "chapter": "Virtues of Zikr in General",
+        "title": "Content for Virtues of Zikr in General",
+        "preview": "Chapter 1 SECTION 2 AHAADITH ON ZIKR (REMEMBRANCE OF ALLAH) When the importance of zikr has been emphasised in so many verses of the Holy Qur'an, the ...",
+        "content": "<div class=\"story-content\"><p>Chapter 1 SECTION 2 AHAADITH ON ZIKR (REMEMBRANCE OF ALLAH) When the importance of zikr has been emphasised in so many verses of the Holy Qur'an, the number of ahaadith on this subject is naturally far too great; it is in proportion to the many voluminous books of ahaadith. The Holy Qur'an is one book of only 30 parts, but the books of ahaa- dith are many and each book contains a large number of ahaadith. For example, Bukhari Shareef alone consists of 30 voluminous parts, and similarly Abu Dawood Shareef has 32 parts. There is no book of ahaadith which does not contain several ahaadith on the subject of zikr, and it is, therefore impossible to quote all such ahaadith in this small booklet. Of course, a single verse of the Holy Qur'an or a hadith moves the faithful-to good actions, but volumes of books would not move an unwilling person, who is like an ass carrying a load of books. Hadith No 1 7 Hadhrat Abu Hurairah (Radhiyallaho anho) narrated that Rasulullah (Sallallaho alaihe wasallam) has said, \"Almighty Allah says, 'I treat my slave (man) accord- ing to his expectations from Me, and I am with him when he remembers Me, If he remembers Me in his heart, I remember him in My heart; if he remembers Me in a gathering, I remember him in a better and nobler gathering (i.e. of angels). If he comes closer to Me by one span, I go towards him a cubit's length, if he comes towards Me by a cubit's length, I go towards him an arm's length, and if he walks towards Me, I run unto him.\" Note: There are several points elaborated in this hadith. The first point is that Allah deals with a man according to his expectations from Him. One should there- .s fore always be hopeful of the mercy and benevolence of 9; Almighty Allah and never be despondent of His blessings. y N Certainly, we are extremely sinful and justly deserve pun- 5 ishment on account of our evil deeds, yet in no case should we feel despondent of the mercy of Allah, as He may per- haps totally forgive us. \"Lo! Allah forgiveth not if a artner be ascribed unto Him and forgiveth all save that to w \\ om He will.\" But Almighty Allah may or map ,not forgive; that is why the Ulama say that true belief lies in between hope (of forgiveness of Allah) and fear (of His wrath). The Holy Prophet (Sallallaho alaihe wasallam) once visited a young Sahabi, who was breathing his last, and asked him how he was feeling. He replied, \"O! Messenger of Allah, I am hope- ful of the mercy of Allah, and yet I am afraid of my sins.\" Thereupon the Holy Prophet (Sallallaho alaihe wasallam) said \"When the heart of a believer is filled with these two feelings of hope and fear, Almighty Allah fulfils his hope and saves him from what he is afraid of.\" It is mentioned in one hadith that a believer thinks of his sin, as if he is sitting under a huge rock that is threaten- ing to fall on him, while for a transgressor his sin is no more than a fly which is easily scared off, i.e., he takes his sins very lightly. In short, one should be appropriately afraid of ones sins, and at the same time remain hopeful of Allah's mercy. 28 Virtues of Zikr 33 Hadhrat Mu'aaz (Radhiyallaho anho) died of the plague and, in the moments of death's agony, he fainted many times. Whenever he regained consciousness for a moment, he would say, \"Oh Allah! Thou knowest that I love Thee. By Thy Honour and Glory, Thou knowest this very well.\" Just before breathing his last, he said, \"0 Death, you are a welcome guest but have come at a time when there is nothing in the .house to eat.\" Then he said, \"0 Allah! Thou knowest very well that I always feared Thee, and today I die hopeful of Thy forgiveness. 0 Allah! I en- joyed life, not in digging canals and planting gardens, but in remaining thirsty in the hot weather, in undergoing hardships for the sake of Islaam, and in taking part in the gatherings engaged in zikr under the supervision of the lama.\" Some Ulama have written that the fulfilment of expec- tations promised by Almighty Allah in the aforesaid hadith is in its most general sense. It carries assurance not only in respect of forgiveness but also in respect of prayers, health, wealth and safety. For instance when a person prays to Allah and sincerely believes that Allah shall accept his prayer, then his prayer is actually accepted, but if he has doubt (that his prayer would not be accepted), it is not ac- cepted. Thus, in another hadith it is stated that the prayer of a person is granted so long as he does not say that his prayer is not granted. The same is true in the case of all blessings relating to health, prosperity, etc. According to one hadith, if a destitute perssn discloses his hunger to everybody, he is not relieved of his poverty, but if ,he shows submission to Gracious Allah, his condition may soon change for the better. However, hoping for the better from Almighty Allah is one thing, and being over-confident of His help and forgiveness is another thing. Almighty Allah has warned us against such an attitude in several verses of the Holy Qur'an e.g. ij$\\ . A4 . $3 yj \"Let not the deceiver (the Satan) beguile you in regard to Allah\" i.e. one should not be misled by the devil to commit sins just because Allah is the most Merciful and the Forgiver\". There is another verse, * , * + J , * I ; J + ~ \\ $ \"Hath he knowledge of the Unseen, or hath he made a pact with the Beneficent. No, never.\" The second point in this hadith is \"Whenever a slave of mine remembers Me, I am with him.\" In another hadith, it is stated, \"So long as one's lips move in My remem- brance I remain with him\" i.e. Almighty Allah bestows His special care and mercy on him during all this time. The third point is that Almighty Allah mentions him with a favour to the angels, which signifies the value of zikr. Firstly, this is because Allah created man such that in- herently he is liable to be good as well as to go astray, as given below in Hadith<br><hr><br>. Submission on his part there- fore deserves special appreciation. Secondly, at the time of Aadam's creation, the Angels (who have no instinct for doing evil) could not understand the creation of man and had contended that he would cause blood-shed and trouble + O in the world, while they are always there to praise and glorify Almighty Allah. Thirdly, man's worship of Allah 13 5 and submission to His will is more commendable than that of the Angels, because he does so on account of his faith in the unseen which, however, is actually seen by the angels. It is to this fact that Allah refers in the Holy Book: \"How would man not have worshipped if he had actually seen the Paradise and the Hell.\" It is for this reason that Almighty Allah praises the noble deeds of those who worship and glorify Him without seeing Him. The fourth point contained in the above-mentioned hadith is that if a man increases his devotion to Almighty Allah, the increase in His mercy and kindness upon him is proportionately far greater. \"Getting near\" and \"running\" signify immediate increase in His blessings and mercy. Thus, it is upto a person that, if he wants to enjoy more kindness and favours from Almighty Allah, he should in- crease his devotion to Him. The fifth point in the above mentioned hadith is that the Angels have been stated to be superior to man, while it is commonly known that man is the best creation of Allah. One reason for this,has already been explained in the trans- lation (of the hadith), that the angels are superior because they are innocent and are unable to commit sins. Secondly, they are superior because they are better than the majority of men, including even the majority of believers; arid yet some selected Believers like the Prophets (Alaihimus salaam) are superior to the angels. There are other reasons 30 Virtues of Zikr as well, which are however left out in order to prevent the discourse from getting too long. Hadith<br><hr><br>A Sahabi once said, \"0, Rasulullah, (Sallallaho alaihe wasallam), I know that the commandments of Sharee- at am many, but of these tell me the one that I may practise assiduously throughout my life.\" The Prophet, (Sallallaho alaihe wasallam), replied, \"Keep ydUr tongue always moist (i.e. busy) with the zikr of Allah.\" According to another hadith, Harat Mu'aaz (Radhiyal- laho anho) has said, \"Once at the time of my departure from Rasulullah [Sallallaho alaihe wasallam), I asked him to advise me of that action which is most pleasing to Almighty Allah: whereupon he replied, \"At the time I of your death, your tongue should be busy with zikr of Almighty Allah.\" Note: By \"my departure\", Hadhrat Mu'aaz (Radhiyal- laho anho) refers to the occasion when he was appointed by the Holy Prophet (Sallallaho alaihe wasallam) as the Governor of Yemen and sent there for teaching and propa- gating Islaam. It was at the time of that farewell that Rasu- lullah (Sallallaho alaihe wasallam) had given him some parting instructions. 1 By saying that \"the commandments of Sharee-at are many\", the Sahabi had meant that although observance of every commandment is imperative, to specialize and attain perfection in each and every one is difficult; and so he wanted that Rasulullah (Sallallaho alaihe wasallam), may recommend him something of over-riding importance which he might hold fast to, and practise at all times and in all conditions of sitting, standing or walking. According to another hadith, a person who pos- sesses the following four things is truly blessed, from the worldly as well as spiritual point of view:- (i) A tongue ever absorbed in the zikr of Almighty Allah. (ii) A heart filled with gratitude of Allah. (iii) A body capable of undergoing hardships. (iv) A wife who does not betray her husband's trust in respect of her chastity and his wealth. The phrase \"moist tongue\" according to some Ulama means excessive utterance (of zikr) and, idiomatically, it is used to convey excessive glorification and praise. But in my (the author's) humble opinian it can have another meaning as well. It is always very sweet and pleasant to talk of one's beloved, as is the common feeling and experi- ence of every lover. On this basis, the phrase \"moist tongue\" would, therefore mean that one should glorify with love the name of Almighty Allah, so as to feel love's sweetness in the mouth. I have observed many times that when some of my religious elders do zikr aloud, the flavour of the sweetness enjoyed by them is so transmitted to the listeners that their mouths also feel the sweetness and they share the ecstasy likewise. But this phenomenon is poss- ible only where there is a genuine yearning for zikr, and the tongue is accustomed to excessive zikr. It is stated in one hadith that the proof of one's love for Almighty Allah lies in one's love for the zikr of Allah, and in the same way lack of zikr betrays lack of attachment with Almighty Allah. Hadhrat Abu Darda (Radhiyallaho anho) said that those who keep their tongues wet with the zikr of Allah, will snter paradise smiling. 32 33 Virtues of Zikr Hadith<br><hr><br>Rasulullah (Sallallaho alaihe wasallam) once said to his companions, \"Shall I tell you of something that is the best of all deeds, constitutes the best act of piety in the eyes of your Lord, will elevate your status in the Hereafter, and carries more virtue than the spending of gold and silver in the service of Allah or taking part in jihaad arid slayin or being slain in the path of Allah.\" The Com anions egged to be informed of such an act. The Prop R et (Sallallaho alaihe wasallam) replied, \"It is the zikr of Almighty Allah.\" Note: This hadith is a generalized statement; other- wise, at times of specific need and emergency sadaqah (charity) and jihaad (fighting in the path of Allah), etc., become more desirable, as stated in some other ahaadith. These acts become more important during the hour of need, but the zikr is for all times and therefore generally more important and virtuous. According to another hadith, Rasulullah (Sallallaho alaihe wasallam) is reported to have said, \"for everything there is a purifier or cleanser. (For instance, soap is used for cleaning the body and the clothes, while a furnace is used for purifying iron). The zikr of Almighty Allah cleanses and purifies the heart, and provides the best pro- tection against retribution in the Hereafter.\" This hadith describes zikr as the purifier of the heart, and as such it also established superiority of zikr over all other actions, of the Holy Qur'an. The author of \"Majaalisul Abraar\", while commenting on this Hadith, has written that zikr of Allah is described to be su- perior to sadaqah, jihaad, and all forms of worship, because it is an end in itself, and ail types of worship constitute only a means to achieve this end. zikr is of two kinds: one is done by word of mouth and the other is in the form of deep meditation and contemplation. It is the latter form of zikr that is implied in the hadith which states that medita- tion for one moment is better than doing worship for se- venty years. Hadhrat Suhail (Radhiyallaho anho) reported that Rasulullah (Sallallaho alaihe wasallam) has said, \"The reward of the zikr of Allah is seven hundred thousand times more than that for spending wealth in the path of Allah.\" Thus, in conclusion, it is evident that jihaad and sada- qah, etc., assume more importance and become more virtu- ous due to the need of the hour. The ahaadith which describe their superiority are therefore understandable. For instance, it is stated in one hadith that standing up for a short while in the path of Allah is more valuable than offer- 34 Virtues of Zikr ing salaat at home for seventy years. Although salaat is unanimously admitted to be the best form of worship, yet taking part in jihaad at the time of an invasion by the infi- dels carries far greater reward. Hadith<br><hr><br>Rasulullah (Sallallaho alaihe wasallam), said, \"There are many a people who do zikr of .Almighty Allah, while lying comfortably in their soft beds, and for this, they will be rewarded with the highest positions in Paradise by Almighty Lord.\" Note: ~ b n e r a l ~ ~ , the greater the sufferings and hard- ships one undergoes in the cause of religion, the higher will be his status in the Hereafter. But the zikr of Allah is such a blessed act that, even if it is done in soft beds in this world, it will bring high rewards and elevated positions in the Hereafter. Rasulullah (Sallallaho alaihe wasallam) had said, \"If you keep yourselves busy in zikr all the time, the angels will shake hands with you in your beds as well as on your way.\" , Once Rasulullah (Sallallaho alaihe wasallam) said, \"The mufarrideen have gone far ahead.\" \"Who are the mu- farrideen?\" enquired the Sahabah. Rasulullah (Sallallaho alaihe wasallam) replied, \"Those who are intensely de- voted to the zikr of Allah.\" On the basis of this hadith, the Sufis have stated that the kings and rulers should not be prevented from zikr of Allah, for they, by this means, can attain a lofty rank in the Hereafter. Hadhrat Abu Darda (Radhiyallaho anho) says, \"Glorify Almighty Allah during the time of prosperity and happi- ness, and it will help you in times of distress and trouble \" - 1-ladhrat Salmaan Faarsi (Radhiyallaho anho) said, \"If a 5 person remembers Allah in times of peace, pleasure and prosperity, then whenever he is in trouble and difficulty, the angels, being familiar with his voice, recognise him in his helplessness and intercede before Almighty Allah (for his forgiveness); but, if one who does not remember Allah in his time of pleasure and happens to pray for help at the time of difficulty, the angels find his voice to be quite un- familiar and therefore do not intercede for him.\" Hadhrat Ibn Abbas, (Radhiyallaho anho) said, \"Para- dise has eight gates, one of which is exclusively reserved for those who are engaged in zikr.\" It is said in one hadith, \"A person who constantly does zikr of Allah is immune from hypocrisy in faith\", and according to another hadith, \"He is loved by Almighty Allah.\" Once during his return journey to Madina Rasulullah (Sallallaho alaihe wasallam) said, \"Where are those who 2 have gone ahead.\" The Companions said, \"The fast travel- g & lers have gone ahead\": then Rasulullah (Sallallaho alaihe 8 wasallam) said, \"Those who remain ahead are the persons who remain constantly absorbed in zikr. Whoever desires to enjoy himself in Paradise, should do zikr of Allah ex- cessively.\" Hadith No 5 Rasulullah (Sallallaho alaihe wasallam) said, \"The contrast between a person who glorifies Almighty Allah and one who does not remember Him is like that between the living and the dead.\" Note: Life is dear to all, and every one fears death. The Prophet (Sallallaho alaihe wasallam) meant to say that one who does not remember Allah, though bodily alive, is spiritually dead and his life is but worthless. A Persian couplet quoted here by the author means, \"(The lover says) My life (of loneliness) is no life; his is the life who lives in contact with the beloved.\" Some scholars have stated that the example refers to the condition of the heart: the heart that remembers Allah is really alive, while the one that does not, is described as 3 6 Virtues of Zikr i dead. Some scholars say that the contrast is in respect of gain and loss. A man who harasses a zaakir is like one har- assing a living being, and he will be avenged for this har- assment and will suffer for it. One who ill-treats the neglectful, ill-treats a dead body, which cannot avenge itself. Some Sufis say that the hadith refers to the eternal life of the zaakireen, because those who glorify Allah con- stantly with sincerity never really die, but instead remain spiritually alive even after passing away from this world. The zaakireen also enjoy a special life after death, like the martyrs, mentioned in a verse of the Holy Qur'an: Nay, they are alive in the eyes of their Sustainer. Hakiem Tirmizi writes, \"Zikr moistens the heart and softens it. A heart that is devoid of zikr becomes dry and hard, due to the excessive heat of lust and base desires. All parts of the body likewise become stiff and abstain from submission to Allah; if you try to bend them, they break like a dry piece of wood, which can be used as firewood only. Hadith<br><hr><br>Rasulullah (Sallallaho alaihe wasallam) is reported to have said, \"If a person has a lot of wealth and distrib- utes it amongst the needy, while another person is only busy with the zikr of Allah, the latter, who is en- gaged in zikr, is the better of the two.\" Note: Spending in the path of Allah is a splendid virtue, but zikr of Allah is more virtuous. How lucky are those well-to- do persons who, in addition to spending for the pleasure of Allah, remain also devoted to His zikr. According to one hadith, Almighty Allah also gives sa- daqah every day, i.e. He showers His favours on the eople, and everybody gets what he deserves, but the luc E iest is the person who is favoured with the ability to do His zikr. People who are engaged in different occupations, such as trade, farming and service, should spare some time for zikr every day and thereby earn great rewards. It should not be difficult to devote an hour or two out of 24 hours, exclus- ively for this noble purpose. A lot of our time is wasted in frivolous pursuits, and some of this can be easily spared for this most useful work. In another hadith, the Prophet (Sallallaho alaihe wasal- lam) is reported to have said, \"The wisest of all people are those who keep track of time, with the help of the sun, the moon, the stars, and the shadows, for doing zikr regularly.\" Nowadays we can determine time with the help of * watches, yet one should be able to judge time with the help 9 2 of these natural agents, so that no time gets wasted in case 5 the watch stops or goes out of order. In another hadith, it is stated that the place where zikr is done, takes pride over other parts of the earth. Hadith<br><hr><br>The Holy Prophet (Sallallaho alaihe wasallam) said, \"Those who are admitted into Paradise will not regret over anything of this world, except the time spent without zikr in their life.\" Note: After their entry into Paradise, when they will see the huge reward (as large as mountains) for remembering Allah once, they will feel extremely sorry over their loss caused by the time spent without zikr, as can be well imagined. In this world, there are such blessed persons who would not 38 Virtues of Zikr relish this life it is were spent without the zikr of Allah. Hafiz Ibn Hajar (Rahmatullah aiaih) writes in his book \"Munabbihaat\" that Yahya bin Mu'aaz Raazi (Rahmatullah alaih) used to say in his supplication: 0 Allah! the nigl.. is no good unless spent in com- munion with You, the day is no good unless spent in worshipping You, this life is no good without Your zikr, the next life will be no good without forgiveness from You, and Paradise will not be enjoyable without beholding You. Hadhrat Sirri (Rahmatullah alaih) says, \"I saw Jurjani swallowing roasted barley flour. He told me that he had compared the time taken in chewing bread and in eating barley flour: eating bread took so much longer that he could say h i seventy times in that time. There- fore, he had not taken bread for forty years, and had lived by swallowing barley flour alone.\" It is said about Mansoor bin Mu'tamar that he never spoke to anybody after Ishaa prayers for forty years. Simi- larly, it is said about Rabee' bin Hatheem that it was his practice for twenty years that he noted down what he talked during the day, and would check at night whether that talking was necessary or not. Those pious scholars were particular that every moment of their life was spent in zikr and in nothing else. Hadith No 8 I 39 Ch. I: Ahaadith on Zikr Hadhrat Abu Hurairah (Radhiyallaho anho) and Hadh- rat Abu Sa'eed (Radhiyallaho anho) both bore testi- mony to having heard from Rasulullah (Sallallaho alaihe wasallam), that the gathering engaged in zikr of Almighty Allah is surrounded by the angels on all sides, the grace of Allah and sakeenah (peace and tran- quility) descend upon them, and Almighty Allah speaks about them, by way of appreciation, to His angels.\" Hadhrat Abu Zar (Radhiyallaho anho) related that Ra- sulullah (Sallallaho alaihe wasallam) had said to him, \"I advise you to fear Allah, as this is the root of all virtues; remain engaged in the recitation of Holy Qur'an and in zikr of Almighty Allah, which will earn you an appreciation in the Heavens and serve you as a light in this world; keep silent for most of the time, so that you speak nothing but good, as this will keep the Devil away from you and make %+ E N it easy for you to perform your religious duties, abstain also $ from too much laughing, for laughing weakens the heart and deprives the face of its spiritual glow (luminosity), always take part in jihaad as this is the sign of piety for my ummah; like the poor and keep their company; compare your lot with persons lower than you, and never look upto those higher than you, otherwise you will forget the boun- ties of Almightv Allah and become ungrateful to Him; try to retain ties with your relatives though they may try to break them; do not hesitate to speak out the truth, though it may be bitter for others: always obey Almighty Allah in spite of adverse criticism, find fault with your own self, and never with others; do not criticise others for the short- comings that you suffer from. O! Abu Zar (Radhiyallaho anho) there is no wisdom better than farsightedness, absti- nence from the unlawful is the best act of piety, and good manners constitute true nobility.\" Note: The word 'sakeenah' according to various scholars means tranquility and peace, as well as Allah's special mercy, as explained in detail in my book Fazaa'il-i-Qur'an. I:or instance, Imam Nawawi (Rahmatullah alaih) states that sakeenah is a special favour consisting of tranquility, mercy, etc. and is brought down from the Heavens by the angels. This appreciation, in the presence of the angels, by Almighty Allah for those engaged in zikr is for two reasons. 40 Lord! by Your Greatness, whoever comes to know of it, will do his best to enter it\", that is to say, its pleasures, com- forts, enjoyments and blessings are so intense that there will be no body who, after knowing and believing these, will not strive his utmost for admission into it. Almighty Allah then surrounded Paradise with hardships and made it compulsory to offer prayers, observe fasting, take part in jihaad, go for Haj, etc., for admission into it. Almighty Allah then sent Jibra-eel (Alayhis salaam) to visit it again. He saw these and then said, \"0 Allah! I fear that hardly anybody will be able to enter it.\" Similarly, after creating Hell, Almighty Allah ordered Jibra-eel (Alayhis salaam) to visit it. After witnessing the punishments, horrors, afflic- tions and tortures of Hell, he submitted, \"I swear by Thy Grandeur that one who comes to know of the conditions in Hell will never dare go near it.\" Then Allah surrounded Hell with acts of indulgence, such as adultery, drinking wine, cruelty, disregard of the Divine commandments, etc., and then asked Jibra-eel (Alayhis salaam) to visit it again. He saw it and submitted. \"My Lord! I fear that hardly any- body will be able to escape it.\" It is for this reason that, when a person obeys Almighty Allah and abstains from sins, he becomes praiseworthy with respect to his environ- ments, and therefore Almighty Allah expresses His pleas- ure about him. The angels mentioned in this hadith and in so many other similar ahaadith belong to a special group who are dutv-bound to visit the places and attend the meet- ings where people are engaged in zikr. This is supported by another hadith wherein it is stated that there is a class of angels who are scattered all over, and when and wherever I 1 I any one of them hears zikr being recited he calls all his companions to come to that place, and partake of what they wanted. They throng to the place and they fill it up to the sky, as mentioned in Chapter I1 under item 14. Hadith</p></div>",
+        "sections": [
+            [
+                30,
+                16463
+            ],
+            [
+                16463,
+                26129
+            ]
+        ]
+    },
+    {
+        "id": 32,
+        "bookId": 4,
+        "chapter": "Kalima Tayyibah",
+        "title": "Content for Kalima Tayyibah",
+        "preview": "Once Rasulullah (Sallallaho alaihe wasallam) went to a group of Sahaba, (Radhiyallaho anhum) and said to them, \"What for are you sitting here?\" They r...",
+        "content": "<div class=\"story-content\"><p>Once Rasulullah (Sallallaho alaihe wasallam) went to a group of Sahaba, (Radhiyallaho anhum) and said to them, \"What for are you sitting here?\" They replied, \"We are engaged in the zikr of Almighty Allah, and are glorifying Him for His extreme kindness to us in that He has blessed us with the wealth of Islaam.\" Rasulul- I lah (Sallallaho alaihe wasallam) said, \"By Allah, Are you here only for this reason?\" \"By Allah!\", replied the Sahaba, (Radhiyallaho anhum), \"We are sitting here only for this reason.\" Rasulullah (Sallallaho alaihe wasallam) then said, \"I asked you to swear not out of any misunderstanding, but because jibra-eel (Alayhis salaam) came to me and informed me just now that Almighty Allah was speaking high about you i 'before angels.\" Note: Enquiry on oath by the Prophet (Sallallaho alaihe wa- 1 i sallam) was simply to ascertain whether there was any other special thing, besides zikr, which might be the cause of Allah's pride. It became definite that it was only because of the zikr of Almighty Allah that He was proud of them. How lucky were those people whose worship was ac- 1 cepted, and the news of Allah's recognition of the zikr on their part was revealed to them in this very earthly life through Rasulullah (Sallallaho alaihe wasallam). Certainly, their sublime deeds deserved all this appreciation. Their heroic deeds are briefly described in my book named Hikaayaat-e- Sahabah, (i.e. The Stories of Sahabah). Mulla 43 4 2 Virtues of Zikr Ali Qari (Rahmatullah alaih) interprets the pride on the part of Almighty Allah to mean that He wants the angels to realize, \"Despite the fact these humans are full of tempta- tions, the Devil is after them, desires are inside them, the worldly needs chase them, and yet they are engaged in glorifying Almighty Allah, and so many deterrents cannot prevent them from doing zikr: and therefore your zikr and glorification, in the absence of any such handicaps is com- paratively insignificant.\" Hadith No 10 Hadhrat Anas (Radhiyallaho anho) reported that Rasu- lullah (Sallallaho alaihe wasallam) had said, \"When some people assemble for the zikr of Allah with the sole purpose of earning His pleasure, an angel pro- claims from the sky, 'You people have been forgiven, your sins have been replaced by virtues.\" According to another hadith, \"A gathering devoid of zikr of Allah, would be the cause of dismay and sorrow on the Day of Judgement.\" It means that the participants of such a gathering will repent that they earned no blessings and wasted their time for nothing; may be, it led them to af- flictions. In another hadith, it is stated that the mem- bers of a gathering devoid of zikr of Allah and salawaat on Rasulullah (Sallallaho alaihe wasallam) are- like those who get up from the dead body of an ass. According to another hadith, one should get the va- riour transgressions (unwittingly) committed in a gath- ering condoned by reciting the following prayer at the conclusion of the meeting: \"Glory be to Allah with all kinds of praises. Glory be to Thee, 0 Allah! with all Thy Praise; I stand witness that there is no one to be worshipped except Thee. I seek Thy forgiveness and turn (for mercy) to Thee.\" It is narrated in another hadith that any gathering devoid of Allah's zikr and salawaat will be a source of dismay and loss. Then, out of His sheer mercy, Allah may 0 grant forgiveness, or He may demand an explanation and 3 3 penalize. It is stated in another hadith. \"Do proper justice ea 5 to a gathering by remembering Allah profusely, show the way to wayfarers (if need be), and close your eyes or cast them down when you come across a forbidden thing. Hadhrat Ali (Karamallaaho Wajhahoo) said, \"Whoso- ever desires that his reward be weighed on the Day of Judgement in a large scale (i.e. his reward should be very big, as only weighty things, and not the small things, are weighed in big scales), should recite the following prayer at the end of a meeting: (Glory) to Thy Lord-The Lord of Honour And Power. (He is free) from what they ascribe (to Him). And peace be on the apostles, and Praise to Allah, the Lord and Sustainer of the Worlds). The above hadith also includes the happy tidings that the sins will be replaced by virtues. Even in the Holy Qur'an, at the end of surah al-Furqaan, Almighty Allah mentions the good qualities of the believers and then says: 44 Virtues of Zikr 34 As for such. Allah will change their evil deeds to good deeds: and Allah is ever forgiving and most merciful. The following are some comments made by the com- mentators on this verse:- 1. All sins would be forgiven and only virtues would remain (in the account); that no sin is left behind (in the account) is itself a big change. 4. Almighty Allah shifts the direction of the conduct of such people from vices to virtues. Almighty Allah guides him to repent for his sins. He recollects his old sins, repents over them and prays for forgiveness. Thus, for every sin pre- viously committed, he gets the credit of one repen- tance, which constitues a devotion and a virtue. 2. Almighty Allah will enable them to do good deeds when otherwise they would have committed bad deeds, just as it is sometimes said, \"the heat was replaced by the cold.\" 3. Their habits become related to virtues instead of vices, so much so that doing good deeds becomes their habit. Habits once formed become second nature, which does not change. The Persian pro- verb meaning that \"The mountain can move, but not the habit\" refers to this fact. This proverb is also derived from another hadith, \"You may be- lieve if you hear that a mountain has moved from its place, but do not believe if you are told that the habits of somebody have changed.\" This hadith implies that the change of a habit is more unli.kely than a mountain changing its place. The question then arises what is meant when it is said that the Sufis and religious teachers reform the behaviour of their disciples. The answer is that habits do not change, but the relationship of habits changes. For instance, if a man's temperament is such that he! is prone to anger, it is difficult for him to get rid of his hot temperament through the training and excercises under the supervisio~l of the Shaikhs, but they would reform him in such a way that, whereas formerly his anger led him to show un- justified cruelty and haughtiness, it will now be directed against transgression of Allah's com- mandments. Hadhrat Umar (Radhiyallaho anho) at one time had left no stone unturned in molesting the Muslims, but after embracing Islaam and re- maining in the company of Rasulullah (Sallallaho alaihe wasallam) he became correspondingly hard on the unbelievers and transgressors. So is the case with other aspects of one's conduct. This clarification leads us to the conclusion that I \\ I i 5. If Allah is pleased with the good deeds of some- body, and through His sheer benevolence grants him virtues equal to his sins, there is nobody to question His authority. He is the Lord, He is the King, He is All powerful, His mercy is boundless. Who can close the door of His forgiveness? Who can stop His bounty? He gives everything from His own treasures. He will exhibit His powers and un- limited forgiveness on the Day of Judgement. Vari- ous scenes of reckoning on the Day of Judgement are described in ahaadith, as briefly given in the book, Bahjatun Nufoos. It is mentioned that reck- oning will be conducted in different ways. \"Some people will be examined in camera under the cover of (secret) Mercy: their sins will be re- counted to them, they will be reminded of the oc- casion when each sin was committed by them and there will be no alternative for them but to confess all their sins. Due to the abundance of his sins. he will think that he is doomed. but the Lord will say, \"I covered your sins during the worldly life and again I cover them now, and forgive them all.\" When such a person, along with others like him, will return from the place of reckoning, the people will see him and exclaim, \"What a blessed person, he never committed any sin,\" because they will have no knowledge of his sins. Similarly, in an- other mode of reckoning, the people will have minor as well as major sins to their account. Then, Almighty Allah will order that their minor sins may be converted into virtues, at which they (in order to get more virtues) will exclaim that many of their sins are not mentioned in their account. In the same way, the modes of reckoning \"are also mentioned in ahaadith. An anecdote is mentioned in one hadith, wherein Rasulullah (Sallallaho alaihe wasallam) is reported to have said. \"I recog- % 8.2 gz $ 46 Virtues of Zikr 7 nise the person who will be transferred from the Hell to the Paradise last of all. He will be sum- moned, and the angels will be directed that his major sins should not be mentioned and that only his minor sins should be read out, and he should be asked to give explanation for them. This trial will start, and his sins will be recounted to him with time and place. How can he deny them? He will confess them all. Almighty Allah will then order that for every sin he may be given one virtue. At this, the man will speak out at once, \"There are still many sins that have not been men- tioned so far.\" While narrating this part of the story, even Rasulullah (Sallallaho alaihe wasal- lam) smiled. Firstly, to be the last one to come out of the Hell, as mentioned in this narrative, does not mean a light punishment; secondly, it is not known as to who will be that lucky one whose sins will be converted into virtues. Hoping for the best from Almighty Allah and constantly begging for His mercy constitute the best form of submis- sion. But one should never be over-complacent in this matter. However, the above-mentioned hadith shows that taking part in meetings of zikr with ikhlaas leads to replacement of sins by virtues. But this ikhlaas is possible only through the grace of Almighty Allah. The main point contained in this hadith is that of ikhlaas (i.e. doing a thing only for the pleasure 'of Allah). That ikhlaas is the pre-requisite for all good deeds will be found in several other ahaadith in this book. In fact, the acceptance by Almighty Allah de- pends only on ikhlaas: every deed will be evaluated according to the degree of ikhlaas involved therein. According to the Sufis, ikhlaas on one's part requires i that one's words, thoughts and deeds should be com- patible. It will be found in one hadith that ikhlaas is that which prevents one from committing sin. A story of a despotic king who was notorious for I his tyranny and cruelty is related in the book \"Bahja- tun Nufoos.\" Once. a large consignment of wine was being brought for him in a ship. A pious man who hap- 1 pened to travel by that ship broke all the bottles or I casks of wine except one, but nobody could stop him 1 from that act. Everybody wondered how he dared to do this, for nobody had the courage to face the cruelty of the king. When the king was informed about it, he was surprised to learn how an ordinary person had the courage to do all that and also wondered why he left one cask intact. The man was called for, and interro- gated. He replied, \"My conscience had urged me to do this; you may punish me as you like.\" He was then asked why one cask was left unbroken? He replied, \"At first I broke the casks of wine out of my religous senti- ments, but when only one was left, my heart felt elated at having done something forbidden by religion. I then felt that breaking this last cask would be for the satis- faction of my ego. I, therefore, did not break it.\" Find- ing him selfless in what he did, the king ordered his - release. o It is narrated in Ihyaa-ul Uloom that there was a B.k2 pious man among the Israelites, who always remained g 3 busy in the worship of Allah. A group of people came 5 to him and told him that a tribe living nearby worshipped a tree. The news upset him, and with an axe on his shou der he went to cut down that tree. On the way, Satan I et him in the form of an old man and asked him where he was going. He said he was going to cut a particular tree. Satan said, \"You are not con- cerned with this tree, you better mind your worship and do not give it up for the sake of something that does not concern you.\" \"This is also worship\", re- torted the worshipper. Then Satan tried to prevent him from cutting the tree, and there followed a bout be- tween the two, in which the worshipper overpowered the Satan. Finding himself completely helpless, Satan begged to be excused, and when the worshipper re- leased him, he again said, \"Allah has not made the cut- ting of this tree obtigatory on you. You do not lose anything if you do not cut it. If its cutting were necess- ary. Allah could have got it done through one of his many Apostles.\" The worshipper insisted on cutting the tree. There was again a bout between the two and again the worshipper overpowered the Satan. \"Well, listen\" said the Satan, \"I propose a settlement that will be to your advantage.\" The worshipper agreed, and the Satan said, \"You are a poor man, a mere burden on this earth. If you desist from this act, I will pay you three gold coins everyday. You will daily find them 48 Virtues of Zikr lying under your pillow. By this money you can fulfil your own needs, can oblige your relatives, help the needy, and do soamany other virtuous things. Cutting the tree will be only one virtue, which will ultimately be of no use because the pebple will grow another tree.\" This proposal appealed to the worshipper, and he accepted it. He found the money on two successive days, but on the third day there was nothing. He got enraged. picked up his axe and went to cut the tree. The old man again met him on the way and asked him where he was going. \"To cut the tree\", shouted the worshipper. \"I will not let you do it\", said the Satan. An encounter ensured between the two, and this time the Satan had the upper-hand and overpowered the worshipper. The latter was surprised at his own defeat, and asked the former the cause of his success. The Satan replied, \"At first, your anger was purely for earn- ing the pleasure of Allah, and therefore Almighty Allah helped you to overpower me, but now it has been partly for the sake of the gold coins and therefore you lost.\" Truly speaking. a deed performed purely for the pleasure of Allah alone carries great force. Hadith<br><hr><br>Rasulullah (Sallallaho alaihe wasallam) said, \"No other action of a person can surpass zikr of Almighty Allah in saving him from the punishment in the grave.\" Note: How serious is the punishment in the rave can be realized only by those who have the knowle f ge of hadith on this subject. Whenever Hadhrat Uthman (Radhiyallaho anho) visited a grave, he would weep so much that his beard would become wet with tears. Some one asked him, \"How is it that mention of Paradise and Hell does not make you weep so much as you do when you come across a grave?\" He replied, \"The grave is the first of the many stages of the Hereafter. For him who is successful or safe during this stage, the later stages will also be easy; while for a person who is not exempted in this stage, the later stages will be even more difficult.\" Then he quoted Rasu- lullah (Sallallaho alaihe wasallam) as having said, \"I have not come across any sight more terrifying than that of the 2 grave.\" Hadhrat Aa'ishah (Radhiyallaho anha) said, that (BA Rasulullah (Sallallaho alaihe wasallam) used to pray after ~ E J every Salaat for protection against the chastisement in the 5 grave. Hadhrat Zaid (Radhiyallaho anho) reported Rasulul- lah (Sallallaho alaihe wasallam) to have said, \"But for fear that you might give up burying your dead, I would have prayed to Almighty Allah to let you hear the torture of the grave. With the exception of men and jinns, all other crea- tures hear the punishment in the grave.\" According to a hadith, once when Rasulullah (Sallal- laho alaihe wasallam) was going on a journey, his she- camel took fright. Someone asked him what had happened to her. Rasulullah (Sallallaho alaihe wasallam) replied that somebody was being punished in the grave, and the cries of the punished had frightened the she-camel. Once Rasulullah (Sallallaho alaik wasallam) entered the mosque and saw that some people were laughing very loudly. He said to them, \"If you had remembered death quite often, you would not have laughed like this. Not a day passes when the grave does not proclaim, \"I am the house of wilderness, the house of loneliness. and the abode of worms and insects.\" When a true believer is buried in a grave, it welcomes him, saying, \"You are welcome here, you have done well to have come here. Of all the people walking upon the earth, you were the dearest to me. Now that you have been made over to me, you will see my excel- lent behaviour.\" Then the grave expands to the farthest point of sight, and a door of paradise opens into it. Through this door comes the scented air of paradise. But - - 50 Virtues of Zikr when an unbeliever or a transgressor is buried, the grave says, \"Your coming here is unwelcome and abominable. You had better not come here. Of all the people who have been walking upon me, I hated ypu the most. Today you have been made over to me, and you will see my treat- ment.\" Then it narrows down and presses him mercilessly, till his ribs pierce into each other as the fingers of the two hands interlock each other. Then ninety or ninety nine dragons are let loose upon him, and they will continue clawing at him till the Day of Resurrection. If one of those serpents or dragons were to blow on the earth, it will be rendered incapable of growing any grass till the Day of Judgement. Then Rasulullah (Sallallaho alaihe wasallam) continued. \"The grave is either a garden out of Paradise or a pit out of Hell.\" Accordine to another hadith. Rasulullah lsallallaho ----.- alaihe wasallgm) happened to pass by two grave'~. He said, \"The two persons buried in these graves are being pun- ished, one for back-biting and the other for polluting his bodv with his urine.\" It is a pity that many of our so-called civilized people regard isti4aa (washingthe private parts after urination) as an undignified act, and even redicule it. Some Ulama regard such pollution by urine as a major sin. Ibn Hajar Makki (Rahmatullah alaih) has stated that, according to an authentic hadith, the punishment in the grave is generally due to neglect of cleanliness from urine. It is narrated in one hadith that interrogation in the grave will first be about (pollution with) urine. In short, the punishment of the grave is a very serious affair. Just as some types of sins lead to this affliction, in the same way certain virtuous acts provide special safeguard against it. It is stated in several ahaadith that the recitation of surah Tabarakal lazi ,every night guarantees security from the tortures in the grave, as well as from that in the Hell. The effectiveness of zikr in this respect is evident from the above-mentioned hadith. Hadith<br><hr><br>1 . L \\.Xi 31 j S! 41 4 u ;,p 3i +UI j, ;-li pJ JGJ, , . ., - y & A;$\\ 3:.gJ\\ ;&d 2 ;\\;i ,$ +;j > >> ,& +$c . dl &\\ 3 . 1s A\\ 3 +ul; JG A\\ 3 i > ~ . , ; JG- A\\ 2 i;&;\\ rl'. - , 0 , i)Stf.J.\\j I4 u& J ~lljl\\ p j (ij J F,: Rasulullah (Sallallaho alaihe wasallam) had said, (r 0 \"Almighty Allah will, on the Day of Resurrection, res- e3 urrect certain groups of people in such a state that their faces will be radiant with light, they will be sit- ting on pulpits of pearls and others will envy their lot. They will neither be from among the Prophets nor from among the martyrs.\" Somebody asked the Prophet (Sallallaho alaihe wasallam) to let him have more details about these people, so that he may be able to recognize them. Rasulullah (Sallallaho alaihe wasal- lam) replied, \"They will be the people who belong to different families and different places, but assemble at one place for the love of Almighty Allah and are en- gaged in His zikr.\" It is said in another hadith, \"In paradise there will be pillars of emerald supporting balconied houses made of rubies and with open doors on all the four sides. These will shine like brilliant stars, and will be occupied by those people who love each other for the sake of Allah, and who assemble at a place and meet each other only for His pleas- ure. Nowadays, the religious devotees are criticizd and ridiculed by everybody. The people may reproach them today as much as they like, but the reality will dawn on them in the Hereafter, when they will realize how these humble persons have been able to earn high fortunes and occupy such grand pulpits and such flats, whereas those who criticized and ridiculed them had earned nothing but misery and despair: 52 Virtues of Zikr \"Soon the dust-cloud will clear away, and it will be seen whether vou are riding a horse or an ass.\" How blessed. in the eyes of Almighty Allah, are the khanqahs (places where zikr is practised), which are the targets of abuse from all quarters. can best be judged from this hadith in their favour. It is mentioned in one hadith that the houses where zikr is practised shine unto the dwellers of the Heaven, as do the stars shine unto the in- habitants of the Earth. According to another hadith, sakee- nah (a very special blessing) descends on the gathering engaged in zikr, the angels surround them, the divine mercy covers them, and Almighty Allah mentions them on His Throne. Hadhrat Abu Razeen (Radhiyallaho anho) a Sahabi, narrated that Rasulullah (Sallallaho alaihe wasallam) had said.!\"Shall I tell you something that will strengthen your Imaan and earn you the blessings of Allah, the Great, in both the worlds? It is the gatherings of those who do zikr of Almighty Allah; you should make it a point to take part in them, and when you are alone, do as much zikr as you can.\" Hadhrat Abu Hurairah (Radhiyallaho anho) has ex- plained that the houses in which zikr is done appear to be as bright and shining as are the stars to the dwellers of the Earth. These houses are so bright because of their light of zikr, they shine like the stars. There are people who are en- dowed by Almighty Allah with spiritual insight and are capable of seeing this light in this very world. There &re some who can recognise the spiritual persons and their houses from the special radiance emitted by them. Hadhrat Fudhail bin Iyaadh, (Kahmatullah alaih) a famous saint, has said that the houses in which zikr is practised shine like a lamp unto the dwellers of the Heavens. Sheikh Abdul Aziz Dabbaagh, a saint of recent times, was illiterate but he could clearly distinguish between the verses of the Qur'an, Hadith Qudsi, and Hadith Nabawi. Me used to say that words coming out from the mouth of the speaker carry a distinguishing glow and that the words of Almighty Allah carrv one kind of radiance and the words of Rasulullah (Sallallaho alaihe wasallam) carry another kind of radiance, while the words of others are devoid of these two tvpes of radiance. 3 It is given in Tazkiratul Khaleel, the biography of Mau- lana Khaleel Ahmad (May Allah enlighten his grave) that Maulana Zafar Ahmad had related, \"When Maulana Kha- lee1 Ahmad, on the occasion of his fifth Hajj, entered the Masjidul Haraam for Tawaaful Qudoom, I was sitting in the company of Maulana Muhibbuddeen, who was one of the most trusted disciples of Maulana al-Haaj Imdaadullah Mu- haajir Makki (May Allah enlighten his grave) and was well known for his gift of divine foresight. He was then engaged in his usual recitation of salawaat from a book, when all of a sudden he turned to me and said, \"Who has entered the Haram? The whole of the Haram has been flooded with his radiance and light.\" I kept quiet. After a short while, Mau- lana Khaleel Ahmad after completing his tawaaf happened to pass by us. On seeing him Maulana Muhibbuddeen stood up, smiled and said, \"Now indeed I see who has en- tered the Haram today! \" 2 2 EN The virtues of assembling for the sake of zikr have 5 been described in different ways in so many other ahaa- dith. In one hadith, it is stated that salaat and gatherings for zikr constitute the best ribaat. Ribaat stands for guarding the boundaries of Daarus Salaam (the Muslim territory) against invasion by the infidels. Hadith No 13 Rasulullah (Sallallaho alaihe wasallam) said, \"When you pass the gardens of Paradise, graze to your heart's content.\" Someone asked. \"0 Kasulullah! (Sallallaho alaihe wasallam), what is meant by the gardens of Paradise?\" He replied, \"Gatherings for performing zikr.\" What is meant is that if somebodv is lucky enough to get access to such gatherings. he should take full advantage of this, as these are the gardens of Paradise on this Earth. 55 54 Virtues of Zikr 1 The words, \"graze to your heart's content\", signify that, just as an animal grazing in a green pasture or garden does not give up grazing in spite of being driven or beaten by its owner, similarly a zaakir (one who practises zikr) should not get pulled away from the gatherings for zikr by the worldly anxieties and hindrances. The gatherings for zikr are likened to the gardens of Paradise, because just as there are no worries in the paradise, similarly gatherings of zikr are safeguarded against every kind of calamity. It is stated in one hadith that the zikr of Almighty Allah cures all diseases of the mind, such as arrogance, jealousy, malice, etc. The author of 'Fawaa'id fis Salaah wal Awaa'id' has stated that constancy in zikr is a sure safeguard against all kinds of calamities. According to an- other hadith, Rasulullah (Sallallaho alaihe wasallam) has said, \"I enjoin on you to do zikr of Allah profusely. It is like taking refuge in a fort against a strong enemy. One who practises zikr is as if it were in the company of Almighty Allah.\" Can there be any benefit greater than that of being in the company of the Almighty Lord? Moreover, it leads to satisfaction of the mind, it enlightens the heart and re- moves its callousness. In addition, there are many other material and spiritual benefits, which are enumerated, upto a hundred, by some Ulama. A man came to see Hadhrat Abu Umaamah, (Radhiyal- laho anho) and said to him, \"I saw in a dream that when- ever you went or came out, or sat or stood up, the angels prayed for you.\" Hadhrat Abu Umaamah (Radhiyallaho anho) replied, \"If you wish you can also earn their pray- ers\", and recited the ayat: i \"0 you who believe! celebrate the praises of Allah and do this excessively and glorify Him morning and even- I ing. He sends blessings on you, as also His angels that He may bring you out from the depths of darkness into light, and He is full of Mercy to the believers.\" i This ayat was quoted to show that the Mercy of Almighty Allah and the prayers of the angels can be earned through zikr. The more we remember Allah, the more He remembers us. Rasulullah (Sallallaho alaihe wasallam) said, \"One who is too weak to bear the strain of keeping awake at night (in the worship of Almighty Allah), is too mi- serly to spend his wealth in the path of Allah, and is $ 8 2 too cowardly to take part in jihaad, is advised to g~ remain engaged in the zikr of Allah.\" i' This shows that deficiencies in respect of non-obliga- tory form of worship can be atoned through profuse zikr of Almighty Allah. Hadhrat Anas (Radhiyallaho anho) re- purted that Rasulullah (Sallallaho alaihe wasallam) had said, \"Zikr of Allah is a sign of Imaan, and it ensures exemption from hypocrisy, and provides a safeguard against the devil and protection from the fire of Hell.\" Be- cause of all these benefits, zikr has been regarded as more virtuous than many other forms of worship; it is specially effective in providing protection against the Devil. It is stated in one hadith that the Devil, in a kneeling position, clings to the heart of a man, and when the man remembers Almighty Allah the devil becomes helpless and frustrated and therefore draws back, but whenever he finds the man neglecting it he pollutes the heart with evil thoughts. It is for this reason that the Sufis advise practising zikr excess- ively, so that the heart remains free from evil thoughts and becomes strong enough to resist the Devil. The Sahaba (Radhiyallaho anhum) who had developed this inner strength through the blessed company of Rasulullah (Sal- lallaho alaihe wasallam) did not stand in such great need of exercising zikr, but with the passage of time after Rasulul- lah (Sallallaho alaihe wasallam) this resistive power of the heart became weaker and weaker, and the need to remedy this weakness through zikr became correspondingly greater. In the present age, the hearts have become so de- 56 57 Rasulullah (Sallallaho alaihe wasallam) is reported to have said, \"Practise zikr so excessively that people may regard you as a maniac.\" It is stated in another hadith \"Practise zikr so much that the hypocrite may regard you as insincere.\" It is clear from this hadith that the taunts of madness and hypocrisy by the munaafiqs and by the foolish people should not make one give up the spiritual wealth of zikr. On the contrary, it should be done with such rapture and abundance that those people may take you to be actually mad and let you alone. They will consider you mad, only if you practise zikr excessively and loudly, and not if you do it quietly. Ibn Katheer (Rahmatullah alaih) has narrated, on the authority of Hadhrat Abdullah bin Abbas (Radhiyallaho anho) \"Nothing has been made obligatory by Almighty Allah without fixing maximum limit for it and excusing shortcomings in respect of it, except His zikr, for which no limit has been fixed and no person, as long as he is sane is exempted from it.\" Almighty Allah has ordered in the Holy Quran: \"Practise zikr of Allah excessively.\" A person should do zikr under all circumstances, whether by day or night; whether in the jungle or at sea; whether travel- ling or halting; whether in. affluence or poverty; , whether in sickness or health; whether loudly or quietly. j& g & In his book 'Munabbihaat', Hafiz Ibn Hajar (Rahmatul- 5 lah alaih) writes that Hadhrat Uthman (Radhiyallaho anho), while explaining the Quranic verse Beneath it there was a treasure for them said that the treasure meant a golden tablet, on which were written the following seven lines: (1) I wonder at the man who knows that he is to die and indulges in laughter. (2) I wonder at the man who knows that this world will come to an end one day, but hankers after it. 1 (3) I wonder that a man who knows that everything is predestined should lament the loss of anything. 1 (4) I wonder that a man who believes in the reckoning in the Hereafter should amass wealth. (5) I wonder that a man who has the knowledge of the b ! fire of the Hell should commit any sin. 1 I I (6) I wonder that a man who believes in Almighty Allah should remember anybody other than Him. (7) I wonder that a man who believes in Paradise should feel pleasure in anything of this world. I In some editions of that book. it is also added, \"I l wonder that a man who knows that Satan is his eternal enemy should obey and follow him.\" 59 5 8 Virtues of Zikr 35 Allah! I am pleased with him, Thou be also pleased with him.\" On seeing this scene, Hadhrat Ibn Masood (Radhiyal- laho anho) wished that it should have been his corpse. Hadhrat Fudhail (who was one of the great Sufis) stated, \"To abstain from a virtuous act for fear of being seen by the people is in itself an act of hypocrisy, and a good action done with the intention to make a show amounts to Shirk (false worship).\" It is stated in one hadith that some persons are the keys to zikr, i.e. their very sight reminds and inspires other people to do zikr of Allah. According to another hadith, such people are the friends of Allah whose very sight makes others remember Almighty Allah. It is stated in one hadith, \"The best amongst you are the people whose very sight reminds you of Allah.\" Similarly it is stated in an- other hadith, \"The best amongst you are those whose sight makes you remember Almighty Allah, whose words add to your knowledge, and whose actions induce you to work for the love of the Hereafter.\" Of course, such a condition can be attained by one who practises zikr profusely. One who is himself indolent in this respect, his sight can hardly inspire others to remember Allah. 2d Some people regard zikr in loud voice as an innovation E N i- and forbidden in religion, but this view is due to lack of in- sight into the knowledge of hadith. Maulana Abdul Hay, (Rahmatullah alaih) has written a booklet 'Sabahatul Fikr' on this very subject, wherein he has quoted about fifty ahaadith in support of zikr in loud voice. However, it is subject to proper limitations, so as not to annoy anybody else. Hadith Nu 16 Rasulullah (Sallallaho alaihe wasallam) has said: \"The following seven persons will be accommo- dated by Allah in the shade of His Mercy on the day when there will be no other shade except His: (1) A Virtues of Zikr 35 61 just ruler (2) A young man who worships Allah in his youth (3) A person whose heart yearns for the musjid (4) Those two persons who love, meet and depart only for the pleasure of Allah. (5) A man who is tempted by a beautiful woman and refuses to respond for fear of Allah. (6) A person who gives alms so secretly that the charity of one hand is not known to the other hand. (7) A person who practises zikr of Allah in solitude, so that tears flow of his eyes.\" The flowing of tears can mean deliberate weeping, due to repentance over one's past sins, but it may also mean a spontaneous outburst of tears due to overwhelming passion of love. Thaabit Banaani (Rahmatullah alaih) has quoted the words of a pious man, \"I come to know when a prayer of mine is accepted.\" When asked as to how he comes to know of it, he said, \"That prayer, at the time of which the hair on my body stand up, my heart starts beating rapidly and my eyes shed tears, is accepted by Allah.\" Among the seven persons mentioned in the foregoing hadith, is in- cluded also the person who weeps while doing zikr in soli- tude. He combines two sublime qualities: first ikhlaas, which makes him remember Allah in solitude, secondly the fear or love of Allah, which makes him weep. Both these things are extremely virtuous. According to a poet, \"My work is to weep at night in remembering my be- loved; and my sleep is to remain absorbed in thoughts of my beloved.\" ('46 31 $i $j), (a In the Arabic text of the hadith person who remembers Allah when he is unoccupied), the word 'unocc~~pied' according to Sufis, has two- meanings. it means in solitude, as is generally understood: but it also signifies the heart being free from all thoughts except of Almighty Allah, which constitutes the real solitude. The ideal is to have both forms of solitude, physical as well as mental. But if a person, even while in the company ot others, has his heart free from all worldly thoughts and, being absorbed in the zikr of Allah, happens to weep thereby, he will also be rewarded as mentioned in this hadith, because the presence or absence of others makes no difference to him. His heart is free from the thoughts, not only of his companions, but also of everything other than Almighty Allah. The presence of others cannot distract him from his attention towards Allah. To be able to weep for fear and love of Allah implies possession of great spiritual wealth. Fortunate is he who is blessed with it by Almighty Allah. It is stated in one hadith that a person who weeps for fear of Allah will not be sent to Hell till the milk goes back into the teats of an animal (which is imposssible). This implies that it is similarly im- possible for such a person to go to Hell. According to an- other hadith, a person who weeps for fear of Allah will not be punished on the Day of Judgement. It is stated in one hadith that the fire of Hell is forbid- den for two eyeszone that sheds tears for fear of Allah, and the other that has remained awake in guarding the Muslims * and Islaam against the infidels. In another hadith, it is stated that the fire of Hell is forbidden on the eye that has gN wept for fear of Allah, on the eye that has remained awake in the path of Allah, on the eye that has refrained from the unlawful and also on the eye that has been lost in the path of Allah. Yet another hadith states that a person who remembers Allah in solitude is like one who goes all alone to fight against the infidels. Hadith No 17 i Rasulullah (Sallallaho alaihe wasailam) said, \"An announcer will call out on the Day of Judgement, 'Where are the wise ones?' People will enquire. 'Who are meant by the wise ones?' The reply will be, 'They are those who always remembered Allah, whether sit- ting, standing or reclining, and pondered over the cre- 62 Virtues of Zikr ation of the Heaven and the Earth, and would say, \"0 Allah! Thou hast not created all this in vain. We glo- rify Thee: save us from the fire of Hell.\" Thereafter a flag will appear for them. and they will follow this flag and will be told to enter Paradise and stag for ever.\" By \"pondering over the creation of the Heaven and the Earth\" is meant that they contemplate over the phenomena and secrets of the things created by Allah, and thereby strengthen their spiritual knowledge. The whole universe is like a garden planned and planted by Allah. As narrated by Ibn Abid Dunyaa, Rasulullah (Sallal- laho alaihe wasallam) once approached a group of Sahabah who were sitting in silence. He asked them what they were thinking about. The Sahabah replied that they were pon- dering over the wonderful creations cf Allah. Rasulullah (Sallallaho alaihe wasallam) appreciated it and said \"Do not ever meditate over the Self of Almighty Allah, (He is beyond comprehension), but do meditate over His creation\" Somebody once asked Hadhrat Aa'ishah (Radhiyallaho anha) to relate some remarkable thing about Rasulullah (Sallallaho alaihe wasallam). She replied. \"There was noth- ing about him that was not remarkable. Once he came home at night and lay down in my bed. After a short while, he said 'Let me pray to my Lord! Saying this, he got up, performed wudhu and stood up in salaat. during which he wept so profusely that tears flowed onto his chest. Then he continued weeping in the same manner while performing ruku and sajdah. He spent the whole night like this. till Hadhrat Bilaal came to call the azaan for the morning prayer. I pleaded with him. 'Almighty Allah has promised you His forgiveness. then why did you weep so much?' He replied, \"Should {not be a grateful slave of my Allah\", and continued. \"Wby should I not pray and weep when these verses have been revealed to me today: ? 01 +\\L @ ........ *g\\- dl+\\ & 2 4 h 2~ J - eignty) for men of understanding such as .remember Allah standing, sitting and reclining . . . . Then he added, 'Destruction is for the person who, in spite of reading these verses, does not ponder over His cre- ation.\" Aamir bin Abdul Qais (Rahmatullah alaih) said, \"I heard from the Sahabah not from one or two or three, but from many of them-that the light and radiance of faith lies in contemplation and meditation.\" Hadhrat Abu Hurairah (Radhiyallaho anho) narrated, from Rasulullah (Sallallaho alaihe wasallam) that a person lying on the roof of his house was looking at the sky and stars for some time, and then said, \"I swear by Allah and I believe there is some- body who has created you all; 0 Allah! forgive me for my sins.\" Thereupon Allah's mercy turned towards him and he was forgiven. Hadhrat Ibn Abbas (Radhiyallaho anho) said that meditation for a short duration of time is better than worshipping throughout the night. Similarly, Hadhrat Anas, (Radhiyallaho anho] narrated that meditation over the creations of Allah is better than doing worship for eighty years. Somebody asked Hadhrat Umme Darda (Rad- hiyallaho anha) as to what had been the best kind of worship done by her husband, Hadhrat Abu Darda (Rad- hiyallaho anho). She replied it was meditation and contem- plation. According to Abu Hurairah (Radhiyallaho anho) Rasulullah (Sallallaho alaihe wasallam) had said that medi- tation and contemplation for a short duration of time is better than worship for sixty years. It should not be de- duced from the various quotations given above that medita- tion obviates the necessity of worship. If anybody neglects any form of worship, he is liable to the same penalty and punishment, as for a fardh or waajib if a fardh or waajib is abandoned, and so for a sunnat or mustahab if any of these is neglected. Imam Ghazaali (Rahmatullah alaih) has written that i meditation is held to be superior tr? zikr because, in ad- dition to the essence of zikr, it includes two additional things, of which one is recognition of Allah, for which meditation is said to be the key, and secondly the love of Allah, which is induced by deep thinking. It is this medita- tion, which the Sufis call 'muraaqabah', and the virtue of which is narrated in many ahaadith. Hadhrat Aa'ishah (Radhiyallaho anha) reported that \"Lo! in the creation of heaven and earth. and in the Rasulullah [Sallallaho alaihe wasallam) had said silent difference of night and day, are tokens (of His sover- 65 Virtues of Zikr lence. We have also read the hadith that favours loud zikr, Between the lover and the beloved, there is a code of communication that is not known even to the reporting as of a mad man. Either form of zikr is important under dif- ferent sets of conditions. It is for the Shaikh (religious guide) of a person to prescribe the best form of zikr for him angels. at a particular time. How fortunate are the people who do not remain idle from zikr even for a moment. In addition to the reward that Hadith<br><hr><br>they will get for their outward prayers, their zikr and medi- tation throughout their life will earn for them seventy times extra reward. It is for this reason that the devil remains worried. Hadhrat Junaid (Rahmatullah alaih) is stated to have seen Satan starkanaked in a dream. He asked him whether he did not feel ashamed of the men around him. \"Are these men?\" replied the devil, \"The men are those who are sit- ting in the mosque of Shonezia, who have worried me so much that my body has become lean and thin, and my heart is burnt.\" Hadhrat Junaid (Rahamatullah alaih) writes that he went to the mosque of Shonezia and saw that a few i Rasulullah (Sallallaho alaihe wasallam) house when the verse was in his men sitting there were deeply absorbed in meditation. When they saw Hadhrat Junaid (Rahamatullah alaih) they told him not to be misled by the deceptive words of the wicked Satan. Similar to this, Masoohi (Rahmatullah alaih) has also written about a dream. On seeing Satan in naked condition, he asked him whether he did not feel ashamed of being naked in the midst of men. The Satan replied, \"By I I Keep yourself bound to the company of those who invoke their Lord, morning and evening was revealed to him. On this revelation, he went out in I 1 66 7 Virtues of Zikr search of such people; he found a group of men who were engaged in zikr. Some of them were with dishevelled hair, parched skins, and clad in a single cloth i.e. except for the loin cloth, the whole body was naked. On seeing them, Ra- sulullah (Sallallaho alaihe wasallam) sat down by them and said, \"All praise is for Allah who has created in my ummah such people that I have been ordered to sit in their company.\" According to aiother hadith, Rasulullah (Sallallaho alaihe wasallam) went out in search of them and found them in the farthest part of the mosque, where they were busy in zikr of Almighty Allah. He said, \"All praise is for Allah Who has created, during my lifetime, such people that I have been ordered to sit with them.\" Then he con- tinued, \"My life and death is with you\" (i.e. You are my companions in life and death.) It is mentioned in one hadith that a group of Sahabah, including Hadhrat Salmaan Faarsi (Radhiyallaho anho) were engaged in zikr of Allah, when Rasulullah (Sallallaho alaihe wasallam) came to them. They became all silent. In reply to his enquiry as to what they were doing, they submitted that they were prac- tising zikr of Allah. Rasulullah (Sallallaho alaihe wasallam) said, \"I saw that the mercy of Allah was descending upon you, and so 1 desired that I should join your company. Al- hamdu lillah (All praise is for Allah)\" he then continued, \"Almighty Allah has raised such pecple in my ummah that He ordered me to sit in their company.\" It is from such orders of Almighty Allah that the Sufis have deduced that the Shaikh should also sit with his dis- ciples. In addition to the benefit. that will thereby accrue to the disciples, it will provide good excercise for the person of the Shaikh. In the effort to tolerate the vulgarities of the uncivilized and uninitiated .people, his ego will undergo severe strain, and thereby he will develop humbleness in him. In addition to this, the get-together of the hearts is im- portant for attracting the mercy and grace of Almighty Allah. It was for this reason that offering prayers in congre- gation was started, and this is why all the pilgrims (in uni- form appearance) are made to pray to Allah together at the same time, in the valley of Arafat. This point has been re- peatedly and specially stressed by Shah Waliullah (Kahma- tullah alaih) in his book, Hujjatullaahil Baalighah. All these virtues, as mentioned in many ahaadith, relate to the group of people who are engaged in zikr. On the other hand, if somehow one happens to be in a group of the negligent, and even there he keeps busy with zikr of Allah, great reward is also promised for him, as stated in many ahaadith. On such occasions, it is all the more necessary that one should remain absorbed in remem- brance of Allah, so that he is immune from the evil effect of such company. According to one hadith, a person who remains en- gaged in zikr, while in the company of the negligent is like one who remains steadfast in his allotted position in a jihaad (holy war), while his companions are fleeing for their lives. In another hadith, he is like one who fights the infidels single-handed, after his companions have fled away. He is also likened to a lamp in a dark house or a beautiful green tree in autumn, when all the trees have % shed their leaves. Almighty Allah will show him before- hand his abode in the Paradise; all his sins, even if equal to 2 + the number of all men and animals, will be forgiven. All these rewards are subject to the condition that one remains g h engaged in zikr while in the company of the negligent; otherwise it is forbidden even to join in such meetings. According to one hadith, one should keep away from those so-called friendly gatherings where there is nothing but idle talk and merrymaking. A pious man once took his negro maid-servant to the bazaar. He left her at a place and asked her to await for his return there; went about the market. When he returned, he was upset to find her miss- ing. He went home, when he found the maid-servant was already there. She came to him and said. '0 Master! do not be angry with me in the haste; you left me in the midst of people who were absolutely negligent in the remembrance of Allah; I feared lest some calamity should befall them, or the Earth should devour them. and I too be buried along with them.\" Hadith<br><hr><br>Rasulullah (Sallallaho alaihe wasallam) said that Almighty Allah says, \"Do My zikr for some time after 68 69 Virtues of Zikr Fajr salaat and after Asr salaat, and I will suffice for you during the intervening periods.\" In one hadith it is stated, \"Do zikr of Allah, He will look after your interests.\" Note: We work so hard for this worldly life, though not for the life Hereafter. We lose nothing if we remember Allah for a little while after Fajr and after Asr, because so many virtues have been mentioned for doing zikr at these two times. When Almighty Allah promises His full help, what more is needed? According to one hadith, Rasulullah (Sallallaho alaihe wasallam) has said, \"I prefer sitting with those who remain busy in remembering Allah after Fajr prayer up to sunrise, to the noble act of setting four Arab slaves free; and simi- larly I prefer sitting with ths group who remain busy in zikr !of Allah after Asr salaat up to sunset to setting four slaves free.\" According to another hadith, if a person offers Fajr salaat in congregation and remains engaged in zikr of Allah until sunrise, and then offers two rakaats of nafl salaat, his reward will equal to that of a perfect Hajj and Umrah. Rasulullah (Sallallaho alaihe wasallam) is also stated to have said, \"offering Fajr salaat in congregation, and then remaining busy in zikr until sunrise, is more pre- cious to me than this world and all that it contains. Simi- larly, remaining busy in zikr with a group after Asr till sunset is preferred by me to this world and everything that it contains.\" It is for this reason that the time after Fajr and Asr prayers is specially reserved for zikr as a matter of rou- tine by the Sufis. Especially, the time after Fajr prayer is also reserved for zikr, even by the Fuqahaa i.e. the Muslim jurists. I It is stated in the book 'Mudawwanah' on the authority of Imaam Maalik (Ral~matullali alaih) that it is makrooh i (undesirable) to indulge in talking during the time between i Fajr and sxnrise. From amongst the Hsnafees the author of Durrul Mukhtaar also regarded it undesirable to indulge in talking during this time. According to one hadith, if after Fajr prayer a person continues to sit in the same posture before talking, recites the following kalimah ten times, ten virtues will be recorded to his account, ten sins remitted, his position in Paradise raised by ten degrees, and he will Ch. I: Ahaadith on Zikr be protected from the Devil and other undesirables throughout the day. Nobody is worthy of worship except Allah; He is one, and He has no partner. This world and the Hereafter belong to Him and He is worthy of all praise; life and death are controlled by Him, and He controls the destiny of every- thing. According to another hadith, whosoever, after Fajr and Asr, recites three times the following prayer: I seek pardon of Allah, except whom there is nobody worthy of worship and Who is living and eternal; I turn to Him. All his sins, even if big like the sea, will be forgiven. Hadith<br><hr><br>Rasulullah (Sallallaho alaihe wasallam) has said, \"The world and all it contents, are accursed (i.e. are devoid of Allah's mercy), except the folowing three: (1) zikr of Allah and everything that is near it, (2) the (Religious) aalim, and, (3) the student (the seeker of religious knowledge).\" The first may mean either the things near to zikr of 70 Virtues of Zikr herein are by parts corroborated by many other ahaadith. In fact, many additional virtues are mentioned in the books of I ahaadith, let alone the foregoing accounting for the specific mention of the 'aalim' and the student in the fore-men- tioned hadith. Hafiz Ibn Qayyim (Rahmatullah alaih), a well-known muhaddith, has written an authentic book, named 'al-Waa- bilus Sayyib', on the virtues of zikr. He has stated therein that the virtues of zikr are more than one hundred and he has listed seventy nine of these, which are briefly given below in the same order. Some of these include multiple benefits, and for this reason their actual number is more than one hundred: (1) Zikr keeps away the Satan and weakens his L. strength. o m L 2 4 (2) It is the cause of Almighty Allah's pleasure. Z N .- + (3) It relieves the mind of anxieties and worries. (4) It produces joy and happiness in the heart. (5) It strengthens the body and the mind. (6) It brightens the face and the heart. (7) It attracts one's sustenance. I (8) It invests the zaakirs with awe and sweetness so that the seeing eye is filled with awe and pleasure at his sight. I (9) It induces love for Allah, which in fact is the spirit of Islaam and the pivot of deen, and the source of success and salvation in the Hereafter. He who seeks access to the love of Almighty Allah should do zikr profusely. Just as reading and repetition is the door of knowledge, so zikr of Allah is the gate- way to His love. (10)Zikr involves muraaqabah (deep meditation), through which one reaches the stage of Ihsaan, wherein a person worships Almighty Allah as if he is actually seeing Him. (The attainment of this stage of Ihsaan is the ultimate objective of the Sufis). (11) It helps realization of Allah so that by and by a stage is reached when he comes to regard 7 2 Virtues of Zikr i Almighty Allah as his sole Cherisher, Guardian and Master, and he turns unto Him, in all afflic- tions. I (12) It is the key to nearness to Almighty Allah; the greater the zikr, the greater the nearness to Allah, and greater the indifference to zikr, the greater the distance from Him. (13)It opens the door of Ma'rifat (realization) of Allah. (14) It makes one realize the greatness and grandeur of Almighty Allah, and strengthens the conscious- ness of his omni-presence. (15)Zikr of Allah causes one's mention in the Court of Allah, as said in the Holy Book. % Remember me, and I will remember you, and as stated in a hadith I Whosoever remembers me in his heart, I remember , him in My heart. I ! It has already been explained under other verses and ahaadith that, even if there were no other good points in zikr, except that mentioned above, this alone would have established its superiority over others. Nevertheless, there are many more virtues and benefits of zikr. (16)It gives life to the heart. Hafiz Ibn Taimiyah (Rah- matullah alaih) says that zikr is as necessary for the heart as water for the fish. Imagine the con- dition of a fish out of water. (17) It is food for the heart and the soul; depriving them of zikr is like depriving the body of its food. (18)It cleanses the heart of its rust. It has been men- tioned in an earlier hadith; everything .rusts according to its nature; and the heart rusts with wordly desires and indifference, to purify it zikr is necessary. (19) It safeguards against pitfalls and lapses. (20) The heart of a neglectful person is tormented by a feeling of remoteness from Allah, and nothing other than zikr can rid the heart of this feeling. (21) The words of zikr keep on moving round the Arsh of Almighty Allah, as stated in a hadith. (22) If one remembers Allah in happiness, Almighty Allah remembers him in his afflictions. (23) It is a means to deliverance from Allah's punish- ment. (24) It causes Allah's peace and mercy to descend, while angels surround the person engaged in zikr. (25) It saves the tongue from indulging in backbiting, loose talk, lies and abuses. It is a common experi- ence that a man whose tongue remains engaged in zikr does not commit these absurdities. On the other hand, the tongue that is not used in zikr, falls an easy prey to all kinds of useless talk. 'z - 9 3 y N S (26) The gatherings of zikr are gathering of angels, and gatherings without zikr are gatherings of Satan. A person is free to have a choice between the two, and verily man, by instinct, is drawn towards what is akin to his temperament. (27) By virtue of zikr, the zaakir is blessed, as also the person sitting by him. Similarly the indolent person is accursed for his indolence, as also the person sitting by him. (28) Zikr will save one from despair on the Day of Judgement. This is confirmed by one of the ahaa- dith which says that the gathering devoid of Allah's zikr will cause sorrow and losses on that day. (29) If zikr is shared by tears and repentance in loneli- ness the zaakir will be blessed under the shadow of Allah's throne on the Day of Judgement, when hearts will jump to lips due to agony of intolerable heat of that day. (30)Those who remain busy in zikr are better re- warded by Allah than those who remain busy in 74 Virtues of Zikr du'aa and supplication. According to one hadith, Almighty Allah says that I will give better reward to one who is abstained by his engagements in zikr from making du'aa than all those who find time for making du'aa. (31) In spite of the fact that zikr is the easiest f ~ r l i i of worship (the movement of the tongue being easier than the movement of any other party of the body), yet it is the most virtuous form. (32)Allah's zikr helps the plants of Paradise to grow. (33)Of all actions the reward and forgiveness promised for zikr is the highest. According to one hadith if on any day a person repeats one hundred times the kalimah: There is none worthy of worship except Allah, the One. There is no partner with Him; His is the king- dom, and for Him is all praise, and He is All-pow- erful to do everything, he is rewarded as for freeing ten slaves, and in ad- dition one hundred virtues are written to his ac- count and one hundred sins are forgiven. He remains protected against the devil throughout the day, and none is considered as having acted better than him except one who has recited these words more often than him. Similarly, there are many other ahaadith proclaming the superiority of zikr over all other good deeds. (34) Due to incessant zikr one is able not to forget one's soul. Forgetting one's soul leads to failure in both the worlds, because forgetting the remembrance of Allah leads to neglecting one's soul and all its best interests. Allah says in His book: And be not ye as those who forgot Allah and there- 5 careless and forgets his re81 interests which leads to his ruin just as a garden or field is invariably ruined when its owner fails to look after it. Protec- tion against this ruin can only be provided by keeping one's tongue always busy in zikr, so that zikr should become as indispensable as water is at the extreme thirst, or food at the time of hunger, or the house and clothes for protection against ex- treme heat and cold. As a matter of fact, one should be more mindful of zikr than any of these material necessities, which at the most can result in physical death, which is a small loss as com- pared with the spiritual death. (35)Zikr is the source of one's spiritual elevation whether done in bed or in the market, whether in % good health or in sickness, or even when one is 8 5 making most of the pleasures of life. Nothing but g 3 zikr can take a man to such spiritual heights, 5 whereby his heart is so illuminated with the light of zikr that even asleep he is more wakeful than the neglectful person who is awake all through the night. (36) The noor (radiance) of zikr remains with a person in his life as well as in his grave. It will go in front of him on the Siraat. in the Hereafter. Almighty Allah says in the Quran: ' a . & b $ # G l & ? & Can he who was desd and whom We gave life, and a light whereby he can walk among men, be like him who is in utter darkness whence he cannot emerge. The one mentioned first is the faithful, who be- lieves in Allah and shines with the light of His love, zikr, and cognizance, while the second one is devoid of all these virtues. In reality this radiance is a great blessing and leads to perfect success. That is why Rasulullah (Sallallaho alaihe wasal- fore He caused them to forget their souls. Such are lam) used to beg for it in prolonged prayers, and the evil-doers. prayed for noor for every part of his body. As men- tioned in many ahaadith Rasulullah (Sallallaho Thus, when one forgets one's soul he becomes I 76 Virtues of Zikr 36 1 7 alaihe wasallam) prayed that Almighty Allah may bless his flesh, bones, muscles, hair, skin, eyes and ears with noor, and that he may be surrounded with noor on all sides; he even prayed that he may be blessed with noor from top to bottom, and that his whole person may be made into noor. One's deeds will shine according to the noor in oneself, so much so that the good deeds of some people (while going upto heaven) will shine like the sun. Similar noor will be found in their faces on the Day of Judgement. (37) Zikr is the basic principle of Tasawwuf (Sufism) and is invoked in all the schools of Sufism. A person who gets conversant with zikr enters the gateway to Almighty Allah, and one who enters this gateway is sure to reach Almighty Allah, from Whom he will get whatever he wants, for Allah's treasures are unlimited. (38)There is not a corner in the heart of a man, which can not be filled but with zikr. When zikr controls the heart, not only does it fill up this corner, but also does it lead the zaakir to contentment which wealth would fail to produce and to respect among people, which the family or party would fail to bring about, and to such control over people as a sovereign would never dream of. On the other hand, the indolent comes to disgrace, in spite of all his wealth and riches, party, strength and powers. (39)Zikr transform dispersion into concentration, and concentration into dispersion; and remoteness into nearness and nearness into remoteness. This means that one is relieved of one's troubles, wor- ries and fears, and is blessed with peace of mind. I His mistakes and sins are forgiven, and the devils who are after him are dispersed away. It makes him to remember that the Hereafter is not far away, and the worldly life has little attraction for hi^. I (40)Zikr does not allow one's heart to suffer from for- getfulness, which leads to ignore one's ultimate in- terest. (41) Zikr is just like a tree, the fruit of which is realiza- tion of Almighty Allah. The more zikr is done, the stronger shall grow the root of this tree; and stronger the root of this tree, the more abundant the fruit it will bear. (42)Zikr of Almighty Allah promotes nearness to Him and thereby earns His constant patronage. It is given in the Quran ljih j;$l b 5! No doubt Allah is with those who fear Him. It is stated in one hadith . - ' &w j& J (I 0 I am with my slave who remembers Me. $$ EN According to another hadith, Allah says, \"Those i' who remember Me are My men, and I do not de- prive them of My mercy. When they repent, I am their friend, but when they do not repent. I am their physician. I put them to worries to condone their sins.\" Nearness to Almighty Allah resulting from zikr has no parallel. No words and no writing can describe this nearness. Its taste is known only to those who are blessed with it. (May Almighty Allah also bless me with the same). (43)Zikr of Allah is as meritorious as liberating of slaves, and spending in charity, and jihaad in the path of Allah. (Many virtues of this kind have already been de- scribed and more will further be narrated in this book). (44)Zikr is the fundamental form of thanksgiving to Almighty Allah. One who does not do zikr cannot thank him. It is stated in hadith that Hadhrat Moosa (Alayhis salaam) had asked Almighty Allah \"0 My Lord! You have done me countless favours, teach me the manner in which I should thank you befittingly.\" Almighty Allah said, \"The more zikr you do, the more thanks you offer.\" According to another hadith, Hadhrat Moosa (Alayhis salaam) is reported to have said, \"0, Lord! how can I offer 78 Virtues of Zikr 1 thanks worthy of Your greatness.\" Almighty Allah replied, \"Let your tongue always remain engaged in zikr.\" (45)According to Almighty Allah, the best of the pious people are those who always remain busy in zikr, because piety leads to paradise, and zikr to the nearness to Allah: (46)There is a sort of hardness in the human heart, which is not softened by anything except zikr. (47)In fact, zikr is a remedy for all ills of the heart. (48)Zikr of Allah is the root of His love, and neglecting zikr is the root of His enmity. - (49)Nothing is more effective than zikr in attracting Allah's blessings and in warding off His chastise- ment. (50)Almighty Allah grants His grace to those who do zikr, and the angels pray for them. (51)One who wants to remain in the gardens of Para- dise, even in this life, should sit in the gatherings of zikr, because these are likened to the gardens of Paradise. (52)Gatherings of zikr are also the gatherings of angels. (53) In the presence of the angels, Almighty Allah praises those who do zikr. (54)One who 'is constant in doing zikr will enter Para- dise in high spirits. (55)All good deeds have been ordained because of zikr.. (56)A good deed becomes superior to others of its kind because of zikr. Of the fasts, the one with more I zikr is the best; Of the Hajj, one with excessive zikr is more virtuous. Similar is the case with other good deeds like jihaad etc; (57)Zikr is a substitute of nafl salaat and other non- obligatory devotions. It is related in one hadith that the poor people once complained to Rasulul- lah (Sallallaho a!aihe wasallam) of the higher reward available to the rich because of their wealth. They said, \"These rich men offer prayers and fast, just as we do, but they excel us by per- forming Umrah and Hajj, and taking part in jihaad on account of their wealth.\" Rasulullah (Sallallaho alaihe wasallam) replied, \"Should I tell you some- thing, so that none except one who practices it can excel you.\" He then advised them to recite after every salaat: By this Rasulullah (Sallallaho alaihe wasallam) had indicated the importance of zikr, to be the substitute for various kinds of worship, like Umrah, Hajj, jihaad, etc. o (r aa (58)Zikr is very helpful to all other forms of worship. g R Excessive zikr creates love for various forms of 5 worship, so that one starts taking delight in their performance and never feels bored or burdened while offering them. (59)Zikr is a solution to all difficulties, and remedy for all handicaps. It lightens every burden, and re- lieves every affliction. (60)Zikr dispels every fear of the heart. It has a special hand in inducing peace of mind and for relieving the heart of its fear. To free the heart of its fears and mind of its perplexity is one of the specific qualities of zikr. The greater, therefore, the amount of zikr, the greater freedom from fear. (61)By zikr one is blessed with divine help that asso- ciates in all one's doings. That is why some time man's achievements surpass his powers, and he attains what was seemingly beyond his reach. This is perhaps the reason why Rasulullah (Sal- lallaho alaihe wasallam) advised his daughter Hadhrat Fatimah, (Radhiyallaho anha) to recite B i;;ji a, ;G thirty three times each and ;;i& thirty , . four times before going to bed at night, when she approached him for a helper, complaining that she was over-worked by the labour of grinding wheat and doing other house-hold jobs. 'The Prophet 1 80 Virtues of Zikr (Sallallaho alaihe wasallam) further said, \"The recitation of these kalimahs is better for you than a servant.\" (62) Those who are working for the life Hereafter are in a race, wherein the zaakirs shall remain ahead of all on account of their zikr. On the day of Judge- ment, says Umar Maula Ghufra (Rahmatullah alaih), when people will be rewarded for their good deeds, many shall repent why they neglected zikr when it was easiest of all good deeds and the highest in reward. In a hadith, Rasulullah (Sallal- laho alaihe wasallam) is quoted to have said, \"The mufarrideen have surpassed all.\" He was asked, \"Who were the mufarrideen?\" The Prophet (Sallal- laho alaihe wasallam) replied, \"Those who toil hard for zikr because it lightens their burdens.\" (63) Those who do zikr are held truthful by Almighty Allah, and those who are testified as such by Almighty Allah cannot be raised among the liars on the Day of Judgement. It is quoted on the auth- ority of Prophet (Sallallaho alaihe wasallam) that when a man utters, Allah proclaims, \"My slave has spoken the truth, and nobody is worthy of worship except I, and I am the Greatest of all.\" (64) Zikr causes houses to be built in Paradise by the angels. When zikr is stopped, the angels also stop construction of houses. When asked why a par- ticular construction was stopped by the angels, they reply, \"The construction had to be stopped because funds for that were stopped. The fact is I confirmed by a hadith, which says when a man re- cites 41 b G 4 k j d% seven times, a tower is raised for him in paradise. zikr. It is related on the authority of Hadhrat Amr bin Aas (Radhiyallaho anho) that when a man says j 1 9% 9.1 the angels pray to 4; A- l;iji Almighty Allah for his forgiveness. (67)The mountain or plain on which zikr is recited feels proud of it. According to a hadith, one moun- tain asks another if any zaakir has crossed over it during the day. If the.reply is in the affirmative. it feels happy. (68) Zikr guarantees immunity from hypocrisy, for Almighty Allah has described the hypocrite as % YI i l b;;ij; y They do not remember Allah except very rarely. It is also related on the authority of Ka'b Ahbaar (Radhiyallaho anho) that he who makes frequent zikr of Allah is free from hypoc- risy. e l (69)Compared with other good deeds, zikr carries a special taste, which is not to be found in any other action. Even if there were no other virtue to zikr, this fine taste alone would have been a sufficient reward to justify it. Maalik bin Deenaar (Rahmatul- lah alaih) has said that nothing surpasses the taste of zikr, which is the best and finest. (70)The faces of those who do zikr remain bright in this life, and will carry a special radiance in the Hereafter. (71) One who is frequently engaged in zikr, whether he is in or out of his house, whether he is stationary or travelling, he will find, on the Day of Judge- ment, a large number of witnesses in his favour. Almighty Allah has described the Day of Judgment as 6jVI LLJ +3 The day when the Earth will tell all that it knows. Rasulullah (Sallallaho alaihe wasallam) asked his companions if they knew what those news would be. They expressed their ignorance. Then Rasulul- lah (Sallallaho alaihe wasallam) said, \"Whatever (65) Zikr provides protection against Hell. If, due to deed is done, good or bad, by any man or woman any misdeed a zaakir deserves Hell, his zikr acts as on the face of the Earth, the Earth will describe it a defence between him and the Hell, the more his all, with d a t ~ , time and place.\" Hence, one who zikr, the stronger will be this defence. does zikr at many places will find many witnesses in his favour. (66)The~ngelspray for the forgiveness of those who do 82 Virtues of Zikr I (72) As long as the tongue is busy in zikr, it cannot in- dulge in lies, backbiting or any other kind of evil talk. The tongue will engage itself in useless talk if it is not in zikr, because it-cannot remain quiet. So 1 is the case with the heart; if it is devoid of love for Almighty Allah, it will be filled with the love of I worldly things. (73) The devils are outright enemies of man and always create trouble for him and keep him surrounded. I The miserable condition of one who remains sur- rounded by enemies can well be imagined, espec- ially when the enemies are vindictive and everyone of them wants to surpass the other in troubling him. Nothing except zikr can protect him against these enemies. Many forms of du'aa are mentioned in the ahaadith, so that, if any of these is recited by a person, then Satan dare not come near him. If the same is recited at the time of going to bed, one remains safe from the Satan throughout the night. Hafiz Ibn Qayyim (Rahma- tullah alaih) has also mentioned many such du'aas. In addition to these, the author has also mentioned in detail under six headings the relative merits of zikr as also some of its virtues, which are specific to zikr alone. Then he has also given seventy five chapters on special du'aas, which are suited to specific times and occasions. For the sake of brevity, these have been excluded from this book. For those blessed with determination to act, the virtues of zikr detailed above are more than enough, and for those who are disinclined to act, thousands of such virtues would be of little avail. si g, &; & $! 3 3 .-. b, I < - 1 Whatever good I have done is through the grace of i Almighty Allah; I, therefore, depend on Him and turn to Him. CHAPTER I1 KALIMAH TAYYIBAH Kalimah Tayyibah, which is also called Kalimah Tau- heed (utterance of Unity), has been mentioned in the Qur'an and the hadith far more frequently than anything else. Since all the saints and Prophets had been sent speci- fically with the primary aim of propagating the Unity of Allah, its excessive mention can well be understood. In the Holy Qur'an, this kalimah has been referred to by various names and in different contexts. It has been referred to as Kalimah Tayyibah (excellent utterance), cat J3) (firm state- % V) L. ment) (cs# iJS) (utterance of piety), (/jJlj al&l (key of 3 heaven and earth), etc: as will be found in the Qur'anic E N verses given in the following pages. Imaam Ghazaali (Rah- matullah alaih) has written in his book Ihyaa that it is (+PILIo (utterance of Unity) W * ~ U ) (utterance of sincer- ity) (&#dl LK) (utterance of piety) (a U) (excellent utter- ance) ( j r 3 1 a ~ j ) (strong rope) (&I Yj) (call of truth) (SlJ;) (price of paradise). As this kalimah has been mentioned in various con- texts in the Holy Qur'an, this chapter is divided into three parts. The first part includes those verses wherein the words of Kalimah Tayyibah do not occur, although it is im- plied therein. Each verse is followed by a brief explanation, as given by the Sahabah and by Rasulullah (Sallallaho alaihe wasallam) himself. The second part consists of t h o s ~ verses which contain tlie text of Kalimah Tayyibah i.e. ~ I Y ! in full-, or slightly J!Y modified, such as j i y ~ i ~ j . the kalimah As the words of occur in these verses, their translation has not been consid- ered necessary. Only the surah and ruku, in which the avat occurs, has been indicated. The third part includes the translation and explanation of those ahaadith that describe the virtues and importance of this kalimah (Whatever has been done is merely through Allah's grace). I Virtues of Zikr PART I I I This contains those ayaat in which the words of the Kalimah Tayyibah do not occur, although it is implied therein: (I) Seest thou not how Allah explains through a parable. Good words are like a good tree that is firmly rooted and its branches reach the sky. It brings fruit at all times, under order from its Lord. So Allah explains through parables for men that they may take heed. The parable of evil words is like an evil tree. It is torn up by the root from the surface of the Earth. It has no sta- bility. Note: Hadhrat Ibn Abbas (Radhiyallaho anho) has explained that the words \"Kalimah Tayyibah\" in this ayat mean the Kalimah Shahaadat which is like a tree with its roots in the hearts of the faith- ful and its branches spread out up to Heaven, by means of which the deeds of the faithful climb up to Heaven; and w w (ugly utterance) is the utterance of Shirk, which prevents any good deed from being accepted. In another hadith, it is stated by Ibn Abbas (Radhiyallaho anho) that \"bearing of fruit all the time\" means that almighty Allah be remembered day and night. It was narrated by Hadhrat Qataadah (Rahmatullah alaih) that somebody had said to Rasulullah (Sallallaho alaihe wasallam), \"The rich are able to earn great rewards (by virtue of spending their wealth in charity)\". Rasulullah 85 ) Whosoever desires glory and power (should know) that L. glory and all powers belong to Allah; Unto Him good sg words ascend and He exalts all righteous deeds. tfN - According to the majority of :o~mentators, the Kali- S mah Tayyibah in this ayat means (&I ys ir!9), but some are of the opinion that it implies the kalimah of tasbeeh. as will be described in part 11. (3) The word of thy Lord finds its fulfilment in truth and in justice. According to Hadhrat Anas (Radhiyallaho anho), Rasu- lullah (Sallallaho alaihe wasallam) had said that the kali- mah of the Lord means the kalimah klj!ii!9. Bu: many con~mentators are of the opinion that it means the Holy Qur'an. (4) Allah will confirm those who believe in words that stand firm, in this world and in the Hereafter, and Allah sends wrong doers astray. Allah does what He wills. Hadhrat Baraa (Radhiyallaho anho) stated that Rasulul- lah (Sallallaho alaihe wasallam) had said, \"At the time of interrogation in the grave, a Muslim bears witness to 86 Virtues of Zikr and this is meant by the words (firm statement) in this ayat. Hadhrat Aa'ishah (Radhiyallaho anha) also corroborated that it refers to the interrogation in the grave. Hadhrat Ibn Abbas (Radhiyallaho anho) said, \"When a Muslim is about to die, the angels come to him, greet him, and convey the glad tidings of paradise; after his death, they accompany him and join his funeral prayer; and after he is buried, they make him sit up when, in the grave, questioning starts. He replies 'I bear witness that there is nobody worthy of worship except Allah. and I bear witness that Muhammad is the messenger of Allah.' 'I'his is what is implied in this ayat.\" Hadhrat Abu Qataadah. (Radhiyallaho anho) also said that c+ujh (firm statement) refers to the Kalimah 'I'avyibah in this life. and the interrogation in the grave after dcath. Hadhrat Taa'oos (Kahmatullah alaih) also gave the same interpretation. (5) Unto Him is the real praver. Those unto whom they prav besides Allah responds to them not at all. Thev are like those who stretch forth their hands for water to reach their mouths but it reaches them not. The praver of clisbelie\\lers goes astray. Note: According to 1-jadhrat Ali (Radhiyallaho anho) as well as Ibn Abbas (Radhi!lallaho anho) and Inanv others, the words ;$I +(propagation of truth) means this kalimah. I I I L f I I 1 1 7 (6) Say: 0, people of scriptures! Come to an agreement be- tween us and vou; that we shall worship none but Allah and that we shall ascribe no partner unto Him. and none of us shall take others for Lords beside Allah. And if you turn awav, bear witness that we (at least) are Muslims. Note: This sacred ayat is self-explanatory, in that the word kalimah in this a p t implies tauheed and the Kalimah Tayvibah. The same view-point has been categorically con- firmed by Hadhrat Abu Aaliyah and Hadhrat Mujahid (Rahmatullah alaitiima). > (7) You are the best of people, evolved for mankind, en- joining what is right, forbidding what is wrong, and be- lieving in Allah. If only the people of scriptures had faith. it were best for them: among them are some who have faith; most of them are transgressors. Note.: Hadhrat Ibn Abbas (Radhiyallaho anho) has stated 4j94 b j j~ (i.e. vou enjoin \\he good) means that vou enjoin the people to believe in 'sl! Y! ;1!9 and obey Almightv Allah; and that this kalimah is by far the best and foremost of all the good things. +$ . . +-*I i! ' $1 @, )@I & &I\\ &I, (A) ( \\ - t a,. ) ~ifi'iu qU.I ' . . &;i? (8) Establish regular prayer at the two ends of the day and at the approaches of the night. Lo! good deeds annul i l l deeds. This is a reminder for the mindful. The expla~lation of this sacred avat is to be found in maliy ahaatlith ac:cording to whic:h Kasulullah (Sallallaho alaihe wasnll;lnl) while refering to this ayat had said that good cieeds wipe out the sins from one's acc:ount. l-iadhrat Abu Zar (Katlhi!lallaho rt~iho) says that he had once re- quested Kasulullah (Sallallaho alaihe wasallam) to give him some advice and Kasulullah (Sallallaho alaihe wasal- 88 Virtues of Zikr lam) replied, \"Hold Almighty Allah in constant fear. If per- chalice you commit anv sin. hasten at once to do some vir- tuous deed so that the sin is atoned, and it is written off.\" 'Then Abu Zar (Radhiyallaho anho) continues to say that he asked Kasulullah (Sallallaho alaihe wasallam) if this kali- mah I was also counted amongst the virtues. At this, Kasulullah (Sallallaho alaihe wasallam) gave the replv that this kalimah is the highest of all virtues. It is likewise quoted from Hadhrat Anas (Radhiyallaho anho) that Rasulullah (Sallallaho alaihe wasallam) had said \"Whosover, any time during the day or night, recites the kalimah I ! . his sins are washed off his ac- count.\" (9) (a) Lo! Allah enjoineth justice and kindness and giving to kinsfolk. He forbids shameful deeds, in- justice and rebellion. He instructs you in order that you take heed. There are different versions regarding the interpreta- tion of the word 2-i; (justice). In one version, Hadh- rat Abdullah bin Abbas (Radhiyallaho anho) says that ?L (justice) means to believe that nobody is worthy of worship except Allah, while J (goodness) means to do one's obligations to Allah. (10) 0, you who believe! Fear Allah and say words straight to the point, that He may make your conduct sound and forgive your sins. Whosoever obeys Allah and His Prophet (Sallallaho alaihe wasallam), he has attained the highest achievement. Hadhrat Abdullah bin Abbas and Hadhrat Ikramah (Radhiyallaho anhuma) are both said to have been of the view that the meaning of L Y I 8 , (and speak words straight to the right) is to recite the I kalimah. According to one hadith, three things constitute the best of all actions. The first is to do zikr of Allah under all circum- stances, in happiness and in grief, in poverty and in afflu- ence; the second is to conduct oneself with impartiality even when one's own interests are involved; and the third is to help one's brother with money. (11) Give good tidings to my servants, who hear advice and follow the best thereof. Such are those whom Allah guideth, and such are men of understanding. Hadhrat Ibn Umar (Radhiyallaho anho) said that Hadh- rat Sa'eed bin Zaid, Hadhrat Abu Zar Ghifaari and Hadhrat 'b Salmaan Faarsi (Radhiyallaho anho), all the three, used to ~l 2 L recite the kalimah I even before they em- 5 EN braced Islaam, and by the words I I (the best ut- terance) what is exactly meant in thls sacred ayat is this kalimah. Hadhrat Zaid bin Aslam (Radhiyallaho anho) had also said that this ayat relftes to three persons who used to recite the kalimah I Y A even in their days of ig- norance, and they were Hadhrat Zaid bin Amr bin Nufail, Hadhrat Abu Zar Ghifaari and Hadhrat Salmaan Faarsi (Radhiyallaho anhum). (12) He who brings the true thing and He who confirms it; such are the dutiful. They shall have all they wish from their Lord's bounty. Such is the reward of those who do good. The persons who brought the message from Almighty Allah are the Prophets (Alaihimus salaatu was salaam) and the people who brought a message from Rasulullah (Sallal- laho alaihe wasallam) are the Ulama (May Allah accept their efforts). Hadhrat lbn Abbas (Radhiyallaho anho) is stated \\o Fave said that \"the true thing'' means the kali- mah AIY!a19 . According to some commentators, the 90 Virtues of Zikr 37 words Z L ' l i ;& 2-i\" (one who brought the true message froni Allah) refers to Kasulullah (Sallallaho alaihe wasal- lam) and the words 2 (those who confirmed it) refer to the believers. (13) In the case of those who say, \"Our Lord is Allah\", and afterwards are steadfast, the angels descend upon them saying, \"Fear not, nor grieve but hear good tidings of the Paradise which you were promised. We are your protecting friends in the life of the world and in the Hereafter. There you will have all that your souls desire, and then vou will have what you pray for. A gift of welcome from the forgiving the Merciful.\" Hadhrat Ibn Abbas (Radhiyallaho anho) said that the words cli;Gl2ti, (then remained steadfast) means that they remained steadfast in their belief in the kalimah +t$!d!5!) Hadhrat Ibrahim and Hadhrat Mujahid (Rahmatullah alai- hima) both supported the interpretation \"they stuck to the kalimah (i~u'!ii!J) upto their death, and never indulged in Shirk of any kind\" (14) Who is better in speech than one who calls (men) to Allah and doeth righteous deeds and says, \"I am among those who bow in Islaam (the Muslims).\" Hadhrat - Hasan (Radhiyallaho anho) said that the words (flllJ!W (invited towards Allah) refers'to the call- ing of &IY!~~!Y, by the muazzin. Aasim bin Hubairah (Rahmatullah alaih) advised, \"After finishing azaan, one should recite Nobody is worthy of worship except Allah: Allah is the greatest and I am from among the Muslims. (15) Is the reward of goodness ought save goodness? Which is it, of the favours of your Lord, that ye deny? Hadhrat Ibn Abbas (Radhiyallaho anho) narrated that Rasulullah (Sallallaho alaihe wasallam) had said, \"The meaning of this ayat is that Allah says, 'Can there be any other reward than Paradise in the Hereafter for one whom I blessed in his worldly life with the recitation of kalimah ( i t j! A$) .\" Hadhrat Ikramah and Hadhrat Hasan (Ra- dhiyallaho anhuma) have also said that the reward of 3 y'! &J) cannot be anything but Paradise. I B (16) Then Allah sent down His tranquility upon His Mes- senger and upon the believers and imposed upon them the word of self restraint, for they were entitled to it and worthv of it. (*u)(utterance of piety) in this hadith means kalimah Tayvibah as explained in many narrations. Hadhrat Abu Hurairah and Hadhrat Salama (Radhiyallaho anhuma) quoted Rasulullah (Sallallaho alaihe wasallam) as having said that it means &J!A!J) . The same view was expressed bv Hadhrat Ubavv bin Kab. Hadhrat Ali, Hadhrat Umar. Hadhrat Ibn Abbas. Hadhrat Ibn Umar, and many other Sahabas. (Radhivallaho anhum). Ataa Khurasani (Rahma- tullahi alaihi) was of the view that it meant the whole Kali- nlah Tayyibah i.e. i l j ~ ~ ~ i ~ Hadhrat ~ l ~ Ali ~ while ! (Radhiyallaho anho) .had said that it meant $i kih $ 4 ~ Tirnlizi is stated to have quoted on the authority of Baraa (Rddhivaliaho anho) that this implied: t $A!J . (&', 2 3 3 1 (CV) @ (17) Those who purify themselves wili prosper. Hadhrat Jaabir (Radhiyallaho anho) has quoted Rasulul- lah (Sallallaho alaihe wasallam) to have said that 21 92 Virtues of Zikr 37 i (purified) means he declared his faith i n h j>;s 311 u'! i!Y and gave up idol-worship. According to Hadhrat k a y h (Ra- dhiyallaho anho) 2 3 means he proclaimed b 4! d!J and this also was the viewpoint held by Ibn Abbas (Radhiyallaho anho) (18) As for him who giveth and is dutiful (towards Allah) and believeth in goodness. Surely we will ease his way unto the state of ease. (JA) (state of ease) means Paradise, because it is Paradise where all kinds of comforts and facilities will be available. Its further elaboration is that Allah will so grace a man as to make good deedseasy for him, which will ex- pedite his entry to Paradise. Many commentators are of the view that the above-mentioned ayat was revealed in favour of Hadhrat Abu Bakr (Radhiyallaho anho). According to Hadhrat Ibn Abbas (Radhiyallaho anho) the word (&I) (good thing) mentioned in this ayat means the kalimah 31 j! d!Y) . Hadhrat Abu Abdur Rahmaan Salmi (Radhiyallaho anho) also shares this view. Hadhrat Imaam-e-A'zam (Rahmatullah alaih) quoting on the auth- ority of Abu Zubair and Hadhrat Jaabir (Radhiyallaho anhuma) says that Rasulullah (Sallallaho alaihe wasallam) explained that (>4 JL) means 'testified 31 j~ ii!j ', while $.Ac +k means 'refi;teds. (1 9) He who does a good deed shall have ten times as much to his credit. He who does an evil deed will be awarded according to his evil. No wrong shall be done to them. ' ,-, .. It is related when this ayat *kbk 3 descended, someone asked Rasulullah (Sallallaho alaihe wasallam) if the reciting of (b g! A!$ was also counted among their vir- tuous deeds. The Prophet (Sallallaho alaihe wasallam) re- plied that it is the best of all virtues. Hadhrat Abdullah bin Abbaas and Hadhrat Abdullah bin Mas'ood (Radhiyallaho anhum) take (b) (virtue) to mean j\\ ill% . Hadhrat Abu Hurairah (Radhiyallaho anho) also holds exactly the same view. Similar meanings were also narrated by Hadhrat Abu Zar Ghifaari (Radhiyallaho anho) on the authority of Rasu- lullah (Sallallaho alaihe wasallam) who held that @j!i!y) was the best amongst all virtuous deeds. According to Hadhrat Abu Hurairah (Radhiyallaho anho). one good deed is counted ten times over as a general principle but, for the muhaajirs, compensation for one good deed is raised to seven hundred times. (20) The revelation of this. Book is from Allah, exalted in power, full of knowledge, who forgives sin and accepts repentance, strict in punishment, and hath a long , - resch. There is no god save He; to Him is the final goal. (r 0 glz Note: EG .- ' In an explanation of this ayat, Hadhrat Abdullah bin Umar (Radhiyallaho anho) states that Almighty Allah is the forgiver of sins, for one who says (h 3! d!Y) and acceptor of towbah for one who recites (i~j!ii!y,, and is the dispensor of severe punishment for one who does not proclaimc~l~! i!J). The words (ilY!il!J) refute the Quraish, who did not be- lieve in the Unity of Allah; (\"r;j\\?;i!j) implies that one who says (LJ!ii!J) will return to Allah for entry into Paradise, while one who refutes (;I j! i!y, will return to Him for entry into Hell. . . y >jjl !,>& -1 4 && >,%, a$-& $g 9 (y,) r ti - +) @ iW1 (21) He who rejects false deities and believeth in Allah has grasped the firm hand-hold, which will never break. Note: Hadhrat Ibn Abbaas (Radhiyallaho anho) says that 9 , \"grasping the firm handhold I , means pro- claiming & +\\ illy) . The same interpretation is also related from Sufyaan (Rahmatullah alaih). 94 Virtues of Zikr CONCLUSION: I PART 2 This chapter includes such ayaat as contains the Kali- mah Tayyibah in full or in part, or else its equivalent in dif- ferent words but having the same meaning. The Kalimah Tayyibah (&l$d!J) means that nobody is worthy of wor- ship except Allah. The words (;;;i+>r;, and jcj!d!J and (31 J! W) also cany the same meaning. Similarly (i$ d! l;irJ) (We do not worship anybody other than Allah) and d! 3 @) (He is the only one worthy of worship) also mean the same thing. There are other similar ayaat, which imply the same meaning as of Kalimah Tayyibah. The surah and ruku in cl which each such ayat occurs has been indicated below. In fact, the whole of the Holy Qur'an is an explanation of the 8 & ZN Kalimah Tayyibah, because the basic objective of the Holy Qur'an and of the deen of Islam is towheed. It is to propa- gate towheed that the messengers of Allah were sent to people at different times. Towheed is the common objec- tive of all'the revealed religions, and for this reason the subject of towheed has all along been dealt with under dif- ferent headings to establish its truth. The same towheed is therefore the object of Kalimah Tayyibah. 1. Your Allah is one Allah. There is no god save Him; Most Beneficent, The Merciful. (Baqarah- 163) 2. There is no god but He-The Living, The Eternal. (Baqarah- 255) 3. There is no god but He-The Living, The Eternal. (Aali Imraan- 2) 96 : Ayaat mentioning Kalimah Tayyabah 97 I 4. Allah Himself is witness, there is no god but He. The angels and the men of learning too are witness. (Aali Imraan- 18) 5. There is no god but He-The Exalted in Power, The Wise. (Aali Imraan- 18) 6. There is no god save Allah, and Allah is Exalted in Power, The Wise. (Aali Imraan-62) 7. Come to an agreement between us and you, that we shall worship none but Allah. (Aali Imraan-64) 8. Allah! here is no god but He: of surety, He will gather you together on the Day of Judgment. (Nisaa-87) 9. There is no god save One Allah. (Maa'idah- 76) ( Y t - ?k,) +I; d! ji Ld! ji (I.) 10. Say: In truth He is the One Allah. (An'aam- 18) I 1 1 I. Which god other than Allah could restore them to you (An'aam - 46) 12. That is Allah, your Lord. There is no god save Him. (An'aanl-102) 13. There is no god save Allah, and turn away from those who join gods with Allah. (An'aam- 106) (,It- dlpl) $! &$i &I j$i j6 ( I t ) 14. He said: Shall I seek for you a god other than Allah. (A'raaf- 140) 15. There is no god save He (Allah). It is he that gives both life and death. (A'raaf- 185) 16. They were commanded to worship but One Allah. There is no god save He, Allah. (Taubah-31) 17. Allah is sufficient for me. There is no god save He (Allah). In Him I have put my trust. He is the Lord of the Tremendous Throne. (Taubah- 129) 18. This is Allah your Lord. Him, therefore, you should worship. (Yunus-3) 19. Such is Allah, your real Sustainer. (Yunus-32) 1 98 99 Virtues of Zikr 20. He said, there is no god except Him (Allah), in Whom the Children of Israel believe, and I am of those who submit unto Him. (Yunus-90) 21. I worship not what you worship other than Allah. (Yunus- 104) 22. Know you that this revelation is sent down in the knowledge of Allah, and there is no god save Him (Allah). (Hood- 14) 23. That ye s'erve none but Allah. (Hood - 26) 24, 25, 26) He said: \"0 my people, worship Allah; you have no other god but Him. (Hood-50-61-84) 27. Are many lords differing among themselves better or the One Allah, the Irresistible? (Yusuf-39) 28. He has commanded that you worship none but Him. (Yusuf-40) # * - (it - UJ) ji Y! d!Y sj ji j j (yq) . Say, \"He is my Lord, there is no god but He (Allah). (Ra'd- 30) 30. And let them know that He (Allah) is only one god. (Ibrahim- 52) 31. There is no god but I, so do your duty unto Me. (Nahl- 2) - 32. Your Allah is one Allah. (Nahl-22) $ ( V t - JC, &'j ii! ji ls! (YY) 33. He is just one Allah. (Nahl- 5) 34. And do not set up with Allah any other god. (Bani Israa-eel- 39) 35. Say if there had been other gods with Him (Allah), as they say. (Bani Israa-eel-42) 36. They said: 'Our Lord is the Lord of the Heavens and of the Earth. Never shall we call upon any god other than Him (Allah). (Kahf - 14) 100 Virtues of Zikr I 1 37. There are people who chose other gods beside Him (Allah). (Kahf- 15) 38. The revelation has come to me that your Allah is one Allah. (Kahf-110) I 39. Verily, Allah is my Lord and your Lord, so serve Him. (Maryam- 36) I 40.. Allah! there is no god but He (Allah). I (Taha- 8) 41. Verily, I am Allah. There is no god but I. So Serve Me. (Taha - 14) 42. But the god of you all is the one Allah: There is no god but He. (Taha-- 98) I 43. If there were (in the Heavens and the Earth) other gods besides Allah, there would have been disorder in both of them. (Ambiyaa-22) 44. Have they taken for worship gods besides Him (Allah). (Ambiyaa-24) 45. It was revealed by Us (Allah) to him (The Apostle) that (Ambiyaa- 25) there is no god but I (Allah). 46. Or have they gods who can shield them from us? (Ambiyaa-43) (r. 47. Do you worship besides Allah things that can neither O, , s 2 be of any good to you, nor do you harm? E N (Ambiyaa-66) 48. There is no god save Thou: Glory be to Thee. (Ambiyaa- 87) 49. What has come to me by revelation is that your Allah is one Allah. (Ambiyaa- 108) (Iiaj-34) 50. Your Allah is one Allah, submit unto Him. 51-52. Worship Allah, you have no other god but Him [Allah). (Mu'minoon-23) (Mu'minoon-91) 53. Nor is there any god along with Him. 102 Virtues of Zikr 54. Therefore Allah, Exalted, the True King! There is no god save Him (Allah). (Mu'minoon- 114) 55. If any one invokes any other god besides Allah, he has no authority therefore. His reckoning is only with his Lord. (Mu'minoon- 11 7) 56. (=an there be another god besides Allah? (Naml-64) 57. And He is Allah. There is no god but He. To Him be praise. (Qasas- 70) 58. Is there other than Allah, who can give you a night? (Qasas- 70) 59. And call not, besides Allah, on any other god. There is no god but He. (Qasas-88) , ( O t a+) &I j &!, qh, (5b ) 60. And our Allah and Your Allah is One. (Ankaboot-46) (\\t >b) L&jf 'p j; y! i! y ( I \\ ) 103 . There is no god save Allah. How then are you deluded? (Faatir- 3) (Saaffaat -4) 62. Lo! Thy Lord is surely One. (\\t &) L;* &I g! ij* 3' 3 \\i! \\jig ,$ (SY) 63. For when it was said unto them: \"There is no god save Allah,\" they were scornful. (Saaffat-35) (\\t /) l+lj q! @?I 'j&i (5f ) *. 0 a $ 64. Maketh he the gods One Allah? (Saad-5) 5 @z 65. There is no god save Allah, The One, The Irresistible. (Saad-65) 66. He is Allah, The One, The Irresistable. (Zumar-4) ., il d,jj a, 3 $j ( \\ t , j > p . . i~ $,i (>v) 67. Such is Allah. Your Lord and Cherisher. His is the (Zumar- 6) Sovereignty. There is no god save Him. 68. There is no god save Him, to Him is the final goal. (Mu'min-3) 104 Virtues of Zikr 69. There is no god save Allah. How then are you de- luded? (Mu'min-62) ( v t >,., 6;tiJ j; u'! ii! y >\\ j; (V.) 70. He is the living (one). There is no god but He. Call upon Him. (Mu'min-65) (\\t + r) ih@! Lj'i J! 2% ( v \\ ) 71. It is revealed to me that your god is One Allah. (Haameem-Sajdah-6) 72. Worship Ye none but Allah. (Haameem Sajdah- 14) 73. Allah is our Lord and your Lord. (Shooraa- 15) 74. Did we appoint gods to be worshipped besides the Beneficient? (Zukhruf-45). 75. The Lord of Heavens and the Earth and all between them. (Dukhaan- 7) > . 3 , o t jb.) * J j; j; Y! i.i! 4 (VT) 76. There is no god but He. It is He who gives life and gives death. (Dukhaan-8) 105 1) 77. Worship ye none other than Allah. (yt U) j j! d$ 8 *jiJ (VA) 78. Know, therefore, that there is no god but Allah. (Muhammad- 19) 7 79. And set not any other god along with Allah. (Zaariyaat- 51) g 3 k E N 80. Allah is He besides Whom there is no other god. S (Hashr-22) 81. We are guiltless of you and all that you worship beside Allah. (Mumtahixlah-4) ! -, 3, , (YL >LG) 9 $! d!y A\\ (AY) \\ (Taghaabun- 13) 82. Allah! There is no god but He. 83. I-Ie is the Lord of the East and the West; there is no god but He (Allah). (Muzzammil- 9) > > e ' -' (,a, @il; bj&v 3i qj Ljm~ +\\ Y 84. I worship not that which ye worship, nor will you (Kaafiroon- 2-3) worship that which I worship. 106 Virtues of Zikr 85. Say: He is Allah, The One and Only. (Ikhlaas) The above are the eighty five verses, in which text of Kalimah Tayyibah or its equivalent in meaning has oc- curred. There are still many more verses, which equally convey the same sense and meaning of the Kalimah as I have stated in the beginning of this section. Tauheed is the fundamental basis of Deen, and therefore the more ac- quainted a man is with the requirements of Tauheed, the more steadfast he shall be in Deen. Tauheed in the Holy Qur'an has been described from various viewpoints and in various manners and aspects, so that it may penetrate through the very depths of the heart; so it firmly settles there, leaving no room for anything else to enter. I 38 PART 3 1 Part 3 includes such ahadith which describe the vir- tues and blessings of reciting Kalimah Tayyibah. In the ~ foregoing we have seen that there is plurality of ayaat on this subject, which goes to prove that the number of aha- dith on this subject must be far more numerous. It is there- fore difficult to record them all here. Only a few illustrative examples will be given here. Hadith No 1 Rasulullah (Sallallaho alaihe wasallam) has said, \"of all the azkaar (plural of zikr) the repetition of (&I J!~IY, is the best, and of all the du'aas (A m'i, is the best.\" - . That & j ! i ! ~ ) is the best of all azkaar is quite evident. It is described as such in many ahadith. In fact when the whole of Deen depends on this Kalimah Tauheed, there can hardly be any doubt that it is the highest of all azkaar. Again (+.a\\) (Alhamdolillah) has been regarded as the best du'aa, because praising one who is the most benevolent person is in fact a form of begging. It is common experience that by writing a eulogy in praise of a man of wealth or of authority does not mean anything else than begging his favours or riches. Hadhrat Ibn Abbaas (Radhiyallaho anho) says that one who recites ( a . u I ) should follow it by hl j! i!y, because in the Holy Qur'an the verse (Ask Allah with sincere devotion) is followed by 91 ;j i . . Ui (All praise is for Allah Who is 108 Virtues of Zikr the Cherisher of all the universe). Mulla Ali Qari (Rahmatullah alaih) has stated: \"There is not the slightest doubt that Kalimah Tayyibah is by far the best and foremost of all azkaar because it is the root and fundamental basis of the Deen and the whole religion of 1slam.centres round it. It is for this reason that the Sufis and saints emphasise its importance and prefer it over all other azkaar and advise their followers to practise it as much as possible. Also, actual experience has shown that, the benefits following from Kalimah Tayyibah far out- number those which result from other forms of zikr. There is a well-known story of Sayyid Ali bin May- moon Maghrabi. Once Shaikh Ulwan Hamawi, who himself was a great scholar, Mufti and teacher of his age, came for learning zikr. The Sayyid (Kahmatullah alaih) devoted special attention to him and made hinl give up all his rou- tines, such as teaching and writing fatawa, and to take up zikr all the time. On this, the common people started freely indulging in fault finding and condemnation. They started a campaign of criticism that the Shaikh has now been lost to them and the people were being deprived of his benefits. A few days later, when the Sayyid (Rahmatullah alaih) came to know that Shaikh Ulwan was occasionally reciting the Holy Qur'an, he stopped him from this recitation also. At this, the people lost all sense and openly accused the Sayyid, (Rahmatullah alaih), of irreligiousness and perver- sion. After some time, when the Shaikh observed that the zikr has had its effect on his heart, the Sayyid (Rahmatul- lah alaih) allowed him to resume recitation of the Holy Qur'an. When he opened the Book, every word and aavat emerged with new meanings and significance he never thought of before. The Sayyid (Rahmatullah alaih) then told Shaikli lqamawi that he had not forbidden him from recitation, but in fact he had desired to develop in him spiritual awareness, which was a pre-requisite for this reci- tation of the Qur'an. As this Holy Kalimah constitutes the fundamental basis of religion and the root of Imaan (faith), the greater the devotion to this Kalimah. the more firmly will Imaan be rooted. lmaan depends on this Kalimah, and the very exist- ence of this world depends on it. According to a hadith, the Day of Judgment will not dawn as long as there exists on Earth a single man reciting the Kalimah b Y\\ dry. This is re- ported in other ahadith also. So long as there lives a single man on Earth who remembers Almighty Allah, Qiyaamat (Doomsday) will not take place. I Hadith<br><hr><br>Rasulullah (Sallallaho alaihe wasallam) is reported to have said: \"Once the prophet Moosa (Alayhis salaam) prayed to Almighty Allah to teach him some forms of zikr for his remembrance. He was advised to recite (b j! i!J,. He submitted: '0 my Lord! this zikr is recited by all the creation. Again came the reply: \"Recite 31 i! &Y .\" He submitted: '0 my Sustainer, I want something special, exclusively meant for me.\" Then Almighty Allah said: 'If the seven heavens and the seven earths were placed in one pan of the Balance, and the Kali- mah i! d!4 in the other, the latter will outweigh the former. \" It is the usual way of Almighty Allah that what is re- quired most is provided most. The more pressing the need for a thing, the more plentiful is the provision for the same. > Looking at the most essential necessities of life, such as breathing. water and air, it will be observed that Almighty Allah has created them in great abundance. It is, however. Ikhlaas (purity of intention) that determines the value of things in the eye of Almighty Allah. The greater the Ikhlaas in an action the greater will be its weight and, likewise. less the Ikhlaas and devotion, the lesser the weight. For the attainment of this Ikhlaas, nothing is more effective than this Kalimah. That is why it is also known as purifier of 110 Virtues of Zikr hearts ( 4 1 s*) . For its purifying effect, Sufis prescribe zikr of this Kalimah and advise its recitation as a daily routine, not only in hundreds but in thousands of times. Mulla Ali Qari (Rahmatullah alaih) writes that a disciple once com- plained to his Shaikh that, despite doing zikr, his heart re- mained inattentive. The Shaikh replied: \"Go on with your zikr firmly, and thank Almighty Allah for His Grace that He enabled a part of your body. i.e. the tongue, to remain busy in His zikr, and pray to Allah for a devoted heart.\" A simi- lar incident is related in Ihyaa-ul Uloom about Abu Usman I Maghribi, who gave the same reply on a similar con~plaint made by one of his disciples, and he prescribed the same cure. As a matter of fact, zikr is the best remedy for indo- lence of the heart. Almighty Allah says in His Book, \"If you show gratitude to Me, I will grant even more than before.\" Likewise the hadith says \"zikr of Almighty Allah is a great blessing; and be thankful to Him in as much as He has en- abled you to do His zikr.\" Hadith No 3 Hadhrat Abu Hurairah (Radhiyallaho anho) once en- quired from Rasulullah (Sallallaho alaihe wasallam) as to who would be most benefitted by his intercession on the Day, of Resurrection. Rasulullah (Sallallaho alaihe wasallam) replied, \"Knowing your anxiety for the Urn (knowledge) of ahadith, I could expect that I none other than you would have asked this question earlier.\" Thereafter the Prophet (Sallallaho alaihe wa- sallam) told Abu Hurairah (Radhiyallaho anho) that the most blessed or the most benefitted by my interces- sion will be the person who proclaims (31 y'!j!y, with Ikhlaas (sincerity). The meaning of good fortune here is to get something good through the Grace of Allah. That the person reciting the Kalimah with Ikhlaas Miil be most deserving to be ben- efitted by the intercession of Rasulullah (Sallallaho alaihe wasallam), can be interpreted in two ways. Firstly, such a person could be one who has just embraced Islaam with sincerity of heart, and has done no other good deed except the recitation of the Kalimah. Evidently he can be helped only by virtue of this intercession, because he has no deed to his credit. In this case, this hadith is corroborated by other ahadith, in which it is stated that the intercession will be for those guilty of major sins who shall have been sent to the Hell because of their sins, but by virtue of their recitation of the Kalimah Tayyibah they will be released through the intercession of Rasulullah (Sallallaho alaihe wasallam). Secondly, the most deserving people to be ben- efitted will be those who continually recite this Kalimah with sincerity and they have to their credit other good '8 deeds as well. Being most fortunate means that they will be 8 & benefitted more than by anything else by the intercession %z of Rasulullah (Sallallaho alaihe wasallam) in raising their a status in Paradise. Allama Ainee (Rahmatullah alaih) has stated that Ra- sulullah (Sallallaho alaihe wasallam), will intercede in six different ways on the Day of Judgement, Firstly, it will be for relief from the intolerable distress and supense in the field of judgement, where all the people will be afflicted in various ways and will even prefer to be sent to Hell so that their present worries may come to an end. They will go to all the high-ranking Prophets, one by one, and beg them to intercede before Almighty Allah, but none of them will dare to do so. At last, Rasulullah (Sallallaho alaihe wasal- lam) will intercede, and this intercession will be in favour of all the people, including Jinn and mankind, believers and non-beliyers, all of whom will be benefitted by it, as explained in detail in the ahadith describing the Resurrec- tion. Secondly, Rasulullah (Sallallaho alaihe wasallam) will intercede for mitigation of punishment to some non- believers, as mentioned in the hadith about Abu Talib. Thirdly, his intercession will be for the release from Hell of some of the Believers who have been thrown in there. Fourthly, it will be for the pardon from Hell of some Be- lievers, who on account of their misdeed have deserved to be condemned to it. Fifthly, it will be in favour of some Be- lievers for their admittance into Paradise, without requiring them to render account of their deeds. Sixthly, it will be for raising the status of the Believers in general. 112 Virtues of Z'ikr Hadith Ro 4 Hadhrat Zaid bin Arqam (Radhiyallaho anho) narrates I I that Rasulullah (Sallallaho -alaihe wasallam) had said that one who recites (31 j! d!9) with Ikhlaas will enter Paradise. Somebody asked what was the sign of Ikh- laas. He explained that it prevents one from indulging in the forbidden things. It is apparent that one w h ~ , abs,tains from the forbidden things and professes faith in 41 g! 93 , will directly be ad- mitted into the Paradise. But if one has indulged in some forbidden things and has been sent to Hell, even then through the blessing of this Kalimah he will, certainly someday, after undergoing punishment for his misdeeds, be transferred to Paradise. But if his misdeeds have led him to stray out of the fold of Islaam and Imaan, he will remain condemned in the Hell for ever. Faqih' Abul Laith of Samarkand has written in his book Tanbeeh-ul-Ghaafileen, \"It is imperative for every- body to hymn (31 J ! ~ ! J ) often, and also pray to Almighty Allah for steadfastness in Imaan, and abstain from sins; be- cause there are many people whose sinful deeds destroy their Imaan and they die as non-believers. There can be no tragedy greater than that a man should be listed as a Muslim throughout his life, but on the Day of Resurrection his name should appear in the list of non-believers. This is indeed the greatest misfortune. One does not feel sorry for a person who has throughout worshipped in a church or a temple and in the Hereafter is listed among the non-believ- ers, but it is a matter of great grief that he who had re- mained in the musjid should be counted as one of the non- believers. This happens, as a result of excessive sinning and secret indulgence in forbidden things. For instance, a person gets unlawful possession of something knowingly, but he consoles his conscience that he will restore it some day to its real owner, or will get it condoned by him, but he happens to die before he is able to do anything of the sort. There are some who divorce their wives, but even then, knowingly, they continue to cohabit with them, till death overtakes them. In such cases, one does not get a chance of doing Taubah (repentance) and consequently is completely deprived of his Imaan. May Almighty Allah save us from this! L, ,.&& $\\ In the books of Hadith, the story of a young man who was unable to recite the Kalimah, when his end was near, is related. It was brought to the notice of Rasulullah (Sallal- laho alaihe wasallam), who went to the young man and asked him what was the matter with him. He replied that he felt as if his mind was locked. On enquiry, it transpired that his mother was angry with him because of his mis- behaviour. She was called by Rasulullah (Sallallaho alaihe wasallam) and when she came, he said to her: \"If some- ZG body kindles a big fire and wants to throw your son into it, 5 will you recommend mercy for him?\" \"I will certainly do so\", she replied. \"If it is so, then forgive his sin\", said Ra- sulullah (Sallallaho alaihe wasallam). At this she pardoned her son, and thereafter when the young man was asked to recite the Kalimah he readily did so. Rasulullah (Sallallaho alaihe wasallam) thanked Almighty Allah that, through his effort, the man was saved from the fire of Hell. There are hundreds of cases, like the one mentioned above, where the evil effect of the sins in which we get involved results in our worldly as well as spiritual loss. The worthy author of Ihya-ul-Uloom has related that once Rasulullah (Sallallaho alaihe wasallam) ge1,ivered a sermon, in which he said: \"One who recites (dl Y! d!J, , in the manner that he does not mix it up,rhe becomes entitled to Paradise.\" Hadhrat Ali (Radhiyallaho anho) asked for the clarification of the meaning of mixing it up. Rasulullah (Sallallaho alaihe wasallam) said: \"It is to love the worldly life and hanker after it. There are many who talk like the Prophets, but act like the arrogant people and tyrants. If one recites this Kalimah while not indulging in anything of this sort, he becomes entitled to Paradise.\" Hadith</p></div>",
+        "sections": [
+            [
+                30,
+                16487
+            ],
+            [
+                16487,
+                33268
+            ],
+            [
+                33268,
+                49893
+            ],
+            [
+                49893,
+                66626
+            ],
+            [
+                66626,
+                83156
+            ],
+            [
+                83156,
+                99652
+            ],
+            [
+                99652,
+                112093
+            ]
+        ]
+    },
+    {
+        "id": 33,
+        "bookId": 4,
+        "chapter": "Third Kalima",
+        "title": "Content for Third Kalima",
+        "preview": "114 Virtues of Zikr i Rasulullah (Sallallaho alaihe wasallam) said, \"There is nobody who may recite (A1 g!qY) and the doors of the Heavens do not get ...",
+        "content": "<div class=\"story-content\"><p>114 Virtues of Zikr i Rasulullah (Sallallaho alaihe wasallam) said, \"There is nobody who may recite (A1 g!qY) and the doors of the Heavens do not get opened to allow this Kaliinah to 1 reach the Arshi Ilaahi (Allah's throne), provided he 1 abstains from the major sins.\" The extreme excellence and acceptability of this Kali- mah is proved by its going straight to the Arshi Ilaahi (throne of Allah). It has already been stated that its recita- tion, even with major sins, is not without benefit. Muila Ali Qari (Rahmatullah alaih) says that the condition of being free from major sins is the key to quick acceptance and for the opening of all the doors of Heaven; otherwise the reci- tation of Kalimah is not without reward and acceptance, in spite of ma'or sins. Some scholars have explained this hadith to me \\ n that, after the death of such a person, all the doors of the Heavens are opened to welcome his soul. According to another hadith, two Kalimahs are such that one does not stop before reaching the Throne of Allah. and the other fills the Heaven and Earth with its light or reward: one is (&I Y'! ii14, and the other is(31g!31$. Hadith<br><hr><br>Hadhrat Shaddaad (Kadhiyallaho anho) relates. while Hadhrat Ubaadah (Radhiyallaho anho) confirms, that once we were sitting with Rasulullah (Sallallaho alaihe wasallam) and he asked if there was any stranger (non- Muslim) in the gathering. We submitted that there was none. He then had the door ~ l 9 s e d and asked us to raise our harids and recite (ir~Y!il!J). We raised our hands for somf: time and recited the Kalimah. He then exclaimed &y!iJ!J, anti said: ''0 Allah! You have sent me with this Kalimah. You have prorrlised paradise for $ v, r- those who profess it, and Your promise never remains unfulfilled.\" Then he turned to us and said: \"Be $3 happy, Allah has blessed you with His forgiveness.\" $ Rasulullah (Sallallaho alaihe wasallam) had made sure that no stranger was present there, and he had got the door closed, because presumably he had every hope that those particular people would be forgiven by virtue of reciting the Kalimah, and he had no such hope in respect of non-believers.\" The Sufis quote this hadith as an argument for making their disciples engage in zikr collectively. it is stated in Jaarni-ul-[Jsool that there were instances when Rasulullah (Sallallahc alaihe wasallam) made his companions do zikr collectively and individually, and this I-fadith is quoted as authority for doing zikr collectively. In that case, the clos- ing of the door would be to help those present to concen- trate their attention. 'The enquiry about the presence of any stranger might also be for the same purpose: it may not have distracted the Prophet (Sallallaho alaihe wasallam), but there was likelihood of others getting distracted. Hadith<br><hr><br>Virtues of Zikr Rasulullah (Sallallaho alaihe wasallam) said: \"Keep on renewing your Imaan. \"0 Rasulullah! Sallallaho alaihe wasallam, how should we renew our Imaan?\" enquired the Sahabah. \"Recite &i!ii!J, very often\", was the reply. Note: In one hadith. Rasulullah (Sallallaho alaihs wasallam) is reported to have said. \"Like old clothes, the Imaan also gets worn out, hence keep on renewing it through supplica- tion to Almighty Allah.\" That the Imaan gets old and worn out means that it loses strength and radiance on account of sins. Thus it is stated in one hadith that, when a man com- mits h sin. a dark spot appears on his heart. If he then does sincere l'aubah (repentance), this spot gets washed away. otherwise it remains there. When he commits another sin, another black dot appears on the heart. Thus, on account of further sins, the black dots continue to increase, till ulti- mately the heart is all blackened and rusted, as decribed in the Qur'an in Surah Tatfeef.\" b* lJgc &$ * blj * < - Nay, but that which they have earned is rust upon their hearts. When such a stage is reached, then th,: heart is no longer influenced by words. It is said in o1.d hadith, \"Four things cause ruination of the heart. namely, debating with stupid people, excessive sinning, excessive mixing with women, and remaining in the society of the dead.\" Some- body enquired, \"What is meant by the dead in this case?\" Rasulullah (Sallallaho alaihe wasallarrl) explained that it meant such wealthy persons who assume arrogance on ac- count of their wealth. Hadith<br><hr><br>.. -. 1 J , ; ,*,, . 1;\"~ 3 (A) I 117 ullah (Sallallaho alaihe wasallam) said. \"Recite Y!il!jij very often, before the time of death comes when'you will not be able to say it.\" Note: It means that no deed is possible after death. This life is very short, but it is the only time for action and for sowing the seeds. This life after death is infinitely long. and we will there reap whatever we have sown here. Hadith<br><hr><br>Rasulullah (Sallallaho alaihe wasallam) said, \"I know of a Kalimah, such that if anybody recites it with sin- cerity of belief in it and then dies. Hell becomes forbid- den for him. This Kalimah is (3t j! ii~y, .'' Note: This subject matter has been related in many ahadith. If the person referred to in the above hadith has been a new convert to Islam, then there can be no doubt about the meaning, because it is unanimously agreed that on embrac- ing Islaam all the sins committed as a non-Muslim are for- given. But if it refers to an old Muslim, who recites the Kalimah with sincerity just before his death, even then it is hoped that Almighty Allah, through His sheer Grace, may forgive all his sins. Almighty Allah has Himself said that He mav forgive whomsoever He likes, all his sins, except 1 Shirk. , Mulla Ali Qari (Rahmatullah alaih) has stated that some scholars are of the view that these ahadith pertain to the very earlv period of lslaam when detailed command- 0 3 9 merits had not yet been revealed. Some scholars have Li stated that the hadith implies declaration of this Kalimah ,& q1 &, $ ii JG & Gj , 2 15 &> &? > L L & ?\\ +> , 118 I 119 above. Hasan Basri (Ratlmatullah alaih) and many others also held the same view. According to the considered view of Imam Bukhari (Rahmatullah alaih) Allah's promise holds good if the declaration of the Kalimah before death is with repentance, which is the es- sence of Taubah while, according to Mulla Ali Qari, the re- citer will not be doomed to Hell-for ever. Moreover, it is a matter of common observation that sometimes the inherent quality of a thing becomes ineffective due to some counter- force. For instance, a purgative may become ineffective if it is followed by a strong constipative drug, but that does not mean that the purgative has become devoid of its inherent effect; it has only not worked because of the strong counter- acting agent. Hadith No 10 Kalimah itself is made up of two parts. one $1 j jig, and the other i1J>;G. Thus. the Paradise may be said to open with these two keys. In these ahadith, wherever the Kali- mah is stated to cause entry into Paradise or protection against Hell, it means the complete Kalimah comprising both the parts. In one hadith. it is said that the price of Par- adise is ($1 u'~ ii14. Hadith No 11 Rasulullah (Sallallaho alaihe wasallam) said. \"1Vhoso- ever recites 3, ii! W, any time during day or night. his sins are remitted from his account and virtues are written instead.\" Note: The replacement of sins by virtues has been fully de- scribed under Hadith No 10 of Chapter 1, part 2, where various meanings of all the aayats and ahadith of this kind are given. According to every version, this hadith categori- cally states that sins are washed away from the account of a person's deeds, provided there is Ikhlaas, that is sincerity of intention. In any case, hymning the blessed name of Al!ah and excessive recitation of Kalimah Tayyibah also develops Ikhlans. That is why this blessed Kalimah is also called the Kalimah of Ikhlaas.\" Hadith<br><hr><br>I., 5 2 &j i&,L hi 2 (\\r) '$1 jo. a.o & L\\ JG f Rasulullah (Sallallaho alaihe wasallam) said \"Profes- J J. - , * JG \\;$ 2$\\ d4 $t4J 2 1 5 2 &, j$ sing faith in j!d!~, provides the keys to Paradise.\" ?+! u,; ;$., &\\ .j! i!q , f , J$ j.$ ,$q $2, $i &$ - , Juj JjS6 ;&Wa&>& Note: 9 9 9 # $,\\ 4 .- J , The Kalimah has been described as the keys of Para- dise, because it serves as the key for opening every door , r.g p 4) GyJ' j . 1s 4 p, ~h\" o ' u and every part of Paradise; therefore, the Kalimah consti- ~ j , 4 + ~ ~ w j 2 d ~ L r , i l i J ~ t - s t r n ~ ~ ~ i ~ ~ b l ~ ~ tutes all the keys. Or else, it is called the keys, because the bl+ d Rasulullah (Sallallaho alaihe wasallam) said, \"There is a pillar of Noor (Divine Light) in front of the Arshi llanhi (the Throne of Allah). When somebody recites & Y! J!Y), this pillar starts shaking. When Allah asks it to stop shaking. it says. 'How can I stop, when the reciter of the Kalimah has not yet been granted forgiveness?' 120 Virtues of Zikr Thereupon Allah says: 'Well, I have forgiven him', and then that pillar stops shaking.\" Note: I Some scholars of hadith have doubted authenticity of this hadith, but Allanla Suyuti (Rahmatullah alaih) has written that this hadith (tradition) in different words has been narrated through many sources. According to some narrations. Almighty Allah also says, \"I have made him utter the Kalimah in order that I may grant him forgive- ness.\" How kind and benevolent is Almighty Allah that He himself graces a person with the power to do this virtuous act, and then grants pardon on this basis to complete His extreme favour. In this connection a story told about Hadh- rat Atna (Rahmatullah alaih) is well known. He once hap- pened to go to the market where a woman lunatic slave was on sale. He purchased her. At midnight she got up, per- formed her ablution. and began offering Salaat. During her prayers she wept so profusely that her breath was getting : choked. Then she said: \"0 my Lord! in the name of the love that You have for me, bestow Your Mercy on me.\" Hearing this. Ataa said \"0, slave woman, say: '0 Allah, in the name of the love that I have for YOU:\" Upon hearing this she got upset and said, \"By Allah! If He had not loved me, He would not have let you sleep and made me to stand I in prayer as you see!\" Then she recited the following couplets: My restlessness is increasing, and my heart is burning; patience has forsaken me, and my tears are flowirlg. How can one have peace of mind, when one is all upset by the pangs of love and restlessness. 0 Allah! if there is anything which can help me to get rid of my grief, please bestow it upon me as a favour! Then she said, '0 Allah! so far the deal between You and me was known to none,.since it has ceased to be secret now, take me away from here. Saying this, she uttered a shriek and breathed her last. There have been many other incidents like this. It is a fact that only Almighty Allah grants the power to do good. trh 121 (And if Allah, the Sustainer of the Universe does not will it, you cannot even wish for anything). Hadith No 13 Rasulullah (Sallallaho alaihe wasallam) has said, Y will neither have fear in \"Those who believe in k~ Y! the grave nor on the Day of Resurrection. It is as if I see the spectacle when they 'will rise from their graves, wiping dust from their heads and saying: 'All praise is for Allah, who has cast off (for good) all worry and fear from us. \" 122 Virtues of Zikr 1 39 It is stated in another hadith that those who profess At d! ii!J will experience no affliction at the time of death or in the grave. Note: Hadhrat Ibn Abbaas (Radhiyallaho anho) says: \"Once Hazrat Jibraa-eel (Alayhis salaam) came to Rasulullah (Sal- lallaho alaihe wasallam): Rasulullah (Sallallaho alaihe wa- sallam) was very much worried, and Jibraa-eel said: 'Almighty Allah has sent His salaam to you and has en- quired why you look so sad and worried!\" Although Allah knows whatever is hidden in the hearts, yet by such enquiries Allah means to indicate honour, respect and favours. Rasulullah (Sallallaho alaihe wasallam) replied, \"0 Jibraa-eel! I am worried about my Ummat, as to how they will (fare) on the Day of Judgement!\" \"Is it about the non-believers or about the Muslims?\" asked Jibraa-eel (Alayhis salaam). \"About the Muslims,\" replied the Prophet (Sallallaho alaihe wasallam). Jibraa-eel (Alayhis salaam) then took the Prophet (Sallallaho alaihe wasallam) along to a graveyard where the people of the tribe of Banu Salama were buried; there he struck a grave with his wing > . and said ,‘A b (stand up by the orders of Allah). Out of that grave', an extremely handsome man stood up, and he was reciting Hadhrat Jibraa-eel (Alayhis salaam) told him to go back to his place, which he did. Then he struck another grave with his wing. Out of it stood up an extremely ugly person with black face and worried eyes, who was saying, \"Alas, there is nothing but sorrow, shame and horror!\" Hadhrat Jibraa- eel (Alayhis salaam) told him to go back to his place, and then explained to Rasulullah (Sallallaho alaihe wasallam), \"The people will rise up on the Day of Resurrection in the same state that they were at the time of their death.\" In this hadith, the people of if g! ii! Y apparently imply those who have close attachment for and remain busy with this Kalimah, just as milkman, shoeman, pearl ma^ and iceman rnean those who deal in and especially stock those particular things. Thus, there is no doubt whatsoever that the people of this Kalimah, will receive this extraordinary treatment. In Surah Faatir of the Holy Qur'an, three catego- ries of this Ummat have been described; one category is named al&bckL. (leaders in virtues), about whom it is stated in a hadith that they will enter Paradise without anv reckoning. According to one hadith, a person who recites AI y~ y one hundred times daily will on the Dav of Resur- rection be raised up with his face shining like the full moon. Madhrat Abu Darda (Radhiyallaho anho) narrated that those whose tongues remain busy in the zikr of Allah will enter Paradise rejoicing. Hadith<br><hr><br>Rasulullah (Sallallaho alaihe wasallam) siid. \"On the Day of Judgement, Almighty Allah will select a man from my Ummat and will call him in the-presenc;~ of all mankind, and then 99 registers of his n1isdt:eds. 124 Virtues of Zikr each register as long as one can see, will be opened before him. He will then be asked if he denies anything recorded in his account of deeds, or whether the angels who were appointed to record his deeds had been unjust to him in any respect. He will reply in the nega- tive (i.e. he will neither deny anything nor blame the angels for any injustice to him). Then Allah will ask him if he can justify his misdeeds, but he will submit that he has no excuse to offer. Then Allah will say 'Well, there is indeed one virtue to your credit. Today no injustice will be done to you.' Then a small piece of I paper with the Kalimah written on it will be handed over to him, and he will be asked to go and get it weighed. He will subniit that this small piece of paper will be of little avail as against so many lengthy registers. Allah will say, \"This day, no injustice will be done to you.\" Then all the registers will be placed in one pan and the piece of paper in the other pan. The pan with the registers will fly up in the air on account of the excessive weight of that piece of paper. The fact is that nothing is weight- ier than the name of Allah.\" Note: It is a blessed result of Ikhlaas that a single recitation, 1 with sincerity, of Kalimah Tayyibah can outweigh all the misdeeds recorded in so manv registers. It is, therefore, necessarv that one should not look down upon anv Muslim and think oneself as superior to him. Who knows that Almighty Allah may accept from him some deeds that may i sutfice for his redemption, while nobody can be sure about himself whether any of his own deeds will be found worthy of acceptance. There is related in one hadith the story of two persons belonging to Bani Israa-eel. One of whom was worshipper and the other was a sinner. The worshipper always criticised the latter, who used to reply: \"LeCive me to my Creator.\" One day, the worshipper, in a fit of anger, said: 'By Allah! you will never be forgiven.' Almighty Allah assembled them unto His presence and pardoned the sinner because he alwavs expected n1err:y from Him. but ordered purlishment for the worshipper due to his swearing upon Allah. No doubt, the oath was serious and offended against the declaration of Allah in the verse (Almightv Allah will not forgive Kufr and Shirk but ex- cepting that. He may forgive any sin as He may like). None else has the right to say that a certain person will not be forgiven, but this does not mean that we should not warn others against sins and undesirable things, and ask others to desist from these. At hundreds of places in the Holy Qur'an and in the books of hadith. there are warnings against not forbidding from evil. It is stated in many aha- dith that the people who see a sin being committed and do not stop it. in spite of their having power to do so, will also co v, share the punishment for that sin. This point has been dis- cussed by me in detail in mv book. Fazaaile Tabligh. which $ can be consulted if desired. There is, moreover. a note of 7 caution. Whereas it is verv wrong to condemn sinful Mus- lims as absolute dwellers of Hell, it is even more dangerous on the part of ignorant people to accept anv person as their spiritual guide, in spite of his being devoid of good prac- tices and his saving senseless and un-Islamic words. Kasu- lullah (Sallallaho alaihe wasallam) has said: \"Whosoever respects an innovator in Islam is c:onsideretl to have taken part in dt:niolishing Islam.\" It is stated in several ahi~clith that in tilnes to come, there will appear Inany imposters. cheats and liars. who will relate ahadith that vou will tlavtt never heard before. Beware of such porsons. lest they should mislead vou and put you into trouble.\" Hadith</p></div>",
+        "sections": [
+            [
+                30,
+                16430
+            ],
+            [
+                16430,
+                17999
+            ]
+        ]
+    },
+    {
+        "id": 34,
+        "bookId": 4,
+        "chapter": "Darood Sharif",
+        "title": "Content for Darood Sharif",
+        "preview": ". ' , * ,, ,, ! ~ ~ ; I ; F ~ ~ ~ I ~ ~ o J + ~ J G J o J \\ ~ ~ I ~ I: S B , . & ~ * , , w ~ ~ j ~ ~ j $ > j ~ ; ~ l j + . jj +\\S& ., * B . ! - 3 B ~f...",
+        "content": "<div class=\"story-content\"><p>. ' , * ,, ,, ! ~ ~ ; I ; F ~ ~ ~ I ~ ~ o J + ~ J G J o J \\ ~ ~ I ~ I: S B , . & ~ * , , w ~ ~ j ~ ~ j $ > j ~ ; ~ l j + . jj +\\S& ., * B . ! - 3 B ~f ;ciul 2 b $1 a ijp a j j 3141 , , , < <, py \\$ ~,i I&) J ~ l AI Y! d! Y ji ;>w +j 4) qj\\ p 4 > IX JIA~I ~ s \" J i J ~ ) i ~ ~ o ~ + j u o ~ ~ ~ ~ J ~ ~ ~ ~ ~ & \\ J ~ J L ; , . * U ~ ; Si &\\ 21 Y! LE dkJJ jl+l r ~ ) ~ ;A a+-& $A$ ~ 1 . i 2' J. w i ~o *L Cli. 11: Ali(~dith on Virtues of Kulimuh 'I'ayyabuh 127 126 I Virtues of Zikr Rasulullah (Sallallaho alaihe wasallam) said: \"I swear by Allah Who controls my life that if all the skies and the Earth, with all the people and all the things be- tween them and all that may be within them, are I placed together in one pan of the balance, and the faith in& y! i!y, is put in the other pan, the latter will outw- eigh the former.\" This subject matter has been described in many aha- dith. It admits of no doubt that nothing can be equal to the blessed name of Allah. It is really a great misfortune and deprivation for those who take it lighty. However, the weight of this Kalimah is proportional to the Ikhlaas with which it is uttered. The greater the Ikhlaas, the weightier becomes the Kalimah. It is to cultivate this Ikhlaas that one has to remain in the service of the Sufis. According to one hadith, the above-mentioned saying of Rasulullah (Sallal- laho alaihe wasallam) was in connection with another sub- ject matter. He has said: \"Persuade a dying person to recite (81 j!ii~$ because he who recites this Kalimah at the time of his death gets entitled to enter Paradise.\" The Sahaba en- quired: \"0 Rasulullah! (Sallallaho alaihe wasallam) what about reciting it during good health?\" He replied, \"Then it is even more effective in obtaining entitlement to Para- dise,\" and then stated, on oath, the hadith related above. Hadith<br><hr><br>I I 1 There came to Rasulullah (Sallallaho alaihe wasallam) three non-Muslims who said to him: \"0 Muhammad! (Sal- lallaho alaihe wasallam) don't you recognise anybody, except Allah as worthy of worship?\" In reply, Rasulullah (Sallsllaho alaihe wasallam) recited (LI j~ j~j, (Nobody is worth\" of worship except Allah), and gdded: \"I have been deputed spscifically for the propagation of this Kalimah, and to it I invite al!*manktnd.\" It was in this connection that the verse LW Yi *;i, ji 4 [What thing is ob most weight in testimony) was reve'aled.\" Note: The words of Rasulullah (Sallallaho alaihe wasallam) namely, \"I have been deputed (as a prophet) specifically for the propagation of this Kalimah, and to it I invite all mankind\" did not mean that only he had been sent on this special mission. In fact, all the Prophets had been deputed for the propagation of this Kalimah, and all of them had in- vited mankind to it. From Aadam (Alayhis salaam) to Rasu- lullah (Sallallaho alaihe wasallam) the last and the best of Prophets, there was not a single prophet who had not propagated this sublime Kalimah. So blessed and sublime *I is this Kalimah, that all the Prophets and all true religions propagated it, and served its cause. In fact, every true relig- 4 ion is based on this Kalimah. It is in support of this Kali- .EN mah that the Qur'anic verse (Y cb~, , ijp $1 '2 21 3 has been revealed, in which Almighty Allah is a witness in favour of Rasulullah (Sallallaho alaihe wasallam). Accord- ing to one hadith, when somebody recites &+!& then Almighty Allah testifies to it and says: \"My slave has spoken the truth; there is nobody worthy of worship except I.\" Hadith<br><hr><br>The Prophet Eesa (Jesus) (Alayhis salaam) had said: The deeds of the Ummat of Hadhrat Muhammad (Sal- lallaho alaihe wasallam) would be reckoned weight- iest, on the Day of Judgement, because their tongues are accustomed to the recitation of a Kalimah, which was found too hard by the Um~nats of other Prophets, and this Kalimah is 51 +I i i ~ y . Note: It is a fact that the Umrnat of Rasulullah (Sallallaho alaihe wasallam) is devoted particularlv to this Kalimah, 128 Virtues of Zikr far more than any other Ummat. There have been hundreds of thousands. nay millions of Sufis (divine persons) every one of whom had hundreds of disciples, all of whom re- cited the Kalimah thousands of times daily as a matter of routine. It is stated in the book 'Jaami-ul-Usool' that the word 'Allah' should be repeated a minimum number of five I the fact stated by Hazrat Eesa (Jesus) (Alayhis salaam) that their tongues are specially accustomed to the recitation of the Kalimah. Hadith<br><hr><br>thousand times daily alid that there is no upper limit for + this, and the Sufis are required to repeat yl j,y, dailv at & J \\ ' j , \\ ,.@ & ' $! !& (,A, - . # # - - h *$,. \\ 1 4 1s +I 9i *+i @U > +U\\Y ~i <! y &I U\\ &! +\\ least twenty five thousand times. This number varies J ~ 4 ac:c:ording to the advice of the Mashaaikh. I have related all this in support of the above saying of Hadhrat Eesa (Jesus) Rasulullah (Sallallaho alaihe wasallam) has said: \"There is inscribed on the gate of Paradise ui i! ii! Y k~ UI $! stated in his book al-Qowlul jameel that his father as a be- WU j; sL~ J (Only I am Allah, none except I am worthy gill~ier in Sufism used to recite ( ~ I Y I JIY, two hundred times of worship. Whosoever keeps reciting this Kalimah in one breath. (r 0 (Alavhis salaam). Shah Waliullah (Kahmatullah alaih) has will not be punished by Me.)\" L , E N 5 Shaikh Abu Yazeed Qurtubi (Rahmatullah alaih) writes: That punishment will be awarded for sins is men- learning that one who recites ,81i1ii!J, seventy thou- \"011 tioned in many other ahadith. As such, if the word punish- salid times becomes safe from the fire of Hell. I completed nlent mentioned in the above hadith implies eternal punishment, then there is no doubt as regards the final atonement. But if any fortunate person recites this Kalimah with such sincerity of heart that he is altogether spared from punishment in spite of his sins, no one can question the mercv of Almighty Allah, as already stated under aha- this number once for my wife and then several times for my own self as a provision for the Hereafter. There used to live near us a voung man who was known to be blessed with the power of Kashf (divine manifestation of unseen thing). even in respect of Paradise and tiell. but I hesitated to believe it.:Once when this voung inan was tiining with dith 9 and 14 of this chapter. us. lie uttered a cry of agony. his breatlii~ig bec:anit: diffic:ult and he exc:laimed. 'I see mv mother burning in firt: of 1-lell.' Wlie~l I saw him so perturbed. I thought of bestotving olie Hadith<br><hr><br>of niv complete seventv thousand recitatio~is of thc kali- mall in favour of his niother. so that the truth of \\vIiat the young Inan said could be tested. I quietly did so i l l my heart, without telling anvbodv else about it. 13ut as soon as I did this. the yoling man felt relieved atid said. '0 lJnc:lc! niy motht:r has beell relieved of the punishmc?nt of 11ell! 'I'liis iticident proved useful to me in two wavs: firstly. the I)lt!ssing of reciting the Kalinlah seventy thousand tirnes iui~s 1)rovt:d by actual experience. and secondly it was es- tal)lisht?cl 1.hat the voung mall was !ruly blessed with the I)o\\ver of Kashf. 'I'liis is but one of manv such incidents in the lives of \\.i~riotls individuals of this Urnmat. l'he Sufis make their I'olloivors pri1c:tise that no breath goes in or comes o u ~ [vith- Rasulullah (Sallallaho alaihe wasallam) related that he was told bv Jibraa-eel (Alayhis salam) that Almighty out zikr of Allah. 'Shere are nlillions of people from the llnlliiat of Muhammad (Sallallaho alaihe wasallam) who Allah s a p : \"Onlv 1 am Allah; there is none worthy of worship except I, hence worship only Me; whosoever hatt adopted this practice. 'I'here is. theretore. no denving 130 Virtues of Zikr I will come to Me with firm faith in (b YJ i~ Y) will enter My fort, and whosoever enters My fort will be safe from My punishment.\" Note: If the abovementioned blessing is on the condition that one does not commit major sins, as mentioned under Hadith No 5, then there is no ambiguitv about it: but if reci- tation of the Kalimah, in spite of major sins, is implied. then the word 'punishment' implies eternal punishment. However, Allah's Mercy knows no bounds. It is mentioned in the Qur'an that Alrnighty Allah will not forgive the sin of Shirk (polytheism), but will forgive any other sin, as he may like. According to one hadith. Almighty Allah pun- ishes o111v such persons who revolt agaillst him and refuse to recite , i t yl JI y, . According to another hadith, the recita- tion of ( k Y 1 JJ removes the wrath of Almighty Allah. as ? l ) long as one refrains from attaching more importance to the worldly things as compared with the religion; but if one starts preferring the former over the religion, then recita- tion of (51 JI j~ y, proves of little use, because then Allah says: \"You are not true to what you profess.\" Hadith<br><hr><br>Rasulullah (Sallallaho alaihe wasallam) said: \"The best form of zikr is (BISI h ~ ) : and the best form of du'aa is Istighfaar (seeking forgiveness of Allah)\"; then, in sup- port thereof, he recited from Surah Muhammad. the verse So know that 11one is worthy of worship but Allah. It is already given in Hadith<br><hr><br>of this Chapter that ( A Y ~ JIY, is superior to all other forms of zikr. The rc.asoli for C I i . 11: AIi(~tlilh on Virtues o / K(11i1nclh 7'(1!*!ro!~(~h 131 this superiority, according to the Sufis, is that zikr has a special cleansing effect on the heart; by virtue of this zikr, the heart gets purified of all its maladies and, if supple- mented by Istighfaar, this becomes most effective. It is stated in one hadith that when the fish had swallowed Hadhrat Yunus (Alayhis salaam) he recited the prayer and that whosoever supplicates Allah in these words will be granted his prayer. This subject has also been mentioned in Hadith</p></div>"
+    },
+    {
+        "id": 35,
+        "bookId": 4,
+        "chapter": "Istighfaar",
+        "title": "Content for Istighfaar",
+        "preview": "of this chapter, namelv that the best form of supplicatiorl is stated to be ( 5 &I, . whereas here it is stated to be Istighfaar. This apparent differ...",
+        "content": "<div class=\"story-content\"><p>of this chapter, namelv that the best form of supplicatiorl is stated to be ( 5 &I, . whereas here it is stated to be Istighfaar. This apparent difference is accord- ing to the differing circumstances. For a pious man. ( A ~ J ) $ is the best form of supplication, whereas a sinner should % a do Taubah and Istighfaar, and for him Istighfaar is nat- =- i ~ r a l l y the most suitable supplication. For increase of I~en- T efits, praising and glorifying Allah is more effective, while for relieving the evils and hardships, Istighfaar proves to be more effective. There are also several other reasons for this difference. Hadith<br><hr><br>As narrated by Hadhrat Abu Bakr (Radhiyallaho anho) Rasulullah (Sallallaho alaihe wasallam) had said: \"Recite ( L I ~ IJ I ~ ) and Istighfaar as frequently as vou can, because Shaytaan says: \"I ruin the people by inclining them to commit sins but they frustrate me through their recitation of (&I $ 4 1 ~ ) and Istighfaar. When I find this so, I mislead them to indulge in bid'at and thereby make them follow their base desires in the belief that they are still on the right path.\" 132 Virtues of Zikr Note:- The main object of Shavtaan is to inject poison into one's mind, as stated under Hadith<br><hr><br>in part 2 of Chapter I, and he is successful in doing so only when the heart is not engaged in zikr. otherwise he has to retreat in disgrace. In fact, zikr of Allah purifies the heart. It is nar- rated in Mishkaat that Kasulullah (Sallallaho alaihe wasal- lam) had said: \"For every thing there is a cleaner, and the heart is cleansed by means of zikr of Almighty Allah.\" The effect of Istighfaar is similar, as mentioned in many ahadith that it removes the dust and rust from the heart, Abu Ali Daqqaaq (Rahmatullah alaih) writes that when a person re- cites +~ly, with sinceritv, his heart is cleansed of all dirt (as a mirror is cleaned with a wet cloth), and when he says ,ksi,, his heart shines with its light. It is clear that, under these circumstances, the whole effort of Shaytaan is bound to go waste. Ruining through base desires, means that one may begin to consider wrong as right, and give reiigious sanctity to whatever he desires. This practice has been condemned in the Holv Qur'an at several places. At one place it is said: Hast thou seen him who maketh his desire as a god and Allah sendeth him astray knowingly and sealeth up his hearing and his heart, and setteth on his sight a covering? Then who will lead him, after Allah (hath condemned him)? Will ye not then heed? (Surah XLVl23). It is said at another place in the Holy Qur'an: .. 133 t i . 1 : t 1 i 1 o ' i l l ~ l t s ( 1 i 1 1 ' I I irreligious deed as a religious one, so that one does it as an article of faith and hopes to get reward for it. As the person performs it as a religious act, there is no likelihood of his doing Taubah. If somebody is habituated to obvious sins, like adultery and theft, there is a possibility that he may do Taubah and give them up, but if somebody is doing a wrong thing under the impression that it is religious duty, the question of his doing Taubah does not arise. Rather, he will get more involved in it day by day. This explains the words of the Shaytaan: \"I involved them in sins, but they frustrated my efforts through zikr, Taubah, and Istighfaar: thereu~on 1 entrapped them in such a manner that their escape became impossible.\" 'I'hus, it is essential that in all matters of religion, guid- ance be sought frorn the ways of life of Rasulullah (Sallal- laho alaihe wasallam) and of his Companions (Radhiyal- laho anhum). Doing otherwise is devoid of virtue, and will entail sins. lrnam Ghazali (Rahmatullah alaih) has reported from Hasan Basri. (Rahmatullah alaih) a narrative that Shaytaan says: \"I presented sinful deeds in an attactive form to the Muslims, but they nullified my efforts through Istighfaar. Then I presented before them vices in the garb of virtues, thus leaving no initiative for Istighfaar.\" Instances of such vices are self-made innovations in religious practices. Wahb bin Munabbih (Rah~natullah alaih) says: \"Fear Almighty Allah. who knows everything; you curse Shay- taan in the presence of others, but you quietly obey and be- friend him.\" Some Sufis have narrated: \"It is most unfortunate that, in spite of knowing Almighty Allah as our real benefactor, and ackrlowledgillg His favours, we should show disobedience to Him and obey Shaytaan, whom we know and believe to be most tre~~c.horous and our greatest enemv.\" Hadith No 22 Who geteth further astray than one who followeth his lust without guidance from Allah? Lo! Allah guideth not wrong-doing folk. (XXXVIII/50) There are many other verses on the same subject. It is most trc!ac:herous attack of Shaytaan that he presents an 134 Virtues of Zikr is.&C@~jd@JjlydjJ JUI& i ~ U ~ ~ i ~ k ~ 4 diplrj. : L J & J , , ~ , , ~ ; L I & W ; ~ ~ Y ~ J ~ Y ~ l i ~ q c . J i ~ , 1 ; ? 1 4 b ~ ; r i e , Rasulullah (Sallallaho alaihe wasallam) says: \"Whosoever professes sincere belief in i~ j+; G 81 y~ j~ y at the time of his death, shall certainly enter Paradise.\" According to another hadith, \"He shall certainly be pardoned by Almighty Allah.\" Note: Rasulullah (Sallallaho alaihe wasallam) is also re- ported to have said: \"Listen to happy tidings, and convey them to others as well. that whosoever believes in ,L J JI y, with sincerity of heart, shall enter Paradise.\" It is the Ikh- laas that is valued by Almighty Allah. A small deed done with Ikhlaas (sincerity) earns a great reward: but anything done for the sake of mere show or to please some people, will 'earn no good reward, but punishment from Almighty Allah. That is why a person who recites the Kalimah with sincerity of heart will certainly be pardoned and admitted into Paradise. It may or may not be that he undergoes some punishment for his sins before going to Paradise; but, if Almighty Allah is really pleased with particular deeds of a sinning believer, He may forgive all his sins in the very first instance. When Allah is so Merciful and Gracious, it is our greatest misfortune if we do not serve and obey Him in full. In short, great rewards are promised in these ahadith for one who believes in the Kalimah Tayyibah. Two possi- bilities are however there: he may have to suffer some pun- ishment for his sins according to the general rule before being forgiven, or he may be forgiven forthwith without any punishment by Almighty Allah, out of sheer Mercy and Grace. Yahva bin Akhtam (~ahmatullah alaih) is a Muhad- dith. After his death, somebody saw him ill a dream, and asked him how he had fared. He replied: \"I appeared before Almighty Allah, and He said to me: 'You sinful old man, you did this and you did that', till all my sins were recounted one by one, and I was asked if I had any expla- nation in my defence. I submitted that no hadith to that effect had been conveyed to me. Then Allah asked: 'What hadith had been conveyed to you?' I submitted: \"I was told by Abdur Kazzaaq who was told by Muammar who waz told t)y Zuhri who was tolti bv Ilrkvnh who was told bv (;/I. 11: /ihudi1h on Virtues of Kctlimcth 'I'(ty!i(ll)(th 135 Hadhrat .Aa-ishah (Kadhiyallaho anha), who was told by Rasulullah (Sallallaho alaihe wasallam), who was told bv Jibraa-eel (Alayhis salaam), who was told by You: 'A person who grows to old age in Islam may have deserved punishment on account of his sins, yet as a token of respect for his old age, I pardon him', and You know that I am very old.\" Allah then said, Abdur Razzaaq spoke the truth, Muammar spoke the truth, Zuhri spoke the truth, Urwah spoke the truth, 'Aa-ishah (Radhivallaho anha) spoke the truth, Kasulullah (Sallallaho alaihe wasallam) spoke the truth, Jibraa-eel (Alayhis salaam) spoke the truth, and what I had said is true.' After that, it was ordered that I should be admitted into Paradise.\" Hadith No 23 Rasulullah (Sallallaho al'aihe wasallam) said: \"There are obstacles in the way of every action before it reaches Almighty Allah, but recitation of $1$&5!) and the prayer of a father in favour of his son go up to Him unchecked.\" Note: 'Going unchecked upto Almighty Allah means that these two actions are accepted without any delay. Whereas there are intermediate stages for other deeds before they reach Allah, these two things go to Him directly. There is a story of a Kaafir king, who was extremely cruel and bigoted against the Muslims. It so happened that he was captured alive in a battle against the Muslims. As he had caused a lot of sufferings to the Muslims, they were naturally very revengeful. They put him in a cauldron placed on fire. At first, he besought his idol gods for help, but finding no response from them he* b7came a Muslim and started continuous recitation of Y!& 9). How sin- cerelv and devotedly he must have been reciting can well 136 Virtue: of Zikr Hadith No 25 be imagined. At once help came from Almighty Allah in the form of heavy rain, which extinguished the fire and I .. cooled the cauldron. It was then followed bv a powerful 9 , I JG 3 j$ G.p a &jj JG & 2 (yo) 0 ' ~ h\\ cyclone which carried away the cauldron and dropped it in a city inhabited by non-believers. He was still engaged in the recitation of the Kalimah. The people there were sj 4A.j + i , J& ;! . J & ~ + Jl wonderstruck by this scene, and after listening to his whole story all them also embraced Islam. > #. J,j ;? r;i JG w..j '! 3 ;;rj ;;i J$ $ /& i;ul , . h * 2 * hl; JG y! I G3i & .. > . +i & +q Hadith<br><hr><br>&I L . J= JG, *+i )-dl ,j IX L U ~ cw9~ ,j +I . . . . 3 u L J i up\\ 4j irly ow fl u ,y L i - 1 j I j *r-l -3 + b ) \\ ~ d y k F ~ ! , & ~ i c ~ > ~ J & ~ c ~ ~ ~ d > i . Y ~ d C 0 &A\\ LIS +Y dl J+ & $1 JH '\"r YG +J % + m L T h 5 Once Hadhrat Talhah (Radhiyallaho anho) was seen sitting in a sad mood. Somebody asked him why Rasulullah (Sallallaho alaihe wasallam) says: \"On the he was so sad. Ile said: \"I had heard from Rasulullah Day of Resurrectinn, He!] yould be forbidden for all (Sallallaho alaihe wasallam) that he knew the words those who had recited c~lY!o!.j, with the sole aim of which, if recited by a dying person at the time of his earning the pleasure of Allah.\" death, brings him relief from the pangs of death, so that his face brightens and he dies in happiness. Unfor- Note: tunately I c;ould not enquire about those words from That a person who recites Kalimah Tayyibah with sin- Rasulullah (Sallallaho alaihe wasallam), and therefore cerity will, as a rule, be safe from the fire of Hell is con- I arn feeling unhappy.\" Hadhrat Umar (Radhiyallaho ditional on his being free from the major sins. Forbidding anho) said that he knew7 those words. Ijadhrat Talhah of Hell for such a person may of course mean that his eter- (Kadhiyallaho anha) jovously asked what those were and Hadhrat Unlar (Radlliyallaho anho) said: \"We nal stav therein is forbidden: but who is there to question 1 Almighty Allah if he forbids Hell altogether for the sincere know that no words are better than the Kalimah which reciter of the Kalimah, in spite of his sins. Mention is made was offered by Rasulullall (Sallallah~~ qle~he wasallam) to his uncle Abu Taalib and it is (d\\Yl 4) .\" Hadhrat in ahadith of such people whose sins will be enumerated by Almighty Allah on the Day of Judgement. so that they Talhah (Kadhiyallaho anho) said \"Hv Allah! it is this, will feel sure of being doomed to heavy punishment, but 1 By Allah! it is this.\" after their confession, Allah will say to them: '1 covered Note: your sins in your worldly life, and I cover them now and pardon you.' Many similar cases have been related in aha- It is related and implied in manv ahadit11 that the Kali- dith. There is thus little wonder if all the reciters of the Ka- mah Tavyibah constitutes light and happiness through and limah may be treated in this way. There are many blessings through. Hafiz Ibn Hajar (Rahnlatulla!~ alaih) has stated in and benefits in reciting the exalted name'of Allah, so that his book Mun'ibbihaat: \"'There are ~ I ! , I J kirlds of darknesses, one should do it as often as possible. How luckv are those for which there are five specific lights. The love of the blessed souls who understood the virtues of this Kalimah. world is a darkness, the light for it is a piety; sin is a dark- and devoted their lives fullv to its recitation. ness, the light for which is Taubah; the grave is a darkness, I 138 Virtues of Zikr 40 the light for which is the Kalimah c h l & U 311 i!d! Y) the i next life is a darkness, the light for which is good deeds; 4 and Pulsiraat is a darkness, the light for which is Faith.\" Raabiah Adawiyyah (Rahmatullah alaiha) a well known woman saint, used to remain busy in salaat throughout the night, would sleep a little at the time of early dawn and would wake up abruptly just before the Fajr prayer, blaming herself and saying: \"How long will you lie asleep; sbon you will be in the grave, where you will sleep till the Doomsday.\" At the time of her death, she told her maid-servant that she should be buried in the patched woolen cloak, which she used to wear at the time of Tahajjud prayer, and that nobody should be informed or her death. After her burial according to her wishes, the maid-servant saw her in a dream wearing a very beautiful dress. When asked what happened to her old woolen dress, she replied that it had been deposited with her deeds. The maid servant requested her for some advice, and she re- plied: \"Do zikr of Almighty Allah as much as you can; by virtue of this you will be worthy of envy in the grave.\" At the time of the death of the Holy Prophet (Sal- lallaho alaihe wasallam), his companions were so much shocked and grieved that many of them became overwhelmed with frustration and doubts of various sorts. Hadhrat Uthman (Radhiyallaho anho) said: \"I was also one of those who were given to frustration. Hadhrat Umar (Radhiyallaho anho) came to me and wished me salaam, but I was too absorbed to be aware of his coming. He complained to Hadhrat Abu Bakr (Radhiyallaho anho) that I was displeased with him, so much so that I did not respond even to his salaam. Then both of them came to me and wished me salaam. and Hadhrat Abu Bakr (Radhiyallaho anho) enquired 8 3 of me the reason why I had not responded to Umar's Ei5 salaam. Hadhrat Umar (Radhiyallaho anho) said: \"Yes, I 5 swear by Allah, most certainly you did\". I denied having be- haved like this, and told them I did not even know of his comin and wishing me salaam. Hadhrat Abu Bakr (Rad- hiyall A o anho) accepted my explanation, and said that it must have happened so, and that probably I must have been absorbed in some thought. I confessed that I was indeed ab- sorbed in deep thought. Hadhrat Abu Bakr (Radhiyal- laho anho) enquired what it was, and I submitted that I was worried because Rasulullah (Sallallaho alaihe wa- sallam) had died and we had failed to enquire from him the basic thing required for salvation. Hadhrat Abu Bakr (Radhiyallaho anho) said that he had made this enquiry from Rasulullah (Sallallaho alaihe wasal- lam). I got up, and praised him saying that only he was worthy of this honour, because he always exelled in matters of religion. Hadhrat Abu Bakr (Radhiyallaho anho) then said, I had asked Rasulullah (Sallallaho alaihe wasallam) what basic thing was necessary for salvation, and he had replied that whoever accepts the Kalimah that he had offered to his uncle Abu Talib at the time of his death (but which he rejected) will have salvation, and that this Kalimah leads to salvation.\" Note: All the Sahabah were so much upset and overwhelmed with grief and sorrow that even Hadhrat Umar (Radhiyal- laho anho), in spite of his being so brave, held out his 140 Virtues of Zikr sword in his hand and proclaimed: \"I will chop off the head of whosoever.says that Rasulullah (Sallallaho alaihe wasallam) is dead. He has only gone to meet his Allah, as Hadhrat Moosa (Alayhis salaam) had gone on Mount Toor.\" Some of the Sahabas feared that the death of the Prophet (Sallallaho alaihe wasallam) meant the end of Islam, some thought that there was no longer any chance for the progress of Islam, whereas some were dumb- founded and could not even speak. It was only Hadhrat Abu Bakr (Radhiyallaho anho) who, in spite of his extreme love and attachment with Rasulullah (Sallallaho alaihe wa- sallam), remained firm, calm, and collected. He got up and delivered his forceful address, beginning with the verse j i j , which means \"Muhammad (Sallallaho alaihe wasallam) is but a messenger; many messengers have passed away before him. Will it be that when he dieth or is slain, ye will turn back on your heels? He who turneth back doth no harm to Allah, but Allah will reward the duti- ful.\" This story has been briefly related by me in my book Stories of Sahabah. Another point made in the above mentioned hadith is on what essential basic thing does salvation depend. It can be interpreted in two ways. Firstly, it may mean: The mat- ters of Deen are many, but what is that on which all these things of 'Deen depehd, and which is indispensable? According to this interpretation, the reply given above is clearly understood: The whole of Deen depends on the Ka- lfmah which is the fundamental tenet of Islam. Secondly it can mean that there are hardships in the path of Deen viz. doubts crop up, the machinations of the devil are a con- stant source of trouble, worldly needs demand one's atten- tion, etc.; how can these be overcome? In this case, the saying of Rasulullah (Sallallaho alaihe wasallam) would mean1 that frequent recitation of Kalimah Tayyibah will help overcome all these difficulties, for it develops sincer- ity of intention, it cleanses the heart, it causes defeat of the devil, and has many other benefits, as mentioned' in all these ahadith. It is said in one hadIth that the Kalimah &I yl d! 9, wards off ninety nine kinds of calami- ties, the least of which is grief, which is a constant worry for a man. Hadith<br><hr><br>- +Y j\\ \\sjy w $1 d, + 3 w $1 dJ 3 b irb Ti1 epb &I + a,i5 1-b JIiJ >I f! i! J ,UI &G $1 4./r YI US JI 4 3 L + Uj.21 icl( '-+& 3 i+L: J(3 Wi &G, , 0 8 2 gr;j Hadhrat , Uthman (Radhiyallaho anho) narrated 5 that he had heard Rasulullah (Sallallaho alaihe wasal- lam) saying: \"I know of a Kalimah which, if-recited by a person with sincerity of heart, fobids the fire of Hell to touch him.\", Hadhrat Umar (Radhiyallaho anho) said: \"Shall I tell you what that Kalimah is? It is the same Kalimah by virtue of which Almighty Allah hon- oured Rasulullah (Sallallaho -alaihd wasallam) and his companions, it is the same Kalimah of piety that was offered by Rasulullah (Sallallaho alaihe wasallam) to his uncle Abu Taalib at the time of his death. It is L $1 ~ I J . Note: This well known story of Abu Taalib, the uncle of Ra- sulullah (Sallallaho alaihe wasallam) is given in the books of Hadith, Tafseer, and history. As he had been helping Ra- sulullah (Sallallaho alaihe wasallam) and the Muslims, Ra- sulullah (Sallallaho alaihe wasallam) went to him when he wasabout to die,and said: \"Omy uncle,recite (2 4! ii! J, , even now, so that I may be able to intercede on your behalf on the Day of Judgement, and i may bear witness before Allah that you embraced Islam.\" Abu Taalib replied: \"People will taunt me for having accepted the faith of my nephew for fear of death, otherwise I would have pleased you by recit- ing this Kalimah.\" Rasulullah (Sallallaho alaihe wasallam) returned from there deeply grieved. It was in this connec- tion that the Qur'anic verse Virtues of Zikr 1 mad (Sallallaho alaihe wasallam), whose name ap- peared along with Yours.\" In reply, it was revealed, was revealed, which means: \"Lo! Thou guidest not whom thou lovest, but Allah guideth whom He will.\" It is evident from this incident that those who indulge in sins and bad \"He is to be the last of all the prophets, and will be your descendant. If he were not to be created, you would not have been created.\" deeds, and disobey Allah and His Prophet Rasulullah (Sal- Note: lallaho alaibe wasallam), but think that they will get salva- tion by virtue of the prayer in their favour of some pious person are sadly mistaken. All power rests with Almighty Allah, to whom we should always turn and with whom we should establish our real connection. However, the com- pany of pious men and their prayers and good wishes can help us in achieving this end. How, at that time, Aadam (Alayhis salaam) prayed, wept and besought pardon has been described in many ahadith. Only those who have experienced the agony of the displeasure of a master can have some idea about the plight of Hadhrat Aadam (Alayhis salaam). On account of the dis- pleasure of earthly masters, a servant gets very much wor- ried, but in the case of Hadhrat Aadam (Alayhis salaam) it was the displeasure of the Lord of Lords, the Sustainer of Hadith<br><hr><br>the whole universe, and in short the anger of Allah the Great himself over one before whom the Angels were made to bow, and who enjoyed the position of a favourite. The 'E; 8 3 Cs higher the position of a favourite, the more he feels the wrath of the Master, provided he is not mean; and in this case a prophet was involved. Hadhrat Ibn Abbas (Radhiyal- laho anho) narrated that Hadhrat Aadam (Alayhis salaam) wept so much that his weeping exceeded the total weeping by all the people of this world, and he remained in sajdah for forty years without lifting up his head even once. Hadh- rat Buraidah (Radhiyallaho anho) also narrated that Rasu- lullah (Sallallaho alaihe wasallam) had said: \"The weeping of Hadhrat Aadam (Alayhis salaam), if compared, will exceed the weeping by all the people of the world.\" It is stated in another hadith that his tears would outweigh the tears shed by all his descendants. Under these circum- stances, in how many ways he must have lamented and re- Rasulullah (Sallallaho alaihe wasallam) said: \"After Hadhrat Aadam (Alayhis salaam) happened to commit the mistake as a result of which he was trans- ferred from Paradise to this Earth, he used to spend all his time in weeping, praying and repenting, and once he looked up towards the Heaven and prayed: \"0 Allah! I beg Thy forgiveness in the name of Muhammad I I pented can well be imagined. In addition, he even begged to be pardoned for the sake of Rasulullah (Sallallaho alaihe wasallam). That the Kalimah &I jj;; G b i! A! 9 is written on the Arsh is corroborated by many other ahadith. Rasulullah (Sallallaho alaihe wasallam) had said: \"When I entered Paradise, I saw three lines written in gold on both sides. In the first line was written (Sallallaho alaihe wasallam).\" \"Who is Muhammad?\" came the enquiry through Divine revelation. He hl JjL; Gi& 3, g! A! 9 replied: \"When you had created me. I saw the words L JjL; U d BI i! d! J written on Your Arsh, and since then I believed that no human being is superior to Muham- In the second was written u> &Lj &j & G j U&j sJj 144 Virtues of ;:ikr What we sent in advance (i.e. charity, etc.), we found, what we consumed we enjoyed', and what we left behind we lost), and in the third line was written (People are sinful, but the Lord is forgiving). A saint relates: \"I happened to visit a town in India, and there I came across a tree, the fruit of which resembles the almond and has a double shell. When it ip broken, a rolled green leaf comes out with JjL; 3% Q in- scribed on it in red. When I spoke about it to Abu Yaqoob, the hunter, he was not suprised at all, and told me that in Elah he had caught a fish, which had gl q inscribed on . . one ear and j;; t;;; on the other. Hadith<br><hr><br>Hadhrat Asma (Radhiyallaho anha) relates that Rasu- lullah (Sallallaho alaihe wasallam) said: \"The greatest name of Allah, which is generally known as Ismul- A'zam, is contained in the following two verses (pro- vided these are recited with Ikhlaas).\" Note: It is stated in several ahadith that whatever prayer is made after the recitation of Ismul-A'zam is granted by Allah. However, scholars differ in specifying the Ismul- A'zam, as is the case with some of the most sublime things that Almighty Allah keeps them partly secret. This results in difference of opinion about their specification. Thus, 1 'aypabah 145 there is difference of opinion about Laylatul Qadr (Night of Power) and in respect of the special time of acceptance of prayer on Friday. This difference of opinion in such mat- ters is a blessing in disguise, as explained in detail in my book on Fadhaail-e-Ramadhaan. Thus, there have been dif- ferent narrations in respect of Ismul-A'zam; that given above is one of these. There have been ahadith too in regard to these two ayaat as follows:- Hadhrat Anas (Radhiyallaho anho) reported that Rasu- lullah (Sallallaho alaihe wasallam] had said that no other verse falls so heavy on the most mischievous and wicked devils as the two ayats beginning with 1 According to Ibrahim bin Wasma, the recitation of the fol- la lowing ayats is very effective in cases of mental derange- ment, etc., and whosoever is particular in their recitation will be safeguarded against such maladies; and that these are written on the corner of the Arsh and cause relief to ter- rified children or those who fear of the evil eye. Allama Shami (Rahmatullah alaih) has quoted Imam Abu Hanifa (Rahmatullah alaih) as saying that Ismul-A'zam is the word \"Allah\". He has also stated that Allama Ta- haawi as well as other scholars supported this view. The great mystics and Sufis also have reached the same conclu- sion, and that is why the zikr of this Holy word is practised more than anything else by their followers. The leader of the saints. Hadhrat Shaikh Abdul Qadir Jilani (may Allah enlighten his grave), is also of the same view that \"Allah\" is the Ismul-A'zam, provided at the time of its recitation, there is nothing but Allah in one's mind. He further ad- vised that during its recitation ordinary people should I think of His grandeur and fear Him, while the spe ialists in I zikr should also concentrate on His attributes, an $i the sel-</p></div>",
+        "sections": [
+            [
+                30,
+                16422
+            ],
+            [
+                16422,
+                26106
+            ]
+        ]
+    }
+]);
@@ -0,0 +1,87 @@
+// Fazail-e-Amaal Data Shard: book 5
+fazailData.stories.push(...[
+    {
+        "id": 36,
+        "bookId": 5,
+        "chapter": "Importance of Tabligh",
+        "title": "Content for Importance of Tabligh",
+        "preview": "146 Virtues of Zikr 1 ected few should have in their mind thoughts of nothing else except Almighty Allah. He also stated that it was for this reason t...",
+        "content": "<div class=\"story-content\"><p>146 Virtues of Zikr 1 ected few should have in their mind thoughts of nothing else except Almighty Allah. He also stated that it was for this reason that this blessed name is mentioned so many times, in fact two thousand three hundred and sixty times, in the Holy Qur'an. Shaikh Ismail Farghaani (Rahmatullah alaih) relates: \"1 had, for a long time, a keen desire to learn this Ismul- A'zam, and for this purpose I had undergone great hard- ships: I would fast for days together, so much that some- times I would fdll senseless on account of severe hunger. One day, I was sitting in a mosque in Damascus, when two men entered there and stood besides me. To me they looked like angels. One of them said to the other: \"Do you want to learn Ismul-A'zam?\" \"Yes\", replied the other, \"please tell me.\" On hearing this conversation, I became more attentive. The former said, \"It is the word \"Allah\", provided it is recited with Sidqul-Lija (I+ J-1, which according to Shaikh Ismail (Rahmatullah alaih) is the state of mind comparable to that of a drowning person when there is nobody to save him, and he calls Almighty Allah I for help with extreme sincerity. In order to learn the Ismul- A'zam one should possess high qualities as well as endur- ance and self-restraint. There is a story of a pious person who knew the Ismul-A'zam. Once a man came to him and begged that 'he should be taught the Ismul-A'zam: \"You lack the required capability,\" said the pious person. \"No, I am capable of learning it,\" said the supplicant. The pious person then asked him to go and sit at a particular place and then come back and relate to him his observations. The man went there and saw an old man who was bringing fire- wood on his donkey from the jungle. A policeman came from the other direction and started beating the old man and snatched away his firewood. The man was extremely enraged against the policeman and came back to report the whole incident before the pious person, and said that if he had known the Ismul-A'zam he would have prayed against that policeman. The pious man said: \"I learnt the Ismul- 1 A'zam from that very old man who was bringing the fire- wood.\" Hadith<br><hr><br>I Rasulullah (Sallallaho alaihe wasallam) said that Almighty Allah will order on the Day of Judgement: \"Take out of Hell all persons who professed (b y!ii!y, and who had an iota of Imaan in their hearts; take all those who recited (L 4) or remembered Me in any way or feared Me on any occasion.\" Note: The blessings-that Almighty Allah bestows on account of this Kalimah can be imagined from the fact that if a hun- dred years old man, who practised Kufr and Shirk all his life, happens to recite this Kalimah once with Imaan and 2 VI 2 % L sincerity, he becomes a Muslim and all the sins committed EN by him are washed away; and if he happens to commit any sins after he had become a Muslim, even then, by virtue of this Kalimah, he will sooner or later be released from Hell. Hadhrat Huzaifa (Radhiyallaho anho) who was a confi- dant of Rasulullah (Sallallaho alaihe wasallam) narrated that Rasulullah (Sallallaho alaihe wasallam) had once said: \"A time will come when Islam will become weak arid dim like the worn-out prints on an old cloth, when nobody will even know about fasting, Hajj or Zakaat, till one night even the Qur'an will be lifted from this world, so that no one will remember any ayat. At this time, old men and women will say that they had heard their elders reciting the Kali- mah ( j ~ jl ilq, and that they would recite it too.\" A pupil of Hadhrat Huzaifa enquired: \"When there is no Hajj, Zakaat, fasting or any other fundamental of Islam, will the mere Kalimah then be of any use?' Hadhrat Huzaifa (Radhiyal- laho anho) did not answer, but when his pupil repeated his enquiry a second and then a third time, he replied: \"Sooner or later it will cause deliverance from Hell, deliverance from Hell, deliverance from Hell.\" He implied that the Ka- limah will deliver from Hell after one has undergone the punishment for not observing the fundamentals of Islam. This is what is meant by above mentioned hadith that a person with even an iota of Imaan will be freed from Hell one day. It is als? qarrated in one hadith: \"Vl'hosoever re- cites the Kalimah &I '91 d!J. it will ccjme to his rescue one day, which may be after he has undergone some punishment.\" 148 lirtues of Zikr Hadith<br><hr><br>+ & & ~ ; j g $ I I I rogance. And of the two things which I recommend. one is the Kalimah (31 j! ii!~), which weighs heavier than all the Universe together with all its contents; in fact the latter, if placed under it will get crushed and crumble on account of its weight; and the second is (+j L G ) , which two words constitute the prayer of all the creation, and by virtue of its blessings every- thing gets its sustenance. Note: The comments of Rasulullah (Sallallaho alaihe wasal- lam) on the clothes implied that the outward appearance provides an indication of one's inner self. When a person's outward behaviour is incorrect, his inner mind is bound to be defective as well. Hence every effort is to be made to im- prove the exterior because the interior is dependant on it. 2 2 and the Sufis lay stress on outward cleanliness through Wudhu. etc., as a first step for attaining inner purity. Those 8 who talk of internal improvement and ignore the external betterment are not right. The external betterment is as im- portant as the internal one. One of the duaas of Rasulullah (Sallallaho alaihe wasallam) was: h L I-, 4i! w 13 i*' cjE 431 Lj a(,., $1 Y! il!Y * dL;I' 4 P! jLl2' yj d l 4 c;C GI),! jyl #I), Jb i $1 Jl& J ~ J \" ~ ; C ~ ~ ' ~ ~ J ! L ( { J&;* J U + ~ ~ J ~ ) J ! J JIwj- tb 0 Allah! make my interior better than my exterior, and A J . I ~ 3 j & l 3 4 JJL J & L * ~ l J - & ~ J i e ~ ( j i J ~ F make my exterior noble and good). Hadhrat Umar narrates 4 Jb -1 J ~ J + JI 0- 4b ;r. ,91 ahJ +A- \" JIIJJI ah, -i b~J, that this duaa was recommended to him by Rasulullah (Sallallaho alaihe wasallam). P! pj &---1 L* u ,y1 GI,, There came to Rasulullah (Sallallaho alaihe wasal- lam) a villager who was wearing a long silken robe bor- dered with silken lace, and said to the Sahaba: \"This friend of yours wants to exalt every ordinary shepherd and his children, and to degrade every (noble) horse- man and his children.\" Rasulullah (Sallallaho alaihe wasallam) got up in anger and pulling his robe by the lapel said to him: \"Are you not dressed like a fool?\" Then after going back to his seat, he added: \"At the time of death. Hadhrat Nooh (Alayhis salaam) sum- moned his two sons and said to them: 'I recommend to you two things and warn you against two things. The two things against which I warn you are shirk and ar- Hadith No 32 150 Virtues of Zikr LI i! ii! Y JG 2 $1 LI i! ii! 9 jj ;+, j LI g! ii! 9 27 >I g! ii! 9 1 4 L ! - +ji d ,.&) 2 A1 JyJb &i is Q +ji d l &I Y! 2) Y JIi 2 iyj 4 G y l j ,MI ,!, &,I!, O I U eJL- 4 &.dl o h &I LWj +I,dJ +dIJ JIi is Q 'LYI JJ~~L&,&~J$I&~ JWIP+ j$.41~&~$ 4 1 5 .. 0 1 , &I Y! a! Y Jb 4-1 & 6jJj j) +&L dG) &J, 3u ' . a ~ d & ) d ! ~ ; i ~ ~ ~ ~ i d Y l L ~ l u & l ~ ~ ~ b ~ ~ l i & * . irt ?+b Cl. &I kj,. d,,, c-6 31 .I, +i ,. ,.+ JIi \"j dyi j 0,5i CAI JM +iLijtWI Jb 3 4 OA& pu J)UI hi j 02, iik bb& Jpdl 31 & +jj Once Hadhrat Abu Bakr (Radhiyallaho anho) came to Rasulullah (Sallallaho alaihe wasallam) in a very sad mood. Rasulullah (Sallallaho alaihe wasallam) asked him: \"You look very sad. What is the matter with you?\" He replied: \"My cousin died last night, and I was sitting near him when he breathed his last.\" \"Did you persuade him to recite ;I i! ii!J?\" asked Rasulullah (Sallallaho alaihe wasallam): \"Yes\", said he. \"Did he recite?\" asked Rasulullah (Sallallaho alaihe wasallam). \"Yes, he had recited it,\" said he. \"Then certainly he will go to Paradise,\" said the Prophet (Sallallaho alaihe wasallam). \"What do the living people get if they recite this Kalimah?\" enquired Abu Bakr (Radhiyallaho anho). Rasulullah (Sallallaho alaihe wasallam) said twice: \"This Kalimah will demolish and ever1 elimi- nate their sins.\" Note: Stress is laid in many ahadith on reciting Kalimah near the dead and in the graveyard. It is said in one hadith that the Kalimah +I i!i!.j, should be recited profusely during a funeral. In another hadith it is said that dii!d!u' (none is worthy of worship except Thee) will be the distinguishing mark of this Ummat, when they pass over the Siraat (the Bridge). In vet another hadith. it is related that when they will rise from their graves on the Day of Resurrection. they will be reciting. $& > , ;I i! ii! y (Nobody is worthy of worship except Allah, and on Him the faithful will rely). In a third hadith, it is said that their mark o,f distinction in the darkness of the Doomsday will be (&i Y! o! j) . The blessings of frequent recitation of the Kalimah fre- quently becomes apparent just before one's death, and in the case of some pious men, these blessings appear even earlier in their life. Abul Abbaas related: \"I was lying sick in the town of Ashbila. I saw a large flock of huge birds of different colours, white, red, green, etc., which were spreading their wings all together and there were many men who were carrying something in big covered trays. I took them as gifts of death, and started reciting the Kalimah Tayyibah hurriedly. Then one of those men said to me that the time of my death had not yet come, and that this was a gift for another believer.\" Just before his death, Hadhrat Umar bin Abdul Aziz (Rahmatullah alaih) asked those around him to make him sit up. After they did so, he said: \"0 Allah! You ordered me to do many things, which I could not do, and You for- bade me certain things, but I disobeyed you in them.\" He repeated these words thrice. and then after reciting ,iaJ!iij)began to stare in one direction. Somebody asked him what was he looking at He said: \"There are green fig- ures who are neither men nor Jinn\", and then breathed his last. Sombeody saw Zubaidah (Rahmatullah alaiha) in dream and asked her how she fared. She replied that she has been pardoned on account of reciting four Kalimahs. 49 % $ii b~ y\\ . i\\ . 9 &> @b~i!i!g ;j $: 3 \\ 6\\ y'! A! 9 &+jb $i&\\y!i!9 (i) I will hold fast unto $1 until I die. with me into my grave, (ii) I will take $1 j! (iii) I will pass my time of solitude with& J! id). (iv) I will take 4, j! ii!j) with me when I appear before my Sustainer. Hadith No 33 + 153 152 Virtues of Zikr , ai yj LWI dI-, -1 bL -c?J~ every tree, so that there are many witnesses in your favour on the Day of Judgement: and if you happen to commit a j +I, +)>,. ;,I ki -7 >I\" 4 241 JU ,.+. ( 1 ~ 3 LL sin, do some virtue immediately in atonement thereof, so & ~UI, c k 9 ~ ~b &I JI Ji +?I, 21 LJI that if the sin is committed in secret the virtue should also be done in secret, and if the sin is committed openly the , y & I 3 b ( j J 41c gb -2 Js J\\iJ ;rz. jlc. &Ul JLrJ U L d p J , * virtue should also be done openly.\" Hadhrat Abu Zar Ghifari (Radhiyallaho anho) sub- mitted: \"0, Rasulullah (Sallallaho alaihe wasallam) favour me with some advice.\" Rasulullah (Sallallaho alaihe wasallam) said: \"When you happen to commit a sin, hasten to do a virtue in atonement, so that the ill effect of the sin may be washed away.\" Abu Zar (Rad- hiyallaho anho) then further enquired: \"0 Rasulullah! (Sallallaho alaihe wasallam) is recitation of 41 u'! A!Y, also a virtue?\" \"It is the best of all virtues,\" was the reply of Rasulullah (Sallallaho alaihe wasallam). Note: A minor sin, no doubt, is washed away by a virtuoys deed, but a major one is wiped off, as a rule, through Taubah or of course through the Mercy of Almighty Allah, as explained earlier in this book. In either case, the wiped- out sin is neither written in the account of deeds nor men- tioned anywhere else. So it is said in one hadith that when a man does Taubah, the Almighty Allah makes the scribing angels forget that sin. It is forgotten even by the hands and feet of the sinner, and even by the piece of land where it was committed, so that there is nobody to give evidence for that sin on the Day of Judgement, when the hands, feet, and other parts of the body of the person himself will stand wit- ness for his gopd or bad deeds, as will be explained in Hadith<br><hr><br>of Chapter 2 part 3. The subject matter of the above mentioned hadith is supported by many other ahadith. There are many ahadith to the effect that Taubah from a sin washes it away, as if one had never committed it. Taubah means to repent and feel ashamed of the sin that has been committed, and make a firm resolution not to repeat it. Rasulullah (Sallallaho alaihe .Wasallam) according to one hadith has said: \"Do wo~ship Allah only, and do not ascribe any partner to Him; be since~e in all your actions es if you are standing before Almighty Allah; consider your- self among the dead; remember Allah near every stone and Hadith No 34 Rasulullah (Sallallaho alaihe wasallam) has said: \"Whosoever recites the following ten times will be re- warded with forty thousand virtues\": Note: Great rewards are mentioned in the books of hadith for reciting Kalimah Tayyibah a certain number of times. It is said in one hadith: \"When you offer an obligatory Salaat, then recite: ten times, because its reward is equivalent to that of releas- ing a slave from bondage.\" Hadith No 35 154 Virtues of Zikr It is said in another hadith: \"Whoever recites: two million virtues will be written to his credit. Note: How great is the kindness and benevolence of Almighty Allah, that He bestows thousands and millions of virtues for the mere recitation of this Kalimah, which action does not involve hard labour or much time; but, un- fortunately we are negligent and remain so much absorbed in our wordly pursuits that we never care to take advantage of these bounties. Almighty Allah grants at least ten times reward for every virtue, provided it is done with Ikhlaas, and then this reward multiplies further according to the degree of sincerity. Rasulullah (Sallallaho alaihe wasallam) has said: \"When a person embraced Islam, all his previous sins are forgiven, and then every virtue is rewarded ten to seven hundred times, and even more than that as Almighty Allah may please, but a sin is indicated as a single deed and if it is forgiven by Allah it is not even mentioned in the account of deeds.\" According to another hadith, a virtue is noted in the account of a person as soon as he intends to do it, but when it is actually done its reward is increased from ten to seven hundred times, and even more, as Allah may please. There are many ahadith to this effect, that Allah's bounty knows no limits, provided a person tries to deserve it. The pious people keep this thing in view, and so they are not misled by any amount of worldly wealth. (0 Allah! make me one of them). Rasulullah (Sallallaho alaihe wasallam) had said: \"There are six kinds of deeds and four categories of people. Of the deeds, the first two kinds lead to definite results, two carry equivalent rewards while the reward is ten times for the fifth and seven hundred times for the remaining one. Of the first two kinds of deed, one is certain to lead to Paradise a person who is free from Shirk at the time of his death, and the other is certain to lead to Hell a person who 155 is committed to Shirk at the time of his death; of the two kinds of deeds which bring equivlrlent rewards, one is to make firm intention for a virtuous deed (before its actual performance), and the other is to commit a sin which is also recorded as one only. The fifth is to do a noble deed, the reward for which is ten times, while the sixth is to spend wealth in the path of Allah, in which case the reward is enhanced seven hundred times. Of the four categories of people, the first is of those who enjoy prosperity in this world but will face adversity in the Hereafter, the second is of those who face adversity in this world but will enjoy prosperity in the Hereafter; the people in the third category face adversity in both the worlds i.e. they are poor in this life and will be punished 'S in the Hereafter, and the fourth category includes those who are well off in both the worlds. 34 r* A person came to Hadhrat Abu Hurairah (Radhiyallaho 5 anho) and asked him if he had narrated that Almighty Allah multiplies the reward of some virtues one million times. He swore in confirmation that he had heard it exactly like that. According to another version, he had heard it from Rasulullah (Sallallaho alaihe wasallam) that the reward of some virtues is two million times. Almighty Allah says in the Holy Qur'an &J+ 2d > rjij Wfr;) that He multiplies the virtues and grants from His treasure great rewards. Who can imagine the extent of the reward which has been described as great by Almighty Lord? According to imam Ghazali, (Rahmatullah alaih] the great reward will be possible only if we recite these words with full concentration on their meanings, because import- ant attributes of Almighty Allah are described therein. L Hadith No 36 Virtues of Zikr Rasulullah (Sallallaho alaihe wasallam) said, \"When a person performs wudhu (ablution) properly (i.e. ob- serving all its essentials as well as details) and then re- cites: (I bear witness that there is none worthy of worship except Allah, the One who has no partner, and also that Muhammad is His slave and prophet), all the eight gates of Paradise are thrown open for him, so that he may enter as he likes, through anyone of them. One gate is enough for entering into Paradise, but opening of all the eight gates is a mark of special welcome and extreme favour. According to another hadith, a person who did not indulge in Shirk before his death, and never committed any unlawful murder, is allowed to enter para- dise as he may like through any one of its gates. Hadith<br><hr><br>A erson who recite6 (bu'l ope hundred times a day, wi i' 1 on the Day of Resurrection, be raised with his face shining like the full moon, and none can surpass him in excellence on that day except one who recites this Kalimah more than he. Many ahaadith and ayaat confirm that ( i t 4 1 is a light for the heart as well as for the face. It has been observed 41 j that the pious people who are used to reciting this Kalimah excessively have a sort of brightness over their faces, even during their earthly life. Hadith<br><hr><br>1 Rasulullah (Sal\\allaho alaihe wasallam) says. \"Teach the Kalimah (LI Y!~!Y) to a child when h~ s!arts speaking and persuade a dying person tp r,ecite (bt Y! a!%. He who has hads his beginning with (aY!a!Y) and has his end with YI il!~), he would not be required to account for any of his sins, even though he lives for thousand years, (i.e. either he would commit no sin, or if he hap- pened to commit any sin, it would be written off by virtue of Taubah or through the sheer mercy of Almighty Allah). 158 Virtues of Zikr Note: The best way to persuade a dying man to recite the Ka- limah is that those sitting near him should recite it, so that on hearing it he may also do the same. He should not be compelled to do it, because he is dying in agony. That a dying person should be persuaded to recite the Kalimah has been stressed in many ahaadith. In several ahaadith, Rasulullah (Sallallaho alaihe wasallam) is reported to have said, \"The sins of a person who is blessed to recite the Ka- limah at the time of death are washed off just as a building is washed away by flood water.\" According to other ahaa- dith, one who recites this blessed Kalimah before his death gets all his past sins forgiven. It is said in one hadith that a hypocrite is never able to recite it (at the time of hjs death). It is said in another hadith that we should give ~ & I Y ! ~ I Y , as provision to our deceased ones. According to a hadith. one who brings up a child till he is able to recite 5 will not be required to render any account. In one hadith it is said, \"When a person who has been steadfast in offer- ing salaat is about to die, an Angel comes to him, drives away the Satan and persuades him to recite the Kalimah (A1 j>; G d i l i! ii! 3). It is however often observed that this sort of yersua- sion proves useful only in case of those who are accus- tomed to the recitation of the Kalimah during their lifetime. A story is related about a person who used to trade in straw: When he was about to die, people tried to persuade him to recite the Kalimah, but he only cried out. \"The price of this bundle is so much and of that is so much.\" Many such incidents. which had been actually observed, have been described in the book. \"Nuzhatul Basaateen\". Sometimes, involvement^ in a sin prevents a dving person from reciting the Kalimah. The Ulama say that opium has seventy disadvantages, one of which is that the opium-user cannot recollect the Kalimah at the time of his death. On the contrary. brushing one's teeth (with mis- waak) carries seventy benefits. one of which is that to recite Kalimah at the time of his death. It is related about one man that, when he was persuaded before his death to recite the Kalimah. he expressed his inabilitv to recite, because he said, he used to cheat through underweighing. There is a story of another persorl who, when persuaded to recite the Kalimah, said. \"I cannot say it, because I was tempted to cast sinful looks on a woman who had come to purchase a towel from my shop.\" Many such stories are related in the book. 'Tazkirah Qurtabvah'. In view of the foregoing. it is essential for a man to ask and seek Allah's help, forgive- ness of his sins, and to recite the Kalimah at the time of one's death. I Hadith<br><hr><br>h O ' . # , I - JI Y! d! J & &I &+ JU d@ * LI >j tdb $ > (yq, ri\\ uib 4 JW~S + J M UL. $1 JY gtj O@j j;b &y , , . < . A # 3 - # - & -f a\\ Ci;j my; Gr5 dpY &I Y! il!Y ~3 &I -, J S ~ j ~b J ,SJj +G J1 45) p/&I j rJb (4 -LJ i. &I + bJj & d i l l LLL-QIL (5i l a L The Holy Prophet (Sallallaho alaihe hw$sallarn) has r N said, \"No deed can excel recitation of Y! il!J, and this 5 Kalimah does not let any sin remain unwashed.\" Note: That no deed can excel professing this Kalimah is quite apparent, because without belief in this Kalimah no action carries any reward. It is the pre-requisite for the ac- ceptance of Salaat. Fasting, Hajj and Zakaat. because unless there is Imaan, no action is acceptable. Recitation of Kali- mah Tayyibah, which amounts to profession of faith, is not dependent on anything else. If a person has only Imaan and no other virtue in his account, sooner or later he is bound (through the grace of Allah) to get admission into Paradise. On the other hand, if a person does not possess Imaan. then no amount of good deeds will be sufficient for his salva- tion. The second part of the above-mentioned hadith is that the Kalimah does not let any sin remain unwashed. It is unanimously agreed that if a person embraces Islam in his old age, and immediately after recitation of the Kalimah he happens to meet his death, then all his sins which he had committed at 3 disbelievt before his declaration of Imaan are remitted. If, however recitation of the Kalinlah in an earlier stage is implied, then the hadith means that the Kalimah purifies and polishes the heart, and its excessive recitation will cleanse the heart, to such an extent that he must do Taubah, which will result in the forgiveness of his 160 Virtues of Zikr sins. According to one hadith, if a person is particular to recite i19!iij before going to sleep and after getting up, even his wordly affairs will lead to the betterment of his life in the Hereafter, and he will be guarded against misfor- tune and trouble. Hadith</p></div>",
+        "sections": [
+            [
+                30,
+                16429
+            ],
+            [
+                16429,
+                23709
+            ]
+        ]
+    },
+    {
+        "id": 37,
+        "bookId": 5,
+        "chapter": "Verses of Quran on Tabligh",
+        "title": "Content for Verses of Quran on Tabligh",
+        "preview": "I Rasulullah (Sallallaho alaihe wasallam) has said, \"Imaan has more than seventy (According to some, ! seventy seven) branches, of which the most impo...",
+        "content": "<div class=\"story-content\"><p>I Rasulullah (Sallallaho alaihe wasallam) has said, \"Imaan has more than seventy (According to some, ! seventy seven) branches, of which the most important is the recitation of S I J ! ~ ! ~ , one and the least is to remove some obstacle (stone, wood, thorn, etc) from the way; and modesty also is a special requisite of Imaan. \" Note: , Modesty has been specially mentioned, because it serves as a safeguard against many sins like adultery, theft, dirty talk, nakedness, abusive language, etc. Similarly, the fear of bad reputation leads to virtuous acts: In fact, fear of getting a bad name in this as well as in the next life actu- ates a man towards all good deeds, including of course Salaat, Hajj, Zakaat, etc, and obedience in all respects to Almighty Allah. Thus, there is the well-known proverb, \"Be shameless and do whatever you like.\" There is also one hadith to this effect 1 &b +Q +$ \\i! 4 I \"If ou do not feel ashamed, you will do whatever you like.\" T i e fgct is that we abstain from misdeeds for fear of disgrace and shame. A sense of modesty and shame makes one think, \"If I do not offer salaat, I will face disgrace in the Hereafter.\" But if one has lost all sense of shame, he will say \"What does it matter if others call me low?\" According to the above-mentioned hadith, there are more than seventy branches of Imaan. In many ehadith, this number is given as seventy-seven. Scholars have written detailed commentaries on these seventy seven branches. Imam Abu Haatim bin Hibbaan (Rahmatullah alaih) wrote, \"I contemplated on the meaning of this hadith for a long time. When I counted the forms of prayers, the number far exceeded seventy-seven. If I counted the things which are specially mentioned in the ahaadith as branches of Imaan, their number was less. The things counted as part of Imaan in the Holy Qur'an would also total less than this. I, how- ever, found that the total of such things mentioned in both the Qur'an as well as the hadith, agreed with this number. I therefore concluded that the above-mentioned hadith im- plied all these things.\" w 0 Qaadhi Iyaadh (Rahmatullah alaih) writes, some people have made special efforts to give details of these branches of Imaan by means of Ijtihaad, but failure to know all these details does not mean any defect in one's Imaan, as its basic principles (with their details) are so well known. Khattaabi (Rahmatullah alaih) says that full details of the exact number is known only to Allah and His Apostle, but they are there in the Islamic Code (Sharist), and therefore it does not matter if their details are not known. Imaam Nawawi (Rahmatullah alaih) has written that the Prophet (Sallallaho alaihe wasallam) has said that Kali- mah Tauheed i.e. $1 J!d!9, is the most important branch of Imaan. This proves that it is the highest thing in Imaan, and that no other branch of Imaan is superior to it. Thus, belief in Tauheed is the most important essential of Imaan and is incumbent on every believcr. The least thing (in the order of merit) is the removal of anything that is likely to cause obstruction or inconvenience to any Muslim. The degree of importance of all the remaining essentials of Imaan lies in betweeen the two; it is enough to believe in them in a general way just as it is necessary to believe in the angels in a general way without knowing their names and details. Some Mohaddiths have however written books about their details. Abu Abdullah Haleemi (Rahmatullah alaih) wrote a book, Fawaaidul Minhaaj on this topic, Imam Bayhaqi (Rahmatullah alaih) and Shaikh Abdul Jaleel (Rahmatullah alaih) wrote books which they called Shu-abul Imaan. Ishaaq Qurtubi (Rahmatullah alaih) wrote 162 Virtues of Zikr Kitabm Nasaa-'ih and Imam Abu Haatim wrote \"Wasful Imaa-, wa Shu-abihi.\" Tne commentators of Bukhari, the most famous collec- tion of ahaadith, have summarised the contents of these books at one place. The gist of this summary is that com- plete Imaan in reality consists of three components: firstly. confirmation by heart of all the essentials of Imaan, sec- ondly, confirmation by word of mouth; and thirdly, confir- mation by our physical actions. Thus, the branches of Imaan are divided into three categories. the first of which concern the intention, belief and action of the heart, the second concern the use of the tongue, and the third con- cern all the remaining parts of the body. All the things of Imaan are included in these three categories. The first cat- egory includes thirty articles of faith, as follows: 1. To believe in Allah-In His Being and His Attri- butes, and that He is One, has no partner, and that there is no one like Him. 2. To believe that all things except Him, were created afterwards by Him, and that only He has been there forever. 3. To believe in the Angels. 4. To believe in the revealed Books. 5. To believe in the Apostles of Allah. 6. To believe in Destiny, i.e. whether good or bad, it is ordained by Allah. 7. To believe in the life after death, including inter- rogation in the grave, punishment in the grave, resurrection, the Day of Judgement, rendering ac- count of ones deeds, and passing over the Bridge of Siraat. 8. To believe in the existence of Paradise, and that (by the grace of Almighty Allah) the Believers will live in it forever. 9. To believe in the existence of Hell, with its severest punishments, and that it will last for ever. 10. To love Almighty Allah. 11. To love or hate other people for the pleasure of Allah (i.e. to love the pious and hate the disobe- dient ones). It includes, of course, loving the Saha- bas, specially Muhajirs, Ansars, and descendants of Rasulullah (Sallallaho alaihe wasallam). 163 . To love Rasulullah (Sallallaho alaihe wasallam), which include cherishing the highest esteem for him, offering Durood on him, and following the Sunnah i.e. his way of life. 13. To practise Ikhlaas. which includes avoiding show and hypocrisy. 14. To make Taubah i.e. to repent over one's sins from the core of the heart, and to be determined not to repeat them. 15. To fear Almighty Allah. 16. To hope and pray for the mercy of Allah. 17. Not to despair of Almighty Allah's mercy. (r 0 L 18. To remain thankful to Allah. $3 Z N 19. To be faithful in one's promise. 5 20. To exercise patience. 21. To show humility, which includes respect for the elders. 22. To show kindness and pity, which includes kind- ness to children. 23. To be resigned to one's fate. 24. To practise tawakkul i.e. to depend on Almighty Allah. 25. To refrain from self-praise and self-aggrandise- ment. This includes self reformation also. . 26. Not to harbour rancour and jealousy against others. 27. To cultivate modesty. 28. To restrain one's rage. 29. Not to deceive, cheat or suspect others. 30. To expel from one's heart the love of the worldly things, including that for wealth and status. According to Allamah Ainee, (Rahmatullah alaih) this list covers all the functions of the heart. If anything is found apparently missing, a little thought will show that it is covered by one item or the other of this list. The second category includes the functions of the 164 Virtues of Zikr tongue, and there are seven essentials in this respect, as fol- lows:- 1. Recitation of Kalimah Tayyibah. 2. Recitation of the Holy Qur'an. 3. Acquisition of Ilm (religious knowledge). - . 4. Propagation of religious knowledge to others. 5. Duaa, i.e. supplication. 6. Zikr of Allah, including Istighfaar. 7. To abstain from loose and useless talk. The third category includes bodily actions. In this re- spect, there are forty essentials which are divided into three parts. The first part which includes actions that relate to the self or person of an individual. These are sixteen, as follows:- 1. Observing cleanliness of body, clothes and place. The cleanliness of body includes wudhu and obligatory bath, purification from menstruation and post-birth blood. 2. Offering salaat, including fardh, nafl and qadhaa salaat. This would mean offering and fulfilling its pre-requisites. 3. Giving sadaqah (charity), which includes zakaat, Sadaqatul-Fitr, voluntary alms, feeding people, en- tertaining guests, and liberating slaves. 4. Fasting, obligatory as well non-obligatory. 5. Performing Hajj, obligatory or non-obligatory. It in- cludes making Umrah and Tawaaf. 6. I'tikaaf (remaining in a mosque in full devotion), which includes search for Lailatul Qadr. 7. Leaving one's home for the defence of the Deen. This includes Hijrat (migratioq for the sake of Allah). 8. Fulfilling one's offerings. 9. Steadfastness in one's oaths. 10. Payment of atonement money, if due. 11. Covering the essential parts of the body, as re- auired bv Islam, during salaat and outside salaat. 12. Offering of sacrifice and taking care of animals to be offered. 13. Making arrangements for the funeral. 14. Payment of debt. 15. Rectitude in dealings, and abstaining from usury. 16. Giving correct evidence, and not concealing the truth. The second part, which includes action involving treat- ment with one's relatives and others, has six essentials:- CI 0 1. Getting married as a safeguard against adultery. V) L. 5 % 2. To discharge obligation towards one's family E N members, servants and subordinates. 5 3. Good treatment towards one's parents, and being kind and obedient to them. 4. Bringing up one's children in a proper way. 5. Remaining on good terms with one's relatives. 6 . Obeying one's elders, and following their advice. The third part includes eighteen essentials, which re- lates to our social obligations to society in general:- 1. To rule one's domain with justice. 2. To support the right party. 3. To obey the rulers, provided their orders are not against religion. 4. To work for the betterment of mutual relations, in- cluding punishing the wrong-doers and making Jihaad against the rebels. 5. To help others in their noble deeds. 6. To enjoin the good and forbid the evil; it includes work and speech for propagation of religion. 7. To carry out the punishments enjoined by religion (for specific offences). 8. To take part in Jihaad i.e. to fight in the path of Allah. It includes guarding the defence lines. - - 166 Virtues of Zikr 9. To pay off our dues and return amaanats; this in- cludes payment of Khums (payment of tax equal to one fifth of the booty). 10. To lend (to the needy) and to pay back the debt. 11. To discharge our obligations to our neighbours, and to be kind and helpful to them. 12. To be fair in one's business dealings; it includes savings and earnings in a lawful manner. 13. To be careful in expenditure: one should guard against extravagence as well as miserliness. 14. To make salaam and respond to the salaam. 15. To say 1 (May Allah have mercy on you) when somebody happens to sneeze. 16. Not to be the cause of trouble and loss to others. 17. To avoid idle and useless pursuits. 18. To clear troublesome obstructions from the way. The seventy-seven branches of Imaan have been counted above. Some of these can be merged together. as for example earning and spending can be put together. under fair dealings. Careful consideration can enable one to cut down the total to seventy or sixty-seven, the numbers given in some ahaadith. The above list has been prepared mainly from the com- mentary of Allamah Ainee (Rahmatullah alaih) on Bukhari Shareef, wherein these things are mentioned in their order of merit. Selection has been made also from other books, i.e. Fathul-Baari of Ibn Hajar and Mirqaat of Allamah Qari. Scholars have written that the implied essen:ia., of Imaan are as given above. One should ponder over these, and be thankful to Almighty Allah for the good qualities acquired already, because all goodness is possible only through His grace and mercy. In case of deficiency in re- spect of any quality, one should strive for it and keep on praying that Almighty Allah may grace him with His bless- ings. CHAPTER 111 (The Third Kalimah) . - . i.p .. $ , i \\ j ' h \\ ~ ! d ! ~ j + , The virtues of the third Kalimah, d l j L ;I*;) which. according to some narrations is also fol- lowed by j k i ! i;iyj ~ p y , , are described in this chapter. These . . words are also known as Tasbihaali-l'atimah, because the Prophet (Sallallaho alaihe wasallam) had advised his most beloved daughter. Hadhrat Fatimah (Kadhiyallaho anha) to recite these regularly, as will be described later on. As there are many verses of the Holy Qur'an and several aha- dith in respect of this Kalimah, this chapter is divided into two parts. The first part contains the Qur'anic verses. and the second part the sayings of the Prophet (Sallallaho alaihe wasallam). PART I This part includes the verses of the Holy Book that relate to the Kalimah As a rule. the greater the importallce of the subject matter. the stress on the method of describing it, make it thor- oughly understood. That is why the meanings and signifi- cances of these words have been explained in various ways in the Holy Qur'an. The first of these phrases is (i~sI*;,. It means that Almighty Allah is free from all defects and shortcomings. and it is a declaratioll of firm belief in His being so. Almighty Allah has ordered its recitation, and has also in- formed us that the angels and all other creation remain busy in reciting it. Such is also the case with the other words of this Kalimah, ill that their significance and im- portance is stressed in so many ways in the Holy Qur'an. 168 Virtues of Zikr 1. (At the time of creation of man, the angels had said,) \"We hymn Thy Praise, glorify and revere Thee.\" 2. (When the angels were put to a test vis-a-vis the first man, they submitted,) \"Glory be to Thee. We have no knowledge save that which Thou hast taught us; Thou art the Knower and the Wise.\" 1 I 8. (When on the mountain of Toor, Hadhrat Moosa, (Alayhis salaam) could not withstand even a glimpse of Allah's glory and became senseless), and when he woke up he said, \"Glory unto 'Thee; I turn unto Thee repentant, and I am the first of true believers. 3. Remember Thy Lord exceedingly, and praise (Him) in the early hours of night and morning. 4. (Wise men are those who remain busy in the zikr of Allah, and ponder over the wonders of Nature and say,) \"0, Lord! Thou created this not in vain, Glory be to Thee; preserve us from the doom of fire.\" I 9. Lo! those who are with thy Lord (i.e. angels) are not too proud to do Him service, but they praise Him and adore Him alone. The Sufis have written that the mention of the negation of pride before anything else implies that to be free from pride is a pre-requisite for con- stancy in prayers, and that pride makes one neg- lectful in prayers. 10. Be He glorified above all that they (unbelievers) ascribe as partners (unto Him). 2 VI I. g 2 Z N 5. Far removed it is from His Transcendant Majesty that He should have a son. 1 +i ?,$i 21, +% Q +&+, 9, ,SJG q\\$j (71 (,& A) A d \\ ;j L , * 6. (On the day of judgement when Allah would en- quire from Hadhrat Eesaa (Alayhis salaam) whether he had preached to his followers the faith in Trinity, he would say,) \"Allah Be glorified; it was not for me to utter that which I had no right.\" I '11. Their (i.e. of dwellers of Paradise) prayers therein will be \"Glory be to Thee, Allah\", and their greet- ings therein (among themselves) will be \"Peace,\" and the conclusion of their prayer wil be \"Praise be to Allah, Lord of the worlds.\" 7. Glorified be He and exalted high above (all) they (Unbelievers) ascribe unto Him. 12. Praised be He and exalted above all that ye (non- believers) associate with Him. 170 Virtues of Zikr 42 13. They say, Allah had taken (unto Him) a son. Glori- rified, and unto themselves (they assign) what fied be He; He hath no needs. they desire. 14. Glory be to Allah, and I am not of the idolators. 19. Glorified be He who carried His servant by night from the inviolable place of worship, musjid of Kaaba, to the musjid Al-Aqsa (in Jerusalem). 15. And the thunder (angel) hymneth His praise, and (so do) the other angels for awe of Him. It is stated by the scholars that if anybody on hearing the thunder recites 20. Glorified is He and exhalted high above what they say. ia (&) 2 > j #>;$I; $1 A\\$\\ 3 &J ( y l ) 5 he will be immune from the ill consequences of lightening. It is narrated in one hadith, \"Make 21. The seven heavens and earths, and all that is zikr of Allah when you hear the thunder of therein, Praise Him. lightening, because it cannot harm one who is doing zikr.\" It is narrated in another hadith, \"At the time of thunder- say (&) (Subhanallah) and not (9) (Allaho- Akbar). 22. And there is not a thing but hymenth His praise, but ye understand not their praise. I 16. Well know We that thy bosom is at times op- 23. (In reply to the absurd demands of others) say, pressed by what they say. But hymn the praise of \"My Lord is glorified, and I am naught save, a thy Lord, and be of those who make prostration mortal messenger.\" (unto Him). And serve thy Lord until the inevi- I table (i.e. death) cometh unto thee. 24. (When the Qur'an is recited before those scholars, they go down in prostration) and they say, \"Glory 17. High be He exalted above all that they associate to our Lord, verily the promise of our Lord must with Him. be fulfilled.\" ,+j ii $'! >;G 2 * j & *+i (YO) -. 18. And.they assign unto Allah daughters-be He glo- \\ . + 172 Virtues of Zikr 25. Then the (Prophet Zakariyya) (Alayhis sal'aam) came forth unto his people from the sanctuary, and signified to them, \"Glorify your Lord at break of day and fall of night.\" 26. It befitteth not Allah that He should take unto Himself a son: glory be to Him. 27. Therefore (0, Muhammad Sallallaho alaihe wasal- lam, bear with what they say) and celebrate the praise of thy Lord ere the rising of the sun and ere the going down thereof. And glorify Him some hours of the night and at the two ends of the day, that thou mayst find joy (because of reward you could expect). , . r,! - ( 7 ~ d J j i y j@\\, j$\\ L s (7A) 28. They (The pious people) celebrate His [Allah's) praise night and day; they feel not tired. (hi) hA U 391 4j &I L u ( ~ q ) 29. G ~ O A ~ W be Allah, the Lord of the Arsh (throne). from all that they ascribe (Unto Him). J , (hi) && \\a, >JI &J\\ I J ~ , (ye) 30. And they (mushrikeen) say, the Beneficent hath taken unto Himself a son! Be He glorified. (Tt sb,) $1; J ~ * I jj~j u+; (YI) i 31. And He subjugated the hills and the birds to Dawood: they hymn (His) praise along with Dawood. I I 'hird Kalirnuh 173 32. (Younus Alayhis salaam cried in the darkness) There is no Allah save Thee, be Thou glorified. Lo! I have been a wrongdoer. 33. Glorified be Allah above all that they allege. (r 0 34. Glory to thee (all that they falsely allege against 8 3 Hadhrat Aa-ishah, (Radhiyallaho anho) it is mani- gq fest untruth. i' 35. Therein do offer praise to Him, at morning and evening, men whom neither merchandise nor sale beguileth from remembrance of Allah and con- stancy in prayer and paying to, the poor their dues; men who fear the day (i.e. Dooms-day) when the hearts and eyeballs will be upturned. 36. Hast thou not seen that Allah, He it is Whom all those in the Heavens and the Earth praise, and the birds in their flight. Each one knoweth verily its own (mode of) worship and praise: and Allah is aware of what they do. $, & a.5 . 3 . & . 3 fi . - bgL &. * + ** \\j6 (YV) . . ..* r.' . # ' - . I r . 1 5 (yt , ~ , u i , lu b, \\$j Fill I> $ 174 Virtues of Zikr Ch. JIJ: A~ruat mentioning Third Kulirnuh 175 1 I 37. (On the Day of Judgement when Allah will haul up the non-believers and those whom they worshipped, and enquire from the latter whether they had misled the former) they will say, \"Be Thou glorified. It was not for us to choose any pro- tectors besides Thee; but Thou did give them and their fathers ease, till they forgot the warning and became lost folk.\" 38. And trust thou in the Living One, Who dieth not, and hymn His praise. He is sufficient as Knower of His bondsman's sins. 39. Glorified be Allah, the Lord of the worlds. 40. Glorified be Allah and exalted above all that they associated with Him. 41. So, glory be to Allah when ye enter the night and when ye enter the morning. Unto Him be praise in heavens and Earth, and at the Sun's decline and at noonday. 42. Praised and exalted be He above what they asso- ciate (with Him). 43. Only those believe in Our revelation who, when they are reminded of them, fall do.wn prostrate and hymn the praise of their Lord, and they are not proud and scornful. 44. Ye who believe! Kemember Allah with much re- membrance, and glorify Him early in the morning and late in the evening. 45. (On the Day of Judgement when the entire creation would be assembled, Allah will ask from the 'tj Angels whether you were being worshipped). gs They (Angels) will say, \"Be Thou glorified, (and .gN need no partner) Thou art our protector from j* them.\" 46. Glory be to Him Who created all the pairs of things I and beings. 47. Therefore, glory be to Him in Whose hand is the domination over all things. Unto Him ye will be brought back. 48. And had he not been one of those who glorify Him, he would have tarried in its (fish's) bellv till the day when they are raised up. 49. Glorified be Allah from that which they attribute unto Him. b-! +j G!, (&) 176 Virtues of Zikr 50. Lo! indeed we (angels) are they who hymn His praise. 51. Glorified be Thy Lord, the Lord of Majesty, from that which they attribute (unto Him). And peace be unto those sent as prophets, and praise be to Allah, the Lord of the worlds. 52. Lo! We subdued the hills to hymn the praises (of their Lord) with him (Prophet Dawood) (Alayhis salaam) at nightfall and sunrise. And the birds as- sembled, all with him, were turning unto Him (and hymn His Praises). 53. Be He glorified; He is Allah, the One, the Abso- lute. 54. Glorified is' lie and exalted High above all that they ascribe as partners (unto Him). 55. And thou (O! Muhammad Sallallaho alaihe wasal- lam) seest (on the Day of Judgement), the angels thronging round the Throne, hymning the praises of their Lord. And the assembled people are judged aright. And it will be said, Praise be to Allah, the Lord of the worlds. Ch. Ill: A!laat mentioning 7'hird Kulirnuh 177 56. Those (angels) who bear the Throne, and all who are round about it, hymn the praise of their Lord, and believe in Him and ask forgiveness for all those who believe, saying: our Lord, Thy compre- hensive reach is over all things in mercy and knowledge; therefore forgive those who repent and follow Thy way, and ward off from them the pun- ishment of hell. L 0 (it - 39) JLW, (Ov) - . p . 4 t4.j && g, 32 E N - 57. And hymn the praise of thy Lord at fall of night and in the early dawn. 58. Those (angels) who are near to Allah glorify Him by day and by night, and they never feel tired. 59. And the angels hymn the praises of their Lord and ask forgiveness for those on the Earth. 60. Glorified be He Who had subdued these (mounts) unto us, and we are not capable (of subduing them). And Lo! unto one Lord we shall return. 61. Glorified be the Lord of the Heavens and the Earth, Virtues of Zikr the Lord of the Throne, from what they ascribe 68. All that is in the Heavens and the Earth glorifieth (unto Him). Allah, and He is the Mighty, the Wise. 62. And glorify Him at early dawn and at the close of the day. 69. All that is in the Heavens and the Earth glorifieth Allah, and He is the Mighty the Wise. 63. Therefore (0 Muhammad Sallallaho alaihe wasal- lam) bear with what they say, and hymn the praises of thy Lord before the rising and before the setting of the sun; and in the night time hymn His praise, and after the (prescribed) prostration (salaat). 70. Glorified be Allah from all that they ascribe as partners (unto Him). 71. All that is in the Heavens and the Earth glorifieth Him, and He is the Mighty, the Wise. - 64. Glorified be Allah from all that they ascribe as partners (unto Him). I 72. All that is in the Heavens and the Earth glorifieth Allah, and He is the Mighty, the Wise. 65. And hymn the praise of they Lord when thou up- risest. And in the night time hymn His praise, and also at the setting of the stars. 66. Therefore (0 Muhammad Sallallaho alaihe wasal- lam), praise the name of the Lord, the supreme. 73. All that is in the Heavens and all that is in the Earth glorifieth Allah, the governing Lord, the Holy One, the Majesty, the Wise. 74. All that is in the Heavens and all that is in the Earth glorifieth Allah; unto Him belongeth the sov- ereignty and unto Him belongeth praise, and He is able to do all things. 180 Virtues of Zikr '+! L;j &G p . + ,j,j ' $9 .$ $i .+i &ji J,j (v,, va) (,t +, &i G? 75 & 76. The best among them said: did I not say unto you: why glorify ve not (Allah)? They said: glorified be our Lord, indeed we have been guilty. ( r t - ZU\\) aj +& + ~ V V , 77. So glorify the name of thy Supreme Lord. s . 4,- ,Q -j 3 J&,j Jj, 2, ' &ij ;$ a;; +p,j (VA) (ye - 9.1 78. Remember the name of thy Lord at morning and evening; and worship Him a portion of the night, and glorify Him through the long night. 79. Praise the name of thy Lord, the most High. 80. Then hymn the praise of thy Lord and seek for- giveness of Him. Lo! He is ever ready to show mercy. In the eighty verses quoted abo\\-i., there is either a clear commandment of Almighty Allah for hymning his glory, or else its importance is stressed. A thing that has been repeatedly mentioned and especially stressed by the Lord of Lords in His Holy Book is doubtless most virtuous. Along with the commandment for glorification of Almighty Allah, it has been stressed in many of the above mentioned verses to hymn His praise and recite ( A ~ I , . In addition to these verses, there are other ayaats as well, given below, which describe specifically the importance of hymning His praise and reciting (.i&i) It is most significant that the Holy Book starts with-the verse (&l+ji.~'i) which indi- cates the excellence of this sacred phrase. 1. Praise be to Allah, Lord of the worlds. 2. Praise be to Allah, Who hath created the Heavens and Earth, and hath appointed darkness and light. Yet those who disbelieve ascribe rivals unto their Lord. 3. So, of the people who did wrong, the last remnant was cut off. Praise be to Allah Lord of the worlds. sz T 4. And they say, all praise be to Allah. Who hath guided us to this: we could not have trulv been led aright if Allah had not guided us. 5. Those who follow the messenger, the prophet who can neither read nor write, whom they will find described in the Torah and Gospel (which are) with them. (Among the qualities described in the Torah, one is that his followers will praise Allah very much). 182 Virtues of Zikr (;/I, Ill: L\\!.(I~I~ I I I ~ I I ~ I ~ I I I I I ~ 'l'l~i~xl K C I I I I T I ~ I ~ 183 6. (While talking about the qualities of those who have sold to Him their lives and wealth, Allah says:) Triumphant are those who turn repentent (to Allah), those who serve (Him), those who praise (Him), those who fast, those who bow down, those who fall prostrate (in prayers), those who enjoin the right and who forbid the wrong, and those who keep the {ordained) limits of Allah: give glad tidings to the believers. 1 c y t *, . ,, ?$\\ 2 \\i& &$\\ * A , *;*il $ (TY) 12. Praise be to Allah, Who hath revealed the scrip- ture unto His slave, and has not placed therein any crookedness. 13. (Addressing Nooh Alayhis salaam) And say Praise be to Allah, Who hath saved us from the wrong- doing folk.\" 7. And the conclusion of their prayer will be: Praise be to Allah, Lord of the worlds. 8. Praise be to Allah, Who hath given me, in my old age, Ismail and Ishaaq. (Alyhimas salaam). 14. (Prophets Sulaimaan and Dawood Alayhimas salaam) said, \"Praise be to Allah\", Who hath pre- ferred us above many of His believing slaves. I , :.J, ,Q 2 $; Jl (TO) (.t J, jbj &, ,, * , P4j t N T 9. Praise be to Allah: But most of them know not. 15. Say (0. Muhammad!) (Sallallaho alaihe wasallam) praise be to Allah, peace be on His slaves whom He hath chosen. 10. A day (the Resurrection day) when He will call you, and ye will obey and answer with His praise, and ye will think that ye have tarried but a little while (in the world and the grave). . . &, 3 I &Q - $9; ,Jj, *? A me, $, (,,) < < (, y t b,) 13 q j Ji,; 2; 8 $3; ( V C 16. And say: Praise be to Allah, Who will show Hi3 portents, so that ye shall know them. L+jt d\\, p,j\\ d; !kq\\j 'J$\\ 3 me\\ d (TV) 49') I . I 17. His is all praise in the former and the latter (state of life), and His is the command and unto Iiim ye will be brought back. 11. And say: praise be to Allah, Who hath not taken unto Himself a son and Who hath no partner in the sovereignty. nor hath He (need of) anv protect- ing friend through dependence. And magnify Him with all magnificence. 18. Say: Praise be to Allah. But most of them have no sense. - - 184 Virtues of Zikr 19. And whosoever refuseth-Lo! Allah is absolute, worthy of all praise. - . I crt L&Y ,+$I ~i ' L * w't 4 (Y.) . 20. Say: Praise be to Allah. But most of them know not. (rt>) w~ 31 j A &I i! ( Y \\ ) 21. Lo! Allah, He is the Absolute, worthy of all praise. !2$l 3 m*, 3; 2 L, & u*i ( y Y ) (je '.-) 22. Praise be to Allah, unto Whom belongeth whatso- ever is in the Heavens and whatsoever is in the Earth. For Him is the praise in the Hereafter. 23. Praise be to Allah, the Creator of Heavens and the Earth. 24. 0, Mankind! You are the needy in your relation to Allah. And Allah: He is the absolute, worthy of all praise. 25. And the9 (virtuous ones) say: Praise be to Allah, Who hath put grief away from us. Lo! our Lord is forgiving, bountiful; Who, of His grace, has installed us in the mansion of eternity, where toil toucheth u s not, nor can weariness affect us. 'hil.tl K c ~ l i r n c ~ h 185 26. And peace be unto those sent (to warn), and praise be to Allah, Lord of the worlds. 27. Praise be to Allah; but most of them know not. 28. (After entry into Paradise) they would say, \"Praise be to Allah, Who hath fulfilled His promise unto g z cN us, and hath made us inherit the land, sojourning s in the garden where we will; so bounteous are the wages of (good) workers.\" 29. Then praise be to Allah, Lord of I-leavens and Lord of the Earth, the Lord of the worlds. 30. (Talking of an unbeliever ruler, who was tyrannis- ing over the believers) And they had naught against them. save that they believed in Allah, Worthy of praise; Him unto Whom belongeth the Sovereignty of the Heavens and the Earth. The ayaats given above describe the attributes of Allah and the virtues of reciting His praise, and contain persuas- ion and commandment for doing so. Those who hvmn His praise have been eulogised in manv of the ahadith. Accord- ing to one hadith, the first to be called for admittance into Paradise will be those who used to hymn His praise under all circumstances, whether favourable or adverse. It is stated in another hadith that Almighty Allah likes recita- tion of His praises. As a matter of fact, it ought to be so, be- CI 186 Virtues of Zikr cause He alone is worthy of real praise. Nobody else (really) deserves praise, because nobody has real control over anything, not even over his own person. It is narrated in one hadith that the luckiest perLons on the Day of Resurrection will be those who hymn Allah's praise excessively. According to one hadith, recitation of Allah's praise is in reality expression of one's gratitude to Him, and one who does not recite His praise has not ex- pressed his thanks to Him. It is stated in one hadith that re- citing Allah's praise on receipt of any bounty acts as a safeguard against its loss. Rasulullah (Sallallaho alaihe wa- sallam) is stated to have said, \"Saying (h.JA1) by anyone from my IJmmat is more beneficial to him than his getting possession of the whole world.\" It is narrated in one hadith that when Allah bestows a bounty on some one and thereupon that person recites His Praise, this act on his part surpasses the value of that bounty, however big it might be. A Sahabi while sitting near Rasulullah (Sallallaho alaihe wasallam) happened to recite in a low voice The holy Prophet (Sallallaho alaihe wasallam) enquired as to who had recited that duaa. Thinking that he had done something which he should not have done at that time, the Sahabi kept quiet. Rasulullah [Sallallaho alaihe wasallam) assured that there was no harm in telling it, because it was not anything undesirable, after which the Sahabi admitted that the duaa had been uttered by him. Then Rasulullah (Sallallaho alaihe wasallam) said, \"I saw thirteen angels, all of whom were trying to surpass each other in carrying this duaa to Almighty Allah.\" And there is the well-known hadith, wherein it is stated that an undertaking, which may be very grand other- wise, will lack Allah's blessing unless praise of Allah is re- cited at the time of its commencement. Hence it is that every book is commenced with the praise of Almighty Allah. It is narrated in one hadith that when a child dies, Almighty Allah asks the angels if they have taken out the soul of His bondman's child. On receiving the reply in the affirmative, He adds that they have taken out (so to say) a part of his heart. Almighty Allah then enquires \"what did my bondsman say on that?' They say, \"He praised You and recited (ij+\\j J!c!j$sfl!) (We belong to Allah, and to Him we shall return). On this, Almighty Allah orders that a house for him should be built in Paradise, and that it should be named Bait-ul-Hamd (House of Praise). According to an- other hadith, Allah is greatly pleased with a person who says &I;;ji) on eating a morsel of food or on getting a drink of water. The third part of this Kalimah is &i!ii~J, which has been described in detail in the l?sichapter. The fourth part is known as Kalimah Takbeer (31 41) which means acclama- tion of His greatness and affirmation of His grandeur and His splendour. The importance of this fourth part of the Kalimah has also been described in many of the verses given already; there are other ayaat which specifically, de- 0 scribe the greatness and grandeur of Almighty Allah. These g 5 E N are as follows:- 5 1. That ye should glorify Allah for having guided you, and that peradventure ye may be thankful. 2. He is the knower of the invisible and the visible the Great, the most High. 3. Thus We made (the sacrificial animals) subject unto you that ye may glorify Allah. that He hath guided you. And give good tidings (O'Muhammad) (Sallallaho alaihe wasallam) to the doers of good deeds. 4 & 5. And indeed Allah, He is the High and the Great. 188 Virtues of Zikr 6. (When the angels receive any commandment they get upset because of fear) Yet when fear is re- moved from their (angels) hearts (on descending of revelation), they say: \"What was that which your Lord said?\" They say: \"The truth, and He is the Sublime, the Great.\" 7. So, the command belongeth only to Allah, the Sublime, the Majestic. 8. And unto Him (alone belorigeth Majestv in the Heavens and the Earth, and He is the Mighty, the Wise. 9. He is Allah, other than Whom there is no Cod. the Sovereign Lord, the Holy One, Bestower of peace. the Keeper of Faith, the Guardian, the Majestic, the Compeller, the Superb. The avaats given above describe the greatness and grandeur of Almightv Allah, and contain commandment and persuasion for recounting it. In many of ahadith too commandment and persuasion for reciting Allah's Great- ness has been stressed. It is stated in one hadith, \"When you see that fire has broken, out somewhere, hymn (21 excessi\\rely, which will put out the fire.\" Another hadith also states that recitation of c;jiii,puts out the fire. It is said in one hadith that when a person sa!.s $1 31 its Noor (Light) covers everything between the Earth and the sky. Accord- ing to one hadith, Rasulullah (Sallallaho alaihe wasallam) has said, \"Hadhrat Jibraa-eel (Alayhis salaam) conveyed to me the order for reciting the Greatness of Allah.\" In addition to the ayaats and ahadith given above, Allah's greatness and His splendour has been desribed, and recitation of it has been stressed under different headings and in different words at many places in the Holy Qur'an. There are also many other ayaats, which do not contain the specific words of these Kalimah, but they imply these Kali- mahs. Some of these ayaats are as follows: 1. Then Aadam received from his Lord some words (of revelation), and His Lord turned towards him, for He is the Relenting, the Merciful. ,A o ,- There are different versions and explanations about the I# words refered to in this ayat. According to some of these 5 versions, these words were as follows: (a) (There is no Allah except Thee) You are above all shortcomings and are worthy of all kinds of praise. O! mv Lord. I have acted viciously and wronged myself; therefore forgive me, surely you are the best of forgivers. (b) There is no Allah except Thee. You are above all defects: you are worthy of all praise. O! my Lord. I have acted viciously and wronged mvself; kindlv show mercv upon me. surely You are most Com- passionate, most Merciful. (c) There is no Allah except Thee. You are above all defects and shortcomings, and are worthy of all praise. O! my Lord. I have acted viciously and wronged mvself: relent towards me, as You are Re- lenting ilnd Merciful. 190 Virtues of Zikr There are other ahadith of similar nature, as narrated by Allamah Soyuti (Rahmatullah alaih) in 'Durrul Man- thoor' wherein words meaning glorification and hymning praise of Allah occur. 2. Whosoever bringeth a good deed will receive ten- fold the like thereof, while whosoever bringeth an ill deed will be awarded like thereof, and they will not be wronged. Kasulullah (Sallallaho alaihe wasallam) said, \"There are two routines, which if followed by a Muslin1 will enable him to enter into Paradise. Both the routines are very easy, but there are very few people, who act according to them. One is to recite ($i L , i &it i 1 a\\;.;) ten times after every obligator\" salaat i.e. five tilies a day. In this way. one is able to glorify Allah one hundred an& fifty times. and thereby earns one thousand and five hundred virtues every day. The second routine is to recite ($i&i) thirtv four times. (L&i) thirty three times, and thirty three times at .the time of going to bed evzry ntght. Orie glorifies Allah one hundred times in this way, and earns. one thousand virtues thereby. Thus, the virtues earned during the day total two thousand and five hull- dred. On the l)av of Judgement. when deeds will .be weighed, will there be anybody who will have committed everyday two thousand and five hundred evil deeds, which can counter-act as many virtues'?\" Although among the Sahaba. there was likely to be ~loile who c:ould have done two thousand and five hundred evil deeds during a day, yet in this age our daily misdeeds far exceed this number. Thus. it was extrenlely kind of Ka- sulullah (Sallallaho alaihe wasallam) to have told us the presc:riptio~~for illcreasillg our good deeds over our mis- deeds. It is upto the patient to act upon it. Acc:ording to one haditti, the companions of Kaslllul- lah (Faltallaho alaihe wasallam) asked him the reason why .o~ily o few people are able to act upon the above nlentioned I\\ro things in spite of their being so easy. He replied that at night the devil makes one to sleep before he has recitetl it Ch. Ill: A!,c~trl men1 ioning 'l'hil.tl Kulinic~h 191 and at time of Salaat he reminds him of something which actuates him to get up and go away at once without having recited it. According to one hadith Rasulullah (Sallallaho alaihe was all an^) said, \"Is it not possible for you to earn even one thousand virtues every day? Someone enquired, \"How can we earn one thousand virtues daily 0' Rasulullah (Sallal- laho alaihe wasallam?\" He replied, \"Recite cbSI;.;;) one hundred times, and you will have earned one thbusand vir- tues.'; CI 0 3. Wealth and children are the ornaments of the g, i earthly life. But good deeds that endure are better EN in thy Lord's sight for rewards, and better in re- 5 spect of hope, (i.e. we should base our hope on good deeds instead of on our wealth and chil- dren.). 4. Allah increaseth in right guidance those who walk aright, and the good deeds which endure are better in thy Lord's sight for reward, and better for ulti- mate resort. Although a u ~ ~ a q g ~ endure (good deeds which for ever) include all good deeds which are rewarded for ever. yet according to some ahadith it implies these very Kali- mahs. Kasulullah (Sallallaho alaihe wasallam) has said, \"Hymn these (oubl~ oqu~) excessively.\" Somebody enquired what this was. Rasulullah (Sallallaho alaihe wasa1,Ianl) re- plied, \"It is to recite Takbeer ($ %) , Tahleel 41 g! il!j,. Tas- beeh (+I ;tG) , Tahmeed , and chk g! ~JY; .\" J$Y) According to another hadith. Rasulullah (&llallaho alaihe wasallam) said, \"Beware. $ ii!JhdijI consti- tute ( ~ U W I ~ Y U I , (good deeds which endbre for ever).\" I t is a1 e wa- stated in one hadith that Rasulullah (Sallallaho a1 'h sallam) had said, \"Beware, be on your guard.\" \"Somebody 192 Virtues of Zikr enquired \"0, Rasulullah (Sallallaho alaihe wasallam), is it against some impending invasion by some enemy?\" \"The Prophet (Sallallaho alaihe wasallam) replied, \"No, arrange to guard yourself against the fire of hell, through the recita- tion of @ &i 31 J!ii!J L Ui L b G ) , because these Kalimahs will go forward to kterckde for you on the Day of Judge- ment (or they will move you forward towards Paradise), these will guard you from behind, these will oblige and benefit you and these are the ~ U W I a ~ g l (good deeds which endure for ever).\" Similarly, there are many other ahadith in support of this contention, as given in Durul Manthoor, by Allama Suyuti. 5. To Him belong the keys of heavens and the earth. It was narrated by Hadhrat Uthman (Radhiyallaho anho) that in reply to his enquiry about (9>1j+&JIq\\i;) (keys of heavens and the earth), Rasulullah (Sallallaho alaihe wasallam) had said that it was According to another hadith, the keys of heavens and the earth means Cj'i % ;I J! j!J L d i LI which had been sent down from the treasure oft-he ~ r s h i.e. Allah's Throne. 6. To Him go up their good kalimahs, and good deeds carry them there. Hadhrat Abdullah bin Masood, (Radhiyallaho anho) said, \"Whenever I recite some hadith, I also quote from the Holy Qur'an in support thereof. When a Muslim hymns an angel carefully takes the words, towards heaven in his wings, and whichever sky he crosses, its angels pray for the Ch. Ill: A!.clcll menlioning 'l'hircl K c ~ l i n l c ~ h 193 forgiveness of the reciter.\" This is supported by the above ayat (&I $1 Li j!) . Hadhrat Ka'ab, (Radhiyallaho anho) had said that hymning of goes buzzing round the Arsh and therein mentions the name of the reciter. Another Sahabi narrated a similar hadith. 195 Virtues of Zikr PART I1 This part deals with the ahadith in which Rasulullah (Sallallaho alaihe wasallam) mentioned the virtues of these kalimahs and recommended their recitation. Hadith No 1 Rasulullah (Sallallaho alaihe wasallam) said, \"There are two kalimahs which are verv light for the tongue (i.e. easy to utter) but very weighty in reward and very pleasing to Allah: These are &I b G *j &I (Glory to Allah with all praises, ~ l o r j t o ~ l l a h , t h eMa- jestic).\" Light for the tongue means that these kalimahs are so brief that no time is spent in their recitation and no diffi- culty is experienced in memorizing them. In spite of their being so easy, they will be found very weighty when good deeds will be weighed. Then the fact that they are dear to Allah more than anything else, surpasses all other advan- tages. Imam Bukhari (Rahmatullah alaih) concluded his book \"Sahih Btukhari\" with these two kalimahs, and the above mentioned hadith was given at the end of the book. According to one hadith, Rasulullah (Sallallaho alaihe wa- sallam) had said, \"None of you should miss earning one thousand virtues every day. Hymn (++jJllirG) one hun- dred times and you will get one thousand virtues. Through Allah's grace, your daily sins will be less than this number. Then the reward of your good deeds, other than reciting this kalimah, will be in addition.\" According to another hadith a person who recites (+++j+St&) one hundred times in the morning and in the evening has all his sins for- given, even if they exceed the foam on the sea. It is stated in one hadith that recitation of &i hi 31 i! d!9 ii W'i iil L G ) causes . . Hadhrat Abu Zar (Radhiyallaho anho) narrated that once Rasulullah (Sallallnho alaihe wasallain) had said, \"Should I tell you what speech is most liked by Allah?\" \"Do tell me\", said I. He said \"It is (u;irj +1 I)'+) .\" In another hadith, it isp3;;rj si b G ) . An- other hadith relates, \"The thing that Allah ordered His angels to hymn is undoubtedly the best one, and it is (,J.+j +l b G ) , , It is mentioned in several ayaat given in<br><hr><br>197 Virtues of Zikr Rasulullah (Sallallaho alaihe wasallam) said, \"Whoso- ever says 41 J!ii!$ his admittance into Paradise is guaranteed, and whosoever hymns one hundred times, j G he is credited with one hundred and twenty four thousand virtues.\" The Sahaba said, \"0, Rasulullah! (Sallallaho alaihe wasallam) if such is the case, then nodoby will be doomed to destruction on the Day of Judgement because the virtues are sure to outweigh the sins.\" Rasulullah (Sallallaho alaihe wa- sallam) said, \"Some people will even then be doomed to destruction because some people will have so many virtues that a mountain may crumble under their weight, but these will be just nothing in comparison with Allah's bounties. However, Almighty Allah, out of His extreme mercy and grace, will rescue them.\" Note: The largest number of virtues will look like nothing as compared with the bounties of Allah, shows that whereas virtues and sins will be weighed on the Day of Judgement, a person will also be called to account whether he had made proper use of Allah's bounties and had shown grati- tude to Him. As a matter of fact, everything we have is granted by Almighty Allah, and for each thing we owe a duty, and it will be checked whether we have discharged this duty properly. Rasulullah (Sallallaho alaihe wasallam) had said, \" ) is sadaqah, saying $1 i!i!J, is sadaqah, saying $31 is sadaqah, removing some obstacle from the way is sadaqah (and so on).\" In short, he enumerated several such items of sadaqah. There are other ahadith like this, wherein Allah's $ bounties in one's own person are enumerated, and then , there are, in addition, the bounties in respect of food. $3 drink, comfort, and so many other blessings of Allah. 5 This subject is mentioned in the Holy Qur'an in Surah at-Takaathur: that on the Day of Judgement, one will be questioned about the bounties of Allah. Hadhrat Ibn Abbas stated that one will be reminded about the health of his body, of his ears, of his eyes, that Almighty Allah had be- stowed all such bounties out of sheer mercy: and a person will be questioned how he used these for the service of Allah, or whether he used them like the animals for his own self. Thus in the Holy Qur'an in Surah Bani Israa-eel, Allah says, the hearing and the sight, and the heart; of each of them will be asked, i.e. everybody will be required to render ac- count for the proper use of his ears, eyes, and heart. The holy Prophet. (Sallallaho alaihe wasallam) remarked that the bounties about which one will be questioned include peace of mind. which is a great blessing, and also physical health. Mujahid has stated that every worldly pleasure is a bounty. for which one will have to give account. Hadhrat Ali (Radhiyallaho anho) said that security is one of the bounties of Allah. A person asked Hadhrat Ali (Radhiyal- laho anho) the meaning of the ayat 198 199 Virtues of Zikr (then on the Day, you will be questioned about the boun- ties). He replied that one will be questioned about the wheat bread eaten and of cold water, as well as about the house in which one lived. It is stated in one hadith that, when this ayat was revealed, some Sahaba (Radhiyallaho anhum) said, \"0, Rasulullah (Sallallaho alaihe wasallam), what are the bounties about which we shall be questibned? We get only half a meal and that too of barley bread.\" Then came the revelation, \"Do you not put on shoes? Do you not drink cold water? These are also bounties of Allah.\" According to one hadith, when this ayat was revealed, some Sahabas said, \"0, Rasulullah (Sallallaho alaihe wa- sallam), about what bounties shall we be questioned? We get only dates to eat and water to drink, and we have to remain always with our swords on our shoulders, ready to fight! some enemy (on account of which even these two things cannot be enjoyed by us in peace).\" Rasulullah (Sal- lallaho alaihe wasallam) replied, \"The bounties are about to become available in the near future.\" It is stated in one hadith that Rasulullah (Sallallaho alaihe wasallam) had said, \"Of the bounties to be ac- counted for on the Day of Judgement, the first is the physi- cal health, (i.e. whether we discharged our obligation in respect of it, and did any service for the pleasure of Allah) and the other is the cold drinking-water.\" Cold water is, in fact, a great gift of Allah, and is realised as such where it is not (readily) available. It is indeed a great blessing of Allah, but we never even acknowledge it to be as such; not to speak of thanking Almighty Allah for it and discharging our duty in respect of it. It is said in one hadith, \"The bounties to he accounted for include the piece of bread eaten to satisfy the hunger, the water drunk to quench the thirst, and the cloth used to cover the body.\" Once at midday when it was very hot, Hadhrat Abu Bakr (Radhiyallaho anho) felt famished and went out of his house. Soon after his arrival in the mosque, Hadhrat Umar (Radhiyallaho anho) also reached there in similar con- dition, and asked him how he was there at that time. \"My hunger has become unbearable\", was the reply. Hadhrat Umar said, \"By Allah, the same thing has compelled me to that all kind of dates may be before you, and you may eat the kind you may like.\" (Sometimes, one likes the half ripe dates in preference to the ripe ones). Leaving the dates before them, he slaughtered a small goat, roasted some of its meat, and cooked the rest. Rasulullah (Sallallaho alaihe wasallam) took some bread and a piece of roasted meat, and giving it to Abu Ayub said, \"Take this to Fatimah (Rad- hiyallaho anha); she also did not get anything to eat for sev- eral days.\" Hadhrat Abu Ayub (Radhiyallaho anho) hastened to comply with the orders and then returned. All of them ate to their hearts' content. Then Rasulullah (Sal- lallaho alaihe wasallam) said, \"See, these are the bounties of Allah: the bread, the meat, the raw dates and the ripe ones.\" While uttering these words, tears came in his eyes and' then he said, \"By Allah! Who controls my life; these are the bounties about which one will he questioned on the Day of Judgement.\" Considering the circumstances under which these things had become available, the Sahabas felt perplexed and worried that account was required to be ren- dered for these things, which became available under such critical conditions of helplessness. Rasulullah (Sallallaho alaihe wasallam) said, \"It is necessary to express our grati- tude to Almighty Allah. When you put your hand on such things, say (&I +J before starting to eat and 200 Virtues of Zikr I (All praise is for Allah who feasted us to the full, and did favour on us, and bestowed upon us plentifully) after you finish eating. Its recitation will suffice as your expression of gratitude.\" Many incidents of this nature are narrated under different headings in the books of hadith. Rasulullah (Sallallaho alaihe wasallam) said the same things when he happened to visit the house of Abul Haitham Maaiik bin Tayhaan (Radhiyallaho anho) and once when he visited a I your life? (2) How did you utilize your youth? (3) How did you earn your wealth? (4) How did you spend it? (i.e. I whether earning and spending was in a lawful manner). (5) How did you act upon your acquired knowledge?\" Hadith<br><hr><br>Sahabi whose name was Waqfi (Radhiyallaho anho). Once Hadhrat Umar (Radhiyallaho anho) came across a leper who was blind, deaf and dumb. He said to his com- panions, \"Do you see any bounties of Allah on this person?\" \"Apparently none,\" they replied. \"Can he not uri- nate easily?\" said Umar (Radhiyallaho anho). Hadhrat Abdullah bin Mas'ood (Radhiyallaho anho) said, \"On the Day of Judgement there will be three courts. In one of these, the accounts of virtues will be scrutinized, in the second Allah's bounties will be counted, and in the third the sins will be accounted for. The virtues will be counterbalanced by the bounties of Allah, so the sins will remain outstanding and their disposal will depend on Allah's mercy.\" All this means that a man is duty bound to show his gratitude to Almighty Allah for His unlimited favours at all times and under all conditions. Therefore, he should strive his utmost to earn as many virtues as possible and should not rest content at any stage, because it will be on the Day of Judgement that he will realize how many sins had been committed unknowingly through his eyes, nose, ears, and other parts of the body. The Prophet (Sallallaho alaihe wa- sallam) had said, \"Everyone of you will have to appear before Almighty Allah, you will be face to face with Him, with no curtain in between. There will be no lawyer or in- terpreter to advocate your cause; there will be heaps of your deeds on either side. The fire of Hell will be in front of you, and therefore you should trv your best to ward off this fire through sadaqah, (voluntarv charity) which may be as paltry as a single date.\" It is stated in one hadith, \"On the Day of Judgement, you will first be reminded how you were blessed with good health and were given cold water to drink\" (which implies. whether you showed gratitude for these favours). According to another hadith, \"You will not be allowed to move away from the court of Allah until you have answered five questions: (1) How did you spend The Holy Prophet (Sallallaho alaihe wasallam) savs, \"When on the night of Mi'raaj 1 met I-ladhrat Ibrahim (Alayhis salaam) he asked me to convev his salam to my Ummat and tell them that the soil of Paradise is very fine and fertile and there is very good water to irrigate it, but the land is all a virgin plain and its plants are 202 Virtues of Zikr 44 so that one can plant there as much as he likes.\" According to one hadith, the above Kalimah is also fol- lowed by !! i! i$Yj J; Y . According to another hadith it was said, \"A tree for every part of this Kalimah is planted in Paradise \" It is stated in one hadith, \"Whosoever recites e & j A l b G , a tree is planted for him in Paradise.\" It is stated in one hadith, \"Rasulullah (Sallallaho alaihe wasal- lam) was going somewhere when he saw that Abu Hurairah (Radhiyallaho anho) was planting a tree. He asked him what he was doing. \"I am planting a tree,\" was the reply. Thereupon Rasulullah, (Sallallaho alaihe wasallam) said, \"Should I tell you about the best plantation? It is (9 ai 51 j! ii!J 3, Ui b LE+ ; the recitation of each of these Kalimahs caises a tree to grow for you in Paradise.\" Hadhrat Ibrahim (Alayhis salaam) sent his salam through Rasulullah (Sallallaho alaihe wasallam) to this Ummat. The 'Alims' have written that whosoever hears this hadith. should say in return ~ j i j ~ l ~ j j ~ ~ l j (May peace be upon him as well as Allah's mercy and His bles- sings). The second thing mentioned in the hadith is that the soil of Paradise is very fine and its water very sweet, which can be interpreted in two ways. Firstly, it is the description of that place that it is extremely fine, its soil (according to some ahadith) is of saffron and musk, and its water is very sweet, so that everybody loves to have a house there; and as it has all facilities for recreation and for planting gar- dens, etc., nobody likes to leave it. The second interpreta- tion is that where there is fine soil and excellent water, there is always luxurious growth. In that case, it means that hymning once will cause a tree to be planted and then, by virtue of the fertile soil and excellent water, this tree will continue to grow by itself. Only the seed is re- quired to be planted once: the growth afterwards is all automatic. In this hadith. Paradise is stated to have a treeless and ~ I virgin soil. In other ahadith where Paradise has been de- scribed it is stated that there are all kinds of fruit trees in it, I so much so that the literal meaning of the word Jannat (Paradise) is \"garden\". There is thus a sort of contradiction: I .the (Jlarna explain that originally Paradise is a treeless plain. but when it will be handed over to the various people tht:y will find gardens and trees there, in accord- ance with their deeds. The second explanation by some Ulama is that the gardens in the Paradise will be awarded according to the deeds of good people, and as such it is the deeds that are said to have caused these trees to grow for them. The third explanation is that the smallest Paradise that anybody will get will be bigger than the whole world, and some parts of it are covered with original gardens and other parts of it are without growth, so that trees will get automatically planted there according to the Zikr and glori- fication done by its recipient. Hadhrat Maulana Gangohi, (Rahmatullah alaih) a great Shaikh and scholar, has stated in his book Kaukabud Durree that all the trees are available there in the form of a nursery, and are planted according to the good deeds, after which they continue to grow. * Hadith<br><hr><br>0 8; E N Rasulullah (Sallallaho alaihe wasallam) said, \"One who is unable to toil at night i.e., he cannot keep awake and pray at night, or is too miserly to spend money, or is too cowardly to take part in Jihaad (fight- ing in the path of Allah) should hymn (+&j &&, ex- cessively, because this action is more vaiiable with Allah than spending in His path a mountain load of gold.\" How great is the grace of Allah that even those who cannot bear hardship in the path of Allah are not deprived from earning virtues and huge rewards. One who cannot keep awake at night, cannot spend in Allah's path and cannot take part in religious fighting, because of co-wardice, but still has value for Deen in his heart, and is anxious to improve his life in the Hereafter, is still eligible to earn 204 Virtues of Zikr 44 Allah's favours. It is one's extreme misfortune if he cannot do something even then. Hadith<br><hr><br>Rasulullah (Sallallaho alaihe wasallam) said, \"The words most liked by Almighty Allah consist of four Kali- mahs, viz; &i ji $ j!g A ki LI j&, which may be recited in any sequence. ~ c c o r d i n ~ to one hadith, these Kalimahs are also mentioned in the Holy Qur'an. These Kalimahs occur very frequently in the Holy Qur'an, wherein there is the commandment and persuasion for their recitation, as describsd in detail in<br><hr><br>Once a group of poor Muhajirs came to Rasulullah (Sallallaho alaihe wasallam) and said, \"0 Rasulullah! (Sallallaho alaihe wasallam) only the rich attain to the higher spiritual grades, and the eternal bounties of Allah fall only to their lot.\" \"How?\" enquired Kasulul- lah (Sallallaho alaihe wasallam). They replied, \"They offer salaat and observe fasting in the same manner as we do, but being rich they are able to perform other b good deeds, like giving sadaqah and freeing slaves, g4 L which we being poor are unable to do.\" Rasulullah E N (Sallallaho alaihe wasallam) said. \"Should I tell you 5 something by acting upon which you may overtake your predecessors and surpass your successors, and nobody may be better than you unless he also acts upon the same thing.\" \"Do tell us,\" said the Sahabas. (Radhiyallaho anhum). \"Recite &i Li, A Ui , i,G) thirty three times each after every salaat;'; said-Rasu- lullah (Sallallaho alaihe wasallam). They acted upon his advice, but the rich of those days came to know of it and started doing the same. The poor again came to Rasulullah (Sallallaho alaihe wasallam) and com- plained. \"Our rich brothers have come to learn what you told us, and are also acting upon it.\" Rasulullah (Sallallaho alaihe wasallam) then remarked, \"It is Allah's favour which He bestows on whomsoever He likes; nobody can stop Him.\" According to another hadith, Rasulullah (Sallallaho alaihe wasallam) is also a narrated to have said to them, \"Allah has also favoured you with a substitute of sadaqah. Reciting ( a a G ) once is sadaqah, saying (?.UI) once is sadaqah, inter- course with one's own wife is sadaqah.\" The Sahabas were astonished to hear this, and submitted, \"0 Rasu- lullah! (Sallallaho alaihe wasallam) indulgence with one's own wife is an act of satisfying one's lust, and vou say this is also sadaqah. Rasulullah (Sallallaho alaihe wasallam) said, \"Would it not be a sin to in- dulge in the unlawful?\" \"Yes\", said the Sahabas. \"In 206 Virtues of Zikr the same manner, doing the lawful amounts to sada- qah, and is virtuous\", explained Rasulullah (Sallallaho alaihe wasallam). From this it is clear that to cohabit with one's own wife in order to save himself from adultery brings reward from Allah.\" In another hadith, the reply of Rasulullah (Sallallaho alaihe wasallam) to the query by the Sahabas, (Radhiyal- laho anhum) that intercourse with the wife is the satisfac- tion of one's lust, was \"Just tell me if a child is born as a result thereof, and when he grows up to youth and be- comes a centre of your expectation, he happens to die, will you not hope for a reward from Allah in lieu of this loss?\" Their reply was in the affirmative, and then Rasulullah (Sallallaho alaihe wasallam) continued, \"Why this expecta- tion of reward? Did you create him? Did you guide him or did you sustain him? On the contrary, it was Almighty Allah who created him, guided him and sustained him. Similarly, you put your semen at the lawful place, then it is up to Allah to make it into a child or prevent it from be- coming a child.\" In short, this hadith implies that the reward from Allah is for one's having become the cause of the birth of the child. Hadith<br><hr><br>Rasulullah (Sallallaho alaihe wasallam) said, \"Whosoever hymns &iji hS;;ji . . L b & ) 33 times each, and then once recites after every salaat. all his sins are forgiven, even though thev mav be (countless) like the foam in the sea.\" Note: That the sins are forgiven (by virtue of zikr) has already been discussed under several ahadith. According to the Ulamaa, it is only the minor sins that are forgiven. In this hadith, it is stated that three Kalimahs should be re- cited 33 times each, and then (31 $!d!J> only once. Accord- ing to the next hadith, two of the three Kalimahs should be recited 33 times each and the third one i.e. &lj 34 times. Hadhrat Zaid; (Radhiyallaho anho) is stated to have narrated, Rasulullah (Sallallaho alaihe wasallam) had ordered us to recite &i ii , A W'i , &I iG) thirty three times each after every salaat. ~n ~ n s a i isaw in a dream that a person advised reciting the three Kalimahs 25 times each and then (31 i! also 25 times. When Rasulullah (Sallal- laho alaihe wasallam) was told about this dream, he,per- 2 mitted him to recite that way. According to one hadith 24 &i hi , A ui , bl b G ) should be hymned 11 times each after r N every &laat, a d 111 another h$d,ith it is ten times each. In $ one hadith, the recitation of (dl Y! il!J) is ten times and that of the other three Kalimahs is 33 times each. According to one hadith, each of the four kalimahs should be hymned hundred times each. All these ahadith are narrated in the book Hisnul Haseen. The apparent difference in these ver- sions is due to the different circumstances of the persons who were advised by Rasulullah (Sallallaho alaihe wasal- lam). Those who were busy with other (important) things were advised the lesser number, and those who were free were advised a greater number. The religious authorities, however, advise that one should conform to the numbers narrated in the ahadith just as the quantity of a thing that is used as a medicine is also specified. Hadith</p></div>",
+        "sections": [
+            [
+                30,
+                16483
+            ],
+            [
+                16483,
+                32914
+            ],
+            [
+                32914,
+                49313
+            ],
+            [
+                49313,
+                64432
+            ]
+        ]
+    },
+    {
+        "id": 38,
+        "bookId": 5,
+        "chapter": "Sayings of the Prophet",
+        "title": "Content for Sayings of the Prophet",
+        "preview": "4 . 5 *..j. i$.+ hjCij j & d l dy.. i$.~ J l X plr .b i$$ h ~ & j eJ j jl,Jdl LG SI.+!I 3~ +VI j~ js;J& J pi, &I, &+I, +, -I 31 &I Rasulullah (Sallall...",
+        "content": "<div class=\"story-content\"><p>4 . 5 *..j. i$.+ hjCij j & d l dy.. i$.~ J l X plr .b i$$ h ~ & j eJ j jl,Jdl LG SI.+!I 3~ +VI j~ js;J& J pi, &I, &+I, +, -I 31 &I Rasulullah (Sallallaho alaihe wasallam) said, \"The fol- lowing words are such that one who recites them is 208 Virtues of Zikr never disappointed. These are &I % A .Ui A! b G ) which should be recited, 33, 33 and 34 times, respect- ively after every obligatory salaat.\" Note: These Kalimahs have been termed as (things (.I.)*) that follow), either because these are recited after the salaat or because the recitation of these after sins results in washing them off, or because these are recited one after the other. Hadhrat Abu Darda (Radhiyallaho anho) narrated, \"We have been directed to recite (At LI&, 33 times and (+ I;;ji) 33 times and& 4! ii!J,34 times aftei every salaat.\" Hadith<br><hr><br>is said in one hadith 1; greater than many such mountains. Rasulullah (Sallallaho alaihe wasallam) once said, \"Is there nobody amongst you who may be able to do, everyday, good deeds equal to Uhud (a mountain near Madinah).\" The Sahaba (Radhiyallaho anhum) said, \"0 Rasulullah! who has the strength to do that?\" \"Everybody has the strength to do it,\" said Rasulullah (Sallallaho alaihe wasallam). \"How is it?\" enquired the Sahabas (Radhiyallaho anhum). He explained, \"The reward of (AIL&, is greater than the mountain Uhud, that of (31 4; ii!.j) is greater than Uhud, that of (A I;iji is greater than Uhud and that of &iii) is greater than Uhud.\" Note: It is thus stated that the reward of each of these Kali- mahs is greater than the mountain of Uhud, nay. it is that the reward of c!iLG) and $ . W 9 fills all the Heavens and the Earths. It is said in another hadith that,the reward of ( A I ~ G ) occupies half the scale-pan, the reward of ( A d i , occupies the remaining half, and the reward of &ail fills the space between the Earth and the sky. It is stated in one hadith that Rasulullah (Sallallaho alaihe wa- sallam) had said, \" is more dear to me than all the things under the Sun.\" Mullah Ali Qari (Rahmatullah alaih) explained it to mean that it is more dear than spending in the path of Allah all that this world contains. It is said that once Hadhrat Sulai- man (Alayhis salaam) was going somewhere on his throne, when the birds spread their wings to protect him from the Sun, and the armies of men and Jinn were going with him. On seeing this, a worshippper praised Allah for the grand- 8 2 eur of this vast kingdom. Hadhrat Sulaiman (Alayhis e~ salaam) remarked, \"The credit in the account of deeds of a i\" believer for reciting ( $ L G ) once is more than the whole kingdom of Sulaiman Bin Dawood, because this kingdom is transitory but the reward of reciting (FJ) is everlasting.\" Hadith<br><hr><br>Once Rasulullah (Sallallaho alaihe wasallam) said, \"Bakhkha! Bakhkha! How weighty in the scales are five things, viz. ( i t d! d!J, , c;;ii 3) , $1 b G ) , (+.W'i) and exercise of patience w) by the father (or the mother) over the death of his (or her) child.\" The subject-matter of this hadith is narrated by many Sahabas (Radhiyallaho anhum) in so many other ahadith. The words (&&) (Bakhkha! Bakhkha!) are exclaimed at the time of extreme joy and pleasure. These things are of great joy and pleasure to Rasulullah (Sallallaho alaihe wasallam) 210 Virtues of Zikr and therefore are stressed so much by him. Is it not there- fore incumbent upon us who claim to love him that we should show extreme devotion to these Kalimahs, because doing so also amounts to showing respect, obedience, and gratitude to Him. ~ a d i t h<br><hr><br>Rasulullah (Sallallaho alaihe wasallam) said, \"Prophet Nooh (Alayhis salaam) said to his sons, \"I give you a piece of advice and, in order that you may not forget it, I say it very briefly. I advise you for doing two things and forbid you from doing two things. The two things which I recommend are such that Almighty Allah and His noble creation are greatly pleased with them. and both of these have easy access to Almighty Allah. One of the two things is (j14!ii!.j,, which if it were enclosed in the mighty sky, will break through it and reach Almighty Allah and, if all the heavens and the earth were placed in one pan of the balance and this kalimah were put in the other pan, the latter would outweight the former. The second thing that I recommend to you is the recitation of (!+j , - L S G ) , which is the prayer of all the creation and by virtue of which all the creation get their sustenance. There is none among the creation that does not hymn glorifica- tion of Allah, but you do not understand their speech. And the two things from which I forbid you, are shirk (polytheism) and arrogance, because these two keep you away from Allah and His noble creation.\" Note: The subject matter of this hadith has also been dis- cussed before when describing the virtues of$\\$ J!J,. That 2 all the creation hymn the glory of Allah is also mentioned 2 in the aayaat of the Holy Qur'an. One of these aayaat is E N 5 (There is none among the creation who does not hymn His glory). It is narrated in many ahadith that on the night of Mi'raaj, Rasulullah (Sallallaho alaihe wasallam) had heard all the Heavens hymning the glory of Allah. Once Rasulullah (Sallallaho alaihe wasallam) hap- pened to pass by a group of men who, though halted, were sitting on the backs of their horses and camels. He said to them \"Do not use the backs of your animals as chairs and pulpits, as so many of them are better than their riders and do zikr of Allah more than the riders.\" Hadhrat Ibn Abbas (Radhiyallaho anho) said that even the crops hymn the glory of Allah, and the owner gets the reward for it. Once a bowl of food was presented to Rasulullah (Sal- lallaho alaihe wasallam), who remarked that the food was hymning the glory of Allah. Somebody asked if he under- stood its hymning. He replied in the affirmative, and then he asked that it be taken to a certain person who also, when the cup was brought to him, heard it hymning the glory of Allah: In the same way, another person also heard it. Some- 212 213 Virtues of Zikr Allah! take away this thing from me. I do not want to see the shortcom- ings of other people.\" His prayer was accepted by Almighty Allah, and he got relieved of this power. It is related that it was during that earlier period that he had declared the water once used for wudhu to have become polluted: when he saw the dirt and bad smell of sins in it, he could not regard it otherwise. After he was relieved of this power, he also gave up declaring this water as polluted. It is related of a disciple of our Shaikh Maulana Abdur Rahim Raipuri (Rahmatullah alaih), mav Allah enlighten his grave, that for days together. he could not go out to answer the call of nature, because he found spiritual light prevailing all over. Similarly, there are hundreds and thou- sands of incidents proving beyond any doubt that those who are blessed with Kashf can see hidden things, accord- 2 3 ing to the degree of their attainment. 5 Z N Hadith<br><hr><br>214 215 Virtues of Zikr Hadhrat Umme Haani (Radhiyallaho anha) related that once Rasulullah (Sallallaho alaihe wasallam) paid her a visit, when she said to him, \"0 Rasulullah! (Sal- lallaho alaihe wasallam) I have grown very old and weak. Tell me something that I may be able to do while sitting.\" Rasulullah (Sallallaho alaihe wasallam) said to her, \"Hymn (&I 3 G ) one hundred times and you will get a reward as if you set free one hundred Arab slaves; hymn (?-j;;J1) one hundred times, which will fetch you ,a reward as if you present a hu2Gred horses, fully equipped, for the Jihaad; hymn @JI) hundred times, which is as if you sacrific~d,a,hundred camels for the sake of Allah; and hymn (blYlil!9) a hundred times, the reward of which will fill the whole space between the earth and the sky. There is no other commendable action that can surpass it.\" Hadhrat Salma (Radhiyal- laho anha) the wife of Abu Raafe' (Radhiyallaho anho) had also requested Rasulullah (Sallallaho alaihe wasal- lam) to prescribe her some zikr which may not be very lengthy. Rasulullah (Sallallaho alaihe wasallam) ad- vised her. \"Recite &i %, ten times, because Almighty Allah says in reply, \"It is for Me,\" recite(jl13G) ten times. because Almighty Allah says in reply, \"It is for Me\", and then recite (&4i1 ,$i) (0 Allah! forgive me) ten times. because then A!lah says, \"Yes, I have forgiven you.\" If you recite (&+l,$i) ten times, Almighty Allah will also say each time, \"I have forgiven you.\" What a brief and easy zikr has been proposed by Rasulullah (Sallallaho alaihe wasallam) for old and weak people, especially the women. It is very brief and involves no labour or going about, and vet what tremendous reward is promised for it. It is really a pity if we fail to earn this high reward. Iladhrat Umme Sulaim (Radhiyallaho anha) has narrated that she also requested Rasulullah (Sallallaho alaihe wasal- l59 ten times I each, and then pray for what you like, Allah will say: \"Yes, l Yes, I accept it.\" How simple and common are these words, that no effort is required to memorize them. We talk all sorts of rubbish throughout the day but if, while doing our business or sitting in the shop, or working on the field, we hymn this zikr as well, then along with work for the earthly life we can also earn a lot of wealth for the next life. i Hadith<br><hr><br>Rasulullah (Sallallaho alaihe wasallam) had said: \"There is a class of angels who keep going about on the pathways. and wherever they find some people 216 I Virtues of Zikr 7 engaged in the zikr of Allah, they call each other and gather round them, and pile up over each other right upto the sky. When that assembly for zikr is over. the 1 angels ascend to the Heavens and then Almighty 1 Allah. in spite of knowing everything, asks them where thev had come from? They submit that they have come I from such and such group of His bondsmen, who were busy in hymning His Glorv, His Grandeur, His Great- 1 ness and His Praise. Allah says, \"Have those people seen Me?\" \"No, our Lord\", confirm the angels. \"How w~ould thev have acted if they had actually seen me?\" \"They would have busied themselves with even greater zeal in praving to You and in hymning Your praise and Glorv.\" submit the angels. \"What do they demand?\" \"They want Paradise\", reply the angels. \"Have they ever seen Paradise?\" says Almighty Lord. i \"No our Lord\" say the angels. \"If thev had seen it, how \\ would thev have acted?\" savs Almighty Allah. \"Their zeal. yearning, and their prayers for it would have been even greater.\" submit the angels. \"What were they seeking refuge from?\" savs Almighty Allah. \"They were seeking refuge from Hell\", say the angels. \"Have I they seen the Hell?\" \"They have not seen it.\" \"How I would they have acted if they had seen it?\" says Allah. \"They would have been more scared of it, and would have tried more for protection against it,\" say the angels. Then Almighty Allah says, \"Allright then, all of you bear witness that I grant forgiveness to all those present in that assembly.\" One angel says. \"0 Allah! a person happened to be there only by chance; he had come for some other business and had not taken part in what they did.\" Almighty Allah says, \"That group I I was so blessed that whosoever happened to sit with them, evell bv the way, is not deprived of the blessings (and thus he is also forgiven).\" It is described in several ahaadith that there is a group v 4 of angels who go about in search of assemblies and individ- uals engaged in zikr. and wherever they find them, they sit near them and listen to their zikr. This subject matter is alreadv included in Hadith<br><hr><br>in Chapter I, wherein it is I also explained whv Almighty Allah praises these persons I in the presence of the angels. The submission by an angel that there was, in that as- semblv. a person who had come there on his private busi- ness was only a statement of facts, because on that occasion those angels were acting as the witnesses that those people were engaged in prayers and zikr of Allah. That is why they had to clarify the position, lest there should be any ob- jection. But it is the extreme benevolence of Allah that, be- cause of the blessed people engaged in zikr. a man who is sitting near them by the way is not deprived of the bles- sings. Almighty Allah savs in His Book: \"0 you who believe! fear Almighty Allah and be with the truthful. The Sufis say. \"Remain with Almighty Allah, and if 'il V) I. this is not possible, then be in the societv of those persons g who remain with Almighty Allah.\" Remaining with E N 5 Almighty Allah means (as given in the book of Bukhari Shareef): Almighty Allah says, \"By means of non-obliga- tory prayers. Mv bondman keeps on getting nearer and nearer to Me, till I make him My beloved, and at that stage I become his ears with which he listens, his eves with which he sees, his hands with which he holds, his feet with which he walks: and whatever he begs of Me I grant him.\" That Allah becomes his hands and feet, etc., means that he performs his actions for earning the pleasure and love of Allah and that he does not do anything against the will of Allah. The books of history relate the lives of many sufis of this level. A booklet, known as 'Nuzhatul Basaateen' is specially devoted to the account of such Sufis. .Sheikh Abu Bakr Kattaani (Rahmatullah alaih) related, \"Once, at the time of Hajj, there was a gathering in Mecca of some Sufis, the youngest among whom was Junaid Bagh- dadi (Rahmatullah alaih). In that gathering, there was a dis- cussion on the subject of 'Love of Allah' and as to who is the lover of Allah! Many of them expressed their views on the subject, but Junaid Baghdadi (Rahmatullah alaih) kept quiet. He was pressed to say something. With his head bowed down and tears in his eyes, he said, \"A lover (of Allah) is he who forgets his own self, remains engaged in Allah's zikr with due regard to all its requirements; sees Allah with the eyes of his heart, which is burnt by the heat of Allah's fear; Allah's zikr intoxicates him like a cup of wine, he speaks the word of Allah as if Almighty Allah 218 Virtues of Z i h 45 Ch. Ill: Ahadith on Virtues of Third Kaliniah 219 speaks through his mouth; if he moves he does so under bolted the door from inside, removed the bread and olive the command of Allah; he derives peace of mind only through obedience to Allah; and when such a stage is reached, his eating, drinking, sleeping, awaking and, in short, all his actions are for the pleasure of Allah; he neither pays any heed to the worldly customs, nor does he attach any importance to adverse criticism by the people.\" Hadhrat Sa'eed bin Musayyib was a well known Ta- bi'ee, and is counted as a great Muhaddith. A person named Abdullah bin Abi Widaa-ah, who used to go to him very often, related as follows: \"I could not go to him for a few days. Then when I went, Hadhrat Sa'eed asked me where I had been. I told him that my wife had died and that I remained busy on that account. He said, \"Had you in- formed me, I could have also joined the funeral.\" When, after a little while, I got up to leave he said, 'Have you mar- ried again?\" I replied, 'Who would marrv a penniless person such as I am?\" He said that he would arrange it, and there and then he read out the marriage serqpn and solem- nised my nikaah (marriage declaration) with his own daughter, fixing the mehr (jointure) at a paltry sum of eight or ten annas\" (This small amount as mehr may be permiss- ible according to them, as it is according to some Imams, but according to Imam Abu Hanifa (Rahmatullah alayh) a sum less than two rupees and eight annas is not permiss- ible). \"After the nikaah, I left the place. Only Almighty Allah knows how overjoyed I was; in my happiness, I was thinking where from to borrow the money for expenses to bring the wife to my house. I remained absorbed in these thoughts till it was evening. I was keeping a fast, and I broke it at sunset. After the evening prayer, I reached home and, lighting the lamp, I started eating my bread with olive oil, when somebody knocked at the door. Who is there? said I, \"Sa'eed\", came the reply. I started thinking which Sa'eed it was. It did not occur to me that it could be Hadh- rat Sa'eed. because for forty pears he had never been to any place except the mosque and his own house. I was sur- prised to see him standing outside, and submitted that he should have called for me. He replied, 'It was proper for me to come. I thought that since you have been married. you should not be alone in your house. I have. therefore, brought vour wife to live with vou. Saving this, he sent his daughter in, closed the door and went away. The girl. being overwhelmed with modestv, fell down on the ground. I i oil from near the lamp lest she should see it, climbed up on the roof of my house and called out to mv neighbours. When people gathered. I told them that Hadhrat Sa'eed had given his daughter to me in marriage, and that he had just then himself brought her and left her in my house. 'T'hev were all greatly surprised, and exclaimed, 'Is it true that she is already in your house? 'Yes,' confirmed I. The news spread and also reached my mother, who at once came there and said, 'If you touch her for three days, I will not see your face: in three days we will make all the prepara- tions. After three days, when I met the girl. I found her ex- tremelv beautiful. She was a Hafiz of the Qur'an. very conversant with the Sunnat of the Prophet (Sallallaho alaihe wasallam) and well acquainted with her obligations % to her husband. For one month, neither Hadhrat Sa'eed , , came to me. nor I went to him. After one month. when I 1 2: went to him there was a big gathering. After wishing 5 salaam to him, I sat down. When all others left, he asked me how I found my wife. I replied, 'She is most excelle~lt. so that friends are pleased to see her and foes become t:n- vious,' He iurther said. 'If you find anything undesirable. you mav use a stick to rectify it.' After I returned from there, he sent me through a special messenger a gift of I twenty four thousand dirhams (which comes to about five 1 thousand rupees). This girl had been demanded by King ', Abdul Malik bin Marwaan for marriage with his son, Waleed, who was the crown prince. but Hadhrat Sa'eed had declined the offer. In this way, he bad incurred the wrath of King Abdul Malik, who on some other pretext got him punished with a hundred lashes in bitter cold, J I I ~ then had a pitcher of cold water poured on him.\" Hadith</p></div>",
+        "sections": [
+            [
+                30,
+                16503
+            ],
+            [
+                16503,
+                18610
+            ]
+        ]
+    },
+    {
+        "id": 39,
+        "bookId": 5,
+        "chapter": "Objections and Answers",
+        "title": "Content for Objections and Answers",
+        "preview": "8 I I , J j - . , 3 3,,,;i; $ 2 ( t o , . . d F & d & K $ i ~ , , ~ , g , ~ ! g j ~ u 9 . . . . , . ;vi j j a ~ ; ;;,e>$iL+>~j?g~i;jld& 220 Virtues of...",
+        "content": "<div class=\"story-content\"><p>8 I I , J j - . , 3 3,,,;i; $ 2 ( t o , . . d F & d & K $ i ~ , , ~ , g , ~ ! g j ~ u 9 . . . . , . ;vi j j a ~ ; ;;,e>$iL+>~j?g~i;jld& 220 Virtues of Zikr 45 1 1 i iii & $ I \\ j 1 s &I JGj WGj, Jacjy!, j a!, &>h: 44 &I -. >,I> ,!I i l Rasulullah (Sallallaho alaihe wasallam) said, \"Whoso- ever recites &i &i i!i!9 A Ui At will be re- warded with ten virtues for each letter thereof. Whoso- ever supports an unjust party in a dispute incurs the wrath of Allah, until he repents and does toubah. Who- soever intercedes to prevent infliction of punishment awarded according to Islamic law is considered to oppose Almighty Allah, and whosoever slanders a Muslim, man or woman, will in the Hereafter be im- prisoned in Radghatul Khabal (a deep part of Hell), until he gets exonerated from this sin, which will hardly be possible there.\" Backing an unjust cause has nowadays become our second nature. In spite of knowing that we are at fault, we become unjust and partial for the sake of our relatives and our party. We are not afraid of the wrath, displeasure, and punishment of Almighty Allah, when our relatives and friends are involved. Not to speak of telling them that they should desist from committing wrong, we cannot even keep quiet and remain neutral, but we go to the extreme in supporting them. If anybody P uts up a claim against them, we try to oppose him. If a riend of ours commits theft, wrongs somebody, or indulges in adultery, we encourage and help him in all possible ways. Is this according to the dictates of our faith and religion? Is this accordfig to Islam that we feel proud of? Do we not thus degrade our Islam in the eyes of others, and degrade ourselves before Almighty Allah? It is stated in one hadith that one who deals or fights with somebody on the basis of sectionalism (racial- ism) is not one of us. According to another hadith, section- alism means to help one's own people in their wrong cause. \"Radghatul Khabal\" is the mud formed by the blood and puss of those in Hell. How dirty and horrible would be that place where such people who do slander against the Muslims will be imprisoned. In this life, we take it very lightly to talk against whosoever we iike, but we will re- alise the gravity of our offence in the Hereafter when we will be required to justify and prove whatever we have said here, and the proof given there wi!l have to be acceptable from the Shariat point of view. Fluent talk based on lies will be of no avail there. What we talk here and what the actual reality is will all be known there. Rasulullah (Sallal- laho alaihe wasallam) had said, \"Sometimes one talks merely to amuse others, but because of it he is thrown into Hell to a depth which exceeds the distance between the earth and the sky. A slip of the tongue is fraught with more dangers than the slip of the foot.\" It is said in one hadith, \"Whosoever reproaches somebody else for his sin will find himself involved in it before his death.\" Imam Ahmad (Rahmatullah alaih) explained that this hadith implies such sins from which the sinner has done toubah. Hadhrat Abu Bakr (Radhiyallaho anho) used to pull his tongue and say, \"You are the cause of our woes.\" Ibn Munkadir, a famous Muhnddith, and a Taabi'ee was seen weeping when he was about to die. Someone asked why he wept. He re- 0 plied, \"I do not remember to have committed any sin, but I 2 might have said something which, though ordinary in my gi3 opinion, may turn out to be something very serious before Almighty Allah.\" Hadith No 16 In the closing period of his life, whenever Rasulul- lah (Sallallaho alaihe wasallam) got up from a meeting, he used to recite \"Glory to Thee, 0 Allah, with the highest of Praises; I bear witness that there is none worthy of worship except Thee, 1 seek Thy forgiveness and turn to Thee.\" 222 Virtues of Zikr Someone said, \"It is only nowadays that it has become customary with you to recite this prayer, but it was not so before.\" Rasulullah (Sallallaho alaihe wa- sallam) said, \"It is the kaffaarah (atonement) of the meeting\". According to another version Rasulullah (Sallallaho alaihe wasallam) had said, \"These words constitute the kaffaarah of the meeting, and were taught to me by Hadhrat Jibraa-eel (Alayhis salaam).\" Hadhrat Aa-ishah (Radhiyallaho anha) also related, \"Whenever Rasulullah (Sallallaho alaihe wasallam) got up from a meeting, he used to recite: When I asked him the reason for reciting this duaa so often, he said, \"If a person recites it at the end of a meeting, then all his slips during the meeting are forgiven\". We are all liable to do some irrelevant and useless talk during a meeting. This duaa is very brief, but whosoever recites either of the two versions of this duaa will get saved from the adverse results of that meeting. The Almighty Lord has provided so many facilities for our benefit. Hadith No 17 Rasulullah (Sallallaho alaihe wasallam) said, \"When a person hymns the greatness of Allah, i.e. re- cites these kalimahs revolve round the Arsh with a low humming tone, and mention the name of the reciter. Do not you wish that there should be somebody near Almighty Allah to mention and recommend you before Him?\" Persons who seek an approach to the rulers, and hanker after position, get overwhelmed with joy and feel so proud if they are praised before a governor, not to speak of the king or the minister or even the viceroy, even though such a recommendation does not result in any benefit to them. That no gain results is clear because even if they get some lift in status, they have to spend comparatively far more in getting it through such recommendation. In order to approach the high officials, some people squander their prop- erty. get involved in debt, incur the enmity of others * and thus disgrace themselves in so many ways. All this 0 is experienced during the election period. ga E N On the other hand, just imagine the blessings and 5 honour of one's name being mentioned before the Arsh of Almighty Allah, the Lord of Lords, who controls this world as well as the Hereafter, and in fact everything in all the universe, Who controls the hearts of the kings, Who grants success or failure, gain or loss: so that, all the people of the world including the rulers and the ruled, the kings and their subjects, cannot harm or help anybody against His will, they cannot give even a drop of water to anybody if He does not will it. No worldlv wealth or honour can be compared to this blessing that one's name should be men- tioned with favour before such a Supreme Lord. If a person attaches more importance to any worldly honour, he does a great wrong to himself. Hadith<br><hr><br>.., 3 JjLj Li JG 2 &&> + &, &j i>: 2 (I,+) +I+@, -, . $& fJh J.~$& 6%\\, yi&, J$, +& . . t &I &+, &* & j . & j IX ~3 6 ~ 9 1 LLt j i\"'4 4 ,.i, 1_iO ,u-p 6- j Jli, 01 rib &\\ *,+I ,QI 2) ;GI si; z >I 2; ),L 2 il& jli, +,z J AGY, -L L) +I ril j U ) 4LyJb iul) 313 y l 05, *I L& &, & ;I &, i1 j& O$i d\\q i, ;\\ ?&, , , - u7 2, && 9) > h ' l c b l &&I J >$dl &I ,p JiiU-I JG JG + j J L) >Gy\\ j < 224 Virtues of Zikr Hadhrat Yaseerah (Radhiyallaho anha) one of the Muhajir women, related that Rasulullah (Sallallaho alaihe wasallam) had said, \"Make it a point to hymn (w) and G)k) and to sanctify Allah through reciting the words u@~ 41 b ~ & ) or ejJtj iC&h +$j >$ e$) and counting on your fingers, because the fingers will also be questioned, on the Day of Judgement, about the deeds performed by them and will speak out what they did. You should not neglect doing zikr of Allah, other- wise you would get deprived of His Mercy. Note: On the Day of Judgement, the body of a person, nay, his hands, feet, and every limb will be questioned about the good and bad actions performed by them, as stated in the Holy Qur'an at so many places. At one place, it is stated The day wheh their tongues, hands and feet will stand wit- ness against them about the sins they committed. At another place, it is said: At this place, the subject matter is decribed in several aayaat, which ar,e translated as follows: \"On that Day (Day of Judgement), the enemies of Allah will be driven towards Hell. Then they will be checked at one place, till they have all reached near the Hell. At that time, their ears, eyes, skin, etc, will bear witness against them, (and will tell the sins committed through these by each person). At this, those people will (in utter surprise) say to them, \"Why do you give witness against us?\" (it was for you that, in the worldly life, we indulged in sins? These organs will reply, \"Allah has given us speech, as He gave speech to all the things. It is He Who created you the first time, and unto Him you have returned.\" There are many ahaadith that describe this sort of testi- mony. In one hadith, it is stated, \"On the Day of Resurrec- tion, the non-believer in spite of knowing his own sins will deny that he had ever committed them. He will be told that his neighbours stand witness against him. He will reply that the neighbours tell lies out of enmity against him. He will be told that his own kith and kin testify against him, but he will say that they are also false. Then his own limbs will be made to give evidence against him. According to one hadith, the thigh will be the first to testify the evil deeds committed by it. It is stated in one hadith, \"The last one to cross the Siraat Bridge will pass stumbling to this side and that side, as a child does when his father gives him a beating. The angels will ask him whether he would confess his sins if he were helped to cmss it with ease. He will promise that he & will tell the real truth, and he will swear by Allah that he f~ will not hide any fact. The angels will make him stand i erect and pass the Siraat Bridge. When he has crossed over, he will be asked by the angels to give his statement. Think- ing that, if he confesses, he may be sent back to Hell, he will flatly deny having committed any bad deed. The angels will tell him that they can produce witnesses against him. He will look around, and as there will be nobody, he will think that since everybody has now reached his desti- nation, no witness can be available against him, and there- fore, he will agree to face witnesses. His own limbs will be asked to tell the truth, and when they start speaking he will be left with no alternative but to make a confession. Then he will say, \"There are many serious sins that are still to be told.\" Almighty Allah will then say that he has been granted forgiveness. It is thus a matter of necessity for us that we should make our limbs do as many good acts as possible. So that these may as well give witness in our favour. It is for this reason that Rasulullah (Sallallaho alaihe wasallam) had or- dered (his followers) to count zikr on the fingers. For the same reason, it is ordered in another hadith that we should go to the mosque very frequently, so that the foot-prints will bear witness in our favour, and reward is granted for these. How fortunate are the people against whom there is nobody to stand witness, either because no sins are com- 226 Virtues of Zikr ~nitted or because these were washed off through toubah, etc, and who (on the other hand) have hundreds and thou- sands of witnesses to testify their good deeds and virtues. The easy way to become one of such people is: Firstly, if a sin happens to be committed, it should be got wiped out at once by means of toubah (because in this way the sin be- comes extinct, as stated in Hadith No 33 of Section 11, Chapter 11) and secondly, the virtues should be accumu- lated in the account of deeds and there should be witnesses to testify to them, the limbs used for good deeds will all stand witness in one's favour. Counting (of zikr) on the fingers by Rasulullah (Sallal- laho alaihe wasallam) himself is mentioned in various words in several ahaadith. Hadhrat Abdullah bin Amr (Radhiyallaho anho) related that the Holy Prophet (Sallal- laho alaihe wasallam) used to hymn Allah's glory with counting on his fingers. 111 the hadith under discussion, there is warning against neglecting zikr of Allah, which deprives one of His Mercy. It is thereby learnt that the people who neglect zikr are ignored in respect of the Mercy of Almighty Allah. It is said in the Holy Qur'an, \"You remember Me, then I will re- member you (with My Mercy).\" Almighty Allah has thus conditioned His granting of favours on doing His zikr. The Holy Qur'an says: \"And a person who intentionally closes his eyes against Allah's zikr (which may be recitation of the Qur'an or any other zikr), We appoint a devil on him, who remains with him all the time and who (with other such devils) keeps on misleading all such people (as have become blind to Allah's zikr), and yet they deem they are rightly guided.\" It is stated in one hadith that a devil is appointed to remain with every person. In the case of a non-believer, he takes part in everything he does, he is with him even when he eats, drinks and sleeps. In the case of a believer he re-, mains at some distance, but is always on the lookout for a chance to attack him unawares when he is not doing zikr of Allah. Allah says at another place in the Holy Qur'an: \"0, you who believe! Let not your wea!th or your chil- dren (and other similar things) distract you from remem- brance of Allah. Those who do so are the losers. And spend of that wherewith We have provided you, before death overtakes one of you and then he says, My Lord: if only Thou wouldst give me respite for a little while, then I would give alms and be amongst Thy good bondsmen, But Almighty Allah reprieves no soul when its time has come and Allah is aware of all that you do.\" There are some people who do not neglect remem- % brance of Allah at any time. Hadhrat Shibli (Rahmatullah alaih) writes, \"I happened to see a lunatic on whom some E N 2 boys were throwing stones. I reprimanded the boys, who 5 said. \"This man claims that he sees Allah.\" I went near him and found that he was murmuring something. On lis- tening to him attentively, I heared him saying, \"You have done so well to have set these boys after me.\" I said to him, \"TChese boys accuse you of something.\" \"What do they say'!'\" enquired he. I said, \"They say that you claim to see Allah.\" He yelled a shriek and said, \"0 Shibli, I swear by Him, who has made me mad in His Love and Who keeps me wandering restlessly sometimes near Him and at times away from Him, if I were to lose sight of Him even for a while, my heart would burst into pieces on account of the pangs of separation.\" He said this, and ran away reciting the following couplet: Your appearance is constantly before my eyes, your re- membrance is always on my tongue, your abode is in my heart, then where can you hide from me. When Junaid Baghdadi (Kahmatullah alaih) was about to die someone advised him to recite the kalimah. He said, \"I have never forgotten it any time; (you should remind it to someone who may have neglected it). When Hadhrat Mumshaad Dinwari (Rahmatullah alaih) was about to die some one prayed to Allah for the grant of such and such blessings to him in Paradise. He smiled, and said, \"For the 228 Virtues of Zikr last thirty years, the Paradise with all its blessings has been appearing before me, but I have not even once diverted my attention from Almighty Allah towards it.\" When somebody reminded Hadhrat Royam (Rahmatul- lah alaih) at the time of his death, to recite the kalimah, he said, \"I have no acquaintance with anyone except Almighty Allah.\" When Hadhrat Ahmad bin Khidhrwayh was about to die, somebody asked him something. With tears in his eyes he said, \"For the last ninety five years, I have been knocking at a door which is now about to open. I am not aware whether it will mean good or bad fortune for me; I am too absorbed to talk to anybody at this time.\" Hadith<br><hr><br>Hadhrat Juwairiah (Radhiyallaho anha) related, \"When Rasulullah (Sallallaho alaihe wasallam) left my house for the morning prayer, I was sitting on the prayer-mat (busy in Allah's zikr). When he came back after Chaasht prayer (just before midday), I was still sitting in the same position. He asked me whether I had continued in that position right from the time he left in the morning. I replied in the affirmative. He then said, \"After I left you, I recited four kalimahs three times which, if compared to all that you have re- cited since the morning, will be found to outweigh it. These kalimahs are: Glory and praise be to Allah equal in number to his creation, according to His will and pleasure, equal in weight to His Arsh and equal in dimensions to His World).\" Hadhrat Sa'ad (Radhiyallaho anho) accompanied Rasu- lullah (Sallallaho alaihe wasallam) to the house of a Sahabi b ul L woman, who had before her some datestones and pebbles, g 3 E on which she was counting her zikr. Rasulullah (Sallallaho alaihe wasallam) said to her, \"May I tell you something which may be easier (or better) than this? I glorify Allah equal to the number of His creation in the Heaven, I glorify Allah equal to the number of His cre- ation on the earth, and I glorify Allah equal to the number of His creation in between the two (i.e. between the Heaven and the Earth), and I glorify Allah equal to the number of things He is to create. Likewise I hymn &hi) c+*Li.i, and ( j t j!i!J) each the same total number of times.\" Mulla Ali Qari has written that the zikr in the words mentioned above is more rewarding because one concen- trates on Allah's attributes mentioned therein, and then meditates over them. It is evident that the more one medi- tates and contemplates over the zikr one does, the better it is. For this very reason, the recitation of even a few aayaat of the Qur'an, with proper contemplation on what is read, is far better than considerably more recitation done without proper understanding. Some Ulama consider that this zikr is superior because there is in it an expression of one's utter helplessness in re- spect of counting the praises and favours of Almighty Allah, which is the best form of submission to Him. It is for 230 Virtues of Zikr this reason that some Sufis say that we commit countless sins, but we recite the name of Allah a limited number of times by counting. This does not mean that we should not count zikr: if it were so, then counting in particular cases would not have been stressed in the ahaadith. In many of the ahaadith, special rewards are promised for doing a par- ticular zikr a specific number of times. It really means that one should not feel contented after completing the speci- fied number, and that after completing the zikr specified for particular timings of the day, one should still remain engaged in other various forms of zikr in one's vacant periods, because zikr is such a precious wealth that it should not be confined to any number or any other limita- tion. These ahaadith also indicate the propriety of using a tasbeeh (i.e. a string of beads) for counting the zikr. Some people think this to be an innovation, but this is not cor- rect,! because Rasulullah (Sallallaho alaihe wasallam) saw others counting zikr on pebbles and date-seeds. but did not object to it, which proves its justification. Stringing or not stringing these together does not make any difference. Therefore all scholars and jurists have been using it. Mau- lana Abdul IIay wrote a book narned Nuzhatul Fikr on this subject. According to Mullah Ali Qari (Rahmatullah alaih) also the above mentioned hadith provides a complete argu- ment in favour of the commonly used string of beads, be- cause Rasulullah (Sallallaho alaihe wasallam) saw his companions counting on date-seeds and pabbles, and did not disapprove it, which proves its justification, and string- ing or not stringing the beads does not make any difference. Therefore, the statement of the people who call this prac- tice an innovation is not reliable. In the terminology of the Sufis, the string of beads is called a scourge for Satan. Someone, once saw a tasbeeh (rosary) in the hands of Hadhrat Junaid Baghdadi (Rahmatullah alaih) at a time when he was at the height of his spiritual glory, and ques- tioned him about it. He replied that he could not give up a thing by means of which he had attained nearness to Allah. It .is narrated about many Sahabas (Radhiyallaho anhum) that they kept date-seeds and pebbles for counting zikr. It is related about a Sahabi named Abu Safiyyah (Radhiyallaho anho) that he used to count zikr on small pebbles or stones. It is related about Hadhrat Sa'ad bin Abi Waqqaas (Kad- hiyallaho anho) that he used (both) datestones as well as pebbles. Hadhrat Abu Sa'eed (Radhiyallaho anho) is also reported to have used pebbles for counting zikr. It is given in Mirqaat that Hadhrat Abu Hurairah (Radhiyallaho anho) used to count on a string with knots on it. It is mentioned in Sunan Abi Dawood (a book of ahaadith) that Hadhrat Abu Hurairah (Radhiyallaho anho) used to keep a bag full of date-stones and pebbles for counting zikr on these, and that when the bag would get emptv, his maid-servant would put these back into the bag and place it near him again. The bag would get empty because the stones after counting were placed outside the bag, till all the stones would get finished, when the maid-servant would put the same stones again into the bag and place it near him. It is also narrated about Hadhrat Abu Darda (Radhiyallaho anho) that he had a bag containing Ajwah date-seeds, on 2 which he would commence zikr after the morning prayer and would continue till all the seeds were finished from gs the bag. E N 5 Hadhrat Abu Safiyyah (Radhiyallaho anho) a slave of Rasulullah (Sallallaho alaihe wasallam) used to have a piece of skin with pebbles spread on it before him, and he would recite zikr on these from morning to mid-day, when this skin with pebbles used to be removed from there, then he would attend to his other needs. After the noon-praver, the skin was again spread before him, and he would (:on- tinue zikr on the pebbles till the evening. The grandson of Hadhrat Abu Hurairah (Kadhiyallaho anho) narrated that his grandfather used to have a string with two thousand knots in it, and that he would not go to bed until he had completed doing zikr on these. Tht: daughter of Hadhrat Imam Husain (Radhiyallaho anho) nar- rate'd about Hadhrat Fatimah (Radhiyallaho anha) that she had a thread with knots, on which she used to count her zikr. In the termillology of the Sufis, the tasbeeh is also known as muzakkirah (that which reminds), becduse when it is held in one's hand there is a sort of urgt: for doing zikr. and therefore it is termed as suc:h. In this c:onnec.tioll a hadith is also narrated through Hadhrat Ali [liadhiyallaho anho) that Rasulullah (Sallallaho alaiht: wiisnllam) hncl said, \"What a good muzakkirah (reminder) is the tasl~t!t:h.\" In this connection, a haclith is 11arratt:tl l)y Mi~ula~ia Abdul Hay (Rahmatullah alaih) \"Every Sheikh If:nc:llc?r in 233 Virtues of Zikr i my line right upto a pupil of Hadhrat Junaid Baghdadi had bestowed a tasbeeh on his pupil and recommended him to do zikr on it. The pupil of Hadhrat Junaid (Rahmatullah alaih) had stated 'On seeing a tasbeeh in the hand of my Sheikh, I enquired if he still needed the tasbeeh after having reached such a spiritual height. He replied that he had seen this tasbeeh in the hand of his Sheikh, Sirri Saqati (Rahmatullah alaih), and had put the same question to him, and Hadhrat Sirri Saqati (Rahmatullah alaih), had also re- plied that on seeing a tasbeeh in the hand of his Sheikh, Hadhrat Ma'roof Karkhi (Rahmatullah alaih), he had put the same question to his Sheikh Hadhrat Bishr Haafi, (Rah- matullah alaih) who said that he had also put the question to his Sheikh Umar Makki, (Rahmatullah alaih) who had also stated that he had asked the same question from his Sheikh Hadhrat Hasan Basri (Rahmatullah alaih) as to why he kept a tasbeeh in his hand in spite of his having attained such spritual heights, to which the Sheikh had replied, \"It had proved very useful in my initial stages of Tasawwuf and I had made progress by virtue of it; I do not want to leave it in the last stage, when I want to use my heart, tongue, hands, and everything in doing zikr of Almighty Allah.\" The Muhaddith however have questioned its use. Hadith<br><hr><br>- / 6- 2 &,& @U Li id, SCk ij $, ti;, % A > &?I ,j,, ~ + j g &&{ ,'j @>{ $ > 52, $ $36 .: . * ' ' ,&,, &.I , *GG &, 31 J j 4 + * . Gag & 'W . , , * .I 1, > j & S U &j !j,, &&j @ &,, , - ,. , , C- c + g > d > > ~ ~ & ~ j & j ~ & $ , & j ~ , k + , , , , -, Rasulullah! (Sallallaho alaihe wasallam) her hands have become worn out on ac- count of working the grindstone, the skinbag used by her for fetching water has left an impression on her cl.sst, and her clothes remain dirty because of sweep- ing the house herself. Therefore, I had sent her to ask for a slave so that she would get some relief in her work. Rasulullah (Sallallaho alaihe wasallam) said, \"0 Fatimah! keep fearing Almighty Allah, discharge your duties to Him, do all the work in the house yourself and at the time of going to bed recite G ) 33 times, &i) 33 times and & i 34. times, be- 34 Virtues of Zikr i 46 235 cause it is better for you than a servant.\" She said, \"I submit to the Will of Allah and the advice of His Prophet (Sallallaho alaihe wasallam).\" According to another hadith, a similar story is related by two cousins of Rasulullah (Sallallaho alaihe wasallam) who, along with his daughter, Fatimah (Radhiyallaho anha), went to him, and told him of their hardships and asked for a servant, Rasulullah (Sallallaho alaihe wasallam) replied to them, \"As for giving you a servant, the orphans of the battle of Badr deserve preference over you; but I can tell you something that is better than a servant. After every Salaat, recite the three Kalimahs (i.e. tasbeeh, tahmeed and - takbeer) thirty-three times each and then recite once This will he more useful than a servant.\" Rasulullah (Sallallaho alaihe wasallam) recommended this zikr especially to members of his household and his relatives. According to one hadith, he would advise his wives to recite (bl S G ) , ( A - U i ) and &i ii) 33 times each at the time of going to bed. ' In the hadith undgr consideration, he recommended this zikr to face worldly labour and hardship. The reason is apparent that the worldly lahow and hardship is not a matter of serious consequence for a Muslim; he is always anxious to provide for the comforts and joys in the life after death. It was therefore that Rasulullah (Sallallaho alaihe wasallam) diverted the attention of his dear ones from the hardships and worries of this life to making provision for the comforts in the Hereafter. That this particular zikr is most rewarding in the Here- after has been described in the hadith given in this chapter. The other reason why Rasulullah (Sallallaho alaihe wasal- lam) recommended these Kalimahs for zikr is that, in ad- dition to spiritual and religious gains, these Kalimahs bring many worldly benefits as well. There are many things in the Book of Allah and in the sayings of Rasulullah (Sallal- laho alaihe wasallam) which result not only in spiritual gains but also in worldly benefits. Thus, it is said in one hadith that during the time of Dajjaal the food of the believ- ers will be the same as of the angels, i.e. reciting (+ILG) etc., Almighty Allah will satisfy his hunger. This hadith proves that in this life also one can live upon the zikr of Allah, and without eating and drinking anything. When such proficiency can be acquired by the common believers at the time of Dajjaal, it is no wonder that the distinguished ones attain this blessing even at this time. This suggests that instances of some saints having lived without (or on insufficient) food for days together should not be disbe- lieved or refuted. It is stated in one hadith that, when fire breaks out anywhere @ %) should be recited excessively, because it is helpful in extinguishing the fire. It is written in the book His-nu1 Haseen that if somebody feels difficulty or weariness in doing some job and requires additional c, strength to overcome his shortcoming, he should recite 8 3 (&I 33 times, (A ljii) 33 times and &i ii) 34 A 5 times, before going to-bed, or each of the three Kalimahs should be recited 33 times or any one of the three may be said 34 times. Hafiz Ibn Taimiyah (Rahmatullah alaih) has deduced from the ahaadith, in which Rasulullah (Sallallaho alaihe wasallam) instead of giving a servant to Hadhrat Fatimah (Radhiyallabo anha) advised her to recite these Kalimahs, that one who does this zikr with constancy will not get tired while doing laborious jobs. Hafiz Ibn Hajar has stated that, even if he feels somewhat tired, it will not harm him in any way. Mulla Ali Qari stated that it had been well- tried that the recitation of this zikr before going to bed eliminates weariness and increases the strength. Allamah Suyuti (Rahmatultah alaih) has written in his book Mirqaatus-Sa'ood that the fact that recitation of these Kalimahs is better than a servant is true in respect of the life in the Hereafter as well as in the worldly life; of course. the benefits that will accrue in the Hereafter as a result of this zikr cannot be compared to the meagre usefulness of a servant in )his world, and also the strength acquired through doing this zikr enables one to accomplish more than is possible even with the help of a servant. According to one hadith, Rasulullah (Sallallaho alaihe wasallam) has said, \"There are two routines which if fol- lowed by a Muslim will enable him to enter Paradise. Both the routines are very easy, but there are very few people who act according to them. One is to recite these three Ka- 236 Virtues of Zikr limahs ten times each after every salaat. In this way, one glorifies Allah one hundred and fifty times, and thereby earns one thousand and five hundred virtues every day. The second routine is to recite cLbv+) and (A+l;;ji, 33 times each, and & 34 times betore going tb bed every day. In this way, one does one hundred good deeds, I but actually earns one thousand virtues.\" Someone asked the reason why only a few people are able to act upon this? Rasulullah (Sallallaho alaihe wasallam) said, \"At the time of salaat, the devil comes and reminds him of something, which actuates him to get up and go away, and at night the devil reminds him of other necessities, which makes him neglect to recite these Kalimahs.\" In these ahaadith, there is one thing specially note- worthy: that Hadhrat Fatimah (Radhiyallaho anha) who would be the leader of women in Paradise, and the daugh- ter of the leader of mankind in both the worlds, used to grind corn flour herself (as a result of which her hands de- veloped calluses on them, would herself fetch the water in the skin waterbag, which left impressions on her chest and would sweep the house herself, so that her clothes re- mained dirty, and did all other household duties, like cooking meals and preparing bread, etc. Do our womenfolk perform that much labour, or even half of it, with their own hands? It is certainly not so, and our lives have little resem- blance with the lives of those whom we profess to be our leadefs. It ought to have been that we who claim to be the servants should put in more labour than our masters, but it is a matter of great disappointment that the actual position is quite the reverse. EPILOGUE Virtues of Salaatut Tasbeeh and Method of Performing Now I will describe something that is really very grand, and thereby conclude this part of the book. The Ka- limahs mentioned above are very important and very useful from the wordly as well as spiritual points of view, as mentioned in the ahaadith given above. As these Kali- mahs are very important and rewarding. Rasulullah (Sallal- laho alaihe wasallam) prescribed a special prayer, which is known as Salaatut Tasbeeh (i.e. salaat of these Kalimahs). It is called Salaatut Tasbeeh, because these Kalimahs are re- $ cited 300 times during this salaat. Rasulullah (Sallallaho 8 3 alaihe wasallam) greatly stressed this and persuaded the gz believers to offer this salaat, as is evident from the follow- 5 ing ahaadith: 238 Virtues of Zikr i 1 (1) Once Rasulullah (Sallallaho alaihe wasallam) said to his uncle, Hadhrat Abbaas, (Radhiyallaho anho). \"0, Abbaas, my uncle! I want to make a special gift to you i.e. to tell you something special, so that if you act upon it Almighty Lord will forgive all your sins, whether old or new, intentional or unintentional, minor or major, open or secret. That action is to offer four rakaats of nafl salaat, and during each rakaat, after you have recited Surah Fatihah, and one more surah, then you should say: 15 times, while standing still, then repeat it 10 times when you are in h k u , 10 times when you rise from the ruku, 10 times in the first sajdah, 10 times when you rise from the first sajdah, 10 times in the second sajdah, and ten times when you sit up after the second sajdah. The total in each rakaat comes to 75 times. If I possible, you should offer this salaat once everyday, and if you cannot do it daily, then offer it on every Friday, or once a month, or once a year or at least once in your lifetime.\" 1 I 1 I EPILOGUE: Virtues of 'Salaat-ut-Tasbeeh' 239 I will grant you something; I will give you a special gift.' I thought that I would be given some thing of ma- terial value. When I went to him he said to me 'Offer four rakaats of salaat after midday'. Then Rasulullah (Sallallaho alaihe wasallam) explained the method of offering this Salaat (as given in the last hadith). Rasu- lullah (Sallallaho alaihe wasallam) also told me that even if I were more sinful than all the other people of the world, my sins would be forgiven. I asked him what I should do if, for some reason, I am not able to offer this salaat at the given time. He told me to offer it whenever I could during day or night.\" (3) Rasulullah (Sallallaho alaihe wasallam) had sent his cousin, Hadhrat Ja'far, (Radhiyallaho anho) to Ethio- pia. When he returned from there and reached Madina, Rasulullah (Sallallaho alaihe wasallam) embraced him, kissed him on his forehead, and said to him, \"Shall I give you something, give you good tidings, give you a gift, grant you a present?\" He replied, in the affirm- ative, and then Rasfillulah (Sallallaho alaihe wasallam) asked him to offer four rakaats in the manner ex- plained already. In his hadith, the four kalimahs are also followed by (2) A Sahdbi narrated. \"Once Rasulullah (Sallallaho alaihe wasallam) said to me, 'Come to me tomorrow morning, EPILOGUE: Virtues of 'Salaat-ut-Tasbeeh' 241 240 Virtues of Zikr (4) Hadhrat Abbaas (Radhiyallaho anho) narrated, \"Rasu- lullah (Sallallaho alaihe wasallam) said to me 'Should I grant you a present, give you a gift, bestow something on you?' I thought that he wanted to give me some ma- terial thing such as had not been given to anybody else.,Then he taught me the method of offering four ra- kaats, as explained above. He had also told me that when I sit for tahiyyaat I should repeat the kalimahs before reciting at-tahiyyaatu . . . \" 242 Virtues of Zikr (5) Hadhrat Abdullah bin Mubaarak and many other scholars, while narrating the virtues of this Salaatut Tasbeeh, also narrate the following method of offering, this salaat. \"After reciting thanaa and before starting Surah Faatihah repeat these kalimahs fifteen times. Then start with (A4 i;ii) and (h +) and, after complet- - , . - . ing Surah Faatihah and some surah, these kalimahs should be repeated ten times before the ruku, ten times during the ruku, ten times after rising from the ruku, ten times in each sajdah and ten times while sitting be- tween the two sajdahs. This completes seventy five times in one rakaat (so that the kalimahs need not be recited ill the sitting position after the two sajdahs. In the ruku & j and in sajdah (>i\\ ;;j b G ) should be recited before reciting the kalimahs.\" (This method is also narrated to have been advised by Rasu- lullah (Sallallaho alaihe wasallam). (1) The Salaatut Tasbeeh is a very important salaat, as is evident from the ahaadith given above, wherein Rasulul- lah (Sallallaho alaihe wasallam) enjoined it as a matter of great kindness and favour and stressed its importance. As such, the scholars, Muhaddiths, jurists, and Sufis through- out the past centuries have been particular in offering this salaat. Haakim (Rahmatullah alaih) who is an authority on hadith, has written that the authenticity of this hadith is supported by the fact that, right from the second generation after the Sahabah to our times, all the great teachers of re- ligion have been offering this salaat with constancy and have been advising the people to do so. Abdullah bin Mu- baarak is also one of them. He was the teacher of the teach- ers of Imam Bukhari. Baihaqi (Rahmatullah alaih) stated that, even before Ibn Mubaarak, Abul Jauza (Rahmatullah alaih), an authentic Taabi'ee (one who had seen the Saha- bah) and whose narrations are considered to be reliable, used to be very particular in offering this salaat. Daily, as soon as he heard the azaan for the noon prayer, he would go to the mosque and would complete this salaat before the noon salaat. Abdul Aziz bin Abi Rawwaad who was the teacher of Ibn Mubaarak, and who was a great devotee, saint, and pious man, stated that one who desires to go to Paradise should be very constant in offering Salaatut Tas- beeh. Abu Uthman Hairee (Rahmatullah alaih) who was a great saint, stated that nothing is as effective as Salaatut EPILOGUE: Virtues of 'Salaat-ut-Tasbeeh' 243 Tasbeeh in providing relief from misfortunes and sorrows. Allama Taqi Subki (Rahmatullah alaih) stated, \"This salaat is very important, and one should not get misled if some people happen to deny its importance. One who ignores it even after learning about its reward, is negligent in relig- ious matters, fails to act like virtuous people, and should not be considered as a reliable person.\" It is stated in Mir- qaat that Hadhrat Abdullah bin Abbaas (Radhiyallaho anho) used to offer this salaat every Friday. (2) Some scholars do not accept this hadith to be au- thentic, because they cannot reconcile that there could be so much reward, especially forgiveness of major sins, for offering only four rakaats. But since it has been narrated by many Sahabas (Radhiyallaho anhum), its authenticity cannot be denied. However, according to many aayaat and $ other ahaadith, taubah is an essential condition for the for- 8 $ giveness of major sins. :- gE;i P (3) In the ahaadith given above, two slightly different ways of offering this salaat have been described. One is that: should be recited fifteen times, after recitation of Surah Faatihah a?d one surah while standing, ten times after re- citing (@\\ s j b G ) in the ruku, ten times after rising from ruku, ten times after reciting ($Y\\ s j b G in each sajdah, ten times while sitting between the two sajdahs and ten times after the second sajdah, when after saying ($i h\\) one should repeat it ten times before standing in the first and third rakaats and before reciting in the second and fourth rakaats. According to the second way of offering this salaat, the kalimahs should be recited fifteen times after reciting ($1 UG) and before starting Surah Faati- hah, ten times after reciting Surah Faatihah and a surah, and the rest is like the first method, except that it is not necessary to re~ite this kalimah after the second sajdah in any rakaat. The scholars have stated \"It is better if this salaat is offered sometimes in one way and sometimes in the other way.\" As this salaat is not in general practice, a few instructions are mentioned below for the facility of those who offer it: (1) In this salaat, no surah is particularly specified. Any 244 Virtues of Zikr 1 EPILOGUE: Virtues of 'Salaat-ut-Tasbeeh' 245 surah may be recited. But some scholars have stated that four out of the five surahs, namely Hadeed, Hashr, Saf, Jumu'ah, and Taghaabun should be recited. According to some ahaadith at least twenty aayaat should be recited. According to some, it should be any of the surahs, Asr, Kaafiroon, Nasr, and Ikhlaas. (2) Counting should not be done by word of mouth, as this act will spoil the salaat. Counting on the fingers or by I . means of a string of beads is permissible but not desir- able. The best way is that the fingers should be kept in their position, but should be pressed one by one for counting. (3) If one forgets to recite the kalimah at any stage, he should make up the number in the next act of salaat, except that no such deficiency should be made up after rising from ruku, between the two sajdahs or after the second sajdah. In these three positions, one should recite the kalimahs as specified and then make up the deficiency in the next act. For instance. if one forgets recitation of the kalimah in the ruku one should make up this deficiency in the first sajdah. Similarly, the deficiency of the first sajdah should be rnade up in the second sajdah and that of second sajdah in the second rakaat while standing or, if one forgets to do so, then in the last rakaat while sitting and before reciting (43 If for some reasor:, sajdatus sahw is required to be done, the kalirnah is not to be recited then, because the number of 300 has already been completed. If however the total has been less than 300, the deficiency can be made up in sajdatus sahw as well. (5) According to some ahaadith the following duaa should 1 be recited after and before the salaam: \"0 Allah! I pray to you for granting me righteous- ness (as) of those who are on the right path, actions (as) of those who are true Believers. sinceritv (as) of those who do taubah, constancy (as) of the contented ones, b precaution (as) of those who fear You, yearning (as) of those who love You, devotion (as) of pious devotees, $2 E N and knowledge (as) of religious scholars, so that 1 may 5 fear You. 0, Allah! grant me such fear as may prevent me from doing any wrong, so that, through submission to You, I may do such deeds as may earn for me your pleasure and your approval, and so that I map do taubah with sincerity out of Your fear, and I may become truely sincere out of Your love, and I may rely on You, because I may always hope for better (things) from You. O! The Creator of noor. You are above all defects. 0 ! our Sustainer, grant us complete light (noor) and forgive us; no doubt You have complete control over everything. O! You, the Most Merciful, grant my prayer out of Your Mercy.\" (6) Except the three forbidden times, this salaat can be of- fered at any time of the day or night. However, the more appropriate times, in order of perference, are: after midday, any time during the day, and any time during the night. (7) According to some ahaadith, the third kalimah should also be followed by (#I >', +4 j! i$yj j+y) as also stated in Hadith No 3 given above. It is therefore better to recite it sometimes in addition to the third kalimah. >'dl &j . h . +i li\\j&j >iJ ZAKARIYA KANDHALVI Friday Night 26th Shawwal1358 (Iiijrah)</p></div>",
+        "sections": [
+            [
+                30,
+                16459
+            ],
+            [
+                16459,
+                33080
+            ],
+            [
+                33080,
+                43200
+            ]
+        ]
+    }
+]);
@@ -0,0 +1,75 @@
+// Fazail-e-Amaal Data Shard: book 6
+fazailData.stories.push(...[
+    {
+        "id": 40,
+        "bookId": 6,
+        "chapter": "Virtues of Ramadhaan",
+        "title": "Content for Virtues of Ramadhaan",
+        "preview": "Virtues of TABLIGH Revised translation of the Urdu book Faza'il-e-Tabligh by Shaikhul Hadith Maulana Muhammad Zakariyya Kaandhlawi o c $2 t% 5 transla...",
+        "content": "<div class=\"story-content\"><p>Virtues of TABLIGH Revised translation of the Urdu book Faza'il-e-Tabligh by Shaikhul Hadith Maulana Muhammad Zakariyya Kaandhlawi o c $2 t% 5 translation revised by Mazhar Mahmood Qureshi Khwaia Ihsanul Haq VIRTUES OF TABLIGH CONTENTS FOREWORD . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 5-7 Page No CHAPTER I Verses from the Holy Qur'an concerning Tabligh 8-12 CHAPTER I1 Sayings of the Holy Prophet concerning Tabligh 13-27 CHAPTER I11 Practise what you preach 28-30 L, E G $3 CHAPTER IV .b + g Importance of Ikraam (Honour) in Tabligh 31-33 CHAPTER V Importance of Ikhlaas (Sincerity) in Tabligh 34-36 CHAPTER VI Respect for Learning and the Learned in Islam 37-40 CHAPTER VII Keeping company with the Righteous Divines 41-46 &J\\ +J\\ +\\ + s & . , d>j 3 .&, ;* ,, FOREWORD IN THE NAME OF ALLAH, THE MOST GRACIOUS, THE MOST MERCIFUL We praise Him, and we ask His blessings on His nol)le Prophet. First, I give thanks to Allah, who has enabled me to write this booklet on Tabligh. One of the best of the Muslim scholars of this age has advised me to select a few verses of the Holy Qur'an and some savings of the I-ioly Prophet (Sallallaho alaihe wasallam) on Tabligh, and ex- plain the same. Since my humble services to such sincere believers can be a means of salvation for me. I present this useful pamphlet to ever\" Islamic School, Islamic Associa- tion, Islamic Government, rather to every Muslim, and re- quest them to serve the sacred cause of Tabligh in their own wav. In fact, during this age there is a dav-to-dav de- cline in our devotion to religion. and objections against our true faith are raised not only by disbelievers, but also by the so-called 'Muslims'. The fardh and waajib observances are being neglected not only by the common Muslims. but by those also who hold important positions. Millions of Muslims have indulged in manifest false-worship, not to speak of neglecting prayers and fasting; vet they arc never conscious of their practices which are against a pure alle- giance to Allah. Trespassing the religious limits is verv common, and mocking at the religious beliefs has becornc il fashion of the dav. That is whv the Muslim scholars have even begun to shun the common folk, and the result of this state of affairs is that ignorance about the teachings of Islam is increasing day bv day. People offer the excuse that no one teaches them the religion of Islam with a keen interest. and the Muslim scholars have an excuse that no one listens to them attentivelv. But none of these excuses is valid before Allah. As a matter of fact. He wi!l ncver <accept the excuse of the common folk that they were ignorant about %= * = 5' {z FOREWORD religious matters; for to learn religion, and to make a se- rious effort to acquire knowledge of its practices is the per- sonal responsibility of every Muslim. Since ignorance of law is no excuse under any government, then why should it be accepted by the Lord of all rulers? They say, making excuses for crime is worse than crime itself. Similarly, the excuse of the scholars that no one listens to them does not hold water. They boast of representing the great spiritual leaders and divines of the past, but never consider how many troubles and hardships they bore to preach the true religion! Were they not pelted with stones? Were they not abused and oppressed to the extreme degree? But in spite of all these obstacles and hardships, they fulfilled their re- sponsibilities about preaching, and they propagated the message of Islam regardless of any opposition. Generally, the Muslims have limited Tabligh to the scholars only, whereas every Muslim has been commanded by Allah to stop people from doing forbidden things. If we admit for a moment that Tabligh is the duty of Muslim scholars only who do not perform it properly, then it is the particular duty of every Muslim to preach Islam. The em- phasis that has been laid on Tabligh by the Qur'an and Hadith, will be proved by the Qur'anic verses and sayings of the Holy Prophet (Sallallaho alaihe wasallam) that are going to be quoted in the following pages. Therefore, you cannot confine Tabligh to scholars only, nor can it be an excuse for you to neglect the same. I would request every Muslim to devote his time and energy to Tabligh as much as he can: \"Consi jer, the time at your disposal. a blessing; for none knows what his end will be.\" You need not necessarily be a perfect scholar to preach Islam and good morals to humanity. Whatever little knowl- edge of Islam you possess, you must impart it to others. Whenever a morally wrong or a forbidden thing is done in your presence, then as a Muslim it is your duty to stop the transgressor, as far as it lies in your power. I have described all the important things about Tabligh briefly in seven chapters, and I hope that every Muslim will benefit from them. HAFlZ MOHAMMAD ZAKARIYYA SHEIKH-UL-HADITH MADRASAH MAZAHIR-UL-ULUM, SAHARANPUR. CHAPTER I VERSES OF THE HOLY QUR'AN CONCERNING TABLIGH First of all, I want to mention a few verses of the Holy Qur'an concerning Tabligh. From these verses, the readers can easily see how important Allah considers the preach- ing of Islam. I have come across as many as sixty verses on this particular subject, and Allah knows how many more verses could be found by another keen observer. I quote here a few of them for the benefit of every true believer. \"And whose words can be better than his, who calls (people) towards Allah, and performs good deeds, and says: 'I am one of those who submit to Allah!'\" Certain commentators have written that whoever in- vites people to Allah through any means deserves the honour mentioned in the above verse. For instance, the prophets call people to Allah by means of miracles. and su- pernatural actions, the scholars invite them by preaching and arguments, the Muslim warriors [mujahids) call them by means of the sword: and the muazzins cat1 them 'bv means of the azaan. In short, whoever invites people to good deeds deserves this reward, whether he calls them to the formal observances of Islam or to the internal improve- ments of the spirit, like the mystics who stress the purifica- tion of the heart and the realization of Allah's attributes. In the concluding verse quoted above some com- mentators say such a person should also be proud of the honour bestowed on him by Allah, of being categorised as a Muslim, and he should proclaim this honour in words. Some other commentators interpret that he should not be proud of being a preacher, but should consider himself as an ordinary Muslim. . l i I ( e o ' -, , && &pl\\ yij ( Y ) +$\\ \"(0 Prophet! Sallallaho alaihe wasallam) preach to them (the Truth), for preaching proves very beneficial for the Believers.\" I The commentators have written that by preaching is meant instructing the believers through the verses of the Holy Qur'an, for these would guide them to the Right Path. But such a preaching can be useful for the disbelievers also, for thereby they may become believers. Alas! in this age, preaching is not performed regularly and properly. Generally the object of the preachers is to show off their ability and eloquence to the listeners, whereas the Holy Prophet (Sallallaho alaihe wasallam) has said: \"Whoever learns the art of declamation in order to attract the people towards himself, his prayers and ob- servances, whether obligatory or optional, will not be accepted on the Day of Judgement.\" 8 3 \"And command your family to observe the pray- f $ ers, and also perform these yourself regularly. We do 5 not ask you for sustenance. We will give you suste- nance; and the ultimate success is for the God-fearing.\" Numerous traditions say that whenever anyone com- plained of poverty to the Holy Prophet (Sallallaho alaihe wasallam), he recited this verse, and advised him to per- form his prayers regularly, as though pointing to the fact that regularity in prayers will lead to ample provision. It has been stressed in this verse to do a thing yourself before giving instructions to other, because this is a more effective and successful method of preaching. That is why all the prophets themselves first did what they preached to others. Thus they became examples for their followers, who would not then think that the teaching of their relig- ion are so difficult to carry out. Moroever. Allah has promised ample provision for those who perform the prayers regularly, so that they should never feel that prayers can interfere with the earn- ing of their livelihood, whether through trade, service, etc. Thereafter it is stated as a rule, that ultimate success and salvation will be attained by the God-fearing only. 10 Virtues of Tabligh \"0 son! Perform thy prayers regularly; and com- mand people to do good deeds, and prevent them from forbidden things, and bear patiently whatever befalls you (in the preaching of Truth): undoubtedly this de- mands courage! \" (Surah Luqmaan: 17) In this verse, several important things for a Muslim have been mentioned, which can be a means for our salva- tion; but we have neglected these very badly. Not to speak of the lack of preaching the truth, we have neglected even the prayers, which is a basic principle of Islam, in fact the most important after faith. There are so many people who do not perform their prayers at all; but even those who do, hardly perform it with all its requisites, such as congrega- tional prayers. It is the poor only who perform the prayers with congregation in the mosque, while the rich feel it below their dignity to be present in the mosque. Ah! my complaint is only to Allah! \"0 careless person! What is an insult for you, is a matter of pride for me.\" \"0 Muslims! there must be a group among you who would invite people to Good; and would com- mand them to do good deeds, and would prevent them from forbidden things; and these are the people who will attain salvation.\" (Surah Aali Imraan: 105) In this verse, Allah has clearly commanded the Mus- lims to prepare a group or party which would preach Islam throughout the world: but we see that the so-called Mus- lims have totally neglected this commandment. On the other hand, the non-Muslims, are preaching their religion day and night. For instance, parties of Christian mission- I 1 I aries have been specially assigned to propagate their relig- ion in the whole world; similarly other communities are trying their best to preach their own religions. But the question is, is there such an organization among the Mus- lims? The answer, if not in the negative, cannot be in the affirmative either. If any individual or any party among the so-called Muslims arises for the preaching of Islam, un- reasonable objections are raised against them, instead of giving them help and co-operation, whereas it is the duty of every true Muslim to help those who preach Islam, and to remove shortcomings where necessary; but these people neither do anything themselves to preach Islam, nor help those who have devoted their lives to this sacred cause. Thus the result is that even the sincere and unselfish preachers are disappointed, and give up their efforts in this regard. \"0 Muslims! you are the best of peoples, who have been selected for the guidance of mankind; you enjoin them to do good deeds, and prevent them from forbidden things; and you have firm faith in Allah.\" (Surah Aali Imraan: 10) That the Muslims are the best of all nations, has been asserted in certain sayings of the Holy Prophet (Sallallaho alaihe wasallam) also; and there are some verses of the Holy Qur'an that corroborate this. Even the above-men- tioned verse bestows the honour of 'Best Nation' on us, provided we preach Islam, command people to do good and prevent them from evil. The commentators have written that in this verse, the preaching of truth and prevention of evil has been men- tioned before faith even, whereas faith (Imaan) is the root of all Islamic beliefs and actions. The reason is that faith has been a common factor among all the nations of the world, but the special thing that has particularly distin- guished the Muslims is the mandate enjoining people to do good, and to prevent them from evil. So, this is the real basis for the superiority of the Muslims, whenever they ful- filled it; and since in Islam good actions are of little value without faith, it is therefore specifically mentioned at the 12 Virtues of Tabligh I end of the verse. In fact, the real object in this verse is to emphasise the importance of enjoining people to do good deeds, and this is the distinguishing feature of the Muslim Ummah. It is not sufficient to enjoin good and to prevent from evil only now and then, but this practice should con- tinue at all times and on all occasions regularly. Reference to the task of preaching the truth are found in earlier relig- ions, but the distinguishing merit of the Muslim Ummah lies in taking it up as a regular assignment. This is not a temporary work, but a permanent one. \"In the talk of an assembly of common folk there 1 is no good at all, except those who command people to I give charity (to the poor) or instruct them to do good things, or make peace between people (they will be re- warded by Allah). And whoever does this only to please Allah, soon he will receive a great reward from Allah.\" (Surah Nisaa: 114) In this verse, Allah has promised a great reward for those who @each truth; and how great and honourable can be the reward that has been called 'great' by Allah. In this context, the Holy Prophet (Sallallaho alaihe wa- I sallam) has said, \"A man's words may be a burden (sin) for him, except those that he has spoken for giving instructions for good deeds, and preventing others from forbidden things, or for remembering Allah.\" In another hadith, the Holy Prophet (Sallallaho alaihe wasallam) has said, \"Shall I tell you a virtue better than op- tional prayer, fasting and charity?\" His Companions said, \"You must tell us that virtue, 0 Messenger of Allah!\" (Sal- lallaho alaihe wasallam). He said: \"To make peace between people, for hate and mutual conflict uproot good deeds, just as a razor removes the hair.\" I There are many more verses of the Holy Qur'an and sayings of the Holy Prophet (Sallallaho alaihe wasallam) that instruct us to make peace between people. What we mean to emphasise here is that to make peace between people is also another form of instructing them to do good and preventing them from evil. To introduce peace and co- operation in the society should therefore be given due im- portance. CHAPTER 2 SAYINGS OF THE HOLY PROPHET (SALLALLAHO ALAIHE WASALLAM) CONCERNING TABLIGH In this chapter, I will quote certain sayings of the Holy Prophet (Sallallaho alaihe wasallam) that explain the meaning of the above-mentioned verses of the Holy Qur'an. It is not the intention to encompass all the relevant ahaa- dith. If I quote all the verses and the ahaadith on this sub- ject, I fear no one will read them, for now-a-days people hardly spare time for such things. So, to place before you how important Tabligh is in the eyes of the Holy Prophet (Sallallaho alaihe wasallam), and what serious conse- quences follow from its neglect, I give below a few sayings of the Holy Prophet (Sallallaho alaihe wasallam): It is reported by Abu Sa'eed Khudri (Radhiyallaho anho) that the Holy Prophet (Sallallaho alaihe wasal- lam) said: \"Whoever sees a forbidden thing being done, he must prevent it by the use of his hand; and if he has no power for this action, then he should pre- vent it with his tongue; and if he cannot do this even, then he should at least consider it a vice in his heart, and this is a very low level of one's faith.\" In another hadith, it has been said that if a person can prevent evil with his tongue then he should so pre- vent it; otherwise, he should at least think it evil in his heart and thus stand exonerated. Another hadith says that if anyone hates sin within his heart, he is a true believer, but this is the weakest form of faith. This topic has occurred in many other sayings of the Prophet. Now think well how many Muslims there are who act upon this hadith in a practical way. How many of us prevent evil forcibly, how many with the tongue, and how many seriously hate it within our 15 I Virtues of Tabligh I heart? We have to take stock of ourselves on these issues. fl I.& SI~I; &I +j& 9 &I & J6 &; ~ & J I 9 (y) I +dl L a &, 0 > * e * , J! w, b$i e + jG * & J. a 9 2 ,& ,#i * . . @,, 0: 3 & &j\\ $ I;\\ , , .- (+b$Ij 6,WI 0Ij,) 19, 1s GJji 3 ljkl It has been reported by Nu'maan bin Basheer (Radhiyallaho anho) that the Holy Prophet (Sallallaho alaihe wasallam) said: \"There are people who do not transgress the limits (laws) of Allah, and there are others who do so. They are like two groups who boarded a ship; one of them settled on the upper deck. and the other, on the lower deck of the ship. So, when the people of the lower deck needed water, they said: 'Why should we cause trouble to the people of the upper deck when we can easily have plenty of water by making a hole in our deck.' Now if the people of the upper deck do not prevent this group from such fool- ishness, all of them will perish - but if they stop them then they all will be saved.\" (Bukhari & Tirmizi) Once the Companions of the Ffoly Prophet (Sallallaho alaihe wasal!am) asked him: \"0 Messenger of Allah! (Sal- lallaho alaihe wasgllam) can we people be destroyed even when there are certain pious God-fearing persons among us?\" He answered: \"Yes, when evil deeds predominate in a society.\" Nowadays the Muslims are generally anxious about the decline and fall of this Ummah, and they suggest certain plans to stop this decline, but they ]:ever consider as to what is the main cause of our decline. They fail to identify the true reason of our spiritual and rcoral decline. particu- larly when the proper remedy has been told by Allah and :he Holy Prophet (Sallallaho alaihe wasallam). It is a pity that because of the wrong diagnos~s, incorrect remedies, in- cluding continued neglect of Tabligh, are leading to the fur- ther decline of the Ummah. In fact, the main cause of our decline is that rye do not pay attention to Tabligh nor do we help those who devote themselves to this sacred mis- sion. 2 2 *Al pj~ j3 * D J>, JG Jd ?+ . ~ (y) i\\ . + pb ti; jll J! ILI; J# 3 3 1 $3, j$ zi $1 j! &\\ -, - *, A\\$ - , - 215 I ik~a*j.9 > , ,- *I ha * * * $; 3 JG &; && 49 41 4 2 a,; 19 i&j, G2, :>% A\\, a JG 9 j&~ 4) ;I! $,;! 2 j? 1;Pj. ;& sl 2 i>*~, +&\\ & 2 :xu, **, $ is,, ~~9~ r.. 0 .. (++$ 4 IX GL,J!, >,I> 3i OI,,~ 131 It has been reported by Ibn Mas'ood (Radhiyallaho anha) that the Holy Prophet (Sallallaho alaihe wasal- lam) said: \"The decline and fall of Bani Israa-eel started thus: when the pious among them saw certain sins being committed by the transgressors, they for- bade them from doing the same; but when the sinners did not repent, the pious because of their relationship and friendship continued to mix with them. So, when this state of affairs began to prevail, Allah caused their hearts to be accursed in the same manner.\" (i.e. the hearts were also affected with the disobedience of the transgressors). Then in support of this, the Holy Prophet (Sallallaho alaihe wasallam) recited a verse of the Holy Qur'an, which says: 'The disobedient and the transgressors among the Bani Israa-eel were accursed by Allah.' On this, the Holy Prophet (Sallallaho alaihe wasallam) emphatically instructed his Companions: \"(To avoid such decline) you people must enjoin upon others to do good deeds and prevent them from doing forbidden things: you should restrain every tyrant from tyranny and invite him towards truth and justice.\" Another hadith says that the Holy Prophet (Sallallaho alaihe wasallam) was reclining comfortably when, sud- denly overcome with emotion, he sat up and said: \"I swear by Allah that you people cannot attain salvation, unless you prevent the tyrants from tyranny.\" Another hadith says that the Holy Prophet (Sallallaho alaihe wasallam) said: \"You people must preach truth, and prevent the sinners from doing forbidden things, and check the tyrants, to bring them towards the right path, otherwise you will be accursed and your hearts will be corrupted, just 16 Virtues of Tabligh as Allah did with Bani Israa-eel.\" The Holy Prophet (Sallal- laho alaihe wasallam) read certain relevant verses of the Holy Qur'an to emphasize this subject. Bani Israa-eel were condemned because among other things, they did not pre- vent others from doing forbidden things. Nowadays it is considered a virtue to be at peace with all, and to please everyone on every occasion. They say it is a requirement of good manners with the evildoers. Obviously, this is a wrong policy, because at most there may be some religious sanction for keeping quiet in extreme case, but never for falling in line with the tyrants and transgressors. At the very least, every one must instruct those people to do good whom he easily can influence for instance: his subordinates, his servants, his wife, his chil- dren, and his relations. In such circumstances, to be abso- lutely silent about Tabligh is unpardonable before Allah. Hadhrat Sufyaan Thowri says: \"Whoever is very popu- lar with his relations and neighbours, we suspect him to be cotnpromising in preaching the true teachings of religion.\" Numerous traditions say that when a sin is committed secretly, its harm is generally limited to the sinner only; but when a sin is committed openly, and those possessing the capability do not prevent it, then it ultimately affects all the people around. Now everyone can see for himself, how many sins are committed before him every day, and he, in spite of having the power to prevent them neglects to do so. And it is a pity that, if anyone gets up to put the wrong down, the ig- norant and shameless people oppose him instead of co-op- erating with him. Those who do wrong will come to know by what a great reverse they will be overturned. - * a * . I 9 8 Y! dj&3j & I,& $&!+ * * dl ,& &j~.& 9 2 .L.>L \" . ' * ?,+, dl,+Yl, d k d~ 4. 25 >,I> y! 03,) 1 j . 1 ~ d, @ , - h gbi (*)I 4 1s Hadhrat Jareer bin Abdullah (Radhiyallaho anho) says, \"I heard the Messenger of Allah (Sallallaho alaihe wa- 17 my friends who desire the improvement of Islam and the Muslims! now you have clearly seen the causes of our decline. Not to speak of strangers, we generally do not prevent even our own family and our subordinates from wrong-doing. We do not even make up our minds to pre- vent evil, much less doing something practical about it. Whatever our own son does against the Commandments of Allah, we do not check him even; but if he takes some in- terest in politics, or mixes up in a certain political party, we are seriously anxious not only about him, but about our own safety and honour. Then we warn him and also think about some plans to be safe and secure from any harm; but on the other hand, when he transgresses against Allah's Commandments, we are never anxious about the life in the Hereafter, and about the Reckoning of the Day of Judge- ment. Sometimes you know full well that your son is ad- :5 dicted to some idle pursuits and is very lax in his prayers, 9 2 but you have no courage to prevent him from such habits. .k + p or to chastise him, although Allah has clearly commanded you to be severe in uprooting such evils and even sever re- lations with the transgressor. There is many a father who would be angry with his son, because he is lazy and does not attend to his studies or services or business properly, but is there anyone who is angry with his son, because he does not perform the fundamental observances of Islam? As a matter of fact, the adverse effect of this negligence is not limited to the great loss in the Hereafter but it is a pity this evidently extends to our worldly affairs and inter- ests also, which are so dear to us. This blindness of ours is horrible, for Allah says: \"Whoever is blind in this world, he will be surely blind in the Hereafter.\" And such transgressors have taken leave of their senses because .*! j A &k ~ , ~ 4 , ~ , w + j ~ ; > , ~ & , & ~ ( V ' i+\") 18 Virtues of Tabligh \"Allah has sealed up their hearts, and on their ears and eyes there are veils (so they neither hear nor see the truth).\" It has been reported by Hadhrat Anas (Radhiyal- laho anho) that the Holy Prophet (Sallallaho alaihe wa- sallam) said: \"So long as a person says \"La ilaaha illallaah\" (no one is worthy of worship but Allah), he receives spiritual benefits, and is saved from miseries and calamities, unless he neglects its rights.\" His Com- panions said: \"0 Messenger of Allah (Sallaho alaihe wasallam)! how are its rights neglected?\" He answered: \"When sins are committed openly, and the person who recites the kalimah does not prevent the sinners from wrongdoings. \" (Targheeb) Now you can yourself cohsider how very often sins are committed during these times, yet there is no serious at- tempt to check or prevent them. In such a dangerous and ungodly atmosphere, the very existence of the Muslims in the world is a great blessing of Allah, otherwise we are in- viting ruination through all possible means. Hadhrat Aa- ishah (Radhiyallaho anha) asked the Holy Prophet (Sallal- laho alaihe wasallam), \"When the punishment of Allah be- falls the inhabitants of any locality, does it affect the pious, just as it affects the guilty?\" The Holy Prophet (Sallallaho alaihe wasallam) answered: \"Yes, it does affect all of them in this world, but at the Resurrection the pious will be sep- arated from the guilty.\" Therefore, those people who are simply satisfied with their own piety, and do not partici- pate in improving others should not rest assured that they are safe from the punishment of the Almighty. If any chas- tisement is inflicted by Allah, they too will be involved in it. i 19 Mus- lims! Allah has commanded you to call people to good deeds, and prevent them from committing sins; otherwise a time will come when you will pray to Him, but He will not listen to you; you will ask your needs of Him, but He will not grant them; you will demand His help against your ene- mies, but He will not help you.\" After saying this, he came 2, 'a Ol down from the pulpit.\" Particularly those persons should consider this hadith .= g 1 well whq want to fight the enemies of Islam, but neglect the performance of the requisites of Islam; they forget that the strength and stability of the Muslim Nation depends upon the propagation of Islam. Hadhrat Abu Darda (Rad- hiyallaho anho), who is a distinguished Companion of the Holy Prophet (Sallallaho alaihe wasallam) says: \"You must command people to do good, and restrain them from evil; otherwise Allah will cause such a tyrant to rule over you, who will not respect your elders, and will not have mercy on your youngsters. Then you people will pray to Him, but He will not accept your prayer; you will ask Him for help, but He will not help you, you will seek His pardon but He will not pardon you; for Allah Himself says: \"0 Believers! if you help Allah, then will He help you, and will make your feet firm (against your ene- mies). \" Says Allah in another verse: 20 Virtues of Tabligh 1 48 people believe your Prophet (Sallallaho alaihe wasallam) I and his teachings to be true and educative, then why do you take those things as useful that are declared harmful by I him. He says such and such thing will aggravate your dis- ease, but you think they will bring health to you. The Holy \"0 Believers! If Allah helps you, then no one can Prophet (Sallallaho alaihe wasallam) said: overpower you; and if He does not help you, then who can come to your help? and only in Allah should the Believers trust.\" It has been reported by Hadhrat Huzaifah (Rad- hiyallaho anho) that the Holy Prophet (Sallallaho alaihe wasallam) said on oath: \"You must command people to do good deeds, and prevent them from doing forbidden things; other- wise Allah will inflict a severe punishment upon you, and then even your prayers will not be accepted by Him.\" Here my respected readers should consider well how many times they violate the commandments of Allah; then they will know why their attempts to reform the nation fail, and why their prayers are of no avail, and they instead of sowing the seeds of progress, cause its decline. It has been reported by Abu Hurairah (Radhiyal- laho anho) that the Holy Prophet (Sallallaho alaihe wa- sallam) said, \"When my followers will begin to adore the worldly benefits, their hearts will be deprived of the dignity and love of Islam; and when they stop the preaching of truth, and preventing transgression, they will be deprived of the blessings of the Revelation; and when they will abuse each other, they will fall from the esteem of Allah.\" (Tirmazi) The well-wishers of the nation should ponder why their efforts result in failure instead of success. If vou \"None of you can be a true Muslim, unless his de- sires are subject to the religion that I have brought.\" But contrary to this, you think that religion is an obstacle in the way of your individual and national progress on the lines of other nations. Says Allah in the Holy Qur'an: \"Whoever desires the harvest of the Hereafter, We ant increase in his harvest; and whoever desires the Exvest of this world we give him the fruit thereof but there is no portion for him in the Hereafter.\" 3 s A hadith of this meaning says: .- I{ F P - \"The heart of a Muslim whose object is the life Here- after does not care for the worldly pleasures, yet the world is brought to his feet; on the other hand, who- ever goes after the world, he is overpowered by mise- ries and calamities, yet he cannot receive more than his allotted portion.\" The Holy Prophet (Sallallaho alaihe wasallam) read the above-mentioned verse, and said: Allah says: \"0 son of man! devote yourself to My worship, and I will free your bosom from the worldly anxieties and will remove your poverty, otherwise I will fill your heart with a thousand I worries and will not remove your poverty.\" These are the words of Allah and the Holy Prophet (Sallallaho alaihe wasallam), but you foolishly think that religion and the teachings of Mullahs (religious divines) are a hindrance in the path of your (worldly) progress. Don't you think that your worldly progress can be very helpful to the Mullahs, for then you would be in a better position to serve them. Then why should they oppose you, to their own loss? As a matter of fact, they are sacrificing their own worldly interests by speaking the truth, by preaching Islam. Virtues of Tabligh in order to bring you to the Right Path. When whatever your religion scholars tell you is in fact based on the teach- ings of the Holy Qur'an, then is it sensible for you to turn away from them? And if you deny them, then can you be a true believer? Your religious preachers might have some personal faults but, so long as they are conveying to you the commandments of Allah from the Holy Qur'an and the sayings of the Holy Prophet, (Sallallaho alaihe wasallam) you are bound to listen to them and to obey their instruc- tions; and if you don't obey them, you have yourself to answer for your disobedience to Allah. Not even a fool would say that the official orders should not be obeyed, simply because they were communicated by a lowly ser- vant. Never make such a sweeping statement that those who have devoted themselves to the sacred cause of Islam hanker after worldly gains and interest. True preachers of Islam are never selfish, and never ask anything for them- selves; the more they worship Allah, (and devote them- selves to the work of religion) the less attention they pay to worldly offerings. Nevertheless, if they ask help of you, it will be entirely for the sake of religion (to preach Islam and the Holy Qur'an); and therein they find more satisfaction than in any personal cause. Then why should you hestitate to help them? A question is generally raised stating that Islam does not prescribe giving up of worldly interests and in this con- nection the verses of the Holy Qur'an are often misunder- stood, for instance, there is a verse that says: \"Our Lord! grant us good in this world, and good in the Hereafter; and save us from the chastisement of the Fire (of Hell).\" (Al-Baqarah: 210) Some ignorant people stress that in this verse the worldly good is favoured and appreciated by Islam, as much as the good in the Hereafter. In other words, there is no renunciation of the world in Islam. Such people claim to be perfect scholars after having seen only some transla- tions of the Holy Qur'an. The true meanings of the Holy Qur'an can be properly understood by those only who have looked deep into its verses and are well-informed on this subject. Different interpretations of the above-mentioned 3 verse that have been explained by the Companions of the Holy Prophet (Sallallaho alaihe wasallam) and the scholars of Islam are as follows: Hadhrat Qatadah (Radhiyallaho anho) says: \"By 'good in this world' is meant peaceful existence and necess- ary livelihood\". Hadhrat Ali (Karramallahu wajhahu) says that by 'good in this world' is meant a pious wife. Hadhrat Hasan Basri (Rahmatullah alaih) says that by 'good in this world' is meant knowledge of Islam and prayer'. Hadhrat Suddi (Rahmatullah alaih) says that by 'good in this world' is meant lawful earnings. Hadhrat Ibn Umar (Radhiyallaho anho) says that by 'good in this world' is meant righteous children and goodwill of other human beings. Hadhrat Ja'far (Radhiyallaho anho) says that by %= \"good in this world\" is meant good health, honest g s living, knowledge of the Holy Qur'an, victory over the enemies of Islam, and the company of the pious.\" f I would add that if \"good in this world\" meant our ma- terial progress, even then the emphasis in the verse is on praying to Allah for such a \"good\" but not on completely busying ourself in this pursuit. Asking from Allah, even if it be the mending of a shoe is in itself a part of religion. Ue- sides, if it means honest living, or to be prosperous and self-sufficient, that too is not forbidden in Islam; by all means make your living in this world consistent with relig- ion. The point is that our endeavours in the cause of relig- ion should at least be as much as those for worldly gains, if not more, because Islam teaches us to value both this lift: and the Hereafter. Please consider also the following verses of the Holv Qur'an, which lay more stress and importance on the lift: Hereafter: \"Whoever desires the harvest of the life Hereafter. We will certainly increase his harvest. 24 25 Virtues of Tabligh Whoever desires this present world (and its ben- efits), We shall soon grant him whatever he desires: then We will make Hell his destination, wherein he will be thrown headlong, with disgrace. And whoever desires the Hereafter, and makes an effort to attain it. and he is a true believer-those are the people whose efforts will be rewarded.\" (Bani Isra-eel: 18-19) \"And amongst you are those who desire this world only; and amongst you are those who desire the life Hereafter.\" (Aali Imraan: 152) \"These are the benefits of the life of this world: but with Allah is a very good abode.\" (Aali Imraan: 14) \"(0 Prophet! Sallallaho alaihe wasallam) say: \"The benefit of this world is very little; but the life Hereafter is much better for those who fear Allah.\" (An-Nisaa: 77) \"The life of this world is nothing but a game and sport, and the House of the Hereafter is much better for the pious.\" (Al-An'aam: 32) I ) \"You people desire the benefits of this present world only, but Allah desires the Hereafter (for you).\" (Al-Anfaal-67) Are you pleased with the worldly life instead of the Hereafter? But the benefits of the life of this world are as nothing, when compared to the Hereafter.\" (At-Towbah-38) \"Whoever desires the life of this world, and all its adornments, we make their attempts therein fruitful, and nothing is decreased' from their due. For them there is nothing but Fire in the Hereafter, whatever they performed (of some good deeds) in the world has been destroyed, for whatever they did was absolutely false.\" (Hud- 16) \"And they have become pleased with the worldly life only; but the worldly life, when compared to the Here- after, is but a small benefit.\" (Ar-Ra'd-26) 26 Virtues of Tabligh 7 \"On them fell the wrath of Allah, and for them is a \"Those who do wrong will come to know by what a great chastisement. It is because they preferred the life (great) reverse they will be overturned.\" I of this world to the Hereafter.\" I Some sayings of the Holy Prophet (Sallallaho alaihe (An-Nahl-107) wasallam) indicate that there will come a time when every- There are many other verses in which the life of this world and the Hereafter have been compared. I cannot mention all of them, but I have quoted a few of them as ex- amples. Basically, the moral of all the verses is that those who prefer this world to the Hereafter will be losers in the long run. If you cannot properly deal with both the worlds, then the life Hereafter is preferable, and you should fulfil its requirements. I admit that this world and the requisites of the life here are unavoidable needs, yet note that no sen- sible person would keep sitting in the toilet, even though one is compelled to visit the toilet. If we carefully study the Shariat, we will have to admit that it has prescribed a proper place for our worldly activi- ties and religious duties. We have been commanded to devote one half of our time to the prayers, and we may spend the rest of our time in our worldly pursuits, whether we devote it to rest or to earning our living. According to this plan, we can maintain a balance between the two, and can carry out our duties about our religion as well as about our worldly 'life. So, if we devote ourselves wholly or mainly to the worldly requirements, then we are unjust and negligent. The sense of justice requires that we should be faithful to both, that is, to the requisites of life as well as to the hereafter, so that both are catered for because Islam does not advocate withdrawal from this world. This is what is meant by the verse: \"0 Lord! give us good in this world and in the Here- after, and save us from the Fire (of Hell).\" (Al-Baqarah: 201) In this chapter, my real object was to quote the sayings of the Holy Prophet (Sallallaho alaihe wasallam) about the Tabligh work. And the seven that I have quoted above are sufficient for true believers; as for the disbelievers. Allah says: one will follow his own wishes and temptations, and no one will pay heed to the teachings of religion or to the com- mandments of Allah. In those times, the Holy Prophet (Sal- lallaho alaihe wasallam) has advised us to mind our own business and to worship Allah, rather than deliver sermons to the people. But the divines of the nation say that such a period has not yet come; therefore, try your best to reform yourself and to instruct others, before such a time comes. We must avoid those shortcomings pointed out by the Holy Prophet (Sallallaho alaihe wasallam) above as these are the doors through which will occur corruption in our personal life as well as in the society. The Prophet (Sallallaho alaihe wasallam) has counted these shortcomings among the causes of our destruction. * *I$, * I 3. 011 \"0 Allah! save us from the trials of evil, whether it be ex- ternal or internal.\" 29 CHAPTER 3 I PRACTISE WHAT YOU PREACH I In this chapter it is intended to draw attention to a sig- nificant shortcoming. Just as most educated Muslims and scholars of the day have neglected the duty of Tabligh work, similarly there are those who preach Islam to others through speech and by writings, but they neglect practising what they say. In fact they, as preachers, should attend to reforming themselves more than to reform others. The Holy Prophet (Sallallaho alaihe wasallam) has strictly forbidden such persons to preach who are themselves guilty of trans- I gression. The Holy Prophet (Sallallaho alaihe wasallam) on the night of Mi'raaj (ascension) saw a group of persons whose I lips were being clipped with fiery scissors. On asking who they were, Jibra-eel (Alayhis salaam) told him that these I persons were preachers from among your followers who did not act on what they preached. A hadith says: \"Some of the residents of Paradise will ask those in Hell: \"How are you people here, whereas we followed your preachings, and thereby we got into Paradise?\" They will answer: \"We did not practise ourselves what we preached to others.\" Another hadith says: \"The punishment of Allah will descend more speedily upon the wicked scholars than on the common sinners. They will be astonished to see this, and will say: \"Why is the punishment of Allah inflicted on us before the idolaters even?\" They will be answered thus: \"Those who transgressed in spite of having knowledge of religion are more guilty than those who had not this knowl- edge.\" The Muslim divines have written that the sermons of those who do not practise the religious observances themselves, cannot leave an impression on others. That is why the religious speeches, writings and the journals in this age fall flat on the listeners and the readers! I Says Allah in the Holy Qur'an: I ) How did you spend your period of life? (2) What use did you make of your youth? (3) How did you earn your wealth, and where did you spend it? (4) How far did you act upon your knowl- edge?\" Hadhrat Abu Darda (Radhiyallaho anho) is a distin- guished Comparlion of the Holy Prophet (Sallallaho alaihe wasallam). He says: \"The thing I fear most is the question that will be put to me on the Day of Judgement in the pres- ence of all the people: Did you act upon the knowledge that you possessed?\" A certain Companion of the Holy Prophet (Sallallaho alaihe wasallam) asked him: \"Who is the worst of all crea- tures?\" He answered: \"Don't ask me a question about bad things, but ask me a question about good things. The worst of all creatures are the wicked scholars. (i.e. those who do not practise what they say).\" Says the Holy Prophet (Sallallaho alaihe wasallam) in another hadith: \"Knowledge is of two kinds: one, which re- mains on the tongue only and does not affect the heart and so is in fact an accusation from Allah; and the other which penetrates into the heart and revives the spirit: that is indeed useful.\" What we mean to say is that a Muslim should not acquire only that knowledge which concerns the formal observances, but also the spiritual knowledge which would purify his heart and enlighten his brain; otherwise it would be a cause for questioning on the Day of judgement as to how far it was acted upon. Similar warn- ings are contained in several other ahaadith. Therefore I would solemnly request all the mission- aries and preachers to reform themselves outwardly and in- 30 Virtues of Tabligh wardly, and to practise themselves what they preach to others, otherwisemere preachment without practice cannot be accepted by Allah, as has been shown by various verses of the Holy Qur'an. as well as sayings of the Holy Prophet. I pray to Allah that He should enable me also to improve myself externally and internally and practise what I preach, for I entirely depend upon His favours to hide my deficiencies. 1 CHAPTER 4 I THE IMPORTANCE OF IKRAAM IN TABLIGH This chapter concerns another very important require- ment for Tabligh, which through a little carelessness of the preachers, can do harm instead of good. For instance, when trying to prevent someone from wrongdoing, or save him from a bad habit, you should advise him privately and not openly disgrace him in the eyes of others; a Muslim's dig- nity is a valuable asset; as explained in the following say- ings of the Holy Prophet (Sallallaho alaihe wasallam): It has been reported by Abu Hurairah (Radhiyallaho + anho) that the Holy Prophet (Sallallaho alaihe wasal- gs lam) said: \"Whoever conceals the sins of a Muslim, \"Zj Allah will conceal his sins in this world and in the g g Hereafter: and Allah helps His servant so long as he helps his brother Muslim.\" (Targheeb) It has been reported by Ibn Abbaas (Radhiyallaho anho) that the Holy Prophet (Sallallaho alaihe wasal- lam) said: \"Whoever conceals the wrong-doings of a brother Muslim. Allah will conceal his wrong-doings on the Day of Judgement, and whoever will publicise the wrong-doings of a brother Muslim, Allah will dis- close his wong-doings to the people, so much so that he will be disgraced sitting in his own house.\" (Targheeb) Similarly, there are many other traditions on this sub- ject, therefore, the preachers of Islam should always have a 33 3 2 Virtues of Tabligh great regard for conniving at faults and maintaining the dig- nity of brethren in Islam. Another hadith says: \"Whoever does not help his brother Muslim, when he is being dis- honoured, Allah will not pay heed to him when he himself is badly in need of help.\" Still another hadith says: \"The worst form of usury is dishonouring a Muslim.\" In numerous traditions like this, the dishonouring of a Muslim has been strictly forbidden; therefore, the mission- aries should be particularly cautious on this subject. The correct method is to advise people secretly on the sins that come to knowledge secretly: and take corrective measures openly on the sins that are committed openly. Even the advice should be given in such a manner that the transgres- sor is not dishonoured, lest the advice produces the oppo- site effect. In short, the transgressors must be checked strictly, according to the commandments of Allah, but let us not forget the instructions given above to respect the dignity of every Muslim. Moreover, a preacher must be polite and courteous when he addresses his audience: for ill temper and bitter words have just the opposite effect. A preacher spoke harshly to the Caliph Ma'moon ar-Rasheed. He said: \"Please be polite and courteous to me, for Fir'own was a worse fellow than me, and Moosa (Alayhis salaam) was a much better person than you, but when he and Haroon (Alayhis salaam) were sent to instruct Fir'own, Allah said: \"Speak to him in soft words, that he may turn to the Right Path, or perchance he may fear Me!\" (Taahaa-44) A youth (from the outlying regions) came to the Holy Prophet (Sallallaho alaihe wasallam), and said: \"Please permit me to commit adultery.\" The Companions of the Holy Prcphet (Sallallaho alaihe wasallam) took this very ill, and were enraged at his words; but the Holy Prophet (Sallallaho alaihe wasallam) said to him: \"Come nearer to me. Would you like anyone to commit adultery with your mother?\" He said: \"Not at all.\" The Holy Prophet (Sallal- laho alaihe wasallam) said: \"Then other people will also never tolerate such a shameful act with their mothers.\" Then the Holy Prophet (Sallallaho alaihe wasallam) asked him the same question about his sister. aunt etc., and he Allah! purify his heart, forgive his sins, and guard him against adultery.\" The reporters say that, after this, nothing was more hateful to him than adultery. To be brief, .the preachers should always be kind, polite and sympathetic towards their listeners, and should treat them as they would themselves like to be treated. 35 I CHAPTER 5 IMPORTANCE OF IKHLAAS (SINCERITY) IN TABLIGH I would particularly request the missionaries to base all their speeches, writings and actions on sincerity. Even a small good deed based on sincerity will be greatly re- warded by AlIah, whereas without sincerity it will fetch no reward in this world or in the Hereafter. Says the Holy Prophet (Sallallaho alaihe wasal- lam) in this context: \"Allah does not look towards your faces, or towards your riches; but He sees (the sincerity of) your hearts, and the nature of your deeds.\" (Mishkaat) On another occasion; the Holy Prophet (Sallallaho alaihe wasallam) was asked as to what is the meaning of 'Eemaan'. He answered: \"It means sincerity.\" (Targheeb) Hadhrat Mu'aaz (Radhiyallaho anho) was given com- mand in Yemen. When he was about to depart. he asked for advice from the Holy Prophet (Sallallaho alaihe wasallam). who said: \"Observe sincerity in all your religious beliefs and actions. for it will increase the reward of your good deeds.\" Another hadith says: \"Allah accepts only those deeds of His servants, which are based on complete sincer- ity to Him.\" (Mishkaat) P S 6 z a To be guilty of false worship here means that he does .= g not perform such good deeds sincerely to please Allah only, but by making a show of them he wants to win the favour and appreciation of human beings, which is to set up partners to Allah indirectly. Another hadith says with this meaning: Another hadith says: \"Allah has proclaimed: 'I am the most self-respecting and self-sufficient of all partners; therefore whoever brings forth a partner to Me in any 3 6 Virtues of Tabligh Certain categories of people will be called first of all for reckoning on the Day of Judgement. A martyr will be asked by Allah, \"Did I not bestow such and such favours on you?\" He will admit those boons and favours. Then Allah will ask him: \"How did you make use of My favours?\" He will answer: \"I went to the Holy War to please You, and was killed therein.\" Allah will say: \"You lie; you participated in the Holy War to be called a hero by people, and this has been done.\" Then he will be thrown headlong into the fire of Hell. Next, a scholar will be called and the same ques- tions will be put to him. In reply he will admit the favours of Allah. Then he will be asked: \"How did you make use of My favours?\" He will answer, \"I acquired knowledge of Islam and taught it to others, simply to please You.\" Allah will say: \"You lie; you attained knowledge in order to be called an aalim and recited the Holy Qur'an to be called a qaari.\" Then he too will be thrown headlong into the fire of Hell. Thereafter a rich man will be called, and the same questions will be put to him. He will say: \"I always spent money to please Thee.\" Allah will say: \"You lie; you spent money in order to be called a generous man, and this has been said.\" Then he will also be thrown headlong into the fire of Hell. (Mishkaat) Therefore, our preachers of Islam should always avoid show and vanity, and should render their services only to please Allah. They should follow the Sunnah of the Holy Prophet (Sallallaho alaihe wasallam), and should not desire to win fame, or favour and appreciation of people. If such a vain desire is suspected in their mind, they should seek the refuge of Allah, and should ask His pardon. May Allah grant us sincerity to serve His religion to the best of our ef- forts. CHAPTER 6 RESPECT FOR LEARNING AND THE LEARNED IN ISLAM In this chapter, I would make a few submissions to the Muslims in general that they may know how to respect the scholars and the preachers of Islam. Today it is usual to have unfounded misgivings and objections jigain>t.,Jhe preachers and the learned men of the nation. this is very harmful from the religious point of view. In every circle and every institution of the world, there are good as well as bad people; and if there are a few bad persons amongbthe scholars also, it is no wonder. Two important consider- ations are here noteworthy. Firstly. you should not form any definite opinion about the character of anyone, unless you have a solid proof about it. Says Allah in the Holy Qur'an: & ; , , , , j , , . . O 4 >. .M 1 = a a y gp \"And do not take practical steps regarding anything, about which you have no knowledge; for everyone will be questioned as to how he used his ears and eyes and the heart.\" And obviously it is unjust to reject the (good) advice of a preacher, simply because you have some unconfirmed doubts about him. The Jews translated their scriptures into Arabic, and used to read them out to the Muslims; but the Holy Prophet (Sallallaho alaihe wasallam) was so cautious about giving his decision on this subject that he said: \"0 Muslims! you should neither confirm what they say. nor reject them; rather you should say: 'Whatever Allah has revealed, we believe in all that.\"' In other words, he prohibited con- tradiction of even an unbeliever's narration without proper investigation. But contrary to this precept, we reject those instructions of preachers that are against our wishes, with- out any arguments on our part, and attack their reputation even when we know them to be righteous. CI 39 I 3 8 Virtues of Tabligh 49 the Learned Another thing that you must keep in mind is that even the righteous scholars and preachers of your nation are also human beings, and as such they too can have some weak- nesses. The responsibility of their good or bad deeds really rests on them and the final reckoning belongs to Allah: but I hope that by His mercy and immense generosity He will forgive them for after all they have been serving His Relig- ion and Faith at great personal sacrifice throughout their lives. In short, either to entertain doubts and objections against the religious preacher himself, or spread them amongst others, will take people away from religion and be the cause of geat distress for those who participate in such affairs. The Holy Prophet (Sallallaho alaihe wasallam) has said: \"Whoever respects the following three, he really pavs respect to Allah: (1) An aged Muslim, (2) One who teaches and preaches the Holy Qur'an without any excess, (3) And a ruler who is just to the people.\" (Targheeb) Also the following saying of the Holy Prophet (Sallal- iaho alaihe wasallam) tells us: \"He is not among my followers, who does not respect our elders, is not merciful to our youngsters, and does not pay due reverence to our scholars.\" \"Whoever belittles the following three persons is not a Muslim but a hypocrite: first, an aged Muslim: second, a scholar (of religion); and third, a just ruler.\" The Holv Prophet (Sallallaho alaihe wasallam) has also said: \"I fear particularly for three shortcomings in my fol- lowers. First, due to increasing worldly benefits and achievements. they will envy one another; second, dis- cussion of the Holy Qur'an will become so common that even the ignorant will claim that they know the meanings of the Holy Qur'an, although many meanings are such that cannot be understood by anyone except the well versed scholars of that Book, who say: \"We have a firm faith in it, and that it is from Allah\", so how much more careful should be the common people; third, the religious scholars will be neglected and will not be patronized properly.\" (Targheeb) Many similar traditions are found in the books of hadith. It has been mentioned in 'Fataawa Aalamgiri' that the sort of derogatory words that are generally used today by the ignorant people about the scholars of Islam ma3 se- riously damage their faith. Therefore, people must be care- ful to avoid such words. Suppose for a moment there are no true and sincere scholars of Islam in the world (and the majority consists of corrupt people), even then nothing is gained by branding them as evil scholars. Rather, it is the religious and moral duty of every Muslim to form such an Islamic society that would give birth to sincere servants of Islam. Only when such a body of persons is in existence we should rest content. Of course, there have always been some differences of opinion among the Muslim scholars, mostly about minor problems, for which they cannot be maligned. There is a hadith that says: \"The Holy Prophet (Sallallaho alaihe wa- sallam) gave his shoes to Abu Hurairah (Radhivallaho anho), and said: \"Take my shoes as a sign, and proclaim among the Muslims that whoever will say 'La ilaha illallah, Mohammadur Rasul-ullah' from the bottom of his heart, he will certainly enter Paradise.\" Hadhrat Umar (Radhiyallaho anho) met Abu Hurairah (Radhiyallaho anho) in the way and asked him where he was going. He told him the mess- age of the Holy Prophet (Sallallaho alaihe wasallam), yet Hadhrat Umar (Radhiyallaho anho) was annoyed. for he did not agree with such a proposition; therefore he hit the messenger in the chest, who fell back. Yet no one raised ob- jections against Hadhrat Umar (Radhivallaho anho), nor was any demonstration arranged against him because of this difference of opinion. Many differences of opinion existed among the Sahabah and later the four Imaams of Fiqh differed among themselves in numerous details. Virtues of Tabligh There have been many minor differences of opinion about prayers among the four Imaams; I myself know of about two hundred, but this does not mean that their fol- lowers should doubt the faith of one another, and call each other 'infidel'. The fact is that the common people are mostly unaware of the finer points on which various schol- ars differ in their views; these differences are a blessing in disguise. As a matter of fact, good preachers and sincere servants of Islam do not attach any importance to such tri- fling things, but continue their attempt to bring people to the Right Path. We know that doctors differ among them- selves and lawyers differ in their advice, nevertheless people continue to make use of their services. But those who are ignorant, selfish and lazy, they simply use their difference of views to raise objections against the religious scholars. Anyhow, it has been enjoined on every Muslim to listen to those scholars of the Holy Qur'an, whom he re- spects and knows to be the followers of the Sunnah, and should avoid reproaching those whom he does not like. Anyone who has no proper knowledge of Islam and the Holy Qur'an, has no right to raise objections against the scholars. The scholars of Islam should always keep this saying of the Holy Prophet (Sallallaho alaihe wasallam) in mind and act accordingly: \"It is to waste knowledge to ad- dress those who are not fit for it.\" In this corrupt age, when even the commandments of Allah- and the sayings of the Holy Prophet (Sallallaho alaihe wasallam) are being criticised, I have no reason to wonder if the sermons of Muslim scholars are not heard and the Qur'an not followed. Says Allah in the Holy Qur'an. \"And whoever transgresses the limits of Allah, surely these are the unjust.\" CHAPTER 7 KEEPING COMPANY WITH THE RIGHTEOUS DIVINES In this last chapter, which really completes the sixth one, I would remind the Muslims to follow the Sunnah of the Holy Prophet (Sallallaho alaihe wasalla'm), and to keep the company of those who devote themselves to Islam and remember Allah day and night, for this will make them steadfast in Islam. Even the Holy Prophet (Sallallaho alaihe wasallam) was commanded to keep such company; says the Holy Prophet (Sallallaho alaihe wasallam)-on this sub- ject: \"Shall I tell you a thing by which you can attain good C 0 8 9 in this world and the Hereafter? Remember, it is the gs company of those who remember and glorify Allah day S and night.\" (Mishkaat) Now it is up to you to search for and to recognize the true lovers of Allah and these are the followers of the Sunnah, for Allah has sent his beloved Prophet (Sallallaho alaihe wasallam) as a model for the guidance of the Mus- lims. Says Allah in the Holy Qur'an: 0 Prophet (Sallallaho alaihe wasallam)! say: \"If you people (really) love Allah, then follow me; so that Allah will love you, and will pardon your sins; and Allah is Forgiving, Merciful.\" Therefore, whoever follows the Holy Prophet (Sallal- laho alaihe wasallam) faithfully is nearer to Allah, and whoever does not follow him is far away from Allah and cannot win His favours. The commentators of the Holy 42 Virtues of Tabligh Qur'an have written that whoever claims to be a lover of Allah, but does not follow the Sunnah of the Holy Prophet (Sallallaho alaihe wasallam), he is a liar; for it is a requisite of love that everything associated with the beloved must be loved. A poet has quoted the words of the famous Qais- 'Aamir, the lover of Laila: \".Whenever I pass through the city of Laila, I love every door and wall of it. Really I do not love the city as a city, but rather love the people in it who are asso- ciated with Laila.\" Another poet says: \"You pretend to be a lover of Allah, and yet you do not obey His commandments! And I swear, in prac- tise this i strange. If you were a true lover, you would never di l obey Him, for a lover always follows the orders of his beloved.\" The Holy Prophet (Sallallaho alaihe wasallam) said: \"All my followers will enter Paradise, but not those who have denied me.\" The Companions said: \"Who would deny you?\" He said: \"Those who follow me would enter Paradise, but those who disobey me, they in fact deny me.\" In another hadith, the Prophet (Sallailaho alaihe wasallam) has said. \"No one of you can be a true Muslim unless his wishes are subordinate to that which I have brought, that is the Holy Qur'an.\" I (Mishkaat) I I One can hardly believe that those who claim to be well-wishers of Islam and the Muslims would disobey Allah and His Prophet. When we say that such and such thing is against the Sunnah, they feel very annoyed; then how can they be among the followers of the Holy Prophet (Sallallaho alaihe wasallam)? Sa'di (Rahmatullah alaih) has said: \"Whoever treads a path contrary to the Sunnah of the Holy Prophet (Sallallaho alaihe wasallam), he will never reach his destination.\" Therefore, whoever keeps the company of true lovers of Allah and followers of the Sunnah, in order to obtain spiritual benefits. he will certainly progress towards salva- tion. On this particular subject, please consider the follow- ing sayings of the Holy Prophet (Sallallaho alaihe wasal- lam): \"Whenever you people pass through the Gardens of Paradise, partake of their fruits.\" The Companions asked: \"What are the Gardens of Paradise?\" The Holy Prophet (Sallallaho alaihe wasallam) answered: \"The assemblies wherein knowledge of Islam and the Holy 2 Qur'an is taught.\" 8,\" The Holy Prophet (Sallallaho alaihe wasallam) $ ? also said: \"Luqmaan instructed his son in these words: \"Keep the company of scholars, and listen attentively to the words of the wise, for therewith Allah revives the dead hearts, just as He revives the dead earth with heavy rains; and the wise alone understand the relig- ion.\" A Companion asked the Holy Prophet (Sallallaho alaihe wasallam) \"Who can be the best companion for us?\" He answered: \"Such a person that, when you see him, you remember Allah; when you listen to him, your knowledge of Islam is increased; when you see his actions, you are reminded of the life Hereafter.\" (Targheeb) Again, \"The most devoted servants of Allah are such that, when you see them you remember Allah.\" Savs Allah in the Holy Qur'an: 44 Virtues of Tabligh \"0 those who believe! Fear Allah, and be with the truthful (faithful) people!\" The commentators have written that by 'truthful' are meant the mystics and the true lovers of Allah, for whoever attaches himself to them and listens to their sermons, he at- tains very high standards of spirituality. Sheikh Akbar has written: \"You cannot get rid of the evil wishes of yourself, though you may strive for it for your whole life unless your desires are subjected to the commandments of Allah and the Sunnah of the Holy Prophet (Sallallaho alaihe wasallam). So, when you find a true lovsr of Allah, serve him well and follow his instruc- tions as though you have no will of your own; obey him in all your spiritual, religious and personal problems, even those concerning your occupation, so that he may lead you to the right path and take you nearer to Allah.\" Says the Holy Prophet (Sallallaho alaihe wasal- lam) \"When a group of people remember Allah in a meeting, then the angels surround that gathering, Allah's mercy descends on them and Allah remembers them in the assembly of Angels.\" What honour can be greater for the believers than that Allah remembers and appreciates them? Says the Holy Prophet (Sallallaho alaihe wasallam): \"An angel is sent to those who re- member Allah sincerely, and he says 'Allah has for- given your past sins, and has converted your bad deeds into good ones'.\" In another hadith, the Holy Prophet (Sallallaho alaihe wasallam) says: \"Any assembly of Muslims, who do not remember Allah, (do not) send salutations to His Messenger (Sallallaho alaihe wasallam), will face disappointment on the Day of Judgement.\" There is a prayer of Hadhrat Dawood (Alayhis salaam) in the following words: \"0 Allah! if you see me neglecting the assembly of those who remember Thee, and attending the assembly of transgressors, then break my feet (that I may not be able to walk towards them).\" A poet has said, \"When I do not listen to Him and see His face, it is better to be deaf and blind.\" Hadhrat Abu Hurairah (Radhiyallaho anho) says: \"An assembly wherein Allah is remembered and glori- fied, shines for the heavenly creatures, just as the stars shine for the earthly creatures.\" Once, Hadhrat Abu Hurairah (Radhiyallaho anho) went to a bazaar and proclaimed to the people: \"0 brethren! You are sitting here, and the legacy of the Holy Prophet (Sallallaho alaihe wasallam) is being dis- tributed in the mosque.\" The people ran to the mosque, but as nothing material was being distributed there, they returned disappointed. Hadhrat Abu Hurai- rah (Radhiyallaho anho) asked them. \"After all what was being done there?\" They answered: \"A few people were reading the Holy Qur'an, and a few others were engaged in praising and glorifying Allah.\" He said: \"This is what we call the legacy of the Holy Prophet (Sallallaho alaihe wasallam).\" Imam Ghazali (Rahmatullah alaih) has mentioned many similar traditions. Even the Holy Prophet (Sallal- 'ij 3 -2' a laho alaihe wasallam) has been commanded by Allah: , = &d, +, Lj&> $,j& gj $+& $j, s g 3,; & >,,+ *,:, u$i > @ &, > *5, GjJ, & * s o , F J , , -j 4 fw ' >' , > e , , ( Y * &J\\) &) 091 is, L> \"0 Messenger! keep the company of those who pray to Allah every morning and evening, and they desire only His pleasure; and do not turn your eyes from them to the attractions and adornment of the worldly life: and do not follow him whose heart We have turned away from our remembrance, and who follows his desires, and (therefore) he has broken the limits (of true re!@- ion). \" Numerous traditions indicate that the Holy Prophet (Sallallaho alaihe wasallam) used to thank Allah for pro- ducing such pious people among his followers that he was commanded to keep their company. And in the same verse, the Holy Prophet (Sallallaho alaihe wasallam) has been commanded to avoid the company of those who are slaves of passion and tresspass the limits laid down by Allah. He has been instructed again and again not to follow their vain desires. 46 Virtues of Tabligh Now all those who blindly follow the ways of the un- godly and transgressing people of the non-believing nations should search their hearts and see how far they are true be- lievers. Their imitating the pagans and the Christian has taken them far away from the Right Path; \"0 ignorant desert dweller! I fear that you won't be able to reach the Kaaba; for the path that you tread leads to Turkistan.\" My object was to advise you on religious matters, and I have done my duty. Now I entrust you to Allah, and bid farewell. Even the prophets were commanded only to preach the truth. (Hafiz) Mohammad Zakariyya Madrasah Mazahir-ul-Ulum Saharanpur 5, Safar 1350 (21 June 1931) Virtues of Ramadan Revised translation of the Urdu book Faz’il-e-Ramadhaan by Sheikhul Hadith Maulana Muhammad Zakariyya translated by Yousuf Abdullah Karaan prepared by The Islamic Bulletin www.islamicbulletin.org HADITH<br><hr><br>Salmaan (RA) reports, \"On the last day of Sha-baan Rasulullah (SAW) addressed us and said, '0 people there comes over you now a great month, a most blessed month in which lies a night more greater in virtue than a thousand months. It is a month in which Allah has made Fasting compulsory by day. And has made sunnah the Taraaweeh by night. Whosoever intends drawing near to Allah by performing any virtuous deed, for such person shall be the reward like the one who had performed a fardh in any other time. And whoever performs a fardh, shall be blessed with the reward of seventy faraa-idh in any other time. This is indeed the month of patience, and the reward for true patience is Jannah (paradise). It is the month of sympathy with one's fellowmen. It is the month wherein a true believer's rizq is increased. Whosoever feeds another who fasted, in order to break the fast at sunset, for the feeder there shall be forgiveness of sins and emancipation from the fire of Jahannam (hell}, and for such feeder shall be the same reward as the one who Fasted (who he fed) without that persons reward being decreased in the least.\" Thereupon we said, \"0 messenger of Allah, not all of us possess the means whereby we can give a fasting person to break his fast.\" Rasulullah (SAW) replied, \"Allah grants the same reward to the one who gives a fasting person to break the fast a mere date, or a drink of water, or a sip of milk.\" \"This is a month, the first of which brings Allah's mercy, the middle of which brings His forgiveness and the last of which brings emancipation from the fire of Jahan-nam.\" \"Whosoever lessens the burden of his servants (bonds-men) in this month; Allah will forgive him and free him from the fire of Jahannam.\" \"And in this month four things you should continue to perform in great number, two of which shall be to please your Lord, while the other two shall be those without which you cannot do. Those which shall be to please your Lord, are that you should in great quantity bear witness that there is no deity to worship except Allah (i.e. recite the Kalimah Tayyibah Laa llaaha illallaah) and make much Istighfaar beg Allah's forgiveness with Astagirfirul-laah).\" And as for those without which you cannot do, you should beg of Allah, entrance into paradise and ask refuge in Him from Jahannam.\" \"And whoever gave a person who fasted water to drink, Allah shall grant that giver to drink from my fountain, such a drink where after that person shall never again feel thirsty until he enters Jannah.\" Reported by ibn Khuzaimah in his 'Saheeh. COMMENTARY All the points which this Hadith draws attention have been further emphasized in numerous other Ahaadith on the great virtues of Ramadan. Quite a number of important points are brought to our notice. Firstly, it should be noted that Rasulullah (SAW) delivered this sermon at the end of the month of Sha-baan the obvious reason being that he intended to put into our minds the great importance of Ramadan so that we could remember and not allow one second of this month to go by without giving it the full importance it deserves. Thereafter attention is drawn to Laylatul Qadr, about which more is said later. Then attention is drawn to the fact that fasting has been made compulsory by Allah who also made Sunnah the Taraaweeh 'salaah by night. From this Hadith it is noted that the command for Taraaweeh prayers too comes from Allah Himself. Besides this in all the Ahaadith wherein Rasulullah (SAW) says, I have made it sunnah\", is mainly to emphasize its importance. All the authorities of the Ahlus Sunnah wal Jamaa'ah are agreed upon the fact that Taraaweeh is Sunnah. (Bur-haan mentions that only the Rawaafidh deny this.) Maulana Shaah Abdulhaq Dehlawi wrote in his book: \"Maa Thabata Bis sunnah\" that should the people of any town fail to perform Taraaweeh prayers, the Muslim ruler should make them do so by force. HADITH<br><hr><br>Abu Hurayrah relates that Rasulullah (SAW) said, \"My Ummah was given five things for Ramadan which was not given to anyone except them. For them, the smell from the mouth of a fasting person is more sweeter to Allah than the fragrant smell of musk. On their behalf the fish in the sea seek forgiveness for the fasting persons until they break their fast. Allah prepares and decorates a special garden in Jannah everyday and then says (to it), \"The time is near when faithful servants shall cast aside the great trials of the world and come to you\". In this month (for them) evil-minded Shaytaan is chained so as not to reach unto those evils to which they normally reach during other months besides Ramadan. On the last night of Ramadan they are forgiven\". The Sahaabah R.A. thereupon enquired, \"0 Messenger of Allah, is that last night Laylatul Qadr? Rasulullah (SAW) replied, \"No. But it is only right that a servant should be given his reward on having completed his service\". Reported by Ahmad, Bazzaar and Bayhaqi HADITH</p></div>",
+        "sections": [
+            [
+                30,
+                16799
+            ],
+            [
+                16799,
+                33242
+            ],
+            [
+                33242,
+                49682
+            ],
+            [
+                49682,
+                66292
+            ],
+            [
+                66292,
+                72630
+            ]
+        ]
+    },
+    {
+        "id": 41,
+        "bookId": 6,
+        "chapter": "Lailatul Qadr",
+        "title": "Content for Lailatul Qadr",
+        "preview": "Kaab bin Ujra relates, \"Rasulullah (SAW) said, \"Come near to the mimbar\". And we came near to the mimbar. When he ascended the First step of the mimba...",
+        "content": "<div class=\"story-content\"><p>Kaab bin Ujra relates, \"Rasulullah (SAW) said, \"Come near to the mimbar\". And we came near to the mimbar. When he ascended the First step of the mimbar he said \"Aameen\". When he ascended the second step of the mimbar he said, \"Aameen\". When he ascended the third step he said, \"Aameen\". When he descended we said, \"0 Rasul of Allah, we have heard from you today something which we never heard before\". He said, When I ascended the first step) Jibra-eel A.S. appeared before me and said, \"Woe to him who found the blessed month of Ramadan and let it pass by without gaining forgiveness\", upon that I said, \"Aameen\". When I ascended the second step, he said \"Woe to him before whom thy name is mentioned and then does not read Durood (salaat alan Nabi) on you\". I replied \"Aameen\". When I ascended the third step he said, \"Woe unto the person in whose presence both parents or one of them attain old age, and (through failure to serve them) is not allowed to enter Jannah\" I said \"Aameen\". Reported by Haakim. HADITH<br><hr><br>Ubaadah bin Saamit ( Radhiallaahu Ánhu ) reports that Rasulullah ( Sallallaahu Álayhi Wasallam ) said one day when Ramadan had drawn near; \"The month of Ramadan, the month of blessings has come to you, wherein Allah turns towards you and sends down to you His special Mercy, forgives your faults, accepts prayers, appreciates your competition for the greatest, good and boasts to the angels about you. So, show to Allah your righteousness; for verily, the most pitiable and unfortunate one is he who is deprived of Allah's Mercy in this month. COMMENTARY In this Hadith, we read about the spirit of competition among the believers, each one trying to do more good deeds than the other. In our own home, I am greatly pleased on seeing how even the womenfolk vie with each other, the one trying to recite more of the Qur’an than the others, so that, in spite of domestic responsibilities, fifteen to twenty 'juz' (Parts) of the Qur’an are read by each one daily. I mention this only out of a sense of gratitude to Allah, mentioning His favor, and not to boast of it. May Allah accept their deeds and ours, and increase us all in good deeds. HADITH<br><hr><br>Abu Saeed Khudri (Radhiallaahu anhu) relates that Rasulullah (Sallallaahu alaihi wasallam) said: \"During each day and night of Ramadan, Allah sets free a great number of souls from Hell. And for every Muslim, during each day and night, at least one prayer is certainly accepted.\" COMMENTARY Apart from this Hadith, there are many others stating that the 'Du'aa' of a fasting person is accepted (Mustajaab). In one Hadith, we read that the 'Du’aa’ is accepted at the time of 'Iftaar', but we are generally so absorbed in eating that we neglect this opportunity. The well-known 'Du’aa' at 'Iftaar' is: \"O Allah for You have I fasted, in You do I believe, and on You do I rely, and now I break this fast with food coming from you.\" Abdullah bin Amr (Radhiallaahu anhu) used to make the following 'Du’aa' at 'Iftaar': O Allah I beg You, through Your infinite Mercy, which surrounds all things, to forgive me.' In some books we read that Rasulullah (Sallallaahu Alayhi Wasallam) used to say: \"O You who are Great in Bounties, forgive me.\" Many other prayers have been indicated for 'Iftaar', but no special 'Dua' is fixed. This time (at Iftaar) is one when 'Du’aa' is accepted; submit before Allah all your needs (and, if you remember, then make \"Du'aa' for me too.) HADITH</p></div>"
+    },
+    {
+        "id": 42,
+        "bookId": 6,
+        "chapter": "I'tikaf",
+        "title": "Content for I'tikaf",
+        "preview": "Abu Hurayrah (Radhiallaahu anhu) reports: Rasulullah (Sallallaahu alaihi wasallam) said: \"There are three people whose \"Du'aa\" is not rejected; the fa...",
+        "content": "<div class=\"story-content\"><p>Abu Hurayrah (Radhiallaahu anhu) reports: Rasulullah (Sallallaahu alaihi wasallam) said: \"There are three people whose \"Du'aa\" is not rejected; the fasting person until he breaks the fast, the just ruler, and the oppressed person, whose 'Dua' Allah lifts above the clouds and opens unto it the doors of heaven, and Allah says: \"I swear by My honor, verily I shall assist you, even though it may be after some time.\" COMMENTARY In 'Durr Manthur' it is reported from Aa'isha (Radhiallaahu anha) that, when Ramadan appeared, the color of Rasulullah's face used to change. He then used to increase his \"Salaat\", become even more humble in his \"Duaas\" and exhibit even more fear of Allah. According to another report, he hardly ever lay down in bed until Ramadan came to an end. Further, it is stated that the angels carrying the Throne are commanded in Ramadan to leave aside everything else and recite \"Aameen\" to the \"Duaas\" of those who fast. Numerous are the Ahaadith stating that the fasting person's 'Duaas' are answered. When Allah has so promised. and his truthful 'Nabi' (Sallallaahu alaihi wasallam) has informed us, there should be no doubt whatsoever about the truth of these reports. Yet it is strange that, in spite of this, we still find such people who apparently do not get what they pray for. They ask and do not receive; but this does not mean that their prayers have been rejected. One should at this point understand the significance of a 'Dua' being answered. Rasulullah (Sallallaahu alaihi wasallam) has informed us that, when a Muslim prays for anything from Allah, on the condition that he does not pray for breaking off from his near of kin or for anything sinful, he definitely receives one out of the following three things: he gets the exact thing which he asked. If that is not received, then Allah either removes from his path some great calamity in exchange for what he desired, or the reward for that thing for which he prayed is stored for him in the Hereafter. Another Hadith states that on the day of \"Qiyaamah\", Allah will call his servant, and say to him: \"O my servant, I used to command you to ask of Me and promised to answer. Did you beg of Me? The servant will answer: \"Yes I did.\" Then Allah shall reply: \"You did not put forth any prayer which has not been accepted. You prayed that a certain calamity should be removed, which I did for you in the worldly life. You prayed that a certain sorrow should be cast off you, but result of that prayer was not known to you. For that, I fixed for you such and such a reward in the Hereafter. Rasulullah (Sallallaahu alaihi wasallam) says that the man shall again be reminded of each and every prayer and he shall be shown how it had been fulfilled in the world or else what reward had been stored for him in the Hereafter. On seeing that reward, he shall wish that not a single prayer of his had been answered on Earth, so that he could receive the full reward only in the Hereafter. Yes, prayer is indeed very important, and to neglect it at any time is a matter of great loss. Even when the outward signs seem to indicate that our prayer is not answered, hope should not be lost. Even from the lengthy Hadith at the end of this booklet, it is clear that Allah in answering prayers considers first of all our own good and welfare. Should Allah find that granting us what we beseech from Him is in our welfare and interest, He grants it, otherwise not. Actually it is Allah's favor on us that we do not always get what we ask for because very often, due to our lack of understanding, we beg for things that are not beneficial at a particular time. Here I must draw your attention to the fact that men as well as women suffer from a bad habit of cursing their children in their anger and affliction. Beware of this. As preordained by Allah, there are certain occasions when whatever prayer be made is immediately answered. So sometimes, due to our own stupidity, the child is cursed and when the effect of that same curse comes upon the child and lands him into a calamity, the parents go about crying and wailing. Rasulullah (Sallallaahu alaihi wasallam) commanded us not to curse ourselves, our children, possessions, or servants. It is just possible that the curse is uttered at a time when all requests are granted, especially in Ramadan, which is replete with such special \"Mustajaab\" (accepted) moments. Hence, in this month, great care should be taken. Ibn Masood (Radhi Allaho anhu) reports that on every night of Ramadan, a crier from the heavens calls out: \"O you seeker of good, come near; O You seeker of evil, turn away (from evil) and open your eyes.\" Thereafter that angel calls out: \"Is there any seeker of forgiveness, that he may be forgiven? Is there anyone with a prayer, that his prayer may be heard? Is there anyone wanting anything, so that his wish may be fulfilled?\" Lastly, it should be borne in mind that there are certain conditions under which prayers are accepted; in the absence of these, prayers may be often rejected. Among these is the use of 'Halaal' food: When 'Haraam' is consumed, the prayers are not accepted. Rasulullah said: \"Many a greatly distressed person lifts up his hands to the heavens. praying and crying: 'O Allah, O Allah.' But the food he eats is \"Haraam\", what he drinks is \"Haraam\", his clothes are of \"Haraam\"; then in such cases how can his prayer be accepted?' A story is related about a group of people in Kufa, whose prayers used to be always accepted. Whenever a (bad) ruler was placed over them, they used to pray for a curse upon him, which quickly came to destroy him. When Hajjaaj became ruler there, he invited these people amongst others, to a feast. After they had all eaten, he said: \"I am no longer afraid of the curse upon me from these people, because \"Haraam\" food has now entered their stomachs.\" (At this stage, let us ponder over how much \"Haraam\" is being consumed in these times, when people are even trying to make permissible the taking of interest money. We find out people going so far as to think that bribery and what is obtained through it is permissible, while our merchants very often justify their deceiving people when trading with them.) HADITH<br><hr><br>Ibn Umar (Radhi Allaho anhu) relates: Rasulullah (Sallallaahu alaihi wasallam) said: 'Verily Allah and His Malaa'ikah send Mercy upon those who eat 'Sehri' (sower-Suhoor).\" COMMENTARY How great is Allah's favor upon us that even the partaking of food before dawn for fasting is so greatly rewarded. There are many Ahaadith in which the virtues of \"Sehri\" are expounded and the rewards mentioned. Allaamah Ain - Commentator on Bukhari - has quoted the virtues of \"Sehri\" from seventeen different 'Sahaabah' and all the \"Ulama\" are agreed on its being \"Mustahab\" (desirable). Many people are deprived of this great reward because of their own laziness. Some even go so far as to finish 'Taraaweeh', eat (what they suppose to be \"Sehri'!) and go to bed. What great blessings do they lose! \"Sehri\" actually means partaking of food shortly before dawn. Some authorities say that the time for \"Sehri\" commences after half the night has passed (Mirquat). The author of Kash- shaff (Zamakhshari) divided the night into six portions, stating that the last one of these is the time of \"Sehri\"; so that, when the night (from sunset till dawn) extends over twelve hours, the last two hours would be the correct time for \"Sehri\". Then it must also be remembered that to eat at the latest possible time is better and greater in reward than eating earlier, subject to the condition that no doubt remains as to whether \"Sehri\" had been eaten before the time of dawn. The Ahaadith are full of virtues of \"Sehri\". Rasulullah (Sallallaahu alaihi wasallam) said: 'The difference between our fasting and that of the Ahlul-Kitaab (Jews and Christians) lies in our partaking of food at \"Sehri\" which they do not.\" The Prophet has said, \"Eat Sehri, because in it lie great blessings; and again.”In three things, are the great blessings: in \"Jamaa’ah\" (company), in eating \"Thareed\" and in \"Sehri\". In this Hadith, the use of the word \"Jama'ah\" is general, wherefrom we deduce that it includes \"Salaat\" with \"Jamaa'ah\" and all those righteous deeds done in company, as thus Allah's help comes to them. \"Thareed\" is a tasty preparation, in which baked bread is cooked with meat. The third thing mentioned in this Hadith is \"Sehri\". When Rasulullah (Sallallaahu alaihi wasallam) used to invite any of the companions to eat \"Sehri\" with him, he used to say: \"Come and partake of blessed food with me.\" One Hadith says: \"Eat 'Sehri' and strengthen yourself for the fast. And sleep in the afternoon (Siesta), so as to gain assistance in waking up in the latter portion of the night (for \"Ibaadah\").\" Abdullah bin Haarith (Radhiallaahu Anhu) reports that one of the Sahaaba said: \"I once visited Rasulullah (Sallallaahu alaihi wasallam) at a time when he was busy in partaking of 'Sehri'. Rasulullah then said: \"This is a thing full of blessings, which Allah has granted you. Do not give it up.\" Rasulullah (Sallallaahu alaihi wasallam) in urging us repeatedly for 'Sehri' has said: \"Even though there be no food, then one date should be eaten or a drink of water taken.\" Thus, when there are definitely great advantages and reward in 'Sehri', Muslims should endeavour to observe this practice as much as possible. However, in all things moderation is important, and going beyond the bounds of moderation is harmful: neither should so little be eaten that one feels weak throughout the period of fasting, nor should so much be eaten that it causes discomfort. Repeatedly, we have been prohibited from filling the stomach excessively. In his commentary on \"Sahih Bukhari\", Ibne Hajar has mentioned various reasons for the blessedness of \"Sehri\": • Because in it, the 'Sunnah' is followed. • Through \"Sehri\", we differentiate ourselves from the ways of Ahlul-Kitaab, which we are at all times called upon to do. • It provides strength for \"Ibaadah\" • It promotes greater sincerity in \"Ibaadah\" • It aids in elimination of bad temper, which normally comes about as result of hunger. • 'Sehri' is the time when prayers are accepted. • At the time of 'Sehri', one gets the opportunity to remember Allah, makes Dhikr and lifts up the hand to Him in prayer. These are a few of the major reasons; there are many others as well. Some 'Sufis' are in doubt as to whether the eating of 'Sehri' conflicts with the object of fasting or not. They maintain that the object of fasting is to stay away from food, drink and sexual desires, therefore 'Sehri' is against the object of fasting. In my opinion the amount to be eaten varies according to different persons and their activities. Foe example, for those students who are busy seeking knowledge of 'Deen', too little food at 'Sehri' as well as 'Iftaar' will be harmful; for them it is better not to have too little, because they seek 'Deeni' knowledge, which is very important (for the preservation and spread of Islam). similar is the case of those who are busy with 'Dhikr' and other 'Deeni' activities. Other people who have no such hard work to do should eat little at 'Sehri'. Once Rasulullah ( Sallallaahu Álayhi Wasallam ) announced to those proceeding for 'Jihaad': 'There is no virtue in fasting while travelling.' That was in the month of Ramadan, when some Sahaaba were fasting. Allamah Sha'raani mentions in Sharh Iqna: 'A covenant was made with us that we shall not fill our stomachs (completely) when eating, especially in the nights of Ramadan.' It is better that one should eat less in the nights of Ramadan than on other nights. After all, what is the utility of fasting after having filled oneself at 'Sehri' and 'Iftaar'? the religious divines have said, 'Whoever remains hungry in Ramadan shall remain safe from the evil of 'Shaytaan' throughout the year, until the next Ramadan.' Sharah Ihya Ulumuddin mentions the experiences of some saints, such as Sahl bin Abdullah Tastari, who used to eat only once every fifteen days, while in Ramadan he ate only one morsel; but in order to follow the Sunnah, he used to have a drink of water daily for 'Sehri' and 'Iftaar'. Shaykh Junayd always used to fast throughout the year. However, when his noble friends would visit him occasionally, he used to break his fast and eat with them, saying, 'The virtue of breaking fast and eating with (such noble) friends is not less than that of 'Nafl' fasting. Similarly, we can mention the experiences of numerous saints who through eating less used to discipline their inner-selves, but let us bear in mind that it should not be carried to such extremes that the'religious' activities and responsibilities are neglected, as a result of weakness of the body. HADITH<br><hr><br>Abu,Hurayra ( Radhiallaahu Ánhu ) relates that Rasulullah ( Sallallaahu Álayhi Wasallam ) said: \"Many of those who fast obtain nothing through such fasting except hunger, and many a one performs \"Salaat\" by' night but obtains nothing by it, except the discomfort of staying awake.\" COMMENTARY With regard to this Hadith, the \"Ulama\" have mentioned three different interpretations: First, this Hadith may refer to those who fast during the day and then for \"Iftaar\" eat food that is \"Haraam\"; all the reward for fasting is lost because of the greater sin of eating 'Haraam' and nothing is gained except remaining hungry. Secondly, it may mean those who fast duly but, during fasting, engage themselves in backbiting and slandering others (see later). Thirdly, the person referred to may be one who, while fasting, did not stay away from evil and sin. In this Hadith all such possibilities are included. Similar is the case of the person performing 'Salaat' all night voluntarily; because of backbiting or any other sinful act (e.g. missing, Fajr salaat or keeping Awake for show), his night of devotion goes unrewarded. HADITH</p></div>"
+    },
+    {
+        "id": 43,
+        "bookId": 6,
+        "chapter": "Last Ten Days",
+        "title": "Content for Last Ten Days",
+        "preview": "Abu Ubaidah ( Radhiallaahu Ánhu ) reports: \"I have heard RasuluLlah ( Sallallaahu Álayhi Wasallam ) saying: \"Fasting is a protective Shield for Man, a...",
+        "content": "<div class=\"story-content\"><p>Abu Ubaidah ( Radhiallaahu Ánhu ) reports: \"I have heard RasuluLlah ( Sallallaahu Álayhi Wasallam ) saying: \"Fasting is a protective Shield for Man, as long as he does not tear up that protection' COMMENTARY \"Protective shield\" here means just as a man protects himself with a shield, similarly fasting protects him from his well-known enemy - 'Shataan'. In other Ahaadith, we are told that fasting saves one from Allah's punishment and Hellfire in the Hereafter. Once somebody inquired from Rasulullah ( Sallallaahu Álayhi Wasallam ), \"What causes the fast to be rent?\" He replied: 'Telling lies and backbiting.' This Hadith, when read in conjunction with so many others, actually tells us to avoid such actions which cause fasting to be wasted. In our times, we are fond of whiling away the time with unnecessary conversations. Some \"Ulema\" are of the opinion that lies, backbiting, slander, etc., actually undo the fast just like eating and drinking, but the great majority of \"Ulama\" believes that the fast is not totally undone, but loses its blessings. The \"Ulama\" of Islam have mentioned six things, about which care should be taken in fasting:- First, one should keep the eyes away from any place where one should not look; some go so far as to prohibit looking at one's own wife with desire, let alone another woman. Similarly, looking at any evil action or where evil is committed should be avoided. Rasulullah( Sallallaahu Álayhi Wasallam ) said: 'The glance is like an arrow from 'Shataan' Whosoever, out of fear for Allah, prevents himself from lookig at evil, Allah shall grant him such light of faith, the taste and ecstacy of which he will feel in the heart.\" The 'Sufis' interpret the above saying to mean that those sights which should be avoided include all such places and things that distract the mind from the remembrance of Allah. Secondly, one should guard the tongue against lies, unnecessary conversation, backbiting, arguments, swearing, etc. In Bukhari, we read that fasting is a shield for the fasting person; for this reason, those who fast should avoid all useless talk, joking, argument, etc. Should anyone pick an argument, then say: \"I am fasting.\" In other words, one should not start an argument and if someone else starts it, then too, one should avoid taking it up. When the person who starts an argument is not an understanding person, then at least one should remind oneself that: \"I am fasting.\" During the time of our Nabi ( Sallallaahu Álayhi Wasallam ), two women were fasting and suffered the pangs of hunger to such an extent that the fast became unbearable and both were on the point of death. The \"Sahaaba\" brought this to the notice of our Nabi ( Sallallaahu Álayhi Wasallam ), who sent a bowl commanding them to vomit into it. When they both vomitted in the bowl, pieces of meat and fresh blood were found in it. The \"Sahaaba\" were greatly surprised, upon which our Nabi ( Sallallaahu Álayhi Wasallam ) said: \"They fasted with 'Halaal' food from Allah, but partook of 'Haraam' food by backbiting other people.\" From the above, it also becomes clear that, by backbiting during fasting, the fast becomes so much more harder; for this reason, both women were near death. Similar is the case with other sinful acts, and experience shows that for the faithful, Godfearing persons, fasting is no hardship, whereas the sinful find it too hard to bear. One should therefore stay away from sins and especially from major sins, like backbiting and slander, which are often indulged in to while away the time. Allah says in the Qur’an that backbiting is tantamount to the (actual) eating of the flesh of one's dead brother. We find this also narrated in various Ahadith. Once the Prophet, ( Sallallaahu Álayhi Wasallam ), on seeing some people, asked them to pick their teeth. They said that they had not tasted any meat that day, on which the Prophet ( Sallallaahu Álayhi Wasallam ) said, \"So and so's flesh is sticking to your teeth.\" It transpired that they had been backbiting. May Allah keep us safe from this evil, because we are very neglectful of this warning. All are guilty of this; not to speak of the common man, even the people of importance indulge in it, even the religious people in their gatherings do not avoid backbiting. Worst of all is the fact that we do not even realize what backbiting is; even when we suspect ourselves of this, we try to cover it up as narration of some event. One of the 'Sahaaba' inquired from Rasulullah ( Sallallaahu Álayhi Wasallam ) \"What is backbiting?\" Rasulullah ( Sallallaahu Álayhi Wasallam ) replied: \"To mention something about your brother behind his back, which he would resent.\" The 'Sahaabi' then said: \"And is it still backbiting if the thing mentioned about him is really true?\" Our Nabi ( Sallallaahu Álayhi Wasallam ) said: 'In that case (if that which was mentioned is really true) it is precisely backbiting; but if what is mentioned is false, then you have in fact slandered him.\" Once our Nabi ( Sallallaahu Álayhi Wasallam ) passed by two graves. He said: \"On both the inmates of these graves, punishment is being inflicted in the grave. One is being punished because of backbiting, the other because of not having taken precautions (to stay clean) when passing urine. Rasulullah (( Sallallaahu Álayhi Wasallam ) also said: \"There are more than seventy degrees of evil in (Usury) interest. The lowest form of it is comparable to committing incest with own mother; and taking one 'Dirham' of interest is a worse evil than having fornicated thirty five times. The worst and most evil degree of taking interest is the slandering of a Muslim.\" In various Ahaadith we are strongly warned against backbiting and slandering a Muslim. I very much wanted to write down here a number of such Ahaadith, because all our gatherings and conversations are generally filled with these evils (backbiting and slander). However I finally decided not to do so, because the topic under discussion here is something else - not actually backbiting. So I once again pray that Allah may keep us safe from this evil. And I beg of my friends and brothers to pray for me too; we are full of inner faults. 'What ailment is there O Allah that is not in me, Heal me from every illness and grant me my needs Verily I have a heart that is sick Verily you are the Healer of the sick' Thirdly, we should be careful that the ears are kept away from listening to anything undesirable (Makrooh). It is equally unlawful to listen to anything that should not be said. Rasulullah ( Sallallaahu Álayhi Wasallam ) has said, 'In backbiting, both the bickbiter and the one who listens to it are equal partners in sin.' Fourthly, the rest of the body should be kept away from sin and unlawful things. Neither should the hands touch it, nor the feet walk towards it. With the stomach, special care should be taken, especially at the time of \"Iftaar\", that no such thing enters it about which there is any doubt of it being \"Halaal\". When a person fasts and, at.\"Iftaar\" time, breaks his fast with \"Haraam\" food, he is like a sick person who takes medicine as a cure, but also adds a little poison, which destroys him. Fifthly, after having fasted, it is not advisable to fill the stomach completely even with \"Halaal\" food at \"Iftaar\", because then the purpose of fasting is defeated. Fasting seeks to diminish one's carnal desires and increase one's faith and spiritual powers. For eleven months, we eat and drink freely enough, in Ramadan this should be cut down to a minimum. We have a bad habit of filling our bellies at \"Iftaar\" to make up for what was lost, and again at \"Sahi\" in preparation for the day, thus actually increasing our average consumption. Ramadan for such people gives an edge to their appetite. Many such items of food are eaten that we normally do not eat at other times. This type of eating habit is completely against the spirit of Ramadan and the true spirit of fasting. Imaam Ghazaali asks the same question: \"When the object of fasting is to conquer our carnal passions in opposition to 'Iblees' (Satan), how can this possibly be done by eating excessively at \"Iftaar\"? Actually in that case we have only altered the times of eating, and not really fasted. In fact by having various types of delicacies, we consume even more than in normal times. The result is that, instead of lessening the carnal desires, these are considerably increased. The real benefit of fasting comes as a result of actual hunger in the 'true sense. Our Nabi ( Sallallaahu Álayhi Wasallam ) said: 'Shataan\" flows through the body of man like blood; so, close up his path by remaining hunqry,\" i.e. when the body is hungry, the spirit receives strength. Apart from hunger, fasting gives us an opportunity to appreciate the condition of the poor and destitute, and thus engenders sympathetic feelings towards them. This too can be attained by remaining hungry and not by filling the stomach with delicious foods at 'Sehri\", so that one does not feel hungry until \"Iftaar\". Once a person went to Bishr Haafi, whom he found shivering in the cold, in spite of having warm clothes lying at his side. That person inquired: \"Is this a time for taking off the clothes?\" Bishr replied: \"There are numerous poor and needy ones; I am unable to sympathise with them; the least I could do is to be in their condition.\" The 'Sufis' plead for the same attitude in fasting and so do the \"Fuqahaa\" (Jurists). In Maraqiul Falaah, it is written. \"Do not eat excessively at \"Sehri\", as this is a way to lose the object of fasting.\" Allama Tahtaawi writes: \"When hunger is really felt, the reward for fasting becomes definitely more. Similarly, a feeling is developed for the poor and hungry ones\". Our Nabi ( Sallallaahu Álayhi Wasallam ) himself said: 'Allah does not dislike the filling of anything to the brim more than He dislikes the filling of the stomach. On another occasion, the Prophet (( Sallallaahu Álayhi Wasallam ) said, \"A few morsels should suffice which can keep back straight.\" The best way for man is that one third should be filled with food, one third with drink while the other third remains empty.\" Rasulullah ( Sallallaahu Álayhi Wasallam ) himself used to fast for days on end, without eating in between. I have seen my ustaaz (teacher) Maulana Khalil Ahmad eating only slightly more than one thin (hand-made) bread (roti) at 'Iftaar' and 'Sehri', during the whole month of Ramadan. When any of his near ones used to urge him to eat more, he would reply: \"I am not hungry. I merely sat down to eat because of my friends.\" About Maulana Shah Abdurraheem Rajpuri, I have heard that in Ramadan, for days on end, he used to fast, drinking at 'Iftaar' and 'Sehri' only a few cups of tea without milk and nothing else. Once his most trusted follower (and Khalifa) Maulana Shah Abdulqaadir remarked with anxiety: \"Hazrat, you will become very weak if you do not eat anything.\" To this, Maulana Shah Rajpuri replied: \"Praise be to Allah, I am experiencing something of the ecstasy of Jannah.'May Allah grant us all the ability to follow those Pious souls.Aameen'. The sixth point is that, after fasting, one should always have some anxiety as to whether one's fast had been accepted by Allah or not. This should be the case with all forms of 'Ibaadah' (worship). One never knows whether some important part may have been left out, of which no notice was taken. One should always fear that Allah may reject one's deeds. Rasulullah ( Sallallaahu Álayhi Wasallam ) said: 'Many reciters of the Qur'an are being cursed by the Qur'an.' He also said: 'On the day of 'Qiyaamah', (judgement) one of those with whom Allah shall reckon first shall be a \"Shaheed\" (martyr in the path of Allah). Allah shall call him and remind him of all His favours to him, which he shall admit. He shall then be asked: \"What have you done by way of expressing gratitude for these favours?\" The 'Shaheed' shall reply: 'I fought in Your cause till I became a 'Shaheed\". Allah shall reply:\"It is not so; you fought so that you can be called a brave man; and so it has been said\" Thereafter, it shall be commanded that he be dragged face on the ground and cast into \"Jahannam.\" Thereafter, an 'Aalim' (Scholar) shall be called. He too shall be reminded of Allah's favours and asked the same question. He shall reply: \"O Lord! I sought to acquire knowledge, taught others and for Your sake recited the Qur’an.\" Allah shall say: \"This is not true. You did all that, merely so that, it may be said that you are learned; and so, it has been said.' Then it shall be commanded that he too be dragged, face on the ground, and cast into \"Jahannam.\" Thereafter a rirh man shall be called. After being reminded of Allah's favours, and admitting them, in reply to Allah's question as to what he did fo express His gratitude, he shall reply: \"There was no worthycause wherein I did not spend in charity for Your sake.\" Allah's reply shall be: 'Not true. You did all that, so that it may be said that you are very generous. And so it has been said.\" Then it shall be commanded that he too be dragged, face on the ground, and cast into \"Jahannam\". Many such incidents are related in Ahaadith. So, a fasting person should not only be sincere but also hope that Allah will accept it. These above mentioned six things are compulsory for all truly righteous persons. As for the exceptionally pious ones, a seventh point is added. That is, during fasting, the heart should not be turned towards anyone except Allah, so much so that during the course of the fast there should be no worry as to whether there shall be something to eat for 'Iftaar'. Some Shaikhs even consider it a fault to think about food for 'Iftaar', or that one should endeavour to acquire something, because this shows lack of faith in Allah's promise of being responsible for the granting of \"Rizq\". In the commentary of 'Ihya Ulumid Deen, the author goes so far as to relate that, should something for \"Iftaar\" arrive from somewhere before the time of 'Iftaar', the \"Mashaikh\" would give it to somebody else, for fear that for the rest of that day the heart may be distracted from Allah by keeping it. This can of course, only be carried out by the exceptionally pious ones. We cannot even imagine having such strong faith. Should we try to follow without it, we may destroy ourselves. The Qur’an commands: \"Fasting has been prescribed for you.\" The commentators of the Qur’an say that from this verse it is deduced that fasting is made compulsory for every part of the body. Thus, fasting of the tongue means to avoid falsehood, etc. fasting of the ears means not listening to evil, fasting of the eyes means not to look at any form of evil and sirl. Similarly, fasting of the self means to be free from all carnal desires. Fasting of the heart means casting out from it the love of worldly things. Fasting of the mind means avoiding thoughts about anything other than Allah. Our Faults in Ramadan At this point we should ponder over our i'baadah. How much importance do we attach to it in Ramadan? How many nafl do we perform? As for fardh deeds, we observe how numerous people who after having eaten sah'ri get back into bed with the result that the Fajr 'salaah is neglected. Many perform it, but not with Jamaa'ah. It gives the impression that we give thanks to Allah for the food we had eaten for sah'ri by not performing the most important fardh or by not performing it with Jamaa'ah. Such a 'salaah has been termed defective. Rasulullah (SAW) said that, \"There is no 'salaah for those near the musjid except in the musjid\". In the kitaab 'Mazhaahire Haq' we find that there is no reward for the 'salaah for persons who do not perform 'salaah with Jamaa'ah without any valid reason or excuse. Similarly, in numerous cases at the time of if'taar (boeka) Maghrib 'salaah is missed, and many who do not come to the musjid miss the Takbeer at the beginning or miss the first raka'ah. Many people hasten to get over the Taraaweeh 'salaah early and even perform the 'ishaa' 'salaah before the time of 'Ishaa' commences. (Some do not pay any attention to 'salaah even in Ramadan.) That is the way we look after our very important fardh 'salaah in Ramadan. Sometimes in the process of performing one fardh, three others are destroyed. How often do we see even the time of Zhuh-r 'salaah going by because we are asleep, while time of A'sr goes by because we are too busy buying, selling or cooking to prepare for if'taar. If such is the case with the faraa'idh, then we can imagine how much less importance is given to the nafl actions. One finds that because of sleep, the time of 'salaatul Ishraaq (after sunrise) and 'salaatul Dhuhaa (before noon) go by. Then what about 'salaat Awwaabeen (just after Maghrib)? Here we find ourselves busy with If'taar and when thinking about Taraaweeh after about an hour this 'salaah too is wasted. Further we find that for 'salaatul Ta-hajjud the time is the same as that for sah'ri with the result that this too goes by. One may make a thousand excuses for not finding time for these nawaafil. These are all excuses for not performing these 'salaah. We see that there are many who do find the time to do all these 'ibaadahs during these precious moments. I personally had observed my ustaaz Maulana Khalil Ahmad during many a Ramadan. He was a weak sickly person and of advanced age but in spite of these drawbacks he used to read one and a quarter juz of the Qur'an in nafl namaaz after Maghrib. Thereafter he used to have meals for about half an hour. After performing all other necessities in preparation for Taraaweeh 'salaah he used to stand in Taraaweeh for about two and a half hours when he was in India, and when he was in Madinah Munawwarah the duration was three hours. Thereafter he used to sleep about two or three hours (according to the season). Then he used to again recite the Qur’an in Tahajjud 'salaah until about half an hour before Fajr. Then he ate sah'ri. From that time until Fajr he remained busy with reading the Qur’an or reciting of wazifas. With the greyness of dawn he performed Fajr 'salaah, thereafter he remained in meditation (muraa-qabah) until Ishraaq. Having performed Ishraaq he used to write his famous kitaab, 'Baziul Majhood', commentary on Abu Dawood. Then he normally attend to letters and dictating replies up to mid-day. Then he used to rest up to Zhuh-r 'salaah. Between Zhuh-r and A'sr he used to recite the Qur’an. From A'sr Namaaz until Maghrib he used to be busy with tasbeeh and answering the queries of those who visited him. When he completed 'Baziul Majhood' then part of the morning used to be spent in tilaawah and studying some monumental religious works, especially Baziul Majhood and Wafa al Wafa. This was his daily programme for nafl 'ibaadah throughout the year. In Ramadan however, he used to spend a bit more time in his i’baadah, making the rak'aats longer. For the ordinary person to observe the special programmes the other pious elders had for Ramadan would be difficult. Shaikhul Hind Maulana Mahmoo-dul Hasan (Rahmatullah alaihi) used to remain in nafl 'salaah from after Taraaweeh until Fajr, while also listening to the Qur’an recited by various huffaazh one after the other. Maulana Shah Abdurraheem Raipuri (d 1963) remained busy with tilaawah (recitation) of the Qur’an day and night through Ramadan. There used to be no time for attending to correspondence or meeting visitors. Only his special ones were allowed to wait on him after Taraaweeh for a short period while he drank a cup of tea. ADVICE FOR RAMADHAAN The reason for mentioning the manner in which these saintly ones spent their Ramadan is not that we may just read without deriving any benefit or pass a casual remark. It is written with the object that we in our way may build up courage and to the best of our ability endeavor to copy and follow their noble examples. Every pious elders programme had its particular specialty. How wonderful would it be if those who are not forced by worldly necessities try their utmost to mend their religious life in this one month after having allowed eleven months of the year go by to destroy themselves. As for those who have to be in their offices and be present at eight, nine or ten in the morning, what difficulty will it be for them if they at least in Ramadan, spend the time from Fajr until their hours of employment in reciting the Qur’an. After all our worldly needs we do find time in spite of office hours. For those engaged in farming, who normally are not bound to others nothing prevents them from reciting the Qur’an on their farm or adjusting their daily routine. Then come the businessmen, shopkeepers and merchants. Nothing prevents them in Ramadan from reciting their Qur’an during their shop hours or cutting short trading time in order to make time for recitation thereof. After all there is very strong link between Ramadan and the Tilaa-wah of the Qur’an. Almost all Allah's great scriptures were revealed in this month. Similarly, in this month the Qur’an was brought down from the Lowhul Mahfoozh to the Samaa'ud Dunyaa, from where it was revealed bit by bit to Rasulullah (SAW) in a span of twenty three years. Nabi Ibrahim (A.S.) received his scriptures on the first and third of this sacred month. Nabi Dawood (A.S.) received the Zaboor on the twelfth or eighteenth. Nabi Moosa (A.S.) received his Towrah on the sixth. Nabi Essa (A.S.) received the Injeel on the twelfth or thirteenth. From this we note the great connection between the divine scriptures and the month of Ramadan. For this reason, as much ti-laawah of the Qur’an as possible should be made during this month. Such was the habit of our saints. Jibraeel (A.S.) used to recite the whole Qur’an to our Nabi Muhammad (SAW) in the month of Ramadan. In some reports it is stated that Rasulullah (SAW) used to recite and he (Jibraeel) used to listen. From joining these reports the 'ulama have said that it is mustahab to read the Qur’an in such a manner that while one recites the other listens. Thereafter another recites while others listen. So recite the Qur’an as much as possible. Whatever time remains thereafter should not be wasted. Rasulullah (SAW) drew our attention to four more things and advised that we should practice them as much as possible. They are the recitation of Kalimah 'Tayyibah, Istighfaar, begging for Jannah and seeking refuge from Ja- hannam. Therefore it must be regarded an honour to spend as much as available in these recitations. This will be the true appreciation of the teachings of Rasulullah (SAW). What is so difficult about keeping the tongue busy with the recitation of Durood ('salawaat) or Laa ilaaha illallaah while being engaged in our daily tasks? In the same Hadith Rasulullah (SAW) said a few more things, Ramadan is the month of patience. Hence even if great difficulty is experienced in fasting one should bear it with patience. One should not complain as people are fond of doing during hot days. If by chance sah-ri is missed then lamentations begin early in the day. Similarly, should difficulty be experienced at the same time of Taraaweeh, it too should be borne with patience. Do not consider it a great calamity or trial, otherwise these deeds may be void of blessings. When we turn our backs on worldly things, forsake our very eating and drinking, then in the face of Allah's pleasure what are these difficulties? Sympathy for the unfortunate Further, the Hadith states that it is the month of sympathy, especially for the poor and destitute. Sympathy should be of a practical nature. When ten things are placed before us for if'taar, at least two or four of them should be set aside for the poor and needy. In fact they should be treated preferentially, if not then at least equally. They should certainly be remembered. In showing sympathy for the poor, as in all other matters, the Sahaabah R.A. were living examples, and in this, it is our duty to follow or at least try to follow them. In the matter of sacrifice and sympathy only the courageous can emulate the Sahaabah. There are numerous instances, if they are cited, will only leave one in astonishment. Let us see the following example, Abu Jahm (RA) relates that: \"During the battle of Yarmouk he went in search of his cousins, taking with him a water bag to give him to drink and also wash his wounds if he was found alive or wounded. He found him lying among the wounded. When I asked him whether he wanted some water, he indicated 'yes'. At that moment someone near him moaned. My cousin pointed to that person indicating that I should first quench the thirst of the neighbour. I went to him and found that he too needed water, but just as I was about to give him water, a third person groaned near him. The second one pointed to this third person meaning that I should give the third one to drink first. I went to the third person but before he could drink, I found out that he had passed away, whereupon I returned to the second one only to find that he too had passed away. When I came to my cousin, he too had become a martyr\". Virtues of I’tikaf I'TIKAAF - SECLUSION IN THE MASJID The meaning of 'I'tikaaf' is to seclude oneself in the Mosque, with the express intention (Niyyat)of 'I'tikaaf'. According to the Hanafi school of thought, this may be of three different types: a) Waajib I'tikaaf (Obligatory I'tikaaf) I'tikaaf becomes compulsory when a person makes it obligatory upon himself. For example, when a person makes a vow to Allah that if Allah fulfils a certain wish of his, he shall perform so many days 'I'tikaaf', in this case, the moment his wish is fulfilled, the I'tikaaf becomes compulsory. Or a person may just make an unconditional vow, whereby he makes I'tikaaf Waajib upon himself for a certain number of days; this becomes obligatory for him from that moment onwards. b) Sunnat I'tikaaf This was the general practice of the Holy Prophet (SAW). It means to seclude oneself in the Masjid for the last ten days of Ramadan. c) Nafl I'tikaaf For the third category i.e. Nafl I'tikaaf, no special time and no specific number of days are fixed. A person may make a Niyyah (intention) for any number of days at any time, even for his whole life. While Imaam Abu Hanifa states that I'tikaaf must be for not less than a full day, Imaam Muhammad states that there is no limit as to the minimum period of time. The 'Fatwa'confirms this latter view. Therefore, it is desirable for anyone entering a Masjid to make the 'Niyyah' (intention) of I'tikaaf for the period that he will remain in the Masjid; so that, while he is in Ibaadah, he also earns the reward of I'tikaaf. OBJECTS OF I'TIKAAF AND ITS ADVANTAGES In view of the above, it is advisable that everyone entering the Masjid to join the congregational prayer should, on entering the Masjid, make the Niyyat for 'I'tikaaf', in thatcase it means that aslong as he remain busy with Salaat, Zikr, listening to lectures or sermons he also receive reward for the I'tikaaf. I always observed that my late father used to make 'Niyyat' for I'tikaaf whenever he entered the Masjid. Occasionally, by way of teaching and reminding his followers, he would raise his voice when reciting when reciting the words for 'Niyyah'. The reward for I'tikaaf is great as indicated by the fact that the Holy Prophet (SAW) always used to perform I'tikaaf. The example of him who resides in the Masjid in I'tikaaf is that of a person who, having gone to a certain place to appeal for something, remains there until it is granted. When someone comes begging at our door and then refuses to leave until he has been granted his request. I am sure that even the person with the hardest heart amongst us will eventually give in to his request. How much more Merciful is Allah, and when someone persistently sits at His door, what doubt can there be in the fulfilment of his wishes. Allama ibn Qayyim, in explaining the significance of I'tikaaf writes that the actual aim is to divert the heart away from everything except Allah, and to make it come near to Allah, thereby forming a complete spiritual connection with the Creator. All wordly connections are thus cut off, for the sake of gaining Allah's attention and all thoughts, desires, love and devotion become centred around Him. As a result, an attachment with Allah is attained - a love and friendship that will be the only support in loneliness of the grave. One can possibly imagine the great ecstacy with which that time in the grave will be spent. In Maraaiqul Falaah, the author writes that I'tikaaf, when properly and sincerely performed, is among the most virtuous deeds. One cannot possibly enumerate all the great advantages and benefits in it. In actual fact, what takes place in I'tikaaf is that the heart is drawn away from everything else except the Creator, while the soul is actually laidat His door-step. All the time, one remains in a state of 'Ibaadah', even when one is asleep, one is still in His worship striving for nearness to Him. And Allah says (according to a Hadith): \"Whoever draws near to Me (the length of) one hand, then I draw nearer to him (the length of) two hands, and whoever draws near to Me by walking, I draw nearer to him by running.\" Moreover, in I'tikaaf one seeks refuge in the house of Allah, and is safe therein from all enemies. WHERE TO PERFORM I'TIKAAF The best of places for I'tikaaf is the Masjidul Haram in Makkah. The next besi is the Masjidun-Nabawiy in Madinah, and the next best is Baytul Muqaddas. Thereafter, comes the Jaama Masjid in one's own time, and last but not least, the Masjid nearest to one's home. Imaam Abu Hanifa stipulates that the Masjid should be one wherein the five daily Salaatare regularly performed, while Imaam Abu Yusuf and Imaam Muhammad agree that any Masjid acceptable to the Shari'ah can be entered for I'tikaaf. The above applies to the males. As for the females, they should perform It'ikaaf in the prayer room (Masjid set aside in their homes). Where, however, no such demarcated place exists, any one room or part of the house should be set aside for this purpose. I'tikaaf is thus in fact an easier task for women. The domestic duties can be performed by daughters or servants under her supervision and the woman in I'tikaaf, while remaining in a section of her own house, is spiritually rewarded for it. It is so very unfortunate that, in spite of this relative ease, our womenfolk still remain deprived of the blessings of I'tikaaf. Virtues of Laylatul Qadr (6&7) HADITH<br><hr><br>Ubaadah bin Saamit (Radhiallaho anhu) reports that he asked the Prophet (Sallallaahu alaihi wasallam) about \"Laylatul Qadr\". He replied: \"It is in Ramadan, during the last ten days, on the unevenly numbered nights, either the 21st 23rd, 25th, 27th, 29 th or the last night of Ramadan. Whosoever stands in \"Ibaadah\" on this night, with sincere faith and with genuine hopes of gaining reward, his previous sins will be forgiven. Among the signs of this night is that it is a serene, quiet, shining night, neither hot, nor cold but temperate as if a moon is shining clear, and no meteors are shot at the \"Shayateen\" on that night; it lasts until the break of the dawn. Another sign is that at morn, the Sun rises without any radiant beams of light, appearing rather like the moon in it's fullness. On that day, Allah prohibits the \"Shayateen\" from rising up with the Sun.\" COMMENTARY Part of what has been mentioned in this Hadith has already been dealt with. Some signs are here mentioned about the actual night. These signs are clear and need no further elucidation. Apart from these, there are other signs too, as mentioned in the Ahadith or in the experiences of those who had the good fortune to experience \"Laylatul Qadr.\" The sign that is, however; most specific in the Hadith is the rising of the sun, 'without any radiant beams of light.' Other signs are not always there. One Sahaabi, Ab'da bin Abi Lubaaba (Radhi Allaho anhu) says: \"On the evening of the 27th , I tasted the water of the sea and it was sweet.\" Ayub bin Khalid said: 'I once had to bathe myself with sea water, and on tasting it, found, it sweet. This was on the 23rd night.\" Some of the \"Mashaaikh\" (religious divines) wrote that, on the evening of \"Laylatul Qadr\", everything prostrates itself before Allah, so much so that trees fall flat on the ground, then return to their normal position; these are however spiritual phenomena not visible to the ordinary person. HADITH<br><hr><br>Aaisha (RadhiAllaho anha) reports: \"I said: 'O Messenger of Allah (Sallallaahu alaihi wasallam), should I find myself the \"Laylatul Qadr\", hat shall I pray. The Prophet (Sallallaahu alaihi wasallam) replied: say, Allaahumma innaka afuwwun tohibbu al'afwa fa'fu anna \"O Allah, Thou art the One who grants pardon for sins. Thou lovest to pardon, so O pardon me.\" COMMENTARY This is indeed such an all-inclusive prayer, wherein one begs that Allah in His infinite Grace should forgive his sins. If that has been obtained, the path to the Hereafter is secure. What more would one require? Imaam Sufyaan Thowry used to say that to keep oneself busy on this night with 'Du’aa' (invocations to Allah) is better than any other form of worship (Ibaadah). Ibne Rajab says that one should not only remain busy with 'Du’aa', but should also take part in all other form of 'Ibaadah', e.g. recitation of the Holy Qur'an, 'Salaat', contemplation, etc. This latter opinion is most correct and nearer to what Rasulullah (Sallallaahu alaihi wasallam) had said, as already mentioned in the previous Ahaadith. Muslim Degeneration and its Only Remedy Translation of the Urdu Book Musalmano-ki-Mawjoodah-pasti-ka-Waahid-llaaj by Maulana Ihtishaamul Hasan Kaandhlawi translated by Malik Haq Nawaz Muslim Degenemtion and its only Remedy AUTHOR'S PREFACE For the high devotion, keenness and perseverance of Hadhrat Mohammad Ilyas (Rahmat-Allah-Alaihi) and also due to the profound zeal shown by many other learned and pjous personages among Muslims, a cohesive work is cur- rently in progress for the propagation of Islam and the Islamic way of life. This fact is known to most of the well- informed Muslims of this period. Although an unworthy being for the high mission; I have been commanded by the distinguished gentlemen referred to above to write an account of this work, so as to bring out clearly the special features of propagation (Tabligh) and also to highlight the burning need for this, the Supreme Islamic activity, at this critical juncture, so that, as many Muslims as possible are able to understand and benefit from what is going on. In obedience to their command, I have ventured to gather in this booklet a few thoughts and ideas, which are mere drops from the ocean of knowledge and enlighten- ment possessed by the above mentioned personalities. The collection really amounts to a handful of petals from the vast garden of the teachings of Islam, which I have hurried- ly picked up for presentation to the readers. There may be mistakes and omissions in the presentation, for which I beg my readers to make allowance, and request them to be so kind as to amend or correct those mistakes if necessary, thereby earning my gratitude. - B h It is my earnest prayer that may Haq-Ta'ala (Shanahoo) .;; 2 by His special favours and kindnesses, and for the sake of e E g e the noble personages connected with this work, forgive me for my sins and not uncover my misdeeds, but He may gra- 3: ciously enable us all to lead a pious and virtuous life. May .g y He bestow upon us the wealth of His own love, and grant 3 -g us the approval to follow His own chosen faith of Islam. Z m May He also give us the power to propagate Islam in strict obedience and loyalty to His dearest and the most distin- guished Prophet, (Hadhrat Mohammad saIlallaho alaihe wasallam). MOHAMMAD EHTESHAM-UL-HASSAN (DELHI) 18 RIBIYYUSANI 1358 (HIJRI) 4 Muslim Degeneration and its only Remedy PAST HISTORY About thirteen and a half centuries ago, when the world was sunk in the darkness of ignorance, sin and impi- ety, a light of true knowledge and guidance rose from the horizon of the rugged hills of Batha.* Its rays spread to the East, West, North and South; they reached every corner of the earth and within the short period of 23 years, the way was paved through that light for the mankind to move to such heights of glory as had never been attained before. It enlightened Muslims and created in them the urge for tak- ing the right counsel, which would ultimately bring them their salvation. By following the right path and the guid- ance emanating from that light, the Muslims moved from success to success and attained the highest pinnacle of glory in history. For centuries, they ruled on this earth with such grandeur and strength that no contemporary power had the courage to challenge them and, if someone dared to do so, he did that at the risk of being annihilated. This is the historical truth, which cannot be-erased. But, alas! this fact of history has only become a myth, an ancient tale, to narrate which may sound meaningless and ridiculous, par- ticularly in the context of the present day life of Muslims, which obviously is a blot on the brilliant performance and achievements of their ancestors, the early followers of Islam. THE DISEASE The history, even up to the end of the thirteenth cen- tury Hijri, will reveal that the Muslims were the sole pos- sessors of honour, dignity, power and grandeur, but when one turns his eyes away from the pages of the history books and looks at the Muslims of today, one sees the picture of a people sunk in misery and disgrace, a people who possess no real strength or power, honour or dignity, brotherhood or mutual love, and reflects no virtues or moral character worth the name. One cannot find any sign in them of those Name of hills around Mecca (Saudi Arabia). Muslim Degeneration and its only Remedy 5 noble deeds which at one time used to be the symbol of each and every Muslim. Now-a-days, there can hardly be a living person who can be said to have the purity or the sin- cerity of conscience. On the contrary, Muslims are sunk in vice and sin. They have wandered away so much from the path of virtue which at one time used to be their \"hall- mark\", that the enemies of Islam talk and discuss their affairs with delight, contempt and ridicule. Unfortunately, the matter does not end here. The Muslim youth of the new generation, which has been affected and influenced by the so-called modern trends or the Western way of life, take pleasure in laughing at the very ideals of Islam and openly criticize the sacred code o.f \"Shariat\" as being out of date and impracticable. One wonders at such behaviour and finds that a people, who once gave strength, happiqess, honour and peace to the entire mankind, have now become completely demoralised, apathetic, shallow and helpless. Those who had once taught the world the golden lessons of etiquette and culture are today found wanting in these very adornments. EARLIER ATTEMPTS TOWARDS IMPROVEMENT For a long time, some distinguished thinkers and preachers of Islam have been seriously pondering over this unfortunate plight of their people and have been striving hard to reform the Muslim society, but alas! (The treatment only aggravated the disease). The situation is fast deteriorating and the future looks darker still. Inaction and complacency on our part in these circumstances will be an unforgiveable sin and crime. But, before deciding what is to be done, it will be necessary to I \" look closely at the root cause of this sad state of affairs. kp$ J a - People have assigned several causes to this degenera- tion and have adopted numerous measures for arresting the l z rot, but unfortunately all efforts so far have only brought further frustration. Instead of improvement, despair and confusion have resulted, particularly so in the ranks'of learned preachers and \"ulema\". The basic truth of all this is that the root cause of the real disease has not been diag- nosed. Until this is done, no proper treatment can be pre- scribed or administered, hence no cure or improvement 6 Muslim Degeneration and its only Remedy can be expected. Any step lacking proper diagnosis and correct treatment would a=ount to making a chronic situa- tion more chronic, and further increase confusion and despair. THE APPROACH It is the proven claim of Islam that the \"Shariat\" is the Divine Code, which lays down a complete way of life out- lining every possible measure for advancing and progress- ing on the path of true success and righteousness. It very clearly describes the proper course of action and indicates methods to check and re-orientate in the event of losing di- rection or going astray. In other words, \"Shariat-e-Muham- madiah\" assures its followers their spiritual and material well-being and advancement for their whole life in all situ- ations, right up to the last day of life on this earth. Ob- viously, therefore, it would be futile to look for the cause and the cure for the prevailing degeneration outside the dictates of \"Shariat\". For this, of necessity, we must look closely into the \"Quran-i-Hakim\" which is the fountain source of \"Shariat\" and of all knowledge and guidance for the whole of mankind. In fact, it is the only source of wis- dom for man. We ought to seek its help in finding out what our troubles are and how they are to be removed, if we really desire to attain full recovery. Once we come to know about that, we must.cling to the solution and solemnly re- solve-to adopt it. Certainly, the wisdom and guidance from the \"Quran\" will never fail us, particularly at the critical juncture and in the difficult times through which we are passing nowadays. Let us look and search for the right sol- ution in the \"Quran\" and \"Sunnah\". THE DIAGNOSIS The Creator of the universe, Allah Ta'ala, remains avowedly commit^ that the kingdom and His vicegerency on earth are only meant for the true Muslims (momineen). This is clear from the following verse: . . . . (a a ,A\\ ) 391 \"Allah has promised to those from amongst you who believe and do righteous deeds that He would surely make them His vicegerents on earth.\" Muslim Degeneration and its only Remedy 7 He has also given the assurances that true believers will always dominate over non-believers a d that non- believers will be left without any friend or ally; as is clear from the following verse: \"And if these non-believers had given you a battle, they were sure to turn on their heels, and they would have found no protector and no helper.\" Moreover, it is Allah Ta'ala's own obligation to grant every help to the true Muslims and it is also His promise that such people will always remain exalted and glorious. This is borne out by the following verses: ctv rJI, 9 @ & d ~ j .. . (, r, Ji, k$ $ 61 A&YI plj 149 9 j I& ~j I c 1 ' ' (A d+U\\) &?jd3 +!!j!! 43 \"And it is our bounden duty to render succour to the true be1 ievers. \" \"And do not give way to despair, and do not grieve, and you only shall dominate, if you are true believers.\" \"And honour is only for Allah, His Prophet (sallallaho I alaihe wasallam) and those who believe.\" The above Divine assertions clearly indicate that the I way to regain honour, grandeur, exaltation, glory and vir- I tues by Muslims, lies only in their being strictly faithful. If their relationship with Allah Ta'ala and the Holy Prophet 3 , (sallallaho alaihe wasallam) is strong and firm, they are 3 1 destined to be masters of each and every things on this g Earth. But if, on from the following verse: > &3 0 0 , 4,g \\ +i : j ) l ~ ] , & & AUJI 51 4 JiilIj E 8 )4YJ - . - 3 P J - - . - - . .- .- (r - , A, ) g k 1993 $\\ 4; I \"And let Time be witness: verily man is in a great loss I except, of course, those who believe and do righteous deeds and who rejoin truth and enjoin patience.\" As already brought out, history proves that the early Muslims had been able to reach the highest summit of 8 Muslim Degeneration and its only Remedy honour and glory, whereas the present day Muslims seem to have moved in the opposite direction. It is obvious from the above verses of the Quran that the first Muslims had attained that high position in life because of the purity and strength of their faith and the excellence of their character. Conversely, the deplorable condition of the present-day Muslims is the result of weakness in their faith and charac- ter, the opposite of what their forefathers possessed. There- fore, it will be right to say that today we are Muslims in name only! In this connection, the true Messenger of Allah Ta'ala Hadhrat Mohamrnad, (sallallaho alaihe wasallam), had prophesied: \"An era will come in the near future when Islam will exist merely in name and Quran will exist merely in phrase.\" : , This is clearly applicable to the Muslims of the present time. In these circumstances, the points which need urgent investigation @re: (a) as the right type of faith, which can have the ap- proval of Allah Ta'ala and His Apostle and which will bring us spiritual and material advancement, is not to be seen anywhere, what will be the means of acquiring that true faith; and (b) what are the factors which have caused the extinc- tion of that faith, and with it the true life of Islam, from our midst? A study of the Holy Quran clearly reveals that the capacity to maintain the required level of the true faith of Islam, and the ultimate ascendance to exaltation and glory through it, are dependent on the fulfilment of a special task which has been so graciously assigned by Allah Ta'ala to the Muslims alone. It is for this that they have been given, in the Quran, the distinguished position, \"Khair-ul-Umam\" (the best of dl peoples). According to the faith of Islam, the main purpose behind the creation of this world was to establish and prove the Divinity, the Oneness, and the most exalted Muslim Degeneration and its only Remedy 9 existence of Almighty Allah Ta'ala, and to reflect His un- limited Powers and boundless Attributes through man, who was to be guided by the light of true knowledge. It was impossible for man to conceive and utilize that knowledge without his first being purified of impiety and obscenity. Only after that purification, is he to be adorned with fine virtues, excellence of conduct and the eventual capacity to act righteously. It was for this purpose of bringing about this purity and power in the ranks of mankind that thou- sands of Prophets and Apostles had been deputed by Allah Ta'ala. The last in the series, came the \"Sayyed-ul-Ambia wal Mursalin\" (the greatest of all the Prophets) Mohammsd (sallallaho alaihe wasallam). It was through him that man reached the high state of development of mind and body leading to the final stage of purity. It was then that man- kind received the glad tidings in the following verse: \"And today we have perfected your Religion for you and completed our bounty upon you.\" The supreme purpose of man's creation had been ful- filled; good and evil had been clearly defined, a complete system of practical life had been revealed, the lineage of prophethood and apostlehood had been terminated, and lastely, the duties that were formerly discharged exc!us- ively by the Prophets had devolved as a collective mission upon the \"Ummat-i-Mohammadia\" (the Muslim people). h This last fact has been clearly brought out in the following 3 1 verses of the Holy Quran: et E &,h ' I. 6 8 I @ A*j d,+j& A,pj &Q< g\\ + @ BY .I .I . - z* d (\\ \\ . OI+ Jr ) +lJ& &,L$j E a \"0 you (followers of Mohammad): you are the noblest of peoples, in that you have been brought out for (the benefit of) mankind. You enjoin the good and forbid the evil, and you believe in Allah.\" 10 Muslim Degeneration and its only Remedy \"And it is but meet that amongst you there should be a group devoted to inviting people towards righteous- ness and enjoining the good and forbidding the evil, and it is only those who do this that prosper.\" In the first verse, \"Allah Ta'ala\" has stated the reason why the Muslims are called \"Khair-ul-Umam\" (noblest of all peoples); it is because of spreading good and preventing evil. In the second verse, He has further clarified that only those people shall be exalted in life who fulfil that injunc- tion. The command does not end here. It is stated in an- other place that the failure to accomplish this vital task will bring curse and gloom on its assignees. This inference is taken from the following verse: \"And those amongst the people of Israel who rejected Allah's commands were cursed by Allah through the tongues of Dawood and Isa, son of Mariam. And the curse was because they rebelled against Allah's com- mands and transgressed the limits and did not desist from the evil that they were doing; and verily it was a grievous lapse on their part.\" A further explanation and clarification of the above verse of the Holy Quran can be seen from the following \"Ahadis\" (sayings of the Holy Prophet Mohammad (sallal- laho alaihe wasallam). (1) It has been narrated by Hadhrat Abdullah bin Ma- sud (radi Allaho anho) that the Holy Prophet (sallallaho alaihe wasailam) was pleased to say: Muslim Degeneration and its only Remedy 11 -. ,. J'J J'J a , a &I A+ p &I, +JI dj (\\) J . @, & $ > J! :&j & ~1 hl iGj \"Amongst peoples gone by, when somebody com- mitted a sin, the other would reprimand him and would say: \"Fear Allah\"; but on the following day would befriend him and mix with him as if he had never seen him committing the sin. And when Allah saw them behaving thus, He confounded the hearts of some with those of some, and cursed them through the tongues of Dawood and Isa son of Mariam; and this bc- cause they rebelled against Allah and transgressed His limits.\" I, Mohammad swear by Him, Who has control over my soul: you must enjoin the good and forbid the evil and force the ignorant wrongdoer into the path of rectitude; else Allah will confound your hearts and you will be cursed, as were some of the peoples gone by. ' S 83 I I Yj & I & j 4 5 3 \" . .\" - E 8 $ f r; g (2) Hadhrat JAreer (radi Allaho anho) has narrated that Hadhrat Mohammad (sallallaho alaihe wasallam) was pleased to say: \"When an individual of a community sins, and the community, in spite of its authority over him, does not prevent him from sinning, Allah's punishment de- scends on them even before death, i.e., He subjects them to various tribulations in this very world.\" 12 Muslim Degeneration and its only Remedy (3) Hadhrat Anas (radi Allaho anho] has narrated that Hadhrat Mohammad (sallallaho alaihe wasallam) was pleased to say, \"The Kalimah La ilaha Illallaho al~ays~benefits the in- dividuals who proclaim it, and keeps away from them woes and troubles, unless, indeed, its rights are ignored.\" The com- panions inquired: \"What does the ignoring of its rights mean?\" Replied the Prophet: \"It means that when sins are be- ing committed openly they do not prevent or stop them.\" (4) Hadhrat Aisha (radi Allaho anha) says: \"The Holy Prophet, (sallallaho alaihe wasallam) came to me and I could read from his noble countenance that something extraordinary had happened. He did not utter a single word but, having per- formed ablution, repaired straight to the mosque. I, too, stood by the wall of the mosque to hear what he had to say. The Prophet of Allah ascended the pulpit and, after the usual holy exordium, said: '0 people, Allah has ordained you to enjoin the good and forbid the evil, lest a time should come when you call and He may not respond, you ask for a favour and He may not grant it, and you call for help and He may refuse'.\" Muslim Degeneration and its only Remedy 13 (5) Hadhrat Abu Huraira (radi Allaho anho) has narrated: \"Said the Prophet (sallallaho alaihe wasallam): When my \"Ummat\" (followers) begin to attach more importance to the world and to regard it as a source of glory, the awe and importance of Islam will vanish from their hearts. When they give up the practice of enjoining good and for- bidding evil, they will be deprived of the blessings of Revelation, and, when they begin to indulge in mutual recrimination, they will fall low in the eyes of Allah.\" THE ROOT-CAUSE From the above \"Ahadis\" it is clear, that the abandon- ment of the act of \"Amir bil maruf wa nahi anil munkar\" (en- joining the good and forbidding the evil) has usually been the root cause of \"Allah Ta'ala's\" anger and displeasure and His eventual wrath. And if the \"Ummat-e-Mohammadiah\" be- comes guilty of that neglect and omission, the punishment to he given to them will be more severe than to the earlier people, because they would have failed to recognise their ex- clusive obligation and neglected to fulfil the sole mission in their life. For this reason, the Holy Prophet (sallallaho alaihe wasallam) has enjoined the act of \"Amir bil maruf wa nahi anil munkar\" (enjoining the good and forbidding the evil) \"as the essence and the pivot of the faith of Islam\" and the aban- donment of that act as the cause of decay and decline of the faith. In the \"Hadis\" of Abu Saeed Khudri, (radi Allaho anho) it is mentioned: 8 h .J% 2 E \"When anyone of you witnesses the commission of evil, he should use his hands to prevent it; and if he has not the power to do this, he should use his tongue; and if he has not the power to do even this, he should use the pow- er of his heart; and this last represents the weakest degree of faith.\" 14 Muslim Degeneration and its only Remedy There is yet a clearer version of the same \"Hadis\" from Ibne Masud (radi Allaho anho): It is usual for Allah to so arrange that every Prophet leaves behind a group of his companions who perpet- uate His message, who follow it rigorously and pre- serve the holy message exactly in the form in which the Messenger left it. Then comes an epoch of mischief and error, an epoch that witnesses the birth of people who step aside from the path laid down by the Prophet. Their actions are at variance with their proc- lamations; their activities are not warranted by the holy law. So whosoever arises in defence of Truth and Law, and opposes the miscreants with his hands, is a true believer; he who cannot do this but uses his tongue, is a believer too; and he who cannot, do even this, but uses the power of his heart, is also a believer; but less than this, there is no degree of faith-(Muslim). The vital importance of Tabligh (the task of propaga- tion] has been further emphasized by Imam Ghazali, (rah- matullah alaih) in the following manner: \"There can be no doubt that the act of \"amr bil maruf wa nahi anil munkar\" is that solid pillar of Islam, on which each and every article of faith rests. It is for this very mission that Allah Ta'ala deputed all the Holy Prophets. If unfortunately, it is ignored or forgotten and its methods and practices are given up, one has to say that the very purpose of prophethood is totally defeated and rendered meaningless. Thereafter, the conscience, which is the capital wealth of man, will wither and degenerate. Indolence and dullness of mind will prevail. The highway to vice and arrogance will be opened up and barbarity will spread in the whole world. All achievements of man will become danger- ous and even harmful. Human relationship will break Muslim Degeneration and its only Remedy 15 down. Civilization will be ruined. Mankind will be reduced to utter moral destitution. But, the vivid realisation of all this will come only on the Day of Judgement, when the entire mankind will be under trial before the Almighty Allah Ta'ala and called upon to'account for each and every action.\" \"Alas! alas! the fear has come true, that which was apprehended is before our eyes. The tower of knowledge and enlightenment has been demolished and its benefits and effects have been com- pletely wiped out. Consequently, mutual contempt and humiliation are rampant. Nothing, of the sublime relation- ship between man and his Creator, is left in human hearts; on the contrary, man, like an animal, has become the slave of his passions. Indeed, not only is there a paucity of true Muslims in this world now, but it is practically impossible to meet anyone who is prepared to bear the inevitable pri- vations for the sake of propagating Islam. \"Any Muslim who dares to take steps to remove the present state of ruin and devastation, endeavours to revive the act of propagation and comes forward to shoulder that I I heavy responsibility, will surely rank as the noblest and the most distinguished being among the whole of man- kind.\" He said this nearly eight hundred years ago, but his statement is very accurately applicable to us today. C 0 *= - We must ponder and calmly think out what is to be 6 $ done in these circumstances. There are some well-known %& causes which seem to be responsible for the apathy and in- ,g 5 difference that prevail today. These are discussed below. E 3 .- .- - -a 5 s 1 Muslim Degeneration and its only Remedy 17 CAUSES FIRST We generally believe that the act of Tabligh is the sole and special responsibility of the \"ulema\", even when the relevant injunctions of the Quran are clear and squarely apply to each and every living Muslim. The actions and the hard work of the Companions of the Holy Prophet (sallalla- ho alaihe wasallam), and all those distinguished Muslims who immediately followed them, bear definite testimony to the contention that each and every Muslim is responsible for the propagation of Islam (Tabligh). 'I'o assign the obligation of 'l'abligh (amr bil maruf wa nahi anil munkar) solely to the ranks of \"ulema\", and not to ourselves, is a sign of grave ignorance on our part. The duty of the \"ulema\" is to state the truth and to point out the right path. To enforce the righteousness among the people and to keep the people moving on the right path is the responsibility of all other Muslims. The following \"Hadis\" is a clear exhortation to this: ' I J J I J tIj 3~~ & &,$I >$J , &j . - 9 i& pj tlj p 91 ' I L t $% 2% $j - a * @ tlj &jjlj ' @ J& $j +$ ' J.. t' Jb&cIjA$Ij < ~ d & ~ j f J j j ~ ~ & ~ l if\"^ ' I ' ' I ' .* j *$j - ~ , b ] . +j - - 3 >& pj tlj @ ' i+$j eu ,.- \"Lo! All of you are leaders and shall be questioned on the Day of Judgment in respect of your trust. So, the king is a head unto his subjects and shall be ques- tioned in respect of them; the husband is a head unto his wife and shall be questioned in respect of her; the wife is a head unto her husband's house and the r:hil- dren, and shall be questioned in respect of them all: the slave is a watchman unto his master's effects and shall be questioned in respect of those. So you are all shepherds, and you shall be questioned in respect of that entrusted to you.\" And similarly, in another place, a yet clearer version is given: 1 The Holy Prophet (sallallaho alaihe wasallam) said: I \"Religion is the act of counselling.\" (The Companions) i enquired: \"On whose part (to counsel)?\" He said: \"On the part of Allah, the Apostle, the leaders of the Mus- lims and the lay Muslims.\" Even if we suppose, as an extreme case, that this task has to be carried out by the \"Ulema\" only, the present emergency and the critical situation demand that everyone of us should put his shoulder to the wheel and strive hard for the propagation of the \"Kalimah\" and the protection of theMuslim way of life. I SECOND I It is commonly believed that, if a person is firm and steadfast in his own faith (eeman), the infidelity of others will bring him no harm, because of the meaning attached to the following verse of Holy Quran: \"0 you who believe! you are responsible for your own souls. He who goes astray cannot harm you, while you are on the path of righteousness.\" g s% In fact, the real meaning and sense of the above verse is not what is being apparently attached to it, because, in ~2 that case, the meaning would appear to be against the Div- -2 g ine wisdom and spirit and against the teachings of the .8.2 - \"Shariat-i-Mohammadiah.\" It indicates that the collective * w life and progress and salvation of the Muslim society as a 5 z whole are the essence of Islam. The Muslim people must be considered like a single body having several limbs. When any limb receives an injury, the whole body suffers from the pain. I Mankind may progress to any limit and it may reach the highest pinnacle of glory in every sphere of life, yet</p></div>",
+        "sections": [
+            [
+                30,
+                16562
+            ],
+            [
+                16562,
+                32955
+            ],
+            [
+                32955,
+                49680
+            ],
+            [
+                49680,
+                60504
+            ]
+        ]
+    }
+]);
@@ -0,0 +1,21 @@
+// Fazail-e-Amaal Data Shard: book 7
+fazailData.stories.push(...[
+    {
+        "id": 44,
+        "bookId": 7,
+        "chapter": "The Remedy",
+        "title": "The Remedy",
+        "preview": "the remedy. It is now up to us to set about the revival of the obligatory task of \"Tabligh\". It will be only then that we can hope to regenerate the t...",
+        "content": "<div class=\"story-content\"><p>the remedy. It is now up to us to set about the revival of the obligatory task of \"Tabligh\". It will be only then that we can hope to regenerate the true faith of Islam in the masses. By this means alone can we recognise and truly understand both Allah Ta'ala and His Holy Prophet, Hadhrat Mohammad (sallallaho alaihe wasallam), and will be able to clearly understand and finally submit to their commands and wishes. To achieve all this, we will have to adopt the exact methods and ways which are laid down and were demon- strated by the Holy Prophet (sallallaho alaihe wasallam) himself when he reformed the pagan Arabs. Allah Ta'ala says in the Quran: \"Indeed the Holy Prophet (sallallaho alaihe wasallam) is the perfect example for you to follow.\" In this very connection, Hadhrat Imam Malik (rahma- tullah alaihi) said: '. dji ligjz91 ?&?T&& Reformation of the last (part) of this (Mohammad's) Ummat will not be possible except by adopting the method which was used in the beginning (by Hadhrat Mohammad sallal- laho alaihe wasallam). In the beginning, when the Holy Prophet (sallallaho alaihe wasallam) had started to call the people to Islam, he did not have a single supporter behind him nor had he any political power or possessions. The Pagan Arabs were arro- gantly independent and self-opinionated. No one among them was prepared to listen to reason or truth or obey another person. They strongly disliked and were deadly opposed to the \"Kalimah-tul-Haq\", which the Holy Prophet (sallallaho alaihe wasallam) had the sole mission to teach. In these circumstances, one wonders what gave such invis- ible power and force to that one single man, who was wordly poor and without any means, that he eventually was able to draw the whole of the Arab nation towards him. First we ought to carefully think and see what was it towards which he beckoned the people; initially they refused, but came running towards him as soon as they per- ceived the light, and stood by him so close that they never left him again. It was the message of Eternal Truth to which he called!-that and only that (Truth), which was the Holy Prophet's (sallallaho alaihe wasallam) sole mission and aim in life-and which he so beautifully presented to the people! It is: ( 7 d l J ) . 1 4, .g 1 \"That we worship nothing but Allah, and associate g! none with Him as His compeer or rival, and none of us considers another god except Allah.\" The propagation of that same very truth can bring the very same results again. The Holy Prophet (sallallaho alaihe wasallam) forbade his followers from looking upon any 'Being' except Allah 26 Muslim Degeneration and its only Remedy Muslim Degeneration and its only Remedy 2 7 Ta'ala for worship or obedience. Not only did he succeed in achieving his aim, but was able to cut all ties between his followers and every alien element, and bound his people in one uniform system of life from which they never tried to break away again. They really became the picture of: \"Follow that which has been sent to you from the Sus- tainer, and do not follow others (considering them) as Protectors except Allah Ta'ala.\" This was the real lesson, which the Ho!y Prophet (sal- lallaho alaihe wasallam) had been commanded (by Allah Ta'ala) to teach and spread. It is further clear from the fol- lowing verse: \"0 Muhammad! invite people to your Lord with wis- dom and better counsel, and argue with them in such wise as ,is best; verily your Lord knows the one who wanders' astray from His path, and He knows those who are bn the right path.\" The highway marked for the progress of the Holy Prophet (sallallaho alaihe wasallam) and .his followers is further declared in the following verses: \"0 Muhammad! say, this is my path, and I invite you towards Allah Ta'ala knowingly, I and my followers too: and Allah is all pure and never will I join partners with Allah.\" To call mankind to Allah Ta'ala and show the right path to all those who had gone astray was the only mission and the sole purpose of the Holy Prophet's (sallallaho alaihe wasallam) life. To serve this very purpose, thou- sands of prophets had been deputed before him. As Allah Ta'ala says: \"And We did not send any Prophet before you, but that We revealed upon him that verily there is no god but Me and so worship Me.\" The sacred biography of Hadhrat Mohammad (sallalla- ho alaihe wasallam) and also those of other Prophets indi- cate one single aim as the sole mission of their lives: i.e., to believe in One True Allah Ta'ala and His one Divine Per- sonality and His Attributes. This belief is the essence of the faith of Islam. It was to practise and demonstrate this very faith that man has been sent on this earth, as will be seen from this verse: I \"And We have not created the genii and human beings but to worship Me only.\" We should by now ought to be able to understand the real purpose for the creation of man and the way we, par- 5 h ticularly Muslims, should live; we also know the true dis- 3 T ease from which we suffer and its treatment; it should, therefore, not be difficult then to find out how to apply that 8h-h 4 treatment and regain our lost vitality. If we bear in our 4 5 mind all that has been discussed so far, and with that back- .g ground act sincerely, any method adopted will \"Insha ,$ J Allah\" prove to be beneficial and successful. However, a proven successful method is described. \"And who is better in speech than one who invites you towards Allah Ta'ala, does good deeds and says, verily, I am of those who submit their will to Allah.\" Muslim Degeneration and its only Remedy 29 COURSE OF ACTION With the very limited knowledge and understanding that I have about such a vital matter as \"Tabligh\" (enjoin- ing good and forbidding evil), a scheme of work and action is described below, for the improvement of Muslims and their progress in Islam. Actually, what I have to say is nothing else than a brief outline of the practical way of life which had been followed by our ancestors and early Muslims. The FIRST and the FOREMOST thing to do is to change the aim of our life, from material motives and ac- quisition of .wealth, to the propagation and spreading of Al- lah Ta'ala's \"Kalimah\" and Islam; to fix as a definite objec- tive for ourselves, the enforcement of the commands and orders of Allah Ta'ala; and to sincerely resolve: I will obey every command of Allah Ta'ala, shall try to practise it in my dgily life and will not disobey Allah Ta'ala in any cir- cumstances. The fulfilment of this resolution must be made the main aim of life. We can plan and act on this broad base by adopting the following practical scheme and pro- cedure: (1) To memorise and correctly recite the \"Kalimah\": And to understand its literal meaning, as well as what it actually implies. That is, to believe, to say, and to act on the faith that Allah Ta'ala is the only Power, the onlv Authority and the Sale Controller of all things, and it is He alone who is to be worshipped and obeyed, and it is He alone who grants suc- cess or failure in life. Success will depend on our truly adopting the way of life preached and taught by Hadhrat Mohammad (sallallaho alaihe wasallam) and our accepting him as true and last Prophet of Allah. Having this as ideal, we begin to change our own life on the pattern requirements of the \"Kalimah\". (2) To become punctual and regular in offering our prayers (naniaz) five times a day. The performance of this most obligatory duty ought to be strictly in accordance with the procedure laid down by Hadhrat Mohammad (sal- lallaho alaihe wasallam), to be periormed in utmost humil- ity and supplication. The greatness and superiority of Allah Ta'ala must be held uppermost in mind throughout the prayers, whilst maintaining the feelings of one's own humbleness and helplessness. In other words, \"namaz\" should be performed as if one was actually being presented to Allah Ta'ala in a manner befitting the Height of His Greatness and Glory. If the procedure of \"namaz\" is not known, it ought to be learnt properly with each detail com- mitted to memory. 7 (3) To develop attachment of body and soul to the Holy Quran in the following manner: (a) To recite daily a portion of the Quran, however small, with highest respect and reverence for the holy scripture and by understanding its meaning, if possible. If one is unable to understand the meaning, he may still recite the text with the pur- pose and hope that his salvation and progress depends on it. Simple recitation of the original words and lines is also a great blessing. If a person is unable to read, he ought to spend a litle time daily to learn to read. (b) To ensure that one's own children as well as those of the neighbours and friends are taught the Holy Quran and other essential religious books as a first step in their learning. (4) Some time should be devoted each day to zikr, 3%. which means concentrating on the Omnipotence, the Great- 8 8 ness, and the Attributes of Allah Ta'ala, and to offer DUROOD [prayers] for the Holy Prophet (sallallaho alaihe %& 7 wasallam). In this connection, guidance should be sought from a \"Sheikh-e-Tariqat\" (a learned and saintly person), z; who should be carefully selected for his distinction in piety and his capacity to follow \"Shariat\" and \"Sunnah\". He may prescribe certain \"Wazaif\" (special verses) to be re- cited during the times of \"Zikr\". In case no such holy per- son can be contacted, it is suggested that the following \"Wazaif\" may be repeated a hundred times (one tasbih of 100 beads) each, both in the morning and in the evening: 3 0 Muslim Degeneration and its only Remedy (a) Third Kalimah, (b) Durood (praying blessings for the prophet). (c) Istighfar (seeking forgiveness of Allah). (5) Every Muslim must be considered as one's real brother and must always be given affection, sympathy and sincere attention at all times, particularly when he is in need. The fact that a person professes the faith of Islam automatically entitles him to brotherly respect and rever- ence from all Muslims, who must at all times refrain from causing him any physical or mental harm. The above practices should be strictly enforced in one's own life and, at the same time, efforts should be made so that other people may follow them as well. The only and the best way to achieve this is to devote some time specially for learning and inculcating in oneself these fine Islamic qualities, and also persuading others to make similar efforts. Thus a joint and collective campaign will automatically ensure for the growth and expansion of Islam in its true form, which is the real and urgent need of the day. It was exactly this type of work, which every Prophet of Allah Ta'ala had to do as his sole occupation. For the sake of this work, almost all Prophets had to bear untold miseries and perils. The worthy Companions of Hadhrat Mohammad (sallallaho alaihe wasallam), as well as many other distinguished Muslims of the early period of Islam, spent the whole of their lives in striving hard and strug- gling for the religion of Islam in this very manner. Most of them sacrificed their lives in the sacred path of Allah Ta'ala. It will be our misfortune and enormous loss if we do not devote a part of our lifetime, however small a period it may be, towards propagating and perpetuating Islam. We must confess that it is due to our negligence in this vital task that the Muslim society has reached its present state of low morale and virtual collapse and, therefore, we must rise and make manifold efforts. r Muslim Degeneration and its only Remedy 3 1 I Previously, the very purpose of being a Muslim was to be ready to lay down one's life, honour and wealth for upholding Islam and the Kalimah. In those days, if anyone did not do that, he was considered to be ignorant and a useless fellow. But alas! today, although we feel proud to be called Muslims, we remain totally unmoved by the fact that every particle of Islam is being destroyed one by one before our very eyes, and not a finger is moved to check this terrible loss. If we realise this we can appreciate that the propagation of Islam is our real mission in life, and 7 therein lies our very existence as Muslims and also our 1 success, glory and ultimate salvation. The opposite is also true that by neglecting this important task we suffer from I moral degeneration and social degradation. The only remedy for this is that all of us must sincerely repent our lethargic and injurious past and take immediate steps to re- vive the act of Tabligh as our major occupation. It is only then that we can expect the mercy and compassion of Allah Ta'ala to flow, to bring us triumph and happiness both in this life and the hereafter. This does not mean that we should give up everything 1 else, i.e., our profession-trade or employment and take entirely to this work. It really means that, as we devote our whole-hearted attention and time to other material voca- tions, we should also attend to this work. As and when some persons find themselves ready to take up this sacred 1 task, they should try to contact their friends or such per- sons in their neighbourhood who may already be engaged I in this work and spend a few hours a week in their com- pany. The next step will be to spend, under the guidance of those people, full three days every month outside in a I locdlity or a village other than one's own. Later, but as 34 early as possible, to pass one full month, or better still, for- 6 g ty days annually in some distant area in similar manner. g;_ i Lastly, the real requirement in \"Tabligh\" is to spend con- 4.5 tinuously four months once in the lifetime, in a given place or area. All these periods are to be spent entirely in the 5 ; pursuit of learning and propagation of the true faith of 5 Islam and adopting the actual way of life under the Sacred code of \"Shariat\". Thus our efforts will become extensive and ultimately reach every person, rich and poor, employer and employee, Land-Lord and Peasant, learned and ignorant, to join hanas in this work and become bound in the ties of true Islam as ordained by Allah Ta'ala and the Holy Prophet Mohammad (sallallaho alaihe wasallam), PROCEDURE TO WORK The most important factor in the task of Tabligh is the manner and the method of approach, which simply means to follow closely the lines adopted by the worthy Compan- ions of the Holy Prophet (sallallaho alaihe wasallam) strict- ly in accordance with his teachings and practices. The method adopted by the Holy Prophet (sallallaho alaihe wasallam) was as follows: A jamaat or group of at least ten men should be formed. One of them should be selected \"amir\" (leader). They should get together in a mosque, make ablutions and offer two \"rakaat 'nafil' prayers. After this, all should sup- plicate together and beseech for Divine mercy, help and guidance for success in their efforts and remaining stead- fast and resolute in their task of Tabligh. For all this time, \"zikr\" should be recited by all, and every precaution should be taken not to indulge in idle talk. On reaching the place for \"Tabligh\", once again the \"jamaat\" should sup- plicate and beseech for Allah Ta'ala's mercy and help in their mission. The place of Tabligh will be the vicinity of a mosque of the locality where the work is to be conducted. A part of the \"jamaat\" should be detailed to tour the local- ity calmly, and quietly inviting people to the mosque, where \"ta'leem, (reading and teaching out of religious books) should be in progress and later the \"namaz\" (pray- ers) of the time should be offered. After this, one of the members of the \"jamaat\" should place before the people, in an affectionate and calm manner, the importance and urgency of reviving Islam in each and every Muslim as or- dained by Allah Ta'ala and the Holy Prophet (sallallaho alaihe wasallam), giving out as simply as possible the car- dinal points of Tabligh and the way to accomplish them. Finally, the people should be persuaded, again in a cordial manner, to join hands in this sacred task and come out to do the work of Tabligh like the Jamaat itself. Later, some members of the \"jamaat\" may accompany the people to their homes, where the womenfolk should also be addressed and persuaded to do similar duty amollg women. ' In formal prayers, a rakaat means one complete action comprising standing, kneeling and bowing by placing the forehead on the ground, two \"rakaat\" means two such actions. Muslim Degeneration and its pnly Remedy 33 They should be told to be regular in their daily pray- ers. All this should be done without entering the private portion of any house. The women should also be told to strictly follow the cardinal points of \"Tabligh\" in their daily life and observe \"pardah\" in accordance with the \"Shriat\". After this, all such people who may be prepared to join the work should be organized into a separate \"jamaat\", with and \"amir\" from among themselves. They should first be made to work under the guidance of the members of the original \"jamaat\". The important point to be remembered at this stage is that every person engaged on \"Tabligh\" must fully obey his \"amir\" and the latter, in turn, should ensure that his personal services and attention are available to each and every member of his Jamaat. He must see to every person's welfare, comforts and morale and, before taking any decision, he must consult all his colleagues. The following general principles of the work of \"Tabligh\" should be carefully noted at all times. GENERAL PRINCIPLES In its real form and sense, \"Tabligh\" is the most im- portant type of worship of Allah Ta'ala and it amounts to a blessing of very high order. It literally means to follow in the footsteps cjf the Prophets. Truly, as the work is of a very superior character, it must be based on equally high prin- ciples, which ought to be strictly followed throughout. Each participant must feel that it is he who needs to im- prove himself rather than thinking of reforming others. g , During the course of work and, even away from it, he must .c Z try to behave as a perfect Muslim, as a faithful slave of Al- c i lah Ta'ala, constantly obeying and following the Divine &3 commands of \"Shariat\" and always seeking Allah Ta'ala's 4 $ mercy and pleasure. This is the basic requirement and the .g -2 soul and foundation of the work of \"Tablfgh\". Once it is 3-u deeply and firmly embedded in the hearts of workers, the 5 3 other principles, rules and practices, some of which are narrated below, will become easy to follow: (1) As far as possible, all expenses, including travel- ling, food etc., must be borne by each individual himself and, if he can afford, he may quietly assist those compan- ions who may be in need. 34 Muslim Degeneration and its only Remedy (2) All fellow workers and companions in this work must be given full respect, shown tolerance, be cared for and encouraged at'all times by one another. Such partici- pation will prove a great blessing for the whole area where the \"jamaat\" may be working. (3) Conversations, talks and discussions must be con- ducted in soft and persuasive tones, using simple and polite language. All types of displeasure with each other must be avoided. The \"ulema-e-karam\" (scholars of Mus- lim scripture) must be held in high respect and esteem as we usually display for the \"Holy Quran\" and \"Hadis\", be- cause, it is through these learned personages that Allah Ta'ala has blessed us with the true knowledge of Islam and enlightenment. Any disrespect towards them, however in- significant, may amount to contempt of Islam itself, which in turn may provoke the wrath of Allah Ta'ala for the whole community. (4) Leisure and free moments must be spent either in reading good religious books or in the company of pious and learned companions; by this means one will be able to learn many right things about the faith of Islam, about Al- lah Ta'ala and His apostle. Particular care must be taken of the time given to the \"Tabligh\" work itself, that nothing unimportant, useless or senseless is uttered, discussed or done. (5) To endeavour to earn an honest and pure living, to be most careful and frugal in expenditure, and to con- stantly observe every single obligation, however big or small, towards one's family, relations and acquaintances. (6) No controversial matters or points of secondary im- portance be discussed at any time. The total time must be devoted to bringing out the Divinity, Oneness and Omni- potence of Allah Ta'ala and to confine all talk to the main points of \"Tabligh\", which are in real sense the basic prin- ciples to be followed by each and every Muslim at all times. (7) Every action, work and speech must be fused with sincerity and honesty of purpose, for an act, however small, but imbued with this quality is destined to bring high rewards and plenty of well-being. On the other hand, an insincere act, however big, will not bear any worthwhile fruit or benefit, either in this life or in the hereafter. Hadh- 67 Muslim Degeneration and its only Remedy 35 rat Mu'az (Radi Allaho anho), who was appointed as Gov- ernor of Yemen, begged the Holy Prophet (sallallaho alaihe wasallam) to give him some s ecial advice. The Holy f Prophet (sallallaho alaihe wasal am) was pleased to say, \"Be meticulously honest and sincere in matters of religion: a little done with sincerity is enough\". There is yet another \"Hadis\" in the same connection, \"Allah Ta'ala accepts only such actions and deeds which are performed purely for His pleasure and accord\". In another place' it is men- tioned \"Allah Ta'ala does not look at your face nor at your property, but only at your hearts and deeds\". So the crux of the matter is that the work of \"Tabligh\" must be performed with all sincerity and honesty, No show or ~utward appear- ance is to be put on. The degree of success and progress will depend entirely on the depth of our sincerity. SUMMARY AND CONCLUSION A brief sketch of the work of \"Tabligh\", its importance and urgent need have been discussed. It now remains to be I judged as to how all this can guide us and bring us the de- sired relief and benefits in these times, which are fraught with confusion, unrest and rivalries. For this, once again, we have to seek guidance from the allwise \"Holy Quran\", which refers to the hard work and i endurance for the faith of Islam as a highly profitable busi- i ness, and puts it across in the following manner: i \"0 you who believe! shall I point out to you a trade that will shield you from a grievous doom? Believe in Allah and His Messenger, and perform \"jehad\" in His way with your wealth and lives. This is best for you, if I you understand. Your Lord will forgive your sins, and you shall enter Paradise, under which ripple (beau- teous) streams, and stately abodes in everlasting gar- dens; and this is great success . . . And another which you covet much, i.e., succour from Allah and victory near at hand; and give glad tidings to those who believe.\" The above verse describes a trade, which if accepted promises deliverance from all types of afflictions and pun- ishments. The trade is meant: to have a firm faith in Allah Ta'ala and His Apostle and to struggle hard in the path of Allah, without shirking to use one's life and wealth. This again points to the act of \"Tabligh\", which can ensure for us everlasting well-being and happiness. It is this simple work which will bring us great benefits, such as the for- giveness for all our sins, deliberate mistakes and short- comings and high rewards in the life hereafter. So much for the success in the next life, which really is the greatest Muslim Degeneration and its only Remedy 37 triumph for a Muslim, but there is also clear hint for this life too. We shall get what we cherish most, such as pros- perity, divine help and success against all our adversaries! In other words, Allah Ta'ala has demanded two things from us, firstly to have firm faith in Him and His Apostle. secondly, to struggle hard in His path, giving, if need be, our lives and all that we possess. In return for this, He has also promised two things: first a beautif91 and peaceful abode in Heaven (Jannat) with an eternal life, and everlast- ing happiness: and second, glory and success in this life. The first demand on u s i s that of faith (eiman). This is exactly what the \"Tabligh\" is meant to bring to us, that we should all be endowed with the wealth of true faith. The second demand is that of striving in the path of Allah, which actually means \"jehad\". Jehad may ncrmally mean fighting a war against oppressors and non-believers. In the practical sense, however, it means spreading of Kalimah of Allah and enforcing of Allah's Commandments, which is also the ultimate aim of \"Tabligh\". It should be clear to us now that the happiness and success in the life after death is solely dependent on having firm faith in Allah Ta'ala and His Apostle, and in striving hard in the path laid down by Him. Similarly, the success and prosperity in this life too depend entirely on that very faith and on spending all our efforts in the path of Allah Ta'ala. When we fulfil these basic requirements, firstly of faith in Allah Ta'ala and His Apostle. and secondly of struggling hard in their path, through these two attributes alone, we can adorn ourselves with high moral virtues and excellence 6 , of character. Only then can we fit to receive the promised r Z vicegerency of Allah Ta'ala and His kingdom on earth. 5 which are bound to come as is promised in the Holy O& Quran: 4 Z . . L;i gjLl j *' \\ 1 , 1 ? * , \\ j $9 E ii ', . . - P' d - , I .@dj .& &-j\\ &jI # w, ( .& > 5 2 . .< . * .. ( \" 0 ,JI) . =i. &,& 6 GI w p g 2 \"To those of you who believe and do righteous deeds, Allah promises that He will certainly givc dominance 38 Muslim Degeneration and its only Remedy to them in this world as He gave to those before you; and the religion that has been chosen for them shall be strengthened for them, and He will thereafter certainly transform their fear into tranquillity, provided they worship Me and associate none with Me.\" The above verse portrays a forthright promise of king- dom, but through \"eiman\" (firm faith) and righteous deeds. This was actually fulfilled in the days of the Holy Prophet (sallallaho alaihe wasallam) and remained in effect right through the period on the \"Khulfa-e-Rashidin\" (the first four Caliphs after the Holy Prophet (sallallaho alaihe wasallam). Practically the whole of Arabia had become an Islamic State in the days of the Holy Prophet (sallallaho alaihe wesallam) himself and the rest of the countries (Muslim countries of today) mostly joined Islam during the period of \"Khulfa-e-Rashdin\" or immediately after their time. Later on too, the promise continued to be fulfilled in favour of a number of Muslim kings and \"Khalifas\" and it still awaits materialisation if someone fulfils the con- ditions, as is clear from the next verse: ,., -.9 41 +k \"Surely Allahs followers shall dominate\" In these few pages, an analysis of the present situation and a practical solution for improving it has been given; in fact the solution is nothing else than the actual Islamic way of life, which belonged to our forefathers and early Muslims. CONCLUSION In conclusion, it can be said that there is no way to gain honour, happiness, peace and tranquillity in this life other than to adopt and firmly hold on to the work and system of \"Tabligh\". for which everyone of us must use all his energies and wealth. (1 .r d,+ JT~ 149 ~j 41 +: I e I j \"Hold fast to the rope of Allah and do not create dis- sensions.\" FINAL APP~AL This very system has actually been put into practico, in the recent past, in the territory of Mewat (an area of Alwar Muslim Degeneration and its only Remedy 39 State) and a few other districts around Llelhi (India). The work in that region, has not yet reached the final stage; the progress of the local Muslims, however, has been quite marked. The blessing and benefits of the system of \"Tabligh\" are clearly visible and worth witnessing. If all Muslims collectively resolve to follow the noble example mentioned above and adopt the correct system of life, as described in this book, there is every hope that, through that effort, Allah Ta'ala may obviate all our miseries and adversities and we may be able to regain our faith, the I power to do righteous deeds and the resultant honour, dig- nity and glory in this life and attain permanent salvation in the next. The Muslims can then set an example for the rest of the World to live in peace, tranquillity and happiness, which is the natural desire of every man on earth. An attempt has been made to explain as early as poss- ible the real purpose behind the writing of this book, which is to present to the readers the sketch of a practical way of life, which about thirty years ago had been initiated and vigorously followed by Hadhrat Maulana Mohammad Ilyas Sahib, \"rahmatullah alaih\". He had in fact dedicated all his life for this sacred purpose and mission. It is up to us, the Muslims of the present time, to understand our obligations towards Islam and fulfil them in our own interest and that of the coming generations and the mankind at large. The way is clear and well set. Let us begin the march and fix our minds on the final goal, which is to acquire the pleas- ure and approval of Allah Ta'ala. Six Fundamentals by Maulana Aashiq Ilaahi Six Fundamentals In the name of Allah most Gracious, most Merciful. First Lesson: Kalimah Tayyibah Laa ilaaha illallaahu, Muhammadur-Rasulullaah. This kalimah is just a sacred pledge of man with Allah. That is, when a believer solemnly reads this kalimah, he admits before Allah that he is His sincere and faithful ser- vant, he will obey His-commandments, and will avoid all the forbidden things. Therefore, one must keep in mind four important points about this kalimah: First, he should remember its words in the correct form. Second, he should remember its correct translation. Third, he should remem- ber its exact meaning. Fourth, he should observe its practi- cal requirements, and act accordingly! Its Words and their Translation This kalimah has two parts; first: \"Laa ilaaha illal- laah\"; second, \"Muhammadur-Rasulullaah\"; and their translation is: \"No one is worthy of worship but Allah, and Muham- mad is His true Messenger.\" The Meaning of this Kalimah When a believer admits that no one is worthy of worship but Allah, it necessarily means that he should worship none in the whole universe, but the Almighty, and should bring no partner to Him in worship, concerning all the principles of Islam. He should believe Him to be his sole guardian and Helper in distress, to be present every- 4 where, seeing and hearing everything in the world. He .z 1 should trust in His guidance, and should faithfully obey a His commandments; moreover, he should not follow the '? customs and usages, that are contrary to His command- = 2 Six Fundamentals Six Fundamentals 3 ments. In all the affairs of his life, he should follow the teachings of the Holy Qur'aan; he should hope for His mercy, and should fear His wrath; he should completely rely upon Him for his guidance! The second part of the kalimah, that is, \"Muhamma- dur, Rasulullaah\" means, that after believing in the unity of Allah, when I would desire to follow the commandments of Allah, I cannot do so unless I keep Muhammad (Sallal- laho alaihe wasallam) my instructor and guide to the Right Path. That is, I will worship Allah just as he has told me; he is a faithful and true messenger of Allah, who taught us nothing of his own will or desire. The obedience of Rasu- lullah (Sallallaho alaihe wasallam), is really the obedience of Allah, and love for him, is love for Allah; one must be- lieve that to be obedient to him is an obligatory thing, and he should submit to his orders, without any objection. Whatever he has told us of the unseen things like angels, like Hell, Paradise the incidents in the grave, and the Res- urrection, we must believe in them, though we could not understand them. We must believe that the method of living, which he has told us, and has behaved himself accordingly, is the method which has been appreciated by Allah; and anyone who acts contrary to it, does not tread the Right Path, and is not loved by Allah. The Requisites of Kalimah Tayyibah When a Muslim has firm faith in the kalimah, un- doubtedly he becomes a true believer, and then he has to abandon all the forbidden things, and to observe the com- mandments of Allah. That is why Rasulullah (Sallallaho alaihe wasallam) has said, \"The first effect of 'Laa ilaaha il- lallaah' is that it should prevent its reader from all the for- bidden things.\" Therefore, the reader of such a sacred kalimah must observe the commandments of Allah on all occasions. He should keep them in mind in marriage, on death, on taking meals, on going to sleep, on waking up, on deals, and on all other occasions; he should faithfully ob- serve the commandments of Allah, and should give up the forbidden things. The Benefits of the Kalimah This kalimah has many spiritual benefits. Rasulullah (Sallallaho alaihe wasallam) said, \"The most distinguished zikr is 'Laa ilaaha illallaah'. Again he says, \"Read the kali- mah a hundred times every day, for it is the best compensa- tion for one's sins, and no good deed is better t-han it.\" In another hadith he says, \"Whoever reads 'Laa ilaaha illal- laah' a hundred times in the morning, and a hundred times in the evening shall have the reward of one who has re- leased ten slaves from the posterity of Ismaa-eel (Alayhis salaam)\" In another hadith Rasulullah (Sallallaho alaihe wasallam) says, \"Keep your faith fresh by reading and ob- serving 'Laa ilaaha illallaah.'\" I Second Lesson: Salaat When a Muslim has firmly believed in Kalimah Tayyi- bah, he has made a sacred pledge to obey all the command- ments of Allah; of which the first and foremost is salaat which must be observed by every adult, male or female, five times a day. In other words, those who perform the prayer regularly, after believing in the kalimah, they practi- cally fulfil their promise with Allah, made through the ka- limah; and those who are not regular at the prayer, they practically belie their promise with Allah, to be His faithful servants; of them said Rasulullah (Sallallaho alaihe wasal- lam) \"Whoever ,abandoned the prayer intentionally, he become an infidel\". In another hadith he says, \"Whoever gave up the prayer, he will be raised among Qaaroon, Fir'own, his minister Haamaan, and the famous hypocrite Ubayy bin Khalaf, on the Day of Resurrection.\" Next to the kalimah, prayer is the most distinguished of all good deeds. It has been mentioned in the hadith that the first thing brought to account on the Day of Judgement, will be the prayer. If one's prayer is perfect in every re- spect, he will certainly attain salvation, otherwise he will be deprived of all the boons and favours of Allah, and will suffer a great loss. Therefore, one should observe the prayer #+ at the appointed times, with good wudu and complete de- f votion, that one may not be raised with the infidels, and should be delivered from the hell-fire. Whatever is read in the Prayer (that is, 'Subhaanak-Al- I lahumma' and Attahiyyaat etc.), should be remembered I well, that no mistake should occur during the prayer. One must know the fardh, the sunnah, and all the conditions of prayer, so that it may be correct, and by having concentra- tion, it should be performed well. A great merit of the prayer is, that all the limbs of a 4 Six Fundamentals worshipper, namely, hands, feet, head, waist, nose, fore- head, tongue etc., are wholly and solely devoted to Allah, that is, every part of a worshipper's body is engaged in an exercise of the obedience of Allah's commandments. If a Muslim performs the prayer with all its conditions, he is not likely to commit sin by any limb, on times other than the prayer. It has been mentioned in the Holy Qur'aan that the prayer prevents a Muslim from shameful and forbidden things. The believers have been commanded hundreds of times in the Holy Qur'aan to perform the prayer properly. In the hadith also the prayer has been enjoined and empha- sised many a time. For instance, Rasulullah (Sallallaho alaihe wasallam) said, \"One's sins from one prayer to an- other are forgiven by Allah\". In another hadith he says, \"If one has a stream at one's door, and he has a bath in it, five times a day, he will have no dirt on his body; similarly if one performs the .prayer five times a day, his sins will be pardoned by Allah, and he will !be clean of them\". In another hadith Rasulullah (Sal- lallaho alaihe wasallam) says, \"When your children are seven years old, instruct them to perform the prayer, but when they are ten years old, beat them to perform the prayer.\" Prayer with Congregation Rasulullah (Sallallaho alaihe wasallam) says in a hadith, \"The prayer with congregation is granted a reward twenty-seven times more than the prayer performed alone\". It has also been mentioned in a hadith that Rasulul- lah (Sallallaho alaihe wasallam) intended to burn the houses of those who did not visit the musjid to perform the rayer with congregation, but he abstained from doing so, [ecause of children and women. Ibn Mas'ood (Radhiyal- laho anho) says, \"During the time of Rasulullah (Sallallaho alaihe wasallam) only that hypocrite dared neglect the prayer who was a declared hypocrite.\" It has also been mentioned in a hadith that peforming the night prayer with congregation begets the reward of prayers till midnight; and performing the morning prayer with congregation, begets the reward of prayers during the whole night. The right way to perform rukoo' and sajdah Rasulullah (Sallallaho alaihe wasallam) says in a Six Fundamentals 5 hadith, \"Allah does not look to the prayer of one, who does not keep his waist straight in the prayer (he prays lazily)\". In another hadith he says, \"The worst kind of theft is the theft of prayer\". His Companions asked, \"What is the theft of prayer?\" He answered, \"The theft of prayer is, not to per- form the rukoo' (bending the knees) and sajdah (prostra- tion) properly, with full time and attention.\" A prayer out of time Rasulullah (Sallallaho alaihe wasallam) said, \"It is the prayer of a hypocrite to cause delay in prayers, and to wait for sun-set; so when it becomes dull, he gets up to perform it just as a custom, and he remembers Allah but little.\" Third Lesson Knowledge and Zikr There are two important subjects in this lesson; first, knowledge, second, zikr (that is, remembrance of Allah). There are so many sayings of Rasulullah (Sallallaho alaihe wasallam) which stress the utility and distinction of these two things. For instance, a hadith says, \"Beware! This world, and whatever is in it, is cursed by Allah, with the exception of prayers, and zikr, and the religious scholar, and the religious student\". Therefore, every Muslim should try his best to achieve the high standard of knowledge and zikr. Knowledge Only that knowledge is appreciated by Allah, which takes a man nearer to Him, and enables him, to observe His commandments. So much knowledge of the religion of Islam, as would purify and strengthen one's faith, is obliga- tory for every Muslim man and woman. When a servant of Allah has entirely submitted himself to Allah, and has promised to observe His commandments, it is indispens- able for him to know all His commandments, and the method of worship. Yes, he should have a perfect knowl- 3 edge of prayers, fasting, poor-rate, hajj; of mutual dealings B .X f in everyday life, the true Islamic culture, and other import- m or ant aspects of Islamic way of living. Every Muslim should particularly know those basic things about Islam, the ignor- rZ 6 Six Fundamentals Six Fundamentals 7 ance of which is likely to commit sins; and when he has got the knowledge of these things, he must observe them in a practical form, for it has been mentioned in a hadith, \"Verily, the worst punishment of Allah will be inflicted on those on the Day of Judgement, who have been scholars of religion, but did not practice it themselves\". The distinction of a scholar and a student Rasulullah (Sallallaho alaihe wasallam) has said in a hadith, \"Anyone who shows the Right Path to a Muslim, is like one who has already observed Allah's command- ments\". Another hadith says, \"A thousand worshippers are not so annyoing and deadly to Shaytaan, as one person who has achieved perfect knowledge about Islam\". An- other hadith says, \"Anyone who died during the period of attaining knowledge about Islam, his class in Jannah will be only one stage below the Ambiyaa\". Another hadith says, \"The best person among you is he, who has learned the Holy Qur'an and then teaches it to other Muslims\". Ra- sulullah (Sallallaho alaihe wasallam) says in another hadith, \"May Allah keep that person fresh and healthy who listens to my instructions, and then delivers them to others, exactly as I have spoken\". To leave home for the sake of knowledge Rasulullah (Sallallaho alaihe wasallam) has said, \"Whoever left his home for the sake of knowledge (about the Holy Qur'aan and Islam), he will be honoured as one, who has entirely devoted himself to Allah\". The service and help for a student of Islam It has been mentioned in a hadith, that Rasulullah (Sal- lallaho alaihe wasallam) while addressing his followers said, \"Undoubtedly, the coming generation will follow you, for you have followed me. After me people will come to you from remote places to attain the knowledge of Islam. So, when they visit you, it is my will, that you should en- tertain them well\". That is, when the student of Islam visit you, serve them properly, sit in their society, and be cour- teous to them. The use of scholarly meetings Rasulullah (Sallallaho alaihe wasallam) says in a hadith, \"When certain people gather together in the House of Allah (that is a musjid), and they read the Book of Allah (i.e., the Holy Qur'aan) to one another, they are blessed with spiritual consolation and Allah's mercy, the Angels assemble around them, and Allah remembers them among His courtiers (Angels)\". Zikr The second part of the third lesson is zikr. The highest degree of zikr is that a believer should be entirely devoted to Allah, and should never forget Him. This standard of zikr is achieved by constant spiritual exercise, and by con- tinuous remembrance of Allah. Those who have realized the spiritual benefits of zikr, they do not neglect it for a single moment of their life. Rasulullah (Sallallaho alaihe wasallam) instructed a companion of his with the follow- ing words, \"Keep your tongue always busy with the re- membrance of Allah\". In another hadith he says, \"When some people gather together in an assembly, and then get up without remembering Allah, be sure that they sat around the dead body of an ass, and left it; therefore such an assembly will be a sorrow to them on the Day of Qiyaa- mah\". The true believers should remember Allah most often, and by contemplating th\"e wonders of His creation, they should glorify Him, and thereby strengthen their love for Him. The more they remember Allah, the better will be their good deeds, the stronger their faith and knowledge. Then, they will have more and more love for Allah, and their service to Him will be more sincere and realistic. Par- ticularly, during the Tabligh journey they should not forget Allah for a single moment. If all the daily prayers, which are mentioned in the hadith, viz, prayer for going to sleep and waking up, prayer at the end of a meeting, prayer for the beginning and the end of the meals, prayer for entering home and going out, prayer for starting a journey, and prayer for returning from it, prayer for riding an animal (or any other transport), prayer for entering a new town or a city etc., are remembered well, and are read on the relevant occasion, naturally the exercise of the remembrance of Allah can be improved to a great extent. No amount of time 8 Six Fundamentals is sufficient for a sacred thing like zikr, yet most spare time should be devoted to the same; but the least thing that every Muslim can do, is to read the kalimah, and Durood Sharief, and Istighfaar (each a complete Tasbeeh) every morning and evening; moreover, a time should be fixed for the recitation of the Holy Qur'aan. Even some worldly loss can easily be tolerated for the boundless boons of Allah, that are going to be granted to a believer in the next life! The preference of zikr It has been mentioned in the hadith that zikr purifies and enlightens the heart. Another hadith says that nothing saves a Muslim from the chastisement of Allah, more than zikr. Another Hadith says that amongst the negligent, one who remembers Allah most often is like a.glowing lamp in a dark house. A hadith of Bukhaari says, \"One who remem- bers Allah, is remembered by Him among His courtiers (Angels)\". Rasulullah (Sallallaho alaihe wasallam) in an- other hadith says, \"Anyone who remembers Allah most often, is so much preferable to a person, who distributes a great amount of money in the way of Allah\". (Targheeb) Fourth-Lesson Honour for a Muslim The gist of this lesson is that every Muslim should re- alise the rights of other Muslims, and should observe them practically, according to the order of the classes and ranks of his brethren in Islam. Particularly, he should have great regard for the honour of a Muslim, who deserves Teverance by all means, for he has the light of faith in his heart. Rasu- lullah (Sallallaho alaihe wasallam) says in a hadith, \"He is not one of us, who does not respect our elders, and does not show mercy to our youngsters and is not respectful to our scholars\". Another hadith says, \"Only a hypocrite could insult these three person; first, an aged Muslim; second, a religioug scholar; third, a Muslim king, who ob- serves justice\". According to the teachings of the Holy Qur'aan, and hadith, here are the most important qualities of a true be- liever. He should realise the rights of Allah's creatures, and should be polite and humble to them. He should like for others, what he likes for himself. He should not be envious 58 Six .Fundamentals 9 of others, nor should he have malice about them. He must not be proud. He should be courteous and loving to all. He should be the first to greet a Muslim. He should be gener- ous enough to pardon those who have offended him. He should go to visit the sick. He should respect all just as he respects himself. He should avoid back-biting. He should overlook the weaknesses of others. If anyone consults him, he should give him the right and honest counsel. He should give financial help to the poor and the needy. He should not rejoice in the misery of others. And the most distinguished and valuable service to a Muslim is that he should be instructed with a firm faith in Allah, in the Day of Judgement, and to be prepared for it with a lot of good deeds, so that he should be delivered of the chastisement thereon. Undoubtedly, this is the best service to a bro!her in Islam. Islam has instructed all the Muslims with a collective life, and has enjoined unity to them, that they should pro- vide peace and prosperity for one another. For instance, they have been instructed to put on their best clothes, and apply perfume to them for the Jumu'ah and the Eid prayers; they have been prevented from jumping over the necks of the worshippers, or to sit between two persons without their permission, or to remove anyone from his sitting place. Rasulullah (Sallallaho alaihe wasallam) says, \"A true Muslim is he, who does not offend any other Muslim with his tongue or hand; and a true believer is he, who does not cause any loss to another believer\". In another hadith Rasu- lullah (Sallallaho alaihe wasallam) says, \"That person will not enter Jannah, whose neighbour is not safe from his of- fence\". These sayings of Rasulullah (Sallallaho alaihe wasal- lam) clearly indicate that a believer should behave so cour- teously towards others, that they should never fear trouble or a loss from his quarters. In another hadith Rasulullah (Sallallaho alaihe wasal- I lam) says, \"Whoever helps a poor and miserable person, Allah will grant him seventy three rewards, of which only one would be sufficient to put his affairs aright in this world. and the other seventy two rewards will sublimate his ranks in the life hereafter\". Another hadith says, \"When a Muslim leaves his home to see another Muslim, seventy thousand angels see him off, and all of them bless him with the mercy of Allah\". Rasulullah (Sallallaho alaihe wasallam) says about a co-traveller, \"Only that person is 10 Six Fundamentals Six Fundamentals 11 your chief in a journey, who serves his companions best; no one can supercede such a person, except a martyr\". Fifth Lesson Sincerity of Intention This is also called the \"correction of intention\". That is, whenever a person intends to do something good, he must not be tempted by some wordly interest, but should do it purely for the pleasure of Allah, and to have its reward in the life hereafter. This purity of intention can be achieved only when he has a firm faith in the reward which Allah and Rasulullah (Sallallaho alaihe wasallam) have promised for our good deeds, and, therefore, the hope .of this reward should be our motive in good deeds. That is why Rasulullah (Sallallaho alaihe wasallam) has said, \"The reward for your deeds depends entirely on your intention, and everyone is paid in accordance with the nature of his intention\". It means, that it is not merely the action which ensures a reward from Allah, but it is the sincerity of our intention, which will ensure it. If an action is void of good intention, and is undertaken for the sake of passion, or to please men, or to attain some wordly interest, then it is hollow, lifeless and deserves no reward from Allah. A hadith to this effect says, \"All the deeds af men will be gathered together before Allah. on the Day of Qiyaamah; of them only the deeds which are purely done for Allah, will be separated, and the rest will be thrown into hell\". (Targheeb) When certain good deeds are done purely for Allah, it is called \"Ikhlaas\" and whenever a believer intends to do something based on sincerity, the evil self, or the Shaytaan cause hinderances in his way. Therefore it is indispensable to sincerity that one should forsake the wordly tempta- tions, and should believe in the everlasting boons and favour of the life hereafter. Those who have realized the value of sincerity, they apply it to their werldlv affairs also. They observe the sincerity of intention in eating, drinking, sleeping, awaking, walking, earning their living etc., but this standard of sincerity cannot be achieved without the company of saints and devouts. As an example. our relig- ious scholars have told us that by observing fasts, if some- one desires its reward and good health at the same time; or, if by undertaking a pilgrimage, one wishes reward, recre- ation, and safety from the enemy: or, if by giving alms to a beggar, one has an intention to have its reward from Allah, appreciation from the onlookers, and to silence the beggar, then all the above-mentioned deeds will be void of sincer- ity. A companian of Rasululla (Sallallaho alaihe wasallam) asked him, \"What is faith?\" He replied, \"Another name for faith is sincerity!\" (Targheeb) In another hadith Rasulullah (Sallallaho alaihe wasallam) says. \"pbserve sincerity in your deeds, then even a few good ddeds will have the reward of great virtue for you!\" (Targheeb). Another com- panion of Rasulullah (Sallallaho alaihe wasallam) asked him, \"One man participates in the holy war for the sake of riches, and another man participates in it for the sake of reputation, that he may be called a hero; say, 0 Messenger of Allah, who is fighting in the way of Allah?\"' He answered, \"Only that person fights in the way of AHah, who wants to propagate and establish the truth told by Him (in the Holy Qur'aan)\". (Bukhaari, Muslim) Those who do not desire the pleasure of Allah by their deeds, but wish only the worldly achievements, they are certainly hypocrites, and this (hypocrisy) is a desease of the heart, which our spiritualists say, is the root of all evils. Once Rasulullah (Sallallaho alaihe wasallam) said to his companions, \"The thing I fear most in your actions, is smaller polytheism\". His companions asked, \"What is smaller polytheism?\" He answered, \"Show (of one's good deeds!)\" Another hadith says, \"Whoever made a show of his prayer, or fasting, or charity, he committed poly- theism\". Another hadith says, \"There is a pit of sorrow in Jahannam, of which Jahannam even seeks refuge, of Allah; those worshippers, who make a show of their worship, will be thrown into it\". Sixth Lesson The spare time A believer should spare as much time as possible; for the preachment of the commandments of Allah, even if he has to leave his home and family for this nobld cause. During this stage of life one should exercise the previous six lessons, for a long experience has told us that-by stick- ing to one's home and familv and the business, one cannot 12 Six Fundamentals learn or teach the principles of Islam, nor one can adopt the original and traditional Islamic culture, particularly in this age of materialism. Therefore, one should get rid of worldly engagements, to serve Allah and His true religion. In this course, a be- liever sitould join the group of the preachers of Islam, and should call those to the right path, who are lost in this fleeting world, and have forgotten immortal life hereafter. To call the wrong doing and negligent people to Allah, and to instruct them with His commandments, was really the duty of the Ambiyaa, which has now been entrusted to the Muslims. The true following of Rasulullah (Sallallaho alaihe wasallam) requires that every Muslim should devote himself to his service, and should sacrifice everything for the preachment of his true religion (Islam). Just as Rasulul- lah (Sallallaho alaihe wasallam) himself bore so many troubles for the sake of Islam, similarly every follower of his should also follow his footsteps. The companions of Rasulullah (Sallallaho alaihe wa- sallam) had properly realised the requisites of Tabligh, and, therefore, they tolerated the troubles of this world, for the sake of the boons and favours of Allah in the next life. They gladly devoted themselves to the service of Allah. and preferred the needs of religion to the needs of worldly life. Sometimes, they ate leaves, or a single date, and walked barefoot on long journies, in the way of Allah. During the time of the Sahabah it was necessary to propa- gate Islam, and to spread it far and wide, but today we have to revive it; just as those believers performed their duty by the sacrifice of their lives, we should also follow their ex- ample. Leaving one's home and family for the cause of Allah, has great rewards for the subject, in the next life, just as Ra- sulullah (Sallallaho alaihe wasallam) has clearly told us. Rasulullah (Sallallaho alaihe wasallam) has said, \"Whoever spends his morning or evening in the way of Allah, his reward will be much better then the whole world, and whatever is in it.\" (Bukhaari and Muslim). In another hadith he says, \"The fire of Jahannam will not reach anyone whose feet become dusty whilst he is on the path of tillah.\" When we instruct the servants of Allah with His com- mandments, it means we have fulfilled the duty of Tabligh, and have revived it, for Rasulullah (Sallallaho alaihe wasal- lam) has said, \"When people see others committing sins, Six Fundamentals 13 and do not prevent them from the same, soon Allah will in- flict a punishment on them, which will affect the common folk, as well as the distinguished persons\". A hadith of Tirmizi Sharief says, \"I swear by Allah. you must command people with good deeds, and prevent them from forbidden things, or soon Allah will inflict a severe punishment to you, and then your prayers even will not be heard by Him!\" A verse of the Holy Qur'aan says, \"There must be a group among you, who should invite people to good, and should induce them to legal things. and should prevent them from illegal things; and certainly these will attain salvation\". Another verse says, I \"0 Muslims! You are the best nation, who has been chosen for the guidance of other nations; you command people with virtue, and prevent them from vice, and have a firm faith in Allah!\" It has been reported by Abu Darda (Radhiyallaho anho) that Rasulullah (Sallallaho alaihe wasallam) said, \"You must induce people to good deeds, and prevent them from f bad ones, otherwise Allah will bring such a tyrant sover- I eign over you, who will not respect your elders, nor will he show mercy to your youngsters; then the prayers of your 1 pious people even will not be granted by Allah; if you I called Him, He will not pardon you!\" I 3 e Six Fundam :ntals Six Fundamentals 15 Seventh Lesson To quit vanity This lesson will explain the most important requisites of piety. A Muslim should spend every moment of his life in the achievement of the eternal boons of the life hereafter. He should not only avoid the sins, but also the vain and de- structive customs of his age, which affect our religious principles and beliefs so badly. Though there may not be sin in so many deeds and hobbies, yet they are a sheer waste of time and energy, and we could do some other con- structive things during that time. This is the characteristic of a true believer that he spends his time only in virtuous deeds, remembers Allah as much as possible, avoids all for- bidden things, does not indulge in vanity, and is polite and humble towards other Muslims. If one does not avoid vain talk and vain deeds, one is likely to indulge in shameful sins. It has been mentioned in a hadith that when a com- panion of Rasulullah (Sallallaho alaihe wasallam) died, a Muslim said to him. \"I deliver to you the happy news of Jannah!\" When Rasulullah (Sallallaho alaihe wasallam) heard these words, he said, \"You are giving him the happy news of Jandah, while you dont know he might have in- dulged in vain talk, or, have been a miser in spending a thing for the good of others, which does not decrease by use\". This evidently means that one should be very cau- tious in talk, and should avoid vanity, for one's tongue is likely to talk nonsense. Another hadith says, \"A man does not slip so much by his feet, as by his tongue\". Another hadith says, \"Sometimes a man speaks an of- fensive and sinful thing unconsciously, by which he is thrown into hell deeper than the distance between East and West!\" (Bukhaari & Muslim) Therefore, every believer should be cautious in his talk, and should spend every moment of his life in good deeds. He must avoid vanity, particularly, during the oeriod when he has left home to learn his religion, or to preach the same. Someone asked Luqmaan the philosopher, \"How did vou attain so much wisdom?\" He answered, \"Because I speak the truth, pay the securities to their owners, and avoid vanity!\" (Muwatta Imaam Maalik) Hadhrat Sahl Tastari says, \"Anyone who desires that the qualities and signs of the truthful should be revealed to him, he must not eat anything but pure and legal, and should follow the Sunnah very strictly\". (Ihya-ul-Ulobm) In another hadith Rasulullah (Sallallaho alaihe wasal- lam) said, \"The perfection of one's faith in Islam, requires that one should give up vanity altogether\". The Holy Qur'aan mentions a great quality of true be- lievers, \"Those who do not indulge in vanity!\" N.B.-All the ahaadith, which have no references have been quoted from Mishkaat Sharief. The requisites of a journey for Tabligh 1. When a believer has determiid to undertake such a journey, he should say the following prayer, \"0 Allah! I attack the enemy with your help, I plan my work with Your help, and I walk on the earth with Your help\". 2. When he has left home, he should read, t \"I start my journey with the name of Allah, I entirely depend on Allah; the power to do good and to avoid evil is from Allah\". J V) 3. The group of preachers should have a leader in this 3 journey, who can be another person than the leader of the group. z, ?;) 4. When he rides and puts his feet in the stirrup, he should say \"Bismillaah\" and when he sits on the back 2</p></div>",
+        "sections": [
+            [
+                30,
+                16479
+            ],
+            [
+                16479,
+                60515
+            ]
+        ]
+    }
+]);
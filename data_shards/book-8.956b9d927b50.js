@@ -0,0 +1,25 @@
+// Fazail-e-Amaal Data Shard: book 8
+fazailData.stories.push(...[
+    {
+        "id": 45,
+        "bookId": 8,
+        "chapter": "1. Kalimah Tayyibah",
+        "title": "Content for 1. Kalimah Tayyibah",
+        "preview": "16 Six Fundamentals Six Fundamentals 17 of the animal, he should say \"Alhamdu lillaah\"; and then he should read this verse, \"Glory be to Allah, who ha...",
+        "content": "<div class=\"story-content\"><p>16 Six Fundamentals Six Fundamentals 17 of the animal, he should say \"Alhamdu lillaah\"; and then he should read this verse, \"Glory be to Allah, who has subjected this animal to us, and we could not overpower it without His help; and at last we have to return to our Sustainer!\" \"Then he should say \"Alhamdu lillaah\" thrice, and then \"Allaahu Akbar\" thrice, and then he should say, \"0 Allah! You are clear of evil; I have been unjust to my.soul! therefore, forgive me, for no one pardons sins, but You!\". 5. When he has ridden, and the animal walks, or, when he himself begins to walk. he should say, \"0 Allah! I seek Your refuge from the hardships of this journey, and from the calamities of my return, and from failure after success, and from the ill prayers of the oppressed, and from loss of wealth and my i family'' 6. When he ascends some high place, he should say \"Al- laahu Akbar\" thrice, and when he descends, he should say \"Subhaanallaah\" thrice; and when he passes through a plain or a stream, he should say \"Laa ilaaha illallaah\" and \"Allaahu Akbar\" (Hisn) 7. When he has to walk on foot, he should be pleased to do so; rather he should prefer to walk on foot, for this is a Sunnah of Rasulullah (Sallallaho alaihe wasallam) and his companions. Hence, he should get himself used to the troubles of this journey, which is a source of Allah's boons and favours, in the next life. 8. If his foot slips somewhere, or hits some obstacle, he should say \"Bismillah\". (Hisn Haseen) 9. When he sets foot at some station or destination, he should say, \"With the complete words of Allah, I seek refuge from the evil of whatever He has created\". 10. When he enters some village or a city, he should say thrice, \"0 Allah! let it be auspicious for us.\" Then he should say this prayer, \"0 Allah! Let us enjoy the fruits of this city, and infuse our love into the hearts of the people of this city, and cause the love of the pious of this city in our hearts\". (Hisn Haseen) 11. He should serve his companions as much as he can, and should take pride in it. It has been mentioned in a hadith, \"Only that person is your leader in a journey, who serves you more than him, except a martyr\". (Mishkaat Sharief) 18 Six Fundamentals 1 Six Fundamentals 19 The duties of a leader Here are the duties of a leader on a journey of religious preachment: 1. He should provide comfort for his companions. He should consult his companions, and if he disagrees with anyone on a certain topic, he should not discour- age him, and should tell him the utility of another's opinion, whose counsel is more useful. 2. He should not be hard upon any companion, and should not speak to him in the tone of command. 3. He should behave towards his companions, according to their status. 4. If some of his companions are capable of speech, he should give them an opportunity to deliver a speech, and if somebody's speech is not according to 'the aims and objects of the group, he should prevent him from the same in such words, as would not displease or dis- hearten him. 5. He should prevent his companions from vain things in a polite and favourable manner. 6. He should instruct them with the.morning and evening zikr, particularly when they are out for Tabligh work. 7. He himself should appoint a leader for preachment, a leader for mutual talk, and if he does not find any effi- cient person for this purpose, he himself s h o ~ ~ l d adopt this office. 8. During the journey even, he should instruct his corn- panions to remember the Tabligh lessons well; he should advise them to remember the prayers for all occasions, by heart. 9. He should entrust the ignorant to the scholars, that they may learn prayers, etc., from them. 10. If he thinks it proper, he should distribute various duties among his companions. For instance, some of them should awake others for the Tahajjud prayer, some of them should lead them for Chaasht and Ish- . raaq prayers, and some of them should instruct others with morning and evening zikr. 11. If there is some friction among his companions, he should reconcile them. 12. He should instruct his companions again and again, with the fear of Allah, and preparation for the next life, and should solemnly advise them in the following words: \"We have left our homes to reform ourselves, before we reform others. Our real aim and object during this journey is that being in the company of the pious, and the God-fearing, we should strengthen our relationship with them, should perform our prayers in the best possible manner. 'Thus we should remember Allah as much as possible, should serve one another sincerely, and should devote ourselves to all good deeds, preventing ourselves from forbidden things. All the time that we have devoted to Tabligh work, is not ours at all, but for the promotion and establishment of the true religion of Allah. Therefore, we should make much of this time, and should learn and teach our re- ligion. We lost our lives in vanity, but at least now we should spend the rest of our life, just as a true Muslim would do. We should fulfil the requisites of this jour- ney at their best\". Knowledge and zikr 1. The subject of the teachings of the Tablighi group is to have a comprehensive and reliable knowledge of I Islam, and to preach the same to other Muslims so that they have a keen interest in Islam. Moreover, this group must know the promises and the command- ments of Allah, and should observe them practically. 2. In the education course of this group the prayer and the Holy Qur'aan have a great importance, but the time which is required to learn these things perfectly, cannot be acquired on this brief Tabligh journey. Therefore, the companions are expected to realize the i importance of salaali and learning the Holy Qur'aan, during this journey, that they should devote more and more time to this subject, in the future. 3. The members of the group should also contemplate their past life, and they should be sorry for not devot- ing themselves to Tabligh work in the past, and they should seek Allah's forgiveness. And those who are 20 Six Fundamentals still ignorant of their religion, should be sorry for their negligence, and should repent for the future. 4. In all the spare time they should remember Allah; they should engage in zikr not only their tongue, but their heart also. 5. Those who know their religion, should teach it to others as a duty, and those who are still ignorant about it, should learn the same very attentively. 6. One cannot learn all the teachings of the religion only by studying the books, or by listening to the orators; knowledge of Islam and the practice thereof are indis- pensable to each other, and perfection in faith cannot be acquired without action. Therefore, one must prac- tise what he knows, and should also instruct others with the same. 7. All the mistakes that one commits during the reading of the Holy Qur'aan, or the prayer, their correction should not be limited only to the teaching class, but one should try his best to correct them during his lei- sure at home. 8. All the members of the group should sit silent and re- spectfully in the class, while they are instructed, and should not pay attention to anything else; only the leader of education should correct their mistakes, but others should keep silent, and having regard for Allah and His Messenger, they should sit motionless, as if birds were sitting on their heads. 9. In the circle of instruction the following things should be observed very attentively. (a) The teachings of the Holy Qur'aan, particularly in relation with the principles of Islam; all the poss- ible mistakes concerning i n a a l , : Zaa, Seen, J' Saud, C Haa, A Haa, Ayn, a Hamzah, GJ Taa, L Tau, FathaJZabar etc., should be avoided with great care. (b) The words of Kalimah Tayyibah should be remem- bered properly, and their meaning should be understood thoroughly, so much so that everyone should believe that Islam is incomplete without putting the kalimah into practice. Six Fundamentals 21 (c) The basic conditions and requisites of salaah should be learnt well; whatever is read in salaah, should be remembered well: the reward of salaah should be stressed, and the punishment for neg- lecting it should be told again and again; more- over, the methods to attain concentration in salaah, should be practised. (d) All the punishments that are mentioned in the Qur'aan and hadith, for neglecting the requisites of salaah, kalimah, reverence for a Muslim, Islamic knowledge, zikr, Tabligh work etc., should be told to the students; mxeover the reward for observing them should also be explained, from reliable books. (e) The important features of the life of Rasulullah (Sallallaho alaihe wasallam) should also be told to the class. For instance, how he observed the Pray- ers, a'nd how he led his daily life. Thus, by study- ing the biography of Rasulullah (Sallallaho alaihe wasallam), and his companions, a Muslim should learn that in spite of troubles and obstacles, how they preached Islam far and wide, and how they dealt with their families and business, being true and just to everyone. (f) All the members of the group should assist one another in learning their Tabligh lessons, viz., the kalimah, salaah, Islamic knowledge. zikr, honour for a Muslim, sincerity, setting aside time to do good deeds, and abstaining from useless things. And then, they should instruct each other to lead their life according to these lessons. 10. They should read one Tasbeeh of Durood Sharief, one of the kalimah, and one of Istighfaar, every morning and evening; and if they have good books of prayer like 'Dalaail-ul-Khairaat, Hizb-al-Aazam, Munaajaate Maq- bool, they should also read them regularly. 11. They should spend all their leisure in the remem- brance of Allah, and should keep their tongues busy with zikr. The optional prayers The \"nawaafil\" or the \"optional prayers\" should also be 22 Six Fundamentals Six Fundamenlals 23 observed during the Tabligh journey. The Ishraaq, the Chaasht, the Tahajjud, the Awwaabeen, the Nawaafil after fardh. and the sunnah prayer, should be observed very carefully. These prayers are generally neglected at home, but they can be performed during the journey, if you find leisure; yet all the persons in the Tabligh group must know that the duty of preachment is more important than the op- tional prayers. That is to say. preachment has a priorty over the nawaafil, and you can easily give up the latter for the former. Observe the requisites of Tabligh first and perform the nawaafil afterwards. Gasht (To go around for an informal visit and the special visit) 1. The real object of going around for an informal visit or a special visit for the purpose of Tabligh is that the worldly and business places like bazaars, streets, and the markets should also be blessed and benefitted with the remembrance of Allah, and the faith of the group should strengthen the faith of others, and vice versa. Remember, this Tabligh work is exactly the following of the Tabligh work observed bv Rasulullah (Sallallaho aiaihe wasallam), who observed it by going around from home to home. 2. When you go around for an informal or a special visit. lower your gaze, and keep your tongue and heart busy with the remembrance of Allah. This attitude of yours will effect the hearts of others, to a great extent. 3. The going arohnd for informal visits and special visits must be done before the Prayer time, and during your Gasht instruct others with the requisites of the kalimah and the principles of Islam; moreover, call the listeners to the prayer in the mosque, and ask them to join vour Tabligh group. 4. Do not ask everyone to let you hear his kalimah, nor compel1 him to perform the prayer, for such an attitude would sometimes cause unfavourable results. That is why. you are advised to take the educated and influ- encial people of that locality with you, so that he should talk to _them according to their reason- and status. 5. Pray to Allah before you start Gasht, and call upon Him with all humbleness, saying, \"0 Allah! We are weak and helpless, and nothing can be achieved with- out Your assistance; therefore, assist us in this sacred cause. and divert the hearts of Your servants, to Your true religion, and to the life hereafter, and let us be a medium for this service. 0 Allah! Accept this humble service of ours, and establish Your religion with it. 0 Allah! Save us from the evil of those, whom we corltact in this work of Tabligll, and also save them from the evil of our self. Let then1 benefit from the good in our souls, and let us benefit from the good in their souls! (And one could say any other suitable du'aa, according to the occasion). 6. Do not be engaged in discussions with anyone, nor ar- range any debate. 7. During vour goirlg around for an informal or special visit for Tabligh, take the local pious people with you, so that they cdn see the impietv and transgression of the people of their towrl with their own eves, and should. consequentlv, join you in Tabligh work. 8. When you reach a certain city or village, meet the dis- tinguished people thereof, and explain to them the method and the aims and objects of Tabligh, and stress the importance of religious preachment, and then invite them to join the group. By the distinguished people we mean the pious, or the wealthy persons, who are, one way or another, influential in their city, mohalla or village. One should be very cautious, reasonable, and to the point, while talking to theni. The invitation and the speech Since your speech is not your real aim and object, and is merely a medium of instruction, one should rather stress the meaning and the purpose of your words, for the sake of Tabligh. Make yourself clear to your listen- ers, in simple and easy language. Do not adopt the style of common orators, and do not talk about things, which the listener would not understand. Rasulullah (Sallallaho alaihe wasallah) repeated every sentence of his thrice, that his audience should understand it easily. His words were spoken slowly and clearly, so that the listeners could count them. 24 Six Fundamentals In your speech you should explain the vanity of worldly objects, and then the greatness and immortal- ity of the boons and enjoyments in the life hereafter. Instruct them to prepare for the life in the grave and to do good deeds for the same; and then attain peace and salvation on the Day of Qiyaamah; and then ask them to live a pious life, for this will save them from the punishment of Jahannam. Explain to them the impiety and negligence of the present Muslims, particularly the condition of local people, which you will come to know during the going around for the informal and special visits. 3. Tell them the spiritual and religious benefits of joining the Tabligh group, and invite them to the same. 4. Explain to them the punishment for not inducing people to good, and preventing them from evil, and tell them the reward of being faithful to Islam, during this era of sin and disobedience. 5. Do not adopt a tone of command and superiority, while instructing people. 6. In every speech, one should advice the audience to be practical about what they know of Islam. Obedience to the leader Every order of the leader should be obeyed, provided he does not ask you to commit a sin. Yes, obey him, though he is not so much educated as you are. Rasulullah (Sallal- laho alaihe wasallam) has said in a hadith, \"If a leader has been appointed to you, whose nose and ears are cut, you should obey him, when he instructs you with the Holy Qur'aan.\" Sometimes the leader will bestow an honour, or the right of speech, on a person inferior to you in status; in such a case, you should not object to it, and raise no objec- tion against him. Hadhrat Ubaadah bin Saamit (Radhiyal- laho anho) says, \"We took a pledge at the hands of Rasulullah (Sallallaho alaihe wasallam), that we should obey him in prosperity and in calamity, in pleasure and sorrow, and will not obey the suggestions of our evil self, against his wish, and will not prefer ourselves to' others against his choice; that we shall not try to snatch lead- 59 Six Fundamentals 25 ership from another; that we will s eak the truth, wherever we are; that we will not mind t ! e criticism of anyone, while obeying the commandments of Allah\". (Mishkaat Sharief) The etiquette of taking meals 1. Wash your hands before and after meals, and wash your mouth also. 2. Begin to take meals by saying; \"Bismillaah wa'alaa bar- katillaah\". 3. Take your meals with your right hand. 4. Take the food that is in front of you, but if there are various things in the utensil from which you )are eating, then you may take it from wherever you please. 5. Place the food on a table cloth and then partake from the food. 6. Do not eat from the centre of the utensil, for the bles- sing of Allah descends at that point. 7. Finish all the food in the utensil, and do not spare any- I thing for the Shaytaan. When all the food is taken, the utensil prays to Allah for your delivery from Jahan- nam. 8. Lick your fingers before washing your hands, it is men- tioned in a hadith, \"One does not know in which par- ticle of the food is the blessing of Allah.\" I 9. Take your meals with three fingers of the right hand. I 20. If a morsel falls on the table cloth, pick it up and eat it, and do not spare it for Shaytaan. I I 11. One should not lean on a cushion or arrogantly recline whilst eating. I 12. Do not object to the quality of food; if you like it, take it otherwise don't take it, and keep silent. 13. All of you should take your meals, as a group, and not separately. CL 14. Hadhrat Anas (Radhiyallaho anho) says, \"I saw Rasu- lullah (Sallallaho alaihe wasallam) taking his meals, in a squatting pdsition.\" 26 Six Fundamentuls 59 15. If some companions are eating sweetmeats or dates to- gether, do not take two pieces at a time, without their permission. I 16. If you forget to read \"Bismillaah\" at the beginning of I your meals, then say when you remember it, \"Bismil- I laahi awwaluhu wa aakhiruhu\", that is, with the name of Allah in the beginning and at the end of it. , 17. Do not eat onions while you are in the mosque, and if you have eaten them out of the mosque, do not enter it, until such time that there is no odour left. i I 18. When you have taken your meals, say, 1 Alkamdu lillaahil lathee at-'amanaa wasaqaanaa waja- alanaa minal muslimeen. \"All praise is due to Allah, who has nourisned us, and has quenched our thirst, and has assisted us to be Mus- lims.\" 19. First pick up the table cloth, and then get up. 20. Do not eat food which is too hot. 21. If you have eaten to your fill, do not get up before your companions, but keep eating slowly; and if you have to get up, excuse yourself, and ask them to continue. 22. If you drink water, milk or any other liquid say, \"Bis- millaah\" at the beginning and \"Alhamdulillaah\" at the end. 23. Do not drink continuously in one gulp, like a camel. 24. Do not breathe in a utensil nor blow into it. 25. If the utensil is broken or chipped at a certain point then do not eat or drink from that point of the utensil. 26. Wash your mouth after drinking milk, and read this du'aa, Six Fundamentals 27 Allaahumma baarik lanaa feehi wa zidnaa minhu. \"0 Allah! let it be a blessing for us and increase it for us\". All these etiquettes of taking food and drink have been quoted from Mishkaat Sharief. The etiquette of going to sleep 1. Do not go to sleep without wudhu. 2. Clean the bed thrice before going to sleep. 3. Lie on the bed on your right side, place your right hand under your cheek, and read \"Allahumma be'is- mika amooto wa ahyaa\". 0 Allah! In Your name do I die and live. 4. Read \"Aayatul Kursi\" and \"Aamanar Rasoolu (up to the end of Surah) before going to sleep. 5. Read \"Subhaanallah\", \"Alhamdulillaah\" and \"Al- laahu-Akbar\", thirty three times each, before going to sleep. 6. Read all the four Surahs, beginning with \"Qul\", then . blow on your hands, and apply them to your whole body; do this thrice. 7. Read Surah \"Alif laam meem sajdah\" and \"Tabarakal- ladhi beyadihil mulk\" (up to the end of Surah) before going to sleep. 8. When awakening read, Alhamdu lillaahil lahee abaanaa ba'da maa amaata- naa wa ilayhin nushoor. \"All praise to Allah. He who revived us to life after giving us death and to Him we shall have to return.\" V) 3 9. Apply collyrium (surmah) to your eyes thrice, before 3 going to sleep. .X E cn a 10. If you want to get up for the Tahajjud prayer, read. \"In- u c alladhina aamanu\" (Up to the end of Surah Kahaf). All 2 Six Fundamentals 29 28 Six Fundamentals these etiquettes of sleeping have been quoted from the ahaadith. Wudhu and Salaah 1. If the time of salaah is near, then have wudhu before proceeding on a journey, also take a Lota (utensil for the purpose of wudhu) and a six yard rope, to draw water from a well if the necessity arises. 2. The water from the station taps and that from the toil= in the train is clean. If this water is not available then only will Tayammum be permissible. 3. The time for Maghrib salaah begins after sunset and ends when the redness in the sky disappears. The gen- eral belief that Maghrib salaah cannot be performed a short while after the sunset is incorrect. 4. If the distance of your journey is more than forty eight miles (77,248 Kilometres) then instead of performing four fardh rak'aats you should perforkal only two. 5. Do not postpone any prayer during the journey, for a single postponement will render your journey useless. If you have forgotten a certain prayer, or its time has passed during your sleep, then perform it as soon as possible, if the prayers of a journey are performed after reaching home, then observe two rak'aat for Zuhr, As'r and Esha: on the other hand, if the prayers postponed at home, are performed during the journey, then ob- serve them in a complete form (four rak'aats for Zuhr, As'r and Esha). 6. There are many Muslims on whom Qadha salaah for years was due. they are advised to perform these sa- laahs as soon as possible, whilst on a Tabligh journey the opportunities are numerous so perform as many qadha salaahs as possible, rather perform the fardh qadha, instead of the nawaafil. Remember that qadha salaah is only performed for the fardh and Wit'r sa- laahs. 7. The jamaat salaah (congregational prayer) is necessary even during the Tabligh journey. When it is time for salaah, say the adhaan (the call to prayer) and then perform the salaah with jamaat, and say takbeer before the same. If all the members cannot perform the salaah in a group, then let them perform it in pairs. 8. If you are in a hurry, then you may omit the sunnats before and after the fardh salaah, but not those of the Faj'r salaah. And if you are not in a hurry, then per- form all the Sunnats. 9. If you have put your luggage in a railway compartment or in a bus, and it is about to depart, then terminate the salaah. Perform the same, salaah in the train or vehicle if it is possible. 10. To face the qiblah is necessary even in a railway com- partment, therefore perform your salaah in the correct direction; and if you do not know the direction of the qiblah, nor is there anyone to show you, then establish the same by careful estimation. If the train or vehicle takes a turn, while you are performing the salaah, then turn yourself accordingly. 11. Even if the train is moving it is fardh for you to stand and complete your salaah. If you are healthy and strong enough to stand, then do not sit for the salaah. One can easily perform the salaah in the passage or in between the seats, moreover you can perform the salaah in pairs with jamaat in the space between the two rows of seats. I 1. Every member of the Tabligh group is responsible for ~ his expenditure during the journey. 2. Be courteous and polite to every Muslim whom you I meet during your journey. Be courteous to the non- I Muslims also, and show them Islamic manners. If you I sometimes talk to them, tell them that humanity is gen- f;i erally negligent of Allah, therefore they must submit to ~ Him for their salvation. 1 3. When you reach a certain destination, consult the local inhabitants, before you start your work of Tablih. , - 1 4. When you reach a city or a town, or a village, do not stay anywhere except in the musjid, even though 3 I someone may insist on doing otherwise. el 9 5. Extinguish the lamp or the light of the musjid where 30 Six Fundamentals Six Fundamentals 31 you stay, at the normally fixed times, for it is not cor- rect to use it for yourself only. Extinguish the lights after Esha salaah, when the musallies (worshippers) have departeg; then light a candle of your own, if it be needed. 6. Do not ask for any bedding from the people of that place; anyhow help one another if there is a shortage of beds: nor ask for any utensils. 7. Fix a fee before engaging any labourer: if you employ any labourer without fixing a fee, then pay him his full remuneration. If you pay him less than the local rate, and he is unhappy, and kept asking for more, until he went away disappointed, then you will have to pay him on the Day of Qiyaamah. Remember. oppression or forced agreement co~lcerning fixing a fee before engaging any labourer is not recognized: therefore if anyone gives up his right by oppression, then the op- pressor can not be forgiven by that person. 8. Avoid every kind of useless talk during your Tabligh journey, and be cautious of everything you do. In short spend your time carefully during this journey, and pay special gttention to the Tabligh work. Do not talk much, nor laugh unnecessarily, for it is mentioned in a hadith, \"Too much talk hardens your heart, and too much laughing kills your heart. and the noor of your face is lessened. 9. Every action of yours must be based on sincerity, and you should not despair the reward from Allah. In whatever you do you must make a good niyyat (inten- tion). 10. Make your return journey also a Tabligh journey, and on your way home, observe the same as you observed while going abroad. v 11. All the requisites of Islamic etiquette that you learnt during the journey, and all the salaahs that you per- formed, should be maintained at home also. Humble- ness in salaah, constant zikr service to humanity, sincerity and all the good actions that 'you practised during the journey, should be observed at home also, for the main object of this journey was to involve one- self in the practice of good deeds. 12. If vou undertake a journey for worldly objects, and not purely for Tabligh work, even then observe Islamic eti- quette and du'aas; perform your salaahs regularly, with Jama'at and if there are three companions, one of them should be made an ameer. In such a Tabligh journey keep all the books of Tabligh with you, namely Hikaayaat-i-Sahaabah, Fadhaa'il Namaaz, Fadhaa'il Tabligh etc., and you should also have a miswak, lota (utensil for holding water for the purpose of wudhu), musallah (prayer mat), soap, thread and needle, table cloth, mud lump made for the purpose of istinja, matches, candle, comb, surmah daani (surmah dispenser), torch, staff (which could be used as a sutrah). 14. If the leader asks you to prepare food for the group, or to do some other service, obey his orders happily; and don't think that you will be deprived of the reward of Tabligh when your companions leave you with your task, for then you will deserve double reward, one for rendering service to your companions, and the other, for relieving your companions of their worry to enable them to do Tabligh work freely. 15. The Tabligh journey is a good period in which to prac- tice Islamic routine; therefore, be heIpful to one an- other, and promote unity. Don't insist on your own proposdl, but only suggest it, and explain the merits. If your companions do not accept your proposal, then don't despair; If the proposal of somebody else is ac- cepted by the group, and the result is not good, then don't say. \"What did I suggest to you? Had you ob- served my counsel, you would have attained much good!\" 16. During the informal or special visit, or during Taalim lessons, or at the time of da'wat don't discuss any con- ; troversial subject; but should rather invite people to the fundamentals of Islam and the Oneness of Allah, for when one understands the meaning of the kalimah, then he will want to know more about Imaan and Islam. I i 17. Remain in any city or village that you visit as long as 8 its inhabitants can easily understand the main object of 1 the work of Tabligh, and are prepared to observe all 2 32 Six Fundamentals Six Fundamentals 33 the rules of T&!igh work. It is not correct to be at one place in the morning, at another in the evening; at one place at Zuh'r, and at another as As'r. One cannot do justice to Tabligh work, if you-visit only a few persons, or deliver a speech in the musjid. Your attempt in this task can be successful and impressive only when you stay in a town for a required period. 18. When you return from a journey, and are nearing your city or village, say, Aa-iboona, taa-iboona, 'aabidoona lirabbinaa haami- doon. \"We are returning (to piety); we are repenting; we are worshipping Allah; and we are giving thanks to Allah!'' 19. When you return from the journey, and enter your home, say, Owban, owban, lirabbinaa towban, laa yughaadiru alaynaa hpwban. \"I have returned, I have returned to my Sustainer with repentence, which would cleanse us of every sin\". 20. It is preferable to reach your town after sunrise; then perform two rakaats nafl in the local musjid, then talk to your Muslim brothers for a while, and then enter your home. Whenever Rasulullah (Sallallaho alaihe wasallam) returned from a journey he did so. (Mish- kaat ) 21. Whenever Rasulullah (Sallallaho alaihe wasallam) re- turned from a journey during the night, he did not enter his home, but on the next morning or evening. (Mishkaat). 22. It has been reported by Jaabir (Radhiyallaho anho) that Rasulullah [Sallallaho alaihe wasallam) said, \"When- ever you return from a journey after sunset, and wish tcl go home to your wife, then give her sufficient time to remove pubic hair and to comb the hair on her head (in order that she groom herself in preparation for your return). (Bukhaari & Muslim) 23. After returning from a journey, one should hastely rejoin the Tabligh workers, successful and fortunate is he who observes the requisites of this journey sin- cerely, and returns home with a great spiritual im- provement. Directives for the workers of Tabligh (Selected from the sayings of Hadhrat Maulana Muhammad Ilyaas (Rahmatullah alaih) 1. The first and the main object of knowledge is that one should examine his actions; he should realize his duties and shortcomings, and should seek means to overcome them. Then if you only compare the actions of others according to your ilm then this pride destroys those who have ilm. 2. The real remembrance of Allah is that a Muslim should always obey the commandments of Allah, and should keep them in mind at all times. I instruct my own friend with the same zikr. 3. The main object of our jamaat is to teach the Muslims the original and complete religion taught by Rasulullah (Sallallaho alaihe wasallam). This is our real object; as for our Tabligh journeys in groups this is a preliminary means to carry out our work; the instruction of Kali- mah Tayyibah and Salaah is the initiation of our course. 4. Our workers should remember that if their da'wat is not accepted anywhere, they should not be disappointed: they should remember that they generally are follow- ing the Sunnah of the Ambiyaa (Alayhimus salaam) and particularly the Sunnah of Rasulullah (Sallallaho alaihe wasallam). How many are there who go out in Allah's path, who bear hardships and yet are dis- graced? On the other hand, if they are welcomed and honoured somewhere, they should think it to be a favour of Allah, and should have great regard for it. When they teach religion to those who pay heed to it, though they be commoners, they thank Allah for His favour. 34 Six Fundamen tals Six Fundamentals 5. Our workers should not desire for calamities from Allah. Should any misfortune befall them then, they should accept that to be the mercy of Allah, and a com- pensation for their sins, and as a means to raise their ranks. 6. In your explanation you should have the intention to please Allah only, and not your audience. In the Tab- ligh journey we should bear in mind that we have left our homes in obedience to Allah's command, and not by our own wish; therefore it is He who will assist us. When you have such an intention, you will not be ang- ered by the i.11 treatment of the people to whom you talk, nor will you be discouraged. 7. It has become an undesirable custom, if our audience does not follow our instructions we regard ourselves to be loosers, whereas it is infact the loss to our listeners, because they have not obeyed the teachings of their re- ligion, our success lies in performing our duty to de- liver the truth. How can we be unsuccessful, by the negligence of others? Our duty is to present Islam in the best possible manner. Even the Ambiyaa fAlayhi- mus salaam) were not held responsible, if the audience did not follow them. You may learn a lesson from peoples rejection, that your approach to this work may not be perfect and faultless; therefore, you shall im- prove your future attempts and ask Allah for complete guidance. 8. If the Ulama and pious people of a town show no keen- ness and are not sympathetic towards the work of Tab- ligh, then do not doubt their sincerity, and don't develop any ill feeling about them in your heart, but you should realize that the object of the work is not apparent to them yet. 9. Wherever you go, you should visit the Ulama and pious people of that place, so that you can benefit from their knowledge and piety. You should not invite them to the work of Tabligh, for they know their duties best, and the benefits thereof; they will not understand the object of your work merely by explanation, therefore, they will naturally not confirm the same, and once they do not acknowledge, they shall insist on their denial, hence meet them only for your benefit, as long as you are in their town make an effort to follow your lessons and principles very strictly; when the ulama and pious ones are informed of your activities, they will naturally be interested in your Tabligh work; thereafter in a very honourable and respectful manner explain to them your aims and objects. 10. One of the principles of Tabligh is that a speaker should be concise and to the point in his general ad- dress but very polite and courteous, when addressing a particular person; rather when he instructs a particular person, even then his address should be of a general nature. Whenever Rasulullah (Sallallaho alaihe wasal- lam) came to know of the wrong actions of a particular person, he disapproved of it in general terms and said, \"What will the result of such a nation be, who commit wrong actio-ns\". 11. We are accustomed to be pleased with talk only; we merely talk about good deeds, and think that our I words replace them; therefore, try to refrain from this habit. 12. Whatever good deeds you do, attribute them to Allah, and seek His forgiveness for verily you should keep in mind that whatever action you did was not the best, and that there was fault in its completion. Rasulullah (Sallallaho alaihe wasallam) used to seek Allah's for- giveness at the end of his salaah. The responsibility of Allah's work cannot be completed in anyway by His servants, and when we are busy with certain work this should not stop us from doing other work, and we should seek Allah's forgiveness and assistance at the completion of all good work. 13. All your Tabligh journeys will be worthless if you did not continue studying deeni ilm and regular zikrullah, hence, there is fear that negligence of these two essen- I tials could be a cause of turmoil, and to be led astray. If you do not possess deeni ilm then Islam and Imaan is for name sake and customary, for no good deed is poss- ible without sound Islamic knowledge, and knowledge without zikrullah is but darkness and no noor can be v, derived therefrom, and this is what our workers have 3 neglected. 5 .5 E 14. When a deeni explanation is made and also during the * 4 gasht the jamaat members are taught to remain in zik- E a k 36 Six Fundamentals Six Fundamentals 3 7 rullah and fikr. The reason for this is whilst an effort is made to explain the truth and at the same time many hearts in the group are occupied in endorsing with a firm belief, the same idea, this makes an impression on other hearts. 15. The proportion of zikrullah must be increased concert- edly to outweigh the unfavourable and adverse con- ditions the jamaat encounters when going out for Tabligh. This will protect them from the evil effects of the human and jinn shayaateen. 16. Sincerity and good intention is the base of Tabligh work, and steadfastness of the abovementioned is very important. Therefore, Tabligh workers should at all times seek Allah's pleasure and obey His commands, the greater the extent there is in your sincerity and steadfastness, the greater will be your reward with Allah. 17. The end of your good actions should always be a con- fession of your weakness and negligence, and the fear of that deed not being accepted by Allah. 18. In our Tabligh work in addition to both sincerity and truthfulness, unity and mutual consultation is essen- tial. Without these a great danger of committing errors prevails. 19. Those high positions which Rasulullah (Sallallaho alaihe wasallam) showed, that could be attained by love and dedication of deen and which was also at- tained by the Sahaabah (Radhiyallaho anhum) for their sacrifices and hardships which they underwent, you wish to attain that status by the mere leasurely reading of books. For those lofty favours and rewards that were obtained through total sacrifice, we should at least sweat a bit. 20. What benefit is there in remembering the duties which have been completed. One should plan the completion of the remainder of the mission, and assess the short- comings of the work done. 21. Don't be contented with a person's accepting or under- standing your message, be mindful of how many mil- lions are left out +a whom Allah's message did not reach. How many more are there who accepted and were aware of your message but due to our negligence did not carry out Allah's command. 22. Many are of the view that to convey the message is Tabligh, this is a serious misunderstanding. The mean- ing of Tabligh is that a person should according to his ability and experience convey the message of deen in a manner, that there is hope for the people to accept what is being said. This was the method practiced by the Ambiyaa (Alayhimus salaam). 23. Those who go out for deeni work or for gasht, and their hearts are effected by meeting unmindful and negligent people or irreligious'places should make good this loss by zikrullah and fikr of the Deen in seclusion. 24. Basically, every good deed is for the pleasure of Allah and to gain reward in the Hereafter. Worldly gains should also be mentioned for encouragement towards piety. At the beginning, some do religious work for worldly gain, but due to the blessing of the work they are later favoured by Allah with sincerity. 25. Plan, suggest and propose ways and means to call people towards Deen and doing the work of Deen. Ap- proach them in a manner that will draw their atten- tion, and attract them towards Deen. 26. The purpose to go out for Tabligh journeys is not merely to advice and guide others, infact the object is to reform ourselves and develop pleasant habits. Hence, during the journey we should be engaged at all times with zikrullah and aquiring deeni ilm. These should be practiced with the advice and guidance of our learned elders and Ameer (leader). Be mindful of these for your going out for Tabligh will be futile if these are neglected. 27. In this work of Tabligh firm establishment is more sig- nificant than expansion. The method of this is that with establishment, expansion must be simultaneous. Without travelling to villages, towns and countries, how could this work of Tabligh be established. .- 1 28. One of the principles of this Tabligh work is that one abstains from unilateral decisions and freedom of .a 8 movement, and at all times abides to the guidance of * the recognized learned elders. 3 k 3 8 Six Fundamentals 29. The general practice of Tabligh workers is that they give full attention to the more prominent personalities, and are less attentive towards other pious and humble not well to do persons who offer their services. It must be understood that this is an approach totally for worldly gain. Keep in mind that the pious and humble who are very poor and needy, who offer their services out of dedication for guidance, are a blessing from Allah. Therefore honour and be grateful to them. 30. Womenfolk should assist the men and give them the opportunity to do religious work. Make their house- hold duties lighter for them so that they may do relig- ious work withaut any hinderance. If the women do not co-operate in this direction, they will be the vic- tims of becoming a trap of Shaytaan. 31. It is very important when one goes out for Tabligh work that one remains occupied in the activities of the jamaat, and does not get involved in other things. The work schedule of the jamaat is as follows: (1) To go around meeting Muslims for the upliftment of Deen. (2) The acquiring of deeni ilm, and the development of a habit of constant zikrullah. (3) To be helpful, particu- larly to your close associates. (4) The correction of in- tention and working towards the development of Ikhlaas (sincerity) and exercising Ihtisaab, i.e. with a concerted effort of keeping ones self under serveilance for purity and clarity of niyyah. One must also regu- larly entrench the thought in your heart that ones going out is solely for the pleasure of Allah alone, therefore one will definately be blessed with the prom- ise in the Qur'aan and hadith for dedication ornate with this refined quality. It is this Ikhlaas that is kept in check by Ihtisaab which is termed true Imaan, and is also the essence of all our deeds. 32. The Shaytaan's desire is to annul and destroy the pro- gress and higher position which would be attained by being punctual with the faraa'idh, therefore all ones free moments must be spent in nafl zikr (optional zikr), so that the Shaytaan is unable to influence you into meaningless things which would result in harm. 33. One of the principles of Tabligh work is that you honour every Muslim and respect the Ulama. Six Fundamentals 39 34. Understand that when some companions intend re- turning home, don't desire or yearn to follow them, rather contain your heartfelt desire and continue with Tabligh work, for great virtues have been promised for the same. The example of those who contain their heartfelt desire and remain steadfast on this work is that of a fighter who remains fighting on the battlefield whilst his co-fighters disappear in retreat. I 35. The condition preceeding the assured method of at- taining Allah's assistance is that you should assist His 1 true religion. If you offer assistance to His deen then difficulties alld obstacles in life will turn into means for your pleasure in this world, and the earth and skies and whatever it contains will be of assistance to you. Those who after carrying out Allah's work despair the I mercy and pleasure of Allah would be most unfortu- nate and wilfully transgressing His laws. 36. What is termed to be divine assistance and unforseen power is not bestowed initially but is disseminated at the appropriate occasion and time.</p></div>",
+        "sections": [
+            [
+                30,
+                16451
+            ],
+            [
+                16451,
+                32848
+            ],
+            [
+                32848,
+                43973
+            ]
+        ]
+    }
+]);
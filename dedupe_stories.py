@@ -0,0 +1,190 @@
+"""
+Detect duplicate and near-duplicate stories and deeds with MinHash/LSH.
+Content is shingled on normalized tokens and signed with one-permutation
+MinHash, signatures are banded so only records sharing a band are compared,
+and candidates are confirmed with the exact shingle Jaccard.
+Writes a report and can merge duplicate stories.
+
+Usage: python dedupe_stories.py [--merge]
+"""
+import hashlib
+import json
+import sys
+
+import patterns
+from arabic_text import tokenize_batch
+from fazail_store import load_fazail_data, write_fazail_data
+
+DEEDS_FILE = 'deeds_content.json'
+REPORT_FILE = 'dedupe_report.json'
+
+SHINGLE_SIZE = 5
+NUM_PERM = 128
+BANDS = 32  # 32 bands x 4 rows ~ 50% collision probability at Jaccard 0.42
+THRESHOLD = 0.7
+
+EMPTY_BIN = 1 << 64
+
+
+def load_deeds():
+    try:
+        with open(DEEDS_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return []
+
+
+def shingles(tokens, size=SHINGLE_SIZE):
+    """Set of hashed token n-grams."""
+    if len(tokens) < size:
+        grams = [' '.join(tokens)] if tokens else []
+    else:
+        grams = [' '.join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)]
+    return {int.from_bytes(hashlib.blake2b(g.encode('utf-8'), digest_size=8).digest(), 'big') for g in grams}
+
+
+def minhash(shingle_set, num_perm=NUM_PERM):
+    """One-permutation MinHash signature of a shingle set.
+
+    Each shingle hash goes to bin hash % num_perm and each bin keeps its
+    minimum; empty bins borrow from the next non-empty bin so sparse
+    documents still produce comparable signatures.
+    """
+    bins = [EMPTY_BIN] * num_perm
+    for h in shingle_set:
+        b = h % num_perm
+        if h < bins[b]:
+            bins[b] = h
+
+    if not shingle_set:
+        return bins
+
+    for i in range(num_perm):
+        if bins[i] == EMPTY_BIN:
+            j = (i + 1) % num_perm
+            while bins[j] == EMPTY_BIN:
+                j = (j + 1) % num_perm
+            bins[i] = bins[j] + (j - i) % num_perm
+    return bins
+
+
+def lsh_candidates(signatures, bands=BANDS):
+    """Pairs of record indices that share at least one signature band."""
+    rows = len(signatures[0]) // bands if signatures else 0
+    candidates = set()
+    for band in range(bands):
+        buckets = {}
+        for idx, sig in enumerate(signatures):
+            key = tuple(sig[band * rows:(band + 1) * rows])
+            buckets.setdefault(key, []).append(idx)
+        for members in buckets.values():
+            for i in range(len(members)):
+                for j in range(i + 1, len(members)):
+                    candidates.add((members[i], members[j]))
+    return candidates
+
+
+def jaccard(a, b):
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def find_duplicates(records, threshold=THRESHOLD):
+    """Return confirmed duplicate pairs and clusters for a list of records.
+
+    Each record is a dict with "kind", "id", "title" and "text".
+    """
+    token_lists = tokenize_batch([patterns.TAG_PATTERN.sub(' ', r['text']) for r in records])
+    shingle_sets = [shingles(tokens) for tokens in token_lists]
+
+    # Empty or image-only records have nothing to compare and are never duplicates
+    indexed = [idx for idx, s in enumerate(shingle_sets) if s]
+    signatures = [minhash(shingle_sets[idx]) for idx in indexed]
+
+    pairs = []
+    for a, b in sorted(lsh_candidates(signatures)):
+        i, j = indexed[a], indexed[b]
+        similarity = jaccard(shingle_sets[i], shingle_sets[j])
+        if similarity >= threshold:
+            pairs.append((i, j, similarity))
+
+    # Union-find over confirmed pairs
+    parent = list(range(len(records)))
+
+    def root(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for i, j, _ in pairs:
+        parent[root(j)] = root(i)
+
+    groups = {}
+    for idx in range(len(records)):
+        groups.setdefault(root(idx), []).append(idx)
+    clusters = [sorted(members) for members in groups.values() if len(members) > 1]
+
+    return pairs, clusters
+
+
+def build_records(data, deeds):
+    records = []
+    for story in data['stories']:
+        records.append({"kind": "story", "id": story['id'], "title": story['title'], "text": story.get('content', '')})
+    for deed in deeds:
+        records.append({"kind": "deed", "id": deed['id'], "title": deed['title'], "text": deed.get('content', '')})
+    return records
+
+
+def merge_duplicate_stories(stories, records, clusters):
+    """Keep the lowest-ID story of each cluster and drop the other stories."""
+    drop_ids = set()
+    for cluster in clusters:
+        story_ids = sorted(records[idx]['id'] for idx in cluster if records[idx]['kind'] == 'story')
+        drop_ids.update(story_ids[1:])
+    return [s for s in stories if s['id'] not in drop_ids], drop_ids
+
+
+def write_report(records, pairs, clusters, path=REPORT_FILE):
+    """Save the duplicate pairs and clusters so merges can be reviewed."""
+    report = {
+        "threshold": THRESHOLD,
+        "pairs": [
+            {
+                "a": {"kind": records[i]['kind'], "id": records[i]['id'], "title": records[i]['title']},
+                "b": {"kind": records[j]['kind'], "id": records[j]['id'], "title": records[j]['title']},
+                "similarity": round(similarity, 3)
+            }
+            for i, j, similarity in pairs
+        ],
+        "clusters": [[{"kind": records[idx]['kind'], "id": records[idx]['id']} for idx in cluster] for cluster in clusters]
+    }
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"Saved report to {path}")
+
+
+def dedupe(merge=False):
+    data = load_fazail_data()
+    if not data:
+        return
+    deeds = load_deeds()
+
+    records = build_records(data, deeds)
+    print(f"Checking {len(records)} records ({len(data['stories'])} stories, {len(deeds)} deeds)...")
+    pairs, clusters = find_duplicates(records)
+
+    print(f"Found {len(pairs)} duplicate pairs in {len(clusters)} clusters")
+    write_report(records, pairs, clusters)
+
+    if merge:
+        data['stories'], dropped = merge_duplicate_stories(data['stories'], records, clusters)
+        write_fazail_data(data, "Deduplicated content")
+        print(f"Removed {len(dropped)} duplicate stories")
+
+
+if __name__ == "__main__":
+    dedupe(merge="--merge" in sys.argv)
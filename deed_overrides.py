@@ -0,0 +1,116 @@
+"""
+Per-book deed override tables.
+Quirks of a book's labeling (deeds printed under another number, headers
+that need a custom regex, first lines that are content rather than a
+header) live in deed_overrides.json instead of code. Each book's section
+is validated and compiled once into lookup tables and precompiled
+patterns; the file is re-read automatically when it changes on disk.
+
+Usage:
+    python deed_overrides.py    # validate the file and print a summary
+"""
+import json
+import os
+import re
+import sys
+
+import patterns
+
+OVERRIDES_FILE = "deed_overrides.json"
+DEFAULT_BOOK = "easy-good-deeds"
+
+KNOWN_KEYS = {"id_overrides", "id_override_notes", "regex_overrides", "regex_override_notes", "keep_first_line"}
+
+# path -> (mtime, raw config, {book: compiled tables})
+_cache = {}
+
+
+def _is_int_key(key):
+    return isinstance(key, str) and key.isdigit()
+
+
+def validate_overrides(config):
+    """Return a list of problems in a parsed overrides file (empty when valid)."""
+    errors = []
+    if not isinstance(config, dict):
+        return ["top level must be an object mapping book name -> overrides"]
+
+    for book, section in config.items():
+        if not isinstance(section, dict):
+            errors.append(f"{book}: overrides must be an object")
+            continue
+        for key in sorted(set(section) - KNOWN_KEYS):
+            errors.append(f"{book}: unknown key {key!r}")
+
+        for deed_id, search_id in section.get("id_overrides", {}).items():
+            if not _is_int_key(deed_id) or not isinstance(search_id, int):
+                errors.append(f"{book}: id_overrides {deed_id!r}: {search_id!r} must map a deed id to an int")
+
+        for deed_id, pattern in section.get("regex_overrides", {}).items():
+            if not _is_int_key(deed_id):
+                errors.append(f"{book}: regex_overrides key {deed_id!r} is not a deed id")
+                continue
+            try:
+                patterns.compile_pattern(pattern)
+            except (re.error, TypeError) as e:
+                errors.append(f"{book}: regex_overrides {deed_id}: {e}")
+
+        keep = section.get("keep_first_line", [])
+        if not isinstance(keep, list) or not all(isinstance(i, int) for i in keep):
+            errors.append(f"{book}: keep_first_line must be a list of deed ids")
+    return errors
+
+
+def compile_overrides(section):
+    """Turn one book's raw section into lookup tables and compiled patterns."""
+    return {
+        "id_overrides": {int(k): v for k, v in section.get("id_overrides", {}).items()},
+        "patterns": {int(k): patterns.compile_pattern(v) for k, v in section.get("regex_overrides", {}).items()},
+        "keep_first_line": frozenset(section.get("keep_first_line", []))
+    }
+
+
+def load_overrides(book=DEFAULT_BOOK, path=OVERRIDES_FILE, required=True):
+    """Compiled tables for one book; reloads the file if it changed since the last call.
+
+    A book missing from the file raises KeyError, so a misspelled name can't
+    silently disable every override; with required=False it gets empty
+    tables and a notice instead.
+    """
+    if not os.path.exists(path):
+        return compile_overrides({})
+
+    mtime = os.path.getmtime(path)
+    cached = _cache.get(path)
+    if cached is None or cached[0] != mtime:
+        with open(path, "r", encoding="utf-8") as f:
+            config = json.load(f)
+        errors = validate_overrides(config)
+        if errors:
+            raise ValueError(f"Invalid {path}:\n  " + "\n  ".join(errors))
+        cached = (mtime, config, {})
+        _cache[path] = cached
+
+    _, config, compiled = cached
+    if book not in config:
+        if required:
+            raise KeyError(f"No overrides for {book!r} in {path} (books: {', '.join(sorted(config))})")
+        print(f"No overrides for {book!r} in {path}; using none")
+    if book not in compiled:
+        compiled[book] = compile_overrides(config.get(book, {}))
+    return compiled[book]
+
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else OVERRIDES_FILE
+    with open(path, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    errors = validate_overrides(config)
+    for error in errors:
+        print(f"ERROR: {error}")
+    if errors:
+        sys.exit(1)
+    for book in config:
+        tables = load_overrides(book, path)
+        print(f"{book}: {len(tables['id_overrides'])} id overrides, {len(tables['patterns'])} regex overrides, "
+              f"{len(tables['keep_first_line'])} kept first lines")
@@ -2,72 +2,64 @@
 Comprehensive extraction of Fazail-e-Amaal PDF
 Extracts all stories, chapters, and Arabic text with proper structure
 """
-import fitz  # PyMuPDF
 import json
 import re
 import os
+from collections import Counter
 
-# Book definitions with their page ranges (approximate)
-BOOKS = {
-    1: {"title": "Stories of Sahaabah", "arabic": "حکایاتِ صحابہ", "start_page": 3, "end_page": 130},
-    2: {"title": "Virtues of Holy Qur'aan", "arabic": "فضائلِ قرآن", "start_page": 131, "end_page": 180},
-    3: {"title": "Virtues of Salaat", "arabic": "فضائلِ نماز", "start_page": 181, "end_page": 260},
-    4: {"title": "Virtues of Zikr", "arabic": "فضائلِ ذکر", "start_page": 261, "end_page": 320},
-    5: {"title": "Virtues of Tabligh", "arabic": "فضائلِ تبلیغ", "start_page": 321, "end_page": 370},
-    6: {"title": "Virtues of Ramadhaan", "arabic": "فضائلِ رمضان", "start_page": 371, "end_page": 420},
-    7: {"title": "Muslim Degeneration", "arabic": "مسلمانوں کی پستی", "start_page": 421, "end_page": 440},
-    8: {"title": "Six Fundamentals", "arabic": "چھ اصول", "start_page": 441, "end_page": 452},
-}
-
-def is_arabic_text(text):
-    """Check if text contains Arabic characters."""
-    arabic_pattern = re.compile(r'[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF]+')
-    return bool(arabic_pattern.search(text))
+import patterns
+from arabic_text import is_arabic_text, normalize_arabic, search_key
+from book_structure import load_structure, book_for_page, chapter_for_page
+from page_layout import load_layout, page_segments, strip_margin_bands
 
 def extract_with_arabic_detection(pdf_path):
     """Extract text with Arabic detection and positioning."""
-    doc = fitz.open(pdf_path)
+    # Running headers and page numbers never make it into the segments
+    layout = strip_margin_bands(load_layout(pdf_path))
     all_content = []
     
-    print(f"Processing {len(doc)} pages...")
+    print(f"Processing {len(layout)} pages...")
     
-    for page_num in range(len(doc)):
-        page = doc[page_num]
-        
-        # Get text blocks with position info
-        blocks = page.get_text("dict", flags=fitz.TEXT_PRESERVE_WHITESPACE)["blocks"]
-        
+    for page_layout in layout:
         page_content = {
-            "page": page_num + 1,
+            "page": page_layout["page"],
             "segments": []
         }
         
-        for block in blocks:
-            if "lines" in block:
-                for line in block["lines"]:
-                    for span in line["spans"]:
-                        text = span["text"].strip()
-                        if text:
-                            is_arabic = is_arabic_text(text)
-                            page_content["segments"].append({
-                                "text": text,
-                                "is_arabic": is_arabic,
-                                "font": span.get("font", ""),
-                                "size": span.get("size", 0),
-                                "y_position": span.get("origin", [0, 0])[1] if "origin" in span else 0
-                            })
+        for segment in page_segments(page_layout):
+            text = segment["text"]
+            is_arabic = is_arabic_text(text)
+            segment["is_arabic"] = is_arabic
+            if is_arabic:
+                segment["text"] = normalize_arabic(text)
+                segment["search_key"] = search_key(text)
+            page_content["segments"].append(segment)
         
         all_content.append(page_content)
-        
-        if (page_num + 1) % 50 == 0:
-            print(f"  Processed {page_num + 1} pages...")
     
-    doc.close()
     return all_content
 
-def identify_chapters_and_stories(content):
-    """Identify chapter headers and story titles from the extracted content."""
+def identify_chapters_and_stories(content, structure):
+    """Identify chapter headers and story titles from the extracted content.
+
+    Books (and chapters, when the structure index has them) come from
+    book_structure lookups; the regex scan is only used for chapters when
+    the index has none.
+    """
+    # Chapter ids run across the whole corpus; the number is the position within its book
+    book_chapter_counts = Counter()
     chapters = []
+    for c in structure["chapters"]:
+        book_chapter_counts[c["book_id"]] += 1
+        chapters.append({
+            "id": c["id"],
+            "book_id": c["book_id"],
+            "number": str(book_chapter_counts[c["book_id"]]),
+            "title": c["title"],
+            "start_page": c["start_page"]
+        })
+    chapters_by_id = {c["id"]: c for c in chapters}
+    scan_chapters = not chapters
     stories = []
     
     current_book = 1
@@ -82,42 +74,42 @@ def identify_chapters_and_stories(content):
     ]
     
     # Story title patterns (numbered items)
-    story_pattern = re.compile(r'^(\d+)\.\s+(.+?)(?:\s*\(|:|\n|$)')
+    story_pattern = patterns.compile_pattern(r'^(\d+)\.\s+(.+?)(?:\s*\(|:|\n|$)')
     
     for page_data in content:
         page_num = page_data["page"]
         
-        # Determine which book this page belongs to
-        for book_id, book_info in BOOKS.items():
-            if book_info["start_page"] <= page_num <= book_info["end_page"]:
-                current_book = book_id
-                break
+        # Determine which book (and chapter) this page belongs to
+        current_book = book_for_page(structure, page_num) or current_book
+        if not scan_chapters:
+            current_chapter = chapters_by_id.get(chapter_for_page(structure, page_num), current_chapter)
         
         # Combine segments into full text for pattern matching
         page_text = ""
         for seg in page_data["segments"]:
             page_text += seg["text"] + " "
         
-        # Check for chapter headers
-        for pattern, ptype in chapter_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                chapter_num = match.group(1)
-                # Try to extract chapter title
-                title_match = re.search(pattern + r'\s*[:\n]?\s*(.+?)(?:\.|$)', page_text, re.IGNORECASE)
-                if title_match and len(title_match.groups()) > 1:
-                    title = title_match.group(2)[:100]  # Limit title length
-                else:
-                    title = f"Chapter {chapter_num}"
+        # Check for chapter headers (only when the structure index has none)
+        if scan_chapters:
+            for pattern, ptype in chapter_patterns:
+                match = patterns.search(pattern, page_text, re.IGNORECASE)
+                if match:
+                    chapter_num = match.group(1)
+                    # Try to extract chapter title
+                    title_match = patterns.search(pattern + r'\s*[:\n]?\s*(.+?)(?:\.|$)', page_text, re.IGNORECASE)
+                    if title_match and len(title_match.groups()) > 1:
+                        title = title_match.group(2)[:100]  # Limit title length
+                    else:
+                        title = f"Chapter {chapter_num}"
                 
-                current_chapter = {
-                    "id": len(chapters) + 1,
-                    "book_id": current_book,
-                    "number": chapter_num,
-                    "title": title.strip(),
-                    "start_page": page_num
-                }
-                chapters.append(current_chapter)
+                    current_chapter = {
+                        "id": len(chapters) + 1,
+                        "book_id": current_book,
+                        "number": chapter_num,
+                        "title": title.strip(),
+                        "start_page": page_num
+                    }
+                    chapters.append(current_chapter)
         
         # Check for story titles (numbered entries like "1. Prophet's Journey to Taif")
         story_matches = story_pattern.findall(page_text)
@@ -189,11 +181,13 @@ def process_full_pdf():
     # Step 1: Extract all content with Arabic detection
     print("\n[1/4] Extracting text with Arabic detection...")
     content = extract_with_arabic_detection(pdf_path)
+    structure = load_structure(pdf_path)
+    books = structure["books"]
     print(f"  Extracted {len(content)} pages")
     
     # Step 2: Identify chapters and stories
     print("\n[2/4] Identifying chapters and stories...")
-    chapters, stories = identify_chapters_and_stories(content)
+    chapters, stories = identify_chapters_and_stories(content, structure)
     print(f"  Found {len(chapters)} chapters and {len(stories)} stories")
     
     # Step 3: Save structured data
@@ -222,14 +216,14 @@ def process_full_pdf():
     output = {
         "books": [
             {
-                "id": book_id,
-                "title": info["title"],
-                "arabic": info["arabic"],
-                "start_page": info["start_page"],
-                "end_page": info["end_page"],
-                "story_count": len([s for s in stories if s["book_id"] == book_id])
+                "id": book["id"],
+                "title": book["title"],
+                "arabic": book["arabic"],
+                "start_page": book["start_page"],
+                "end_page": book["end_page"],
+                "story_count": len([s for s in stories if s["book_id"] == book["id"]])
             }
-            for book_id, info in BOOKS.items()
+            for book in books
         ],
         "chapters": chapters,
         "stories": stories,
@@ -276,9 +270,10 @@ def process_full_pdf():
     print(f"Total Stories: {len(stories)}")
     print(f"Arabic Segments: {arabic_segment_count}")
     print("\nBooks breakdown:")
-    for book_id, info in BOOKS.items():
-        story_count = len([s for s in stories if s["book_id"] == book_id])
-        print(f"  {book_id}. {info['title']}: {story_count} stories")
+    for book in books:
+        story_count = len([s for s in stories if s["book_id"] == book["id"]])
+        print(f"  {book['id']}. {book['title']}: {story_count} stories")
+    patterns.print_pattern_stats()
 
 if __name__ == "__main__":
     process_full_pdf()
@@ -1,7 +1,53 @@
+import glob
 import json
 import re
 import os
+import posixpath
+import sys
 import fitz # PyMuPDF
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+import patterns
+from checkpoint import Checkpoint
+from clip_writer import ClipWriter, png_size
+from deed_overrides import load_overrides
+from glyph_remap import MIN_COVERAGE, learn_glyph_maps, page_glyphs, remap_region
+from page_layout import file_hash, load_layout, clip_bbox, detect_margin_bands, strip_margin_bands
+
+# "font": classify spans by a per-document font profile (one pre-pass)
+# "heuristic": classify each span's text with is_garbage
+DETECTION_MODE = "font"
+
+# "text": emit Unicode Arabic recovered from the embedded fonts, falling back to an image clip
+# "image": always render calligraphy runs to PNG clips
+ARABIC_RENDER_MODE = "text"
+
+# Raster tiers for image clips; the first tier is the 1x src, the rest become srcset candidates
+CLIP_DPI_TIERS = [96, 192]
+
+# Also keep a vector crop of each clip ("pdf", "svg" or None) so new tiers can be rendered later
+CLIP_VECTOR_FORMAT = "pdf"
+
+# Font names that are always calligraphy regardless of their text statistics
+CALLIGRAPHY_FONT_HINTS = ("arabic", "naskh", "nastaliq", "quran", "uthman", "amiri", "traditional")
+
+# Fraction of a font's characters that must be symbols for it to count as mis-encoded Arabic
+CALLIGRAPHY_SYMBOL_RATIO = 0.3
+
+# Characters that make up ordinary English text; anything else counts as a symbol
+PLAIN_CHARS = str.maketrans("", "", "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 .,;:'\"-()[]!?\n\t")
+
+# Deed assembly: processes used once deed boundaries are known (1 = in-process)
+ASSEMBLY_WORKERS = 1
+
+LEADING_SPACE = patterns.compile_pattern(r'\s*')
+PAGE_NUMBER_LINE = patterns.compile_pattern(r'\s*\d+\s*')
+# Either a whole page-number line (skipped) or one word of content
+CLEANUP_TOKENS = patterns.compile_pattern(r'^[^\S\n]*\d+[^\S\n]*$|(\S+)', re.MULTILINE)
+
+CLIP_TAG = patterns.compile_pattern(r'<img src="([^"]+)"[^>]*class="arabic-text"[^>]*>')
+CLIP_TIER_SUFFIX = patterns.compile_pattern(r'(?:@[\d.]+x)?\.png$')
 
 def is_garbage(text):
     text = text.strip()
@@ -9,12 +55,12 @@ def is_garbage(text):
         return False
         
     # Ignore numbers like (1), 1., 123
-    if re.match(r'^[\(\[]?\d+[\)\]]?\.?$', text):
+    if patterns.match(r'^[\(\[]?\d+[\)\]]?\.?$', text):
         return False
     
     # Check for specific garbage patterns or high non-alnum ratio
     # Added ~ and ` to the list, and check for them anywhere
-    if re.search(r'[&@#$%\^&*/\\]{3,}', text) or re.search(r'[~`]', text):
+    if patterns.search(r'[&@#$%\^&*/\\]{3,}', text) or patterns.search(r'[~`]', text):
         return True
         
     # Check for high density of punctuation/symbols
@@ -28,33 +74,199 @@ def is_garbage(text):
         words = [w for w in text.split() if len(w) >= 3 and w.isalpha()]
         if not words:
             # If no valid words, and contains suspicious chars or mostly uppercase/numbers
-            if re.search(r'[A-Z0-9]', text) and re.search(r'[\.,;\'\"]', text):
+            if patterns.search(r'[A-Z0-9]', text) and patterns.search(r'[\.,;\'\"]', text):
                  # Check if it looks like the specific garbage pattern
-                 if re.search(r'\s[A-Z0-9]\s', text) or re.search(r',[A-Z],', text):
+                 if patterns.search(r'\s[A-Z0-9]\s', text) or patterns.search(r',[A-Z],', text):
                      return True
 
-    non_alnum = re.sub(r'[a-zA-Z0-9\s\.,;:\'\"-]', '', text)
+    non_alnum = patterns.sub(r'[a-zA-Z0-9\s\.,;:\'\"-]', '', text)
     if len(text) > 0 and len(non_alnum) / len(text) > 0.4:
         return True
         
     return False
 
-def extract_text_from_pdf(pdf_path):
+def build_font_profile(layout):
+    """Aggregate character statistics per font and return the set of calligraphy fonts.
+
+    A font is classified once for the whole document, so spans are later
+    recognised by a set lookup on span["font"] instead of inspecting their text.
+    """
+    totals = defaultdict(int)
+    symbols = defaultdict(int)
+
+    for page_layout in layout:
+        for b in page_layout["blocks"]:
+            for line in b.get("lines", []):
+                for span in line["spans"]:
+                    text = span["text"].strip()
+                    if not text:
+                        continue
+                    totals[span["font"]] += len(text)
+                    symbols[span["font"]] += len(text.translate(PLAIN_CHARS))
+
+    calligraphy_fonts = set()
+    for font, total in totals.items():
+        if any(hint in font.lower() for hint in CALLIGRAPHY_FONT_HINTS):
+            calligraphy_fonts.add(font)
+        elif symbols[font] / total > CALLIGRAPHY_SYMBOL_RATIO:
+            calligraphy_fonts.add(font)
+
+    return calligraphy_fonts
+
+def save_vector_clip(doc, page, bbox, stem, output_dir, fmt=CLIP_VECTOR_FORMAT, writer=None):
+    """Store the clip region as a single-page PDF (or SVG) crop; returns its path.
+
+    The crop is serialized here (PyMuPDF documents aren't thread-safe);
+    with a writer, the file write is left to its thread pool.
+    """
+    crop = fitz.open()
+    crop_page = crop.new_page(width=bbox.width, height=bbox.height)
+    crop_page.show_pdf_page(crop_page.rect, doc, page.number, clip=bbox)
+    if fmt == "svg":
+        data = crop_page.get_svg_image(text_as_path=True).encode("utf-8")
+    else:
+        data = crop.tobytes(garbage=3, deflate=True)
+    crop.close()
+
+    vector_dir = os.path.join(output_dir, "vector")
+    os.makedirs(vector_dir, exist_ok=True)
+    path = os.path.join(vector_dir, f"{stem}.{fmt}")
+    if writer:
+        writer.submit_bytes(data, path)
+    else:
+        with open(path, "wb") as f:
+            f.write(data)
+    return path
+
+def tier_filename(stem, dpi, tiers=CLIP_DPI_TIERS):
+    """arabic_clip_3_7.png for the base tier, arabic_clip_3_7@2x.png for a 2x tier."""
+    scale = dpi / tiers[0]
+    if scale == 1:
+        return f"{stem}.png"
+    return f"{stem}@{scale:g}x.png"
+
+def render_clip_tiers(vector_path, tiers=CLIP_DPI_TIERS, writer=None):
+    """Rasterize requested DPI tiers from a stored vector crop (on-demand upscaling).
+
+    Tier files of the same clip that aren't in tiers are removed.
+    """
+    output_dir = os.path.dirname(os.path.dirname(vector_path))
+    stem = os.path.splitext(os.path.basename(vector_path))[0]
+    wanted = {tier_filename(stem, dpi, tiers) for dpi in tiers}
+    for path in glob.glob(os.path.join(output_dir, glob.escape(stem) + "@*x.png")):
+        if os.path.basename(path) not in wanted:
+            os.remove(path)
+    crop = fitz.open(vector_path)
+    for dpi in tiers:
+        pix = crop[0].get_pixmap(dpi=dpi)
+        path = os.path.join(output_dir, tier_filename(stem, dpi, tiers))
+        if writer:
+            writer.submit(pix, path, dpi=dpi)
+        else:
+            pix.save(path)
+    crop.close()
+
+def clip_img_tag(output_dir, stem, tiers=CLIP_DPI_TIERS, width=None, height=None):
+    """<img> for a clip with a srcset covering every rendered tier.
+
+    width/height are the base tier's pixel size; with them the browser
+    reserves the box up front, so lazily loaded clips don't shift layout.
+    """
+    src = f"{output_dir}/{tier_filename(stem, tiers[0], tiers)}"
+    srcset = ", ".join(f"{output_dir}/{tier_filename(stem, dpi, tiers)} {dpi / tiers[0]:g}x" for dpi in tiers)
+    size = f' width="{width}" height="{height}"' if width and height else ''
+    return f'<img src="{src}" srcset="{srcset}"{size} loading="lazy" decoding="async" class="arabic-text" alt="Arabic Text" />'
+
+def retier_clip_tags(html, tiers, stems, root="."):
+    """Rebuild the src/srcset of the clip tags in stems for tiers, sized from the re-rendered base tier.
+
+    stems holds "output_dir/stem" paths; tags of clips that were not
+    re-rendered are left untouched, since their tier files don't exist.
+    """
+    def fix(match):
+        output_dir, name = posixpath.split(match.group(1))
+        stem = CLIP_TIER_SUFFIX.sub("", name)
+        if posixpath.normpath(posixpath.join(output_dir, stem)) not in stems:
+            return match.group(0)
+        base = os.path.join(root, output_dir, tier_filename(stem, tiers[0], tiers))
+        width, height = png_size(base) if os.path.exists(base) else (None, None)
+        return clip_img_tag(output_dir, stem, tiers, width=width, height=height)
+    return CLIP_TAG.sub(fix, html)
+
+def add_clip_dimensions(html, root="."):
+    """Add width/height (read from the PNG) and lazy-loading attributes to clip tags that lack them."""
+    def fix(match):
+        tag = match.group(0)
+        if 'width=' in tag:
+            return tag
+        path = os.path.join(root, match.group(1))
+        size = ''
+        if os.path.exists(path):
+            width, height = png_size(path)
+            size = f'width="{width}" height="{height}" '
+        return tag.replace('class="arabic-text"', f'{size}loading="lazy" decoding="async" class="arabic-text"', 1)
+    return CLIP_TAG.sub(fix, html)
+
+def rewrite_deed_content(transform, content_file="deeds_content.json"):
+    """Apply transform to every deed's content in place, without re-extracting."""
+    with open(content_file, "r", encoding="utf-8") as f:
+        deeds = json.load(f)
+    for deed in deeds:
+        deed["content"] = transform(deed["content"])
+    with open(content_file, "w", encoding="utf-8") as f:
+        json.dump(deeds, f, indent=4)
+
+def backfill_clip_dimensions(content_file="deeds_content.json"):
+    """Rewrite already-extracted deed content with clip dimensions."""
+    rewrite_deed_content(add_clip_dimensions, content_file)
+    print(f"Added clip dimensions in {content_file}")
+
+def extract_text_from_pdf(pdf_path, detection=DETECTION_MODE, render_mode=ARABIC_RENDER_MODE, output_dir="arabic_clips",
+                          tiers=CLIP_DPI_TIERS):
     if not os.path.exists(pdf_path):
         print(f"Error: File not found at {pdf_path}")
         return None
 
-    output_dir = "arabic_clips"
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
 
     doc = fitz.open(pdf_path)
-    full_text = ""
-    clip_count = 0
     
-    for page_num, page in enumerate(doc):
-        blocks = page.get_text("dict")["blocks"]
+    # Running headers and page numbers are dropped here, so later stages never see them
+    layout = load_layout(pdf_path)
+    bands = detect_margin_bands(layout)
+    layout = strip_margin_bands(layout, bands)
+    print(f"Margin bands: header above {bands['header']:.1%}, footer below {bands['footer']:.1%} of page height")
+    
+    calligraphy_fonts = build_font_profile(layout)
+    print(f"Calligraphy fonts: {sorted(calligraphy_fonts)}")
+    
+    if detection == "font":
+        is_calligraphy = lambda span: span["font"] in calligraphy_fonts and bool(span["text"].strip())
+    else:
+        is_calligraphy = lambda span: is_garbage(span["text"])
+    
+    glyph_maps = learn_glyph_maps(doc, calligraphy_fonts) if render_mode == "text" else {}
+    
+    # Completed page ranges (text plus the clips they produced) survive a crash
+    checkpoint = Checkpoint("deeds_text", file_hash(pdf_path), {
+        "detection": detection, "render_mode": render_mode, "output_dir": output_dir,
+        "tiers": tiers, "vector_format": CLIP_VECTOR_FORMAT
+    })
+    full_text = "".join(chunk["text"] for chunk in checkpoint.chunks)
+    clip_count = checkpoint.chunks[-1]["clip_count"] if checkpoint.chunks else 0
+    text_count = checkpoint.chunks[-1]["text_count"] if checkpoint.chunks else 0
+    chunk_text = ""
+    chunk_files = []
+    
+    # PNG encoding and disk writes happen off the extraction loop
+    writer = ClipWriter()
+    
+    for page_num in range(checkpoint.next_page, len(doc)):
+        page = doc[page_num]
+        blocks = layout[page_num]["blocks"]
         page_text = ""
+        glyphs = None  # texttrace is only read for pages that have calligraphy
         
         # Do not sort blocks manually; rely on fitz default order (usually better for reading order if not columnar-interleaved by y-coord)
         # blocks.sort(key=lambda b: (b["bbox"][1], b["bbox"][0]))
@@ -68,47 +280,65 @@ def extract_text_from_pdf(pdf_path):
                         span = spans[i]
                         text = span["text"]
                         
-                        if is_garbage(text):
+                        if is_calligraphy(span):
                             # Look ahead for more garbage in this line to merge
                             garbage_spans = [span]
                             j = i + 1
-                            while j < len(spans) and is_garbage(spans[j]["text"]):
+                            while j < len(spans) and is_calligraphy(spans[j]):
                                 garbage_spans.append(spans[j])
                                 j += 1
                             
-                            # Compute union bbox
-                            x0 = min(s["bbox"][0] for s in garbage_spans)
-                            y0 = min(s["bbox"][1] for s in garbage_spans)
-                            x1 = max(s["bbox"][2] for s in garbage_spans)
-                            y1 = max(s["bbox"][3] for s in garbage_spans)
+                            if glyph_maps:
+                                if glyphs is None:
+                                    glyphs = page_glyphs(page, calligraphy_fonts)
+                                arabic, coverage = remap_region(glyphs, clip_bbox(garbage_spans, 0, 0), glyph_maps)
+                                if arabic and coverage >= MIN_COVERAGE:
+                                    page_text += f' <span class="arabic-text" lang="ar" dir="rtl">{arabic}</span> '
+                                    text_count += 1
+                                    i = j
+                                    continue
                             
-                            bbox = fitz.Rect(x0, y0, x1, y1)
+                            # Union bbox with generous padding to avoid clipping calligraphy
+                            bbox = fitz.Rect(clip_bbox(garbage_spans))
                             
-                            # Add generous padding to avoid clipping calligraphy
-                            bbox.x0 -= 5
-                            bbox.y0 -= 15  # Increased vertical padding
-                            bbox.x1 += 5
-                            bbox.y1 += 15  # Increased vertical padding
+                            stem = f"arabic_clip_{page_num+1}_{clip_count}"
+                            if CLIP_VECTOR_FORMAT:
+                                chunk_files.append(save_vector_clip(doc, page, bbox, stem, output_dir, writer=writer))
+                            for dpi in tiers:
+                                pix = page.get_pixmap(clip=bbox, dpi=dpi)
+                                if dpi == tiers[0]:
+                                    width, height = pix.width, pix.height
+                                clip_path = os.path.join(output_dir, tier_filename(stem, dpi, tiers))
+                                writer.submit(pix, clip_path, dpi=dpi)
+                                chunk_files.append(clip_path)
                             
-                            pix = page.get_pixmap(clip=bbox, dpi=300)
-                            filename = f"arabic_clip_{page_num+1}_{clip_count}.png"
-                            pix.save(os.path.join(output_dir, filename))
-                            
-                            # Append image tag to text
-                            page_text += f' <img src="{output_dir}/{filename}" class="arabic-text" alt="Arabic Text" /> '
+                            # Append image tag to text, sized from the base tier
+                            page_text += f' {clip_img_tag(output_dir, stem, tiers, width=width, height=height)} '
                             clip_count += 1
                             
                             i = j # Skip processed spans
                         else:
                             # Debug print for suspicious but accepted text
-                            if any(c in text for c in "~&+$<>^"):
+                            if detection != "font" and any(c in text for c in "~&+$<>^"):
                                 print(f"DEBUG: Text kept (not garbage): {text!r}")
                             page_text += text + " "
                             i += 1
                     page_text += "\n"
             page_text += "\n"
         full_text += page_text
+        chunk_text += page_text
         
+        if checkpoint.is_chunk_end(page_num, len(doc)):
+            writer.flush()  # the chunk's clips must be on disk before it is recorded
+            checkpoint.save(checkpoint.chunk_start(page_num), page_num + 1, {
+                "text": chunk_text, "clip_count": clip_count, "text_count": text_count, "files": chunk_files
+            })
+            chunk_text = ""
+            chunk_files = []
+    
+    writer.close()
+    checkpoint.clear()
+    print(f"Arabic runs: {text_count} as text, {clip_count} as image clips")
     return full_text
 
 def load_deeds_metadata(file_path):
@@ -116,7 +346,7 @@ def load_deeds_metadata(file_path):
         content = f.read()
     
     # Extract the array content
-    match = re.search(r'const deeds = \[(.*?)\];', content, re.DOTALL)
+    match = patterns.search(r'const deeds = \[(.*?)\];', content, re.DOTALL)
     if not match:
         print("Could not find deeds array")
         return []
@@ -130,8 +360,8 @@ def load_deeds_metadata(file_path):
         if not obj:
             continue
             
-        id_match = re.search(r'id:\s*(\d+)', obj)
-        title_match = re.search(r'title:\s*"(.*?)"', obj)
+        id_match = patterns.search(r'id:\s*(\d+)', obj)
+        title_match = patterns.search(r'title:\s*"(.*?)"', obj)
         
         if id_match and title_match:
             deeds.append({
@@ -141,7 +371,7 @@ def load_deeds_metadata(file_path):
             })
     return deeds
 
-def find_deed_content(full_text, deeds):
+def find_deed_content(full_text, deeds, overrides=None, workers=ASSEMBLY_WORKERS):
     # We will search for headers based on ID.
     # Patterns observed: "(1) TITLE", "2. TITLE", "(53) TITLE"
     # We'll look for these patterns at the start of lines.
@@ -151,23 +381,12 @@ def find_deed_content(full_text, deeds):
     
     deed_indices = []
     
-    # Overrides for IDs that are labeled differently in PDF
-    ID_OVERRIDES = {
-        37: 31, # Labeled as (31) in PDF body
-        47: 41, # Labeled as (41) in PDF body
-        79: 19, # data.js 79 (Morsel) -> PDF 19 (typo for 79)
-    }
-    
-    # Overrides for Regex patterns for specific IDs (original ID)
-    REGEX_OVERRIDES = {
-        1: r'(?:^|\n)\s*\(1\)\s+GOOD', # Deed 1 override
-        2: r'(?:^|\n)\s*2\.\s+PRAYING', # Deed 2 uses "2. PRAYING"
-        21: r'(?:^|\n)\s*(?:Tenderness\s+towards\s+others|\(21\))', # Missing header
-        51: r'(?:\(511|511\.)', # Typo in PDF, appears mid-line
-        68: r'(?:^|\n).*?\(68\)', # Loose match for 68 (has noise before it), non-greedy
-        71: r'(?:^|\n).*?(?:Six\s+Good\s+Deeds|SIX\s+GOOD\s+DEEDS|\(71\))', # Weird label, loose match
-        79: r'(?:^|\n)\s*(?:\(19\)|19\.)\s+CLEANING' # Second (19)
-    }
+    # Per-book quirks come from deed_overrides.json (compiled once, reloaded on change)
+    if overrides is None:
+        overrides = load_overrides()
+    id_overrides = overrides["id_overrides"]
+    regex_overrides = overrides["patterns"]
+    keep_first_line = overrides["keep_first_line"]
     
     current_pos = 0
     
@@ -175,18 +394,18 @@ def find_deed_content(full_text, deeds):
         deed_id = deed['id']
         
         # Determine search ID
-        search_id = ID_OVERRIDES.get(deed_id, deed_id)
+        search_id = id_overrides.get(deed_id, deed_id)
         
         # Determine pattern
-        if deed_id in REGEX_OVERRIDES:
-            pattern = REGEX_OVERRIDES[deed_id]
+        if deed_id in regex_overrides:
+            pattern = regex_overrides[deed_id]
         else:
             # Default pattern: (ID) followed by whitespace AND an uppercase letter (start of title)
             # We REMOVED 'ID.' because it matches list items (e.g. 1., 3., 4.) inside other deeds.
             # We use (?=[A-Z]) to ensure it's a title (most titles start with uppercase).
-            pattern = r'(?:^|\n)\s*\(' + str(search_id) + r'\)\s+(?=[A-Z])'
+            pattern = patterns.compile_pattern(r'(?:^|\n)\s*\(' + str(search_id) + r'\)\s+(?=[A-Z])')
             
-        match = re.search(pattern, full_text[current_pos:])
+        match = pattern.search(full_text[current_pos:])
         
         if match:
             start_index = current_pos + match.start()
@@ -204,7 +423,7 @@ def find_deed_content(full_text, deeds):
             # If mapped ID failed, maybe try original ID?
             if search_id != deed_id:
                  id_pattern_orig = r'(?:^|\n)\s*(?:(' + str(deed_id) + r')|' + str(deed_id) + r'\.)\s+(?=[A-Z])'
-                 match_orig = re.search(id_pattern_orig, full_text[current_pos:])
+                 match_orig = patterns.search(id_pattern_orig, full_text[current_pos:])
                  if match_orig:
                      start_index = current_pos + match_orig.start()
                      if full_text[start_index] == '\n':
@@ -217,47 +436,50 @@ def find_deed_content(full_text, deeds):
             print(f"Warning: Could not find start of deed {deed_id} (Search ID: {search_id})")
             print(f"Context at current_pos ({current_pos}): {full_text[current_pos:current_pos+100]!r}")
             
-    # Now extract content
+    # Now extract content: each deed runs from its start to the next deed's start
+    deeds_by_id = {d['id']: d for d in deeds}
+    jobs = []
+    for i, (deed_id, start_index) in enumerate(deed_indices):
+        end_index = deed_indices[i + 1][1] if i < len(deed_indices) - 1 else len(full_text)
+        header_ids = () if deed_id in keep_first_line else (str(id_overrides.get(deed_id, deed_id)), str(deed_id))
+        jobs.append((deed_id, start_index, end_index, header_ids))
+    
+    if workers > 1:
+        # Ship only each deed's slice to the worker processes
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            contents = list(pool.map(assemble_deed, [full_text[s:e] for _, s, e, _ in jobs],
+                                     [0] * len(jobs), [e - s for _, s, e, _ in jobs],
+                                     [h for _, _, _, h in jobs], chunksize=8))
+    else:
+        contents = [assemble_deed(full_text, s, e, h) for _, s, e, h in jobs]
+    
     final_deeds = []
-    for i in range(len(deed_indices)):
-        deed_id, start_index = deed_indices[i]
-        
-        if i < len(deed_indices) - 1:
-            end_index = deed_indices[i+1][1]
-        else:
-            end_index = len(full_text)
-            
-        content = full_text[start_index:end_index].strip()
-        
-        # Clean up the content
-        lines = content.split('\n')
-        
-        # Remove lines that are just the ID and Title (existing logic)
-        search_id = ID_OVERRIDES.get(deed_id, deed_id)
-        if lines:
-            first_line = lines[0]
-            if str(search_id) in first_line or str(deed_id) in first_line or (deed_id == 21 and "Tenderness" in first_line):
-                if deed_id != 21:
-                    lines.pop(0)
-        
-        # Filter out page numbers (lines that are just digits)
-        cleaned_lines = []
-        for line in lines:
-            # Check if line is just a number (page number)
-            if re.match(r'^\s*\d+\s*$', line):
-                continue
-            
-            cleaned_lines.append(line)
-            
-        content = '\n'.join(cleaned_lines).strip()
-        content = re.sub(r'\s+', ' ', content)
-        
-        deed_obj = next(d for d in deeds if d['id'] == deed_id)
+    for (deed_id, _, _, _), content in zip(jobs, contents):
+        deed_obj = deeds_by_id[deed_id]
         deed_obj['content'] = content
         final_deeds.append(deed_obj)
     
     return final_deeds
 
+def assemble_deed(text, start, end, header_ids):
+    """Cleaned content of text[start:end] in one pass over the buffer.
+
+    Drops the first line when it carries one of header_ids (the deed's
+    label), drops page-number lines and collapses all whitespace.
+    """
+    start = LEADING_SPACE.match(text, start, end).end()
+    line_end = text.find('\n', start, end)
+    if line_end == -1:
+        line_end = end
+    first_line = text[start:line_end]
+    
+    words = []
+    if not any(h in first_line for h in header_ids) and not PAGE_NUMBER_LINE.fullmatch(first_line):
+        words.extend(first_line.split())
+    # Page-number lines match the first alternative and are skipped
+    words.extend(m.group(1) for m in CLEANUP_TOKENS.finditer(text, line_end, end) if m.group(1))
+    return ' '.join(words)
+
 def main():
     pdf_path = "easy-good-deeds.pdf"
     print(f"Extracting text from {pdf_path}...")
@@ -285,6 +507,33 @@ def main():
     with open("deeds_content.json", "w", encoding="utf-8") as f:
         json.dump(deeds, f, indent=4)
     print("Saved to deeds_content.json")
+    patterns.print_pattern_stats()
+
+def render_stored_tiers(tiers, output_dir="arabic_clips", content_file="deeds_content.json"):
+    """Re-render every stored vector crop at the given DPI tiers and point those clips' tags at them."""
+    vector_paths = sorted(glob.glob(os.path.join(output_dir, "vector", "*.pdf")) +
+                          glob.glob(os.path.join(output_dir, "vector", "*.svg")))
+    if not vector_paths:
+        print(f"No stored vector crops in {os.path.join(output_dir, 'vector')}; nothing to re-render")
+        return
+    rendered = set()
+    with ClipWriter() as writer:
+        for vector_path in vector_paths:
+            render_clip_tiers(vector_path, tiers, writer)
+            stem = os.path.splitext(os.path.basename(vector_path))[0]
+            rendered.add(posixpath.normpath(posixpath.join(output_dir.replace(os.sep, "/"), stem)))
+    print(f"Rendered {len(vector_paths)} clips at {tiers} dpi")
+
+    # The base tier's pixel size is read back, so this runs after the writer has finished
+    rewrite_deed_content(lambda html: retier_clip_tags(html, tiers, rendered), content_file)
+    print(f"Updated clip srcsets in {content_file}")
 
 if __name__ == "__main__":
-    main()
+    # python extract_deeds.py --tiers 96,192,288
+    # python extract_deeds.py --backfill-sizes
+    if "--tiers" in sys.argv:
+        render_stored_tiers([int(d) for d in sys.argv[sys.argv.index("--tiers") + 1].split(",")])
+    elif "--backfill-sizes" in sys.argv:
+        backfill_clip_dimensions()
+    else:
+        main()
@@ -1,25 +1,22 @@
 """
 Extract content from Fazail-e-Amaal PDF and create structured data for the website.
 """
-import fitz  # PyMuPDF
 import json
 import re
 import os
 
+from page_layout import load_layout, page_text, strip_margin_bands
+
 def extract_text_from_pdf(pdf_path):
     """Extract all text from PDF."""
-    doc = fitz.open(pdf_path)
     full_text = []
     
-    for page_num in range(len(doc)):
-        page = doc[page_num]
-        text = page.get_text()
+    for page_layout in strip_margin_bands(load_layout(pdf_path)):
         full_text.append({
-            "page": page_num + 1,
-            "text": text
+            "page": page_layout["page"],
+            "text": page_text(page_layout)
         })
     
-    doc.close()
     return full_text
 
 def identify_chapters(pages):
@@ -0,0 +1,142 @@
+"""
+Extract the images embedded in a PDF into extracted_images/.
+Images are enumerated with page.get_images() and deduplicated by xref, so
+an image shared by several pages is saved once. JPEG and PNG streams are
+written as-is; anything a browser can't show directly (JPX, JBIG2, CMYK,
+images with a soft mask) is converted to PNG. Files are written on a
+ClipWriter thread pool, and manifest.json maps every page to its images.
+
+Usage:
+    python extract_images.py [pdf_path] [output_dir] [--force]
+"""
+import json
+import os
+import sys
+import fitz # PyMuPDF
+
+from clip_writer import ClipWriter
+from page_layout import file_hash
+
+PDF_FILE = "easy-good-deeds.pdf"
+OUTPUT_DIR = "extracted_images"
+MANIFEST_NAME = "manifest.json"
+
+# Formats written straight from the PDF stream without re-encoding
+PASSTHROUGH_FORMATS = {"jpeg": "jpg", "png": "png"}
+
+# Colour components browsers handle in a passthrough JPEG (grey, RGB)
+PASSTHROUGH_COMPONENTS = (1, 3)
+
+WRITER_THREADS = 4
+
+
+def load_manifest(output_dir):
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def is_current(manifest, pdf_hash, output_dir):
+    """True when the manifest was built from this PDF and every image is still on disk."""
+    return (manifest is not None and manifest.get("pdf_hash") == pdf_hash
+            and all(os.path.exists(os.path.join(output_dir, name)) for name in manifest["images"]))
+
+
+def _passthrough(info):
+    """Extension to save the raw stream under, or None if it must be converted."""
+    ext = PASSTHROUGH_FORMATS.get(info["ext"])
+    if ext is None or info.get("smask"):
+        return None
+    if info["ext"] == "jpeg" and info.get("colorspace") not in PASSTHROUGH_COMPONENTS:
+        return None
+    return ext
+
+
+def _to_pixmap(doc, xref, smask):
+    """Decode an image to an RGB(A) pixmap, applying its soft mask."""
+    pix = fitz.Pixmap(doc, xref)
+    if pix.colorspace and pix.colorspace.n > 3:
+        pix = fitz.Pixmap(fitz.csRGB, pix)
+    if smask:
+        pix = fitz.Pixmap(pix, fitz.Pixmap(doc, smask))
+    return pix
+
+
+def extract_images(pdf_path=PDF_FILE, output_dir=OUTPUT_DIR, force=False):
+    """Save every distinct embedded image once and write the page -> images manifest."""
+    pdf_hash = file_hash(pdf_path)
+    manifest = load_manifest(output_dir)
+    if not force and is_current(manifest, pdf_hash, output_dir):
+        print(f"{output_dir} is up to date ({len(manifest['images'])} images)")
+        return manifest
+
+    os.makedirs(output_dir, exist_ok=True)
+    doc = fitz.open(pdf_path)
+    saved = {}
+    pages = {}
+    images = {}
+    converted = 0
+
+    # PyMuPDF documents aren't thread-safe: streams are read here, only writing is threaded
+    with ClipWriter(workers=WRITER_THREADS) as writer:
+        for page_num, page in enumerate(doc, start=1):
+            names = []
+            for xref, smask, width, height, *_ in page.get_images(full=True):
+                if xref in saved:
+                    name = saved[xref]
+                    if page_num not in images[name]["pages"]:
+                        images[name]["pages"].append(page_num)
+                    if name not in names:
+                        names.append(name)
+                    continue
+
+                info = doc.extract_image(xref)
+                ext = _passthrough(info)
+                stem = f"page_{page_num}_img_{len(names)}"
+                if ext:
+                    name = f"{stem}.{ext}"
+                    writer.submit_bytes(info["image"], os.path.join(output_dir, name))
+                else:
+                    name = f"{stem}.png"
+                    pix = _to_pixmap(doc, xref, smask)
+                    writer.submit(pix, os.path.join(output_dir, name))
+                    converted += 1
+
+                saved[xref] = name
+                names.append(name)
+                images[name] = {"xref": xref, "width": width, "height": height,
+                                "source_format": info["ext"], "passthrough": ext is not None,
+                                "pages": [page_num]}
+            if names:
+                pages[str(page_num)] = names
+    doc.close()
+
+    # Drop files from an earlier run that no longer correspond to an image
+    if manifest:
+        for name in manifest.get("images", {}):
+            if name not in images and os.path.exists(os.path.join(output_dir, name)):
+                os.remove(os.path.join(output_dir, name))
+
+    manifest = {"pdf": os.path.basename(pdf_path), "pdf_hash": pdf_hash, "pages": pages, "images": images}
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, manifest_path)
+
+    shared = sum(1 for image in images.values() if len(image["pages"]) > 1)
+    print(f"Saved {len(images)} images from {len(pages)} pages to {output_dir} "
+          f"({len(images) - converted} passthrough, {converted} converted, {shared} shared across pages)")
+    return manifest
+
+
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    pdf_path = args[0] if args else PDF_FILE
+    output_dir = args[1] if len(args) > 1 else OUTPUT_DIR
+    if not os.path.exists(pdf_path):
+        print(f"PDF not found: {pdf_path}")
+        sys.exit(1)
+    extract_images(pdf_path, output_dir, force="--force" in sys.argv)
@@ -0,0 +1,186 @@
+"""
+Incremental read/write of the site's story data.
+fazail_data.js holds books and chapters; stories live in per-book shards
+under data_shards/ whose filenames carry a content hash. On each build we
+hash every story, compare with the previous manifest, rewrite only shards
+whose stories changed, and record what changed. Unchanged shards keep
+their URL, so browsers only re-download what actually changed.
+"""
+import glob
+import hashlib
+import json
+import os
+import re
+
+import patterns
+from search_index import write_search_index
+
+DATA_FILE = 'fazail_data.js'
+SHARD_DIR = 'data_shards'
+MANIFEST_FILE = os.path.join(SHARD_DIR, 'manifest.json')
+CHANGES_FILE = os.path.join(SHARD_DIR, 'changes.json')
+HTML_FILE = 'index.html'
+
+DATA_PATTERN = patterns.compile_pattern(r'const fazailData = ({.*});', re.DOTALL)
+SHARD_PATTERN = patterns.compile_pattern(r'fazailData\.stories\.push\(\.\.\.(\[.*\])\);', re.DOTALL)
+SHARDS_BLOCK = patterns.compile_pattern(r'(    <!-- data-shards:start -->\n).*?(    <!-- data-shards:end -->)', re.DOTALL)
+
+# Long story bodies are split into sections of about this many bytes for progressive rendering
+SECTION_BYTES = 16 * 1024
+STORY_PREFIX = b'<div class="story-content"><p>'
+STORY_SUFFIX = b'</p></div>'
+# Break candidates (chunk/paragraph separators, sentence ends) plus the tokens needed to avoid cutting inside markup
+SECTION_TOKENS = patterns.compile_pattern(rb'<br><hr><br>|<br><br>|<span\b|</span>|<|>|[.!?]["\')]? (?=["\'(A-Z0-9<])')
+
+
+def story_hash(story):
+    """Stable content hash of one story record."""
+    canonical = json.dumps(story, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+
+
+def story_sections(content, target=SECTION_BYTES):
+    """[start, end) UTF-8 byte ranges of a long story's body, cut at paragraph or sentence breaks.
+
+    Ranges are contiguous, lie inside the <div class="story-content"><p>
+    wrapper and never split a tag or an inline <span>; None for short or
+    unwrapped content.
+    """
+    data = content.encode('utf-8')
+    if len(data) <= target or not (data.startswith(STORY_PREFIX) and data.endswith(STORY_SUFFIX)):
+        return None
+
+    body_end = len(data) - len(STORY_SUFFIX)
+    sections = []
+    start = len(STORY_PREFIX)
+    in_tag = False
+    depth = 0
+    for match in SECTION_TOKENS.finditer(data, start, body_end):
+        token = match.group()
+        if token == b'<span':
+            depth += 1
+            in_tag = True
+        elif token == b'</span>':
+            depth -= 1
+        elif token == b'<':
+            in_tag = True
+        elif token == b'>':
+            in_tag = False
+        elif not in_tag and depth == 0 and match.end() - start >= target:
+            sections.append([start, match.end()])
+            start = match.end()
+    if start < body_end:
+        sections.append([start, body_end])
+    return sections if len(sections) > 1 else None
+
+
+def load_manifest():
+    if os.path.exists(MANIFEST_FILE):
+        with open(MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {"stories": {}, "shards": {}}
+
+
+def load_fazail_data():
+    """Read fazail_data.js plus every shard listed in the manifest."""
+    with open(DATA_FILE, 'r', encoding='utf-8') as f:
+        content = f.read()
+    match = DATA_PATTERN.search(content)
+    if not match:
+        return None
+    data = json.loads(match.group(1))
+
+    manifest = load_manifest()
+    for book_id in sorted(manifest["shards"], key=int):
+        path = manifest["shards"][book_id]["file"]
+        with open(path, 'r', encoding='utf-8') as f:
+            shard_match = SHARD_PATTERN.search(f.read())
+        if shard_match:
+            data['stories'].extend(json.loads(shard_match.group(1)))
+    return data
+
+
+def _write_shard(book_id, stories, digest):
+    path = f"{SHARD_DIR}/book-{book_id}.{digest}.js"
+    body = json.dumps(stories, indent=4, ensure_ascii=False)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f"// Fazail-e-Amaal Data Shard: book {book_id}\nfazailData.stories.push(...{body});\n")
+    return path
+
+
+def _update_html(shard_files):
+    if not os.path.exists(HTML_FILE):
+        return
+    with open(HTML_FILE, 'r', encoding='utf-8') as f:
+        html = f.read()
+    tags = "".join(f'    <script src="{path}"></script>\n' for path in shard_files)
+    updated = SHARDS_BLOCK.sub(lambda m: m.group(1) + tags + m.group(2), html)
+    if updated != html:
+        with open(HTML_FILE, 'w', encoding='utf-8') as f:
+            f.write(updated)
+
+
+def write_fazail_data(data, comment):
+    """Write books/chapters to fazail_data.js and stories to changed shards only."""
+    os.makedirs(SHARD_DIR, exist_ok=True)
+    previous = load_manifest()
+
+    for story in data['stories']:
+        sections = story_sections(story.get('content') or '')
+        if sections:
+            story['sections'] = sections
+        else:
+            story.pop('sections', None)
+
+    hashes = {str(s['id']): story_hash(s) for s in data['stories']}
+    by_book = {}
+    for story in data['stories']:
+        by_book.setdefault(str(story['bookId']), []).append(story)
+
+    shards = {}
+    rewritten = []
+    for book_id, stories in by_book.items():
+        digest = hashlib.sha256(''.join(hashes[str(s['id'])] for s in stories).encode('utf-8')).hexdigest()[:12]
+        old = previous["shards"].get(book_id)
+        if old and old["hash"] == digest and os.path.exists(old["file"]):
+            shards[book_id] = old
+            continue
+        path = _write_shard(book_id, stories, digest)
+        shards[book_id] = {"file": path, "hash": digest, "story_ids": [s['id'] for s in stories]}
+        rewritten.append(path)
+
+    # Remove shard files that are no longer referenced
+    live = {shard["file"] for shard in shards.values()}
+    for path in glob.glob(f"{SHARD_DIR}/book-*.js"):
+        if path.replace(os.sep, '/') not in live:
+            os.remove(path)
+
+    core = {key: value for key, value in data.items() if key != 'stories'}
+    core['stories'] = []
+    js_content = f"// Fazail-e-Amaal Data\n// {comment}\n\nconst fazailData = {json.dumps(core, indent=4, ensure_ascii=False)};\n"
+    with open(DATA_FILE, 'w', encoding='utf-8') as f:
+        f.write(js_content)
+
+    old_hashes = previous["stories"]
+    changes = {
+        "added": sorted(int(i) for i in hashes if i not in old_hashes),
+        "changed": sorted(int(i) for i in hashes if i in old_hashes and old_hashes[i] != hashes[i]),
+        "removed": sorted(int(i) for i in old_hashes if i not in hashes),
+        "rewritten_shards": rewritten
+    }
+
+    with open(MANIFEST_FILE, 'w', encoding='utf-8') as f:
+        json.dump({"stories": hashes, "shards": shards}, f, indent=2)
+    with open(CHANGES_FILE, 'w', encoding='utf-8') as f:
+        json.dump(changes, f, indent=2)
+
+    _update_html([shards[book_id]["file"] for book_id in sorted(shards, key=int)])
+    write_search_index(data)
+    # index.html and the shard list changed, so the precache manifest must too.
+    # Imported here because build_service_worker -> check_budget imports this module
+    from build_service_worker import build_service_worker
+    build_service_worker()
+
+    print(f"Wrote {DATA_FILE}: {len(rewritten)}/{len(shards)} shards rewritten "
+          f"({len(changes['added'])} added, {len(changes['changed'])} changed, {len(changes['removed'])} removed stories)")
+    return changes
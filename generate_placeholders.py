@@ -1,13 +1,15 @@
 import re
 import json
 
+import patterns
+
 def parse_data_js(file_path):
     with open(file_path, 'r', encoding='utf-8') as f:
         content = f.read()
     
     # Extract the array content
     # Look for const deeds = [...];
-    match = re.search(r'const deeds = \[(.*?)\];', content, re.DOTALL)
+    match = patterns.search(r'const deeds = \[(.*?)\];', content, re.DOTALL)
     if not match:
         print("Could not find deeds array")
         return []
@@ -28,11 +30,11 @@ def parse_data_js(file_path):
             continue
             
         # Extract ID
-        id_match = re.search(r'id:\s*(\d+)', obj)
+        id_match = patterns.search(r'id:\s*(\d+)', obj)
         # Extract Title
-        title_match = re.search(r'title:\s*"(.*?)"', obj)
+        title_match = patterns.search(r'title:\s*"(.*?)"', obj)
         # Extract Description
-        desc_match = re.search(r'description:\s*"(.*?)"', obj, re.DOTALL)
+        desc_match = patterns.search(r'description:\s*"(.*?)"', obj, re.DOTALL)
         
         if id_match and title_match and desc_match:
             deeds.append({
@@ -5,11 +5,15 @@ Processes the extracted content and creates structured data with inline Arabic t
 import json
 import re
 
+import patterns
+from book_structure import load_structure, book_ranges
+from fazail_store import write_fazail_data
+
 # Load the extracted content
 with open("fazail_full_content.json", "r", encoding="utf-8") as f:
     pages = json.load(f)
 
-# Book definitions with correct page ranges based on PDF structure
+# Book display metadata; page ranges come from the shared structure index
 BOOKS = [
     {
         "id": 1,
@@ -17,9 +21,7 @@ BOOKS = [
         "arabic": "حکایاتِ صحابہ",
         "icon": "📚",
         "color": "#1a5f2a",
-        "description": "Inspiring tales from the lives of the Prophet's companions",
-        "start_page": 3,
-        "end_page": 130
+        "description": "Inspiring tales from the lives of the Prophet's companions"
     },
     {
         "id": 2,
@@ -27,9 +29,7 @@ BOOKS = [
         "arabic": "فضائلِ قرآن",
         "icon": "📖",
         "color": "#2d7a3d",
-        "description": "The blessings and rewards of reciting the Holy Qur'an",
-        "start_page": 131,
-        "end_page": 200
+        "description": "The blessings and rewards of reciting the Holy Qur'an"
     },
     {
         "id": 3,
@@ -37,9 +37,7 @@ BOOKS = [
         "arabic": "فضائلِ نماز",
         "icon": "🕌",
         "color": "#3d9450",
-        "description": "The importance and rewards of prayer in Islam",
-        "start_page": 201,
-        "end_page": 280
+        "description": "The importance and rewards of prayer in Islam"
     },
     {
         "id": 4,
@@ -47,9 +45,7 @@ BOOKS = [
         "arabic": "فضائلِ ذکر",
         "icon": "📿",
         "color": "#4dae63",
-        "description": "The spiritual benefits of remembering Allah",
-        "start_page": 281,
-        "end_page": 340
+        "description": "The spiritual benefits of remembering Allah"
     },
     {
         "id": 5,
@@ -57,9 +53,7 @@ BOOKS = [
         "arabic": "فضائلِ تبلیغ",
         "icon": "🌍",
         "color": "#5ec876",
-        "description": "The rewards of spreading the message of Islam",
-        "start_page": 341,
-        "end_page": 400
+        "description": "The rewards of spreading the message of Islam"
     },
     {
         "id": 6,
@@ -67,9 +61,7 @@ BOOKS = [
         "arabic": "فضائلِ رمضان",
         "icon": "🌙",
         "color": "#6fe289",
-        "description": "The blessings of the holy month of fasting",
-        "start_page": 401,
-        "end_page": 430
+        "description": "The blessings of the holy month of fasting"
     },
     {
         "id": 7,
@@ -77,9 +69,7 @@ BOOKS = [
         "arabic": "مسلمانوں کی پستی",
         "icon": "⚠️",
         "color": "#d4a373",
-        "description": "Analysis of the decline of Muslim civilization",
-        "start_page": 431,
-        "end_page": 445
+        "description": "Analysis of the decline of Muslim civilization"
     },
     {
         "id": 8,
@@ -87,12 +77,14 @@ BOOKS = [
         "arabic": "چھ اصول",
         "icon": "🎯",
         "color": "#c9b037",
-        "description": "The six essential principles of Islamic practice",
-        "start_page": 446,
-        "end_page": 452
+        "description": "The six essential principles of Islamic practice"
     }
 ]
 
+BOOK_RANGES = book_ranges(load_structure())
+for book in BOOKS:
+    book.update(BOOK_RANGES.get(book["id"], {}))
+
 # Chapters for Stories of the Sahaabah
 CHAPTERS = [
     {"id": 1, "bookId": 1, "title": "Steadfastness in the Face of Hardships", "arabic": "مشکلات میں ثابت قدمی"},
@@ -112,7 +104,7 @@ CHAPTERS = [
 def format_arabic_in_content(text):
     """Replace <arabic> tags with proper HTML span tags"""
     # Replace the <arabic>...</arabic> tags with proper span
-    text = re.sub(r'<arabic>(.*?)</arabic>', r'<span class="arabic-text" lang="ar">\1</span>', text, flags=re.DOTALL)
+    text = patterns.sub(r'<arabic>(.*?)</arabic>', r'<span class="arabic-text" lang="ar">\1</span>', text, flags=re.DOTALL)
     return text
 
 def extract_story(title, start_page, end_page, pages_content):
@@ -236,7 +228,7 @@ for story in STORIES:
     full_content = format_arabic_in_content(full_content)
     
     # Get preview (first 200 chars)
-    preview = re.sub(r'<[^>]+>', '', full_content)[:200] + "..."
+    preview = patterns.TAG_PATTERN.sub('', full_content)[:200] + "..."
     
     processed_stories.append({
         "id": story["id"],
@@ -247,23 +239,15 @@ for story in STORIES:
         "content": full_content
     })
 
-# Generate the JavaScript file
-js_content = """// Fazail-e-Amaal Data
-// Auto-generated from PDF extraction
-
-const fazailData = {
-    books: """ + json.dumps(BOOKS, indent=8, ensure_ascii=False) + """,
-    
-    chapters: """ + json.dumps(CHAPTERS, indent=8, ensure_ascii=False) + """,
-    
-    stories: """ + json.dumps(processed_stories, indent=8, ensure_ascii=False) + """
-};
-"""
-
-with open("fazail_data.js", "w", encoding="utf-8") as f:
-    f.write(js_content)
+# Generate the JavaScript data file and story shards
+write_fazail_data({
+    "books": BOOKS,
+    "chapters": CHAPTERS,
+    "stories": processed_stories
+}, "Auto-generated from PDF extraction")
 
 print("Generated fazail_data.js with:")
 print(f"  - {len(BOOKS)} books")
 print(f"  - {len(CHAPTERS)} chapters")
 print(f"  - {len(processed_stories)} stories")
+patterns.print_pattern_stats()
@@ -0,0 +1,141 @@
+"""
+Recover real Unicode Arabic text from custom-encoded calligraphy fonts.
+The PDF's Arabic fonts map their glyphs to Latin "garbage" codepoints, but
+the embedded font programs still carry a Unicode cmap and/or glyph names.
+We extract each calligraphy font once, learn glyph id -> Unicode from
+them, and then rebuild the text of a clip region from the glyph ids that
+page.get_texttrace() reports. Regions that can't be fully mapped fall back
+to the rendered image clip.
+"""
+from io import BytesIO
+
+import fitz  # PyMuPDF
+
+import patterns
+from arabic_text import ARABIC_RANGES, normalize_arabic
+
+try:
+    from fontTools.ttLib import TTFont
+except ImportError:
+    TTFont = None
+
+# Minimum fraction of glyphs in a run that must map before we emit text
+MIN_COVERAGE = 0.95
+
+UNI_NAME = patterns.compile_pattern(r'^uni([0-9A-F]{4})+$')
+U_NAME = patterns.compile_pattern(r'^u([0-9A-F]{4,6})$')
+
+
+def _is_arabic(cp):
+    return any(start <= cp <= end for start, end in ARABIC_RANGES)
+
+
+def _name_to_text(name):
+    """Unicode text for a glyph name like uni0627, u0627, alef.fina or afii57415."""
+    base = name.split('.')[0].split('_')
+    chars = []
+    for part in base:
+        if UNI_NAME.match(part):
+            hexes = part[3:]
+            chars.extend(chr(int(hexes[i:i + 4], 16)) for i in range(0, len(hexes), 4))
+        elif U_NAME.match(part):
+            chars.append(chr(int(part[1:], 16)))
+        else:
+            cp = fitz.glyph_name_to_unicode(part)
+            if cp <= 0 or cp == 0xFFFD:
+                return None
+            chars.append(chr(cp))
+    text = ''.join(chars)
+    return text if text and all(_is_arabic(ord(c)) or c.isspace() for c in text) else None
+
+
+def glyph_map_from_font(buffer):
+    """Learn glyph id -> Unicode text from one embedded font program."""
+    glyph_map = {}
+
+    # 1. Reverse the font's own Unicode cmap for Arabic codepoints
+    font = fitz.Font(fontbuffer=buffer)
+    for cp in font.valid_codepoints():
+        if _is_arabic(cp):
+            gid = font.has_glyph(cp)
+            if gid and gid not in glyph_map:
+                glyph_map[gid] = chr(cp)
+
+    # 2. Fill the rest (contextual forms, ligatures) from glyph names
+    if TTFont is not None:
+        try:
+            glyph_order = TTFont(BytesIO(buffer), lazy=True).getGlyphOrder()
+        except Exception:
+            glyph_order = []
+        for gid, name in enumerate(glyph_order):
+            if gid not in glyph_map:
+                text = _name_to_text(name)
+                if text:
+                    glyph_map[gid] = text
+
+    return glyph_map
+
+
+def _base_name(font_name):
+    """Font name without the "ABCDEF+" subset tag."""
+    return font_name.split('+')[-1]
+
+
+def learn_glyph_maps(doc, font_names):
+    """Extract each named font once and return {subset-tagged font name: {gid: text}}.
+
+    Every subset numbers its glyphs independently, so maps are kept per
+    subset rather than merged under the base font name.
+    """
+    glyph_maps = {}
+    seen_xrefs = set()
+    for page in doc:
+        for xref, ext, ftype, basefont, name, encoding in page.get_fonts():
+            if _base_name(basefont) not in font_names or xref in seen_xrefs:
+                continue
+            seen_xrefs.add(xref)
+            _, _, _, buffer = doc.extract_font(xref)
+            if not buffer:
+                continue
+            if basefont in glyph_maps:
+                print(f"  Warning: {basefont} is embedded more than once; keeping its first map")
+                continue
+            glyph_maps[basefont] = glyph_map_from_font(buffer)
+    for font_name, glyph_map in glyph_maps.items():
+        print(f"  Learned {len(glyph_map)} glyphs for {font_name}")
+    return glyph_maps
+
+
+def page_glyphs(page, font_names):
+    """(center_x, center_y, origin_x, font, gid, ucs) for every calligraphy glyph on the page."""
+    # Keep subset tags in span font names so they match the glyph map keys
+    previous = fitz.TOOLS.set_subset_fontnames()
+    fitz.TOOLS.set_subset_fontnames(True)
+    try:
+        trace = page.get_texttrace()
+    finally:
+        fitz.TOOLS.set_subset_fontnames(previous)
+
+    glyphs = []
+    for span in trace:
+        font_name = span["font"]
+        if _base_name(font_name) not in font_names:
+            continue
+        for ucs, gid, origin, bbox in span["chars"]:
+            glyphs.append(((bbox[0] + bbox[2]) / 2, (bbox[1] + bbox[3]) / 2, origin[0], font_name, gid, ucs))
+    return glyphs
+
+
+def remap_region(glyphs, bbox, glyph_maps):
+    """Rebuild the Arabic text inside bbox; returns (text, coverage)."""
+    x0, y0, x1, y1 = bbox
+    inside = [g for g in glyphs if x0 <= g[0] <= x1 and y0 <= g[1] <= y1]
+    if not inside:
+        return "", 0.0
+
+    # Glyphs are placed left to right; Arabic reads right to left
+    inside.sort(key=lambda g: -g[2])
+    mapped = [" " if ucs == 32 else glyph_maps.get(font, {}).get(gid) for _, _, _, font, gid, ucs in inside]
+    coverage = sum(1 for m in mapped if m) / len(mapped)
+    text = normalize_arabic(' '.join(''.join(m for m in mapped if m).split()))
+    return text, coverage
@@ -0,0 +1,250 @@
+"""
+Shared page-layout layer for the extraction scripts.
+Each PDF page is parsed once with get_text("rawdict"); the simplified layout
+is cached on disk and every derived view (plain text, span segments,
+calligraphy clip boxes) is computed from it without touching the PDF again.
+"""
+import hashlib
+import json
+import os
+from collections import defaultdict
+
+import patterns
+from checkpoint import Checkpoint
+
+LAYOUT_CACHE_DIR = "layout_cache"
+LAYOUT_VERSION = 2
+
+# Latin ligatures are kept by TEXTFLAGS_RAWDICT (the Arabic ones must be), so
+# expand them here: extract_complete used to get "fi"/"fl" spelled out by MuPDF
+LATIN_LIGATURES = str.maketrans({
+    "\ufb00": "ff", "\ufb01": "fi", "\ufb02": "fl", "\ufb03": "ffi",
+    "\ufb04": "ffl", "\ufb05": "st", "\ufb06": "st",
+})
+
+# Padding around calligraphy runs so clips don't cut off ascenders/descenders
+CLIP_PADDING_X = 5
+CLIP_PADDING_Y = 15
+
+# Running headers/footers are looked for in this fraction of the page at the top and bottom
+MARGIN_ZONE = 0.12
+# A margin line is "running" when its text (digits ignored) repeats at the same height on this share of pages
+MARGIN_REPEAT_RATIO = 0.1
+MARGIN_MIN_PAGES = 3
+# How far (page-height fraction) a repeat may sit from the line's median position
+MARGIN_POSITION_TOLERANCE = 0.01
+# Slack when testing a line against a band, as a fraction of page height
+MARGIN_TOLERANCE = 0.002
+
+DIGITS = patterns.compile_pattern(r'\d+')
+
+
+def file_hash(path):
+    """SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _simplify_page(page, flags):
+    """Reduce a rawdict page to blocks/lines/spans with joined span text."""
+    raw = page.get_text("rawdict", flags=flags)
+    blocks = []
+    for block in raw["blocks"]:
+        if "lines" not in block:
+            continue
+        lines = []
+        for line in block["lines"]:
+            spans = []
+            for span in line["spans"]:
+                spans.append({
+                    "text": "".join(ch["c"] for ch in span["chars"]).translate(LATIN_LIGATURES),
+                    "font": span.get("font", ""),
+                    "size": span.get("size", 0),
+                    "flags": span.get("flags", 0),
+                    "bbox": list(span["bbox"]),
+                    "origin": list(span["origin"]),
+                })
+            lines.append({"bbox": list(line["bbox"]), "spans": spans})
+        blocks.append({"bbox": list(block["bbox"]), "lines": lines})
+
+    return {
+        "page": page.number + 1,
+        "width": raw["width"],
+        "height": raw["height"],
+        "blocks": blocks,
+    }
+
+
+def extract_layout(pdf_path, pdf_hash=None):
+    """Parse every page of the PDF once, checkpointing completed page ranges."""
+    # Imported here so stages that only read cached layouts run without PyMuPDF
+    import fitz  # PyMuPDF
+
+    # Also clips to the mediabox, so text hidden outside the visible page is dropped
+    flags = fitz.TEXTFLAGS_RAWDICT
+    doc = fitz.open(pdf_path)
+    checkpoint = Checkpoint("layout", pdf_hash or file_hash(pdf_path), {"version": LAYOUT_VERSION})
+    pages = [page for chunk in checkpoint.chunks for page in chunk["pages"]]
+    for page_num in range(checkpoint.next_page, len(doc)):
+        pages.append(_simplify_page(doc[page_num], flags))
+        if (page_num + 1) % 50 == 0:
+            print(f"  Parsed {page_num + 1} pages...")
+        if checkpoint.is_chunk_end(page_num, len(doc)):
+            start = checkpoint.chunk_start(page_num)
+            checkpoint.save(start, page_num + 1, {"pages": pages[start:]})
+    doc.close()
+    return pages, checkpoint
+
+
+def load_layout(pdf_path, cache_dir=LAYOUT_CACHE_DIR):
+    """Return the page layouts for a PDF, parsing it only if no valid cache exists."""
+    pdf_hash = file_hash(pdf_path)
+    cache_path = os.path.join(cache_dir, os.path.splitext(os.path.basename(pdf_path))[0] + ".layout.json")
+
+    if os.path.exists(cache_path):
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("pdf_hash") == pdf_hash and cached.get("version") == LAYOUT_VERSION:
+            return cached["pages"]
+
+    pages, checkpoint = extract_layout(pdf_path, pdf_hash)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": LAYOUT_VERSION, "pdf_hash": pdf_hash, "pages": pages}, f, ensure_ascii=False)
+    os.replace(tmp_path, cache_path)
+    checkpoint.clear()
+
+    return pages
+
+
+def iter_spans(page_layout):
+    """Yield every span on the page in reading order."""
+    for block in page_layout["blocks"]:
+        for line in block["lines"]:
+            yield from line["spans"]
+
+
+def page_text(page_layout):
+    """Plain text of the page, equivalent to page.get_text()."""
+    block_texts = []
+    for block in page_layout["blocks"]:
+        lines = ["".join(span["text"] for span in line["spans"]) for line in block["lines"]]
+        block_texts.append("\n".join(lines) + "\n")
+    return "".join(block_texts)
+
+
+def page_segments(page_layout):
+    """Non-empty spans with font, size and baseline position."""
+    segments = []
+    for span in iter_spans(page_layout):
+        text = span["text"].strip()
+        if text:
+            segments.append({
+                "text": text,
+                "font": span["font"],
+                "size": span["size"],
+                "y_position": span["origin"][1],
+            })
+    return segments
+
+
+def clip_bbox(spans, pad_x=CLIP_PADDING_X, pad_y=CLIP_PADDING_Y):
+    """Padded union bbox of a run of spans, as (x0, y0, x1, y1)."""
+    x0 = min(s["bbox"][0] for s in spans) - pad_x
+    y0 = min(s["bbox"][1] for s in spans) - pad_y
+    x1 = max(s["bbox"][2] for s in spans) + pad_x
+    y1 = max(s["bbox"][3] for s in spans) + pad_y
+    return (x0, y0, x1, y1)
+
+
+def _margin_key(text):
+    """Line text with numbers masked, so "Ch. 3: Zikr 41" repeats across pages."""
+    return " ".join(DIGITS.sub("#", text).lower().split())
+
+
+def _margin_lines(page_layout):
+    """(key, top, bottom) of each non-empty line inside the top/bottom zones, as page-height fractions.
+
+    Page numbers mask to the same key ("#", "- # -", "(#)"), so they are
+    found by the same repeat test as running headers.
+    """
+    height = page_layout["height"] or 1
+    for block in page_layout["blocks"]:
+        for line in block["lines"]:
+            text = "".join(span["text"] for span in line["spans"]).strip()
+            if not text:
+                continue
+            top, bottom = line["bbox"][1] / height, line["bbox"][3] / height
+            if bottom <= MARGIN_ZONE or top >= 1 - MARGIN_ZONE:
+                yield _margin_key(text), top, bottom
+
+
+def _running_extent(occurrences, min_pages, outermost):
+    """Edge of a margin key's repeats at a consistent height, or None if it isn't running.
+
+    occurrences are (page, edge) pairs. Only repeats within
+    MARGIN_POSITION_TOLERANCE of the key's median edge count, and the
+    extent is the outermost (max for headers, min for footers) of those, so
+    a stray line with the same key elsewhere can't stretch it.
+    """
+    edges = sorted(edge for _, edge in occurrences)
+    median = edges[len(edges) // 2]
+    consistent = [(page, edge) for page, edge in occurrences if abs(edge - median) <= MARGIN_POSITION_TOLERANCE]
+    if len({page for page, _ in consistent}) < min_pages:
+        return None
+    return outermost(edge for _, edge in consistent)
+
+
+def detect_margin_bands(layout):
+    """Header and footer bands of a document from margin lines that repeat at the same height.
+
+    Returns {"header": y, "footer": y} as page-height fractions; lines
+    ending above header or starting below footer are running text. Each
+    key only counts at its usual height, so one isolated "(7)" or "13."
+    in a margin zone can't widen the band for every page.
+    """
+    headers = defaultdict(list)
+    footers = defaultdict(list)
+    for page_layout in layout:
+        for key, top, bottom in _margin_lines(page_layout):
+            if bottom <= MARGIN_ZONE:
+                headers[key].append((page_layout["page"], bottom))
+            else:
+                footers[key].append((page_layout["page"], top))
+    min_pages = max(MARGIN_MIN_PAGES, len(layout) * MARGIN_REPEAT_RATIO)
+
+    header, footer = 0.0, 1.0
+    for occurrences in headers.values():
+        extent = _running_extent(occurrences, min_pages, max)
+        if extent is not None:
+            header = max(header, extent)
+    for occurrences in footers.values():
+        extent = _running_extent(occurrences, min_pages, min)
+        if extent is not None:
+            footer = min(footer, extent)
+    return {"header": header, "footer": footer}
+
+
+def strip_margin_bands(layout, bands=None):
+    """Copy of the layout without lines in the header/footer bands (detected once if not given)."""
+    if bands is None:
+        bands = detect_margin_bands(layout)
+    header = bands["header"] + MARGIN_TOLERANCE
+    footer = bands["footer"] - MARGIN_TOLERANCE
+
+    pages = []
+    for page_layout in layout:
+        height = page_layout["height"] or 1
+        blocks = []
+        for block in page_layout["blocks"]:
+            lines = [line for line in block["lines"]
+                     if not (line["bbox"][3] / height <= header or line["bbox"][1] / height >= footer)]
+            if lines:
+                blocks.append(dict(block, lines=lines))
+        pages.append(dict(page_layout, blocks=blocks))
+    return pages
@@ -0,0 +1,65 @@
+"""
+Shared compiled-regex registry.
+Python's re module only keeps a small internal cache, and the extraction
+scripts build many patterns on the fly (one per deed, one per chapter
+title). Every script goes through this registry instead, so each distinct
+pattern is compiled exactly once per run, with hit/compile-time stats.
+"""
+import re
+import time
+
+_cache = {}
+_stats = {"hits": 0, "misses": 0, "compile_time": 0.0}
+
+
+def compile_pattern(pattern, flags=0):
+    """Return the compiled pattern, compiling it only on first use."""
+    key = (pattern, flags)
+    compiled = _cache.get(key)
+    if compiled is not None:
+        _stats["hits"] += 1
+        return compiled
+
+    start = time.perf_counter()
+    compiled = re.compile(pattern, flags)
+    _stats["compile_time"] += time.perf_counter() - start
+    _stats["misses"] += 1
+    _cache[key] = compiled
+    return compiled
+
+
+def search(pattern, string, flags=0):
+    return compile_pattern(pattern, flags).search(string)
+
+
+def match(pattern, string, flags=0):
+    return compile_pattern(pattern, flags).match(string)
+
+
+def findall(pattern, string, flags=0):
+    return compile_pattern(pattern, flags).findall(string)
+
+
+def split(pattern, string, flags=0):
+    return compile_pattern(pattern, flags).split(string)
+
+
+def sub(pattern, repl, string, flags=0):
+    return compile_pattern(pattern, flags).sub(repl, string)
+
+
+# Any HTML tag; shared by the scripts that strip markup before counting or indexing text
+TAG_PATTERN = compile_pattern(r'<[^>]+>')
+
+
+def pattern_stats():
+    """Copy of the registry statistics plus the number of cached patterns."""
+    return dict(_stats, patterns=len(_cache))
+
+
+def print_pattern_stats():
+    stats = pattern_stats()
+    total = stats["hits"] + stats["misses"]
+    hit_rate = stats["hits"] / total * 100 if total else 0
+    print(f"Regex cache: {stats['patterns']} patterns, {stats['hits']} hits ({hit_rate:.1f}%), "
+          f"{stats['compile_time'] * 1000:.1f} ms compiling")
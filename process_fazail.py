@@ -2,7 +2,8 @@
 Process Fazail-e-Amaal text and create structured JSON for the website.
 """
 import json
-import re
+
+import patterns
 
 # Define the main books in Fazail-e-Amaal
 BOOKS = [
@@ -115,7 +116,7 @@ def extract_stories_from_text(text_file):
         if page_content:
             lines = page_content.strip().split('\n')
             if lines:
-                page_num_match = re.match(r'(\d+) ---', lines[0])
+                page_num_match = patterns.match(r'(\d+) ---', lines[0])
                 if page_num_match:
                     page_num = int(page_num_match.group(1))
                     text = '\n'.join(lines[1:])
@@ -134,7 +135,7 @@ def extract_stories_from_text(text_file):
                                 break
                     
                     # Look for story titles (numbered items)
-                    story_patterns = re.findall(r'(\d+)\.\s*(.+?)(?:\n|$)', text)
+                    story_patterns = patterns.findall(r'(\d+)\.\s*(.+?)(?:\n|$)', text)
                     for num, title in story_patterns:
                         if len(title) > 10 and len(title) < 100:
                             story_id += 1
@@ -2,23 +2,20 @@ import json
 import re
 import os
 import math
+import sys
+
+import patterns
+from book_structure import load_structure, book_ranges
+from dedupe_stories import find_duplicates, build_records, merge_duplicate_stories, write_report
+from fazail_store import load_fazail_data, write_fazail_data
 
 # Configuration
 INPUT_FILE = 'fazail_full_content.json'
 DATA_FILE = 'fazail_data.js'
-OUTPUT_FILE = 'fazail_data.js'
-
-# Book definitions with their page ranges (from extract_complete.py)
-BOOKS_META = {
-    1: {"start_page": 3, "end_page": 130},
-    2: {"start_page": 131, "end_page": 180},
-    3: {"start_page": 181, "end_page": 260},
-    4: {"start_page": 261, "end_page": 320},
-    5: {"start_page": 321, "end_page": 370},
-    6: {"start_page": 371, "end_page": 420},
-    7: {"start_page": 421, "end_page": 440},
-    8: {"start_page": 441, "end_page": 452},
-}
+
+# Drop near-duplicate stories (keeping the lowest ID) before saving; off unless
+# --merge-duplicates is passed, so nothing is removed without a report to review
+MERGE_DUPLICATES = False
 
 def load_json_content():
     try:
@@ -30,26 +27,21 @@ def load_json_content():
 
 def load_current_data():
     try:
-        with open(DATA_FILE, 'r', encoding='utf-8') as f:
-            content = f.read()
-            match = re.search(r'const fazailData = ({.*});', content, re.DOTALL)
-            if match:
-                return json.loads(match.group(1))
+        return load_fazail_data()
     except Exception as e:
         print(f"Error loading {DATA_FILE}: {e}")
         return None
-    return None
 
 def clean_text(text):
-    text = re.sub(r'Stories of the Sahaabah', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'Virtues of the Holy Qur\'an', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'Ch\. [IVX0-9]+:.*?\d+', '', text)
-    text = re.sub(r'Part [IVX]+.*', '', text)
-    text = re.sub(r'Page No:', '', text)
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = patterns.sub(r'Stories of the Sahaabah', '', text, flags=re.IGNORECASE)
+    text = patterns.sub(r'Virtues of the Holy Qur\'an', '', text, flags=re.IGNORECASE)
+    text = patterns.sub(r'Ch\. [IVX0-9]+:.*?\d+', '', text)
+    text = patterns.sub(r'Part [IVX]+.*', '', text)
+    text = patterns.sub(r'Page No:', '', text)
+    text = patterns.sub(r'\s+', ' ', text).strip()
     return text
 
-def extract_stories():
+def extract_stories(merge_duplicates=MERGE_DUPLICATES):
     full_content = load_json_content()
     data = load_current_data()
     
@@ -58,6 +50,7 @@ def extract_stories():
         return
 
     pages = {item['page']: item['content'] for item in full_content}
+    books_meta = book_ranges(load_structure())
     
     # Keep existing manual stories (IDs 1-10)
     final_stories = [s for s in data['stories'] if s['id'] <= 10]
@@ -67,11 +60,11 @@ def extract_stories():
 
     for book in data['books']:
         book_id = book['id']
-        if book_id not in BOOKS_META:
+        if book_id not in books_meta:
             continue
             
-        start_page = BOOKS_META[book_id]['start_page']
-        end_page = BOOKS_META[book_id]['end_page']
+        start_page = books_meta[book_id]['start_page']
+        end_page = books_meta[book_id]['end_page']
         
         print(f"Processing Book {book_id}: {book['title']} (Pages {start_page}-{end_page})")
         
@@ -92,12 +85,12 @@ def extract_stories():
         for idx, chapter in enumerate(book_chapters):
             # Title match
             search_title = re.escape(chapter['title'].replace('(', '').replace(')', ''))
-            match = re.search(search_title, book_text, re.IGNORECASE)
+            match = patterns.search(search_title, book_text, re.IGNORECASE)
             
             # Roman Numeral Fallback (Book 1)
             if not match and book_id == 1 and idx < len(romans):
                 pattern = f"CHAPTER {romans[idx]}"
-                match = re.search(pattern, book_text, re.IGNORECASE)
+                match = patterns.search(pattern, book_text, re.IGNORECASE)
 
             if match:
                 chapters_found.append({
@@ -141,7 +134,7 @@ def extract_stories():
             
             # Split patterns: "Hadith ...", "Story ...", "No. ..."
             # Note: ( ) capture group in split keeps the delimiter
-            splits = re.split(r'(?:HADITH|Hadith|Story|STORY|No\.|NO\.)\s*[-:.]?\s*\d+', book_text)
+            splits = patterns.split(r'(?:HADITH|Hadith|Story|STORY|No\.|NO\.)\s*[-:.]?\s*\d+', book_text)
             
             # If split failed to produce enough chunks, try just splitting by paragraphs?
             # Or "Story I", "Story II".
@@ -194,14 +187,21 @@ def extract_stories():
                     })
                     next_id += 1
 
+    # Deduplicate
+    records = build_records({"stories": final_stories}, [])
+    pairs, clusters = find_duplicates(records)
+    print(f"Found {len(pairs)} near-duplicate story pairs")
+    write_report(records, pairs, clusters)
+    if merge_duplicates and clusters:
+        final_stories, dropped = merge_duplicate_stories(final_stories, records, clusters)
+        print(f"  Removed duplicate stories: {sorted(dropped)}")
+
     # Save
     data['stories'] = final_stories
-    js_content = f"// Fazail-e-Amaal Data\n// Populated with extracted content\n\nconst fazailData = {json.dumps(data, indent=4, ensure_ascii=False)};\n"
-    
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        f.write(js_content)
+    write_fazail_data(data, "Populated with extracted content")
     
     print(f"Total stories saved: {len(final_stories)}")
+    patterns.print_pattern_stats()
 
 if __name__ == "__main__":
-    extract_stories()
+    extract_stories(merge_duplicates="--merge-duplicates" in sys.argv)
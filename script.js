@@ -16,6 +16,12 @@ document.addEventListener('DOMContentLoaded', () => {
     // State
     let selectedBookId = null;
 
+    // Search runs in a worker once its index has loaded; the in-page filter is the fallback
+    const storyIndexById = new Map(fazailData.stories.map((story, i) => [story.id, i]));
+    let searchWorker = null;
+    let searchReady = false;
+    let latestQueryId = 0;
+
     // Initialize the page
     init();
 
@@ -25,6 +31,37 @@ document.addEventListener('DOMContentLoaded', () => {
         populateChapterFilter();
         setupEventListeners();
         updateStats();
+        registerServiceWorker();
+        setupSearchWorker();
+    }
+
+    // Ranked, Arabic-aware search off the main thread (search_worker.js + search_index.json)
+    function setupSearchWorker() {
+        if (!('Worker' in window) || location.protocol === 'file:') return;
+        searchWorker = new Worker('search_worker.js');
+        searchWorker.addEventListener('message', (e) => {
+            const message = e.data;
+            if (message.type === 'ready') {
+                searchReady = true;
+            } else if (message.type === 'error') {
+                console.warn('Search index unavailable, using in-page filter:', message.message);
+                searchWorker.terminate();
+                searchWorker = null;
+            } else if (message.type === 'results') {
+                const indices = message.ids.map(id => storyIndexById.get(id)).filter(i => i !== undefined);
+                cachePut(message.cacheKey, indices);
+                // Results for anything but the latest query are stale and not rendered
+                if (message.id === latestQueryId) renderIndices(indices);
+            }
+        });
+    }
+
+    // Offline cache for the app shell, data files and clip images
+    function registerServiceWorker() {
+        if (!('serviceWorker' in navigator) || location.protocol === 'file:') return;
+        navigator.serviceWorker.register('sw.js').catch(err => {
+            console.warn('Service worker registration failed:', err);
+        });
     }
 
     // Update statistics
@@ -41,7 +78,7 @@ document.addEventListener('DOMContentLoaded', () => {
     // Event Listeners
     function setupEventListeners() {
         // Search and filter
-        searchInput.addEventListener('input', handleFilter);
+        searchInput.addEventListener('input', scheduleFilter);
         chapterFilter.addEventListener('change', handleFilter);
 
         // Modal
@@ -309,22 +346,144 @@ document.addEventListener('DOMContentLoaded', () => {
         });
     }
 
+    // Filter pipeline: debounced input, facet bitsets, narrowing and an LRU of recent results
+    const SEARCH_DEBOUNCE_MS = 150;
+    const QUERY_CACHE_SIZE = 50;
+    const queryCache = new Map(); // key -> array of story indices (Map keeps insertion order)
+    let searchTexts = null; // lowercased title/preview/content per story, built on first search
+    let facetBitsets = null;
+    const facetCache = new Map(); // facetKey -> story indices allowed by that book/chapter pair
+    let lastFilter = null;
+    let debounceTimer = null;
+
+    function scheduleFilter() {
+        clearTimeout(debounceTimer);
+        debounceTimer = setTimeout(handleFilter, SEARCH_DEBOUNCE_MS);
+    }
+
+    function newBitset() {
+        return new Uint32Array((fazailData.stories.length + 31) >>> 5);
+    }
+
+    // One bitset per book and per chapter, computed once
+    function buildFacetBitsets() {
+        const byBook = new Map();
+        const byChapter = new Map();
+        fazailData.stories.forEach((story, i) => {
+            if (!byBook.has(story.bookId)) byBook.set(story.bookId, newBitset());
+            if (!byChapter.has(story.chapter)) byChapter.set(story.chapter, newBitset());
+            byBook.get(story.bookId)[i >>> 5] |= 1 << (i & 31);
+            byChapter.get(story.chapter)[i >>> 5] |= 1 << (i & 31);
+        });
+        return { byBook, byChapter };
+    }
+
+    // Story indices allowed by the book and chapter selections: the facet bitsets
+    // are ANDed a word at a time and the result is cached per combination
+    function facetIndices(bookId, chapter) {
+        const key = `${bookId}|${chapter}`;
+        const cached = facetCache.get(key);
+        if (cached) return cached;
+
+        if (!facetBitsets) facetBitsets = buildFacetBitsets();
+        const combined = newBitset();
+        if (bookId === null && chapter === 'all') {
+            combined.fill(0xFFFFFFFF);
+        } else {
+            const sets = [];
+            if (bookId !== null) sets.push(facetBitsets.byBook.get(bookId) || newBitset());
+            if (chapter !== 'all') sets.push(facetBitsets.byChapter.get(chapter) || newBitset());
+            combined.set(sets[0]);
+            for (let s = 1; s < sets.length; s++) {
+                for (let w = 0; w < combined.length; w++) combined[w] &= sets[s][w];
+            }
+        }
+
+        const indices = [];
+        const count = fazailData.stories.length;
+        for (let w = 0; w < combined.length; w++) {
+            let word = combined[w];
+            while (word !== 0) {
+                const bit = 31 - Math.clz32(word & -word);
+                const i = (w << 5) + bit;
+                if (i >= count) break;
+                indices.push(i);
+                word &= word - 1;
+            }
+        }
+        facetCache.set(key, indices);
+        return indices;
+    }
+
+    function cacheGet(key) {
+        const hit = queryCache.get(key);
+        if (hit) {
+            queryCache.delete(key);
+            queryCache.set(key, hit);
+        }
+        return hit;
+    }
+
+    function cachePut(key, indices) {
+        queryCache.delete(key);
+        queryCache.set(key, indices);
+        if (queryCache.size > QUERY_CACHE_SIZE) {
+            queryCache.delete(queryCache.keys().next().value);
+        }
+    }
+
+    function renderIndices(indices) {
+        renderStories(indices.map(i => fazailData.stories[i]));
+    }
+
     // Handle Filter
     function handleFilter() {
+        clearTimeout(debounceTimer);
         const searchTerm = searchInput.value.toLowerCase();
         const selectedChapter = chapterFilter.value;
+        const facetKey = `${selectedBookId}|${selectedChapter}`;
+        const cacheKey = `${searchReady ? 'ranked' : 'filter'}|${facetKey}|${searchTerm}`;
+        latestQueryId++;
 
-        const filteredStories = fazailData.stories.filter(story => {
-            const matchesSearch = story.title.toLowerCase().includes(searchTerm) ||
-                stripHtml(story.preview).toLowerCase().includes(searchTerm) ||
-                stripHtml(story.content).toLowerCase().includes(searchTerm);
-            const matchesChapter = selectedChapter === 'all' || story.chapter === selectedChapter;
-            const matchesBook = selectedBookId === null || story.bookId === selectedBookId;
+        const cached = cacheGet(cacheKey);
+        if (cached) {
+            renderIndices(cached);
+            return;
+        }
 
-            return matchesSearch && matchesChapter && matchesBook;
-        });
+        if (searchWorker && searchReady && searchTerm.trim()) {
+            searchWorker.postMessage({
+                type: 'query',
+                id: latestQueryId,
+                cacheKey,
+                query: searchTerm,
+                bookId: selectedBookId,
+                chapter: selectedChapter
+            });
+            return;
+        }
+
+        if (!searchTexts) {
+            searchTexts = fazailData.stories.map(story => [
+                story.title, stripHtml(story.preview), stripHtml(story.content)
+            ].join('\u0000').toLowerCase());
+        }
+
+        // A query that extends the previous one can only match a subset of its results
+        let candidates;
+        if (lastFilter && lastFilter.facetKey === facetKey && searchTerm.includes(lastFilter.searchTerm)) {
+            candidates = lastFilter.indices;
+        } else {
+            candidates = facetIndices(selectedBookId, selectedChapter);
+        }
 
-        renderStories(filteredStories);
+        const indices = searchTerm
+            ? candidates.filter(i => searchTexts[i].includes(searchTerm))
+            : candidates;
+
+        lastFilter = { facetKey, searchTerm, indices };
+        cachePut(cacheKey, indices);
+        renderIndices(indices);
     }
 
     // Open Story Modal
@@ -333,6 +492,7 @@ document.addEventListener('DOMContentLoaded', () => {
         const book = fazailData.books.find(b => b.id === story.bookId);
         const bookTitle = book ? book.title : '';
 
+        stopSectionRendering();
         modalBody.innerHTML = `
             <div class="modal-header">
                 <span class="modal-book-title">${bookTitle}</span>
@@ -340,13 +500,62 @@ document.addEventListener('DOMContentLoaded', () => {
                 <h2 class="modal-title">${story.title}</h2>
             </div>
             <div class="modal-content-body">
-                ${formatContent(story.content)}
+                ${story.sections ? '' : formatContent(story.content)}
             </div>
         `;
 
+        if (story.sections) {
+            renderSections(story, modalBody.querySelector('.modal-content-body'));
+        }
+
         toggleModal(true);
     }
 
+    // Long stories: render their byte-range sections a few at a time as the reader scrolls
+    const SECTIONS_PER_STEP = 2;
+    let sectionObserver = null;
+
+    function renderSections(story, body) {
+        const bytes = new TextEncoder().encode(story.content);
+        const decoder = new TextDecoder();
+        const container = document.createElement('div');
+        container.className = 'story-content';
+        const paragraph = document.createElement('p');
+        container.appendChild(paragraph);
+        const sentinel = document.createElement('div');
+        body.append(container, sentinel);
+
+        let next = 0;
+        const renderStep = () => {
+            const end = Math.min(next + SECTIONS_PER_STEP, story.sections.length);
+            for (; next < end; next++) {
+                const [start, stop] = story.sections[next];
+                paragraph.insertAdjacentHTML('beforeend', decoder.decode(bytes.subarray(start, stop)));
+            }
+            if (next >= story.sections.length) stopSectionRendering();
+        };
+
+        sectionObserver = new IntersectionObserver((entries) => {
+            if (!entries.some(entry => entry.isIntersecting)) return;
+            renderStep();
+            // Re-observe so a sentinel that is still visible triggers the next step
+            if (sectionObserver) {
+                sectionObserver.unobserve(sentinel);
+                sectionObserver.observe(sentinel);
+            }
+        }, { rootMargin: '0px 0px 800px 0px' });
+
+        renderStep();
+        if (sectionObserver) sectionObserver.observe(sentinel);
+    }
+
+    function stopSectionRendering() {
+        if (sectionObserver) {
+            sectionObserver.disconnect();
+            sectionObserver = null;
+        }
+    }
+
     // Format Content - handles Arabic text and paragraphs
     function formatContent(text) {
         if (!text) return '';
@@ -382,6 +591,7 @@ document.addEventListener('DOMContentLoaded', () => {
         } else {
             modal.classList.remove('active');
             document.body.style.overflow = '';
+            stopSectionRendering();
         }
     }
 
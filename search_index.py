@@ -0,0 +1,69 @@
+"""
+Prebuilt search index for the site's search worker (search_worker.js).
+Stories are tokenized with the same Arabic-aware normalization used by the
+extraction scripts and written as a sorted term list with weighted
+postings, so the worker only has to binary-search prefixes and sum scores.
+The character folding table is emitted alongside, so queries typed in the
+browser are normalized exactly like the indexed text.
+"""
+import json
+from collections import Counter
+
+import patterns
+from arabic_text import ARABIC_RANGES, DIACRITIC_TABLE, PRESENTATION_TABLE, PUNCTUATION_TABLE, VARIANT_TABLE, tokenize
+
+INDEX_FILE = "search_index.json"
+INDEX_VERSION = 1
+
+# Term weight per field; title hits rank above body hits
+FIELD_WEIGHTS = {"title": 5, "preview": 1, "content": 1}
+
+
+def fold_table():
+    """Single char -> replacement map equivalent to search_key's translate passes."""
+    table = {}
+    for start, end in ARABIC_RANGES:
+        for cp in range(start, end + 1):
+            char = chr(cp)
+            folded = (char.translate(PRESENTATION_TABLE).translate(DIACRITIC_TABLE)
+                      .translate(VARIANT_TABLE).translate(PUNCTUATION_TABLE))
+            if folded != char:
+                table[char] = folded
+    return table
+
+
+def build_search_index(stories):
+    """Sorted terms with flat [doc, weight, doc, weight, ...] postings."""
+    postings = {}
+    docs = []
+    for doc, story in enumerate(stories):
+        docs.append([story["id"], story.get("bookId"), story.get("chapter")])
+        weights = Counter()
+        for field, weight in FIELD_WEIGHTS.items():
+            for term in tokenize(patterns.TAG_PATTERN.sub(" ", story.get(field) or "")):
+                weights[term] += weight
+        for term, weight in weights.items():
+            postings.setdefault(term, []).extend((doc, weight))
+
+    terms = sorted(postings)
+    return {
+        "version": INDEX_VERSION,
+        "fold": fold_table(),
+        "docs": docs,
+        "terms": terms,
+        "postings": [postings[term] for term in terms]
+    }
+
+
+def write_search_index(data, index_file=INDEX_FILE):
+    index = build_search_index(data["stories"])
+    with open(index_file, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, separators=(",", ":"))
+    print(f"Wrote {index_file}: {len(index['terms'])} terms over {len(index['docs'])} stories")
+    return index
+
+
+if __name__ == "__main__":
+    from fazail_store import load_fazail_data
+
+    write_search_index(load_fazail_data())
@@ -0,0 +1,111 @@
+// Fazail-e-Amaal Search Worker
+// Loads search_index.json (built by search_index.py) and answers ranked
+// prefix queries off the main thread. Only the newest pending query is run;
+// anything older is dropped as stale.
+
+// Same ranges as arabic_text.ARABIC_RANGES (no U+FDD0-FDEF noncharacters, no U+FEFF)
+const ARABIC_CHAR = /[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDCF\uFDF0-\uFDFF\uFE70-\uFEFC]/g;
+const TOKEN = /[؀-ۿݐ-ݿࢠ-ࣿ]+|[a-z0-9]+/g;
+
+// Exact term matches score higher than prefix-only matches
+const EXACT_BOOST = 1.5;
+
+let index = null;
+let pending = null;
+let scheduled = false;
+
+const ready = fetch('search_index.json')
+    .then(response => {
+        if (!response.ok) throw new Error(`HTTP ${response.status}`);
+        return response.json();
+    })
+    .then(data => {
+        index = data;
+        postMessage({ type: 'ready', docs: index.docs.length });
+    })
+    .catch(err => postMessage({ type: 'error', message: String(err) }));
+
+// Same folding as arabic_text.search_key on the Python side
+function tokenize(text) {
+    const folded = text.replace(ARABIC_CHAR, c => index.fold[c] ?? c).toLowerCase();
+    return folded.match(TOKEN) || [];
+}
+
+// First index in the sorted term list that is >= prefix
+function lowerBound(prefix) {
+    let lo = 0;
+    let hi = index.terms.length;
+    while (lo < hi) {
+        const mid = (lo + hi) >> 1;
+        if (index.terms[mid] < prefix) lo = mid + 1;
+        else hi = mid;
+    }
+    return lo;
+}
+
+// Map of doc -> score for every term starting with token
+function scoreToken(token) {
+    const scores = new Map();
+    const docCount = index.docs.length;
+    for (let t = lowerBound(token); t < index.terms.length && index.terms[t].startsWith(token); t++) {
+        const postings = index.postings[t];
+        const df = postings.length / 2;
+        const idf = Math.log(1 + docCount / df);
+        const boost = index.terms[t] === token ? EXACT_BOOST : 1;
+        for (let i = 0; i < postings.length; i += 2) {
+            const doc = postings[i];
+            scores.set(doc, (scores.get(doc) || 0) + postings[i + 1] * idf * boost);
+        }
+    }
+    return scores;
+}
+
+function matchesFacets(doc, bookId, chapter) {
+    const [, docBook, docChapter] = index.docs[doc];
+    return (bookId === null || docBook === bookId) && (chapter === 'all' || docChapter === chapter);
+}
+
+function search({ query, bookId, chapter }) {
+    const tokens = tokenize(query);
+    if (tokens.length === 0) {
+        return index.docs.filter((_, doc) => matchesFacets(doc, bookId, chapter)).map(d => d[0]);
+    }
+
+    // Every query token must match (as a prefix); scores add up across tokens
+    let totals = null;
+    for (const token of tokens) {
+        const scores = scoreToken(token);
+        if (totals === null) {
+            totals = scores;
+        } else {
+            for (const doc of totals.keys()) {
+                if (scores.has(doc)) totals.set(doc, totals.get(doc) + scores.get(doc));
+                else totals.delete(doc);
+            }
+        }
+        if (totals.size === 0) return [];
+    }
+
+    return [...totals.entries()]
+        .filter(([doc]) => matchesFacets(doc, bookId, chapter))
+        .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+        .map(([doc]) => index.docs[doc][0]);
+}
+
+function runPending() {
+    scheduled = false;
+    const request = pending;
+    pending = null;
+    if (!request || !index) return;
+    postMessage({ type: 'results', id: request.id, cacheKey: request.cacheKey, ids: search(request) });
+}
+
+self.onmessage = event => {
+    if (event.data.type !== 'query') return;
+    // A newer query replaces any that has not started yet
+    pending = event.data;
+    if (!scheduled) {
+        scheduled = true;
+        ready.then(() => setTimeout(runPending, 0));
+    }
+};
@@ -0,0 +1,105 @@
+// Fazail-e-Amaal Service Worker
+// Auto-generated by build_service_worker.py - do not edit
+
+const CACHE_VERSION = '15b4d2b1a1af';
+const SHELL_CACHE = 'shell';
+const DATA_CACHE = 'data';
+const IMAGE_CACHE = 'images';
+const FONT_CACHE = 'fonts';
+
+const PRECACHE = [{"url": "index.html", "kind": "shell", "hash": "8f5c15147b9cc0f3"}, {"url": "styles.css", "kind": "shell", "hash": "f9e8259ae1e2ebde"}, {"url": "script.js", "kind": "shell", "hash": "b6af527b4572f515"}, {"url": "search_worker.js", "kind": "shell", "hash": "158410d2235682cb"}, {"url": "fazail_data.js", "kind": "data", "hash": "a88a13491dac2544"}, {"url": "data.js", "kind": "data", "hash": "cb104887c05714b4"}, {"url": "search_index.json", "kind": "data", "hash": "1f7648f10ee06797"}, {"url": "data_shards/book-1.34133ea60489.js", "kind": "data", "hash": "69c475e461a8ae31"}, {"url": "data_shards/book-2.cfd22e4215d4.js", "kind": "data", "hash": "45e58851fe23b730"}, {"url": "data_shards/book-3.b1c6bf6e00be.js", "kind": "data", "hash": "bb49ee3dd2950d83"}, {"url": "data_shards/book-4.3f2d43985764.js", "kind": "data", "hash": "0e66eb9626c0acf4"}, {"url": "data_shards/book-5.be3439ca16c2.js", "kind": "data", "hash": "344c1dfb9a02f719"}, {"url": "data_shards/book-6.f0bc39d01f99.js", "kind": "data", "hash": "94653c1f5cb55cd4"}, {"url": "data_shards/book-7.f71c69d9a278.js", "kind": "data", "hash": "0ddbd447d969b575"}, {"url": "data_shards/book-8.956b9d927b50.js", "kind": "data", "hash": "2710577e715e1916"}];
+
+const DATA_URLS = new Set(PRECACHE.filter(e => e.kind === 'data').map(e => e.url));
+const PRECACHE_URLS = new Set(PRECACHE.map(e => new URL(e.url, self.location).href));
+const SCOPE_PATH = new URL(self.registration.scope).pathname;
+
+// Each precached file is stored only once, in the cache for its kind
+function cacheFor(entry) {
+    return entry.kind === 'image' ? IMAGE_CACHE : entry.kind === 'data' ? DATA_CACHE : SHELL_CACHE;
+}
+
+self.addEventListener('install', event => {
+    event.waitUntil((async () => {
+        await Promise.all(PRECACHE.map(async entry => {
+            const cache = await caches.open(cacheFor(entry));
+            const cached = await cache.match(entry.url);
+            if (cached && cached.headers.get('x-content-hash') === entry.hash) return;
+            const response = await fetch(entry.url, { cache: 'no-cache' });
+            if (response.ok) await cache.put(entry.url, await tagResponse(response, entry.hash));
+        }));
+        self.skipWaiting();
+    })());
+});
+
+self.addEventListener('activate', event => {
+    event.waitUntil((async () => {
+        const keep = new Set([SHELL_CACHE, DATA_CACHE, IMAGE_CACHE, FONT_CACHE]);
+        const names = await caches.keys();
+        await Promise.all(names.filter(name => !keep.has(name)).map(name => caches.delete(name)));
+
+        // Drop URLs the new manifest no longer lists (old content-hashed shards, removed clips)
+        await Promise.all([SHELL_CACHE, DATA_CACHE, IMAGE_CACHE].map(async name => {
+            const cache = await caches.open(name);
+            const requests = await cache.keys();
+            await Promise.all(requests.filter(request => {
+                const url = new URL(request.url);
+                url.search = '';
+                return !PRECACHE_URLS.has(url.href);
+            }).map(request => cache.delete(request)));
+        }));
+        await self.clients.claim();
+    })());
+});
+
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    if (request.method !== 'GET') return;
+    const url = new URL(request.url);
+
+    if (url.origin === 'https://fonts.googleapis.com' || url.origin === 'https://fonts.gstatic.com') {
+        event.respondWith(staleWhileRevalidate(request, FONT_CACHE));
+        return;
+    }
+    if (url.origin !== self.location.origin) return;
+
+    const path = url.pathname.startsWith(SCOPE_PATH) ? url.pathname.slice(SCOPE_PATH.length) : url.pathname;
+    if (DATA_URLS.has(path) || path.startsWith('data_shards/')) {
+        event.respondWith(staleWhileRevalidate(request, DATA_CACHE));
+    } else if (request.mode === 'navigate') {
+        // Pages name the current content-hashed shards, so prefer the network copy
+        event.respondWith(networkFirst(request, path === '' ? 'index.html' : undefined));
+    } else {
+        event.respondWith(cacheFirst(request));
+    }
+});
+
+async function tagResponse(response, hash) {
+    const headers = new Headers(response.headers);
+    headers.set('x-content-hash', hash);
+    return new Response(await response.blob(), { status: response.status, statusText: response.statusText, headers });
+}
+
+async function cacheFirst(request, cachedUrl) {
+    const cached = await caches.match(cachedUrl || request, { ignoreSearch: true });
+    if (cached) return cached;
+    return fetch(request);
+}
+
+async function networkFirst(request, cachedUrl) {
+    try {
+        return await fetch(request);
+    } catch (e) {
+        // Offline: serve the precached page
+        return cacheFirst(request, cachedUrl);
+    }
+}
+
+async function staleWhileRevalidate(request, cacheName) {
+    const cache = await caches.open(cacheName);
+    const cached = await cache.match(request, { ignoreSearch: true });
+    const network = fetch(request).then(response => {
+        if (response.ok) cache.put(request, response.clone());
+        return response;
+    }).catch(() => cached);
+    return cached || network;
+}
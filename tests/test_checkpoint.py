@@ -0,0 +1,56 @@
+import os
+
+from checkpoint import Checkpoint
+
+PDF_HASH = "ab" * 32
+
+
+def run_pages(checkpoint, page_count, stop=None):
+    """Simulate a stage: one payload per page, saved at every chunk end."""
+    pages = [page for chunk in checkpoint.chunks for page in chunk["pages"]]
+    for page_num in range(checkpoint.next_page, page_count if stop is None else stop):
+        pages.append(f"page {page_num + 1}")
+        if checkpoint.is_chunk_end(page_num, page_count):
+            start = checkpoint.chunk_start(page_num)
+            checkpoint.save(start, page_num + 1, {"pages": pages[start:]})
+    return pages
+
+
+def test_resumes_after_last_saved_chunk(tmp_path):
+    first = Checkpoint("layout", PDF_HASH, {"version": 1}, chunk_pages=4, root=tmp_path)
+    run_pages(first, 10, stop=9)  # interrupted inside the third chunk
+
+    resumed = Checkpoint("layout", PDF_HASH, {"version": 1}, chunk_pages=4, root=tmp_path)
+    assert resumed.next_page == 8
+    assert run_pages(resumed, 10) == [f"page {n}" for n in range(1, 11)]
+
+
+def test_corrupt_chunk_resumes_before_it(tmp_path):
+    first = Checkpoint("layout", PDF_HASH, chunk_pages=4, root=tmp_path)
+    run_pages(first, 12)
+    with open(os.path.join(first.directory, "pages-00005-00008.json"), "a", encoding="utf-8") as f:
+        f.write(" ")
+
+    resumed = Checkpoint("layout", PDF_HASH, chunk_pages=4, root=tmp_path)
+    assert resumed.next_page == 4
+    assert [chunk["pages"] for chunk in resumed.chunks] == [["page 1", "page 2", "page 3", "page 4"]]
+    assert run_pages(resumed, 12) == [f"page {n}" for n in range(1, 13)]
+
+
+def test_missing_output_file_invalidates_chunk(tmp_path):
+    output = tmp_path / "clip.png"
+    output.write_bytes(b"png")
+    first = Checkpoint("clips", PDF_HASH, chunk_pages=4, root=tmp_path)
+    first.save(0, 4, {"files": [str(output)]})
+    output.unlink()
+
+    assert Checkpoint("clips", PDF_HASH, chunk_pages=4, root=tmp_path).next_page == 0
+
+
+def test_changed_settings_start_from_scratch(tmp_path):
+    run_pages(Checkpoint("layout", PDF_HASH, {"version": 1}, chunk_pages=4, root=tmp_path), 8)
+
+    changed = Checkpoint("layout", PDF_HASH, {"version": 2}, chunk_pages=4, root=tmp_path)
+    assert changed.next_page == 0
+    assert changed.chunks == []
+    assert not os.path.exists(changed.directory)
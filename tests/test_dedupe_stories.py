@@ -0,0 +1,26 @@
+from dedupe_stories import find_duplicates, jaccard
+
+
+def record(idx, text):
+    return {"kind": "story", "id": idx, "title": f"Story {idx}", "text": text}
+
+
+def test_empty_records_are_not_duplicates():
+    records = [record(1, ""), record(2, '<img src="a.png">'), record(3, "   ")]
+    pairs, clusters = find_duplicates(records)
+    assert pairs == []
+    assert clusters == []
+
+
+def test_empty_records_do_not_join_real_clusters():
+    text = "the companions would give away their food to the guest and sleep hungry that night"
+    records = [record(1, text), record(2, ""), record(3, text), record(4, "")]
+    pairs, clusters = find_duplicates(records)
+    assert [(i, j) for i, j, _ in pairs] == [(0, 2)]
+    assert clusters == [[0, 2]]
+
+
+def test_jaccard_of_empty_sets_is_zero():
+    assert jaccard(set(), set()) == 0.0
+    assert jaccard(set(), {1}) == 0.0
+    assert jaccard({1, 2}, {2, 3}) == 1 / 3
@@ -0,0 +1,29 @@
+import pytest
+
+pytest.importorskip("fitz")  # extract_deeds imports PyMuPDF at module level
+
+from extract_deeds import assemble_deed
+
+TEXT = "12. Smile at your brother\nIt is   charity.\n  14  \nSo smile\tagain.\n\n15. Next deed"
+
+
+def test_drops_header_line_and_page_numbers():
+    end = TEXT.index("15.")
+    assert assemble_deed(TEXT, 0, end, ("12",)) == "It is charity. So smile again."
+
+
+def test_keeps_first_line_without_header_ids():
+    end = TEXT.index("15.")
+    assert assemble_deed(TEXT, 0, end, ()) == "12. Smile at your brother It is charity. So smile again."
+
+
+def test_page_number_first_line_is_dropped():
+    text = "\n  7 \nCarry on\nreading"
+    assert assemble_deed(text, 0, len(text), ()) == "Carry on reading"
+
+
+def test_slice_matches_assembling_the_substring():
+    start, end = TEXT.index("15."), len(TEXT)
+    assert assemble_deed(TEXT, start, end, ("15",)) == assemble_deed(TEXT[start:end], 0, end - start, ("15",)) == ""
+    start = TEXT.index("It is")
+    assert assemble_deed(TEXT, start, TEXT.index("15."), ()) == "It is charity. So smile again."
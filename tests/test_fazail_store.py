@@ -0,0 +1,42 @@
+from fazail_store import STORY_PREFIX, STORY_SUFFIX, story_sections
+
+# Spans and tags full of sentence ends, so most break candidates sit where a cut is not allowed
+ARABIC = '<span class="arabic-text" lang="ar" dir="rtl">' + "قال رسول الله. Sallallahu alayhi wasallam! " * 12 + '</span>'
+CLIP = '<img src="arabic_clips/page_3.png" class="arabic-text" alt="' + "Arabic Text. Clip. " * 40 + '" />'
+
+
+def story(paragraphs):
+    return (STORY_PREFIX + "<br><br>".join(paragraphs).encode("utf-8") + STORY_SUFFIX).decode("utf-8")
+
+
+def long_story():
+    paragraphs = []
+    for n in range(60):
+        paragraphs.append(f"Story part {n}: {CLIP} {ARABIC} and then. Ibn ʿAbbās narrated it. Done.")
+    return story(paragraphs)
+
+
+def test_sections_are_contiguous_and_cover_the_body():
+    content = long_story()
+    data = content.encode("utf-8")
+    sections = story_sections(content, target=512)
+
+    assert len(sections) > 1
+    assert sections[0][0] == len(STORY_PREFIX)
+    assert sections[-1][1] == len(data) - len(STORY_SUFFIX)
+    assert all(prev[1] == cur[0] for prev, cur in zip(sections, sections[1:]))
+    assert b"".join(data[start:end] for start, end in sections) == data[len(STORY_PREFIX):-len(STORY_SUFFIX)]
+
+
+def test_cuts_fall_on_utf8_boundaries_outside_tags_and_spans():
+    data = long_story().encode("utf-8")
+    for start, end in story_sections(data.decode("utf-8"), target=512):
+        head = data[:end].decode("utf-8")  # raises if the cut splits a multi-byte character
+        assert head.rfind("<") < head.rfind(">")
+        assert head.count("<span") == head.count("</span>")
+        data[start:end].decode("utf-8")
+
+
+def test_short_or_unwrapped_content_is_not_split():
+    assert story_sections(story(["One short paragraph."]), target=512) is None
+    assert story_sections("Plain text. " * 200, target=512) is None
@@ -0,0 +1,59 @@
+from page_layout import detect_margin_bands, strip_margin_bands
+
+PAGE_HEIGHT = 1000.0
+# Body lines differ from page to page even with digits masked, as real text does
+WORDS = ["patience", "charity", "prayer", "fasting", "kindness", "honesty", "modesty", "gratitude", "mercy", "humility",
+         "forgiveness", "trust", "generosity", "justice", "courage", "sincerity", "hope", "repentance", "service", "peace"]
+
+
+def line(text, top, bottom):
+    return {"bbox": [50, top * PAGE_HEIGHT, 500, bottom * PAGE_HEIGHT],
+            "spans": [{"text": text, "font": "Body", "size": 11, "bbox": [50, top * PAGE_HEIGHT, 500, bottom * PAGE_HEIGHT]}]}
+
+
+def page(number, extra=()):
+    lines = [
+        line("Easy Good Deeds", 0.03, 0.05),
+        line(f"Body text about {WORDS[number - 1]}", 0.085, 0.10),
+        line(f"More about {WORDS[number - 1]} in the middle", 0.5, 0.52),
+        line(f"Closing words on {WORDS[number - 1]}", 0.86, 0.875),
+        line(str(number), 0.95, 0.97),
+    ]
+    lines.extend(extra)
+    lines.sort(key=lambda l: l["bbox"][1])
+    return {"page": number, "width": 600, "height": PAGE_HEIGHT, "blocks": [{"bbox": [0, 0, 600, 1000], "lines": lines}]}
+
+
+def layout_with(strays):
+    return [page(n, strays.get(n, ())) for n in range(1, 21)]
+
+
+def texts(page_layout):
+    return [l["spans"][0]["text"] for b in page_layout["blocks"] for l in b["lines"]]
+
+
+def test_running_header_and_page_numbers_are_detected():
+    bands = detect_margin_bands(layout_with({}))
+    assert bands["header"] == 0.05
+    assert bands["footer"] == 0.95
+
+    stripped = strip_margin_bands(layout_with({}))
+    assert texts(stripped[0]) == ["Body text about patience", "More about patience in the middle",
+                                  "Closing words on patience"]
+
+
+def test_isolated_numeric_lines_do_not_widen_the_bands():
+    layout = layout_with({
+        3: [line("(7)", 0.105, 0.11)],
+        8: [line("13.", 0.885, 0.895)],
+        12: [line("- 3 -", 0.09, 0.1)],
+    })
+    bands = detect_margin_bands(layout)
+    assert bands["header"] == 0.05
+    assert bands["footer"] == 0.95
+
+    stripped = strip_margin_bands(layout, bands)
+    for page_layout in stripped:
+        number = page_layout["page"]
+        assert f"Body text about {WORDS[number - 1]}" in texts(page_layout)
+        assert f"Closing words on {WORDS[number - 1]}" in texts(page_layout)